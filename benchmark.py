@@ -0,0 +1,257 @@
+import sys
+import io
+import re
+import json
+import time
+import argparse
+import platform
+import tempfile
+import contextlib
+from pathlib import Path
+from typing import Any, Callable
+
+import yaml
+import validation
+from validation import Glosses, Relation
+from ccdb_parser import CCDB
+import ccdb_parser
+
+
+# The real database that the synthetic databases are scaled up from
+DATABASE = Path(__file__).parent / 'cc-database.yaml'
+
+# The per-item validators that are timed separately
+VALIDATORS = [
+    'validate_names_and_aliases',
+    'validate_alias_variants',
+    'validate_link_ids',
+    'validate_consistent_name_and_id',
+    'validate_codewords',
+    'validate_isolated',
+    'validate_relations_by_cctype',
+    'validate_strategy_supertypes',
+]
+
+# The same export settings as for docs/cc-graph-data.js in the Makefile
+JSON_EXPORT_ARGS = [
+    '--format', 'json', '--keys', 'Id', 'Name', 'Type', 'Alias', 'FromGlossary', 'Definition', 'Status',
+    '--relations', 'all', '--js-object', 'DATA', '--html',
+]
+
+
+###############################################################################
+## Synthetic databases
+
+def copy_prefix(copy: int) -> str:
+    """A unique word for each copy of the database, with only letters so that the ids are valid."""
+    if copy == 0:
+        return ""
+    letters = ""
+    while copy:
+        copy, n = divmod(copy, 26)
+        letters += chr(ord('a') + n)
+    return letters + "a" if len(letters) == 1 else letters
+
+
+def rename_id(id: str, prefix: str) -> str:
+    idtype, colon, name = id.partition(":")
+    return f"{idtype}:{prefix}-{name}" if colon and prefix else id
+
+
+def rename_name(name: str, prefix: str) -> str:
+    """Prefix all comma-separated parts, because they are expanded into separate aliases."""
+    return ", ".join(f"{prefix} {part}" for part in re.split(r", *", name)) if prefix else name
+
+
+def rename_links(definition: str, prefix: str) -> str:
+    """Make the definition links refer to the CCs in the same copy."""
+    def rename(m: re.Match[str]) -> str:
+        ref, name = m.group(1), m.group(2)
+        if ref:
+            return f"<a {rename_id(ref, prefix)}>{name}</a>"
+        return f"<a>{rename_name(name, prefix)}</a>"
+    return re.sub(r'<a *([^<>]*?)>(.+?)</a>', rename, definition) if prefix else definition
+
+
+def synthetic_database(items: list[dict[str, Any]], scale: int) -> list[dict[str, Any]]:
+    """
+    Scale up the database by making copies of all entries. Every copy has its own ids, names, aliases,
+    relations and definition links, and all copies share the same sections.
+    """
+    relations = set(Relation.__members__) - {Relation.Sections.value}
+    newitems: list[dict[str, Any]] = []
+    for copy in range(scale):
+        prefix = copy_prefix(copy)
+        for item in items:
+            newitem = dict(item)
+            newitem['Id'] = rename_id(item['Id'], prefix)
+            newitem['Name'] = rename_name(item['Name'], prefix)
+            if 'Alias' in item:
+                newitem['Alias'] = [rename_name(alias, prefix) for alias in item['Alias']]
+            if 'Definition' in item:
+                newitem['Definition'] = rename_links(item['Definition'], prefix)
+            for rel in relations & item.keys():
+                newitem[rel] = [rename_id(relid, prefix) for relid in item[rel]]
+            newitems.append(newitem)
+    return newitems
+
+
+###############################################################################
+## Timing
+
+def run_validator(name: str, glosses: Glosses) -> list[validation.Diagnostic]:
+    """Run one of the per-item validators on all CCs, including building the index that it needs."""
+    found: list[validation.Diagnostic] = []
+    if name == 'validate_names_and_aliases':
+        names = validation.index_names_and_aliases(glosses)
+        for item in glosses.values():
+            found += validation.validate_names_and_aliases(item, glosses, names)
+    elif name == 'validate_isolated':
+        incoming = validation.reverse_relations(glosses)
+        for item in glosses.values():
+            found += validation.validate_isolated(item, incoming)
+    elif name in ('validate_link_ids', 'validate_relations_by_cctype'):
+        validator = getattr(validation, name)
+        for item in glosses.values():
+            found += validator(item, glosses)
+    else:
+        validator = getattr(validation, name)
+        for item in glosses.values():
+            found += validator(item)
+    return found
+
+
+def timeit(repeat: int, function: Callable[[], object]) -> float:
+    """The fastest of the given number of runs, in seconds."""
+    best = float('inf')
+    for _ in range(repeat):
+        validation.reset_errors_and_warnings()
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    validation.reset_errors_and_warnings()
+    return best
+
+
+def benchmark(glossfile: Path, repeat: int) -> dict[str, float]:
+    timings: dict[str, float] = {}
+    glosses: Glosses = {}
+
+    def parse() -> None:
+        nonlocal glosses
+        glosses = validation.parse_yaml_database(glossfile)
+    timings['parse_yaml_database'] = timeit(repeat, parse)
+
+    for name in VALIDATORS:
+        timings[name] = timeit(repeat, lambda: run_validator(name, glosses))
+    timings['run_validators'] = timeit(repeat, lambda: validation.run_validators(glosses))
+
+    ccdb: CCDB | None = None
+    def build() -> None:
+        nonlocal ccdb
+        ccdb = CCDB(glosses, "benchmark")
+    timings['CCDB.__init__'] = timeit(repeat, build)
+    assert ccdb
+
+    def export_json() -> None:
+        args = ccdb_parser.parser.parse_args(JSON_EXPORT_ARGS + ['--', str(glossfile)])
+        with contextlib.redirect_stdout(io.StringIO()):
+            ccdb.export_to_json(args)
+    timings['export_to_json'] = timeit(repeat, export_json)
+
+    def export_fnbr() -> None:
+        with contextlib.redirect_stdout(io.StringIO()):
+            ccdb.export_to_fnbr()
+    timings['export_to_fnbr'] = timeit(repeat, export_fnbr)
+    return timings
+
+
+def run_benchmarks(args: argparse.Namespace) -> dict[str, Any]:
+    with open(args.database) as F:
+        items = yaml.load(F, Loader=yaml.CLoader)
+    results: dict[str, Any] = {
+        'database': str(args.database),
+        'python': platform.python_version(),
+        'repeat': args.repeat,
+        'scales': {},
+    }
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for scale in args.scales:
+            glossfile = Path(tmpdir) / f"cc-database-{scale}x.yaml"
+            with open(glossfile, 'w') as F:
+                yaml.dump(synthetic_database(items, scale), F, Dumper=yaml.CDumper, sort_keys=False, allow_unicode=True)
+            print(f"Benchmarking {scale}x database ({len(items) * scale} entries)", file=sys.stderr)
+            results['scales'][str(scale)] = {
+                'entries': len(items) * scale,
+                'timings': benchmark(glossfile, args.repeat),
+            }
+    return results
+
+
+###############################################################################
+## Reporting and comparing
+
+def print_table(results: dict[str, Any], baseline: dict[str, Any] | None = None) -> None:
+    for scale, result in results['scales'].items():
+        print(f"\n{scale}x database, {result['entries']} entries:", file=sys.stderr)
+        base = baseline['scales'].get(scale, {}).get('timings', {}) if baseline else {}
+        for phase, seconds in result['timings'].items():
+            line = f"  {phase:35s} {seconds:9.4f} s"
+            if phase in base:
+                line += f"   baseline {base[phase]:9.4f} s   ({seconds / max(base[phase], 1e-9):5.2f}x)"
+            print(line, file=sys.stderr)
+    print(file=sys.stderr)
+
+
+def find_regressions(results: dict[str, Any], baseline: dict[str, Any], tolerance: float, slack: float) -> list[str]:
+    """Every phase that is slower than the baseline times the tolerance (plus some slack for timer noise)."""
+    regressions: list[str] = []
+    for scale, result in results['scales'].items():
+        base = baseline['scales'].get(scale, {}).get('timings', {})
+        for phase, seconds in result['timings'].items():
+            if phase in base and seconds > base[phase] * tolerance + slack:
+                regressions.append(f"{scale}x {phase}: {seconds:.4f} s, baseline {base[phase]:.4f} s")
+    return regressions
+
+
+###############################################################################
+## Command-line parsing
+
+parser = argparse.ArgumentParser(description='Benchmark parsing, validating and exporting synthetic scaled-up databases.')
+parser.add_argument('--database', type=Path, default=DATABASE, help=f'database to scale up (default: {DATABASE.name})')
+parser.add_argument('--scales', type=int, nargs='+', default=[1, 10, 100], help=f'database sizes (default: 1 10 100)')
+parser.add_argument('--repeat', type=int, default=3, help=f'number of runs for each timing, the fastest is used (default: 3)')
+parser.add_argument('--output', '-o', type=Path, help=f'write the results to this JSON file (default: stdout)')
+parser.add_argument('--compare', '-c', type=Path, help=f'compare with baseline results, and fail if there are regressions')
+parser.add_argument('--tolerance', type=float, default=1.5,
+                    help=f'a phase is a regression if it is this many times slower than the baseline (default: 1.5)')
+parser.add_argument('--slack', type=float, default=0.01,
+                    help=f'absolute slack in seconds, to ignore timer noise for fast phases (default: 0.01)')
+
+
+def main(args: argparse.Namespace) -> None:
+    baseline = None
+    if args.compare:
+        with open(args.compare) as F:
+            baseline = json.load(F)
+    results = run_benchmarks(args)
+    print_table(results, baseline)
+    if args.output:
+        with open(args.output, 'w') as F:
+            json.dump(results, F, indent=2)
+    else:
+        print(json.dumps(results, indent=2))
+    if baseline:
+        regressions = find_regressions(results, baseline, args.tolerance, args.slack)
+        if regressions:
+            for regression in regressions:
+                print(f"*REGRESSION* {regression}", file=sys.stderr)
+            raise ValueError(f"{len(regressions)} regressions found compared to {args.compare}")
+        print(f"No regressions compared to {args.compare}", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    try:
+        main(parser.parse_args())
+    except ValueError as err:
+        sys.exit(str(err))
@@ -0,0 +1,255 @@
+import os
+import sys
+import re
+import json
+import argparse
+from pathlib import Path
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import NamedTuple, TextIO
+
+import validation
+import ccdb_parser
+from ccdb_parser import CCDB
+
+
+# The words in a text, in the same way as clean_link sees them: letters, with inner hyphens, slashes and apostrophes
+TOKEN = re.compile(r"[A-Za-z]+(?:['/-]+[A-Za-z]+)*'?")
+
+# Word endings that clean_link removes or adds when looking up a name: (ending of the name, ending in the text)
+INFLECTIONS = [
+    ('', ''), ('', 's'), ('', 'es'), ('s', ''), ('es', ''), ('', "'s"), ('', 'd'), ('', 'ed'), ('al', 'ally'),
+]
+
+# The approximate number of characters in each chunk of text that is annotated at once
+CHUNK_SIZE = 1 << 20
+
+
+class Span(NamedTuple):
+    """A mention of one or more CCs, from character position start to end in the text."""
+    start: int
+    end: int
+    text: str
+    ids: tuple[str, ...]
+
+
+###############################################################################
+## Aho-Corasick automaton over words
+
+class Automaton:
+    """
+    An Aho-Corasick automaton where the symbols are words, so that all patterns are found in one pass over a text.
+    Each state has the patterns that end there (its own pattern and the patterns reached by its failure links),
+    as (number of words, pattern number), longest first.
+    """
+    goto: list[dict[str, int]]
+    fail: list[int]
+    outputs: list[tuple[tuple[int, int], ...]]
+
+    def __init__(self, patterns: Iterable[tuple[str, ...]]):
+        self.goto = [{}]
+        own: list[tuple[int, int] | None] = [None]
+        for n, words in enumerate(patterns):
+            state = 0
+            for word in words:
+                if word not in self.goto[state]:
+                    self.goto[state][word] = len(self.goto)
+                    self.goto.append({})
+                    own.append(None)
+                state = self.goto[state][word]
+            own[state] = (len(words), n)
+        # The failure links and outputs are computed breadth-first, so shorter states are always done first
+        self.fail = [0] * len(self.goto)
+        self.outputs = [()] * len(self.goto)
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            mine = own[state]
+            self.outputs[state] = ((mine,) if mine else ()) + self.outputs[self.fail[state]]
+            for word, next in self.goto[state].items():
+                if state:
+                    fail = self.fail[state]
+                    while fail and word not in self.goto[fail]:
+                        fail = self.fail[fail]
+                    self.fail[next] = self.goto[fail].get(word, 0)
+                queue.append(next)
+
+    def search(self, words: Iterable[str]) -> Iterator[tuple[int, int, int]]:
+        """Yield all matches as (first word, last word, pattern number), ordered by the last word."""
+        state = 0
+        for i, word in enumerate(words):
+            while state and word not in self.goto[state]:
+                state = self.fail[state]
+            state = self.goto[state].get(word, 0)
+            for length, n in self.outputs[state]:
+                yield i - length + 1, i, n
+
+
+###############################################################################
+## Annotating texts
+
+class Annotator:
+    """
+    Finds the CCs that are mentioned in a text: all names, aliases and ids in the database,
+    the inflected forms that clean_link handles, and names followed by a type ending (as in find_closest).
+    Each form is resolved to the same ids as a definition link with that text.
+    The mentions are the leftmost-longest matches, which don't overlap.
+    """
+    patterns: list[str]
+    ids: list[tuple[str, ...]]
+    automaton: Automaton
+
+    def __init__(self, ccdb: CCDB, min_length: int = 1):
+        resolved: dict[str, tuple[str, ...]] = {}
+        for form in sorted(self.surface_forms(ccdb, min_length)):
+            if len(form) < min_length or " ".join(TOKEN.findall(form)) != form:
+                continue
+            link = ccdb.clean_link(form)
+            ids = ccdb.find_closest(link) if link else ()
+            if ids:
+                resolved[form] = ids
+        # clean_link removes the colon of an id, so the ids are added as mentions of themselves
+        for id in ccdb.glosses:
+            form = " ".join(TOKEN.findall(id.casefold()))
+            if ":" in id and len(form) >= min_length:
+                resolved.setdefault(form, (id,))
+        self.patterns = list(resolved)
+        self.ids = list(resolved.values())
+        self.automaton = Automaton(tuple(form.split(" ")) for form in self.patterns)
+
+    @staticmethod
+    def surface_forms(ccdb: CCDB, min_length: int = 1) -> set[str]:
+        """
+        All forms in a text that can be a mention of a CC, cleaned in the same way as clean_link.
+        Names that are shorter than min_length are left out, together with all their inflected forms.
+        """
+        def clean(name: str) -> str:
+            return re.sub(r"[^'a-z/()-]+", ' ', name.casefold()).strip()
+
+        forms: set[str] = set()
+        for name in ccdb.allnames:
+            name = clean(name)
+            if len(name) < min_length:
+                continue
+            for ending, inflected in INFLECTIONS:
+                if name.endswith(ending):
+                    forms.add(name[:len(name) - len(ending)] + inflected)
+        for nametype, name in ccdb.typednames:
+            forms.add(f"{clean(name)} {nametype}")
+        return forms
+
+    def annotate(self, text: str, offset: int = 0) -> list[Span]:
+        """Find the CC mentions in the text, with character positions starting from offset."""
+        tokens = list(TOKEN.finditer(text))
+        words = [token.group().casefold() for token in tokens]
+        matches = sorted((start, -end, n) for start, end, n in self.automaton.search(words))
+        spans: list[Span] = []
+        position = 0
+        for start, negend, n in matches:
+            if start < position:
+                continue
+            first, last = tokens[start], tokens[-negend]
+            spans.append(Span(offset + first.start(), offset + last.end(), text[first.start():last.end()], self.ids[n]))
+            position = -negend + 1
+        return spans
+
+
+def read_chunks(file: TextIO, chunksize: int = CHUNK_SIZE) -> Iterator[tuple[int, str]]:
+    """
+    Read a text file in chunks of about chunksize characters, as (character offset, text).
+    A chunk ends at an empty line if possible, and otherwise at the end of a line,
+    so that mentions are only split if a paragraph is longer than the chunk size.
+    """
+    lines: list[str] = []
+    size = offset = 0
+    for line in file:
+        lines.append(line)
+        size += len(line)
+        if size >= chunksize and (not line.strip() or size >= 2 * chunksize):
+            yield offset, "".join(lines)
+            offset += size
+            lines, size = [], 0
+    if lines:
+        yield offset, "".join(lines)
+
+
+# The annotator in a parallel worker process
+WORKER_ANNOTATOR: list[Annotator] = []
+
+def init_annotation_worker(annotator: Annotator):
+    WORKER_ANNOTATOR[:] = [annotator]
+
+def annotate_chunk(chunk: tuple[int, str]) -> list[Span]:
+    offset, text = chunk
+    return WORKER_ANNOTATOR[0].annotate(text, offset)
+
+
+def annotate_files(annotator: Annotator, files: Iterable[Path], jobs: int = 1,
+                   chunksize: int = CHUNK_SIZE) -> Iterator[tuple[Path, Span]]:
+    """
+    Annotate the files chunk by chunk, and yield the mentions in the order of the files.
+    With several jobs, the chunks are annotated in parallel processes, with at most a few chunks per process
+    waiting at any time, so that large files are never read into memory.
+    """
+    def chunks() -> Iterator[tuple[Path, tuple[int, str]]]:
+        for path in files:
+            if str(path) == '-':
+                yield from ((path, chunk) for chunk in read_chunks(sys.stdin, chunksize))
+            else:
+                with open(path) as F:
+                    yield from ((path, chunk) for chunk in read_chunks(F, chunksize))
+
+    if jobs <= 1:
+        for path, chunk in chunks():
+            for span in annotator.annotate(chunk[1], chunk[0]):
+                yield path, span
+        return
+    with ProcessPoolExecutor(jobs, initializer=init_annotation_worker, initargs=(annotator,)) as executor:
+        pending: deque[tuple[Path, Future[list[Span]]]] = deque()
+        for path, chunk in chunks():
+            pending.append((path, executor.submit(annotate_chunk, chunk)))
+            if len(pending) >= 4 * jobs:
+                path, future = pending.popleft()
+                yield from ((path, span) for span in future.result())
+        while pending:
+            path, future = pending.popleft()
+            yield from ((path, span) for span in future.result())
+
+
+###############################################################################
+## Command-line parsing
+
+parser = argparse.ArgumentParser(description='Find the comparative concepts that are mentioned in text files.')
+parser.add_argument('--quiet', '-q', action='store_true', help=f'suppress warnings')
+parser.add_argument('--json', action='store_true', help=f'output one JSON object per mention (default: tab-separated)')
+parser.add_argument('--jobs', type=int, default=1,
+                    help=f'number of parallel processes, 0 means one per CPU (default: 1)')
+parser.add_argument('--min-length', type=int, default=2,
+                    help=f'ignore names that are shorter than this, such as "a" or "s", and their inflections (default: 2)')
+parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE,
+                    help=f'approximate number of characters that are annotated at once (default: {CHUNK_SIZE})')
+parser.add_argument('--no-cache', action='store_true', help=f'always parse the YAML database, bypassing the cache')
+parser.add_argument('cc_database', type=Path, help='YAML database of comparative concepts')
+parser.add_argument('files', type=Path, nargs='+', help='text files to annotate, or "-" to read from stdin')
+
+
+def main(args: argparse.Namespace) -> None:
+    validation.set_error_verbosity(not args.quiet)
+    args.keep_deleted = False
+    if args.jobs < 1:
+        args.jobs = os.cpu_count() or 1
+    glosses = ccdb_parser.load_glosses(args)
+    annotator = Annotator(CCDB(glosses, ccdb_parser.read_version(args)), args.min_length)
+    for path, span in annotate_files(annotator, args.files, args.jobs, args.chunk_size):
+        if args.json:
+            print(json.dumps({'file': str(path), **span._asdict()}, ensure_ascii=False))
+        else:
+            print(path, span.start, span.end, span.text.replace("\n", " "), ",".join(span.ids), sep="\t")
+
+
+if __name__ == '__main__':
+    try:
+        main(parser.parse_args())
+    except ValueError as err:
+        sys.exit(str(err))
@@ -1,49 +1,139 @@
 
+import os
 import sys
 import re
 import json
+import pickle
+import sqlite3
+import cProfile
+import hashlib
+import tempfile
+import subprocess
+import difflib
+import unicodedata
+import time
 import argparse
+import functools
+import threading
+import contextlib
 from pathlib import Path
 from datetime import datetime
+from html import escape, unescape
+from collections.abc import Iterable, Iterator
+from typing import NamedTuple
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
 
+import yaml
 import validation
-from validation import CCType, Relation, Glosses, Example, error
+from validation import CCType, Relation, GlossItem, Glosses, ReverseRelations, Example, error
 
 
 # A parsed definition is a list of either strings or links (as pairs of strings)
 ParsedDefinition = list[str | tuple[str, str]]
 
+# Tokens of the pseudo-HTML definition language: links "<a ref>name</a>", simple tags "<x>" and "</x>",
+# and any other "<" or ">" (which are never part of a matched tag)
+DEFINITION_TOKENS = re.compile(r'(?P<link><a *(?P<ref>[^<>]*?)>(?P<name>.+?)</a>)|<(?P<close>/?)(?P<tag>\w+)>|[<>]')
+
+# The words in the search index, which are the same as the words (\w+) that Javascript regexes match
+SEARCH_TOKENS = re.compile(r'[a-z0-9_]+')
+
 # The different formats that we can export the database to
-OutputFormats = ['json', 'fnbr']
+OutputFormats = ['json', 'fnbr', 'sqlite', 'search', 'layout', 'html', 'npz']
+
+
+class RawJSON(str):
+    """A value that is already serialized as JSON, which print_json writes as it is."""
 
 
 class CCDB:
     glosses: Glosses
     version: str
+    incoming: ReverseRelations
     allnames: dict[str, tuple[str,...]]
+    typednames: dict[tuple[str, str], tuple[int, str]]
     definitions: dict[str, ParsedDefinition]
     links: dict[str, list[str]]
+    # Only used by incremental builds:
+    lookups: dict[str, set[str]] | None          # id -> all names that its definition links can resolve through
+    fragments: dict[str, dict[str, RawJSON]] | None  # export settings -> id -> serialized JSON node
 
-    def __init__(self, glosses: Glosses, version: str) -> None:
+    def __init__(self, glosses: Glosses, version: str, incremental: bool = False, previous: 'CCDB | None' = None) -> None:
+        """
+        If incremental, the CCDB also stores what is needed to build the next version from this one.
+        If the previous CCDB is given, only the definitions and JSON nodes affected by the changes are built again.
+        """
         self.glosses = glosses
         self.version = version
+        self.lookups = {} if incremental or previous else None
+        self.fragments = {} if incremental or previous else None
 
-        # All possible names (ids and aliases)
-        allnames: dict[str, set[str]] = {}
+        # Incoming edges for every id, per relation
+        self.incoming = validation.reverse_relations(glosses)
+
+        # All possible names (ids, names and the expanded aliases), with the ids in database order
+        allnames: dict[str, dict[str, None]] = {}
         for id, item in self.glosses.items():
             for name in [id, item.Name] + item.Alias:
-                allnames.setdefault(name.casefold(), set()).add(id)
+                allnames.setdefault(name.casefold(), {})[id] = None
         self.allnames = {name: tuple(ids) for name, ids in allnames.items()}
 
+        # All names followed by a type ending (e.g., "X construction"), used by find_closest:
+        # (ending, name) -> (position, id), where the position keeps the first match in allnames order
+        self.typednames = {}
+        position = 0
+        for name, ids in self.allnames.items():
+            for id in ids:
+                idtype, colon, _ = id.partition(":")
+                if colon:
+                    for nametype in self.TYPE_ENDINGS.get(idtype, ()):
+                        self.typednames.setdefault((nametype, name), (position, id))
+                position += 1
+
         # Expand all definitions by converting abbreviated links
         # "<a>name</a>" and "<a alias>name</a>" into the form "<a id>name</a>"
         self.definitions = {}
         self.links = {}
+        reparse = self.affected_definitions(previous) if previous else None
         for id, item in self.glosses.items():
-            defn, links = self.parse_definition(id, item.Definition)
+            if previous and reparse is not None and id not in reparse:
+                defn, links = previous.definitions.get(id), previous.links.get(id)
+                if self.lookups is not None and previous.lookups is not None:
+                    self.lookups[id] = previous.lookups.get(id, set())
+            else:
+                defn, links = self.parse_definition(id, item.Definition)
             if defn: self.definitions[id] = defn
             if links: self.links[id] = links
 
+        # Reuse the serialized JSON nodes that are not affected by the changes
+        if previous and reparse is not None and self.fragments is not None and previous.fragments:
+            for settings, nodes in previous.fragments.items():
+                self.fragments[settings] = {id: node for id, node in nodes.items() if id in glosses and id not in reparse}
+
+
+    def affected_definitions(self, previous: 'CCDB') -> set[str] | None:
+        """
+        Find the CCs whose definitions have to be parsed again, compared to the previous CCDB:
+        the changed CCs, and the CCs with links that can resolve through a name whose ids have changed.
+        Returns None if all definitions have to be parsed.
+        """
+        if previous.lookups is None:
+            return None
+        changed = validation.changed_ids(previous.glosses, self.glosses)
+        changed_names: set[str] = set()
+        for id in changed:
+            for item in (previous.glosses.get(id), self.glosses.get(id)):
+                if item:
+                    for name in [id, item.Name] + item.Alias:
+                        name = name.casefold()
+                        if previous.allnames.get(name) != self.allnames.get(name):
+                            changed_names.add(name)
+        affected = changed & self.glosses.keys()
+        for id, names in previous.lookups.items():
+            if not names.isdisjoint(changed_names):
+                affected.add(id)
+        return affected
+
 
     def export(self, args: argparse.Namespace) -> None:
         format = args.format
@@ -51,6 +141,21 @@ class CCDB:
             self.export_to_json(args)
         elif format == "fnbr":
             self.export_to_fnbr()
+        elif format == "sqlite":
+            self.export_to_sqlite()
+        elif format == "search":
+            self.export_to_search_index(args)
+        elif format == "layout":
+            self.export_to_layouts(args)
+        elif format == "html":
+            self.export_to_html()
+        elif format == "npz":
+            self.export_to_npz()
+
+
+    def sources(self, id: str, rel: Relation) -> list[str]:
+        """Return the ids of all CCs that point to the given id via the relation."""
+        return self.incoming.get(id, {}).get(rel, [])
 
 
     ###########################################################################
@@ -60,44 +165,83 @@ class CCDB:
         """Parse a definition and return the expanded definition and the list of links."""
         expanded: ParsedDefinition = []
         links: list[str] = []
-        for part in re.split(r'(<a[^<>]*>.+?</a>)', definition):
-            if (m := re.match(r'<a *([^<>]*?)>(.+?)</a>', part)):
-                link_ref = m.group(1)
-                name = m.group(2)
-
-                linkids: tuple[str, ...]
-                if link_ref:
-                    link = link_ref
-                    linkids = (link,)
+        # The text since the last link, where matched tags "<x>...</x>" are reduced to "..."
+        # Stack elements are (tag, text), where tag is '' for plain text and None for unmatchable tokens
+        reduced: list[tuple[str | None, str]] = []
+        start = pos = 0
+        for m in DEFINITION_TOKENS.finditer(definition):
+            if m.start() > pos:
+                self._push_text(reduced, definition[pos:m.start()])
+            pos = m.end()
+            if not m.group('link'):
+                tag = m.group('tag')
+                if tag and m.group('close'):
+                    if len(reduced) >= 2 and reduced[-1][0] == '' and reduced[-2][0] == tag:
+                        del reduced[-2:]
+                        self._push_text(reduced, "...")
+                    else:
+                        reduced.append((None, m.group()))
                 else:
-                    link = self.clean_link(name)
-                    if not link:
-                        error(id, f"Could not clean link '{name}'")
-                        link = name
-                    linkids = self.find_closest(link)
-
-                if not linkids:
-                    error(id, f"Could not find any matching id for link '{link}'")
-                    linkid = link
-                else:
-                    linkid = linkids[0]
-                    if len(linkids) > 1:
-                        error(id, f"Ambiguous link '{link}', maps to any of {linkids}")
-                links.append(linkid)
-                part = (linkid, name)
+                    reduced.append((tag, m.group()))
+                continue
+
+            self._check_unmatched(id, reduced)
+            if m.start() > start:
+                expanded.append(definition[start:m.start()])
+            start = pos
+            reduced = []
+
+            link_ref = m.group('ref')
+            name = m.group('name')
+            linkids: tuple[str, ...]
+            if link_ref:
+                link = link_ref
+                linkids = (link,)
             else:
-                # Test that all <x> are matched
-                testpart = part
-                nsubs = 1
-                while nsubs > 0:
-                    (testpart, nsubs) = re.subn(r"<(\w+)>[^<>]+</\1>", "...", testpart)
-                if (m := re.search(r"<\w+>", testpart)):
-                    error(id, f"Unmatched {m.group()} in definition: {testpart}")
-            if part:
-                expanded.append(part)
+                if self.lookups is not None:
+                    self.lookups.setdefault(id, set()).update(self.link_lookups(name))
+                link = self.clean_link(name)
+                if not link:
+                    error(id, f"Could not clean link '{name}'")
+                    link = name
+                linkids = self.find_closest(link)
+
+            if not linkids:
+                error(id, f"Could not find any matching id for link '{link}'")
+                linkid = link
+            else:
+                linkid = linkids[0]
+                if len(linkids) > 1:
+                    error(id, f"Ambiguous link '{link}', maps to any of {linkids}")
+            links.append(linkid)
+            expanded.append((linkid, name))
+
+        if len(definition) > pos:
+            self._push_text(reduced, definition[pos:])
+        self._check_unmatched(id, reduced)
+        if len(definition) > start:
+            expanded.append(definition[start:])
         return expanded, links
 
 
+    @staticmethod
+    def _push_text(reduced: list[tuple[str | None, str]], text: str) -> None:
+        if reduced and reduced[-1][0] == '':
+            reduced[-1] = ('', reduced[-1][1] + text)
+        else:
+            reduced.append(('', text))
+
+
+    @staticmethod
+    def _check_unmatched(id: str, reduced: list[tuple[str | None, str]]) -> None:
+        """Test that all <x> are matched, in the text between two links."""
+        for tag, text in reduced:
+            if tag:
+                testpart = "".join(text for _, text in reduced)
+                error(id, f"Unmatched {text} in definition: {testpart}")
+                return
+
+
     def clean_link(self, link: str) -> str | None:
         """Clean a link by trying some very common English inflection patterns."""
         link = link.casefold()
@@ -127,16 +271,31 @@ class CCDB:
         """Find the closest CC ids that a link refers to."""
         if link in self.allnames:
             return self.allnames[link]
-        for name, ids in self.allnames.items():
-            for id in ids:
-                idtype, _, _ = id.partition(":")
-                for nametype in self.TYPE_ENDINGS[idtype]:
-                    if link.endswith(' '+nametype) and id.startswith(idtype+':'):
-                        linkname = link[:-len(nametype)].strip()
-                        if name == linkname:
-                            return (id,)
-                        break
-        return ()
+        best: tuple[int, str] | None = None
+        for nametypes in self.TYPE_ENDINGS.values():
+            for nametype in nametypes:
+                if link.endswith(' '+nametype):
+                    linkname = link[:-len(nametype)].strip()
+                    found = self.typednames.get((nametype, linkname))
+                    if found and (best is None or found < best):
+                        best = found
+                    break
+        return (best[1],) if best else ()
+
+    @classmethod
+    def link_lookups(cls, name: str) -> set[str]:
+        """
+        All names that clean_link and find_closest can look up when resolving a link to the given name.
+        This must cover all lookups in these two methods, because it's used by incremental builds.
+        """
+        link = re.sub(r"[^'a-z/()-]+", ' ', name.casefold()).strip()
+        lookups = {name, link, link + 'es', link + 's', link[:-1], link[:-2]}
+        for candidate in (name, link):
+            for nametypes in cls.TYPE_ENDINGS.values():
+                for nametype in nametypes:
+                    if candidate.endswith(' '+nametype):
+                        lookups.add(candidate[:-len(nametype)].strip())
+        return lookups
 
     # Used when finding the closest match of a link
     TYPE_ENDINGS: dict[str, list[str]] = {
@@ -227,67 +386,400 @@ class CCDB:
     ## Export to JSON or Javascript objects
 
     def export_to_json(self, args: argparse.Namespace) -> None:
-        nodes: list[dict[str, object]] = []
-        edges: list[dict[str, object]] = []
-        for item in self.glosses.values():
-            node: dict[str, object] = {}
-            if "all" in args.keys:
-                args.keys = list(key for key, _ in item if key != "Relations")
-            for key in args.keys:
-                value = getattr(item, key)
-                if key == "Definition" and item.Id in self.definitions:
-                    value = self.convert_definition(self.definitions[item.Id], html=args.html)
-                if key == "Examples":
-                    value = [
-                        (ex.__dict__ if isinstance(ex, Example) else ex)
-                        for ex in value
-                    ]
-                if key == "FromGlossary":
-                    if not value:
-                        node["notOriginal"] = True
-                elif value:
-                    node[key.lower()] = self.clean_object(value, html=args.html)
-            nodes.append(node)
-            if "all" in args.relations:
-                args.relations = list(Relation)
-            for rel in args.relations:
-                for target in item.Relations.get(Relation(rel), []):
-                    edges.append({
-                        "start": target,
-                        "end": item.Id,
-                        "rel": rel,
-                    })
-        nodes.sort(key=lambda n: str(n['id']))
-        edges.sort(key=lambda e: (e['start'], e['end'], e['rel']))
+        if "all" in args.relations:
+            args.relations = list(Relation)
         data: dict[str, object] = {
             "version": self.version,
             "builddate": datetime.now().strftime("%Y-%m-%d, %H:%M:%S"),
+            "nodes": self.json_nodes(args),
+            "edges": self.json_edges(args),
         }
-        if nodes:
-            data["nodes"] = nodes
-        if edges:
-            data["edges"] = edges
+        if args.shards:
+            data["shards"] = [file.name for file in self.shard_files(args)]
         self.print_json(data, args)
 
 
+    def json_nodes(self, args: argparse.Namespace) -> Iterator[RawJSON]:
+        """
+        Yield the serialized JSON nodes one at the time, sorted by id.
+        If the output is sharded, the sharded keys are left out and replaced by the number of the shard.
+        """
+        fragments = None
+        if self.fragments is not None and not args.shards:
+            fragments = self.fragments.setdefault(repr((args.keys, args.html)), {})
+        shards = self.shard_numbers(args)
+        for item in self.sorted_items(args):
+            if fragments is not None and item.Id in fragments:
+                yield fragments[item.Id]
+                continue
+            node = self.json_node(item, args)
+            if args.shards:
+                core = {key: value for key, value in node.items() if key not in self.SHARDED_KEYS}
+                if len(core) < len(node) and item.Id in shards:
+                    core["shard"] = shards[item.Id]
+                node = core
+            serialized = RawJSON(json.dumps(node))
+            if fragments is not None:
+                fragments[item.Id] = serialized
+            yield serialized
+
+
+    def json_node(self, item: GlossItem, args: argparse.Namespace) -> dict[str, object]:
+        node: dict[str, object] = {}
+        if "all" in args.keys:
+            args.keys = list(key for key, _ in item if key != "Relations")
+        for key in args.keys:
+            value = getattr(item, key)
+            if key == "Definition" and item.Id in self.definitions:
+                value = self.convert_definition(self.definitions[item.Id], html=args.html)
+            if key == "Examples":
+                value = [
+                    (ex.__dict__ if isinstance(ex, Example) else ex)
+                    for ex in value
+                ]
+            if key == "FromGlossary":
+                if not value:
+                    node["notOriginal"] = True
+            elif value:
+                node[key.lower()] = self.clean_object(value, html=args.html)
+        return node
+
+
+    def sorted_items(self, args: argparse.Namespace) -> list[GlossItem]:
+        return sorted(self.glosses.values(), key=lambda item: str(self.clean_object(item.Id, html=args.html)))
+
+
+    def json_edges(self, args: argparse.Namespace) -> Iterator[RawJSON]:
+        """Yield the serialized JSON edges one at the time, sorted by start, end and relation."""
+        for start in sorted(self.incoming):
+            incoming = self.incoming[start]
+            edges = sorted(
+                (end, rel)
+                for rel in args.relations
+                for end in incoming.get(Relation(rel), ())
+            )
+            for end, rel in edges:
+                yield RawJSON(json.dumps({
+                    "start": start,
+                    "end": end,
+                    "rel": rel,
+                }))
+
+
+    ###########################################################################
+    ## Sharded JSON export, where some keys are split into separate files
+
+    # The node keys that are moved to the shards, the rest of the node is kept in the main output
+    SHARDED_KEYS = ('definition', 'examples')
+
+    def shard_files(self, args: argparse.Namespace) -> list[Path]:
+        """The shard files are named after the main output, e.g., cc-graph-core-3.js for cc-graph-core.js."""
+        if not args.output:
+            raise ValueError("Sharded JSON export needs an --output file")
+        output = Path(args.output)
+        return [output.with_name(f"{output.stem}-{n}{output.suffix}") for n in range(args.shards)]
+
+
+    def shard_numbers(self, args: argparse.Namespace) -> dict[str, int]:
+        """Split the nodes that have a definition or examples into consecutive shards of the same size."""
+        items = [item for item in self.sorted_items(args) if item.Definition or item.Examples]
+        return {item.Id: n * args.shards // len(items) for n, item in enumerate(items)} if args.shards else {}
+
+
+    def json_shards(self, args: argparse.Namespace) -> Iterator[tuple[Path, Iterator[str]]]:
+        """
+        Yield each shard file and its serialized contents, which maps ids to the sharded keys of the nodes.
+        If the output is a Javascript object, each shard file adds itself to the list of shards in that object.
+        """
+        shardfiles = self.shard_files(args)
+        nodes: list[dict[str, object]] = [{} for _ in shardfiles]
+        shards = self.shard_numbers(args)
+        for item in self.sorted_items(args):
+            node = self.json_node(item, args)
+            sharded = {key: value for key, value in node.items() if key in self.SHARDED_KEYS}
+            if sharded and item.Id in shards:
+                nodes[shards[item.Id]][item.Id] = sharded
+        for n, shardfile in enumerate(shardfiles):
+            serialized = json.dumps(nodes[n], indent=None if args.compact else 4)
+            if args.js_object:
+                yield shardfile, iter([f"{args.js_object}.shards[{n}] = ", serialized, ";\n"])
+            else:
+                yield shardfile, iter([serialized, "\n"])
+
+
     @staticmethod
     def print_json(data: dict[str, object], args: argparse.Namespace):
+        """
+        Print the data, where lists and iterators are streamed one value at the time.
+        Empty lists and iterators are skipped, and RawJSON values are written without serializing them again.
+        """
+        sys.stdout.writelines(CCDB.json_lines(data, args))
+
+
+    @staticmethod
+    def json_lines(data: dict[str, object], args: argparse.Namespace) -> Iterator[str]:
         if args.js_object:
-            print(f"var {args.js_object} = ", end="")
-        if args.compact:
-            print(json.dumps(data), end="")
-        else:
-            print("{")
-            for key, value in data.items():
-                if isinstance(value, list):
-                    print(f"    {json.dumps(key)}: [")
-                    for v in value:  # type: ignore
-                        print(f"        {json.dumps(v)},")
-                    print("    ],")
+            yield f"var {args.js_object} = "
+        yield "{" if args.compact else "{\n"
+        separator = ""
+        for key, value in data.items():
+            if isinstance(value, (list, Iterator)):
+                values = map(CCDB.json_value, value)  # type: ignore
+                first = next(values, None)
+                if first is None:
+                    continue
+                if args.compact:
+                    yield f"{separator}{json.dumps(key)}: [{first}"
+                    for v in values:
+                        yield f", {v}"
+                    yield "]"
                 else:
-                    print(f"    {json.dumps(key)}: {json.dumps(value)},")
-            print("}", end="")
-        print(";" if args.js_object else "")
+                    yield f"    {json.dumps(key)}: [\n"
+                    yield f"        {first},\n"
+                    for v in values:
+                        yield f"        {v},\n"
+                    yield "    ],\n"
+            elif args.compact:
+                yield f"{separator}{json.dumps(key)}: {CCDB.json_value(value)}"
+            else:
+                yield f"    {json.dumps(key)}: {CCDB.json_value(value)},\n"
+            separator = ", "
+        yield "}"
+        yield ";\n" if args.js_object else "\n"
+
+
+    @staticmethod
+    def json_value(value: object) -> str:
+        return value if isinstance(value, RawJSON) else json.dumps(value)
+
+
+    ###########################################################################
+    ## Export a search index for the glossary
+
+    def export_to_search_index(self, args: argparse.Namespace) -> None:
+        """
+        Export an inverted index from lowercase words to the CCs that have them in their name, aliases or definition,
+        so that the glossary can search by lookup. The texts are the same as in the JSON export with --html,
+        and the definitions are indexed as the text that the browser shows.
+        Each word maps to one list of CC numbers per field, where the numbers are positions in the list of ids.
+        """
+        ids = sorted(self.glosses)
+        postings: dict[str, tuple[list[int], ...]] = {}
+        for n, id in enumerate(ids):
+            item = self.glosses[id]
+            definition = self.clean_text(item.Definition)
+            if id in self.definitions:
+                definition = self.clean_text(self.convert_definition(self.definitions[id], html=True))
+            fields = (
+                [self.clean_text(item.Name)],
+                [self.clean_text(alias) for alias in item.Alias],
+                [unescape(re.sub(r'<[^<>]*>', '', definition))],
+            )
+            for field, texts in enumerate(fields):
+                for token in {token for text in texts for token in SEARCH_TOKENS.findall(text.lower())}:
+                    postings.setdefault(token, tuple([] for _ in fields))[field].append(n)
+        data: dict[str, object] = {
+            "version": self.version,
+            "fields": list(self.SEARCH_WEIGHTS),
+            "weights": self.SEARCH_WEIGHTS,
+            "ids": ids,
+            "tokens": {token: postings[token] for token in sorted(postings)},
+        }
+        self.print_json(data, args)
+
+
+    # How important a match in each field of the search index is
+    SEARCH_WEIGHTS = {
+        'name': 3,
+        'alias': 2,
+        'definition': 1,
+    }
+
+
+    ###########################################################################
+    ## Export precomputed layouts for the graph visualization
+
+    def export_to_layouts(self, args: argparse.Namespace) -> None:
+        """
+        Export the graphs of the visualization from docs/cc-graphs.json, each with the positions of its nodes,
+        so that the browser doesn't have to stabilize the graphs from scratch. Computing the layouts needs NumPy.
+        """
+        try:
+            import graph_layout
+        except ImportError as err:
+            raise ValueError(f"Exporting graph layouts needs NumPy: {err}")
+        graphs = graph_layout.read_graphs()
+        layouts = graph_layout.graph_layouts(self.glosses, graphs)
+        data: dict[str, object] = {
+            "version": self.version,
+            "graphs": {name: {**graph, "positions": layouts[name]} for name, graph in graphs.items()},
+        }
+        self.print_json(data, args)
+
+
+    def export_to_npz(self) -> None:
+        """
+        Export the relation graph as NumPy arrays in an .npz file, which is written to stdout:
+        the node ids, types and sections, and the forward and reverse CSR adjacency of each relation.
+        """
+        try:
+            import graph_arrays
+        except ImportError as err:
+            raise ValueError(f"Exporting graph arrays needs NumPy: {err}")
+        sys.stdout.flush()
+        sys.stdout.buffer.write(graph_arrays.npz_bytes(graph_arrays.graph_arrays(self.glosses, self.version)))
+        sys.stdout.buffer.flush()
+
+
+    ###########################################################################
+    ## Export a pre-rendered glossary page
+
+    def export_to_html(self) -> None:
+        """
+        Render the glossary as a static HTML page, with the same layout and entries as docs/cc-database.html
+        builds in the browser, sorted by name and with the link titles already added.
+        The page only needs a script for searching and filtering. It has no build date,
+        so that rendering the same database again gives the same page.
+        """
+        page = self.GLOSSARY_TEMPLATE.read_text()
+        template = re.search(r'\s*<template id="cc-entry-template">\s*(.*?)\s*</template>', page, re.DOTALL)
+        if not template:
+            raise ValueError(f"Could not find the entry template in {self.GLOSSARY_TEMPLATE}")
+        entry = re.sub(r'\s+', ' ', template.group(1))
+        titles = {id: escape(self.link_title(id)) for id in self.glosses}
+        ids = sorted(self.glosses, key=lambda id: self.collation_key(self.clean_text(self.glosses[id].Name)))
+        entries = "\n".join(self.render_glossary_entry(id, entry, titles) for id in ids)
+        edges = sum(len(relids) for item in self.glosses.values() for relids in item.Relations.values())
+        page = page.replace(template.group(0), "")
+        scripts = "".join(f'  <script {attrs} src="{script}"></script>\n' for script, attrs in self.GLOSSARY_SCRIPTS.items())
+        page = re.sub(r'(?m)^\s*<script\b.*</script>\n', "", page)
+        page = page.replace('  <link rel="stylesheet"', scripts + '  <link rel="stylesheet"', 1)
+        page = re.sub(r'\n\s*<strong>Build date:</strong> <span id="db-build-date">.*?</span><br/>', "", page, count=1)
+        replacements = {
+            'db-version': escape(self.version),
+            'db-statistics': f"{len(self.glosses)} CCs, with {edges} relations",
+        }
+        for spanid, contents in replacements.items():
+            page = re.sub(rf'(<span id="{spanid}">).*?(</span>)', lambda m: m.group(1) + contents + m.group(2), page, count=1)
+        page = page.replace('<div id="glosses">\n  </div>', f'<div id="glosses">\n{entries}\n  </div>')
+        print(page, end="")
+
+
+    def render_glossary_entry(self, id: str, entry: str, titles: dict[str, str]) -> str:
+        """Render one entry in the same way as build_cc_item in docs/cc-database.js."""
+        item = self.glosses[id]
+        cctype = item.Type.value
+        entry = entry.replace('<div class="cc">', f'<div class="cc" id="{escape(id)}">')
+        entry = entry.replace('<a class="cc-header-name">',
+                              f'<a class="cc-header-name" href="#{escape(id)}">{self.glossary_name(id)}')
+        entry = entry.replace('<a class="cc-header-graph" target="CC-graph">',
+                              f'<a class="cc-header-graph" target="CC-graph" href="cc-graph.html#g={cctype}&amp;id={escape(id)}">')
+
+        def link(linkid: str) -> str:
+            return f'<span><a href="#{linkid}" title="{titles[linkid]}">{self.glossary_name(linkid)}</a></span>'
+
+        def render_row(m: re.Match[str]) -> str:
+            rowtype, relations, direction = m.group('type'), (m.group('relation') or '').split(), m.group('direction')
+            parents = [relid for rel in relations for relid in sorted(item.Relations.get(Relation(rel), ()))]
+            children = [srcid for rel in relations for srcid in sorted(self.sources(id, Relation(rel)))]
+            contents = None
+            if rowtype == "cc-id":
+                contents = escape(id)
+            elif rowtype == "cc-type":
+                typeid = self.GLOSSARY_TYPES.get(cctype)
+                if typeid in self.glosses:
+                    contents = f'<a href="#{typeid}" title="{titles[typeid]}">{self.clean_text(self.glosses[typeid].Name)}</a>'
+                else:
+                    contents = typeid or ""
+            elif rowtype == "cc-alias" and item.Alias:
+                contents = " <br/>".join(self.clean_text(alias) for alias in item.Alias)
+            elif rowtype == "cc-definition" and item.Definition:
+                definition = self.html_definition(id)
+                contents = re.sub(r'<a href="#([^"]+)">',
+                                  lambda m: f'<a href="#{m.group(1)}" title="{titles.get(m.group(1), "")}">', definition)
+            elif rowtype == "cc-not-original" and not item.FromGlossary:
+                return m.group(0)
+            elif rowtype == "cc-relation" and (children if direction == "in" else parents):
+                contents = "<br/>".join(link(relid) for relid in (children if direction == "in" else parents))
+            elif rowtype == "cc-hierarchy" and (parents or children):
+                contents = "".join([
+                    f'<div class="boxes">{"".join(link(relid) for relid in parents)}</div>' if parents else "",
+                    f'<div><span><strong>{self.glossary_name(id)}</strong></span></div>',
+                    f'<div class="boxes">{"".join(link(relid) for relid in children)}</div>' if children else "",
+                ])
+            if contents is None:
+                return ""
+            return f'{m.group("start")}{contents}{m.group("end")}'
+
+        return self.GLOSSARY_ROW.sub(render_row, entry)
+
+
+    def html_definition(self, id: str) -> str:
+        """The definition of a CC as HTML, in the same way as in the JSON export."""
+        item = self.glosses[id]
+        definition = self.convert_definition(self.definitions[id]) if id in self.definitions else item.Definition
+        return self.clean_text(definition or "")
+
+
+    def glossary_name(self, id: str) -> str:
+        item = self.glosses[id]
+        return f'{self.clean_text(item.Name)} (<em>{item.Type.value}</em>)'
+
+
+    def link_title(self, id: str) -> str:
+        """
+        The title of links to a CC: its name in uppercase and the start of its definition as text.
+        The definition is shortened, because the title is repeated in every link to the CC.
+        """
+        item = self.glosses[id]
+        definition = self.html_definition(id)
+        text = unescape(re.sub(r'<[^<>]*>', '', definition or "[no definition]"))
+        if len(text) > self.LINK_TITLE_LENGTH:
+            text = text[:self.LINK_TITLE_LENGTH].rsplit(None, 1)[0] + " …"
+        return self.clean_text(item.Name).upper() + "\n" + text
+
+
+    @staticmethod
+    def collation_key(name: str) -> tuple[object, ...]:
+        """
+        Sort names like Intl.Collator does by default: first ignoring case and accents,
+        where spaces come before punctuation, digits and letters, then with accents, and then lowercase first.
+        """
+        decomposed = unicodedata.normalize('NFD', name)
+        base = "".join(c for c in decomposed if not unicodedata.combining(c)).casefold()
+        classes = [(0 if c.isspace() else 3 if c.isdigit() else 4 if c.isalpha() else 1, c) for c in base]
+        return (classes, decomposed.casefold(), name.swapcase())
+
+
+    # The page that the glossary is rendered from, with its layout and the template of the entries
+    GLOSSARY_TEMPLATE = Path(__file__).parent / 'docs' / 'cc-database.html'
+
+    # The scripts of the pre-rendered page, instead of the scripts of the template page
+    GLOSSARY_SCRIPTS = {
+        'mark.min.js': 'defer',
+        'cc-graph-core.js': 'defer',
+        'cc-search-index.js': 'async',
+        'cc-search.js': 'defer',
+        'cc-glossary.js': 'defer',
+    }
+
+    # The maximum length of the definitions in the link titles
+    LINK_TITLE_LENGTH = 200
+
+    # The rows of an entry in the template
+    GLOSSARY_ROW = re.compile(
+        r'(?P<start>\s*<div type="(?P<type>[\w-]+)"(?: relation="(?P<relation>[^"]*)")?(?: direction="(?P<direction>\w+)")?>'
+        r'\s*<dt>.*?</dt>\s*<dd [^<>]*>)(?P<contents>.*?)(?P<end></dd>\s*</div>)'
+    )
+
+    # The CC that describes each CC type, the same as DATA.types in docs/cc-database.js
+    GLOSSARY_TYPES = {
+        'cxn': 'cxn:construction',
+        'inf': 'inf:information-packaging',
+        'str': 'str:strategy',
+        'sem': 'sem:meaning',
+        'def': 'definition',
+    }
 
 
     ###########################################################################
@@ -331,6 +823,399 @@ class CCDB:
     }
 
 
+    ###########################################################################
+    ## Export to an SQLite database
+
+    def export_to_sqlite(self) -> None:
+        """
+        Export the database to an indexed SQLite file, which is written to stdout.
+        The database is built in a temporary file, because SQLite cannot write to a stream.
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            dbfile = Path(tmpdir) / 'cc-database.sqlite'
+            db = sqlite3.connect(dbfile)
+            try:
+                db.executescript(self.SQLITE_SCHEMA)
+                self.insert_into_sqlite(db)
+                db.commit()
+                db.execute("VACUUM")
+            finally:
+                db.close()
+            sys.stdout.flush()
+            sys.stdout.buffer.write(dbfile.read_bytes())
+            sys.stdout.buffer.flush()
+
+
+    def insert_into_sqlite(self, db: sqlite3.Connection) -> None:
+        db.executemany("INSERT INTO meta VALUES (?, ?)", [
+            ('version', self.version),
+            ('builddate', datetime.now().strftime("%Y-%m-%d, %H:%M:%S")),
+        ])
+        nodes: list[tuple[object, ...]] = []
+        for id, item in self.glosses.items():
+            html = text = item.Definition
+            if id in self.definitions:
+                html = self.convert_definition(self.definitions[id], html=True)
+                text = self.convert_definition(self.definitions[id], html=False)
+            nodes.append((
+                id, item.Name, item.Type.value, item.Definition,
+                self.clean_text(html, html=True), self.clean_text(text, html=False), item.FromGlossary, item.Status,
+            ))
+        db.executemany("INSERT INTO nodes VALUES (?, ?, ?, ?, ?, ?, ?, ?)", nodes)
+        db.executemany("INSERT INTO aliases VALUES (?, ?)", (
+            (name, id) for name, ids in self.allnames.items() for id in ids
+        ))
+        db.executemany("INSERT INTO edges VALUES (?, ?, ?)", (
+            (id, rel.value, relid)
+            for id, item in self.glosses.items()
+            for rel, relids in item.Relations.items()
+            for relid in relids
+        ))
+        db.executemany("INSERT INTO examples VALUES (?, ?, ?, ?, ?, ?, ?)", (
+            (id, n, ex.Example, ex.Language, ex.Gloss, ex.Translation, json.dumps(ex.EquivalentPieces))
+            if isinstance(ex, Example) else (id, n, ex, None, None, None, None)
+            for id, item in self.glosses.items()
+            for n, ex in enumerate(item.Examples)
+        ))
+        db.executemany("INSERT INTO sections VALUES (?, ?, ?)", (
+            (id, item.Name, (item.Relations.get(Relation.Sections) or [None])[0])
+            for id, item in self.glosses.items()
+            if item.Type == CCType.section
+        ))
+        db.executemany("INSERT INTO links VALUES (?, ?, ?)", (
+            (id, n, linkid) for id, links in self.links.items() for n, linkid in enumerate(links)
+        ))
+        db.execute("""
+            INSERT INTO search (id, name, aliases, definition)
+            SELECT id, name, (SELECT group_concat(name, ' ') FROM aliases WHERE aliases.id = nodes.id), text
+            FROM nodes
+        """)
+
+
+    # The tables and indexes of the SQLite export
+    SQLITE_SCHEMA = """
+        CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+        CREATE TABLE nodes (
+            id TEXT PRIMARY KEY, name TEXT NOT NULL, type TEXT NOT NULL,
+            definition TEXT, html TEXT, text TEXT, from_glossary INTEGER, status TEXT
+        );
+        CREATE INDEX nodes_type ON nodes (type);
+        -- All names (ids, names and aliases) in lowercase, as used for resolving definition links
+        CREATE TABLE aliases (name TEXT NOT NULL, id TEXT NOT NULL);
+        CREATE INDEX aliases_name ON aliases (name);
+        CREATE INDEX aliases_id ON aliases (id);
+        -- Each edge says that the source CC has the relation to the target CC, e.g. source SubtypeOf target
+        CREATE TABLE edges (source TEXT NOT NULL, relation TEXT NOT NULL, target TEXT NOT NULL);
+        CREATE INDEX edges_source ON edges (source, relation);
+        CREATE INDEX edges_target ON edges (target, relation);
+        CREATE TABLE examples (
+            id TEXT NOT NULL, position INTEGER NOT NULL, example TEXT NOT NULL,
+            language TEXT, gloss TEXT, translation TEXT, equivalent_pieces TEXT
+        );
+        CREATE INDEX examples_id ON examples (id, position);
+        CREATE TABLE sections (id TEXT PRIMARY KEY, name TEXT NOT NULL, parent TEXT);
+        CREATE INDEX sections_parent ON sections (parent);
+        -- The expanded links in each definition, in order
+        CREATE TABLE links (id TEXT NOT NULL, position INTEGER NOT NULL, target TEXT NOT NULL);
+        CREATE INDEX links_id ON links (id, position);
+        CREATE INDEX links_target ON links (target);
+        CREATE VIRTUAL TABLE search USING fts5 (id UNINDEXED, name, aliases, definition);
+    """
+
+
+###############################################################################
+## Caching the parsed database
+
+# The cache directory is created next to the YAML database
+CACHE_DIR = '.ccdb-cache'
+
+
+def cache_key(args: argparse.Namespace, with_database: bool = True) -> str:
+    """The cache is invalidated if the database, its version, or the parsing code changes."""
+    hash = hashlib.sha256(repr(args.keep_deleted).encode())
+    files = [args.cc_database.with_suffix('.version'), Path(validation.__file__), Path(__file__)]
+    if with_database:
+        files.append(args.cc_database)
+    for file in files:
+        hash.update(file.read_bytes() if file.exists() else b"")
+    return hash.hexdigest()
+
+
+def cache_file(args: argparse.Namespace, suffix: str) -> Path:
+    return args.cc_database.parent / CACHE_DIR / (args.cc_database.name + suffix)
+
+
+def read_cache(cachefile: Path, key: str) -> object | None:
+    """Read cached data, or return None if there is no cache or if it was stored with another key."""
+    try:
+        with open(cachefile, 'rb') as F:
+            cachedkey, data = pickle.load(F)
+        if cachedkey == key:
+            return data
+    except (OSError, EOFError, ValueError, AttributeError, pickle.PickleError):
+        pass
+    return None
+
+
+def write_cache(cachefile: Path, key: str, data: object) -> None:
+    try:
+        cachefile.parent.mkdir(exist_ok=True)
+        tmpfile = cachefile.with_name(f"{cachefile.name}.{os.getpid()}.tmp")
+        with open(tmpfile, 'wb') as F:
+            pickle.dump((key, data), F, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmpfile, cachefile)
+    except OSError as err:
+        print(f"Could not write cache file {cachefile}: {err}", file=sys.stderr)
+
+
+def load_glosses(args: argparse.Namespace) -> Glosses:
+    """Parse the YAML database, or load the parsed glosses from the cache if no input has changed."""
+    if args.no_cache:
+        return validation.parse_yaml_database(args.cc_database, args.keep_deleted)
+    key = cache_key(args)
+    cachefile = cache_file(args, '.pickle')
+    glosses = read_cache(cachefile, key)
+    if glosses is None:
+        # Parsing raises an error if the database is invalid, and then nothing is cached
+        glosses = validation.parse_yaml_database(args.cc_database, args.keep_deleted)
+        write_cache(cachefile, key, glosses)
+    return glosses  # type: ignore
+
+
+###############################################################################
+## Incremental builds
+
+class BuildState(NamedTuple):
+    """What is kept from the last successful incremental build."""
+    entries: validation.ParsedEntries
+    glosses: Glosses
+    diagnostics: dict[str, validation.Diagnostics]
+    ccdb: CCDB | None
+
+
+def build_incrementally(args: argparse.Namespace, outputs: list[argparse.Namespace], state: BuildState | None) -> BuildState:
+    """Parse, validate and export the database, only redoing what is affected by the changes since the state."""
+    glosses, entries = validation.parse_yaml_entries(
+        args.cc_database, args.keep_deleted, state.entries if state else None)
+    diagnostics = validation.validate_database(
+        glosses, state.glosses if state else None, state.diagnostics if state else None, jobs=args.jobs)
+    if args.check_version:
+        check_version(args, glosses)
+    ccdb = state.ccdb if state else None
+    if args.format or outputs:
+        validation.reset_errors_and_warnings()
+        ccdb = CCDB(glosses, read_version(args), incremental=True, previous=ccdb)
+        export(args, outputs, ccdb)
+    return BuildState(entries, glosses, diagnostics, ccdb)
+
+
+def load_state(args: argparse.Namespace) -> BuildState | None:
+    if args.no_cache:
+        return None
+    return read_cache(cache_file(args, '.state.pickle'), cache_key(args, with_database=False))  # type: ignore
+
+
+def save_state(args: argparse.Namespace, state: BuildState) -> None:
+    if not args.no_cache:
+        write_cache(cache_file(args, '.state.pickle'), cache_key(args, with_database=False), state)
+
+
+###############################################################################
+## Watching the database and serving a preview of the docs
+
+# How often to check if the database has changed, in seconds
+WATCH_INTERVAL = 0.5
+
+# Pages served by the preview server listen to this path, and reload when they get an event
+RELOAD_PATH = '/__reload'
+RELOAD_SCRIPT = f"<script>new EventSource('{RELOAD_PATH}').onmessage = () => location.reload();</script>"
+
+
+def watch(args: argparse.Namespace, outputs: list[argparse.Namespace]) -> None:
+    """Build the database incrementally whenever it changes, until interrupted. The state is kept in memory."""
+    server = PreviewServer(args.serve, args.port) if args.serve else None
+    if server:
+        print(f"Serving {args.serve} on http://localhost:{args.port}/", file=sys.stderr)
+    files = [args.cc_database, args.cc_database.with_suffix('.version')]
+    modified: list[int | None] = []
+    state: BuildState | None = None
+    try:
+        while True:
+            current = [file.stat().st_mtime_ns if file.exists() else None for file in files]
+            if current != modified:
+                modified = current
+                try:
+                    state = build_incrementally(args, outputs, state)
+                    print(f"Built {args.cc_database} at {datetime.now().strftime('%H:%M:%S')}", file=sys.stderr)
+                    if server:
+                        server.notify()
+                except (ValueError, OSError, yaml.YAMLError) as err:
+                    print(f"Build failed: {err}\n", file=sys.stderr)
+            time.sleep(WATCH_INTERVAL)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if server:
+            server.shutdown()
+
+
+class PreviewServer(ThreadingHTTPServer):
+    """Serves a directory on localhost in a background thread, and tells the open pages when to reload."""
+    def __init__(self, directory: Path, port: int) -> None:
+        self.builds = 0
+        self.built = threading.Condition()
+        super().__init__(('localhost', port), functools.partial(PreviewHandler, directory=str(directory)))
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+
+    def notify(self) -> None:
+        with self.built:
+            self.builds += 1
+            self.built.notify_all()
+
+
+class PreviewHandler(SimpleHTTPRequestHandler):
+    server: PreviewServer
+
+    def do_GET(self) -> None:
+        path = self.path.partition('?')[0]
+        if path == RELOAD_PATH:
+            self.send_reload_events()
+            return
+        file = Path(self.translate_path(path))
+        if file.is_dir():
+            file = file / 'index.html'
+        if file.suffix == '.html' and file.is_file():
+            html = file.read_text()
+            if '</body>' in html:
+                html = html.replace('</body>', RELOAD_SCRIPT + '</body>', 1)
+            else:
+                html += RELOAD_SCRIPT
+            body = html.encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        else:
+            super().do_GET()
+
+    def send_reload_events(self) -> None:
+        """Send a server-sent event after every build, for as long as the page is open."""
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.end_headers()
+        builds = self.server.builds
+        try:
+            while True:
+                with self.server.built:
+                    self.server.built.wait_for(lambda: self.server.builds != builds, timeout=15)
+                if self.server.builds != builds:
+                    builds = self.server.builds
+                    self.wfile.write(b"data: reload\n\n")
+                else:
+                    self.wfile.write(b": keep-alive\n\n")
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def end_headers(self) -> None:
+        # Always load the latest exported data
+        self.send_header('Cache-Control', 'no-cache')
+        super().end_headers()
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+###############################################################################
+## Checking that the database is consistent with its version
+
+# The lines of the YAML database that have the id and the deleted status of each entry
+ID_LINE = re.compile(r'^- Id: +(.+)')
+DELETED_LINE = re.compile(r'^ +Status: +deleted')
+
+# Width of the columns when showing the differences between the versions
+VERSION_COLUMN = 59
+
+
+def check_version(args: argparse.Namespace, glosses: Glosses) -> None:
+    """
+    Compare the ids in the database with the tagged commit of its version, which is read from git.
+    All ids in the tagged version must still be in the database, and no new ids can be added or deleted
+    without updating the version.
+    """
+    version = read_version(args)
+    commit = git_command(args, 'rev-parse', '--verify', '--quiet', f'{version}^{{commit}}')
+    if not commit:
+        print(f"\nVersion {version} does not exist (yet)")
+        raise ValueError(f"Commit your changes and create a tag: git tag {version}")
+    commit = commit.decode().strip()
+    print(f"Version {version} exists, comparing with commit {commit}")
+
+    oldids = versioned_ids(args, version, commit)
+    newids = {id: item.Status == 'deleted' for id, item in glosses.items() if item.Type is not CCType.section}
+    if not args.keep_deleted:
+        # The deleted entries are not in the glosses, so they are scanned from the database
+        with open(args.cc_database) as F:
+            newids.update((id, True) for id, deleted in scan_ids(F) if deleted)
+    old = sorted(id + ":DELETED" * deleted for id, deleted in oldids.items())
+    new = sorted(id + ":DELETED" * deleted for id, deleted in newids.items())
+    if old == new:
+        print(f"The current database is ok with version {version}")
+        return
+
+    print()
+    print(f"{'missing from new database':{VERSION_COLUMN}}|    not in version {version}")
+    print(f"{'-' * VERSION_COLUMN}|{'-' * VERSION_COLUMN}")
+    for opcode, i1, i2, j1, j2 in difflib.SequenceMatcher(None, old, new, autojunk=False).get_opcodes():
+        if opcode == 'equal':
+            continue
+        for i in range(max(i2 - i1, j2 - j1)):
+            left = old[i1 + i] if i1 + i < i2 else ""
+            right = new[j1 + i] if j1 + i < j2 else ""
+            mark = "|" if left and right else "<" if left else ">"
+            print(f"{left:{VERSION_COLUMN}}{mark}" + (f"    {right}" if right else ""))
+    print()
+    raise ValueError(f"You have to update the file {args.cc_database.with_suffix('.version')} with a new version > {version}")
+
+
+def versioned_ids(args: argparse.Namespace, version: str, commit: str) -> dict[str, bool]:
+    """The ids in the database of a tagged version, and if they are deleted, cached for each tag."""
+    cachefile = cache_file(args, f'.{version}.ids.pickle')
+    key = f"{commit}:{args.cc_database.name}"
+    ids = read_cache(cachefile, key)
+    if ids is None:
+        blob = git_command(args, 'cat-file', 'blob', f'{commit}:./{args.cc_database.name}')
+        if blob is None:
+            raise ValueError(f"Could not read {args.cc_database.name} from commit {commit}")
+        ids = dict(scan_ids(blob.decode().splitlines()))
+        write_cache(cachefile, key, ids)
+    return ids  # type: ignore
+
+
+def scan_ids(lines: Iterable[str]) -> Iterator[tuple[str, bool]]:
+    """
+    Yield the id of each entry in the YAML database and if it is deleted, by only looking at the lines
+    with an id or a status, which is much faster than parsing the YAML.
+    """
+    id, deleted = None, False
+    for line in lines:
+        if m := ID_LINE.match(line):
+            if id is not None:
+                yield id, deleted
+            id, deleted = m.group(1).rstrip(), False
+        elif DELETED_LINE.match(line):
+            deleted = True
+    if id is not None:
+        yield id, deleted
+
+
+def git_command(args: argparse.Namespace, *command: str) -> bytes | None:
+    """Run a git command in the directory of the database, and return its output, or None if it fails."""
+    result = subprocess.run(['git', *command], cwd=args.cc_database.parent.resolve(), capture_output=True)
+    return result.stdout if result.returncode == 0 else None
+
+
 ###############################################################################
 ## Command-line parsing
 
@@ -345,27 +1230,169 @@ parser.add_argument('--js-object', '-j', type=str,
                     help=f'name Javascript object to store the data (default: output json)')
 parser.add_argument('--html', action='store_true', help=f'html in value strings (default: plain text)')
 parser.add_argument('--compact', action='store_true', help=f'compact JSON output (default: indented)')
+parser.add_argument('--shards', type=int, default=0,
+                    help=f'move definitions and examples from the JSON output into this many separate files (needs --output)')
+parser.add_argument('--output', '-o', type=Path, help=f'write the export to this file (default: stdout)')
 parser.add_argument('--keep-deleted', '-d', action='store_true', help=f'keep deleted terms')
+parser.add_argument('--manifest', '-m', type=Path,
+                    help=f'YAML file listing several outputs to export in one run (see cc-exports.yaml)')
+parser.add_argument('--incremental', '-i', action='store_true',
+                    help=f'only validate and export the CCs affected by the changes since the last incremental build')
+parser.add_argument('--watch', '-w', action='store_true',
+                    help=f'keep running, and build again whenever the database changes')
+parser.add_argument('--serve', '-s', type=Path, metavar='DIR',
+                    help=f'when watching, also serve DIR on localhost and reload the pages after each build')
+parser.add_argument('--port', '-p', type=int, default=8000, help=f'port for --serve (default: 8000)')
+parser.add_argument('--timings', '-t', action='store_true',
+                    help=f'print the time, number of calls (and peak memory) of each phase and validator')
+parser.add_argument('--trace-memory', action='store_true', help=f'include peak memory in the timings (this is slower)')
+parser.add_argument('--profile', type=Path, metavar='FILE',
+                    help=f'write the timings to FILE if it ends with .json, otherwise write cProfile statistics')
+parser.add_argument('--jobs', type=int, default=1,
+                    help=f'number of parallel processes for validation, 0 means one per CPU (default: 1)')
+parser.add_argument('--no-cache', action='store_true', help=f'always parse the YAML database, bypassing the cache')
+parser.add_argument('--check-version', action='store_true',
+                    help=f'check that the ids are consistent with the git tag of the database version')
 parser.add_argument('cc_database', type=Path, help='YAML database of comparative concepts')
 
 
 def main(args: argparse.Namespace) -> None:
     validation.set_error_verbosity(not args.quiet)
-    if not args.format:
+    if args.jobs < 1:
+        args.jobs = os.cpu_count() or 1
+    if not (args.format or args.manifest):
+        if args.output:
+            raise ValueError("An --output file needs an export --format")
         print("No output format selected, I will only validate the database.", file=sys.stderr)
-    glosses: Glosses = validation.parse_yaml_database(args.cc_database, args.keep_deleted)
-    validation.validate_database(glosses)
-    if args.format:
-        validation.reset_errors_and_warnings()
-        with open(args.cc_database.with_suffix('.version')) as version:
-            ccdb = CCDB(glosses, version.read().strip())
+    outputs = read_manifest(args) if args.manifest else [args] if args.output else []
+    if args.watch:
+        watch(args, outputs)
+    elif args.incremental:
+        save_state(args, build_incrementally(args, outputs, load_state(args)))
+    else:
+        glosses: Glosses = load_glosses(args)
+        validation.validate_database(glosses, jobs=args.jobs)
+        if args.check_version:
+            check_version(args, glosses)
+        if args.format or outputs:
+            validation.reset_errors_and_warnings()
+            export(args, outputs, CCDB(glosses, read_version(args)))
+
+
+def read_version(args: argparse.Namespace) -> str:
+    with open(args.cc_database.with_suffix('.version')) as version:
+        return version.read().strip()
+
+
+def export(args: argparse.Namespace, outputs: list[argparse.Namespace], ccdb: CCDB) -> None:
+    if outputs:
+        export_outputs(ccdb, outputs)
+    else:
         ccdb.export(args)
         validation.report_errors_and_warnings(f"exporting to {args.format} format")
 
 
+###############################################################################
+## Exporting several outputs in one run
+
+# The keys that can be used in a manifest entry, and the arguments they set
+MANIFEST_KEYS = {
+    'output': 'output',
+    'format': 'format',
+    'keys': 'keys',
+    'relations': 'relations',
+    'js-object': 'js_object',
+    'html': 'html',
+    'compact': 'compact',
+    'shards': 'shards',
+}
+
+
+def read_manifest(args: argparse.Namespace) -> list[argparse.Namespace]:
+    """Read a manifest of outputs, and return the export arguments for each of them."""
+    with open(args.manifest) as F:
+        entries = yaml.safe_load(F) or []
+    outputs: list[argparse.Namespace] = []
+    for entry in entries:
+        outargs = parser.parse_args([str(args.cc_database)])
+        for key, value in entry.items():
+            if key not in MANIFEST_KEYS:
+                raise ValueError(f"Unknown key {key!r} in manifest {args.manifest}")
+            setattr(outargs, MANIFEST_KEYS[key], value)
+        if not entry.get('output'):
+            raise ValueError(f"Missing output file in manifest {args.manifest}: {entry}")
+        if outargs.format not in OutputFormats:
+            raise ValueError(f"Unknown format {outargs.format!r} for {outargs.output} in manifest {args.manifest}")
+        outputs.append(outargs)
+    return outputs
+
+
+def export_outputs(ccdb: CCDB, outputs: list[argparse.Namespace]) -> None:
+    """
+    Export to all outputs from the same database. Each output is first written to a temporary file,
+    and the output files are only replaced if there were no errors.
+    """
+    tmpfiles: dict[Path, Path] = {}
+    try:
+        for outargs in outputs:
+            output = Path(outargs.output)
+            tmpfile = output.with_name(f".{output.name}.{os.getpid()}.tmp")
+            tmpfiles[tmpfile] = output
+            with open(tmpfile, 'w') as F, contextlib.redirect_stdout(F):
+                ccdb.export(outargs)
+            if outargs.format == 'json' and outargs.shards:
+                for shardfile, lines in ccdb.json_shards(outargs):
+                    tmpfile = shardfile.with_name(f".{shardfile.name}.{os.getpid()}.tmp")
+                    tmpfiles[tmpfile] = shardfile
+                    with open(tmpfile, 'w') as F:
+                        F.writelines(lines)
+        validation.report_errors_and_warnings(f"exporting to {', '.join(str(out.output) for out in outputs)}")
+        for tmpfile, output in tmpfiles.items():
+            os.replace(tmpfile, output)
+    finally:
+        for tmpfile in tmpfiles:
+            tmpfile.unlink(missing_ok=True)
+
+
+# Functions and methods in this module that are timed when timings are enabled
+TIMED_FUNCTIONS = ['load_glosses', 'build_incrementally', 'export_outputs']
+TIMED_METHODS = [
+    '__init__', 'export', 'parse_definition', 'clean_link', 'find_closest',
+    'convert_definition', 'clean_text', 'print_json', 'export_to_fnbr',
+]
+
+
+def profile_main(args: argparse.Namespace) -> None:
+    """Run main with timings and/or profiling."""
+    json_trace = args.profile and args.profile.suffix == '.json'
+    if args.timings or args.trace_memory or json_trace:
+        validation.enable_timings(
+            [(sys.modules[__name__], TIMED_FUNCTIONS), (CCDB, TIMED_METHODS)],
+            memory=args.trace_memory,
+        )
+    profiler = cProfile.Profile() if args.profile and not json_trace else None
+    try:
+        if profiler:
+            profiler.runcall(main, args)
+        else:
+            main(args)
+    finally:
+        if args.timings or args.trace_memory:
+            validation.report_timings()
+        if json_trace:
+            with open(args.profile, 'w') as F:
+                json.dump(validation.TIMINGS, F, indent=2)
+        if profiler:
+            profiler.dump_stats(args.profile)
+
+
 if __name__ == '__main__':
     try:
-        main(parser.parse_args())
+        args = parser.parse_args()
+        if args.timings or args.trace_memory or args.profile:
+            profile_main(args)
+        else:
+            main(args)
     except ValueError as err:
         sys.exit(str(err))
 
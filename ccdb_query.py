@@ -0,0 +1,243 @@
+import sys
+import json
+import argparse
+from pathlib import Path
+from collections import deque
+from collections.abc import Iterable, Iterator
+
+import validation
+from validation import CCType, Relation, Glosses
+import ccdb_parser
+
+
+# Reachability of every node, as bitsets where bit i is set if node i can be reached
+Bitsets = list[int]
+
+
+###############################################################################
+## Graph traversal over the database
+
+class CCGraph:
+    """
+    Adjacency lists over the CC relations, with the nodes numbered in database order.
+    A relation goes upwards, from a CC to its targets: the ancestors of a CC are reached by
+    following the relations forwards, and its descendants by following them backwards.
+    The transitive closures are computed once for each combination of relations and direction,
+    and stored as reachability bitsets, so that later queries are only bit operations.
+    """
+    glosses: Glosses
+    ids: list[str]
+    index: dict[str, int]
+    forward: dict[Relation, list[list[int]]]
+    reverse: dict[Relation, list[list[int]]]
+    typemasks: dict[CCType, int]
+    closures: dict[tuple[frozenset[Relation], bool], Bitsets]
+
+    def __init__(self, glosses: Glosses):
+        self.glosses = glosses
+        self.ids = list(glosses)
+        self.index = {id: n for n, id in enumerate(self.ids)}
+        self.forward = {rel: [[] for _ in self.ids] for rel in Relation}
+        self.reverse = {rel: [[] for _ in self.ids] for rel in Relation}
+        self.typemasks = {cctype: 0 for cctype in CCType}
+        self.closures = {}
+        for n, item in enumerate(glosses.values()):
+            self.typemasks[item.Type] |= 1 << n
+            for rel, relids in item.Relations.items():
+                for relid in relids:
+                    if relid in self.index:
+                        self.forward[rel][n].append(self.index[relid])
+                        self.reverse[rel][self.index[relid]].append(n)
+
+    def node(self, id: str) -> int:
+        if id not in self.index:
+            raise ValueError(f"Unknown CC id: {id}")
+        return self.index[id]
+
+    def successors(self, relations: Iterable[Relation], backwards: bool) -> list[list[int]]:
+        """The adjacency lists for the given relations, merged into one list per node."""
+        adjacency = self.reverse if backwards else self.forward
+        relations = list(relations)
+        if len(relations) == 1:
+            return adjacency[relations[0]]
+        return [sorted({m for rel in relations for m in adjacency[rel][n]}) for n in range(len(self.ids))]
+
+    def closure(self, relations: Iterable[Relation] | None = None, backwards: bool = False) -> Bitsets:
+        """The transitive closure of the relations (default: all), cached as one reachability bitset per node."""
+        key = (frozenset(relations or Relation), backwards)
+        if key not in self.closures:
+            self.closures[key] = reachability(self.successors(sorted(key[0]), backwards))
+        return self.closures[key]
+
+    def select(self, bits: int, types: Iterable[CCType] | None = None) -> list[str]:
+        """The ids of the nodes in the bitset, in database order, optionally only the CCs of the given types."""
+        if types is not None:
+            mask = 0
+            for cctype in types:
+                mask |= self.typemasks[cctype]
+            bits &= mask
+        return [self.ids[n] for n in iter_bits(bits)]
+
+    def ancestors(self, id: str, relations: Iterable[Relation] | None = None,
+                  types: Iterable[CCType] | None = None) -> list[str]:
+        """All CCs that can be reached from the CC by following the relations (default: all) forwards."""
+        return self.select(self.closure(relations)[self.node(id)], types)
+
+    def descendants(self, id: str, relations: Iterable[Relation] | None = None,
+                    types: Iterable[CCType] | None = None) -> list[str]:
+        """All CCs that reach the CC by following the relations (default: all) forwards."""
+        return self.select(self.closure(relations, backwards=True)[self.node(id)], types)
+
+    def is_ancestor(self, ancestor: str, id: str, relations: Iterable[Relation] | None = None) -> bool:
+        return bool(self.closure(relations)[self.node(id)] >> self.node(ancestor) & 1)
+
+    def shortest_path(self, source: str, target: str, relations: Iterable[Relation] | None = None,
+                      directed: bool = False) -> list[str] | None:
+        """
+        A shortest path from source to target using the relations (default: all), as a list of ids.
+        If directed, the path only follows the relations forwards, otherwise in both directions.
+        Returns None if there is no path.
+        """
+        start, goal = self.node(source), self.node(target)
+        relations = sorted(frozenset(relations or Relation))
+        if directed and not (start == goal or self.closure(relations)[start] >> goal & 1):
+            return None
+        adjacency = [self.successors(relations, False)]
+        if not directed:
+            adjacency.append(self.successors(relations, True))
+        parents = {start: start}
+        queue = deque([start])
+        while queue and goal not in parents:
+            n = queue.popleft()
+            for successors in adjacency:
+                for m in successors[n]:
+                    if m not in parents:
+                        parents[m] = n
+                        queue.append(m)
+        if goal not in parents:
+            return None
+        path = [goal]
+        while path[-1] != start:
+            path.append(parents[path[-1]])
+        return [self.ids[n] for n in reversed(path)]
+
+
+def reachability(successors: list[list[int]]) -> Bitsets:
+    """
+    The transitive closure of a graph, as a bitset for each node of all nodes reachable from it (not itself,
+    unless it is on a cycle). Tarjan's algorithm finds the strongly connected components with their
+    successors first, so each component's bitset is the union of already computed bitsets.
+    """
+    size = len(successors)
+    reach: Bitsets = [0] * size
+    order = [-1] * size
+    lowlink = [0] * size
+    onstack = [False] * size
+    stack: list[int] = []
+    counter = 0
+    for root in range(size):
+        if order[root] >= 0:
+            continue
+        work = [(root, 0)]
+        while work:
+            n, i = work.pop()
+            if i == 0:
+                order[n] = lowlink[n] = counter
+                counter += 1
+                stack.append(n)
+                onstack[n] = True
+            succs = successors[n]
+            while i < len(succs):
+                m = succs[i]
+                i += 1
+                if order[m] < 0:
+                    work.append((n, i))
+                    work.append((m, 0))
+                    break
+                if onstack[m]:
+                    lowlink[n] = min(lowlink[n], order[m])
+            else:
+                if lowlink[n] == order[n]:
+                    component: list[int] = []
+                    while True:
+                        m = stack.pop()
+                        onstack[m] = False
+                        component.append(m)
+                        if m == n:
+                            break
+                    bits = 0
+                    for m in component:
+                        for s in successors[m]:
+                            bits |= reach[s] | (1 << s)
+                    for m in component:
+                        reach[m] = bits
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[n])
+    return reach
+
+
+def iter_bits(bits: int) -> Iterator[int]:
+    while bits:
+        lowest = bits & -bits
+        yield lowest.bit_length() - 1
+        bits ^= lowest
+
+
+###############################################################################
+## Command-line parsing
+
+QUERIES = ['ancestors', 'descendants', 'path']
+
+parser = argparse.ArgumentParser(description='Query the relations between comparative concepts in the database.')
+parser.add_argument('--quiet', '-q', action='store_true', help=f'suppress warnings')
+parser.add_argument('--relations', '-r', nargs='+', choices=[rel.value for rel in Relation],
+                    help=f'relations to follow (default: all)')
+parser.add_argument('--types', '-t', nargs='+', choices=[cctype.value for cctype in CCType],
+                    help=f'only output CCs of these types (default: all types)')
+parser.add_argument('--directed', action='store_true',
+                    help=f'paths only follow the relations forwards (default: in both directions)')
+parser.add_argument('--json', action='store_true', help=f'output the results as JSON')
+parser.add_argument('--no-cache', action='store_true', help=f'always parse the YAML database, bypassing the cache')
+parser.add_argument('cc_database', type=Path, help='YAML database of comparative concepts')
+parser.add_argument('query', choices=QUERIES,
+                    help=f'"ancestors" or "descendants" of each CC, or the shortest "path" between two CCs')
+parser.add_argument('ids', nargs='+', help='CC ids, or "-" to read them from stdin (one per line)')
+
+
+def main(args: argparse.Namespace) -> None:
+    validation.set_error_verbosity(not args.quiet)
+    args.keep_deleted = False
+    graph = CCGraph(ccdb_parser.load_glosses(args))
+    relations = [Relation(rel) for rel in args.relations] if args.relations else None
+    types = [CCType(cctype) for cctype in args.types] if args.types else None
+    ids = [line.strip() for line in sys.stdin if line.strip()] if args.ids == ['-'] else args.ids
+
+    results: dict[str, list[str] | None] = {}
+    if args.query == 'path':
+        if len(ids) != 2:
+            raise ValueError(f"A path query needs exactly two ids, not {len(ids)}")
+        results[" ".join(ids)] = graph.shortest_path(ids[0], ids[1], relations, args.directed)
+    else:
+        query = graph.ancestors if args.query == 'ancestors' else graph.descendants
+        for id in ids:
+            results[id] = query(id, relations, types)
+
+    if args.json:
+        print(json.dumps(results, indent=2, ensure_ascii=False))
+        return
+    for query, result in results.items():
+        if len(results) > 1:
+            print(f"## {query}")
+        if result is None:
+            print("No path found")
+            continue
+        for id in result:
+            print(f"{id}\t{graph.glosses[id].Name}")
+
+
+if __name__ == '__main__':
+    try:
+        main(parser.parse_args())
+    except ValueError as err:
+        sys.exit(str(err))
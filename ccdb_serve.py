@@ -0,0 +1,243 @@
+import os
+import sys
+import json
+import asyncio
+import argparse
+import functools
+from pathlib import Path
+from datetime import datetime
+from urllib.parse import urlsplit, parse_qsl
+
+import yaml
+import validation
+from validation import Relation, Glosses
+import ccdb_parser
+from ccdb_parser import CCDB
+
+
+# Default number of answers that are kept in the cache
+CACHE_SIZE = 4096
+
+# The longest request line or header that is accepted
+MAX_LINE = 1 << 16
+
+STATUS_TEXT = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed'}
+
+
+class QueryError(Exception):
+    """An invalid query, with the HTTP status to answer with."""
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+###############################################################################
+## Answering queries
+
+class LookupService:
+    """
+    Answers queries about a loaded database. The answers are cached as serialized JSON in an LRU cache,
+    which belongs to this service, so that a new service with an empty cache is made when the database is reloaded.
+    """
+    glosses: Glosses
+    ccdb: CCDB
+
+    COMMANDS = ['resolve', 'entry', 'neighbours', 'definition']
+
+    def __init__(self, glosses: Glosses, version: str, cachesize: int = CACHE_SIZE):
+        self.glosses = glosses
+        self.ccdb = CCDB(glosses, version)
+        self.answer = functools.lru_cache(maxsize=cachesize)(self._answer)
+
+    def _answer(self, command: str, params: tuple[tuple[str, str], ...]) -> bytes:
+        """Answer a command with the given (sorted) parameters, as JSON."""
+        args = dict(params)
+        if command == '':
+            result: object = {'version': self.ccdb.version, 'ccs': len(self.glosses), 'commands': self.COMMANDS}
+        elif command == 'resolve':
+            result = self.resolve(self.param(args, 'term'))
+        elif command == 'entry':
+            result = self.entry(self.param(args, 'id'))
+        elif command == 'neighbours':
+            result = self.neighbours(self.param(args, 'id'), args.get('relation'), args.get('direction', 'both'))
+        elif command == 'definition':
+            result = self.definition(self.param(args, 'id'), args.get('html', 'true') != 'false')
+        else:
+            raise QueryError(404, f"Unknown command {command!r}, use one of: {', '.join(self.COMMANDS)}")
+        return json.dumps(result, ensure_ascii=False).encode()
+
+    @staticmethod
+    def param(args: dict[str, str], name: str) -> str:
+        if not args.get(name):
+            raise QueryError(400, f"Missing parameter {name!r}")
+        return args[name]
+
+    def item(self, id: str) -> validation.GlossItem:
+        if id not in self.glosses:
+            raise QueryError(404, f"Unknown CC id: {id}")
+        return self.glosses[id]
+
+    def resolve(self, term: str) -> dict[str, object]:
+        """Resolve a term in the same way as a definition link, with clean_link and find_closest."""
+        link = self.ccdb.clean_link(term)
+        ids = self.ccdb.find_closest(link) if link else ()
+        return {'term': term, 'link': link, 'ids': list(ids), 'names': [self.glosses[id].Name for id in ids]}
+
+    def entry(self, id: str) -> dict[str, object]:
+        return self.item(id).model_dump(mode='json')
+
+    def neighbours(self, id: str, relation: str | None, direction: str) -> dict[str, object]:
+        """The CCs that are related to the CC, by one or all relations, outgoing ("out"), incoming ("in") or both."""
+        item = self.item(id)
+        if direction not in ('out', 'in', 'both'):
+            raise QueryError(400, f"Unknown direction {direction!r}, use one of: out, in, both")
+        if relation and relation not in Relation.__members__:
+            raise QueryError(400, f"Unknown relation {relation!r}")
+        relations = [Relation(relation)] if relation else list(Relation)
+        result: dict[str, object] = {'id': id}
+        if direction in ('out', 'both'):
+            result['out'] = {rel.value: item.Relations[rel] for rel in relations if item.Relations.get(rel)}
+        if direction in ('in', 'both'):
+            result['in'] = {rel.value: self.ccdb.sources(id, rel) for rel in relations if self.ccdb.sources(id, rel)}
+        return result
+
+    def definition(self, id: str, html: bool) -> dict[str, object]:
+        """The definition with its links expanded, as HTML (with links to the glossary) or as plain text."""
+        item = self.item(id)
+        if html:
+            return {'id': id, 'html': self.ccdb.html_definition(id)}
+        definition = item.Definition
+        if id in self.ccdb.definitions:
+            definition = self.ccdb.convert_definition(self.ccdb.definitions[id], html=False)
+        return {'id': id, 'text': self.ccdb.clean_text(definition, html=False)}
+
+
+def load_service(args: argparse.Namespace) -> LookupService:
+    """
+    Parse and validate the database, and build a service for it. The warnings are printed,
+    and errors raise ValueError, so that a reload keeps using the previous service.
+    """
+    glosses = ccdb_parser.load_glosses(args)
+    validation.validate_database(glosses)
+    validation.reset_errors_and_warnings()
+    service = LookupService(glosses, ccdb_parser.read_version(args), args.cache_size)
+    validation.report_errors_and_warnings("resolving the definition links")
+    validation.reset_errors_and_warnings()
+    return service
+
+
+###############################################################################
+## The HTTP server
+
+class LookupServer:
+    """
+    A small asyncio HTTP server for the lookup service, on a TCP port or a Unix socket.
+    Requests are GET /command?parameters, and are answered with JSON. Connections are kept alive,
+    so that a client can send many queries over one connection.
+    The database is reloaded in a background thread when it changes, and queries are answered
+    by the old service until the new one is ready.
+    """
+    def __init__(self, args: argparse.Namespace, service: LookupService):
+        self.args = args
+        self.service = service
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request = await reader.readline()
+                if not request:
+                    break
+                headers: dict[str, str] = {}
+                while (line := await reader.readline()) not in (b'\r\n', b'\n', b''):
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+                method, target, version = (request.decode('latin-1').split() + ['', '', ''])[:3]
+                status, body = self.respond(method, target)
+                keep_alive = version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+                writer.write(
+                    f"HTTP/1.1 {status} {STATUS_TEXT[status]}\r\n"
+                    f"Content-Type: application/json; charset=utf-8\r\n"
+                    f"Content-Length: {len(body)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode() + body
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, ValueError, asyncio.LimitOverrunError):
+            pass
+        finally:
+            writer.close()
+
+    def respond(self, method: str, target: str) -> tuple[int, bytes]:
+        if method != 'GET':
+            return 405, json.dumps({'error': f"Only GET requests are supported"}).encode()
+        url = urlsplit(target)
+        params = tuple(sorted(parse_qsl(url.query)))
+        try:
+            return 200, self.service.answer(url.path.strip('/'), params)
+        except QueryError as err:
+            return err.status, json.dumps({'error': str(err)}, ensure_ascii=False).encode()
+
+    async def reload_on_change(self) -> None:
+        """Reload the database whenever it changes, like ccdb_parser.py --watch."""
+        files = [self.args.cc_database, self.args.cc_database.with_suffix('.version')]
+        modified = [file.stat().st_mtime_ns if file.exists() else None for file in files]
+        while True:
+            await asyncio.sleep(ccdb_parser.WATCH_INTERVAL)
+            current = [file.stat().st_mtime_ns if file.exists() else None for file in files]
+            if current == modified:
+                continue
+            modified = current
+            try:
+                self.service = await asyncio.to_thread(load_service, self.args)
+                print(f"Reloaded {self.args.cc_database} at {datetime.now().strftime('%H:%M:%S')}", file=sys.stderr)
+            except (ValueError, OSError, yaml.YAMLError) as err:
+                print(f"Reload failed, still using the previous version: {err}\n", file=sys.stderr)
+
+    async def serve(self) -> None:
+        if self.args.socket:
+            self.args.socket.unlink(missing_ok=True)
+            server = await asyncio.start_unix_server(self.handle, self.args.socket, limit=MAX_LINE)
+            print(f"Answering queries on {self.args.socket}", file=sys.stderr)
+        else:
+            server = await asyncio.start_server(self.handle, self.args.host, self.args.port, limit=MAX_LINE)
+            print(f"Answering queries on http://{self.args.host}:{self.args.port}/", file=sys.stderr)
+        reloader = asyncio.create_task(self.reload_on_change())
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            reloader.cancel()
+            if self.args.socket:
+                self.args.socket.unlink(missing_ok=True)
+
+
+###############################################################################
+## Command-line parsing
+
+parser = argparse.ArgumentParser(description='Keep the comparative concepts database loaded, and answer queries about it.')
+parser.add_argument('--quiet', '-q', action='store_true', help=f'suppress warnings')
+parser.add_argument('--host', default='localhost', help=f'host to listen on (default: localhost)')
+parser.add_argument('--port', '-p', type=int, default=8765, help=f'port to listen on (default: 8765)')
+parser.add_argument('--socket', type=Path, help=f'listen on this Unix socket instead of a port')
+parser.add_argument('--cache-size', type=int, default=CACHE_SIZE,
+                    help=f'number of answers to keep in the cache (default: {CACHE_SIZE})')
+parser.add_argument('--no-cache', action='store_true', help=f'always parse the YAML database, bypassing the cache')
+parser.add_argument('cc_database', type=Path, help='YAML database of comparative concepts')
+
+
+def main(args: argparse.Namespace) -> None:
+    validation.set_error_verbosity(not args.quiet)
+    args.keep_deleted = False
+    server = LookupServer(args, load_service(args))
+    try:
+        asyncio.run(server.serve())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    try:
+        main(parser.parse_args())
+    except ValueError as err:
+        sys.exit(str(err))
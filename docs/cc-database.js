@@ -15,6 +15,7 @@ function initialize() {
     build_table();
     init_linktitles();
     init_searchfilter();
+    init_shards();
     const elapsedTime = new Date().getTime() - startTime;
     console.log(`Finished initialization in ${elapsedTime/1000} s`);
 }
@@ -26,19 +27,7 @@ function build_table() {
     document.getElementById("db-statistics").innerText =
         `${DATA.nodes.length} CCs, with ${DATA.edges.length} relations`;
 
-    DATA.concepts = {};
-    for (const cc of DATA.nodes) {
-        cc.related = [];
-        DATA.concepts[cc.id] = cc;
-    }
-    DATA.relations = {};
-    for (const e of DATA.edges) {
-        DATA.concepts[e.start].related.push(e.end);
-        DATA.concepts[e.end].related.push(e.start);
-        if (!(e.rel in DATA.relations)) DATA.relations[e.rel] = {start: {}, end: {}};
-        (DATA.relations[e.rel].start[e.start] ??= []).push(e.end);
-        (DATA.relations[e.rel].end[e.end] ??= []).push(e.start);
-    }
+    index_concepts();
 
     const template = document.getElementById("cc-entry-template");
     DATA.nodes.sort((a,b) => Intl.Collator().compare(a.name,b.name));
@@ -77,11 +66,12 @@ function build_cc_item(cc, template) {
             elem.innerHTML = cc.alias.join(" <br/>");
             break;
         case "cc-definition":
-            if (!cc.definition) {
+            // In a sharded export, the definition is filled in when its shard is loaded
+            if (!cc.definition && cc.shard === undefined) {
                 row.remove();
                 break;
             }
-            elem.innerHTML = cc.definition;
+            elem.innerHTML = cc.definition || "";
             break;
         case "cc-not-original":
             if (!cc.notOriginal) row.remove();
@@ -132,117 +122,58 @@ function ccName(id) {
     return `${cc.name} (<em>${cc.type}</em>)`;
 }
 
-function stripHTML(html) {
-    const tmp = document.createElement("div");
-    tmp.innerHTML = html;
-    return tmp.textContent || "";
-}
-
 
 ///////////////////////////////////////////////////////////////////////////////
 // Show preview when hovering over links
 
 function init_linktitles() {
-    for (const elem of document.getElementsByTagName('a')) {
-        elem.addEventListener('mouseover', set_link_title);
-    }
+    // One listener for all links, so that it also works for definitions that are loaded later
+    document.addEventListener('mouseover', set_link_title);
 }
 
 function set_link_title(event) {
-    if (typeof event.target.href !== "string") return;
-    const url = new URL(event.target.href);
+    const link = event.target.closest?.("a[href]");
+    if (!link || typeof link.href !== "string") return;
+    const url = new URL(link.href);
     const id = url.hash.replace("#", "");
     const cc = DATA.concepts[id];
     if (cc) {
-        event.target.title = cc.name.toUpperCase() + "\n" + stripHTML(cc.definition || "[no definition]");
+        load_shard(cc.shard).then(() => {
+            link.title = cc.name.toUpperCase() + "\n" + stripHTML(cc.definition || "[no definition]");
+        });
     }
 }
 
 
 ///////////////////////////////////////////////////////////////////////////////
-// Searching/filtering CCs
-
-function init_searchfilter() {
-    for (const id in DATA.concepts) {
-        const cc = DATA.concepts[id];
-        cc.search = {
-            name: (cc.alias || []).concat(cc.name).join("\n"),
-            definition: stripHTML(cc.definition),
-            relation: cc.related.map((c) => DATA.concepts[c].name).join("\n"),
-        };
-    }
-    for (const elem of document.querySelectorAll('a')) {
-        elem.addEventListener('click', () => setTimeout(filter_ccs, 100));
-    }
-    for (const elem of document.querySelectorAll('#search input')) {
-        elem.addEventListener('input', filter_ccs);
+// Loading definitions when they are needed (only for sharded exports, see cc-shards.js)
+
+function init_shards() {
+    if (!DATA.shards) return;
+    document.addEventListener("shardloaded", (event) => show_definitions(event.detail));
+    const observer = new IntersectionObserver((entries) => {
+        for (const entry of entries) {
+            if (entry.isIntersecting) {
+                observer.unobserve(entry.target);
+                load_shard(DATA.concepts[entry.target.id].shard);
+            }
+        }
+    });
+    for (const cc of DATA.nodes) {
+        if (cc.shard !== undefined) observer.observe(cc.elem);
     }
-    document.getElementById("search").addEventListener("toggle", filter_ccs);
-    window.addEventListener("hashchange", filter_ccs);
-    filter_ccs();
 }
 
-
-function filter_ccs() {
-    const glosses = document.getElementById("glosses");
-    new Mark(glosses).unmark();
-
-    const current_id = window.location.hash.replace("#", "");
-    const current_elem = current_id && document.getElementById(current_id);
-    if (current_elem) {
-        const current_name = current_elem.querySelector(".cc-header-name");
-        new Mark(current_name).markRanges([{
-            start: 0, length: current_name.innerText.trim().length,
-        }]);
-    }
-
-    // Define search variables, based on current search term
-    // We only care about alphanumeric characters
-    let search_term = document.getElementById("search-box").value.trim().replace(/\W+/g, " ");
-    const is_search = (
-        document.getElementById("search").hasAttribute("open") &&
-        search_term.length >= 3
-    );
-    if (!is_search) {
-        document.querySelectorAll(".cc").forEach((elem) => {elem.style.display = ""});
-        document.getElementById("search-info").innerText = `Type at least 3 characters`;
-        return;
-    }
-
-    const match_type = document.querySelector('#search input[name="matchtype"]:checked')?.value;
-    if (match_type === "startswith") {
-        search_term = "^" + search_term.replaceAll(" ", "\\S*?\\s*");
-    } else if (match_type === "wordstarts") {
-        search_term = "\\b" + search_term.replaceAll(" ", ".*?\\b");
-    } else {
-        search_term = search_term.replaceAll(" ", ".*?");
-    }
-    const regex = new RegExp(search_term, "igm");
-    const mark_regex = new RegExp(search_term.replace("^", "\\b"), "igm");
-
-    const filter_types = [...document.querySelectorAll('#search input[name="filtertype"]:checked')].map((e) => e.value);
-    const cc_types = new Set([...document.querySelectorAll('#search input[name="cctype"]:checked')].map((e) => e.value));
-
-    let count = 0;
-    for (const id in DATA.concepts) {
+function show_definitions(ids) {
+    for (const id of ids) {
         const cc = DATA.concepts[id];
-        const show = (
-            cc_types.has(cc.type) &&
-            filter_types.some((type) => regex.test(cc.search[type]))
-        );
-        if (id === current_id || show) {
-            cc.elem.style.display = "";
-            count++;
-            for (const type of filter_types) {
-                const contents = cc.elem.querySelectorAll("." + type);
-                new Mark(contents).markRegExp(mark_regex, {acrossElements: true});
-            }
+        cc.search.definition = stripHTML(cc.definition);
+        const row = cc.elem.querySelector('[type="cc-definition"]');
+        if (!row) continue;
+        if (cc.definition) {
+            row.querySelector(".cc-info").innerHTML = cc.definition;
         } else {
-            cc.elem.style.display = "none";
+            row.remove();
         }
     }
-
-    document.getElementById("search-info").innerText = `Showing ${count} CCs (out of ${DATA.nodes.length})`;
-    document.getElementById("search-box").focus();
-    if (current_elem) current_elem.scrollIntoView();
 }
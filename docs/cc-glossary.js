@@ -0,0 +1,21 @@
+window.name = "CC-database";
+window.addEventListener("DOMContentLoaded", initialize);
+
+// The glossary is pre-rendered by ccdb_parser.py (--format html), with link titles,
+// so the only thing left to do is the searching/filtering.
+// DATA comes from cc-graph-core.js, where the definitions are left out, so they are taken from the page.
+
+function initialize() {
+    const startTime = new Date().getTime();
+    index_concepts();
+    for (const cc of DATA.nodes) {
+        cc.elem = document.getElementById(cc.id);
+        if (cc.shard !== undefined) {
+            cc.definition = cc.elem.querySelector(".definition")?.innerHTML;
+        }
+    }
+    delete DATA.shards;
+    init_searchfilter();
+    const elapsedTime = new Date().getTime() - startTime;
+    console.log(`Finished initialization in ${elapsedTime/1000} s`);
+}
@@ -0,0 +1 @@
+DATA.shards[0] = {"cxn:adjectival-phrase": {"definition": "an <a href=\"#cxn:attributive-phrase\">attributive phrase</a> whose <a href=\"#cxn:head\">head</a> denotes a <a href=\"#sem:property-concept\">property concept</a>. <em>Example</em>: in <em>a very large balloon, very large</em> is an adjectival phrase; the head <em>large</em> denotes a property concept. An adjectival phrase is the prototypical attributive phrase, and its head is an <a href=\"#cxn:adjective\">adjective</a>. (Section 2.2.3)"}, "cxn:adjective": {"definition": "the <a href=\"#cxn:head\">head</a> of an <a href=\"#cxn:attributive-phrase\">attributive phrase</a> that denotes a <a href=\"#sem:property-concept\">property</a>. <em>Example</em>: the word <em>new</em> in <em>a very new book</em> is an adjective \u2013 it is a property concept that is the head of the attributive phrase <em>very new</em> and <a href=\"#inf:modification\">modifies</a> <em>book</em>. (Sections 2.2.3, 4.1.1)"}, "cxn:admodifier": {"definition": "a construction that performs the function of <a href=\"#inf:admodification\">admodification</a>. <em>Example</em>: in <em>very slow, very</em> is an admodifier that intensifies the speed denoted by the <a href=\"#cxn:modifier\">modifier</a> <em>slow</em>. (Sections 2.2.2, <strong>4.1.2</strong>)"}, "cxn:adverbial-clause-construction": {"definition": "a <a href=\"#cxn:complex-sentence\">complex sentence construction</a> with a <a href=\"#inf:figure-ground\">figure\u2013ground</a> construal / information packaging of the relation between the <a href=\"#sem:event\">events</a> denoted by the two <a href=\"#cxn:clause\">clauses</a>. An adverbial clause construction is made up of a <a href=\"#cxn:matrix-clause\">matrix clause</a> and an <a href=\"#cxn:adverbial-dependent-clause\">adverbial dependent clause</a>. <em>Example</em>: <em>I left early because I was bored</em> is an instance of an adverbial clause construction. (Section 15.3.1)"}, "cxn:adverbial-dependent-clause": {"definition": "the <a href=\"#cxn:dependent-clause\">dependent clause</a> in an <a href=\"#cxn:adverbial-clause-construction\">adverbial clause construction</a>; it is construed as the ground in the <a href=\"#inf:figure-ground\">figure\u2013ground</a> <span class=\"separation\"/> <a href=\"#inf:information-packaging\">information packaging</a> of the construction. <em>Example</em>: in <em>I left early because I was bored, I was bored</em> is the adverbial dependent clause. (Section 15.3.1)"}, "cxn:adversative-coordination": {"definition": "a type of <a href=\"#cxn:coordinate-clause-construction\">coordinate clause construction</a> typically equated with coordination by <q>but</q>, representing some sort of contrast in the relevant context. Adversative coordination is prototypically with <a href=\"#sem:simple-contrast\">simple contrast</a>, but often may also express an <a href=\"#sem:unexpected-co-occurrence\">unexpected co-occurrence</a>. <em>Example</em>: <em>Petja is diligent but Vanja is lazy</em> is an instance of adversative coordination, with a simple contrast between the two events. (Section 15.2.1)"}, "cxn:affecting-verb": {"definition": "a <a href=\"#cxn:verb\">verb</a> that expresses an <a href=\"#sem:affecting\">affecting event</a>. <em>Example</em>: <em>The dog surprised me</em> is an instance of an affecting event, and <em>surprise</em> is an affecting verb. (Section 7.4)"}, "cxn:age-term": {"definition": "a <a href=\"#cxn:modifier\">modifier</a> expressing a concept of age, maturity, or ripeness. <em>Examples</em>: <em>old</em> and <em>ripe</em> are English age terms. (Section 4.1.2)"}, "cxn:agentive-change-of-state-verb": {"definition": "a <a href=\"#cxn:verb\">verb</a> that expresses an agentive change of state event. <em>Example</em>: the event of a person drying dishes is an agentive change of state event, and <em>dry</em> is an agentive change of state verb. (Section 6.2.1)"}, "cxn:alienable-possession-modification-construction": {"definition": "a <a href=\"#cxn:possessive-modification-construction\">possessive modification construction</a> that always includes the <a href=\"#sem:ownership\">ownership relation</a>, and contrasts in the language with an <a href=\"#cxn:inalienable-possession-modification-construction\">inalienable possession construction</a>. <em>Example</em>: Crow <em>bas-\u00f3osshee</em> <q>my food</q> is an instance of alienable possession, using the distinct index bas- (cf. the inalienable <a href=\"#str:index\">index</a> b-). (Section 4.1.4)"}, "cxn:alternative-question-construction": {"definition": "a construction expressing the <a href=\"#inf:alternative-question\">alternative question function</a>. <em>Example</em>: <em>Do you prefer beer or wine?</em> is an instance of an alternative question construction, where the alternatives offered are beer and wine. (Section 12.3.1)"}, "cxn:amount-term": {"definition": "a form used to indicate an imprecise quantity for noncountable entities. <em>Example</em>: in <em>some wine</em>, <em>some</em> is an amount term. (Section 4.1.3)"}, "cxn:anaphoric-article": {"definition": "an <a href=\"#cxn:article\">article</a> that is used for a <a href=\"#inf:semi-active-referent\">semi-active referent</a>. <em>Example</em>: in the Nguna text passage <em>e tape araa ni nararo...go nararo wanogoe...</em> <q>[he] took the branch of the <em>nararo</em> tree...and the aforementioned <em>nararo</em> tree...</q>, <em>wanogoe</em> <q>the aforementioned</q> is an anaphoric article. An anaphoric article is always used when the referent is semi-active because it has been previously referred to in the discourse. (Section 3.3.1)"}, "cxn:anaphoric-head-construction": {"definition": "an anaphoric-head construction contains a <a href=\"#cxn:modifier\">modifier</a> that modifies a (semantic) <a href=\"#cxn:head\">head</a> that <a href=\"#inf:reference\">refers</a> to an <a href=\"#sem:token\">individual</a> of the same <a href=\"#sem:type\">type</a> as one previously referred to. <em>Example</em>: in <em>I took a red candy and Greg took a green one, a green one</em> is an anaphoric-head construction, referring to a green candy. An <a href=\"#cxn:anaphoric-head-relative-clause-construction\">anaphoric-head relative clause construction</a> is a special case of the anaphoric-head construction. (Sections 5.4, 19.4)"}, "cxn:anaphoric-head-relative-clause-construction": {"definition": "an <a href=\"#cxn:anaphoric-head-construction\">anaphoric-head construction</a> in which the <a href=\"#cxn:modifier\">modifier</a> is a <a href=\"#cxn:clause\">clause</a> denoting an <a href=\"#sem:event\">event</a>. <em>Example</em>: in K'ichee' <em>utz</em> [<em>l\u0113 xubij l\u0113 achi</em>] <q>What the man said is good</q>, the clause <em>l\u0113 xubij l\u0113 achi</em> <q>the man said [it]</q> is an instance of the anaphoric-head relative clause construction. (Section 19.4)"}, "cxn:anaphoric-pronoun": {"definition": "a <a href=\"#cxn:pronoun\">pronoun</a> that is used for <a href=\"#inf:active-referent\">active</a> referents. <em>Example</em>: English unstressed <em>he</em>, <em>she</em>, <em>they</em> are examples of anaphoric pronouns. Anaphoric pronouns are most often, but not always, used when the referent is active because it has been previously referred to in the discourse. (Section 3.3.1)"}, "cxn:anchoring-construction": {"definition": "a <a href=\"#cxn:nominal-modification-construction\">nominal modifier construction</a> whose <a href=\"#sem:object-concept\">object</a> <span class=\"separation\"/> <a href=\"#cxn:modifier\">modifier</a> functions as an <a href=\"#inf:anchor\">anchor</a>. <em>Example</em>: <em>Peter's bag</em> is an anchoring construction, since the identity of Peter allows the interlocutors to identify the referent of <em>bag</em>. (Section 5.2.1)"}, "cxn:antipassive-construction": {"definition": "any <a href=\"#cxn:construction\">construction</a> that is used for a <a href=\"#sem:p-role\">P</a> <span class=\"separation\"/> <a href=\"#sem:participant-role\">participant</a> that is less <a href=\"#inf:topicality\">salient</a> than it usually is in the <a href=\"#cxn:basic-voice\">basic voice construction</a>. <em>Example</em>: West Greenlandic <em>inun-nik tuqut-si-vuq</em> <q>He killed people</q>, with an <a href=\"#cxn:oblique-phrase\">oblique</a> <span class=\"separation\"/> <a href=\"#str:flagging\">flag</a> <em>-nik</em> for the <a href=\"#cxn:argument-phrase\">argument phrase</a> expressing P and an <a href=\"#str:overt-coding\">overtly coded</a> <span class=\"separation\"/> <a href=\"#cxn:verb\">verb</a> form with the suffix <em>-si</em>, is an instance of the antipassive construction. (Section 8.4)"}, "cxn:antonym": {"definition": "opposing values on a <a href=\"#sem:gradient\">gradient scale</a>. <em>Example</em>: <em>tall</em> and <em>short</em> are antonyms on the gradient scale of height. (Section 4.1.2)"}, "cxn:apodosis-clause": {"definition": "the <a href=\"#cxn:clause\">clause</a> expressing the causally consequent <a href=\"#sem:proposition\">proposition</a> in a <a href=\"#sem:causal\">causal</a>, <a href=\"#sem:conditional-relation\">conditional</a>, <a href=\"#sem:concessive-relation\">concessive</a>, <a href=\"#cxn:concessive-conditional-construction\">concessive conditional</a>, or <a href=\"#cxn:comparative-conditional-construction\">comparative conditional construction</a>. <em>Example</em>: in <em>If you press this button, the door will open</em>, <em>the door will open</em> is the apodosis; <em>If you press this button</em> is the <a href=\"#cxn:protasis-clause\">protasis</a>. (Section 17.3.1)"}, "cxn:application-verb": {"definition": "the <a href=\"#cxn:verb\">verb</a> expressing an <a href=\"#sem:application-event\">application event</a>. <em>Examples</em>: smearing (2-dimensional) and loading (3-dimensional) are application events. (Section 7.3.2)"}, "cxn:applicative-construction": {"definition": "a <a href=\"#cxn:construction\">construction</a> describing an <a href=\"#sem:event\">event</a> in which a <a href=\"#sem:participant-role\">participant</a> other than the <a href=\"#sem:p-role\">P</a> participant is coded as <a href=\"#inf:object-argument\">object</a> \u2013 that is, a non-P participant is <a href=\"#inf:topicality\">salient</a> enough to be expressed as a <a href=\"#cxn:core-argument-phrase\">core argument phrase</a>, specifically object. <em>Example</em>: <em>Fred baked me a shepherd's pie</em>, in which Fred baking the pie is the base event, encodes a non-participant, namely the recipient of the shepherd's pie, as object. (Sections 9.1, 9.3)"}, "cxn:applicative-object-phrase": {"definition": "the <a href=\"#sem:participant-role\">participant role</a> which is expressed as the <a href=\"#inf:object-argument\">object</a> in an <a href=\"#cxn:applicative-construction\">applicative construction</a>. <em>Example</em>: in Nomatsiguenga <em>na-manant\u00eb-ne-ro kayeta</em> <q>I bought crackers for her</q>, the <a href=\"#sem:beneficiary\">beneficiary</a> referred to by <q>her</q> is expressed as the object, with the <span class=\"sc\">3sg</span> Object suffix <em>-ro</em>. (Section 9.3)"}, "cxn:apposition": {"definition": "a <a href=\"#str:strategy\">strategy</a> for <a href=\"#sem:object-concept\">object</a> <span class=\"separation\"/> <a href=\"#inf:reference\">reference</a> in which two or more separate <a href=\"#cxn:referring-phrase\">referring phrases</a> juxtaposed to each other refer to the same <a href=\"#inf:reference\">referent</a>. <em>Example</em>: in <em>my brother, the geophysicist</em>, two separate referring phrases, <em>my brother</em> and <em>the geophysicist</em>, are juxtaposed and refer to the same individual. (Section 5.4)"}, "cxn:argument-complex-predicate": {"definition": "a <a href=\"#cxn:complex-predicate\">complex predicate</a> in which one <a href=\"#cxn:element\">element</a> denotes an <a href=\"#sem:event\">event</a> and is expressed as a <a href=\"#cxn:verb\">verb</a>, but the other element denotes an <a href=\"#sem:object-concept\">object</a> and is expressed in an <a href=\"#cxn:argument-phrase\">argument phrase</a>, yet the verb\u2013argument combination has <a href=\"#def:lexicalization\">lexicalized</a> to have a unitary <a href=\"#sem:meaning\">meaning</a>. <em>Example</em>: in Spanish <em>Pero est\u00e1 haciendo bastante sol</em> <q>But it's really sunny</q> [lit. <q>But it is making a lot of sun</q>], <em>haciendo...sol</em> <q>making sun</q> is an instance of an argument complex predicate. (Section 13.6)"}, "cxn:argument-phrase": {"definition": "a <a href=\"#cxn:referring-phrase\">referring phrase</a> that <a href=\"#inf:reference\">refers</a> to a <a href=\"#sem:participant\">participant</a>. <em>Example</em>: in <em>The tree fell</em>, <em>the tree</em> is an argument phrase because it is a referring phrase that refers to the argument of the predicate \u2013 namely, the tree that fell. Argument phrases are divided into <a href=\"#cxn:core-argument-phrase\">core argument phrases</a> (<a href=\"#cxn:subject-phrase\">subject phrase</a>, <a href=\"#cxn:object-phrase\">object phrase</a>) and <a href=\"#cxn:oblique-phrase\">oblique argument phrases</a>. (Sections 2.2.2, 6.6.1)"}, "cxn:article": {"definition": "a <a href=\"#sem:contextual\">contextual</a> form combining with a <a href=\"#cxn:common-noun\">common noun</a> that expresses primarily <a href=\"#inf:information-status\">information status</a>. <em>Example</em>: English <em>the</em> and <em>a(n)</em> are articles. (Section 3.2)"}, "cxn:associative-construction": {"definition": "a <a href=\"#cxn:construction\">construction</a> in which there is <a href=\"#inf:reference\">reference</a> to an individual and a group associated with that individual. Attention has been focused on the associative construction strategy in which an <a href=\"#str:index\">index</a> refers to not just the <a href=\"#inf:reference\">referent</a> expressed in a <a href=\"#cxn:referring-phrase\">referring phrase</a> in the same construction, but also a group associated with that referent. <em>Example</em>: in the Talitsk dialect of Russian, in <em>G\u00f3\u0161a pr\u00b4ij\u00e9xal\u00b4i!</em> <q>Gosha and his family have arrived!</q> the plural predicate <em>pr\u00b4ij\u00e9xal\u00b4i</em> <q>they have arrived</q>, combined with the referring phrase <em>G\u00f3\u0161a</em> <q>Gosha</q>, expresses that the <a href=\"#cxn:subject-phrase\">subject</a> referent is Gosha plus an associated group \u2013 namely, his family. (Section 4.4.4)"}, "cxn:attending-verb": {"definition": "a <a href=\"#cxn:verb\">verb</a> that expresses an <a href=\"#sem:attending\">attending event</a>. <em>Example</em>: <em>I am looking at the sandhill crane</em> is an instance of an attending event, and <em>look (at)</em> is an attending verb. (Section 7.4)"}, "cxn:attributive-phrase": {"definition": "a <a href=\"#cxn:construction\">construction</a> that performs the act of <a href=\"#inf:modification\">modification</a>. <em>Example</em>: in <em>a very slow truck</em>, the attributive phrase <em>very slow</em> modifies the truck with respect to its speed. The head of an attributive phrase is a <a href=\"#cxn:modifier\">modifier</a>. The prototypical attributive phrase is an <a href=\"#cxn:adjectival-phrase\">adjectival phrase</a>. (Sections 2.2.2, <strong>4.1.1</strong>)"}, "cxn:auxiliary": {"definition": "the <a href=\"#cxn:element\">element</a> expressing <a href=\"#sem:tamp\">TAMP</a> <span class=\"separation\"/> <a href=\"#sem:meaning\">meaning</a> in an <a href=\"#cxn:auxiliary-construction\">auxiliary construction</a>. <em>Example</em>: in <em>The cats have eaten, have</em> is the auxiliary in the auxiliary construction <em>have eaten</em>. (Section 13.4)"}, "cxn:auxiliary-construction": {"definition": "an <a href=\"#cxn:eventive-complex-predicate\">eventive complex predicate construction</a> in which one <a href=\"#cxn:element\">element</a> of the <a href=\"#cxn:construction\">construction</a>, the <a href=\"#cxn:auxiliary\">auxiliary</a>, denotes <a href=\"#sem:tense\">tense</a>, <a href=\"#sem:aspect\">aspect</a>, <a href=\"#sem:modality\">modality</a>, and/or <a href=\"#sem:polarity\">polarity</a> (typically abbreviated TAMP), and the other element of the construction denotes the <a href=\"#sem:event\">event</a> whose tense, aspect, modality, and/or polarity is expressed by the first element. <em>Example</em>: in English <em>She might be sitting in the living room, might be sitting</em> is an example of an auxiliary construction. (Section 13.4)"}, "cxn:basic-voice": {"definition": "an <a href=\"#cxn:clause\">argument structure construction</a> that conforms to the prototypical parallel ranking of <a href=\"#sem:participant-role\">participant role</a> and <a href=\"#inf:topicality\">argument salience</a>. <em>Example</em>: <em>I ate the smoked salmon</em> is an instance of a basic voice construction \u2013 semantically, I act upon the salmon, and I am more <a href=\"#inf:topicality\">salient</a> than the salmon in the discourse. Basic voice constructions are also called <q>active</q> or <q>direct</q> constructions. (Sections 6.1.1, <strong>8.1</strong>)"}, "cxn:binominal-lexeme": {"definition": "a <a href=\"#inf:subcategorizing\">typifying</a> (non-anchoring) construction that expresses a unitary concept by means of two object concepts. <em>Example</em>: in French <em>moulin \u00e0 vent</em> and its English translation <em>windmill</em>, two object concepts, <em>vent/wind</em> and <em>moulin/mill</em>, combine syntactically to express a unitary concept. (Section 5.2.1)"}, "cxn:bodily-motion-verb": {"definition": "the <a href=\"#cxn:verb\">verb</a> expressing a <a href=\"#sem:bodily-motion-event\">bodily motion event</a>. <em>Example</em>: <em>stretch out (oneself)</em> expresses a bodily motion event. (Section 7.2)"}, "cxn:bodily-predicate": {"definition": "the <a href=\"#cxn:predicate\">predicates</a> that express events in the <a href=\"#sem:bodily-action\">bodily action</a> event class. <em>Example</em>: coughing is a bodily action, and <em>cough</em> is a bodily action predicate. (Section 6.3.3)"}, "cxn:body-care-verb": {"definition": "the <a href=\"#cxn:verb\">verb</a> expressing a <a href=\"#sem:body-care-event\">body care event</a>. <em>Examples</em>: <em>shave</em> and <em>wash (oneself)</em> express body care events. (Section 7.2)"}, "cxn:body-position-predicate": {"definition": "the <a href=\"#cxn:predicate\">predicates</a> that express events in the <a href=\"#sem:body-position-event\">body position event</a> class. <em>Example</em>: standing is a body position event, and <em>stand</em> is a body position predicate. (Section 6.3.3)"}, "cxn:cardinal-numeral-term": {"definition": "a form that expresses the number (cardinality) of a set of <a href=\"#sem:token\">individuals</a> of the <a href=\"#sem:type\">type</a>. <em>Examples</em>: in <em>one tree, two boys, three books</em>, <em>one/two/three</em> are cardinal numerals. (Section 4.1.3)"}, "cxn:causative-construction": {"definition": "a <a href=\"#cxn:construction\">construction</a> describing an <a href=\"#sem:event\">event</a>, in which an external cause has been <q class=\"dq\">added</q> to the <a href=\"#sem:base-event\">base event</a>, and the external cause is <a href=\"#inf:topicality\">salient</a> enough to be expressed as a <a href=\"#cxn:core-argument-phrase\">core argument phrase</a>, specifically the <a href=\"#cxn:subject-phrase\">subject</a>. <em>Example</em>: <em>I made Fred wash the car</em> is an instance of a causative construction in which Fred washing the car is the base event, and an external cause (me) is added and is encoded as the subject. (Sections 9.1, 9.2)"}, "cxn:chaining-construction": {"definition": "the <a href=\"#cxn:construction\">construction</a> expressing such a <a href=\"#sem:chaining\">chaining event</a>. <em>Example</em>: in <em>The guests followed one another into the room</em>, each guest is a follower and a <q class=\"dq\">followee</q>, except the first and last in the chain. It is also possible to have a closed chain, as in people following each other in a circle, in which all participants are both initiator and endpoint. (Section 7.2)"}, "cxn:change-in-position-verb": {"definition": "the <a href=\"#cxn:verb\">verb</a> expressing a <a href=\"#sem:change-in-position-event\">change in body position event</a>. <em>Example</em>: <em>sit</em> and <em>lean</em> express change in body posture events. (Section 7.2)"}, "cxn:change-of-state-verb": {"definition": "the <a href=\"#cxn:verb\">verb</a> expressing a <a href=\"#sem:change-of-state-event\">change of state event</a>. <em>Example</em>: the event of dishes becoming dry is a change of state event, and <em>dry</em> is a change of state verb. (Sections 6.1.2, <strong>6.2.1</strong>)"}, "cxn:clause": {"definition": "a construction that performs the function of <a href=\"#inf:predication\">predication</a>, including the <a href=\"#cxn:predicate\">predicate</a> (which may be a <a href=\"#cxn:complex-predicate\">complex predicate</a>) and the <a href=\"#cxn:referring-phrase\">referring phrases</a> and other roles dependent on the predication. Example: <em>The birds were singing</em> is an instance of a clausal construction. This is the prototypical function of clauses; there are also <a href=\"#cxn:nonpredicational-construction\">nonpredicational clauses</a> that perform different information packaging functions. The prototypical predicational clause is a <a href=\"#cxn:verbal-clause\">verbal clause</a>. (Sections 1.3, 2.2.2, 6.1.1) <br /> a <a href=\"#cxn:clause\">clause construction</a> that consists of the <a href=\"#cxn:predicate\">predicate</a> and the <a href=\"#cxn:argument-phrase\">argument phrases</a> that are <a href=\"#cxn:dependent\">dependent</a> on that predicate. <em>Example</em>: the clause <em>The engineers placed sandbags on the levee</em> is an instance of an English argument structure construction made up of the predicate (<em>placed</em>) and the combination of three argument phrases, the Subject (<em>the engineers</em>) plus the Object (<em>sandbags</em>) plus the Oblique (<em>on the levee</em>). The <a href=\"#def:function\">function</a> of the argument structure construction is its <a href=\"#sem:meaning\">semantics</a> \u2013 the <a href=\"#sem:participant-role\">participant roles</a> that the <a href=\"#inf:reference\">referents</a> of the argument phrases are playing in the event \u2013 combined with its <a href=\"#inf:information-packaging\">information packaging</a> \u2013 the relative <a href=\"#inf:topicality\">salience</a> implied by the Subject \u2013 Object \u2013 Oblique ranking of argument phrases. (Sections 2.2.4, 6.1.1)"}, "cxn:cognition-verb": {"definition": "a <a href=\"#cxn:verb\">verb</a> that expresses a <a href=\"#sem:cognition-event\">cognition event</a>. <em>Example</em>: <em>Tim thought about the war</em> is an example of a cognition event, and <em>think (about)</em> is the cognition verb. (Section 7.4)"}, "cxn:collective-construction": {"definition": "the <a href=\"#cxn:construction\">construction</a> expressing a <a href=\"#sem:collective\">collective event</a>. <em>Example</em>: in <em>Mary and Sue left together</em>, Mary leaves and Sue leaves, and the two leaving events are connected. (Section 7.2)"}, "cxn:color-term": {"definition": "a <a href=\"#cxn:modifier\">modifier</a> expressing a color concept. <em>Examples</em>: <em>red</em>, <em>black</em>, and <em>green</em> are English color terms. (Section 4.1.2)"}, "cxn:combining-verb": {"definition": "the <a href=\"#cxn:verb\">verb</a> expressing a <a href=\"#sem:combining-event\">combining event</a>. <em>Example</em>: blending is a combining event. (Section 7.3.2)"}, "cxn:commentative-predicate": {"definition": "the <a href=\"#cxn:predicate\">predicate</a> expressing a <a href=\"#sem:commentative-event\">commentative event</a>. <em>Example</em>: in <em>Nancy is glad that Joe won the election</em>, the commentative predicate <em>is glad</em> expresses Nancy's evaluation of Joe's winning the election, and also presupposes that the speaker believes that Joe indeed won the election. (Section 18.2.2)"}, "cxn:common-noun": {"definition": "a linguistic <a href=\"#def:form\">form</a> that usually <a href=\"#inf:reference\">refers</a> to <a href=\"#sem:token\">individuals</a>, via the <u>category</u> that the individual belongs to. Often referred to as just <a href=\"#cxn:noun\">noun</a>. <em>Example</em>: <em>cat</em> is usually used to refer to a particular cat via the category of felines. Note that being a common noun is a function of a form; one can use the form <em>city</em> to refer to an individual city \u2013 for example in the San Francisco Bay Area, <em>the City</em> refers to the city of San Francisco. (Section 3.1.1)"}, "cxn:comparative-conditional-construction": {"definition": "a construction that expresses a <a href=\"#sem:comparative-conditional-relation\">comparative conditional relation</a>. <em>Example</em>: <em>The longer that Bill had to wait, the angrier he got</em> is an instance of the comparative conditional relation and construction: a degree of length of time that Bill had to wait can (in a <a href=\"#sem:generic-conditional-relation\">generic conditional</a>) or does (in an ordinary, specific <a href=\"#sem:conditional-relation\">conditional</a>) cause the occurrence of the corresponding degree of Bill's anger. (Section 17.4.1)"}, "cxn:comparative-construction": {"definition": "a construction that has the semantic function of assigning different positions on a <a href=\"#sem:gradable-predicative-scale\">gradable predicative scale</a> to two <a href=\"#inf:reference\">referents</a>, the <a href=\"#sem:comparee\">comparee</a> and the <a href=\"#sem:standard\">standard</a>. The comparative construction therefore consists of three propositions: the predicative scale applies to the comparee, it also applies to the standard, and the comparee exceeds the standard on the scale. <em>Example</em>: <em>The tree is taller than the house</em> is an instance of the comparative construction \u2013 the comparee is the tree, the standard is the house, the gradable comparative scale is height, and the comparee exceeds the standard in height. (Section 17.2.1)"}, "cxn:comparative-form": {"definition": "a higher value on a <a href=\"#sem:property-concept\">property</a> scale than the comparable value for another object. <em>Example</em>: in <em>more intelligent</em>, <em>more</em> indicates a value higher on the intelligence scale than the comparable value for the person to whom the current referent is being compared. (Section 4.1.2)"}, "cxn:comparative-pronoun": {"definition": "a <a href=\"#cxn:pronoun\">pronoun</a> expressing a <a href=\"#inf:comparative-referent\">comparative referent</a>. <em>Example</em>: in <em>The boy runs as fast as anyone in his class</em>, <em>anyone</em> is a comparative pronoun expressing a hypothetical referent selected from the class representing the standard to which the boy's running is being compared. (Section 3.5)"}, "cxn:complement": {"definition": "a <a href=\"#cxn:construction\">construction</a> defined by the function of <a href=\"#inf:reference\">referring</a> to an <a href=\"#sem:action-concept\">action concept</a>. <em>Example</em>: a variety of strategies are used for complements, including the English Gerund, as in <em>Hiking in Canyonlands</em> (<em>is fun</em>), and the English Finite Complement, as in (<em>Frieda thinks</em>) <em>that Janet won't come to the party</em>. (Sections 2.2.5, 18.2.1)"}, "cxn:complement-clause-construction": {"definition": "a <a href=\"#cxn:construction\">construction</a> consisting of a <a href=\"#cxn:matrix-clause\">matrix clause</a> and a <a href=\"#cxn:complement\">complement</a>. <em>Example</em>: <em>I told her that I would go</em> is an instance of a complement clause construction; the matrix clause is <em>I told her</em> and the complement is <em>I would go</em>. (Section 18.2.1)"}, "cxn:complement-taking-predicate": {"definition": "the <a href=\"#cxn:matrix-clause\">matrix clause</a> <span class=\"separation\"/> <a href=\"#cxn:predicate\">predicate</a> in a <a href=\"#cxn:complement-clause-construction\">complement clause construction</a>. <em>Example</em>: in <em>I told her that I would go</em>, <em>told</em> is the complement-taking predicate. (Section 18.2.1)"}, "cxn:complementary": {"definition": "opposing values on a scale where there is no gradience, only <a href=\"#sem:categorical\">categorical</a> values (either the object has the value or it doesn't). <em>Example</em>: <em>alive/dead</em> are complementaries in that one is either alive or not. (Section 4.1.2)"}, "cxn:complex-predicate": {"definition": "a <a href=\"#cxn:predicate\">predicate</a> consisting of more than one semantic <u>component</u>, and hence the <a href=\"#cxn:construction\">construction</a> consists of multiple <a href=\"#cxn:element\">elements</a>. These semantic components are quite varied. This textbook takes a broad view of what constitutes a complex predicate; most <a href=\"#cxn:dependent\">dependents</a> of a <a href=\"#cxn:clause\">clause</a> that are not <a href=\"#cxn:argument-phrase\">argument phrases</a> are parts of a complex predicate. <em>Example</em>: in <em>The soldier quickly walked off, quickly walked off</em> is the complex predicate consisting of <em>quickly</em>, <em>walked</em>, and <em>off</em>. (Sections 2.2.2, 13.1.1)"}, "cxn:complex-sentence": {"definition": "a construction made up of more than one clausal construction. <em>Example</em>: [<em>The birds were singing</em>] [<em>when I went out to get the newspaper</em>] is an instance of a complex sentence construction consisting of two clauses, indicated by square brackets in the example. (Sections 1.3, <strong>15.1.1</strong>)"}, "cxn:concessive-conditional-construction": {"definition": "the construction that expresses a <a href=\"#sem:concessive-conditional-relation\">concessive conditional relation</a>. <em>Example</em>: <em>However much advice you give him, he does exactly what he wants to do</em> is an instance of the concessive conditional relation and construction \u2013 the <a href=\"#cxn:protasis-clause\">protasis</a> <em>However much advice you give him</em> introduces a scalar model of your giving him a full range of amounts of advice; and the <a href=\"#cxn:apodosis-clause\">apodosis</a> <em>he does exactly what he wants to do</em> describes the event that occurs or would occur under any of those conditions. The speaker has a neutral epistemic stance toward the range of events associated with the scalar model. The apodosis has an unexpected causal relation with respect to the set of events that make up the protasis. A concessive conditional may express a <a href=\"#sem:content-causal-relation\">content</a>, <a href=\"#sem:epistemic-causal-relation\">epistemic</a>, or <a href=\"#sem:speech-act-causal-relation\">speech act causal relation</a>. (Section 17.3.3)"}, "cxn:concessive-construction": {"definition": "the construction that expresses a <a href=\"#sem:concessive-relation\">concessive relation</a>.. <em>Example</em>: <em>Although it was raining, I went out</em> is an instance of a concessive relation and construction: the expected causal relation is that rain would lead to my staying in; but in fact I went out. The speaker has a <a href=\"#sem:positive-epistemic-stance\">positive epistemic stance</a> toward the concessive construction. A concessive may express a <a href=\"#sem:content-causal-relation\">content</a>, <a href=\"#sem:epistemic-causal-relation\">epistemic</a>, or <a href=\"#sem:speech-act-causal-relation\">speech act causal relation</a>. (Section 17.3.2)"}, "cxn:conditional-construction": {"definition": "the <a href=\"#cxn:construction\">construction</a> that expresses a <a href=\"#sem:conditional-relation\">conditional relation</a>. <em>Example</em>: <em>If you press this button, the door will open</em> is an instance of the conditional relation and construction. The causally antecedent proposition is the <a href=\"#sem:protasis\">protasis</a>, and the causally consequent proposition is the <a href=\"#sem:apodosis\">apodosis</a>. A conditional may express a <a href=\"#sem:content-causal-relation\">content</a>, <a href=\"#sem:epistemic-causal-relation\">epistemic</a> or <a href=\"#sem:speech-act-causal-relation\">speech act causal relation</a>. (Section 17.3.1)"}, "cxn:conditional-pronoun": {"definition": "a conditional pronoun that expresses a <a href=\"#inf:conditional-referent\">conditional referent</a>. <em>Example</em>: in <em>If you hear <strong>anything</strong>, tell me</em>, <em>anything</em> is a conditional pronoun expressing a referent that is found only in the hypothetical world introduced by the protasis of the conditional construction. (Section 3.5)"}, "cxn:conjunctive-coordination": {"definition": "a type of <a href=\"#cxn:coordinate-construction\">coordinate construction</a> typically equated with coordination by <q>and</q>, representing some sort of grouping together in the relevant context. Conjunctive coordination is prototypically associated with an <a href=\"#sem:additive\">additive</a> relation between the two (or more) <a href=\"#sem:entity\">entities</a>, but often also may express a <a href=\"#sem:consecutive\">consecutive</a> relation. <em>Example</em>: <em>The robins drank water and the juncos ate fennel seeds</em> is an instance of conjunctive coordination with an additive relation. (Section 15.2.1)"}, "cxn:construction": {"definition": "the basic unit of <a href=\"#def:morphosyntax\">morphosyntactic</a> analysis; a construction is a conventional pairing of form and function \u2013 its form is morphosyntactic structure, and its function is a combination of <a href=\"#sem:meaning\">meaning</a> (<a href=\"#sem:meaning\">semantic content</a>) and <a href=\"#inf:information-packaging\">information packaging</a> (Section 1.1). When combined with a modifier describing a specific construction, <q>[Modifier] construction</q> refers to any pairing of form and function in a language (or any language) used to express a particular combination of semantic content and information packaging denoted by the modifier of <q>construction</q> (Section 1.4). <em>Example</em>: the <a href=\"#sem:numeral\">numeral</a> <span class=\"separation\"/> <a href=\"#inf:modification\">modification</a> construction exemplified by <em>three tree-s</em> consists of a form which: (i) can be described schematically as [<span class=\"sc\">Num Noun-number</span>]; (ii) performs the function of referring to a group of objects of the type denoted by the noun (<em>tree</em>), and modifying that information with the additional information that the cardinality of the group is the amount denoted by the number (<em>three</em>). Specific constructions (<em>a.k.a.</em> criteria, tests, evidence) are used to define <a href=\"#def:word-class\">word classes</a>. (Section 1.2.3)"}, "cxn:contact-by-impact-verb": {"definition": "the <a href=\"#cxn:verb\">verb</a> expressing a <a href=\"#sem:contact-by-impact-event\">contact by impact event</a>. <em>Example</em>: hitting is a contact by impact event, and <em>hit</em> is a contact by impact verb. (Section 7.3.2)"}, "cxn:container-term": {"definition": "a <a href=\"#cxn:mensural-term\">mensural term</a> that selects an amount of a <a href=\"#inf:reference\">referent</a> according to the container it is found in. <em>Example</em>: in <em>a bottle of wine, bottle</em> functions as a container term for <em>wine</em>. (Section 4.1.3)"}, "cxn:controlled-predicate": {"definition": "the <a href=\"#cxn:predicate\">predicates</a> that express events in the <a href=\"#sem:controlled\">controlled activity</a> class. <em>Example</em>: running is a controlled activity event, and <em>run</em> is a controlled activity predicate. (Section 6.3.3)"}, "cxn:coordinand": {"definition": "a component of a <a href=\"#cxn:coordinate-construction\">coordinate construction</a>. <em>Example</em>: in <em>Jerry played the guitar and Billy was on drums, Jerry played the guitar</em> is one of the coordinands and <em>Billy was on drums</em> is the other coordinand. Since coordination constructions link entities other than <a href=\"#sem:event\">events</a> and the clause constructions that express them, coordinands may also be other constructions than clauses \u2013 in particular, coordinands are often <a href=\"#cxn:referring-phrase\">referring phrases</a>. (Section 15.2.1)"}, "cxn:coordinate-clause-construction": {"definition": "a <a href=\"#cxn:construction\">construction</a> in which two <a href=\"#sem:event\">events</a> are construed as part of a <a href=\"#inf:complex-figure\">complex figure information packaging</a>. <em>Example</em>: in <em>Jerry played the guitar and Billy was on drums</em>, Jerry playing guitar and Billy being on drums are combined in a coordinate clause construction that construes the two events as part of a complex whole. <a href=\"#str:deranking\">Deranked</a> coordinate clause constructions are also called clause chaining, medial verb constructions, or cosubordination. (Section 15.2.1)"}, "cxn:coordinate-construction": {"definition": "a <a href=\"#cxn:construction\">construction</a> in which two <a href=\"#sem:entity\">entities</a> are construed as part of a <a href=\"#inf:complex-figure\">complex figure information packaging</a>. <em>Example</em>: in <em>John, Paul, George, and Ringo</em>, the four <a href=\"#cxn:referring-phrase\">referring phrases</a> are combined into a coordinate construction that construes the four referents as part of a complex whole."}, "cxn:core-argument-phrase": {"definition": "the <a href=\"#cxn:subject-phrase\">subject</a> and <a href=\"#cxn:object-phrase\">object phrases</a> in a clause, generally considered to <a href=\"#inf:reference\">refer</a> to the more <a href=\"#sem:central-participant\">central participants</a> in an <a href=\"#sem:event\">event</a>. <em>Example</em>: in <em>Sally threw the letter into the wastebasket</em>, <em>Sally</em> and <em>the letter</em> are the core argument phrases; in <em>The letter was thrown into the wastebasket</em>, only <em>the letter</em> is a core argument phrase. (Section 6.1.1)"}, "cxn:damage-verb": {"definition": "the <a href=\"#cxn:verb\">verb</a> expressing a <a href=\"#sem:damage-event\">damage event</a>. <em>Example</em>: scratching something is a damage event, and <em>scratch</em> is a damage verb. (Section 7.3.2)"}, "cxn:declarative-construction": {"definition": "the <a href=\"#cxn:construction\">construction</a> that expresses a <a href=\"#inf:declarative\">declarative</a> speech act. <em>Example</em>: The English sentence <em>Sandra picked up the children</em> is an instance of a declarative speech act. The declarative is the most common speech act construction, and is considered the default speech act construction. (Section 12.1)"}, "cxn:declarative-negation-construction": {"definition": "a <a href=\"#cxn:construction\">construction</a> that expresses <a href=\"#sem:negative-polarity\">negative polarity</a> of a <a href=\"#inf:declarative\">declarative</a> <span class=\"separation\"/> <a href=\"#inf:speech-acts\">speech act</a>. <em>Example</em>: in English, <em>Kit didn't like the movie</em> is an instance of a declarative negation construction, with the morpheme <em>not</em> ~ <em>-n't</em> combining with the past tense <a href=\"#cxn:auxiliary\">auxiliary</a> <em>did</em> to negate the declarative speech act <q>Kit liked the movie</q>. (Section 12.2)"}, "cxn:definite-article": {"definition": "an <a href=\"#cxn:article\">article</a> that is associated with the top end of the <a href=\"#inf:information-status\">information status</a> continuum, where the identity of the <a href=\"#inf:reference\">referent</a> is already known to both speaker and hearer. This includes <a href=\"#inf:active-referent\">active</a>, <a href=\"#inf:semi-active-referent\">semi-active</a>, <a href=\"#inf:inactive-referent\">inactive</a>, and <a href=\"#inf:inferrable-referent\">inferrable</a> referents. <em>Example</em>: <em>the bowl</em> is an example of a definite referring phrase with a definite article <em>the</em> combined with a <a href=\"#cxn:common-noun\">common noun</a> bowl, used in a context where the individual bowl in question is identifiable by both speaker and hearer. (Table 3.4, Section 3.3.1)"}, "cxn:definite-pronoun": {"definition": "a <a href=\"#cxn:pronoun\">pronoun</a> that is associated with the top end of the <a href=\"#inf:information-status\">information status</a> continuum, where the identity of the <a href=\"#inf:reference\">referent</a> is already known to both speaker and hearer. This includes <a href=\"#inf:active-referent\">active</a>, <a href=\"#inf:semi-active-referent\">semi-active</a>, <a href=\"#inf:inactive-referent\">inactive</a>, and <a href=\"#inf:inferrable-referent\">inferrable</a> referents. <em>Example</em>: in <em>It is under the bed</em>, <em>it</em> is an example of a definite pronoun, used in a context where the referent of it is identifiable by both speaker and hearer. (Table 3.4, Section 3.3.1)"}, "cxn:demonstrative-attributive": {"definition": "a <a href=\"#sem:contextual\">deictic</a> <span class=\"separation\"/> <a href=\"#sem:contextual\">contextual</a> expression that combines with a <a href=\"#cxn:common-noun\">common noun</a> to form a <a href=\"#cxn:referring-phrase\">referring phrase</a>. <em>Example</em>: in <em>This machine drives me crazy!</em>, <em>This</em> is a demonstrative attributive combined with the common noun <em>machine</em>. (Sections <strong>3.1.3</strong>, 3.2)"}, "cxn:demonstrative-pronoun": {"definition": "a <a href=\"#sem:contextual\">deictic</a> <span class=\"separation\"/> <a href=\"#sem:contextual\">contextual</a> expression that stands alone as a <a href=\"#cxn:referring-phrase\">referring phrase</a>. <em>Example</em>: in <em>This is a collared lizard</em>, <em>This</em> is a demonstrative pronoun. (Sections 3.1.1, 3.1.3, 3.2)"}, "cxn:dependent": {"definition": "any <a href=\"#cxn:element\">element</a> of a <a href=\"#cxn:construction\">construction</a> that is not the <a href=\"#cxn:head\">head</a>. <em>Example</em>: in the phrase <em>an ancient watch</em>, <em>ancient</em> and <em>an</em> are dependents. (Section 2.2.1)"}, "cxn:dependent-clause": {"definition": "a <a href=\"#cxn:clause\">clause</a> that is a <a href=\"#cxn:dependent\">dependent</a> of a <a href=\"#cxn:matrix-clause\">matrix clause</a> in a <a href=\"#cxn:complex-sentence\">complex sentence construction</a>. <a href=\"#cxn:adverbial-clause-construction\">Adverbial clauses</a>, <a href=\"#complement clause construction\">complement clauses</a>, and <a href=\"#cxn:relative-clause\">relative clauses</a> are all examples of dependent clauses. <em>Example</em>: in <em>She watered the plants before she ate lunch, before she ate lunch</em> is an instance of an (adverbial) dependent clause. Dependent clauses are often, but not always, <a href=\"#cxn:subordinate-clause\">subordinate clauses</a>. (Section 15.1.2)"}, "cxn:depictive-complex-predicate": {"definition": "a <a href=\"#cxn:stative-complex-predicate\">stative complex predicate</a> in which the <a href=\"#sem:stative\">stative component</a> of the <a href=\"#cxn:complex-predicate\">complex predicate</a> describes a <a href=\"#sem:state\">state</a> that holds at the same time as the <a href=\"#sem:event\">event</a> denoted by the main predicate. A depictive complex predicate is <a href=\"#sem:participant-oriented\">participant-oriented</a>. <em>Example</em>: in English <em>I ate the carrots raw</em>, <em>ate...raw</em> is a depictive complex predicate, and <em>raw</em> describes a state of the carrots as they were being eaten. (Section 14.1)"}, "cxn:desiderative-predicate": {"definition": "the <a href=\"#cxn:predicate\">predicate</a> that expresses a <a href=\"#sem:desiderative-event\">desiderative event</a>. <em>Example</em>: in <em>Meagan wants to climb Mt. Baldy on Saturday, wants</em> denotes a desiderative event. Noonan (2007:135) includes intending events in the category of desiderative events. (Section 18.2.2)"}, "cxn:determiner": {"definition": "a superordinate category of <a href=\"#sem:contextual\">contextually</a> defined forms that combine with <a href=\"#cxn:common-noun\">common nouns</a>; determiners include both <a href=\"#cxn:demonstrative-attributive\">demonstrative attributives</a> and <a href=\"#cxn:article\">articles</a>. (Section 3.2)"}, "cxn:dimension-term": {"definition": "a <a href=\"#cxn:modifier\">modifier</a> expressing a concept of extent on a spatial dimension. <em>Examples</em>: <em>tall</em>, <em>small</em>, and <em>thin</em> are English dimension terms. (Section 4.1.2)"}, "cxn:direct-negation-pronoun": {"definition": "the <a href=\"#cxn:pronoun\">pronoun</a> that expresses a <a href=\"#inf:direct-negation-referent\">direct negation referent</a>. <em>Example</em>: in <em>I noticed nothing</em>, <em>nothing</em> is a direct negation pronoun expressing a referent found only in the negative alternative world to the real world. (Section 3.5)"}, "cxn:discourse-markers": {"definition": "a <a href=\"#cxn:construction\">construction</a> that serves a variety of discourse <a href=\"#def:function\">functions</a>, including linking sections of discourse together. <em>Example</em>: in the discourse passage <em>... all you gotta do is put the outdoor condensing unit, ... and refrigerant piping to that coil. So it ... saves\u2013 ... it saves additional work in the future</em>, the word <em>so</em> is a discourse marker that links the preceding section of discourse to the following section. Discourse markers are not discussed in this book except as sources of <a href=\"#str:conjunction\">conjunctions</a>. (Section 15.1.1)"}, "cxn:disjunctive-coordination": {"definition": "a type of <a href=\"#cxn:coordinate-construction\">coordinate construction</a> typically equated with coordination by <q>or</q>, representing alternatives in the relevant context. <em>Example</em>: <em>I will take the bus or ride my bicycle</em> is an instance of disjunctive coordination of clauses; <em>an apple or an orange</em> in <em>I'll have an apple or an orange</em> is an instance of disjunctive coordination of referring phrases. Disjunctive coordination can be divided into <a href=\"#sem:inclusive-disjunction\">inclusive disjunction</a> and <a href=\"#sem:exclusive-disjunction\">exclusive disjunction</a>. (Section 15.2.1)"}, "cxn:distributive-quantifier-term": {"definition": "a form that specifies the members of the set but treats them individually (that is, the <a href=\"#cxn:predicate\">predicate</a> applies to the whole set by virtue of applying to the individual members of the set). Example: in <em>Every dog has fleas, every</em> is a distributive quantifier. (Section 4.1.3)"}, "cxn:ditransitive-construction": {"definition": "the <a href=\"#cxn:construction\">construction</a> used to express the <a href=\"#sem:agent\">agent</a> of the <a href=\"#sem:trivalent\">trivalent</a> giving event (the <a href=\"#sem:a-role\">A role</a>), the <a href=\"#sem:theme\">theme</a> of the giving event (the <a href=\"#sem:theme\">T role</a>), and the <a href=\"#sem:recipient\">recipient</a> of the giving event (the <a href=\"#sem:recipient\">R role</a>) when the agent is more salient than the theme or recipient. <em>Example</em>: <em>Randy gave the car to his daughter</em> is an instance of the exemplar (the single <q class=\"dq\">most prototypical</q> example) of the ditransitive construction. (Sections 6.1.2, <strong>7.5.1</strong>)"}, "cxn:downtoner": {"definition": "a lower than normal value on a <a href=\"#sem:property-concept\">property</a> scale. <em>Example</em>: in <em>somewhat long, somewhat</em> indicates a value shorter than is normal for length. (Section 4.1.2)"}, "cxn:element": {"definition": "a word or <a href=\"#cxn:construction\">construction</a> that is part of \u2013 that is, functions in a <a href=\"#def:role\">role</a> in \u2013 a <a href=\"#cxn:construction\">construction</a>. <em>Example</em>: in <em>an ancient watch</em>, the elements are <em>an</em>, <em>ancient</em>, and <em>watch</em>. (Section 2.2.1)"}, "cxn:emotion-verb": {"definition": "a <a href=\"#cxn:verb\">verb</a> that expresses an <a href=\"#sem:emotion-event\">emotion event</a>. <em>Example</em>: <em>He fears dogs</em> is an example of an emotion event, and <em>fear</em> is the emotion verb. (Section 7.4)"}, "cxn:entity-central-construction": {"definition": "the <a href=\"#cxn:construction\">construction</a> that expresses an <a href=\"#inf:entity-central\">entity-central</a> information packaging. <em>Example</em>: <em>There's a snake in the kitchen sink</em> is an instance of an entity-central thetic construction, where the primary new information being presented is the snake. (Sections 10.1.2, <strong>11.3.1</strong>)"}, "cxn:equational-construction": {"definition": "the <a href=\"#cxn:construction\">construction</a> that expresses an <a href=\"#inf:equational\">equational</a> information packaging. <em>Example</em>: in <em>The Morning Star is the Evening Star</em>, it is asserted that two celestial objects that were once thought to be distinct objects (and given distinct names) are one and the same, namely the planet Venus. (Section 10.1.2)"}, "cxn:equative-construction": {"definition": "a construction that has the semantic function of assigning the identical position on a <a href=\"#sem:gradable-predicative-scale\">gradable predicative scale</a> to two referents, the <a href=\"#sem:comparee\">comparee</a> and the <a href=\"#sem:standard\">standard</a>. <em>Example</em>: <em>The tree is as tall as the house</em> is an instance of the equative construction: the comparee is the tree, the standard is the house, the gradable comparative scale is height, and the comparee is equal to the standard in height. (Section 17.2.4)"}, "cxn:evaluative-predicate": {"definition": "a <a href=\"#cxn:predicate\">predicate</a> expressing an <a href=\"#sem:evaluative-event\">evaluative event</a>. (Section 18.2.2)"}, "cxn:event-central-construction": {"definition": "a <a href=\"#cxn:construction\">construction</a> that expresses an <a href=\"#inf:event-central\">event-central</a> information packaging. <em>Example</em>: in <em>The PHONE's ringing</em>, the most important new information is the ringing of the phone, not the existence of the phone. (Sections 10.1.2, <strong>11.3.1</strong>)"}, "cxn:eventive-complex-predicate": {"definition": "a <a href=\"#cxn:complex-predicate\">complex predicate</a> in which both <a href=\"#cxn:element\">elements</a> of the complex predicate denote <u>processes</u>, and those processes constitute the subevents of the <a href=\"#sem:event\">event</a> denoted by the basic event complex predicate as a whole. <em>Example</em>: in English <em>Please go get the newspaper, go get</em> is an example of a basic event complex predicate. (Section 13.1.2)"}, "cxn:exclamative-construction": {"definition": "a <a href=\"#cxn:construction\">construction</a> that expresses an <a href=\"#inf:exclamative\">exclamative</a> speech act. <em>Example</em>: <em>What a beautiful house!</em> is an instance of an English exclamative construction. (Sections 12.1, 12.5)"}};
@@ -0,0 +1 @@
+DATA.shards[1] = {"cxn:exclusive-disjunctive-coordination": {"definition": "a type of <a href=\"#cxn:disjunctive-coordination\">disjunctive coordination</a> in which the alternatives expressed cannot be combined. <em>Example</em>: <em>You can have the soup or the salad</em> is an instance of exclusive disjunctive coordination in the situation where you cannot have both. Exclusive disjunctive coordination can be an instance of <a href=\"#cxn:exhaustive-list-coordination\">exhaustive list coordination</a>. (Section 15.2.1)"}, "cxn:exclusive-pronoun": {"definition": "a <a href=\"#cxn:first-person-pronoun\">first person pronoun</a> that refers to a group including the speaker but excluding the addressee. <em>Example</em>: Kosraean <em>kit\u025bl</em> is a first person exclusive pronoun referring to a group that includes the speaker but not the addressee. (Section 3.1.1)"}, "cxn:exhaustive-list-coordination": {"definition": "a type of <a href=\"#cxn:coordinate-construction\">coordination construction</a> in which all the entities that are understood to be coordinated are expressed (and hence no other entities are included). <em>Example</em>: Hua <em>dgaimo-gi kgaimo-gi</em> <q>you and I</q> is an instance of exhaustive list coordination, in that you and I and no others are included. Exhaustive list coordination can include <a href=\"#cxn:exclusive-disjunctive-coordination\">exclusive disjunctive coordination</a>. (Section 15.2.1)"}, "cxn:existential-negation-construction": {"definition": "a construction that expresses negative polarity with respect to an <a href=\"#sem:existence-event\">existential</a> situation type. <em>Example</em>: Malay <em><strong>tanana</strong> seraya</em> <q>There was no substitute</q> is an example of a negative existential construction using a special negative existential form <em>tanana</em>. (Section 12.2)"}, "cxn:experience-verb": {"definition": "a <a href=\"#cxn:verb\">verb</a> that expresses an <a href=\"#sem:experience\">experience event</a>. <em>Example</em>: <em>I saw the dog</em> is an instance of an experience event, and <em>see</em> is an experience verb. (Section 7.4)"}, "cxn:experiential-construction": {"definition": "an <a href=\"#cxn:clause\">argument structure construction</a> used to <a href=\"#cxn:predicate\">predicate</a> an <a href=\"#sem:experiential-event\">experiential event</a>. <em>Example</em>: <em>Shelley tasted the soup</em> is an instance of an experiential construction, with the <a href=\"#sem:experiencer\">experiencer</a> expressed as <a href=\"#cxn:subject-phrase\">subject</a> and the <a href=\"#sem:stimulus\">stimulus</a> expressed as <a href=\"#inf:object-argument\">object</a>. (Section 7.4)"}, "cxn:experiential-verb": {"definition": "a <a href=\"#cxn:verb\">verb</a> that expresses an <a href=\"#sem:experiential-event\">experiential event</a>. Experiential events include <a href=\"#sem:perception-event\">perception events</a>, <a href=\"#sem:cognition-event\">cognition events</a>, <a href=\"#sem:emotion-event\">emotion events</a>, and <a href=\"#sem:sensation-event\">(bodily) sensation events</a>; <a href=\"#sem:ingestion-event\">ingestion events</a> also exhibit some semantic similarities to experiential events. (Sections 6.1.2, <strong>7.4</strong>)"}, "cxn:extroverted-verb": {"definition": "a <a href=\"#cxn:verb\">verb</a> expressing an <a href=\"#sem:extroverted\">extroverted event</a>. <em>Examples</em>: seeing something vs. oneself, or loving someone vs. oneself (or even each other), are instances of extroverted events, and <em>see</em> and <em>love</em> are extroverted verbs. (Section 7.2)"}, "cxn:fearing-predicate": {"definition": "the <a href=\"#cxn:predicate\">predicate</a> expressing a <a href=\"#sem:fearing-event\">fearing event</a>. <em>Example</em>: in <em>Jill fears that Donald has won the election</em>, the commentative predicate <em>fears</em> expresses Jill's evaluation of Donald's winning the election, and also presupposes that the speaker does not know whether Donald has won the election. (Section 18.2.2)"}, "cxn:first-person-pronoun": {"definition": "a <a href=\"#cxn:personal-pronoun\">personal pronoun</a> used for <a href=\"#sem:contextual\">contextual</a> <span class=\"separation\"/> <a href=\"#inf:reference\">reference</a> to a person in their role as speaker. The term is conventionally used also for a pronoun referring to a group of persons, one of whom is the speaker. <em>Example</em>: <em>I</em> and <em>we</em> are first person pronouns, the former referring to the speaker and the latter to a group including the speaker. (Section 3.1.1)"}, "cxn:form-term": {"definition": "a <a href=\"#cxn:mensural-term\">mensural term</a> that selects an amount of a <a href=\"#inf:reference\">referent</a> according to the shape defined by the amount. <em>Example</em>: in <em>two piles of sand, pile(s)</em> is a form term. (Section 4.1.3)"}, "cxn:free-choice-pronoun": {"definition": "a <a href=\"#cxn:pronoun\">pronoun</a> that expresses a <a href=\"#inf:free-choice-referent\">free choice referent</a>. <em>Example</em>: in <em>After the fall of the Wall, East Germans were free to travel anywhere</em>, <em>anywhere</em> is a free choice pronoun expressing a referent \u2013 a place \u2013 toward which the agent in the clause, the East Germans, is free to choose to travel. (Section 3.5)"}, "cxn:free-relative-clause-construction": {"definition": "a <a href=\"#cxn:relative-clause-construction\">relative clause construction</a> in which the head has one of several possible <a href=\"#cxn:indefinite-pronoun\">indefinite</a> functions \u2013 that is, <a href=\"#inf:specific-known-referent\">specific</a>, <a href=\"#inf:irrealis-referent\">irrealis</a>, <a href=\"#inf:free-choice-referent\">free choice</a>, and/or <a href=\"#cxn:universal-pronoun\">universal</a>. <em>Example</em>: in <em>Take what(ever) you like</em>, <em>what(ever) you like</em> is a free relative clause using a <a href=\"#str:headless\">headless strategy</a>, and in <em>Take anything you like</em>, <em>anything you like</em> is a free relative clause using an <a href=\"#str:overtly-headed-strategy\">overt head strategy</a>. (Section 19.4)"}, "cxn:gender-term": {"definition": "a <a href=\"#cxn:modifier\">modifier</a> expressing concepts based on sex. <em>Example</em>: <em>male</em> and <em>female</em> are English gender terms. (Section 4.1.2)"}, "cxn:generic-article": {"definition": "an <a href=\"#cxn:article\">article</a> used in combination with a <a href=\"#cxn:common-noun\">common noun</a> (and its <a href=\"#cxn:modifier\">modifiers</a>, if any) for <a href=\"#inf:generic-referent\">generic reference</a>. <em>Example</em>: in <em>A bat is a flying mammal</em>, <em>a</em> is functioning as a generic article. (Section 3.6)"}, "cxn:generic-conditional-construction": {"definition": "a construction that expresses a <a href=\"#sem:generic-conditional-relation\">generic conditional relation</a>. <em>Example</em>: <em>If/When/Whenever a dog starts barking, I run away</em> is an instance of a generic conditional relation and construction \u2013 it doesn't describe a specific instance of a dog barking causing me to run away; instead, it describes a general or habitual pattern of this causal sequence of events. (Section 17.3.1)"}, "cxn:generic-pronoun": {"definition": "a <a href=\"#cxn:pronoun\">pronoun</a> used for <a href=\"#inf:generic-referent\">generic reference</a>. <em>Example</em>: in <em>One always works too much</em>, <em>one</em> is functioning as a generic pronoun. (Section 3.6)"}, "cxn:group-term": {"definition": "a <a href=\"#cxn:mensural-term\">mensural term</a> that selects an amount of a set of <a href=\"#inf:reference\">referents</a> according to some delimiting function. <em>Example</em>: in <em>a herd of cattle, herd</em> is a group term. (Section 4.1.3)"}, "cxn:hanging-topic-phrase": {"definition": "a phrase that expresses a <a href=\"#inf:reference\">topic</a> that is not a <a href=\"#sem:participant-role\">participant</a> in the <a href=\"#cxn:predicate\">predicated</a> <span class=\"separation\"/> <a href=\"#sem:event\">event</a>. <em>Example</em>: in Mandarin Chinese <em>xi\u00e0ng bizi ch\u00e1ng</em> [elephant nose long] <q>Elephant's noses are long / Elephants have long noses</q>, <em>xi\u00e0ng</em> <q>elephant</q> is a topic but not a participant in the predicated event <em>ch\u00e1ng</em> <q>be long</q>. Hanging topics may use a <a href=\"#str:detached-topic-phrase\">detached topic phrase</a> strategy. (Section 11.2.3)"}, "cxn:head": {"definition": "the most contentful word that most closely denotes the same function as the phrase (or clause) as a whole. <em>Example</em>: the head of the phrase <em>an ancient watch</em> is <em>watch</em>. (Section 2.2.1)"}, "cxn:hoping-predicate": {"definition": "the predicate expressing a <a href=\"#sem:hoping-event\">hoping event</a>. <em>Example</em>: in <em>Jill hopes that Joe won the election</em>, the commentative predicate <em>hopes</em> expresses Jill's evaluation of Joe's winning the election, and also presupposes that the speaker does not know whether Joe has won the election. (Section 18.2.2)"}, "cxn:human-propensity-term": {"definition": "a <a href=\"#cxn:modifier\">modifier</a> expressing a concept of a type of behavior that a person has a propensity to exhibit. <em>Examples</em>: <em>smart</em>, <em>rude</em>, and <em>nice</em> are English human propensity terms. (Section 4.1.2)"}, "cxn:identificational-construction": {"definition": "the <a href=\"#cxn:construction\">construction</a> that expresses a <a href=\"#inf:identificational\">identificational</a> information packaging. The presupposed open proposition may be evoked by an alternative proposition that differs from the identificational construction by only the focus. <em>Example</em>: in <em>It was Ollie who was playing the piano</em>, the information in the identificational construction is divided into the presupposed open proposition <q>X was playing the piano</q>, and the focused information Ollie, and what is being asserted is <q>X = Ollie</q>. The term <q>focus</q> is sometimes used as a synonym for <q>identificational</q>, but this term is used differently here. (Sections 10.1.2, 11.1, <strong>11.4.1</strong>)"}, "cxn:imperative-hortative-construction": {"definition": "the <a href=\"#cxn:construction\">construction</a> that expresses a <a href=\"#inf:imperative-hortative\">imperative\u2013hortative</a> speech act. <em>Example</em>: <em>Dance!</em> is an example of the English imperative\u2013hortative construction for the <a href=\"#cxn:second-person-pronoun\">second person</a>, and <em>Let's dance!</em> is an example of the same for the <a href=\"#cxn:first-person-pronoun\">first person</a> <span class=\"separation\"/> <a href=\"#sem:number\">plural</a>. The term <q>hortative</q> is sometimes used for a first person imperative\u2013hortative, and <q>jussive</q> for a third person imperative\u2013hortative. A negative imperative\u2013hortative is a <a href=\"#cxn:prohibitive-construction\">prohibitive</a>. (Sections 12.1, 12.4)"}, "cxn:inalienable-possession-modification-construction": {"definition": "a <a href=\"#cxn:possessive-modification-construction\">possessive modification construction</a> that always includes either <a href=\"#sem:body-part-relation\">body part relations</a> <em>or</em> <a href=\"#sem:kinship-relation\">kinship relations</a> (but not necessarily both), and contrasts in the language with an <a href=\"#cxn:alienable-possession-modification-construction\">alienable possession construction</a>. <em>Example</em>: Crow <em>ba-ap\u00e9</em> <q>my nose</q> is an instance of inalienable possession, using the distinct index <em>b-</em> (cf. the alienable <a href=\"#str:index\">index</a> <em>bas-</em>). (Sections 4.1.4, <strong>5.2.3</strong>)"}, "cxn:inclusive-disjunctive-coordination": {"definition": "a type of <a href=\"#cxn:disjunctive-coordination\">disjunctive coordination</a> in which any <a href=\"#sem:entity\">entity</a> enumerated or any combination of the entities enumerated is intended. The simplest case is coordination of two entities where one, the other, or both are intended. <em>Example</em>: <em>Applicants must be a college graduate or have fluency in German</em> is an example of inclusive disjunctive coordination under the assumption that being both a college graduate and fluent in German does not disqualify you from applying. Inclusive disjunctive coordination can be an instance of <a href=\"#cxn:non-exhaustive-list-coordination\">non-exhaustive list coordination</a>. (Section 15.2.1)"}, "cxn:inclusive-pronoun": {"definition": "a <a href=\"#cxn:first-person-pronoun\">first person pronoun</a> that refers to a group including both speaker and addressee. <em>Example</em>: Kosraean <em>k\u028ct</em> is a first person inclusive pronoun referring to a group that includes both the speaker and the addressee. (Section 3.1.1)"}, "cxn:inclusory-construction": {"definition": "a <a href=\"#cxn:construction\">construction</a> in which there is <a href=\"#inf:reference\">reference</a> to a <a href=\"#cxn:first-person-pronoun\">first</a> or <a href=\"#cxn:second-person-pronoun\">second</a> person participant, and additional third person participants. More specifically, attention is focused on the inclusory construction <a href=\"#str:strategy\">strategy</a> in which an <a href=\"#str:index\">index</a> encodes nonsingular first (or second) person, and the additional participants are expressed in an accompanying <a href=\"#cxn:referring-phrase\">referring phrase</a>. <em>Example</em>: In Toqabaqita <em>doqora-mu mere ngata</em> <q>Your brother and I spoke (to each other)</q>, first person <q>I</q> is expressed only in the auxiliary form <em>mere</em> <q>1st person dual exclusive nonfuture</q>; the referring phrase <em>doqora-mu</em> refers only to <q>your brother</q>. (Section 4.4.4)"}, "cxn:indefinite-article": {"definition": "an <a href=\"#cxn:article\">article</a> that is associated with the bottom end of the <a href=\"#inf:information-status\">information status</a> continuum, where the identity of the referent is not known to speaker or hearer (or both). This includes <a href=\"#inf:pragmatically-specific-referent\">pragmatically specific referent</a>, <a href=\"#inf:semantically-specific-referent\">pragmatically nonspecific referent</a>, and various categories of <a href=\"#inf:nonspecific-referent\">nonspecific referents</a> (see Table 3.4 and Sections 3.4\u20133.5). <em>Example</em>: <em>a bowl</em> is an example of an indefinite article <em>a</em> combined with a <a href=\"#cxn:common-noun\">common noun</a> bowl, used in a context where the individual bowl in question is not identifiable by the hearer. (Table 3.4, Section 3.3.1)"}, "cxn:indefinite-pronoun": {"definition": "a <a href=\"#cxn:pronoun\">pronoun</a> that is associated with the bottom end of the <a href=\"#inf:information-status\">information status</a> continuum, where the identity of the <a href=\"#inf:reference\">referent</a> is not known to speaker or hearer (or both). This includes <a href=\"#inf:pragmatically-specific-referent\">pragmatically specific referent</a>, <a href=\"#inf:semantically-specific-referent\">pragmatically nonspecific referent</a>, and various categories of <a href=\"#inf:nonspecific-referent\">nonspecific referents</a> (see Table 3.4 and Sections 3.4\u20133.5). <em>Example</em>: in <em>Something is under the bed</em>, <em>something</em> is an example of an indefinite pronoun, used in a context where the referent is not identifiable by the hearer. (Table 3.4, Section 3.3.1)"}, "cxn:indirect-negation-pronoun": {"definition": "a <a href=\"#cxn:pronoun\">pronoun</a> that expresses an <a href=\"#inf:indirect-negation-referent\">indirect negation referent</a>. <em>Example</em>: in <em>I don't think that anybody has seen it</em>, <em>anybody</em> is an indirect negation pronoun expressing a referent that is found only in the negated <q class=\"dq\">world</q> of the speaker's beliefs. (Section 3.5)"}, "cxn:information-question-construction": {"definition": "the <a href=\"#cxn:construction\">construction</a> expressing an <a href=\"#inf:information-question\">information question</a> <span class=\"separation\"/> <a href=\"#def:function\">function</a>. <em>Example</em>: <em>Who is coming?</em> is an instance of the English information question construction, expecting an answer identifying the person(s) who is/are coming. Information questions, unlike <a href=\"#cxn:polarity-question-construction\">polarity questions</a>, contain an <a href=\"#cxn:interrogative-pronoun\">interrogative pronoun</a>. (Section 12.3.1)"}, "cxn:information-question-response-construction": {"definition": "the <a href=\"#cxn:construction\">construction</a> that expresses the <a href=\"#inf:information-question-response\">answer to an information question</a>. <em>Example</em>: the answer to the English information question <em>Who is coming?</em> could be <em>Sandra is coming, Sandra is</em>, or just <em>Sandra</em>. (Section 12.3.3)"}, "cxn:ingestion-verb": {"definition": "a <a href=\"#cxn:verb\">verb</a> that expresses an <a href=\"#sem:ingestion-event\">ingestion event</a>. <em>Example</em>: <em>Elena ate a lot of veggie chips</em> is an instance of an ingestion event, and <em>eat</em> is an ingestion verb. (Section 7.4)"}, "cxn:intensifier": {"definition": "a higher than normal value on a <a href=\"#sem:property-concept\">property</a> scale. <em>Example</em>: in <em>very long, very</em> indicates a value longer than normal. (Section 4.1.2)"}, "cxn:interaction-verb": {"definition": "a <a href=\"#cxn:verb\">verb</a> that expresses an <a href=\"#sem:interaction-event\">interaction event</a>. (Section 7.3)"}, "cxn:interrogative-complement": {"definition": "a <a href=\"#cxn:complement\">complement</a> that expresses a <a href=\"#sem:proposition\">proposition</a> which contains information that is unknown. Interrogative complements commonly occur in certain types of <a href=\"#sem:propositional-attitude-event\">propositional attitude</a> <span class=\"separation\"/> <a href=\"#cxn:complement-clause-construction\">complement clause constructions</a>. <em>Examples</em>: in <em>I wonder who is going to the party</em> or <em>John wondered whether he would go to the party</em>, <em>who is going to the party</em> and <em>whether he would go to the party</em> are interrogative complements. Interrogative complements are often found in the <a href=\"#sem:objective\">objective</a> construal of <a href=\"#sem:epistemic-modality\">epistemic modality</a>. (Sections 12.3.4, 18.3.1)"}, "cxn:interrogative-construction": {"definition": "the <a href=\"#cxn:construction\">construction</a> that expresses a <a href=\"#inf:interrogative\">interrogative</a> speech act. Interrogatives are divided into <a href=\"#cxn:polarity-question-construction\">polarity questions</a>, <a href=\"#cxn:information-question-construction\">information questions</a>, and <a href=\"#cxn:alternative-question\">alternative questions</a>. (Sections 12.1, 12.3)"}, "cxn:interrogative-pronoun": {"definition": "<a href=\"#cxn:pronoun\">pronoun</a> that is used to ask an addressee about the identity of a <a href=\"#inf:reference\">referent</a> whose identity is unknown to the speaker. <em>Example</em>: in <em>Who ate my cookie?</em>, <em>who</em> is an interrogative pronoun; the identity of the cookie eater is unknown to the speaker, who is asking the hearer to provide the referent's identity. The interrogative form may also be a <a href=\"#cxn:modifier\">modifier</a> rather than a pronoun: in <em>Which book is required reading?, which</em> is an interrogative modifier denoting the missing information about the book that is required reading. (Sections 3.4.2, 12.3.1)"}, "cxn:intransitive-construction": {"definition": "the <a href=\"#cxn:construction\">construction</a>, or possibly set of constructions, used to express <a href=\"#sem:monovalent\">monovalent events</a> with their single <a href=\"#inf:topicality\">salient</a> <span class=\"separation\"/> <a href=\"#inf:reference\">argument</a>, in the <a href=\"#sem:s-role\">S role</a>. <em>Example</em>: <em>The boys walked</em> is an example of an English intransitive construction. Unlike the <a href=\"#cxn:transitive-construction\">transitive construction</a> and the <a href=\"#cxn:ditransitive-construction\">ditransitive construction</a>, there is no clear exemplar event for defining intransitive constructions, thanks to the existence of <a href=\"#str:active-alignment\">active alignment</a>. (Sections 6.1.2, <strong>6.3.3</strong>)"}, "cxn:introverted-verb": {"definition": "a <a href=\"#cxn:verb\">verb</a> expressing an <a href=\"#sem:introverted\">introverted event</a>. <em>Examples</em>: shaving oneself vs. shaving someone else, laying down vs. laying someone else down, or quarreling (with each other) are instances of introverted events, and <em>shave</em>, <em>lay (down)</em>, and <em>quarrel</em> are introverted verbs. (Section 7.2)"}, "cxn:irrealis-pronoun": {"definition": "a <a href=\"#cxn:pronoun\">pronoun</a> that expresses an <a href=\"#inf:irrealis-referent\">irrealis referent</a>. <em>Example</em>: in <em>Visit me sometime</em>, <em>sometime</em> is an irrealis <a href=\"#cxn:pronoun\">pronoun</a> expressing an irrealis referent \u2013 a time only found in the hoped-for mental space of the speaker's offer. (Section 3.5)"}, "cxn:killing-injuring-verb": {"definition": "the <a href=\"#cxn:verb\">verb</a> expressing such a <a href=\"#sem:killing-injuring-event\">killing/injuring event</a>. <em>Example</em>: stabbing is a killing/injuring event, and <em>stab</em> is a killing/injuring verb. (Section 7.3.2)"}, "cxn:knowledge-predicate": {"definition": "the <a href=\"#cxn:predicate\">predicate</a> expressing a <a href=\"#sem:knowledge-event\">knowledge event</a>. <em>Example</em>: in <em>Sally knows that Donald won the election</em>, Sally's belief with respect to the proposition that Donald won the election is reported by the speaker; and, in addition, a <a href=\"#sem:positive-epistemic-stance\">positive epistemic stance</a> is taken by the speaker toward that proposition (i.e., the speaker believes that Donald indeed won the election). (Section 18.2.2)"}, "cxn:let-alone-construction": {"definition": "a <a href=\"#sem:negative-polarity\">negative</a> sentence that expresses two <a href=\"#sem:proposition\">propositions</a> at different degrees of <q class=\"dq\">strength</q> in a <a href=\"#sem:scalar-model\">scalar model</a>; the speaker asserts the most informative of the two propositions, although the less informative proposition is sufficient in the communicative context. <em>Example</em>: in response to the question <em>Did the kids get their breakfast on time this morning?</em>, the sentence <em>I barely got up in time to <span class=\"sc\">eat lunch</span>, let alone <span class=\"sc\">cook breakfast</span></em> is an instance of the let alone construction: not getting up in time to cook breakfast would answer the question, but not getting up in time to eat lunch is still more informative (indicating just how long the speaker remained in bed). (Section 17.4.2)"}, "cxn:locational-construction": {"definition": "a <a href=\"#cxn:clause\">clause</a> in which a locative relation is expressed, either <a href=\"#inf:predicational\">predicationally</a> or <a href=\"#inf:presentational\">presentationally</a>. These two types of location clauses are <a href=\"#cxn:predicational-location-construction\">locative predication</a> and <a href=\"#cxn:presentational-location-construction\">presentational locative</a>, respectively. (Section 10.4.1)"}, "cxn:locative-modification-construction": {"definition": "a <a href=\"#cxn:referring-phrase\">referring phrase</a> that expresses a <a href=\"#sem:figure-ground-spatial-relation\">figure\u2013ground spatial relation</a> between the ground <a href=\"#sem:object-concept\">object</a> functioning as the <a href=\"#cxn:modifier\">modifier</a> and the figure functioning as the modified <a href=\"#inf:reference\">referent</a>. <em>Example</em>: <em>the bicycle in the garage</em> is a locative modification construction. (Section 4.1.4)"}, "cxn:locative-phrase": {"definition": "an <a href=\"#cxn:attributive-phrase\">attributive phrase</a> whose <a href=\"#cxn:head\">head</a> denotes an <a href=\"#sem:object-concept\">object concept</a> <span class=\"separation\"/> <a href=\"#inf:modification\">modifying</a> a <a href=\"#cxn:referent-expression\">referent expression</a> via a <a href=\"#sem:figure-ground-spatial-relation\">figure\u2013ground spatial relation</a>. <em>Example</em>: in <em>the bicycle in the garage, in the garage</em> is a locative attributive phrase: its head denotes an object concept, the garage, and the garage is the ground in a figure\u2013ground spatial relation with respect to the bicycle. (Section 4.1.4)"}, "cxn:logophoric-construction": {"definition": "the construction in a <a href=\"#str:logophoric-system\">logophoric system</a> for <a href=\"#cxn:complement-clause-construction\">complement clause constructions</a> that is used when a <a href=\"#sem:participant-role\">participant</a> in the <a href=\"#cxn:complement\">complement</a> <span class=\"separation\"/> <a href=\"#sem:event\">event</a> is <a href=\"#inf:coreference\">coreferential</a> with the <u>speaker</u>, <u>addressee</u>, or <a href=\"#sem:experiencer\">experiencer</a> of an <a href=\"#sem:utterance-event\">utterance</a>, <a href=\"#sem:propositional-attitude-event\">propositional attitude</a>, <a href=\"#sem:knowledge-event\">knowledge</a>, or <a href=\"#sem:commentative-event\">commentative event</a>. <em>Example</em>: Donno S\u0254 <em>Oumar Anta inyem\u025b\u00f1 waa be gi</em> <q>Oumar<sub>i</sub> said that Anta had seen him<sub>i</sub></q> is an instance of the logophoric construction \u2013 the reference to Oumar in the complement clause uses a special <a href=\"#cxn:pronoun\">pronoun</a> form <em>inyem\u025b\u00f1</em>. (Section 18.4.2)"}, "cxn:main-clause": {"definition": "a <a href=\"#cxn:clause\">clause</a> that is <a href=\"#inf:pragmatic-assertion\">pragmatically asserted</a>, typically in the context of identifying the pragmatically asserted clause in a <a href=\"#cxn:complex-sentence\">complex sentence construction</a>. <em>Example</em>: in <em>Jerry played the guitar while Phil played the bass</em>, the clause <em>Jerry played the guitar</em> is the main clause, whereas <em>while Phil played the bass</em> is a <a href=\"#cxn:subordinate-clause\">subordinate clause</a>. Main clauses are generally <a href=\"#cxn:matrix-clause\">matrix clauses</a>, but matrix clauses need not be main clauses, and <a href=\"#cxn:dependent-clause\">dependent clauses</a> may be pragmatically asserted \u2013 i.e. function as main clauses. (Section 15.1.2)"}, "cxn:manipulative-predicate": {"definition": "the <a href=\"#cxn:predicate\">predicate</a> expressing a <a href=\"#sem:manipulative-event\">manipulative event</a>. <em>Example</em>: in <em>Bruce convinced Greg to take him to San Rafael, convinced</em> denotes a manipulative event. Manipulative <a href=\"#cxn:complement-clause-construction\">complement clause constructions</a> overlap with <a href=\"#cxn:causative-construction\">causative constructions</a>. (Section 18.2.2)"}, "cxn:manner-complex-predicate": {"definition": "a <a href=\"#cxn:stative-complex-predicate\">stative complex predicate</a> in which the <a href=\"#sem:stative\">stative component</a> of the <a href=\"#cxn:complex-predicate\">complex predicate</a> describes a <a href=\"#sem:state\">state</a> that holds of the <a href=\"#sem:event\">event</a> denoted by the main predicate. Hence, the state holds at the same time as the event. Manner complex predicates are <a href=\"#sem:event-oriented\">event-oriented</a>. <em>Example</em>: in English <em>We crawled down the slope slowly, crawl... slowly</em> is a manner complex predicate, and <em>slowly</em> describes a property of the crawling event. (Section 14.1)"}, "cxn:manner-of-motion-verb": {"definition": "the <a href=\"#cxn:verb\">verb</a> expressing a <a href=\"#sem:manner-of-motion-event\">manner of motion event</a>. <em>Example</em>: in <em>Sam strode into the room, stride</em> is a manner of motion verb expressing a manner of motion event. (Sections 7.3.1, 14.2)"}, "cxn:manner-verb": {"definition": "a <a href=\"#cxn:verb\">verb</a> expressing a <a href=\"#sem:manner-profile\">manner event</a>. <em>Example</em>: in <em>She smeared jam on the toast</em>, the event is described in terms of the manner by which the jam is applied to the toast. (Section 7.3.2)"}, "cxn:material-term": {"definition": "a <a href=\"#cxn:modifier\">modifier</a> expressing a concept describing the material or substance out of which an object is made. <em>Example</em>: <em>wood(en)</em> and <em>metal</em> are English material terms. (Section 4.1.2)"}, "cxn:matrix-clause": {"definition": "the <a href=\"#cxn:clause\">clause</a> in a <a href=\"#cxn:complex-sentence\">complex sentence construction</a> that also contains a <a href=\"#cxn:dependent-clause\">dependent clause</a>; the <a href=\"#cxn:dependent-clause\">dependent clause</a> is a <a href=\"#cxn:dependent\">dependent</a> of the matrix clause. <em>Example</em>: in <em>She watered the plants before she ate lunch, She watered the plants</em> is an instance of a matrix clause; <em>before she ate lunch</em> is a dependent clause. A matrix clause is often, but not always, a <a href=\"#cxn:main-clause\">main clause</a>; it may be a <a href=\"#cxn:subordinate-clause\">subordinate clause</a> that is itself dependent on another matrix clause."}, "cxn:measure-term": {"definition": "a <a href=\"#cxn:mensural-term\">mensural term</a> that selects a measured amount of an uncountable <a href=\"#inf:reference\">referent</a>. <em>Example</em>: in <em>six gallons of wine, gallon(s)</em> is a measure term. (Section 4.1.3)"}, "cxn:measurement": {"definition": "a calibratable value on a <a href=\"#sem:property-concept\">property</a> scale. <em>Example</em>: in <em>three feet long, three feet</em> measures the value of length for the object in question. (Section 4.1.2)"}, "cxn:mensural-modification-construction": {"definition": "a <a href=\"#cxn:typifying-construction\">non-anchoring construction</a> that has a <a href=\"#cxn:mensural-term\">mensural term</a> as the <a href=\"#sem:object-concept\">object</a> <span class=\"separation\"/> <a href=\"#cxn:modifier\">modifier</a> and a (semantic) <a href=\"#cxn:head\">head</a> <span class=\"separation\"/> <a href=\"#inf:reference\">referent</a> that is only <a href=\"#inf:type-identifiable\">type identifiable</a>. <em>Example</em>: <em>a piece of cake</em> is a mensural construction in that the object modifier denotes only the type <q>cake</q>. Two strategies for mensural constructions are <a href=\"#str:mensural-classifier\">mensural classifiers</a> and the <a href=\"#str:pseudo-partitive\">pseudo-partitive</a>. (Section 5.2.2)"}, "cxn:mensural-term": {"definition": "a term that measures out a quantity or unit of a referent. Mensural terms are classified in different ways; this textbook divides measure terms into <a href=\"#cxn:measure-term\">measure terms</a>, <a href=\"#cxn:container-term\">container terms</a>, <a href=\"#cxn:form-term\">form terms</a>, <a href=\"#cxn:group-term\">group terms</a>, <a href=\"#cxn:piece-term\">piece terms</a>, and <a href=\"#cxn:species-term\">species terms</a>. (Section 4.1.3)"}, "cxn:modification-construction": {"definition": "a <a href=\"#cxn:construction\">construction</a> that consists of the <a href=\"#cxn:referent-expression\">referent expression</a> and an <a href=\"#cxn:attributive-phrase\">attributive phrase</a> (or phrases) that are dependent on that referent expression. <em>Example</em>: the <a href=\"#cxn:referring-phrase\">referring phrase</a> <em>my mother's book</em> is an instance of an English modification construction made up of the referent expression (<em>book</em>) plus the Possessive attributive phrase <em>my mother's</em>. (Section 2.2.4, <strong>Chapters 4\u20135</strong>)"}, "cxn:modifier": {"definition": "the <a href=\"#cxn:head\">head</a> of an <a href=\"#cxn:attributive-phrase\">attributive phrase</a>. <em>Example</em>: in <em>nearly fifty trees</em>, <em>fifty</em> is a modifier. A prototypical modifier, a <a href=\"#sem:property-concept\">property concept</a>, is an <a href=\"#cxn:adjective\">adjective</a>. (Section 2.2.4)"}, "cxn:motion-verb": {"definition": "the <a href=\"#cxn:verb\">verb</a> expressing a <a href=\"#sem:motion-event\">motion event</a>. <em>Examples</em>: <em>fly</em> and <em>go</em> express motion events. (Sections 7.2, 7.3.1, 14.4)"}, "cxn:negation-construction": {"definition": "a <a href=\"#cxn:construction\">construction</a> that expresses <a href=\"#sem:negative-polarity\">negative polarity</a>. Negation constructions include <a href=\"#cxn:declarative-negation-construction\">declarative negation</a>, <a href=\"#cxn:existential-negation-construction\">existential negation</a>, and the <a href=\"#cxn:prohibitive-construction\">prohibitive</a>. (Sections 12.2, 12.4.1)"}, "cxn:nominal-modification-construction": {"definition": "a <a href=\"#cxn:construction\">construction</a> in which an <a href=\"#sem:object-concept\">object concept</a> is used as a <a href=\"#cxn:modifier\">modifier</a> of a <a href=\"#cxn:referent-expression\">referent expression</a>. <em>Examples</em>: the English Possessive Construction, as in <em>the boy's bicycle</em>, is an instance of a nominal modification construction. (Sections 2.2.5, <strong>4.1.4</strong>)"}, "cxn:nominal-phrase": {"definition": "a <a href=\"#cxn:referring-phrase\">referring phrase</a> whose <a href=\"#cxn:head\">head</a> denotes an <a href=\"#sem:object-concept\">object concept</a>. <em>Example</em>: <em>a large balloon</em> is a nominal phrase; the head <em>balloon</em> denotes an object concept. A nominal phrase is the prototypical referring phrase, and its head is a <a href=\"#cxn:noun\">noun</a>. (Section 2.2.3)"}, "cxn:non-exhaustive-list-coordination": {"definition": "a type of <a href=\"#cxn:coordinate-construction\">coordination construction</a> that does not express all of the relevant entities that are understood to be coordinated (i.e. does not express all of the relevant entities on the list). <em>Example</em>: <em>In the window were cookies, cakes, chocolates, and everything</em> is an instance of non-exhaustive list coordination with objects. Non-exhaustive list coordination can include <a href=\"#sem:inclusive-disjunction\">inclusive disjunction</a>. (Section 15.2.1)"}, "cxn:nonanaphoric-definite-article": {"definition": "an <a href=\"#cxn:article\">article</a> that is used for an <a href=\"#inf:inactive-referent\">inactive</a> or <a href=\"#inf:inferrable-referent\">inferrable referent</a>. (Section 3.3.1)"}, "cxn:nonbasic-voice": {"definition": "an <a href=\"#cxn:clause\">argument structure construction</a> that does not conform to the prototypical parallel ranking of <a href=\"#sem:participant-role\">participant role</a> and <a href=\"#inf:topicality\">argument salience</a>. <em>Example</em>: <em>The salmon were eaten by grizzlies</em> is an instance of a nonbasic voice construction. Nonbasic voice constructions include the <a href=\"#cxn:passive-inverse-voice\">passive\u2013inverse voice construction</a>, the <a href=\"#cxn:antipassive-construction\">antipassive construction</a>, the <a href=\"#cxn:causative-construction\">causative construction</a>, and the <a href=\"#cxn:applicative-construction\">applicative construction</a>. (Section 8.1)"}, "cxn:nonpredicational-construction": {"definition": "a <a href=\"#cxn:clause\">clause</a> that is defined by a <a href=\"#def:function\">function</a> other than the <a href=\"#inf:topic-comment\">topic\u2013comment</a> (<a href=\"#inf:predication\">predication</a>) function, i.e. a clause that express the <a href=\"#inf:thetic\">thetic</a> or <a href=\"#inf:identificational\">identificational</a> functions. <em>Examples</em>: <em>There's a jaguar!</em> (thetic) and <em>Sally is the winner</em> (identificational) are examples of nonpredicational clauses. (Section 10.1.2)"}, "cxn:nonprototypical-construction": {"definition": "a <a href=\"#cxn:construction\">construction</a> that expresses less common or <q class=\"dq\">disfavored</q> (see Section 2.4) combinations of <a href=\"#inf:information-packaging\">information packaging</a> and <a href=\"#sem:meaning\">semantic content</a>. <em>Example</em>: <em>(Sam) is a barber</em> is an instance of a nonprototypical <a href=\"#inf:predication\">predication</a> construction: it expresses predication of an <a href=\"#sem:object-concept\">object</a> category. This is not the most common or <q class=\"dq\">favored</q> type of predication; <a href=\"#sem:action-concept\">action</a> predication is the <a href=\"#cxn:prototypical-construction\">prototypical</a> predication construction. (Section 2.2.5)"}, "cxn:nonprototypical-predication-construction": {"definition": "the <a href=\"#inf:predication\">predication</a> of concepts other than <a href=\"#sem:action-concept\">action</a> concepts. The types of nonprototypical predication most commonly described include predication of <a href=\"#sem:object-concept\">object concepts</a>, <a href=\"#sem:property-concept\">property concepts</a>, <a href=\"#sem:figure-ground-spatial-relation\">location</a>, and <a href=\"#sem:possession\">possession</a>. <em>Example</em>: <em>Frieda is an engineer</em>, an instance of object predication, is an example of nonprototypical predication. (Section 10.1.1)"}, "cxn:noun": {"definition": "the <a href=\"#cxn:head\">head</a> of a nominal phrase \u2013 that is, <a href=\"#cxn:referring-phrase\">referring phrase</a> \u2013 that denotes an <a href=\"#sem:object-concept\">object</a>. <em>Example</em>: the word <em>violin</em> in the referring phrase <em>an old violin</em> is a noun \u2013 it is an object concept that is the head of the referring phrase. (Sections 2.2.3, 3.1)"}, "cxn:noun-complement": {"definition": "the <a href=\"#inf:modification\">modifying</a> <span class=\"separation\"/> <a href=\"#cxn:clause\">clause</a> in a <a href=\"#cxn:noun-complement-clause-construction\">noun complement clause construction</a>. <em>Example</em>: in <em>the fact that the student bought the book, that the student bought the book</em> is the noun complement. (Section 19.2.4)"}, "cxn:noun-complement-clause-construction": {"definition": "a <a href=\"#cxn:construction\">construction</a> in which a <a href=\"#cxn:noun-complement\">noun complement</a> (a <a href=\"#cxn:dependent-clause\">dependent clause</a>) <a href=\"#inf:modification\">modifies</a> a <a href=\"#cxn:noun\">noun</a> <span class=\"separation\"/> <a href=\"#cxn:head\">head</a>. The noun head is not necessarily a (<a href=\"#inf:topicality\">salient</a>) <a href=\"#sem:participant-role\">participant</a> in the <a href=\"#sem:event\">event</a> denoted by the noun complement. <em>Example</em>: <em>the fact that the student bought the book</em> is an example of a noun complement clause construction: <em>that the student bought the book</em> is the noun complement, and <em>the fact</em> is the head noun. The noun complement clause construction also includes examples such as Japanese [<em>dareka ga doa o tataku</em>] <em>oto</em> <q>the sound of someone knocking on the door</q>, where the head noun <em>oto</em> <q>sound</q> is modified by the noun complement <em>dareka ga doa o tataku</em> <q>someone is knocking on the door</q>. (Section 19.2.4)"}, "cxn:object-identity-construction": {"definition": "a <a href=\"#cxn:complex-sentence\">complex sentence construction</a> in which the <a href=\"#sem:object-concept\">object</a> <span class=\"separation\"/> <a href=\"#inf:reference\">referents</a> in the two <a href=\"#cxn:clause\">clauses</a> are <a href=\"#inf:coreference\">coreferential</a>. <em>Example</em>: <em>Sumie patted and Norio hit the dog</em> is an instance of an object identity <a href=\"#cxn:coordinate-clause-construction\">coordinate clause construction</a> \u2013 the object referent for both clauses is the dog. (Section 16.5)"}, "cxn:object-phrase": {"definition": "the <a href=\"#cxn:argument-phrase\">argument phrase</a> expressing the <a href=\"#inf:mid-topicality\">second most salient</a> <span class=\"separation\"/> <a href=\"#inf:reference\">referent</a> in a <a href=\"#cxn:transitive-construction\">transitive construction</a>. <em>Example</em>: in <em>Emily read the paper, the paper</em> is the object. (Sections 6.1.1, <strong>6.3.2</strong>)"}, "cxn:oblique-phrase": {"definition": "the <a href=\"#cxn:argument-phrase\">argument phrase</a> expressing the (less salient) arguments expressing <a href=\"#sem:peripheral-participant\">peripheral participants</a> in an <a href=\"#cxn:clause\">argument structure construction</a>. <em>Example</em>: in <em>Emily viewed the hawk with binoculars, with binoculars</em> is an oblique argument phrase. (Sections 6.1.1, 6.3.2)"}, "cxn:ordinal-numeral-term": {"definition": "a <a href=\"#cxn:set-member-term\">set-member term</a> for a member in an ordered set, based on the precise position of the member in the ordering of the set. <em>Example</em>: in <em>the second tree</em>, <em>second</em> is an ordinal numeral. (Section 4.1.3)"}, "cxn:partitive-construction": {"definition": "an <a href=\"#cxn:anchoring-construction\">anchoring construction</a> that has a <a href=\"#cxn:piece-term\">piece</a> <span class=\"separation\"/> <a href=\"#cxn:noun\">noun</a> as the <a href=\"#cxn:head\">head</a> <span class=\"separation\"/> <a href=\"#inf:reference\">referent</a> and an <a href=\"#inf:anchor\">anchor</a> as the <a href=\"#cxn:modifier\">modifier</a>. Example: <em>a piece of the cake</em> is a partitive construction in that the <a href=\"#sem:object-concept\">object</a> modifier <em>of the cake</em> is a particular <a href=\"#sem:token\">individual</a> and hence functions as an anchor. (Section 5.2.2)"}, "cxn:passive-inverse-voice": {"definition": "a type of <a href=\"#cxn:nonbasic-voice\">nonbasic voice construction</a> that expresses a situation in which the <a href=\"#sem:p-role\">P</a> <span class=\"separation\"/> <a href=\"#sem:participant-role\">participant</a> has a higher discourse <a href=\"#inf:topicality\">salience</a> than the <a href=\"#sem:a-role\">A</a> participant. <em>Example</em>: the English Passive Construction, as in <em>The boys were followed by a mountain lion</em>, is an instance of the passive\u2013inverse voice construction. (Sections 6.3.4, <strong>8.3</strong>)"}, "cxn:path-verb": {"definition": "the <a href=\"#cxn:verb\">verb</a> expressing such a <a href=\"#sem:path-event\">path of motion event</a>. <em>Example</em>: in <em>The guests entered the reception hall, enter</em> is a path of motion verb expressing a path of motion event. (Sections 7.3.1, 14.2)"}, "cxn:perception-complement-taking-predicate": {"definition": "A perception complement-taking predicate is a <a href=\"#cxn:predicate\">predicate</a> that expresses perceiving an event, which is expressed as the <a href=\"#cxn:complement\">complement</a> event of the predicate. <em>Example</em>: in <em>We watched the elk graze in the caldera</em>, watched denotes a perception event. The complement event has <a href=\"#sem:dependent-time-reference\">dependent time reference</a>; the complement event must be occurring at the same time as the perceiving event (although modern media allowing watching a prior event via a recording). (Section 18.2.2)"}, "cxn:perception-verb": {"definition": "a perception verb is a <a href=\"#cxn:verb\">verb</a> that expresses the event of perceiving an object. <em>Example</em>: <em>Tim heard the macaw</em> is an example of a perception event, and <em>hear</em> is the perception verb (Section 7.4)."}, "cxn:personal-pronoun": {"definition": "a linguistic <a href=\"#def:form\">form</a> used for <a href=\"#sem:contextual\">contextual</a> <span class=\"separation\"/> <a href=\"#inf:reference\">reference</a> to a person in terms of their role in the speech act event. <em>Example</em>: <em>I</em> is a pronoun that refers to a person in terms of their role as speaker in a speech event. (Section 3.1)"}, "cxn:physical-property-term": {"definition": "a <a href=\"#cxn:modifier\">modifier</a> expressing a physical property (apart from shape; see <a href=\"#cxn:shape-term\">shape term</a>). <em>Examples</em>: <em>soft</em> and <em>smooth</em> are English physical property terms. (Section 4.1.2)"}, "cxn:piece-term": {"definition": "a <a href=\"#cxn:mensural-term\">mensural term</a> that selects an amount of a <a href=\"#inf:reference\">referent</a> which is usually a separated, arbitrary part of the object. <em>Example</em>: in <em>a slice of meat, slice</em> is a piece term. (Section 4.1.3)"}, "cxn:polarity-focus-construction": {"definition": "an <a href=\"#cxn:identificational-construction\">identificational construction</a> whose <a href=\"#inf:focus\">focus</a> is the polarity of the <a href=\"#sem:proposition\">proposition</a> (that is, whether it is true or false). <em>Example</em>: in English, <em>I DID finish my assignment!</em> is an instance of a polarity focus construction, whose focus is the positive polarity (accented <em>DID</em>) of the proposition <q>I finished my assignment</q>. (Section 11.4.1)"}, "cxn:polarity-question-construction": {"definition": "the <a href=\"#cxn:construction\">construction</a> expressing the <a href=\"#inf:polarity-question\">polarity question function</a>. <em>Example</em>: <em>Are you coming?</em> is an instance of the English polarity question construction, expecting a <q>yes</q> or <q>no</q> answer. (Section 12.3.1)"}, "cxn:polarity-response-construction": {"definition": "the <a href=\"#cxn:construction\">construction</a> that expresses a <a href=\"#inf:polarity-response\">polarity answer</a>. <em>Example</em>: the polarity response to <em>Do you have any money?</em> in English is <em>Yes (I do)</em> or <em>No (I don't)</em>. (This is excluding other less cooperative responses such as <em>I don't know</em> or <em>It's none of your business</em>.) (Section 12.3.3)"}, "cxn:possession-construction": {"definition": "<a href=\"#cxn:clause\">clauses</a> in which a <a href=\"#sem:possession\">possession relation</a> is expressed, either <a href=\"#inf:predicational\">predicationally</a> or <a href=\"#inf:presentational\">presentationally</a>. These two types of possession clauses are <a href=\"#cxn:predicational-possession-construction\">predicational possession</a> and <a href=\"#cxn:presentational-possession-construction\">presentational possession</a>, respectively. (Section 10.4.2)"}, "cxn:possessive-attributive-phrase": {"definition": "an <a href=\"#cxn:attributive-phrase\">attributive phrase</a> whose <a href=\"#cxn:head\">head</a> denotes an <a href=\"#sem:object-concept\">object concept</a> <span class=\"separation\"/> <a href=\"#inf:modification\">modifying</a> a <a href=\"#cxn:referent-expression\">referent expression</a> via a <a href=\"#sem:possession\">possession relation</a>. <em>Example</em>: in <em>Sally's calendar</em>, <em>Sally</em> is a possessive attributive phrase: its head denotes an object concept, the person Sally, and Sally is in a possession relation with respect to the calendar. (Section 4.1.4)"}, "cxn:possessive-modification-construction": {"definition": "the <a href=\"#cxn:nominal-modification-construction\">nominal modifier construction</a> that expresses a <a href=\"#sem:possession\">possession relation</a> such that the <a href=\"#sem:possessor\">possessor</a> is the <a href=\"#cxn:modifier\">modifier</a> and the <a href=\"#sem:possessum\">possessum</a> is the <a href=\"#cxn:head\">head</a> (i.e. is the <a href=\"#cxn:referent-expression\">referent expression</a>). <em>Example</em>: <em>Sally's calendar</em> is an instance of possession \u2013 the calendar could be one that she owns, one that she gave me, one that she is holding in a photo of people with calendars, one that she designed or made, one with photos of her, and so on. Many languages have two morphosyntactically distinct possessive modification constructions, an <a href=\"#cxn:alienable-possession-modification-construction\">alienable possession construction</a> and an <a href=\"#cxn:inalienable-possession-modification-construction\">inalienable possession construction</a> (or constructions). (Section 4.1.4)"}, "cxn:pragmatically-nonspecific-article": {"definition": "an <a href=\"#cxn:article\">article</a> that is used for a <a href=\"#inf:semantically-specific-referent\">pragmatically nonspecific indefinite referent</a>. (Section 3.4.1)"}, "cxn:pragmatically-nonspecific-pronoun": {"definition": "an <a href=\"#cxn:pronoun\">pronoun</a> that is used for a <a href=\"#inf:semantically-specific-referent\">pragmatically nonspecific indefinite referent</a>. (Section 3.4.1)"}, "cxn:pragmatically-specific-article": {"definition": "an <a href=\"#cxn:article\">article</a> that is used for a <a href=\"#inf:pragmatically-specific-referent\">pragmatically specific referent</a>. (Section 3.4.1)"}, "cxn:pragmatically-specific-pronoun": {"definition": "an <a href=\"#cxn:pronoun\">pronoun</a> that is used for a <a href=\"#inf:pragmatically-specific-referent\">pragmatically specific referent</a>. (Section 3.4.1)"}, "cxn:predicate": {"definition": "the <a href=\"#cxn:head\">head</a> of a <a href=\"#cxn:clause\">clause</a>, which is not necessarily an <a href=\"#sem:action-concept\">action</a>. <em>Example</em>: in <em>The dog is old, (is) old</em> is the predicate. (Section 2.2.4)"}, "cxn:predicate-adjectival-construction": {"definition": "a <a href=\"#cxn:clause\">clause construction</a> defined by the function of <a href=\"#inf:predication\">predicating</a> a <a href=\"#sem:property-concept\">property concept</a> of a <a href=\"#inf:reference\">referent</a> \u2013 that is, asserting that a property applies to the referent. <em>Example</em>: <em>Sarah is intelligent</em> is an example of an English predicate adjectival construction: it predicates intelligence of Sarah. (Sections 1.5, <strong>2.2.5</strong>, <strong>10.3</strong>)"}, "cxn:predicate-identity-construction": {"definition": "a <a href=\"#cxn:complex-sentence\">complex sentence construction</a> in which the <a href=\"#sem:event\">events</a> denoted by the <a href=\"#cxn:predicate\">predicate</a> in the two <a href=\"#cxn:clause\">clauses</a> are of the same type. <em>Example</em>: <em>Sumie saw the dog and Norie the cat</em> is an instance of a predicate identity <a href=\"#cxn:coordinate-clause-construction\">coordinate clause construction</a>: the event denoted by the predicate in both clauses is seeing. (Section 16.5)"}};
@@ -0,0 +1 @@
+DATA.shards[2] = {"cxn:predicate-nominal-construction": {"definition": "a <a href=\"#cxn:clause\">clause construction</a> defined by the function of <a href=\"#inf:predication\">predicating</a> an <a href=\"#sem:object-concept\">object concept</a> of a <a href=\"#inf:reference\">referent</a> \u2013 that is, asserting what object category the referent belongs to. <em>Example</em>: <em>Ira is a writer</em> is an example of an English predicate nominal construction; it predicates that the referent of <em>Ira</em> belongs to the category of writer. <a href=\"#cxn:predicate-nominal-construction\">Predicational construction</a> is another term for a predicate nominal construction. Sometimes <q>predicate nominal</q> is used to cover predicational, <a href=\"#cxn:presentational-construction\">presentational</a> and <a href=\"#cxn:equational-construction\">equational</a> constructions; we will use it in the narrow sense only. (Sections 1.4, <strong>2.2.5</strong>, <strong>10.3</strong>)"}, "cxn:predicational-location-construction": {"definition": "the <a href=\"#cxn:construction\">construction</a> expressing a <a href=\"#inf:predicational-location\">predicational location</a> <span class=\"separation\"/> <a href=\"#def:function\">function</a>. <em>Example</em>: <em>The pot is on the table</em> is an instance of the predicational locative construction. (Section 10.4.1)"}, "cxn:predicational-possession-construction": {"definition": "a <a href=\"#cxn:possession-construction\">possession clause</a> in which <a href=\"#sem:ownership\">ownership</a> of the <a href=\"#sem:possessum\">possessum</a> by the <a href=\"#sem:possessor\">possessor</a> is <a href=\"#cxn:predicate\">predicated</a> of the possessum. <em>Example</em>: in <em>That laptop belongs to Kerry</em>, ownership of the laptop by Kerry is predicated of the laptop. <em>That laptop is Kerry's</em> is also treated as an instance of a predicational possession construction, <a href=\"#str:recruitment-strategy\">recruiting</a> the <a href=\"#str:strategy\">strategy</a> of a <a href=\"#cxn:nonprototypical-predication-construction\">nonprototypical predication construction</a>; but it might be better analyzed as having <a href=\"#inf:equational\">equational information packaging</a>. (Section 10.4.2)"}, "cxn:presentational-construction": {"definition": "the <a href=\"#cxn:construction\">construction</a> that expresses a <a href=\"#inf:presentational\">presentational</a> information packaging. <em>Example</em>: <em>There's my bicycle</em> and <em>In the corner sat a mouse</em> are sentences that express the presentational information packaging function. Subtypes of the presentational construction are the <a href=\"#cxn:presentational-location-construction\">presentational location</a> and the <a href=\"#cxn:presentational-possession-construction\">presentational possession constructions</a>. (Sections 10.1.2, 10.4)"}, "cxn:presentational-location-construction": {"definition": "the <a href=\"#cxn:construction\">construction</a> expressing a <a href=\"#inf:presentational\">presentational</a> information packaging of <a href=\"#sem:figure-ground-spatial-relation\">location</a>. <em>Example</em>: in <em>In the room was a request for breakfast</em>, the request for breakfast is being introduced into the discourse, anchored by its spatial relation to the room. (Sections 10.4.1, 10.4.3)"}, "cxn:presentational-possession-construction": {"definition": "a <a href=\"#inf:presentational\">presentational information packaging</a> of the <a href=\"#sem:possession\">possession relation</a> in which a <a href=\"#sem:possessum\">possessum</a> is introduced into the discourse, <a href=\"#inf:anchor\">anchored</a> by the <a href=\"#sem:possessor\">possessor</a>; and the <a href=\"#cxn:construction\">construction</a> expressing this <a href=\"#def:function\">function</a>. <em>Example</em>: in <em>Kerry has a laptop</em>, the laptop is introduced into the discourse, but anchored to Kerry by the <a href=\"#sem:possession\">possession relation</a> that holds between Kerry and the laptop. More <a href=\"#def:grammaticalization\">grammaticalized</a> versions of this strategy include Spanish <em><strong>Hab\u00eda</strong> muchas chicas de mi edad y m\u00e1s j\u00f3venes</em> <q>There were many girls of my age and younger</q>. (Section 10.4.2)"}, "cxn:pretense-predicate": {"definition": "a <a href=\"#cxn:predicate\">predicate</a> expressing a <a href=\"#sem:pretense-event\">pretense event</a>. <em>Example</em>: in <em>Ira pretended that the guests had already left</em>, the proposition that the guests had already left is presented as true in an alternative reality from the shared beliefs of the interlocutors (or, for that matter, Ira). There is a strong implicature that the proposition does not hold in reality (that is, the shared beliefs of the interlocutors). (Section 18.2.2)"}, "cxn:prohibitive-construction": {"definition": "the <a href=\"#cxn:construction\">construction</a> that expresses a <a href=\"#inf:prohibitive\">prohibitive</a> speech act. <em>Example</em>: English <em>Don't be a fool!</em> is an instance of a prohibitive; the construction uses a special prohibitive morpheme <em>Don't</em> to express prohibitive function. (Section 12.4.1)"}, "cxn:pronominal-argument-complex-predicate": {"definition": "an <a href=\"#cxn:argument-complex-predicate\">argument complex predicate</a> in which the <a href=\"#inf:reference\">argument</a> is a <a href=\"#cxn:pronoun\">pronoun</a> rather than a <a href=\"#cxn:common-noun\">common noun</a>. <em>Example</em>: in English <em>I'm losing it</em> (meaning <q>lose one's mind</q>), <em>losing it</em> is a pronominal argument complex predicate, containing the pronoun <em>it</em>. (Section 13.6)"}, "cxn:pronoun": {"definition": "a linguistic <a href=\"#def:form\">form</a> that <a href=\"#inf:reference\">refers</a> to an individual via some <a href=\"#sem:contextual\">contextual</a> factor in the <a href=\"#def:speech-act-situation\">speech act situation</a>. <em>Example</em>: <em>I</em> is a pronoun because it refers to a person via the role she is playing in the speech event (namely, speaker). (Section 3.1.1)"}, "cxn:proper-noun": {"definition": "a linguistic <a href=\"#def:form\">form</a> that <a href=\"#inf:reference\">refers</a> to an <a href=\"#sem:token\">individual</a> directly \u2013 that is, it names an individual rather than a <u>category</u>. The term <q>proper name</q> is also used; we will consider these two terms to be synonymous. <em>Example</em>: <em>Bill Croft</em> refers to a particular individual. Note that being a proper noun is a function of a form; one can use the form <em>Bill Croft</em> as a common noun \u2013 for example, to refer to a category of all persons named <q>Bill Croft</q>. (Section 3.1.1)"}, "cxn:property-referring-phrase": {"definition": "a <a href=\"#cxn:construction\">construction</a> that expresses <a href=\"#inf:reference\">reference</a> to <a href=\"#sem:property-concept\">property concepts</a>. <em>Examples</em>: <em>length</em> (&lt; <em>long</em>), <em>happiness</em> (&lt; <em>happy</em>) are examples of the property referring phrase construction. Property reference is very rare in discourse, little described in reference grammars, and little studied in typology, so they are not further discussed here. (Section 2.2.5)"}, "cxn:proportional-quantifier-term": {"definition": "a <a href=\"#def:form\">form</a> that specifies the set of instances as a proportion of the whole set of individuals/tokens of the type, or at least the contextually relevant whole set. <em>Example</em>: in <em>few children</em>, <em>few</em> is a proportional quantifier indicating a lesser proportion of the contextually relevant set of children. (Section 4.1.3)"}, "cxn:propositional-attitude-predicate": {"definition": "the <a href=\"#cxn:predicate\">predicate</a> expressing such a <a href=\"#sem:propositional-attitude-event\">propositional attitude event</a>. <em>Example</em>: in <em>Aram thought that the pianist was very good</em>, the <a href=\"#cxn:complement-taking-predicate\">complement-taking predicate</a> <em>thought</em> denotes a propositional attitude event. (Section 18.2.2)"}, "cxn:protasis-clause": {"definition": "the <a href=\"#cxn:clause\">clause</a> expressing the causally antecedent <a href=\"#sem:proposition\">proposition</a> in a <a href=\"#sem:causal\">causal</a>, <a href=\"#sem:conditional-relation\">conditional</a>, <a href=\"#sem:concessive-relation\">concessive</a>, <a href=\"#cxn:concessive-conditional-construction\">concessive conditional</a>, or <a href=\"#cxn:comparative-conditional-construction\">comparative conditional construction</a>. <em>Example</em>: in <em>If you press this button, the door will open</em>, <em>If you press this button</em> is the protasis; <em>the door will open</em> is the <a href=\"#cxn:apodosis-clause\">apodosis</a>. (Section 17.3.1)"}, "cxn:prototypical-construction": {"definition": "a <a href=\"#cxn:construction\">construction</a> that expresses the most common or <q class=\"dq\">favored</q> (see Section 2.4) combinations of <a href=\"#inf:information-packaging\">information packaging</a> and <a href=\"#sem:meaning\">semantic content</a>. <em>Example</em>: <em>an old violin</em> is an instance of a prototypical <a href=\"#inf:reference\">referring</a> construction: it expresses <a href=\"#inf:reference\">reference</a> to an <a href=\"#sem:object-concept\">object</a>, the most common or <q class=\"dq\">favored</q> type of referent. (Section 2.2.3)"}, "cxn:pursuit-verb": {"definition": "the <a href=\"#cxn:verb\">verb</a> expressing a <a href=\"#sem:pursuit-event\">pursuit event</a>. <em>Examples</em>: pursuit events include following, chasing, searching for something, and waiting for someone/something; and <em>follow</em>, <em>chase</em>, <em>search (for)</em>, and <em>wait (for)</em> are pursuit verbs. (Section 7.3.3)"}, "cxn:quantifier-term": {"definition": "<a href=\"#def:form\">forms</a> that describe the quantity of the <a href=\"#sem:token\">instances</a> of a <a href=\"#sem:type\">type</a>, where the precise cardinality of the set is not specified. Quantifiers include <a href=\"#cxn:vague-numeral\">vague numerals</a>, <a href=\"#cxn:amount-term\">amount terms</a>, <a href=\"#cxn:proportional-quantifier\">proportional quantifiers</a>, and <a href=\"#cxn:distributive-quantifier-term\">distributive quantifiers</a>. (Section 4.1.3)"}, "cxn:question-pronoun": {"definition": "a <a href=\"#cxn:pronoun\">pronoun</a> that expresses a <a href=\"#inf:question-referent\">question referent</a>. (Section 3.5)"}, "cxn:reciprocal-construction": {"definition": "the <a href=\"#cxn:construction\">construction</a> expressing such a <a href=\"#sem:reciprocal\">reciprocal event</a>. <em>Example</em>: in <em>Mary and Sue praised each other</em>, Mary praises Sue and Sue praises Mary. (Section 7.2)"}, "cxn:reference-tracking-construction": {"definition": "a <a href=\"#cxn:construction\">construction</a> that indicates <a href=\"#inf:coreference\">coreference</a> or lack thereof with respect to a referent occurring elsewhere in the discourse, including one occurring elsewhere in the same construction, such as a <a href=\"#cxn:complex-sentence\">complex sentence construction</a>. Coreference may be indicated by <a href=\"#str:zero-anaphora\">zero anaphora</a> as well as by an overt expression. <em>Example</em>: in the discourse passage <em>and there's a man at the top of the ladder, you can't see him yet...</em>, the pronoun <em>him</em> serves to track the referent as recurrence of the man in the second reported event. (Section 16.1)"}, "cxn:referent-expression": {"definition": "the <a href=\"#cxn:head\">head</a> of a <a href=\"#cxn:referring-phrase\">referring phrase</a>, which is not necessarily an <a href=\"#sem:object-concept\">object</a>. <em>Example</em>: in <em>Hiking in the desert is wonderful</em>, <em>hiking</em> is a referent expression. (Section 2.2.4)"}, "cxn:referring-phrase": {"definition": "a <a href=\"#cxn:construction\">construction</a> that performs the act of <a href=\"#inf:reference\">reference</a>. <em>Example</em>: <em>the blue mailboxes</em> is a referring phrase that refers to a group of mailboxes. (Sections 2.2.2, <strong>3.1</strong>)"}, "cxn:reflexive-construction": {"definition": "the <a href=\"#cxn:construction\">construction</a> expressing a <a href=\"#sem:reflexive\">reflexive event</a>. <em>Examples</em>: reflexive events may be direct, when there is no other participant, as in <em>I saw myself</em>; or indirect, when there is another participant in an intermediate position in the <a href=\"#sem:causal-chain\">causal chain</a>, as in <em>Sally baked a cake for herself</em>, whose causal structure is Sally &rarr; cake &rarr; Sally. (Section 7.2)"}, "cxn:relative-clause": {"definition": "the <a href=\"#cxn:dependent-clause\">dependent clause</a> in a <a href=\"#cxn:relative-clause-construction\">relative clause construction</a>. The relative clause denotes the <a href=\"#sem:event\">event</a> that is used to <a href=\"#inf:modification\">modify</a> the <a href=\"#cxn:relative-clause-head\">relative clause head</a> <span class=\"separation\"/> <a href=\"#inf:reference\">referent</a>. <em>Example</em>: in <em>I ate the cheesecake</em> [<em>that Carol baked</em>], <em>that Carol baked</em> is the relative clause. (Section 19.1)"}, "cxn:relative-clause-construction": {"definition": "a <a href=\"#cxn:construction\">construction</a> defined by the function of <a href=\"#inf:modification\">modifying</a> a <a href=\"#inf:reference\">referent</a> with an <a href=\"#sem:action-concept\">action concept</a>. <em>Example</em>: <em>I ate the cheesecake</em> [<em>that Carol baked</em>] is an instance of a relative clause construction: <em>that Carol baked</em> is the <a href=\"#cxn:relative-clause\">relative clause</a> (indicated by brackets), <em>the cheesecake</em> is the <a href=\"#cxn:relative-clause-head\">relative clause head</a>, and <em>I ate the cheesecake</em> is the <a href=\"#cxn:matrix-clause\">matrix clause</a>. There are a wide variety of strategies used for relative clauses, including <a href=\"#str:externally-headed\">externally headed</a>, <a href=\"#str:internally-headed-strategy\">internally headed</a>, <a href=\"#str:adjoined-strategy\">adjoined</a>, <a href=\"#str:correlative-strategy\">correlative</a>, <a href=\"#str:noun-modifying-clause-strategy\">noun-modifying clause</a> and <a href=\"#str:verb-coding-strategy\">verb-coding</a>, as well as <a href=\"#str:participle\">participles</a>. (Sections 2.2.5, <strong>19.1</strong>)"}, "cxn:relative-clause-head": {"definition": "the <a href=\"#cxn:referring-phrase\">referring phrase</a> that denotes the <a href=\"#sem:necessary-participant-sharing\">necessarily shared participant</a> in a <a href=\"#cxn:relative-clause-construction\">relative clause construction</a> \u2013 that is, the <a href=\"#sem:participant-role\">participant</a> that plays a <a href=\"#sem:semantic-role\">semantic role</a> in both the <a href=\"#sem:event\">event</a> denoted by the <a href=\"#cxn:relative-clause\">relative clause</a> and the event denoted by the <a href=\"#cxn:matrix-clause\">matrix clause</a>. <em>Example</em>: in <em>I ate the cheesecake</em> [<em>that Carol baked</em>], <em>the cheesecake</em> is the relative clause head. The relative clause head is an <a href=\"#inf:reference\">argument</a> of the matrix clause predicate, and is <a href=\"#inf:modification\">modified</a> by the relative clause. (Section 19.1)"}, "cxn:removal-verb": {"definition": "the <a href=\"#cxn:verb\">verb</a> expressing a <a href=\"#sem:removal-event\">removal event</a>. <em>Example</em>: scrubbing is a removal event, and <em>scrub</em> is a removal verb. (Section 7.3.2)"}, "cxn:response-construction": {"definition": "the <a href=\"#cxn:construction\">construction</a> expressing an <a href=\"#inf:response\">answer</a> <span class=\"separation\"/> <a href=\"#def:function\">function</a>. Like interrogatives, responses are divided into <a href=\"#cxn:polarity-response-construction\">polarity responses</a> and <a href=\"#cxn:information-question-response-construction\">information (question) responses</a>."}, "cxn:result-verb": {"definition": "the <a href=\"#cxn:verb\">verb</a> expressing a <a href=\"#sem:result-profile\">result event</a>. <em>Example</em>: in <em>Peter broke the window</em>, the event is described in terms of the result state that is reached (a broken window). (Section 7.3.2)"}, "cxn:resultative-complex-predicate": {"definition": "a <a href=\"#cxn:stative-complex-predicate\">stative complex predicate</a> in which the <a href=\"#sem:stative\">stative component</a> of the <a href=\"#cxn:complex-predicate\">complex predicate</a> describes a <a href=\"#sem:state\">state</a> that results from the performance of the <a href=\"#sem:event\">event</a> denoted by the main <a href=\"#cxn:predicate\">predicate</a>. Hence, the stative event temporally follows the main predicate event. A resultative complex predicate is <a href=\"#sem:participant-oriented\">participant-oriented</a>. <em>Example</em>: in English <em>We painted the door red, painted...red</em> is a resultative complex predicate, and <em>red</em> describes the result state of a <a href=\"#sem:participant-role\">participant</a>, the door, after the painting event is done. (Section 14.1)"}, "cxn:second-person-pronoun": {"definition": "a <a href=\"#cxn:personal-pronoun\">personal pronoun</a> used for <a href=\"#sem:contextual\">contextual</a> <span class=\"separation\"/> <a href=\"#inf:reference\">reference</a> to a person in their role as addressee. The term is conventionally used also to refer to a group of persons, one of whom is the addressee, as long as the group does not also include the speaker; if the speaker is included, then the pronoun is a <a href=\"#cxn:first-person-pronoun\">first person pronoun</a>. <em>Example</em>: <em>you</em> is a second person pronoun, referring to the addressee, or a group including the addressee but not the speaker. (Section 3.1.1)"}, "cxn:semantically-nonspecific-article": {"definition": "an <a href=\"#cxn:article\">article</a> that is used for a <a href=\"#inf:nonspecific-referent\">nonspecific referent</a>. (Section 3.5)"}, "cxn:semantically-nonspecific-pronoun": {"definition": "a <a href=\"#cxn:pronoun\">pronoun</a> that expresses a <a href=\"#inf:nonspecific-referent\">nonspecific referent</a>. (Section 3.5)"}, "cxn:sensation-verb": {"definition": "a <a href=\"#cxn:verb\">verb</a> that expresses a <a href=\"#sem:sensation-event\">sensation event</a>. <em>Example</em>: <em>My head aches</em> is an example of a sensation event, and <em>ache</em> is the sensation verb. (Section 7.4)"}, "cxn:set-member-term": {"definition": "a <a href=\"#def:form\">form</a> that specifies a member or members of a designated set, usually previously presented in the discourse or inferrable from it, which has some sort of ordering. <em>Example</em>: in <em>the next question</em>, <em>next</em> is a set-member term. Other set-member terms include <em>last</em>, <em>another, (the) other</em>, and the <a href=\"#cxn:ordinal-numeral\">ordinal numerals</a>. (Section 4.1.3)"}, "cxn:shape-term": {"definition": "a <a href=\"#cxn:modifier\">modifier</a> expressing a concept of physical shape or form. <em>Example</em>: <em>round</em> is an English shape term. (Section 4.1.2)"}, "cxn:species-term": {"definition": "a <a href=\"#cxn:mensural-term\">mensural term</a> that selects a subtype or variety of the <a href=\"#inf:reference\">referent</a> category. <em>Example</em>: in <em>many flavors of ice cream, flavor(s)</em> is a species term. (Section 4.1.3)"}, "cxn:specific-known-pronoun": {"definition": "a <a href=\"#cxn:pronoun\">pronoun</a> that expresses a <a href=\"#inf:specific-known-referent\">specific known referent</a>. <em>Example</em>: if <em>Masha met with someone near the university</em> is used in a context where the speaker knows the identity of the person Masha met, then <em>someone</em> is a specific known pronoun expressing a specific known referent. (Section 3.5)"}, "cxn:specific-unknown-pronoun": {"definition": "a <a href=\"#cxn:pronoun\">pronoun</a> that expresses a <a href=\"#inf:specific-unknown-referent\">specific unknown referent</a>. <em>Example</em>: if <em>Masha met with somebody near the university</em> is used in a context where the speaker does not know the identity of the person Masha met, then <em>somebody</em> is a specific unknown pronoun expressing a specific unknown referent. (Section 3.5)"}, "cxn:speech-act-construction": {"definition": "the <a href=\"#cxn:construction\">constructions</a> used to express <a href=\"#inf:speech-acts\">speech acts</a> functions. (Section 12.1)"}, "cxn:spontaneous-verb": {"definition": "the <a href=\"#cxn:verb\">verb</a> expressing a <a href=\"#sem:spontaneous\">spontaneous event</a>. <em>Examples</em>: dying and melting are spontaneous events, and <em>die</em> and <em>melt</em> are spontaneous event verbs. (Sections 6.3.4, 7.2)"}, "cxn:stative-complex-predicate": {"definition": "a <a href=\"#cxn:complex-predicate\">complex predicate</a> in which one <a href=\"#cxn:element\">element</a> of the complex predicate denotes a <u>process</u> but the other element of the complex predicate denotes a <a href=\"#sem:state\">state</a> somehow associated with the process. Stative complex predicates are divided into <a href=\"#cxn:resultative-complex-predicate\">resultative complex predicates</a>, <a href=\"#cxn:depictive-complex-predicate\">depictive complex predicates</a>, and <a href=\"#cxn:manner-complex-predicate\">manner complex predicates</a>; manner complex predicates include <a href=\"#str:ideophones\">ideophones</a> when they are a part of a complex predicate. (Sections 13.1.2, 14.1)"}, "cxn:subject-identity-construction": {"definition": "a <a href=\"#cxn:complex-sentence\">complex sentence construction</a> in which the <a href=\"#cxn:subject-phrase\">subject</a> <span class=\"separation\"/> <a href=\"#inf:reference\">referents</a> in the two <a href=\"#cxn:clause\">clauses</a> are <a href=\"#inf:coreference\">coreferential</a>. <em>Example</em>: <em>Sumie patted the dog and hit the cat</em> is an instance of a subject identity <a href=\"#cxn:coordinate-clause-construction\">coordinate clause construction</a> \u2013 the subject referent for both <em>patted the dog</em> and <em>hit the cat</em> is Sumie. (Section 16.5)"}, "cxn:subject-phrase": {"definition": "the <a href=\"#cxn:argument-phrase\">argument phrase</a> expressing the <a href=\"#inf:high-topicality\">most salient</a> <span class=\"separation\"/> <a href=\"#inf:reference\">referent</a> in an <a href=\"#cxn:clause\">argument structure construction</a>. <em>Example</em>: in <em>Emily slept</em> and <em>Emily read the paper</em>, <em>Emily</em> is the subject. (Sections 6.1.1, <strong>6.3.2</strong>)"}, "cxn:subordinate-clause": {"definition": "a <a href=\"#cxn:clause\">clause</a> that is not <a href=\"#inf:pragmatic-assertion\">pragmatically asserted</a>, in contrast to a <a href=\"#cxn:main-clause\">main clause</a>. <em>Example</em>: in <em>She watered the plants before she ate lunch</em>, the clause <em>before she ate lunch</em> is a subordinate clause. A subordinate clause is typically also a <a href=\"#cxn:dependent-clause\">dependent clause</a>, but a <a href=\"#cxn:matrix-clause\">matrix clause</a> may be a subordinate clause (for example, if it is dependent on a third clause), and a dependent clause may be pragmatically asserted, i.e. function as a main clause. (Section 15.1.2)"}, "cxn:superlative-form": {"definition": "the most extreme value on a <a href=\"#sem:property-concept\">property</a> scale for the relevant referents. <em>Example</em>: in <em>most expensive</em>, <em>most</em> indicates the highest value on the expensiveness scale for the relevant set of objects. (Section 4.1.2)"}, "cxn:support-verb": {"definition": "the <a href=\"#cxn:element\">element</a> in a <a href=\"#cxn:support-verb-construction\">support verb construction</a> that has undergone semantic change \u2013 specifically, semantic generalization \u2013 such that it makes a minimal semantic contribution to the <a href=\"#sem:meaning\">meaning</a> of the whole <a href=\"#cxn:complex-predicate\">complex predicate</a>. <em>Example</em>: in English <em>They had a drink, had</em> is the support verb in the support verb construction <em>had a drink</em>. <a href=\"#str:copula\">Copulas</a> are analyzed as a subtype of a support verb. (Section 13.5)"}, "cxn:support-verb-construction": {"definition": "an <a href=\"#cxn:eventive-complex-predicate\">eventive complex predicate</a> in which one of the <a href=\"#cxn:element\">elements</a>, the <a href=\"#cxn:support-verb\">support verb</a>, has undergone semantic change \u2013 specifically, semantic generalization \u2013 such that it makes a minimal semantic contribution to the <a href=\"#sem:meaning\">meaning</a> of the whole <a href=\"#cxn:complex-predicate\">complex predicate</a>. This element no longer denotes a separate subevent of the whole <a href=\"#sem:event\">event</a>, unlike in <u>basic</u> <a href=\"#cxn:eventive-complex-predicate\">eventive complex predicates</a>. The <a href=\"#cxn:verb\">verb</a> <span class=\"separation\"/> <a href=\"#def:form\">forms</a> in a support verb construction are also in a relatively idiosyncratic semantic relationship. <em>Example</em>: in English <em>Frances Patterson underwent an operation at RMH today</em>, <em>underwent an operation</em> is an instance of a support verb construction. The element other than the support verb is often in an <a href=\"#str:action-nominal\">action nominal</a> or other form that is unlike the form of a simple (<a href=\"#cxn:predicate\">predicated</a>) verb. (Section 13.5)"}, "cxn:temporary-predicate": {"definition": "the <a href=\"#cxn:predicate\">predicates</a> that express the class of <a href=\"#sem:state\">temporary state</a> events. <em>Example</em>: being sick is a temporary state, and <em>(be) sick</em> is a temporary state predicate. (Section 6.3.3)"}, "cxn:thetic-construction": {"definition": "the <a href=\"#cxn:construction\">construction</a> that expresses a <a href=\"#inf:thetic\">thetic</a> information packaging. <em>Example</em>: <em>TRUMP was elected!</em> (with accent on <em>Trump</em>), uttered on November 9, 2016, is thetic, in that this information is expressed as all new \u2013 in this case because it was unexpected at the time. (Sections 10.1.2, 11.1, <strong>11.3.1</strong>)"}, "cxn:third-person-pronoun": {"definition": "a <a href=\"#cxn:personal-pronoun\">personal pronoun</a> used for <a href=\"#sem:contextual\">contextual</a> <span class=\"separation\"/> <a href=\"#inf:reference\">reference</a> to a person that is neither the speaker nor an addressee, or group of persons that does not include the speaker or addressee. <em>Example</em>: <em>they</em> is a third person pronoun, referring to a group, none of whom is the speaker or the addressee. (Section 3.1.1)"}, "cxn:topic-comment-construction": {"definition": "the <a href=\"#cxn:construction\">construction</a> that expresses a <a href=\"#inf:topic-comment\">topic\u2013comment</a> information packaging. <em>Example</em>: <em>The bus stopped</em> is an instance of a topic\u2013comment construction in which <em>stopped</em> is the comment and <em>The bus</em> is the topic. (Sections 2.2.2, 10.1.2, 11.1, <strong>11.2.1</strong>)"}, "cxn:topic-phrase": {"definition": "a <a href=\"#cxn:referring-phrase\">referring phrase</a> that refers to the <a href=\"#inf:reference\">topic</a>, usually applied to a phrase that is distinct in <a href=\"#def:form\">form</a> and <a href=\"#def:role\">role</a> from the subject phrase. <em>Example</em>: in Japanese <em>Nihon wa syuto ga sumiyoi</em> <q>As for Japan, its capital is a good place to live</q>, <em>Nihon wa</em> [Japan <span class=\"sc\">top</span>] is a topic phrase marked by the topic marker <em>wa</em>."}, "cxn:transfer-verb": {"definition": "a <a href=\"#cxn:verb\">verb</a> that expresses a <a href=\"#sem:transfer-of-possession-event\">transfer event</a>. <em>Examples</em>: giving and sending are physical transfer events (and <em>give</em> and <em>send</em> are transfer verbs), and showing and telling are <q class=\"dq\">mental transfer</q> events (and <em>show</em> and <em>tell</em> are <q class=\"dq\">mental transfer</q> verbs). (Section 7.5.1)"}, "cxn:transitive-construction": {"definition": "the <a href=\"#cxn:construction\">construction</a> used to express the <a href=\"#sem:agent\">agent</a> (<a href=\"#sem:a-role\">A role</a>) and the <a href=\"#sem:patient\">patient</a> (<a href=\"#sem:p-role\">P role</a>) of the <a href=\"#cxn:predicate\">predicated</a> <span class=\"separation\"/> <a href=\"#sem:bivalent\">bivalent</a> breaking <a href=\"#sem:event\">event</a> when the agent is more <a href=\"#inf:topicality\">salient</a> than the patient and the breaking event is a single, completed event. <em>Example</em>: <em>Jack broke the window</em> is an instance of the exemplar (the single <q class=\"dq\">most prototypical</q> example) of the transitive construction. (Sections 6.1.2, <strong>6.2.1</strong>, <strong>7.3.3</strong>)"}, "cxn:typifying-construction": {"definition": "a <a href=\"#cxn:nominal-modification-construction\">nominal modification construction</a> that is not an <a href=\"#cxn:anchoring-construction\">anchoring construction</a>, in that the <a href=\"#sem:object-concept\">object</a> <span class=\"separation\"/> <a href=\"#cxn:modifier\">modifier</a> is only <a href=\"#inf:type-identifiable\">type identifiable</a>, the modifier\u2013head combination refers to a subclass of a broader class, and the head cannot be identified via its relation to the modifier. <em>Example</em>: <em>women's magazine</em> is an instance of a typifying construction: <em>women</em> does not refer to a specific set of women; the phrase as a whole denotes a particular subclass of magazines; and the referent of <em>magazine</em> cannot be identified by the modifier <em>women's</em>. (Section 5.2.1)"}, "cxn:uncontrolled-predicate": {"definition": "the <a href=\"#cxn:predicate\">predicates</a> that express the class of <a href=\"#sem:uncontrolled\">uncontrolled activity</a> events. <em>Example</em>: dying is an uncontrolled activity, and <em>die</em> is an uncontrolled activity predicate. (Section 6.3.3)"}, "cxn:universal-pronoun": {"definition": "universal pronouns express when the <a href=\"#inf:predication\">predication</a> applies to all <a href=\"#inf:reference\">referents</a> in a set determined by the type description provided by the pronoun. <em>Example</em>: <em>Everyone left the room</em> predicates of all members of a contextually determined set of people (indicated by <em>-one</em>) that they left the room. (Section 3.5)"}, "cxn:utterance-predicate": {"definition": "the <a href=\"#cxn:predicate\">predicate</a> expressing an <a href=\"#sem:utterance-event\">utterance event</a>. <em>Example</em>: in <em>Sandy said, <q class=\"dq\">I'm buying the house</q>, said</em> denotes the utterance event. Some predicates denoting utterance events include the <u>addressee</u> as an <a href=\"#inf:reference\">argument</a>, as in <em>Sandy told me that she's buying the house</em>. (Section 18.2.2)"}, "cxn:vague-numeral-term": {"definition": "a <a href=\"#def:form\">form</a> used to select a set of countable entities, but not by their precise cardinality. Example: in <em>several ravens, several</em> is a vague numeral. (Section 4.1.3)"}, "cxn:value-term": {"definition": "a <a href=\"#cxn:modifier\">modifier</a> expressing a concept of value or quality. <em>Examples</em>: <em>good</em> and <em>bad</em> are English value terms. (Section 4.1.2)"}, "cxn:verb": {"definition": "the <a href=\"#cxn:head\">head</a> of a <a href=\"#cxn:verbal-clause\">verbal clause</a> \u2013 that is, a <a href=\"#cxn:clause\">clause</a> that denotes an <a href=\"#sem:action-concept\">action</a>. <em>Example</em>: the word <em>jumped</em> in the clause <em>She jumped</em>, is a verb \u2013 it is an action word that is the head of the clause and is predicated of <em>She</em>. (Sections 2.2.3, 6.1.1)"}, "cxn:verbal-clause": {"definition": "a <a href=\"#cxn:clause\">clause</a> whose <a href=\"#cxn:head\">head</a> denotes an <a href=\"#sem:action-concept\">action concept</a>. <em>Example</em>: <em>She popped the balloon</em> is a verbal clause; the head <em>popped</em> denotes an action concept. A verbal clause is the prototypical clause, and its head is a <a href=\"#cxn:verb\">verb</a>. (Section 2.2.3)"}, "cxn:wishing-predicate": {"definition": "the <a href=\"#cxn:predicate\">predicate</a> expressing a <a href=\"#sem:wishing-event\">wishing event</a>. <em>Example</em>: in <em>Jill wishes that Joe had won the election</em>, the wishing predicate <em>wishes</em> expresses Jill's evaluation of Joe's winning the election, and also presupposes that the speaker believes that Joe didn't win the election. (Section 18.2.2)"}, "def:accessibility-hierarchy": {"definition": "an implicational hierarchy that governs universals of the distribution of <a href=\"#cxn:relative-clause-construction\">relative clause constructions</a> and particular <a href=\"#str:strategy\">strategies</a> of relative clause constructions, depending on the <a href=\"#sem:semantic-role\">semantic role</a> that the <a href=\"#cxn:relative-clause-head\">relative clause head</a> plays in the <a href=\"#sem:event\">event</a> denoted by the <a href=\"#cxn:relative-clause\">relative clause</a>. The Accessibility Hierarchy is usually formulated as: <a href=\"#cxn:subject-phrase\">subject</a> (<a href=\"#sem:a-role\">A</a>/<a href=\"#sem:s-role\">S</a>) &lt; <a href=\"#inf:object-argument\">object</a> (<a href=\"#sem:p-role\">P</a>/<a href=\"#sem:theme\">T</a>) &lt; <a href=\"#str:indirect-object-category\">indirect object</a> (<a href=\"#sem:recipient\">G</a>), <a href=\"#cxn:oblique-phrase\">oblique</a> &lt; (<a href=\"#cxn:attributive-phrase\">attributive</a>) <a href=\"#sem:possessor\">possessor</a>. All languages have a relative clause construction that can relativize the <a href=\"#cxn:subject-phrase\">subject</a>; a specific construction is used for a continuous segment of the hierarchy; <a href=\"#str:deranking\">deranked</a> relative clauses are used for the top part of the hierarchy downwards; less explicit relative clause strategies are used for the top part of the hierarchy downwards; and more <a href=\"#def:explicitness\">explicit</a> relative clause strategies are used for the bottom part of the hierarchy upwards. (Section 19.3)"}, "def:accessibility-scale": {"definition": "an ordering of types of <a href=\"#cxn:referring-phrase\">referring phrases</a> by their degree of <a href=\"#inf:accessibility\">accessibility</a>. The Accessibility Scale accommodates the fact that referring phrases may provide a more fine-grained set of <a href=\"#inf:information-status\">information status</a> distinctions than the common three-way classification of <a href=\"#inf:active-referent\">active</a>, <a href=\"#inf:semi-active-referent\">semi-active</a>, and <a href=\"#inf:inactive-referent\">inactive</a>. (Section 3.3.1)"}, "def:adjunct": {"definition": "a term that is sometimes used for an <a href=\"#cxn:oblique-phrase\">oblique argument phrase</a> denoting certain <a href=\"#sem:participant-role\">participants</a> that are more <a href=\"#sem:peripheral-participant\">peripheral</a> than other participants denoted by oblique phrases, and which is therefore syntactically <q class=\"dq\">optional</q>. Semantically, there is no clear division between peripheral participants that motivates an (oblique) argument / adjunct distinction. Also, the phrases expressing even central participants that are highly <a href=\"#inf:topicality\">salient</a> may be morphosyntactically <q class=\"dq\">optional</q>, as is found with <a href=\"#str:zero-anaphora\">zero anaphora</a>. There is no clear comparative concept of <q>adjunct</q>, and the term is not used in this textbook."}, "def:agreement-hierarchy": {"definition": "a typological universal that constrains the <q class=\"dq\">mismatches</q> that occur in the grammatical categories (typically, <a href=\"#sem:number\">number</a> and <a href=\"#sem:gender-class\">gender\u2013class</a>) of a <a href=\"#cxn:pronoun\">pronoun</a> or <a href=\"#str:index\">index</a> and the grammatical categories of a prior <a href=\"#cxn:referring-phrase\">referring phrase</a> that <a href=\"#inf:reference\">refers</a> to the same <a href=\"#inf:reference\">referent</a> as the pronoun or index. The Agreement Hierarchy ranks the constructions as follows: <a href=\"#cxn:modifier\">modifier</a> index &lt; <a href=\"#cxn:predicate\">predicate</a> index &lt; <a href=\"#str:relative-pronoun-strategy\">relative pronoun</a> &lt; <a href=\"#cxn:personal-pronoun\">personal pronoun</a>. <em>Example</em>: in British English, in <em>this committee</em>, the modifier <em>this</em> must index the committee as a singular, but a following personal pronoun may index the committee as a singular <em>...It...</em> or as a plural <em>...They...</em>, indicating that the committee is a group. The personal pronoun is lower on the Agreement Hierarchy, and therefore is more likely to index a <q class=\"dq\">semantic</q> value (plural) that is not overtly encoded on the noun. (Section 4.4.4)"}, "def:animacy-hierarchy": {"definition": "a ranking of entities from human to (nonhuman) animate to inanimate, such that humans are <q class=\"dq\">highest</q> on the hierarchy. The ranking is presumed to represent the <a href=\"#inf:topicality\">salience</a> of the entity to persons, or possibly the empathy we have toward the entity. (Section 3.1.2)"}, "def:behavioral-potential": {"definition": "the ability of a form in a construction to take the inflections or other grammatical <a href=\"#cxn:element\">elements</a> characteristic of a construction. <em>Example</em>: the noun <em>tree</em> in a referring expression <em>the huge trees</em> has the behavioral potential of inflecting for number (singular and plural) and taking an article (<em>a</em> or <em>the</em>). (Sections 2.4, <strong>2.5</strong>)"}, "def:binding-hierarchy": {"definition": "an implicational hierarchy of <a href=\"#sem:event\">events</a> that have other events as <a href=\"#sem:participant-role\">participants</a> (the <a href=\"#cxn:complement\">complement</a> events), which appears to govern a wide range of strategies for <a href=\"#cxn:complement-clause-construction\">complement clause constructions</a>, including <a href=\"#str:balancing\">balancing</a> vs. <a href=\"#str:deranking\">deranking</a> (Section 18.3.1), the <a href=\"#def:grammaticalization\">grammaticalization</a> of <a href=\"#sem:purpose\">purpose</a> <span class=\"separation\"/> <a href=\"#cxn:adverbial-clause-construction\">adverbial clauses</a> into deranked <a href=\"#cxn:complement\">complements</a> (Section 18.3.2), the expression of the participants of the <a href=\"#cxn:complement-taking-predicate\">complement-taking predicate</a> and complement events (Section 18.4.1), and the use of <a href=\"#cxn:logophoric-construction\">logophoric constructions</a> (Section 18.4.2). The Binding Hierarchy is described in detail in Giv\u00f3n (1980) and Cristofaro (2003); the latter calls it the Complement Deranking \u2013 Argument Hierarchy. The version used here is a slightly revised version of Cristofaro's hierarchy: <a href=\"#sem:utterance-event\">utterance</a>, <a href=\"#sem:propositional-attitude-event\">propositional attitude</a>, <a href=\"#sem:knowledge-event\">knowledge</a> &lt; <a href=\"#sem:evaluative-event\">evaluative</a>, <a href=\"#sem:perception-event\">perception</a> &lt; <a href=\"#sem:desiderative-event\">desiderative</a>, <a href=\"#sem:manipulative-event\">manipulative</a> &lt; <a href=\"#sem:modality\">modal</a>, <a href=\"#sem:phasal-aspect\">phasal</a>. (Section 18.3.1)"}, "def:comparative-concept": {"definition": "a concept that can be used to compare the <a href=\"#def:morphosyntax\">morphosyntactic</a> structure of different languages. <em>Example</em>: a good example of a comparative concept that can easily be defined on a crosslinguistically valid basis is one based on a <a href=\"#def:semantic-classes\">semantic class</a>, such as words referring to humans. Other examples of comparative concepts are those based on an <a href=\"#inf:information-packaging\">information packaging</a> function; <a href=\"#cxn:construction\">constructions</a> (in the specific sense); and <a href=\"#str:strategy\">strategies</a>. (Section 1.4)"}, "def:conceptual-space": {"definition": "an underlying network of semantic relationships among functions that are <a href=\"#str:co-expression\">co-expressed</a> across the world's languages. The conceptual space represents a universal pattern in the <a href=\"#def:semantic-map-model\">semantic map model</a>. (Section 3.5)"}, "def:construction-grammar": {"definition": "a model of morphosyntax in which the basic unit of grammatical analysis is a <a href=\"#cxn:construction\">construction</a>. (Section 1.1)"}, "def:crosslinguistically-valid": {"definition": "a property of a construction (in the general sense) that can be defined across languages independently of any language-specific categories. <em>Example</em>: relative word order of <a href=\"#cxn:adjective\">adjective</a> and <a href=\"#cxn:noun\">noun</a> is a crosslinguistically valid property, depending only on the order in which the adjective and noun are uttered. (Section 1.4)"}, "def:cumulation": {"definition": "the expression of multiple <q class=\"dq\">grammatical</q> (not lexical) <a href=\"#sem:meaning\">meanings</a> in a single morpheme. <em>Example</em>: English <em>-s</em> in <em>She sing-s</em> cumulates third <a href=\"#sem:person\">person</a>, singular <a href=\"#sem:number\">number</a>, and present <a href=\"#sem:tense\">tense</a> in a single morpheme. (Sections 1.6, 4.4.1)"}, "def:explicitness": {"definition": "the property of <a href=\"#cxn:relative-clause-construction\">relative clause construction</a> <span class=\"separation\"/> <a href=\"#str:strategy\">strategies</a> that refers to how explicitly the strategy encodes the <a href=\"#sem:semantic-role\">semantic role</a> of the <u>shared participant</u> in the <a href=\"#sem:event\">event</a> denoted by the <a href=\"#cxn:relative-clause\">relative clause</a>. For example, the <a href=\"#str:pronoun-retention-strategy\">pronoun-retention strategy</a> is more explicit than the <a href=\"#str:gap-strategy\">gap strategy</a> because the former strategy overtly encodes the semantic role of the participant in the relative clause event via the retained <a href=\"#cxn:pronoun\">pronoun</a>, whereas the latter strategy does not encode the semantic role at all. Explicitness plays a role in determining the distribution of relative clause strategies with respect to the <a href=\"#def:accessibility-hierarchy\">Accessibility Hierarchy</a>. (Section 19.3)"}, "def:extended-animacy-hierarchy": {"definition": "a ranking of entities including <a href=\"#sem:contextual\">contextually</a> defined and <a href=\"#sem:token\">individually</a> defined entities as well as <u>categories</u> of entities. The Extended Animacy Hierarchy is given below, with the construction for each position on the hierarchy given in square brackets: first/second person [<a href=\"#cxn:pronoun\">pronoun</a>] &lt; third person [<a href=\"#cxn:pronoun\">pronoun</a>] &lt; <a href=\"#sem:token\">individual</a> [<a href=\"#cxn:proper-noun\">proper noun</a>] &lt; <a href=\"#sem:human\">human</a> [<a href=\"#cxn:common-noun\">common noun</a>] &lt; (nonhuman) <a href=\"#sem:animate\">animate</a> [common noun] &lt; <a href=\"#sem:inanimate\">inanimate</a> [common noun]. The Extended Animacy Hierarchy figures in many grammatical phenomena. (Section 3.1.2)"}, "def:false-cumulation": {"definition": "the translation of an <a href=\"#def:object-language\">object language</a> morpheme by more than one English word because English lacks a one-word translation. Example: Spanish <em>buscar</em> must be translated into English as <q>look for</q>. In an <a href=\"#def:interlinear-morpheme-translation\">interlinear morpheme translation</a> the English combination is ideally notated look_for. (Section 1.6)"}, "def:file-metaphor": {"definition": "a metaphor used by linguists from different theoretical traditions to describe the <a href=\"#inf:major-propositional-act\">propositional act information packaging</a> functions. The metaphor is based on the notion of a file in which information about <a href=\"#inf:reference\">referents</a> is stored. (Sections 2.1, 10.1.2)"}, "def:form": {"definition": "the <a href=\"#def:morphosyntax\">morphosyntactic</a> structure of a <a href=\"#cxn:construction\">construction</a>. (Section 1.1)"}, "def:function": {"definition": "the combination of <a href=\"#sem:meaning\">meaning</a> and <a href=\"#inf:information-packaging\">information packaging</a> conveyed by a <a href=\"#cxn:construction\">construction</a>. <em>Example</em>: the numeral modification construction illustrated by <em>three tree-s</em> combines the meanings of an object, or more precisely a group of objects (trees), and the cardinality of the group (three), packaged as referring to the (group of) trees and adding information about the group of trees \u2013 namely, that its cardinality is three. Another use of the term <q>function</q> is to refer to a <a href=\"#def:role\">role</a> in a construction. (Section 1.1)"}, "def:functionalism": {"definition": "an approach to the study of language that seeks explanations of language structure in the function of language in communicative interaction. This textbook takes a functionalist approach. (Section 1.1)"}, "def:grammaticalization": {"definition": "the process by which new grammatical <a href=\"#cxn:construction\">constructions</a> emerge from novel and specialized uses of other grammatical constructions; once a grammatical construction acquires a novel, specialized <a href=\"#def:function\">function</a>, it eventually undergoes changes in <a href=\"#def:morphosyntax\">morphosyntactic</a> structure and scope, and often also phonetic form. <em>Example</em>: <em>a kind of</em> originally expressed a type of <a href=\"#sem:object-concept\">object</a>, then shifted <a href=\"#sem:meaning\">meaning</a> to become a hedging phrase for a less-central member of a category, was extended to describe hedging of a <a href=\"#sem:property-concept\">property</a> word (<em>kind of cute</em>), and was phonetically reduced to <em>kinda</em>. (Sections 1.1, <strong>2.3</strong>)"}, "def:identity-statements": {"definition": "a superordinate category sometimes used to cover both <a href=\"#inf:equational\">equational</a> and <a href=\"#inf:presentational\">presentational information packaging</a>. (Section 10.1.2)"}, "def:interlinear-morpheme-translation": {"definition": "a widely used method to describe the <a href=\"#def:morphosyntax\">morphosyntactic</a> structure of a language by providing a morpheme-by-morpheme translation of the <a href=\"#def:object-language\">object language</a>, including abbreviations for morphemes expressing <q class=\"dq\">grammatical</q> functions, and including notation of the morpheme type (affix, clitic, reduplication, etc.). (Section 1.6)"}, "def:lexicalization": {"definition": "the diachronic process by which a complex <a href=\"#def:morphosyntax\">morphosyntactic</a> structure develops an idiosyncratic <a href=\"#sem:meaning\">meaning</a>, and so comes to form one unit, in the sense of a pairing of a <a href=\"#def:form\">form</a> and a unitary, unanalyzable meaning. <em>Example</em>: the English phrase <em>jack-in-the-pulpit</em> has lexicalized to denote a particular species of plant. There is usually an earlier stage where the <a href=\"#cxn:element\">elements</a> of the <a href=\"#cxn:complex-predicate\">complex predicate</a> have an identifiable meaning, even if the meaning of the whole is idiosyncratic. For example <em>red-winged blackbird</em> describes a specific species of bird, but the phrase is partially analyzable in that the bird is mostly black but has a patch of red on its wings. A lexicalized structure may come to be fixed in the order of its elements, and altered or reduced in form, for example the farewell <em>goodbye</em> which originated in the phrase <em>God be with ye</em> (and has now been further reduced to <em>bye</em>). (Sections 13.1.2, 13.4)"}, "def:metalanguage": {"definition": "the language used for the free translation of an object language example. The free translation is intended to express the <a href=\"#sem:meaning\">meaning</a> of the object language example. However, in the absence of a theoretical language to describe the components of sentence meaning, linguists use another language, the language of the text (in our case, English), as the metalanguage. (Section 1.6)"}, "def:modification-predication-continuum": {"definition": "a continuum of <a href=\"#inf:information-packaging\">information packaging</a> functions from prototypical <a href=\"#inf:modification\">modification</a> \u2013 that is, <a href=\"#inf:restrictive-modification\">restrictive modification</a> \u2013 to prototypical <a href=\"#inf:predication\">predication</a>. The intermediate functions in this continuum are identified as (roughly, from most modifier-like to most predicate-like) <a href=\"#inf:appositive-modification\">appositive</a>, <a href=\"#inf:complementative\">complementative</a>, <a href=\"#cxn:depictive-complex-predicate\">depictive</a>, <a href=\"#cxn:resultative-complex-predicate\">resultative</a>, and <a href=\"#sem:manner\">manner</a>. (Section 14.3)"}, "def:modification-reference-continuum": {"definition": "a continuum of <a href=\"#inf:modification\">modification</a> from <a href=\"#inf:situating\">anchoring</a> <span class=\"separation\"/> <a href=\"#cxn:nominal-modification-construction\">nominal modifier constructions</a>, to <a href=\"#cxn:typifying-construction\">non-anchoring</a> <span class=\"separation\"/> <a href=\"#cxn:nominal-modification-construction\">nominal modifier constructions</a>, to <a href=\"#sem:property-concept\">property</a> <span class=\"separation\"/> <a href=\"#inf:modification\">modification</a> and <a href=\"#inf:selecting\">selecting</a> <span class=\"separation\"/> <a href=\"#inf:modification\">modification</a>, to a unitary <a href=\"#cxn:referent-expression\">referent expression</a> (such as a <a href=\"#cxn:binominal-lexeme\">binominal lexeme</a>) formed etymologically from distinct <a href=\"#inf:modification\">modifying</a> and <a href=\"#inf:reference\">referring</a> concepts. (Section 5.2.4)"}, "def:morphology": {"definition": "the analysis of the internal structure of words. <em>Example</em>: in <em>walk-ed</em>, the word has been analyzed into the verb root <em>walk</em> and the past tense suffix <em>-ed</em>. (Section 1.1)"}, "def:morphosyntax": {"definition": "the analysis of the internal structure of utterances, both above the word level and below it. <em>Example</em>: <em>three tree-s</em> is analyzed as the numeral modifier <em>three</em> combined with the head <em>tree-s</em>, which is made of the root <em>tree</em> and the plural suffix <em>-s</em>. (Section 1.1)"}, "def:object-language": {"definition": "in an example presented with an <a href=\"#def:interlinear-morpheme-translation\">interlinear morpheme translation</a>, the language that is the object of grammatical analysis, and hence the language of the example being analyzed. (Section 1.6)"}, "def:ontological-categories": {"definition": "very broad semantic categories that play a role in distinguishing different types of pronouns and determiners. <em>Examples</em>: the ontological categories include: person, thing, place, time, quantity, and manner (this is not an exhaustive list). (Section 3.1.3)"}, "def:ontology": {"definition": "a classification of concepts into their <a href=\"#def:semantic-classes\">semantic classes</a> or categories. (Section 2.1)"}, "def:particularizing": {"definition": "the process in the <a href=\"#def:verbalization\">verbalization of experience</a> in which a <a href=\"#cxn:common-noun\">common noun</a>, which denotes a semantic <u>category</u>, is used to refer to a specific <a href=\"#sem:token\">individual</a>. This process often involves accompanying forms, such as a <a href=\"#cxn:demonstrative-attributive\">demonstrative attributive</a> or an <a href=\"#cxn:article\">article</a>. Other verbalization processes involved in particularizing are <a href=\"#inf:selecting\">selecting</a> and <a href=\"#inf:situating\">situating</a>. (Section 3.2)"}, "def:preferred-argument-structure": {"definition": "the universal that the <a href=\"#sem:participant-role\">participant</a> in the <a href=\"#sem:a-role\">A role</a> is, on average, higher on the <a href=\"#def:accessibility-hierarchy\">Accessibility Hierarchy</a> than the participant in the <a href=\"#sem:p-role\">P role</a> in a <a href=\"#sem:bivalent\">bivalent event</a>, and, in fact, the participant in the A role is usually <a href=\"#inf:active-referent\">active</a>. (Section 8.1)"}, "def:prenominal-integration": {"definition": "the typological phenomenon that prenominal modifiers are more tightly integrated into the noun phrase than postnominal modifiers. (Section 5.3)"}, "def:role": {"definition": "a <a href=\"#cxn:construction\">construction</a> consists of <a href=\"#cxn:element\">elements</a>, each of which describes a role that expresses a particular <a href=\"#def:function\">function</a> in a construction. <em>Example</em>: in the English Predicate Adjective Construction [<span class=\"sc\">Sbj</span> <em>be</em> <span class=\"sc\">PredAdj</span>], illustrated by <em>She is intelligent</em>, the label <span class=\"sc\">Sbj</span> describes a role <a href=\"#inf:reference\">referring</a> to an <a href=\"#sem:object-concept\">object</a>, and <span class=\"sc\">PredAdj</span> describes a role occurring after <em>be</em> that <a href=\"#cxn:predicate\">predicates</a> a <a href=\"#sem:property-concept\">property</a> of the object referred to in the Subject role. (Section 1.1)"}};
@@ -0,0 +1 @@
+DATA.shards[3] = {"def:semantic-classes": {"definition": "a category of concepts. <em>Example</em>: humans are a semantic class. (Section 1.2.2)"}, "def:semantic-map": {"definition": "a representation of the set of functions in a <a href=\"#def:conceptual-space\">conceptual space</a> that are co-expressed by a particular form in a particular language, usually by a line encircling the set of functions in the conceptual space. A semantic map represents a language-specific <a href=\"#def:morphosyntax\">morphosyntactic</a> category. It is part of the <a href=\"#def:semantic-map-model\">semantic map model</a>. (Section 3.5)"}, "def:semantic-map-model": {"definition": "a model for representing semantic relationships among functions that are <a href=\"#str:co-expression\">co-expressed</a> across the world's languages. The semantic relationships form a <a href=\"#def:conceptual-space\">conceptual space</a> that is represented in a network (in mathematical terms, a graph). The co-expression of functions by a particular language form is represented by a <a href=\"#def:semantic-map\">semantic map</a> encircling the nodes of the graph/network that represent the co-expressed functions. (Section 3.5)"}, "def:speech-act-situation": {"definition": "the context in which speaking occurs. The speech act situation includes the roles of speaker and hearer; their spatial location; the time of the speech event; the shared knowledge of the speaker and hearer; and the social roles of the speaker and hearer and their social relation to each other. Many linguistic constructions have their <a href=\"#sem:meaning\">meanings</a> defined in whole or part by <a href=\"#cxn:element\">elements</a> of the speech act situation \u2013 in particular, <a href=\"#sem:contextual\">contextual</a> <span class=\"separation\"/> <a href=\"#cxn:referent-expression\">referring expressions</a>. (Section 3.1.1)"}, "def:structural-coding": {"definition": "the number of morphemes used to express the function of a <a href=\"#cxn:construction\">construction</a>. <em>Example</em>: in <em>Harry's car</em>, the clitic <em>-'s</em> expresses the function of <a href=\"#inf:modification\">modification</a> by an <a href=\"#sem:object-concept\">object concept</a>, and so is an example of structural coding of modification by one morpheme. (Section 2.5)"}, "def:syntax": {"definition": "the analysis of the internal structure of utterances/sentences \u2013 more specifically, how words are put together. <em>Example</em>: <em>the stolen succulents</em> has the syntax of a referring expression consisting of the head <em>succulents</em>, a preposed modifier <em>stolen</em> and the initial definite article <em>the</em>. (Section 1.1)"}, "def:token-frequency": {"definition": "the frequency of occurrence of specific <a href=\"#cxn:construction\">constructions</a> (morphemes, words, larger units) in language use, usually measured operationally as the frequency of occurrence in a particular corpus. (Section 2.5)"}, "def:transitivity-hierarchy": {"definition": "a ranking of <a href=\"#sem:event\">events</a> by their likelihood to be expressed by the <a href=\"#cxn:transitive-construction\">transitive construction</a> (the <q class=\"dq\">more transitive</q> end of the hierarchy) or a <a href=\"#str:subject-oblique-strategy\">subject\u2013oblique</a> <span class=\"separation\"/> <a href=\"#cxn:construction\">construction</a> (the <q class=\"dq\">less transitive</q> end of the hierarchy). (Section 7.3.3)"}, "def:translation": {"definition": "in an example presented with an <a href=\"#def:interlinear-morpheme-translation\">interlinear morpheme translation</a>, the <a href=\"#sem:meaning\">meaning</a> of an example from the language being analyzed, expressed in the <a href=\"#def:metalanguage\">metalanguage</a> being used in the text. (Section 1.6)"}, "def:typology": {"definition": "an approach to the study of language that starts from the diversity of grammatical structures across the languages of the world, and derives general patterns found in that diversity. (Section 1.1)"}, "def:verbalization": {"definition": "a model of how experiences are expressed in language developed by Chafe (1977 and later publications) and elaborated in Croft (2007a). In this book, one part of this model, <a href=\"#def:particularizing\">particularizing</a>, is described with respect to the structure of <a href=\"#cxn:referring-phrase\">referring phrases</a>. (Section 4.1.1)"}, "def:word-class": {"definition": "the set of words defined by their occurrence in a particular <a href=\"#def:role\">role</a> in a <a href=\"#cxn:construction\">construction</a>. <em>Example</em>: in the English Predicate Adjective Construction [<span class=\"sc\">Sbj</span> <em>be</em> <span class=\"sc\">PredAdj</span>], illustrated by <em>She is intelligent</em>, the PredAdj role defines a word class consisting of all the words that can occur in that role in that construction (<em>happy</em>, <em>tall</em>, <em>asleep</em>, etc.). Word classes are defined by a set of constructions that the words occur in (<em>a.k.a.</em> distribution, behavior, properties). (Section 1.2.1)"}, "inf:aboutness": {"definition": "the relation between what is expressed in a <a href=\"#cxn:topic-comment-construction\">topic\u2013comment</a> sentence and the <a href=\"#inf:reference\">referent</a> or <a href=\"#inf:reference\">topic</a> that the comment or <a href=\"#inf:predication\">predication</a> is predicated of. <em>Example</em>: in <em>The coyote ran across the lawn</em>, the sentence is about the coyote. Aboutness is intended to capture the notion that an utterance is relevant to <q>a matter of standing interest or concern</q> (Strawson 1964:97). (Section 11.2.1)"}, "inf:accessibility": {"definition": "the <a href=\"#inf:information-status\">information status</a> of a <a href=\"#inf:reference\">referent</a> with respect to the hearer's knowledge \u2013 that is, for which the hearer already has a <u>discourse file</u>. Accessibility refers to how easily the referent can be accessed by the hearer, in the speaker's estimation. The accessibility categories described in this book are <a href=\"#inf:active-referent\">active</a>, <a href=\"#inf:semi-active-referent\">semi-active</a>, <a href=\"#inf:inactive-referent\">inactive</a>, and <a href=\"#inf:inferrable-referent\">inferrable</a>. The adjective <q>accessible</q> is also used for the <a href=\"#inf:semi-active-referent\">semi-active</a> accessibility status. (Sections 3.1.3, <strong>3.3.1</strong>)"}, "inf:active-referent": {"definition": "a <a href=\"#inf:reference\">referent</a> whose <u>discourse file</u> has been opened and which is at the center of the hearer's consciousness. This is the highest <a href=\"#inf:accessibility\">accessibility</a> referent at the current point in the discourse. (Section 3.3.1)"}, "inf:actor": {"definition": "the main players in the actions reported in the discourse. Actors are typically <a href=\"#sem:human\">human</a> or <a href=\"#sem:animate\">animate</a> (especially personified animals), are referred to multiple times in the discourse, and are often introduced by special <a href=\"#cxn:construction\">constructions</a>. The term <q>actor</q> is also used for the <a href=\"#str:active-category\">active category</a>. (Section 3.4.1)"}, "inf:admodification": {"definition": "the <a href=\"#inf:information-packaging\">information packaging</a> function of qualifying a <a href=\"#cxn:modifier\">modifier</a>, usually via semantically expressing <a href=\"#sem:degree\">degree</a> or hedging of the <a href=\"#sem:property-concept\">property</a> denoted by the modifier. <em>Example</em>: in <em>very slow</em>, the degree <a href=\"#cxn:admodifier\">admodifier</a> <em>very</em> intensifies the value of the speed dimension denoted by <em>slow</em>. (Section 2.2.2)"}, "inf:alternative-proposition": {"definition": "when a <a href=\"#inf:contrast\">contrast</a> situation is construed as an <a href=\"#cxn:identificational-construction\">identificational construction</a>, the <a href=\"#sem:propositional-content\">propositional content</a> is asserted against a background of an alternative <a href=\"#sem:proposition\">proposition</a> (or propositions) expressed or evoked in the discourse context. <em>Example</em>: in the exchange <em>John bought apples. No, he bought PEACHES</em>, the proposition that John bought peaches is asserted against the background of the alternative proposition that John bought apples. The shared part of the proposition and its alternative, that John bought something, is presupposed \u2013 that is, <q>John bought X</q> is a <a href=\"#inf:presupposed-open-proposition\">presupposed open proposition</a>. (Section 11.4.1)"}, "inf:alternative-question": {"definition": "an interrogative in which the speaker offers a closed list of alternatives to fill in the unknown piece of information in the propositional content. <em>Example</em>: <em>Do you prefer beer or wine?</em> is an instance of an alternative question construction, where the alternatives offered are beer and wine. (Section 12.3.1)"}, "inf:anchor": {"definition": "an <a href=\"#sem:object-concept\">object</a> that, if its identity is known to speaker and hearer, allows for the identity of a related object to be known to the speaker and hearer. <em>Example</em>: <q>knowing who Peter is we can identify Peter's bag, arm, brother</q> (Koptjevskaja-Tamm 2002:147) \u2013 i.e. Peter serves as the anchor for identifying the bag, arm, or brother. The anchoring function requires that the <a href=\"#inf:modification\">modifying</a> <span class=\"separation\"/> <a href=\"#sem:object-concept\">object</a> concept denote an <a href=\"#sem:token\">individual</a> and not a <a href=\"#sem:type\">type</a>, and preferably a highly <a href=\"#inf:semi-active-referent\">accessible</a> individual. Another term used for <q>anchor</q> is <q>reference point</q>, but the latter term has another use in this book. (Section 5.2.1)"}, "inf:announcement": {"definition": "a discourse context which tends to favor a <a href=\"#inf:thetic\">thetic</a> construal. An announcement is an <q class=\"dq\">out of the blue</q>, usually unexpected and salient reporting of a situation. <em>Example</em>: <em>TRUMP was elected!</em> (with accent on <em>Trump</em>), uttered on November 9, 2016, the day after the Presidential election, is an announcement. (Section 11.3.1)"}, "inf:appositive-modification": {"definition": "an <a href=\"#inf:information-packaging\">information packaging</a> <span class=\"separation\"/> <a href=\"#def:function\">function</a> in which the modifying <a href=\"#sem:stative\">stative</a> concept does not narrow the set of possible <a href=\"#inf:reference\">referents</a> of the <a href=\"#sem:object-concept\">object concept</a> it modifies in a <a href=\"#cxn:referring-phrase\">referring phrase</a>; it simply adds a further description of the referent. <em>Example</em>: in <em>The angry young men left the party</em>, <em>angry</em> is an appositive modifier in the context in which it is adding a further description to the young men leaving the party, rather than specifying a subset of the young men, as with <a href=\"#inf:restrictive-modification\">restrictive modification</a>. (Section 14.3)"}, "inf:background-description": {"definition": "scene-setting information for a narrative which functions as the foreground. A background description is a discourse context which (weakly) tends to favor a <a href=\"#inf:thetic\">thetic</a> construal. <em>Example</em>: <em>DOGS were running in the yard</em> can function as a background description for telling a narrative. (Section 11.3.1)"}, "inf:choosing-contrast": {"definition": "a subtype of <a href=\"#inf:counterpresuppositional-contrast\">counterpresuppositional contrast</a> in which some semantic content is chosen from a list of alternatives. <em>Example</em>: in the exchange <em>Would you like coffee or tea? COFFEE, please</em>, the discourse context presents two alternatives (coffee or tea), and the respose chooses one of the alternatives (coffee). (Dik 1997 proposes the term <q>selecting</q>, but this term is used here with a different meaning.) (Section 11.4.1)"}, "inf:comparative-referent": {"definition": "an unspecified <a href=\"#inf:reference\">referent</a> occurring in the <a href=\"#sem:standard\">standard</a> of comparison in a <a href=\"#cxn:comparative-construction\">comparative construction</a>. <em>Example</em>: in <em>The boy runs as fast as anyone in his class</em>, <em>anyone</em> is a comparative pronoun expressing a hypothetical referent selected from the class representing the standard to which the boy's running is being compared. (Section 3.5)"}, "inf:complementative": {"definition": "an <a href=\"#inf:information-packaging\">information packaging</a> <span class=\"separation\"/> <a href=\"#def:function\">function</a> in which specification of the modifying <a href=\"#sem:stative\">stative</a> concept is required by the <a href=\"#cxn:predicate\">predicate</a>. <em>Example</em>: in English <em>I consider John intelligent</em>, the property of intelligence is necessarily specified of the participant John by the main predicate of attributing a property to a participant. (Section 14.3)"}, "inf:complex-figure": {"definition": "a construal or <a href=\"#inf:information-packaging\">information packaging</a> of two <a href=\"#sem:event\">events</a> such that the two events are construed as parts of a complex whole. <em>Example</em>: in <em>Jim was promoted and Cindy quit</em>, the events of Jim being promoted and Cindy quitting are conceived of as parts of a complex whole (e.g. a causal sequence). A complex figure packaging construes the events as equal in status, and also requires a common denominator for the two events. This information packaging is found in <a href=\"#cxn:coordinate-construction\">coordinate constructions</a>. (Section 15.1.3)"}, "inf:conditional-referent": {"definition": "an unspecified <a href=\"#inf:reference\">referent</a> in the <a href=\"#cxn:protasis-clause\">protasis</a> in a <a href=\"#cxn:conditional-construction\">conditional construction</a>. <em>Example</em>: in <em>If you hear <strong>anything</strong>, tell me</em>, <em>anything</em> is a conditional pronoun expressing a referent that is found only in the hypothetical world introduced by the protasis of the conditional construction. (Section 3.5)"}, "inf:contrast": {"definition": "a discourse context in which there is shared information between two propositions but some information contrasts between the two. The two major types of contrast are <a href=\"#inf:counterpresuppositional-contrast\">counterpresuppositional contrast</a> (the one usually meant with the term <q>contrast</q>) and <a href=\"#inf:parallel-contrast\">parallel contrast</a>. (Section 11.4.1)"}, "inf:coreference": {"definition": "the act of <a href=\"#inf:reference\">referring</a> to a <a href=\"#inf:reference\">referent</a> that recurs in different occasions in a stretch of discourse. The stretch of discourse may constitute a single <a href=\"#cxn:construction\">construction</a>, such as a <a href=\"#cxn:complex-sentence\">complex sentence construction</a>. This is the primary context in which coreference is discussed in this book. <em>Example</em>: in <em>Jared<sub>i</sub> praised his<sub>i</sub> father, but his<sub>i</sub> father ignored him<sub>i</sub></em>, the referent Jared recurs four times in the sentence, and so represents an example of coreference. In linguistic analysis, coreference is often notated by subscript indexes such as <em>i</em> in the example. (Section 16.1)"}, "inf:counterpresuppositional-contrast": {"definition": "a type of <a href=\"#inf:contrast\">contrast</a> in which the sentence rejects one component of a previously asserted full proposition; this discourse context favors an <a href=\"#inf:identificational\">identificational</a> construal. <em>Example</em>: in the exchange <em>John bought apples. No, he bought PEACHES</em>, the second sentence rejects the previous assertion of what John bought. (Section 11.4.1)"}, "inf:declarative": {"definition": "a <a href=\"#inf:speech-acts\">speech act</a> which simply asserts its <a href=\"#sem:propositional-content\">propositional content</a>. <em>Example</em>: The English sentence <em>Sandra picked up the children</em> is an instance of a declarative speech act. (Section 12.1)"}, "inf:different-subject": {"definition": "in <a href=\"#cxn:complex-sentence\">complex sentence constructions</a> that express <a href=\"#cxn:reference-tracking-construction\">reference tracking</a>, the situation where the <a href=\"#inf:topicality\">salient</a> <span class=\"separation\"/> <a href=\"#sem:participant-role\">participant</a> in the current <a href=\"#cxn:clause\">clause</a> is indicated as not <a href=\"#inf:coreference\">coreferential</a> with the salient participant in another clause in the construction. The salient participant is typically, but not always, encoded as the <a href=\"#cxn:subject-phrase\">subject</a> of the <a href=\"#cxn:predicate\">predicate</a>. <em>Example</em>: in <em>Harry having finished preparing the salad, Bill brought it to the table</em>, the overt referring phrase <em>Harry</em> in <em>Harry having finished preparing the salad</em> signals that the subject referent of finishing the salad is not coreferential with the subject referent of the <a href=\"#cxn:matrix-clause\">matrix clause</a> \u2013 namely, Bill. (Section 16.1)"}, "inf:direct-negation-referent": {"definition": "an unspecified <a href=\"#inf:reference\">referent</a> which is in the scope of <a href=\"#cxn:negation-construction\">negation</a> in the same <a href=\"#cxn:clause\">clause</a>. <em>Example</em>: in <em>I noticed nothing</em>, <em>nothing</em> is a direct negation pronoun expressing a referent found only in the negative alternative world to the real world. (Section 3.5)"}, "inf:discourse-deixis": {"definition": "<a href=\"#inf:reference\">reference</a> to <a href=\"#sem:event\">events</a> or <a href=\"#sem:proposition\">propositions</a> already described in the discourse, in contrast to reference to objects. (Section 3.3.3)"}, "inf:entity-central": {"definition": "a type of <a href=\"#inf:thetic\">thetic</a> in which the most important new information being presented is the identity of the <a href=\"#sem:object-concept\">object</a> (entity). <em>Example</em>: <em>There's a snake in the kitchen sink</em> is an instance of an entity-central thetic construction, where the primary new information being presented is the snake. (Sections 10.1.2, <strong>11.3.1</strong>)"}, "inf:equational": {"definition": "a type of <a href=\"#inf:identificational\">identificational information packaging</a> in which two <a href=\"#inf:reference\">referents</a> that the hearer assumed were different individuals are asserted to be, in fact, one and the same individual. <em>Example</em>: in <em>The Morning Star is the Evening Star</em>, it is asserted that two celestial objects that were once thought to be distinct objects (and given distinct names) are one and the same, namely the planet Venus. (Section 10.1.2)"}, "inf:event-central": {"definition": "a type of <a href=\"#inf:thetic\">thetic</a> in which the more important new information being presented is the <a href=\"#sem:event\">event</a> reported. <em>Example</em>: in <em>The PHONE's ringing</em>, the most important new information is the ringing of the phone, not the existence of the phone. (Sections 10.1.2, <strong>11.3.1</strong>)"}, "inf:exclamative": {"definition": "a <a href=\"#inf:speech-acts\">speech act</a> which expresses a strong emotional reaction to the <a href=\"#sem:propositional-content\">propositional content</a> that it conveys. More precisely, the exclamative speech act expresses the speaker's surprise toward the <a href=\"#sem:degree\">degree</a> of a scalar <a href=\"#sem:property-concept\">property</a> contained in the propositional content of the speech act; the rest of the propositional content consists of a <a href=\"#inf:presupposed-open-proposition\">presupposed open proposition</a>. <em>Example</em>: <em>What a beautiful house!</em> is an instance of an English exclamative construction. (Sections 12.1, 12.5)"}, "inf:expanding-contrast": {"definition": "a subtype of <a href=\"#inf:counterpresuppositional-contrast\">counterpresuppositional contrast</a> in which the sentence rejects a component of a prior assertion by adding something else to the rejected component, rather than simply replacing it. <em>Example</em>: in the exchange <em>John bought apples. He also bought PEACHES</em>, the speaker rejects that what John bought was just apples, and adds peaches to what John bought. <em>Also</em> is an additive focus operator. (Section 11.4.1)"}, "inf:explanation": {"definition": "a discourse context which tends to favor a <a href=\"#inf:thetic\">thetic</a> construal. The fact that something happened is presupposed, and the statement explains or elaborates what happened. <em>Example</em>: <em>My CAR broke down</em> \u2013 as, for instance, a response to the question <q>What happened?</q> \u2013 is an example of an explanation. (Section 11.3.1)"}, "inf:figure-ground": {"definition": "a construal or <a href=\"#inf:information-packaging\">information packaging</a> of two <a href=\"#sem:event\">events</a> such that one event (the <a href=\"#sem:ground\">ground</a>) serves as the reference point for the other event (the <a href=\"#sem:figure\">figure</a>). <em>Example</em>: in <em>Cindy quit after Jim was promoted</em>, the two events are in a figure\u2013ground packaging, such that Jim's being promoted serves as the reference point for the time of Cindy's quitting. This is an extension of the figure\u2013ground construal beyond spatial relations. This information packaging is found in <a href=\"#cxn:adverbial-clause-construction\">adverbial clause constructions</a>. (Section 15.1.3)"}, "inf:focus": {"definition": "in <a href=\"#inf:identificational\">identificational information packaging</a>, the information which is identified as the <q class=\"dq\">filler</q> for the open part of the <a href=\"#inf:presupposed-open-proposition\">presupposed open proposition</a>. <em>Example</em>: in <em>It was Jack who stole my cookies!</em>, the presupposed open proposition is <q>X stole my cookies</q>, and the filler of X is Jack \u2013 i.e. X = Jack. The focus may be any part of the information in the clause, not just an argument. The term <q>focus construction</q> is sometimes used as a synonym for <q>identificational construction</q>, but we avoid that usage here. (Section 11.4.1)"}, "inf:free-choice-referent": {"definition": "an unspecified <a href=\"#inf:reference\">referent</a> in certain contexts, whose identity can be freely chosen without affecting the truth value of the utterance. <em>Example</em>: in <em>After the fall of the Wall, East Germans were free to travel anywhere</em>, <em>anywhere</em> is a free choice pronoun expressing a referent \u2013 a place \u2013 toward which the agent in the clause, the East Germans, is free to choose to travel. (Section 3.5)"}, "inf:generic-referent": {"definition": "<a href=\"#inf:reference\">reference</a> to the <a href=\"#sem:type\">type</a> itself, and not to a particular <a href=\"#inf:reference\">referent</a>/<a href=\"#sem:token\">token</a> of the type. <em>Example</em>: in the generic use of <em>You can't come to the party without an invitation, you</em> is referring to the general category of people. (Sections 3.1.1, <strong>3.6</strong>)"}, "inf:identifiability": {"definition": "how identifiable a particular <a href=\"#inf:reference\">referent</a>/token is to the speaker and hearer, based on the description of the referent/token provided by the <a href=\"#cxn:referring-phrase\">referring phrase</a>. <em>Examples</em>: felicitous use of <em>the student</em> or <em>she</em> requires that the identity of the referent is known to the speaker and hearer; if <em>a student</em> is used for a real-world referent, then the identity of the referent is unknown to the hearer, and possibly also to the speaker; <em>a student</em> may also refer to a referent that is only <a href=\"#inf:type-identifiable\">type identifiable</a>, hence its individual identity cannot be known to the speaker and hearer. (Section 3.2)"}, "inf:identificational": {"definition": "<a href=\"#inf:information-packaging\">information packaging</a> in which a particular piece of information (the <a href=\"#inf:focus\">focus</a>) is equated with the <q class=\"dq\">open slot</q> in a <a href=\"#inf:presupposed-open-proposition\">presupposed open proposition</a>. The presupposed open proposition may be evoked by an alternative proposition that differs from the identificational construction by only the focus. <em>Example</em>: in <em>It was Ollie who was playing the piano</em>, the information in the identificational construction is divided into the presupposed open proposition <q>X was playing the piano</q>, and the focused information Ollie, and what is being asserted is <q>X = Ollie</q>. The term <q>focus</q> is sometimes used as a synonym for <q>identificational</q>, but this term is used differently here. (Sections 10.1.2, 11.1, <strong>11.4.1</strong>)"}, "inf:imperative-hortative": {"definition": "a <a href=\"#inf:speech-acts\">speech act</a> which requests that the action expressed in the propositional content of the imperative\u2013hortative be carried out, prototypically by the addressee but possibly by other persons. <em>Example</em>: <em>Dance!</em> is an example of the English imperative\u2013hortative construction for the <a href=\"#cxn:second-person-pronoun\">second person</a>, and <em>Let's dance!</em> is an example of the same for the <a href=\"#cxn:first-person-pronoun\">first person</a> <span class=\"separation\"/> <a href=\"#sem:number\">plural</a>. The term <q>hortative</q> is sometimes used for a first person imperative\u2013hortative, and <q>jussive</q> for a third person imperative\u2013hortative. A negative imperative\u2013hortative is a <a href=\"#inf:prohibitive\">prohibitive</a>. (Sections 12.1, 12.4)"}, "inf:inactive-referent": {"definition": "a <a href=\"#inf:reference\">referent</a> for which the speaker and hearer have a <u>discourse file</u> (also described as: the referent is in the speaker's long-term memory) but which generally has not been activated in the discourse, at least not recently. (Section 3.3.1)"}, "inf:indirect-negation-referent": {"definition": "an unspecified <a href=\"#inf:reference\">referent</a> which is in a <a href=\"#cxn:clause\">clause</a> embedded in a <strong>negated</strong> clause. <em>Example</em>: in <em>I don't think that anybody has seen it</em>, <em>anybody</em> is an indirect negation pronoun expressing a referent that is found only in the negated <q class=\"dq\">world</q> of the speaker's beliefs. (Section 3.5)"}, "inf:inferrable-referent": {"definition": "a <a href=\"#inf:reference\">referent</a> whose identity can be inferred via the <a href=\"#sem:type\">type</a> described by the <a href=\"#cxn:referring-phrase\">referring phrase</a>. Example: in <em>the bowl of noodles on the kitchen counter</em>, the identity of the referent can be inferred from the type description (is a bowl, contains noodles, is on the kitchen counter) even if the referent has not previously been mentioned. Inferrable referents are very similar to <a href=\"#inf:inactive-referent\">inactive</a> referents (which are sometimes called noncontaining inferrables) and may not be clearly distinguishable from them. (Section 3.3.1)"}, "inf:information-gap": {"definition": "a discourse context which favors an <a href=\"#inf:identificational\">identificational</a> construal. An information gap is a proposition in the discourse context with a <q class=\"dq\">missing</q> piece of information. <em>Example</em>: in <em>So I learned to sew books. They're really good books. <strong>It's just the covers that are rotten</strong></em>, asserting that the books are really good evokes an information gap in that something is not good / rotten, since the books need repairing. The proposition with the information gap is the <a href=\"#inf:presupposed-open-proposition\">presupposed open proposition</a>. (Section 11.4.1)"}, "inf:information-packaging": {"definition": "the way that the <a href=\"#sem:meaning\">meaning</a> or semantic content is <q class=\"dq\">packaged</q> for communication in discourse. <em>Example</em>: the <a href=\"#sem:property-concept\">property</a> concept <em>huge</em> can be presented or packaged as a <a href=\"#inf:predication\">predication</a> asserted of an <a href=\"#sem:object-concept\">object</a> (<em>That tree is huge!</em>), or it can be used to <a href=\"#inf:modification\">modify</a> or add information about an object (<em>that huge tree over there</em>). (Sections 1.1, <strong>1.3</strong>)"}, "inf:information-question": {"definition": "an <a href=\"#inf:interrogative\">interrogative</a> in which the unknown piece of the <a href=\"#sem:propositional-content\">propositional content</a> requested of the addressee is a semantic component of the <a href=\"#sem:proposition\">proposition</a> other than its <a href=\"#sem:polarity\">polarity</a>. <em>Example</em>: <em>Who is coming?</em> is an instance of the English information question construction, expecting an answer identifying the person(s) who is/are coming. (Section 12.3.1)"}, "inf:information-question-response": {"definition": "the answer to an <a href=\"#inf:information-question\">information question</a>. <em>Example</em>: the answer to the English information question <em>Who is coming?</em> could be <em>Sandra is coming, Sandra is</em>, or just <em>Sandra</em>. (Section 12.3.3)"}, "inf:information-status": {"definition": "the information status of a <a href=\"#inf:reference\">referent</a> in discourse is a characterization of how the interlocutors identify an <a href=\"#sem:token\">individual</a> as the intended referent of a <a href=\"#cxn:referring-phrase\">referring phrase</a>. Information status represents a subdivision of the <a href=\"#inf:information-packaging\">information packaging</a> <span class=\"separation\"/> <a href=\"#def:function\">function</a> of <a href=\"#inf:reference\">reference</a>: a more fine-grained means to pick out the referent. <em>Examples</em>: some examples of information status categories are <a href=\"#inf:active-referent\">active</a>, <a href=\"#inf:semi-active-referent\">semi-active</a>, <a href=\"#inf:inactive-referent\">inactive</a>, and other categories listed in the third column of Table 3.4. (Section 3.2)"}, "inf:interrogative": {"definition": "a <a href=\"#inf:speech-acts\">speech act</a> which requests information, usually of the addressee, regarding uncertain or unknown information that is part of the <a href=\"#sem:propositional-content\">propositional content</a> of the question. Interrogatives are divided into <a href=\"#inf:polarity-question\">polarity questions</a>, <a href=\"#inf:information-question\">information questions</a>, and <a href=\"#inf:alternative-question\">alternative questions</a>. (Sections 12.1, 12.3)"}, "inf:interruption": {"definition": "a discourse context which tends to favor a <a href=\"#inf:thetic\">thetic</a> construal. Something in the ambient environment of the discourse becomes salient enough to interrupt the conversational interaction. <em>Example</em>: <em>The PHONE's ringing!</em> in response to that event in the context is an interruption. (Section 11.3.1)"}, "inf:irrealis-referent": {"definition": "a <a href=\"#inf:reference\">referent</a> which is in the <q class=\"dq\">world</q> or <a href=\"#sem:mental-space\">mental space</a> representing a person's desire, wish, command, etc. <em>Example</em>: in <em>Visit me sometime</em>, <em>sometime</em> is an irrealis <a href=\"#cxn:pronoun\">pronoun</a> expressing an irrealis referent \u2013 a time only found in the hoped-for mental space of the speaker's offer. (Section 3.5)"}, "inf:link": {"definition": "a concept expressed in a sentence that is linked to a <a href=\"#inf:trigger\">trigger</a> concept previously evoked, and forms a <a href=\"#inf:poset\">poset</a> with the trigger (and other potentially evoked concepts). <em>Example</em>: in the exchange <em>Do you like this album? Yeah, this song I really like</em>, the song mentioned in the second turn serves as the link to the album which is the trigger mentioned in the first turn. (Section 11.2.3)"}, "inf:listing-contrast": {"definition": "a subtype of <a href=\"#inf:parallel-contrast\">parallel contrast</a> in which the two propositions are identical except for the contrasting parts, and the contrasting parts are construed as belonging in a set relationship \u2013 that is, they are members of a poset. <em>Example</em>: in <em>He brought back all the goods, and he also brought back his kinsman Lot and his goods</em>, the second clause is identical except for the members of the poset {all the goods, his kinsman Lot and his goods}. (Section 11.4.1)"}, "inf:major-propositional-act": {"definition": "the basic <a href=\"#inf:information-packaging\">information packaging</a> functions that structure phrases and <a href=\"#cxn:clause\">clauses</a>; the propositional acts are <a href=\"#inf:reference\">reference</a>, <a href=\"#inf:predication\">predication</a>, and <a href=\"#inf:modification\">modification</a>. (Section 1.3)"}, "inf:modification": {"definition": "provides additional information about the <a href=\"#inf:reference\">referent</a> and enriches the specification of the referent for the hearer. Example: in <em>a furry cat</em>, the speaker enriches the specification of the referent in the cat category by the <a href=\"#sem:property-concept\">property</a> of being furry. In the <a href=\"#def:file-metaphor\">file metaphor</a> for describing <a href=\"#inf:major-propositional-act\">propositional acts</a>, modification enriches the discourse file; the information it adds to the discourse file is secondary in comparison to <a href=\"#inf:predication\">predication</a>. (Sections 1.3, <strong>2.1</strong>)"}, "inf:nonspecific-referent": {"definition": "the information status of a referent whose identity cannot be known to the speaker and the hearer because the referent is only <a href=\"#inf:type-identifiable\">type identifiable</a>. <em>Example</em>: in <em>A student came to my office</em>, the hearer does not know the identity of the student, and hence that referent is nonspecific. (Section 3.5)"}, "inf:nonverbal-contrast": {"definition": "a subtype of <a href=\"#inf:parallel-contrast\">parallel contrast</a> in which the verbs (or more generally, <a href=\"#cxn:predicate\">predicates</a>) are identical or virtually synonymous, and there are at least two sets of parallel nonverbal components that are members of <a href=\"#inf:poset\">posets</a>. <em>Example</em>: in <em>and Joseph called the name of the elder [of his two sons] Manasseh...and he called the name of the second Ephraim</em>, the verbs <q>call</q> are identical, and there are two sets of parallel nonverbal components that differ and form posets: {the name of the elder son, the name of the second son} and {Manasseh, Ephraim}. (Section 11.4.1)"}, "inf:parallel-contrast": {"definition": "a type of <a href=\"#inf:contrast\">contrast</a> that involves two propositions that exhibit some sort of parallelism in their structure, and there is a difference in semantic components in parallel positions that is construed as a <a href=\"#inf:topicality\">salient</a> contrast. Three subtypes of parallel contrast are <a href=\"#inf:listing-contrast\">listing contrast</a>, <a href=\"#inf:verbal-contrast\">verbal contrast</a>, and <a href=\"#inf:nonverbal-contrast\">nonverbal contrast</a>. (Section 11.4.1)"}, "inf:polarity-question": {"definition": "an <a href=\"#inf:interrogative\">interrogative</a> in which the unknown piece of the <a href=\"#sem:propositional-content\">propositional content</a> requested of the addressee is the <a href=\"#sem:polarity\">polarity</a> (<a href=\"#sem:positive-polarity\">positive</a> or <a href=\"#sem:negative-polarity\">negative</a>) of the proposition. (Section 12.3.1)"}, "inf:polarity-response": {"definition": "the <u>answer</u> to a <a href=\"#inf:polarity-question\">polarity question</a>. <em>Example</em>: the polarity response to <em>Do you have any money?</em> in English is <em>Yes (I do)</em> or <em>No (I don't)</em>. (This is excluding other less cooperative responses such as <em>I don't know</em> or <em>It's none of your business</em>.) (Section 12.3.3)"}, "inf:poset": {"definition": "a partially ordered set of discourse entities. The partial ordering is defined by some sort of semantic relation, such as part\u2013whole or type\u2013subtype. <em>Example</em>: in the exchange <em>Do you like this album? Yeah, this song I really like</em>, the album mentioned in the first turn and the song mentioned in the second turn are members of a poset which is defined by a <a href=\"#sem:part-whole-relation\">part\u2013whole relation</a> (the album is the whole, and the song is a part of the album). (Section 11.2.3)"}, "inf:pragmatic-assertion": {"definition": "the <a href=\"#sem:meaning\">information</a> added to the discourse context when a <u>sentence</u> is uttered, or, more precisely, <q>the proposition expressed by a sentence which the hearer is expected to know or take for granted as a result of hearing the sentence uttered</q> (Lambrecht 1994:52). <em>Example</em>: in <em>Alarms ringing, the burglar fled</em>, the <a href=\"#cxn:clause\">clause</a> <em>the burglar fled</em> is pragmatically asserted. The criterion typically used for pragmatic assertion is that the content of a sentence can be negated or questioned, though other criteria are sometimes used, such as hedging. (Sections 13.2.1, <strong>15.1.2</strong>)"}, "inf:pragmatic-presupposition": {"definition": "the set of <a href=\"#sem:proposition\">propositions</a> evoked by the <a href=\"#cxn:construction\">constructions</a> in a sentence <q>which the speaker assumes the hearer already knows or is ready to take for granted at the time the sentence is uttered</q> (Lambrecht 1994:52). <em>Example</em>: in <em>I'm grateful that you finished cleaning the house</em>, the proposition that you finished cleaning the house is presupposed, while the proposition that I am grateful about it is <a href=\"#inf:pragmatic-assertion\">asserted</a>. (Section 11.4.1)"}, "inf:pragmatically-specific-referent": {"definition": "a referent introduced into the discourse by the speaker that is normally referred to again in subsequent discourse. We will use the shorter term <q>pragmatically specific</q>. (Section 3.4.1)"}, "inf:predication": {"definition": "what the speaker is asserting about the referents in a particular utterance. <em>Example</em>: in <em>Masha is nice</em>, the speaker is predicating the <a href=\"#sem:property-concept\">property</a> of being nice to the referent Masha. In the <a href=\"#def:file-metaphor\">file metaphor</a> for describing <a href=\"#inf:major-propositional-act\">propositional acts</a>, predication adds information to a referent's discourse file. The predication is the <a href=\"#inf:predication\">comment</a> in <a href=\"#inf:topic-comment\">topic\u2013comment information packaging</a>. (Sections 1.3, <strong>2.1</strong>)"}, "inf:presentational": {"definition": "a type of <a href=\"#inf:entity-central\">entity-central</a> <span class=\"separation\"/> <a href=\"#inf:thetic\">thetic information packaging</a> that introduces a <a href=\"#inf:reference\">referent</a> into the discourse, in order to make the identity of the referent known to the hearer. <em>Example</em>: <em>There's my bicycle</em> and <em>In the corner sat a mouse</em> are sentences that express the presentational information packaging function. (Sections 10.1.2, 10.4)"}, "inf:presupposed-open-proposition": {"definition": "in <a href=\"#inf:identificational\">identificational information packaging</a>, the <a href=\"#sem:proposition\">proposition</a> with an unknown part (hence <q class=\"dq\">open</q> proposition) which is already part of the shared knowledge of the speaker and hearer (that is, it is presupposed). <em>Example</em>: in <em>It was Jack who stole my cookies!</em>, the presupposed open proposition is <q>X stole my cookies</q>; in the appropriate discourse context, it is already known that someone stole my cookies. (Section 11.4.1)"}, "inf:prohibitive": {"definition": "a <a href=\"#sem:negative-polarity\">negative</a> <span class=\"separation\"/> <a href=\"#inf:imperative-hortative\">imperative\u2013hortative</a> <span class=\"separation\"/> <a href=\"#inf:speech-acts\">speech act</a>. <em>Example</em>: English <em>Don't be a fool!</em> is an instance of a prohibitive. (Section 12.4.1)"}, "inf:prop": {"definition": "a supporting entity that plays a role in the actions reported in the discourse. Props are almost always nonhuman, usually are referred to only once, and are rarely introduced by special <a href=\"#cxn:construction\">constructions</a>. (Section 3.4.1)"}, "inf:question-referent": {"definition": "an unspecified <a href=\"#inf:reference\">referent</a> in the scope of <a href=\"#inf:interrogative\">interrogation</a>, especially <a href=\"#inf:polarity-question\">polar</a> <span class=\"separation\"/> <a href=\"#cxn:interrogative-construction\">interrogatives</a>. <em>Example</em>: in <em>Can you hear <strong>anything</strong>?</em>, <em>anything</em> is a question pronoun expressing a referent that only <q class=\"dq\">exists</q> in a hypothetical world, the possibility of whose existence is being entertained by the questioner. (Section 3.5)"}, "inf:reference": {"definition": "what the speaker is talking about. <em>Example</em>: in <em>Masha is nice</em>, the speaker is referring to a person named Masha, and Masha is the referent. In the <a href=\"#def:file-metaphor\">file metaphor</a> for describing <a href=\"#inf:major-propositional-act\">propositional acts</a>, reference opens or accesses a discourse file for the referent. (Sections 1.3, <strong>2.1</strong>)"}, "inf:rejecting-contrast": {"definition": "a subtype of <a href=\"#inf:counterpresuppositional-contrast\">counterpresuppositional contrast</a> in which the sentence simply rejects a component of a prior assertion without offering a replacement. <em>Example</em>: in the exchange <em>John bought apples. No, he didn't buy APPLES</em>, the speaker rejects the assertion of what John bought, but without asserting what John did buy. (Section 11.4.1)"}, "inf:replacing-contrast": {"definition": "a subtype of <a href=\"#inf:counterpresuppositional-contrast\">counterpresuppositional contrast</a> in which the sentence rejects a component of a prior assertion by offering a replacement for the rejected information. <em>Example</em>: in the exchange <em>John bought apples. No, he bought PEACHES</em>, the speaker rejects the assertion that what John bought was apples and replaces it with peaches. (Section 11.4.1)"}, "inf:response": {"definition": "the answer to an <a href=\"#inf:interrogative\">interrogative</a> (question) <a href=\"#inf:speech-acts\">speech act</a>. Like interrogatives, responses are divided into <a href=\"#inf:polarity-response\">polarity responses</a> and <a href=\"#inf:information-question-response\">information (question) responses</a>."}, "inf:restricting-contrast": {"definition": "a subtype of <a href=\"#inf:counterpresuppositional-contrast\">counterpresuppositional contrast</a> in which the sentence rejects a component of a prior assertion by excluding part of the rejected component rather than simply replacing it. <em>Example</em>: in the exchange <em>John bought apples and peaches. No, he only bought PEACHES</em>, the speaker rejects that what John bought was both apples and peaches, and restricts what John bought to just peaches. <em>Only</em> is a restrictive focus operator. (Section 11.4.1)"}, "inf:restrictive-modification": {"definition": "the prototypical type of <a href=\"#inf:modification\">modification</a> <span class=\"separation\"/> <a href=\"#inf:information-packaging\">information packaging</a> <span class=\"separation\"/> <a href=\"#def:function\">function</a> in which the modifying <a href=\"#sem:stative\">stative</a> concept narrows or restricts the set of possible <a href=\"#inf:reference\">referents</a> of the <a href=\"#sem:object-concept\">object concept</a> it modifies in a <a href=\"#cxn:referring-phrase\">referring phrase</a>. <em>Example</em>: in <em>The tall trees block the view, tall</em> restrictively modifies <em>trees</em> in the context where there are tall trees and short trees. (Section 14.3)"}, "inf:same-subject": {"definition": "in <a href=\"#cxn:complex-sentence\">complex sentence constructions</a> that express <a href=\"#cxn:reference-tracking-construction\">reference tracking</a>, the situation where the <a href=\"#inf:topicality\">salient</a> <span class=\"separation\"/> <a href=\"#sem:participant-role\">participant</a> in the current <a href=\"#cxn:clause\">clause</a> is indicated to be <a href=\"#inf:coreference\">coreferential</a> with the salient participant in another clause in the construction. The salient participant is typically, but not always, encoded as the <a href=\"#cxn:subject-phrase\">subject</a> of the <a href=\"#cxn:predicate\">predicate</a>. <em>Example</em>: in <em>Having finished the chapter, Bill went to bed</em>, the zero anaphora in <em>Having finished the chapter</em> signals that the subject referent of finishing the chapter is coreferential with the subject referent of the <a href=\"#cxn:matrix-clause\">matrix clause</a>, namely Bill. (Section 16.1)"}, "inf:selecting": {"definition": "a subtype of <a href=\"#inf:modification\">modification</a> that picks out the <a href=\"#sem:token\">instance</a>, or set of instances, of the <a href=\"#sem:type\">type</a> that the speaker intends to <a href=\"#inf:reference\">refer</a> to. Usually performed by <a href=\"#sem:numeral\">numerals</a> and <a href=\"#cxn:quantifier-term\">quantifiers</a>, as well other related concepts. (Dik 1997 uses <q>selecting</q> for <a href=\"#inf:choosing-contrast\">choosing</a>.) (Sections 4.1.1, <strong>4.1.3</strong>)"}, "inf:semantically-specific-referent": {"definition": "a <a href=\"#inf:reference\">referent</a> introduced into the discourse by the speaker that is not normally referred to again in subsequent discourse. The term <q>semantically specific</q> indicates that the referent is not in a nonreal context \u2013 that is, it is not a nonspecific referent. We will use the shorter term <q>pragmatically nonspecific</q> and assume that such referents are also semantically specific. (Section 3.4.1)"}, "inf:semi-active-referent": {"definition": "a <a href=\"#inf:reference\">referent</a> whose <u>discourse file</u> has been activated (i.e. it is in short-term memory), but is not at the center of the hearer's consciousness at the current point in the discourse. The term <q>recognitional</q> is used for a referent so peripheral to the hearer's consciousness that the speaker is unsure whether the hearer remembers it. (Section 3.3.1)"}, "inf:setting": {"definition": "the place where the <a href=\"#inf:actor\">actors</a> and <a href=\"#inf:prop\">props</a> are located and the <a href=\"#cxn:predicate\">predicated</a> <span class=\"separation\"/> <a href=\"#sem:action-concept\">action(s)</a> take place, and the times at which the actions take place. Settings are not typically referred to multiple times, but they play an important role in organizing discourse, especially narratives. (Section 3.4.1)"}, "inf:situating": {"definition": "a subtype of <a href=\"#inf:modification\">modification</a> that picks out a particular referent by situating it in physical space (<a href=\"#sem:spatial-deixis\">deixis</a>) or in the (knowledge/belief) <a href=\"#sem:mental-space\">mental space</a> of the interlocutors (<a href=\"#inf:information-status\">information status</a>). (Section 4.1.1)"}, "inf:specific-known-referent": {"definition": "a real-world <a href=\"#inf:reference\">referent</a> whose identity is known to the speaker but not the hearer. <em>Example</em>: if <em>Masha met with someone near the university</em> is used in a context where the speaker knows the identity of the person Masha met, then <em>someone</em> is a specific known pronoun expressing a specific known referent. (Section 3.5)"}, "inf:specific-unknown-referent": {"definition": "a real-world <a href=\"#inf:reference\">referent</a> whose identity is known neither to the speaker nor to the hearer. <em>Example</em>: if <em>Masha met with somebody near the university</em> is used in a context where the speaker does not know the identity of the person Masha met, then <em>somebody</em> is a specific unknown pronoun expressing a specific unknown referent. (Section 3.5)"}, "inf:speech-acts": {"definition": "speech acts package the <a href=\"#sem:propositional-content\">propositional content</a> of the utterance in such a way that the speaker wants or requires an explicit response from the addressee with respect to the propositional content. The speech acts that are most likely to be expressed as distinct constructions are the <a href=\"#inf:declarative\">declarative</a>, the <a href=\"#inf:interrogative\">interrogative</a>, the <a href=\"#inf:imperative-hortative\">imperative\u2013hortative</a> and its negative the <a href=\"#inf:prohibitive\">prohibitive</a>, and the <a href=\"#inf:exclamative\">exclamative</a>. (Section 12.1)"}, "inf:subcategorizing": {"definition": "a subtype of <a href=\"#inf:modification\">modification</a> supporting the basic <u>categorizing</u> function of <a href=\"#cxn:common-noun\">common nouns</a>. Usually performed by <a href=\"#sem:property-concept\">property</a> concepts. (Sections 4.1.1, <strong>4.1.2</strong>)"}, "inf:theater-metaphor": {"definition": "a metaphor used to describe the <a href=\"#inf:information-status\">information status</a> of <a href=\"#inf:reference\">referents</a> in discourse, especially narrative discourse. The theater metaphor divides referents into three categories: <a href=\"#inf:actor\">actors</a>, <a href=\"#inf:prop\">props</a>, and <a href=\"#inf:setting\">settings</a>. (Section 3.4.1)"}, "inf:thetic": {"definition": "<a href=\"#inf:information-packaging\">information packaging</a> that does not split the information into a <a href=\"#inf:reference\">topic</a> and a <a href=\"#inf:predication\">comment</a>, as is done in the <a href=\"#inf:topic-comment\">topic\u2013comment</a> information packaging. Instead, the information is presented as a single whole, hence the alternative name <q>all new</q>. <em>Example</em>: <em>TRUMP was elected!</em> (with accent on <em>Trump</em>), uttered on November 9, 2016, is thetic, in that this information is expressed as all new \u2013 in this case because it was unexpected at the time. (Sections 10.1.2, 11.1, <strong>11.3.1</strong>)"}, "inf:token-identity": {"definition": "two referents are the same individual. <em>Example</em>: in <em>I picked up a red candy and gave it to Greg</em>, the referent of <em>it</em> is the same individual as the referent of <em>a red candy</em>. Contrasts with <a href=\"#inf:type-identity\">type identity</a>. (Section 5.4)"}, "inf:topic-comment": {"definition": "the <a href=\"#inf:information-packaging\">information packaging</a> in which one concept (the <a href=\"#inf:predication\">comment</a>) is <a href=\"#inf:predication\">predicated about</a> another concept which is <a href=\"#inf:reference\">referred</a> to (the <a href=\"#inf:reference\">topic</a>). <em>Example</em>: <em>The bus stopped</em> is an instance of a topic\u2013comment construction in which <em>stopped</em> is the comment and <em>The bus</em> is the topic. Topic\u2013comment information packaging is basically synonymous with <a href=\"#inf:predication\">predication</a>; the term <q>topic\u2013comment</q> highlights the fact that a predication is a predication about a <a href=\"#inf:reference\">referent</a>. (Sections 2.2.2, 10.1.2, 11.1, <strong>11.2.1</strong>)"}, "inf:topicality": {"definition": "the degree of attention directed to a <a href=\"#inf:reference\">referent</a> by the interlocutors at a given point in the discourse. <em>Example</em>: it is generally the case that, in a sentence like <em>He ate the cookies</em>, the <a href=\"#cxn:subject-phrase\">subject</a> referent is more salient than the <a href=\"#inf:object-argument\">object</a> referent in discourse. Salience is also considered to vary across different <a href=\"#sem:object-concept\">object concepts</a>, other things being equal: people are more interested in other people, somewhat less so in <a href=\"#sem:animate\">animate</a> objects, and less still in <a href=\"#sem:inanimate\">inanimate</a> objects. Salience is the motivation for the <a href=\"#def:animacy-hierarchy\">Animacy Hierarchy</a> and the <a href=\"#def:extended-animacy-hierarchy\">Extended Animacy Hierarchy</a>. (Section 6.1.1)"}, "inf:trigger": {"definition": "a concept evoked or inferrable in the prior discourse that is a member of a <a href=\"#inf:poset\">poset</a> that also includes the <a href=\"#inf:link\">link</a>. <em>Example</em>: in the exchange <em>Do you like this album? Yeah, this song I really like</em>, the album mentioned in the first turn is the trigger that generates a poset together with the song mentioned in the second turn; the latter serves as the link to the trigger. (Section 11.2.3)"}};
@@ -0,0 +1 @@
+DATA.shards[4] = {"inf:type-identifiable": {"definition": "a <a href=\"#inf:reference\">referent</a> in a nonreal <q class=\"dq\">world</q> or <a href=\"#sem:mental-space\">mental space</a> (desire, hypothetical, negative, etc.) whose individual identity is unknown to speaker and hearer; all that is known about the nonreal referent is its <a href=\"#sem:type\">type</a>, as provided by the <a href=\"#cxn:common-noun\">common noun</a> and any <a href=\"#cxn:modifier\">modifiers</a> in the <a href=\"#cxn:referring-phrase\">referring phrase</a>. <em>Example</em>: in <em>An undergraduate student may take this course</em>, all that is known about the possible referent is that he or she belongs to the type <q>undergraduate student</q>. (Section 3.5)"}, "inf:type-identity": {"definition": "two referents are of the same type but not the same individual. <em>Example</em>: in <em>I took a red candy and Greg took a green one</em>, the referent of <em>green one</em> is the same type as the referent of <em>red candy</em>, but is a different individual. (Section 5.4)"}, "inf:verbal-contrast": {"definition": "a subtype of <a href=\"#inf:parallel-contrast\">parallel contrast</a> in which the <a href=\"#cxn:predicate\">predicates</a> in the two propositions have opposite <a href=\"#sem:meaning\">meanings</a>, while other parallel components of the proposition are members of <a href=\"#inf:poset\">posets</a>. <em>Example</em>: in <em>We will give our daughters to you and we will take your daughters for ourselves</em>, the verbs <q>give</q> and <q>take</q> have opposite meanings, and the other parallel parts of the two propositions that differ form the posets {our daughters, your daughters} and {you, ourselves}. (Section 11.4.1)"}, "sem:a-role": {"definition": "the <a href=\"#sem:agent\">agent</a> or agent-like <a href=\"#sem:central-participant\">central participant role</a> in the prototypical <a href=\"#sem:bivalent\">bivalent event</a> (that is, a breaking event) or the prototypical <a href=\"#sem:trivalent\">trivalent event</a> (that is, a giving event). <em>Examples</em>: in <em>Jack broke the window</em>, Jack plays the A role in the breaking event; and in <em>Jill gave Joe the keys</em>, Jill plays the A role in the giving event. (Section 6.3.1)"}, "sem:achievement": {"definition": "a type of <a href=\"#sem:aspect\">aspect</a> that indicates the success or failure in carrying out the <a href=\"#cxn:complement\">complement</a> <span class=\"separation\"/> <a href=\"#sem:event\">event</a>. Achievement is often, but not always, expressed by a <a href=\"#cxn:complement-taking-predicate\">complement-taking predicate</a> in a <a href=\"#cxn:complement-clause-construction\">complement clause construction</a>. <em>Example</em>: in <em>She managed to solve the riddle, managed</em> expresses achievement \u2013 namely, the successful execution of the complement event of solving the riddle. (Section 18.2.2)"}, "sem:action-concept": {"definition": "a concept belonging to a <a href=\"#def:semantic-classes\">semantic class</a> that is <a href=\"#sem:relational\">relational</a>, <a href=\"#sem:dynamic\">dynamic</a>, and <a href=\"#sem:transitory\">transitory</a>. <em>Example</em>: motion events such as running, or transfer events such as giving, are action concepts \u2013 they involve change but come to an end. (Section 2.1; <strong>Chapters 6\u20137</strong> cover a wide range of action concepts.)"}, "sem:additive": {"definition": "a relation between two or more <a href=\"#sem:entity\">entities</a> such that the entities are construed as combined in a sort of totality. The additive relation may be construed as a <a href=\"#inf:complex-figure\">complex figure</a>, as in <em>The robins drank water and the juncos ate fennel seeds</em>, or in a <a href=\"#inf:figure-ground\">figure\u2013ground</a> relation, as in <em>Besides missing my bus, I got my feet all wet</em>. The additive relation is considered the prototype for <a href=\"#cxn:conjunctive-coordination\">conjunctive coordination</a>. (Section 15.2.1)"}, "sem:agent": {"definition": "a <a href=\"#sem:semantic-role\">semantic role</a> that includes <a href=\"#sem:participant-role\">participant roles</a> for a <a href=\"#sem:participant-role\">participant</a> that volitionally initiates an event. <em>Example</em>: in <em>Jack broke the window</em>, Jack volitionally initiates the breaking event. (Section 6.1.2)"}, "sem:agentive-change-of-state-event": {"definition": "a <a href=\"#sem:change-of-state-event\">change of state event</a> in which an external volitional <a href=\"#sem:agent\">agent</a> brings about a change in a <a href=\"#sem:patient\">patient</a> such that the patient enters a resulting <a href=\"#sem:state\">state</a>. <em>Example</em>: the event of a person drying dishes is an agentive change of state event. (Section 6.2.1)"}, "sem:animate": {"definition": "a semantic <u>category</u> of <a href=\"#sem:object-concept\">objects</a> that denotes animate beings. <em>Example</em>: <em>cat</em> denotes an animate entity. The term <q>animate</q> is often used to contrast with <a href=\"#sem:human\">human</a>, and therefore often is used to refer only to nonhuman animates. (Section 3.1.2)"}, "sem:antecedent-role": {"definition": "a <a href=\"#sem:participant-role\">participant role</a> that is antecedent to the participant role expressed as <a href=\"#inf:object-argument\">object</a> in the <a href=\"#sem:causal-chain\">causal chain</a> / <a href=\"#sem:causal-structure\">causal structure</a> of an <a href=\"#sem:event\">event</a>. <em>Example</em>: in <em>Jack broke the window with a hammer</em>, the hammer is antecedent to the window in the breaking causal chain (Jack &rarr; hammer &rarr; window), and the window is expressed as object. (Section 6.1.2)"}, "sem:anterior": {"definition": "a temporal sequential relation between two <a href=\"#sem:event\">events</a> such that the following event serves as the reference point for the preceding event. <em>Example</em>: in <em>He washed the car before driving to the party</em>, washing the car has an anterior temporal relation with respect to driving to the party. Used to describe a sequential temporal relation between events in a <a href=\"#inf:figure-ground\">figure\u2013ground information packaging</a>. (Section 15.1.3)"}, "sem:apodosis": {"definition": "the proposition or event denoted by an <a href=\"#cxn:apodosis-clause\">apodosis clause</a>. <em>Example</em>: in <em>If you press this button, the door will open</em>, <em>the door will open</em> is the apodosis; <em>If you press this button</em> is the <a href=\"#cxn:protasis-clause\">protasis</a>. Since the conditional relations are defined in terms of both logical implication and causal relation, the semantic use of <q>apodosis</q> can be distinguished as <q>apodosis proposition</q> or <q>apodosis event</q>. (Section 17.3.1)"}, "sem:application-event": {"definition": "an <a href=\"#sem:event\">event</a> describing placing or applying one <a href=\"#sem:object-concept\">object</a> onto (2-dimensional) or into (3-dimensional) another object. <em>Examples</em>: smearing (2-dimensional) and loading (3-dimensional) are application events. (Section 7.3.2)"}, "sem:apprehensional": {"definition": "the semantic relation between two <a href=\"#sem:event\">events</a> where one event serves as the opposite of the intended outcome of bringing about the other event. In this respect, the apprehensional relation is a <q class=\"dq\">negative</q> version of the <a href=\"#sem:purpose\">purpose</a> relation. <em>Examples</em>: <em>I grabbed a stick lest he attack me</em> is a <a href=\"#inf:figure-ground\">figure\u2013ground construal</a> of the simultaneous relation in an <a href=\"#cxn:adverbial-clause-construction\">adverbial clause construction</a>, and <em>Grab a stick or he will attack you</em> is a <a href=\"#inf:complex-figure\">complex figure construal</a> of the relation in a <a href=\"#cxn:coordinate-clause-construction\">coordinate clause construction</a>. In the figure\u2013ground construal, the <q class=\"dq\">negatively intended</q> event is construed as the ground. As with the purpose relation, the apprehensional event is unrealized; the complex figure construal is possible because the <a href=\"#cxn:matrix-clause\">matrix clause</a> event is also unrealized. (Section 15.3.1)"}, "sem:arrival": {"definition": "the final phase of the <a href=\"#sem:path-event\">path</a> in a <a href=\"#sem:motion-event\">motion event</a>. <em>Example</em>: in <em>He went from the tree to the house</em>, the path oblique phrase <em>to the house</em> denotes the arrival phase of the motion event. (Section 14.4)"}, "sem:aspect": {"definition": "how an event unfolds over time. The semantics of aspectual structure is not discussed in detail in this textbook. However, certain basic aspectual distinctions are discussed in Section 6.2.2: <a href=\"#sem:dynamic\">dynamic</a> and <a href=\"#sem:stative\">stative</a>, <a href=\"#sem:punctual\">punctual</a> and <a href=\"#sem:durative\">durative</a>, and <a href=\"#sem:telic\">telic</a> and <a href=\"#sem:atelic\">atelic</a>. (Sections 6.1.1, 6.2.2)"}, "sem:atelic": {"definition": "an <a href=\"#sem:event\">event</a> in which the relevant <a href=\"#sem:participant-role\">participant</a> does not end up in a <q class=\"dq\">natural</q> result <a href=\"#sem:state\">state</a>. <em>Example</em>: in <em>I walked in the park</em>, there is not a natural result state for my walking, and so the event is atelic. (Section 6.2.1)"}, "sem:base-event": {"definition": "the <a href=\"#sem:event\">event</a> that is expressed in the <a href=\"#cxn:basic-voice\">basic voice construction</a>, with its set of <a href=\"#sem:central-participant\">central</a> and <a href=\"#sem:peripheral-participant\">peripheral participants</a> in their prototypical level of <a href=\"#inf:topicality\">salience</a>/<a href=\"#inf:topicality\">topicality</a>, whose <a href=\"#sem:valency\">valency</a> is considered basic for that event semantic class. <em>Example</em>: in <em>Fred baked me a shepherd's pie</em>, the base event is Fred baking the pie (i.e., excluding transferring the pie to me). (Section 9.1)"}, "sem:beneficiary": {"definition": "a <a href=\"#sem:semantic-role\">semantic role</a> including <a href=\"#sem:participant-role\">participant roles</a> for a <a href=\"#sem:participant-role\">participant</a> that is positively affected by the outcome of the <a href=\"#sem:event\">event</a>. <em>Example</em>: in <em>Terry made lunch for Sandy</em>, Sandy is positively affected by the outcome of the event. (Section 6.1.2)"}, "sem:bivalent": {"definition": "an event with a <a href=\"#sem:valency\">valency</a> of two \u2013 that is, with two <a href=\"#sem:central-participant\">central participant roles</a>. <em>Example</em>: drinking is a bivalent event, with the two central roles of drinker and drink. (Section 6.1.2)"}, "sem:bodily-action": {"definition": "the <a href=\"#sem:event\">event</a> class of normally uncontrolled actions involving one's body. <em>Example</em>: coughing is a bodily action. (Section 6.3.3)"}, "sem:bodily-motion-event": {"definition": "a <a href=\"#sem:monovalent\">monovalent event</a> involving an internal bodily motion. <em>Example</em>: <em>stretch out (oneself)</em> expresses a bodily motion event. (Section 7.2)"}, "sem:body-care-event": {"definition": "a <a href=\"#sem:monovalent\">monovalent event</a> involving a person acting on that person's own body, generally for grooming or hygiene. <em>Examples</em>: <em>shave</em> and <em>wash (oneself)</em> express body care events. (Section 7.2)"}, "sem:body-part-relation": {"definition": "a relation between a person and a physical body part of hers or his. Example: <em>the child's arm</em> is a <a href=\"#cxn:possession-construction\">possession construction</a> expressing a body part relation. (Section 4.1.4)"}, "sem:body-position-event": {"definition": "the event class of maintaining a particular body posture or position. <em>Example</em>: standing is a body position event. (Section 6.3.3)"}, "sem:causal": {"definition": "the semantic relation between two <a href=\"#sem:event\">events</a> where one event causes the other. <em>Example</em>: <em>I left the party because I was tired</em> is a <a href=\"#inf:figure-ground\">figure\u2013ground construal</a> of the simultaneous relation in an <a href=\"#cxn:adverbial-clause-construction\">adverbial clause construction</a>, and <em>I was tired and (so) I left the party</em> is a <a href=\"#inf:complex-figure\">complex figure construal</a> of the relation in a <a href=\"#cxn:coordinate-clause-construction\">coordinate clause construction</a>. In the figure\u2013ground construal, the causing event (the <a href=\"#sem:protasis\">protasis</a>; Section 17.3.2) is construed as the ground, and expressed in the <a href=\"#cxn:adverbial-dependent-clause\">adverbial dependent clause</a>. Causal relations also occur in <a href=\"#sem:conditional-relation\">conditional</a>, <a href=\"#sem:concessive-relation\">concessive</a>, <a href=\"#cxn:concessive-conditional-construction\">concessive conditional</a>, and <a href=\"#cxn:comparative-conditional-construction\">comparative conditional constructions</a>. Causal relations are divided into <a href=\"#sem:content-causal-relation\">content</a>, <a href=\"#sem:epistemic-causal-relation\">epistemic</a>, and <a href=\"#sem:speech-act-causal-relation\">speech act relations</a>. (Sections 15.3.1, 17.2.1, 17.3.2)"}, "sem:causal-chain": {"definition": "a <a href=\"#sem:causal-structure\">causal / force dynamic structure</a> in which one <a href=\"#sem:participant-role\">participant</a> acts on a second participant, which acts on a third participant, and so on. <em>Example</em>: in <em>Jack broke the window with a hammer</em>, Jack acts on the hammer (grasping and moving it), and the hammer acts on the window (breaking it). A causal chain is often represented with arrows: Jack &rarr; hammer &rarr; window. (Sections 6.1.1, <strong>6.1.2</strong>)"}, "sem:causal-structure": {"definition": "the interactions among participants in an event, specifically causal interactions (although there are other types of interactions among participants in an event which are subsumed under the term). <em>Example</em>: in <em>The cats scratched the furniture</em>, the cats act on the furniture, and the furniture undergoes a change of state. The causal structure of events that is expressed by a single <a href=\"#cxn:clause\">argument structure construction</a> in a single <a href=\"#cxn:clause\">clause</a> is generally in the form of a <a href=\"#sem:causal-chain\">causal chain</a>. (Sections 6.1.1, <strong>6.1.2</strong>)"}, "sem:causative-event": {"definition": "an <a href=\"#sem:event\">event</a> consisting of a <a href=\"#inf:topicality\">salient</a> external <a href=\"#sem:causer\">causer</a> <span class=\"separation\"/> <a href=\"#sem:participant-role\">participant role</a> added to the <a href=\"#sem:causal-chain\">causal chain</a> of a <a href=\"#sem:base-event\">base event</a>. <em>Example</em>: <em>Fred made me fill out the questionnaire</em> is a causative event since an external causer (Fred) is added to the base event of filling out the questionnaire. (Section 9.2)"}, "sem:cause": {"definition": "a <a href=\"#sem:semantic-role\">semantic role</a> including <a href=\"#sem:participant-role\">participant roles</a> for a <a href=\"#sem:participant-role\">participant</a>, usually an event, that causes the <a href=\"#sem:event\">event</a> expressed by the <a href=\"#cxn:predicate\">predicate</a>. <em>Example</em>: in <em>The house collapsed from neglect</em>, the neglect is the cause of the house collapsing. (Section 6.1.2)"}, "sem:causee": {"definition": "in a <a href=\"#sem:causative-event\">causative event</a>, the <a href=\"#sem:participant-role\">participant role</a> that is the initiator of the <a href=\"#sem:causal-chain\">causal chain</a> of the <a href=\"#sem:base-event\">base event</a>. <em>Example</em>: in <em>Sandra had Phil sweep the patio</em>, Phil fills the participant role of causee because Phil is the initiator of the sweeping event. The term <q>causee</q> is used only when there is a <a href=\"#sem:causer\">causer</a> in the event as well. (Section 9.2)"}, "sem:causer": {"definition": "a <a href=\"#sem:participant-role\">participant role</a> which names an external cause that brings about an event, and is conceptualized as a <a href=\"#sem:central-participant\">central participant</a> in the <a href=\"#sem:event\">event</a>. <em>Example</em>: in <em>Harry made the antelope jump</em>, Harry is in the causer role. (Sections 7.4, 9.2)"}, "sem:central-participant": {"definition": "certain <a href=\"#sem:participant-role\">participants</a> are considered to be more central to the <a href=\"#sem:event\">event</a>, in particular those that initiate the action and those that are most strongly affected by the action. <em>Example</em>: in an eating event, the eater and the food are the more central participants, in that the eater initiates the action and the food is completely affected by the action. In contrast, the place where the eating takes place is a <a href=\"#sem:peripheral-participant\">peripheral participant</a> in the action. (Section 6.1.1)"}, "sem:change-in-position-event": {"definition": "a <a href=\"#sem:monovalent\">monovalent event</a> involving a person changing their bodily position. <em>Example</em>: <em>sit</em> and <em>lean</em> express change in body posture events. (Section 7.2)"}, "sem:change-of-state-event": {"definition": "an <a href=\"#sem:event\">event</a> in which a <a href=\"#sem:participant-role\">participant</a>, the <a href=\"#sem:patient\">patient</a>, undergoes a change such that the patient enters a resulting <a href=\"#sem:state\">state</a>, usually a change of physical state. <em>Example</em>: the event of dishes becoming dry is a change of state event. (Sections 6.1.2, <strong>6.2.1</strong>)"}, "sem:cognition-event": {"definition": "an <a href=\"#sem:experiential-event\">experiential event</a> involving an <a href=\"#sem:experiencer\">experiencer</a>'s cognition directed toward a <a href=\"#sem:stimulus\">stimulus</a>. <em>Example</em>: <em>Tim thought about the war</em> is an example of a cognition event. (Section 7.4)"}, "sem:combining-event": {"definition": "an <a href=\"#sem:event\">event</a> describing the combining of two <a href=\"#sem:object-concept\">objects</a>. <em>Example</em>: blending is a combining event. (Section 7.3.2)"}, "sem:comitative": {"definition": "a <a href=\"#sem:semantic-role\">semantic role</a> including <a href=\"#sem:participant-role\">participant roles</a> for a <a href=\"#sem:participant-role\">participant</a> that accompanies another participant, usually the <a href=\"#sem:agent\">agent</a>. <em>Example</em>: in <em>I went to the concert with Carol</em>, Carol is in the comitative role. (Section 6.1.2)"}, "sem:commentative-event": {"definition": "an <a href=\"#sem:evaluative-event\">evaluative event</a> in which an evaluative judgment about a <a href=\"#sem:proposition\">proposition</a> expressed by the <a href=\"#cxn:complement\">complement</a> of the commentative event is made, and there is a <a href=\"#sem:positive-epistemic-stance\">positive epistemic stance</a> by the speaker toward the proposition. <em>Example</em>: in <em>Nancy is glad that Joe won the election</em>, the commentative predicate <em>is glad</em> expresses Nancy's evaluation of Joe's winning the election, and also presupposes that the speaker believes that Joe indeed won the election. (Section 18.2.2)"}, "sem:comparative-conditional-relation": {"definition": "a relation between two events, each on a <a href=\"#sem:gradable-predicative-scale\">gradable predicative scale</a>, such that an event at one degree on the first predicative scale causes an event at the corresponding degree on the second predicative scale. <em>Example</em>: <em>The longer that Bill had to wait, the angrier he got</em> is an instance of the comparative conditional relation and construction: a degree of length of time that Bill had to wait can (in a <a href=\"#sem:generic-conditional-relation\">generic conditional</a>) or does (in an ordinary, specific <a href=\"#sem:conditional-relation\">conditional</a>) cause the occurrence of the corresponding degree of Bill's anger. (Section 17.4.1)"}, "sem:comparee": {"definition": "in a <a href=\"#cxn:comparative-construction\">comparative construction</a> or <a href=\"#cxn:equative-construction\">equative construction</a>, the <a href=\"#inf:reference\">referent</a> whose position on the <a href=\"#sem:gradable-predicative-scale\">gradable predicative scale</a> is specified relative to the position of the <a href=\"#sem:standard\">standard</a> on the predicative scale. <em>Example</em>: in the comparative construction <em>Your cat is bigger than my dog</em>, the cat is the comparee \u2013 it is asserted to exceed the dog on the scale of size. (Sections 17.2.1, 17.2.4)"}, "sem:concessive-conditional-relation": {"definition": "a <a href=\"#sem:causal\">causal relation</a> between a set of <a href=\"#sem:event\">events</a> that are associated with a <a href=\"#sem:scalar-model\">scalar model</a> on the one hand, and another event, such that the other event would occur under the entire range of conditions described in the scalar model associated with the first set of events. <em>Example</em>: <em>However much advice you give him, he does exactly what he wants to do</em> is an instance of the concessive conditional relation and construction \u2013 the <a href=\"#cxn:protasis-clause\">protasis</a> <em>However much advice you give him</em> introduces a scalar model of your giving him a full range of amounts of advice; and the <a href=\"#cxn:apodosis-clause\">apodosis</a> <em>he does exactly what he wants to do</em> describes the event that occurs or would occur under any of those conditions. The speaker has a neutral epistemic stance toward the range of events associated with the scalar model. The apodosis has an unexpected causal relation with respect to the set of events that make up the protasis. A concessive conditional may express a <a href=\"#sem:content-causal-relation\">content</a>, <a href=\"#sem:epistemic-causal-relation\">epistemic</a>, or <a href=\"#sem:speech-act-causal-relation\">speech act causal relation</a>. (Section 17.3.3)"}, "sem:concessive-relation": {"definition": "a relation between two <a href=\"#sem:event\">events</a> such that there is an expected <a href=\"#sem:causal\">causal relation</a> between the two events, but the opposite of the second event, expressed in the <a href=\"#cxn:apodosis-clause\">apodosis</a>, unexpectedly occurs. <em>Example</em>: <em>Although it was raining, I went out</em> is an instance of a concessive relation and construction: the expected causal relation is that rain would lead to my staying in; but in fact I went out. The speaker has a <a href=\"#sem:positive-epistemic-stance\">positive epistemic stance</a> toward the concessive construction. A concessive may express a <a href=\"#sem:content-causal-relation\">content</a>, <a href=\"#sem:epistemic-causal-relation\">epistemic</a>, or <a href=\"#sem:speech-act-causal-relation\">speech act causal relation</a>. (Section 17.3.2)"}, "sem:concomitant-role": {"definition": "a subset of <a href=\"#sem:antecedent-role\">antecedent roles</a> that includes <a href=\"#sem:participant-role\">participant roles</a> in between the participant role expressed as <a href=\"#cxn:subject-phrase\">subject</a> and the participant role expressed as <a href=\"#inf:object-argument\">object</a>. <em>Example</em>: in <em>Jack broke the window with a hammer</em>, the hammer is antecedent to the window in the breaking causal chain (Jack &rarr; hammer &rarr; window), and the window is expressed as object; and it is also <a href=\"#sem:subsequent-role\">subsequent</a> to Jack in the breaking <a href=\"#sem:causal-chain\">causal chain</a>, and Jack is expressed as subject. (Section 6.1.2)"}, "sem:conditional-relation": {"definition": "a semantic relation between two <a href=\"#sem:event\">events</a> that involves a logical material implication relation between their corresponding <a href=\"#sem:proposition\">propositions</a>, some type of <a href=\"#sem:causal\">causal relation</a> between the corresponding <a href=\"#sem:event\">events</a>, and non-positive <a href=\"#sem:epistemic-stance\">epistemic stance</a>. <em>Example</em>: <em>If you press this button, the door will open</em> is an instance of the conditional relation and construction. The causally antecedent proposition is the <a href=\"#sem:protasis\">protasis</a>, and the causally consequent proposition is the <a href=\"#sem:apodosis\">apodosis</a>. A conditional may express a <a href=\"#sem:content-causal-relation\">content</a>, <a href=\"#sem:epistemic-causal-relation\">epistemic</a> or <a href=\"#sem:speech-act-causal-relation\">speech act causal relation</a>. (Section 17.3.1)"}, "sem:consecutive": {"definition": "a sequential relation between two <a href=\"#sem:event\">events</a>, as expressed by a <a href=\"#inf:complex-figure\">complex figure</a> construal of the relation between the two events. <em>Example</em>: in <em>He washed the car and drove to the party</em>, the washing of the car and the driving to the party are in a consecutive relation. Used to describe the temporal relation between two events in a <a href=\"#inf:complex-figure\">complex figure information packaging</a>. (Section 15.1.3)"}, "sem:contact-by-impact-event": {"definition": "an <a href=\"#sem:event\">event</a> describing contact by impact. <em>Example</em>: hitting is a contact by impact event. (Section 7.3.2)"}, "sem:content-causal-relation": {"definition": "the semantic relation in a <a href=\"#sem:conditional-relation\">conditional</a>, <a href=\"#sem:causal\">causal</a>, <a href=\"#sem:concessive-relation\">concessive</a>, or <a href=\"#cxn:concessive-conditional-construction\">conditional concessive construction</a> that expresses a <a href=\"#sem:causal\">causal relation</a> between events in the world. <em>Example</em>: in <em>If you press this button, the door will open</em>, there is a content causal relation between the event of your pressing the button and the event of the door opening. A content causal relation contrasts with an <a href=\"#sem:epistemic-causal-relation\">epistemic causal relation</a> or a <a href=\"#sem:speech-act-causal-relation\">speech act causal relation</a>. (Section 17.3.1)"}, "sem:contextual": {"definition": "an entity defined relative to some factor in the speech act context. <em>Examples</em>: <em>this table</em> is defined as a table but relative to the location of the speaker (<em>this</em> expresses the contextual component); <em>the table</em> is defined as a table relative to the shared knowledge of speaker and hearer (<em>the</em> expresses the contextual component). (Section 3.1.1)"}, "sem:damage-event": {"definition": "an <a href=\"#sem:event\">event</a> describing material damage to an <a href=\"#sem:object-concept\">object</a>. <em>Example</em>: scratching something is a damage event. (Section 7.3.2)"}, "sem:degree": {"definition": "for scalar concepts, a value on the scale that may be expressed by a distinct word. <em>Example</em>: in <em>very long</em>, the <a href=\"#cxn:admodifier\">admodifier</a> <em>very</em> indicates that the value on the scale of length is beyond the normal value implicit in the word <em>long</em>. (Section 2.2.2)"}, "sem:deontic-modality": {"definition": "a type of <a href=\"#sem:modality\">modality</a> which expresses the attitude of a speaker or other conceiver toward performing an <a href=\"#sem:action-concept\">action</a> (i.e. making the action come true). <em>Example</em>: <em>Jerry must get his hair cut</em> is an instance of deontic modality: the speaker expresses her attitude that the situation necessarily will come about. Deontic modality is construed broadly in this textbook, to include wishes as well as intentions and commands, attitude toward oneself performing the action as well as toward others performing the action, and to include <a href=\"#sem:objective\">objective</a> as well as <a href=\"#sem:subjective\">subjective</a> characterization of the attitude. (Sections 12.1, 12.4)"}, "sem:departure": {"definition": "the initial phase of the <a href=\"#sem:path-event\">path</a> in a <a href=\"#sem:motion-event\">motion event</a>. <em>Example</em>: in <em>He went from the tree to the house</em>, the path oblique phrase <em>from the tree</em> denotes the departure phase of the motion event. (Section 14.4)"}, "sem:dependent-time-reference": {"definition": "in a <a href=\"#cxn:complement-clause-construction\">complement clause construction</a>, this is the <a href=\"#sem:meaning\">semantic</a> property that the time reference of the <a href=\"#cxn:complement\">complement</a> <span class=\"separation\"/> <a href=\"#sem:event\">event</a> is determined by the time reference of the <a href=\"#cxn:matrix-clause\">matrix clause</a> <span class=\"separation\"/> <a href=\"#sem:event\">event</a>. <em>Example</em>: in <em>Sally persuaded John to make the cake</em>, the time reference of John's making the cake is dependent on the time reference of Sally's persuading him \u2013 it must follow the persuading event. (Section 18.2.2)"}, "sem:desiderative-event": {"definition": "an <a href=\"#sem:event\">event</a> that expresses a desire toward the realization of a future event that is expressed by the complement. <em>Example</em>: in <em>Meagan wants to climb Mt. Baldy on Saturday, wants</em> denotes a desiderative event. Noonan (2007:135) includes intending events in the category of desiderative events. (Section 18.2.2)"}, "sem:directed-change": {"definition": "an <a href=\"#sem:event\">event</a> in which the change that a <a href=\"#sem:participant-role\">participant</a> undergoes in the course of an event is in one <q class=\"dq\">direction</q>. <em>Example</em>: in <em>The storm expanded</em>, there is a gradual unidirectional increase in size, and so the event is a directed change. (Section 6.2.1)"}, "sem:distal": {"definition": "a <a href=\"#sem:contextual\">contextual</a> category of <a href=\"#sem:spatial-deixis\">deixis</a> defined as away from the location of the speaker in the speech event. (Section 3.1.1)"}, "sem:durative": {"definition": "an <a href=\"#sem:event\">event</a> that is construed as taking place over a period of time. <em>Example</em>: <em>They inflated the balloon</em> is a durative event. (Section 6.2.1)"}, "sem:dynamic": {"definition": "a concept construed as involving change over the time course of the <a href=\"#sem:event\">event</a>. <em>Example</em>: walking involves change over the time course of the walking event. (Sections 2.1, 6.2.1)"}, "sem:emotion-event": {"definition": "an <a href=\"#sem:experiential-event\">experiential event</a> involving an <a href=\"#sem:experiencer\">experiencer</a>'s emotions directed toward a <a href=\"#sem:stimulus\">stimulus</a>. <em>Example</em>: <em>He fears dogs</em> is an example of an emotion event. (Section 7.4)"}, "sem:endpoint": {"definition": "a <a href=\"#sem:participant-role\">participant role</a> defined in terms of the <a href=\"#sem:participant-role\">participant</a> being acted upon by another participant in a <a href=\"#sem:causal-chain\">causal chain</a>. <em>Example</em>: in <em>The cats scratched the furniture</em>, the furniture is the endpoint of the causal chain [cats &rarr; furniture]. (Sections 6.1.1, 6.1.2)"}, "sem:entity": {"definition": "a superordinate category including <a href=\"#sem:object-concept\">object concepts</a>, <a href=\"#sem:property-concept\">property concepts</a>, and <a href=\"#sem:event\">event concepts</a>. (Section 2.1)"}, "sem:epistemic-causal-relation": {"definition": "the semantic relation in a <a href=\"#sem:conditional-relation\">conditional</a>, <a href=\"#sem:causal\">causal</a>, <a href=\"#sem:concessive-relation\">concessive</a>, or <a href=\"#cxn:concessive-conditional-construction\">conditional concessive construction</a> that expresses an epistemic inferential relation between two propositions. <em>Example</em>: in <em>If Professor Smith's door is closed, then she is not on campus</em>, there is an epistemic causal relation between the fact that Professor Smith's office door is closed and the inference that she is not on campus. An epistemic causal relation contrasts with a <a href=\"#sem:content-causal-relation\">content causal relation</a> and a <a href=\"#sem:speech-act-causal-relation\">speech act causal relation</a>. (Section 17.3.1)"}, "sem:epistemic-modality": {"definition": "a type of <a href=\"#sem:modality\">modality</a> that expresses the attitude of a speaker or other conceiver toward the truth of the situation described in the clause \u2013 that is, degree of certainty that the situation is true. <em>Example</em>: <em>Jerry might get his hair cut</em> is an instance of epistemic modality \u2013 the speaker is expressing a relatively neutral attitude toward whether the future situation will actually come about. Epistemic modality is construed broadly in this textbook, to include <a href=\"#sem:objective\">objective</a> as well as <a href=\"#sem:subjective\">subjective</a> characterization of the epistemic modal attitude. (Sections 12.1, 12.3.4)"}, "sem:epistemic-stance": {"definition": "the speaker's commitment to the actuality of the <a href=\"#sem:proposition\">proposition</a> expressed in a <a href=\"#cxn:clause\">clause</a>. Epistemic stance is normally <a href=\"#inf:pragmatic-presupposition\">presupposed</a>. Epistemic stance is divided by Fillmore (1990b) into three categories: <a href=\"#sem:positive-polarity\">positive</a>, <a href=\"#sem:neutral-epistemic-stance\">neutral</a>, and <a href=\"#sem:negative-polarity\">negative</a>. Others use a finer-grained categorization (e.g., partial positive and partial negative), and still others refer to a continuum of hypotheticality. Non-positive (i.e., neutral and negative) epistemic stances are referred to as <a href=\"#sem:hypothetical\">hypothetical</a>. (Section 17.3.1)"}, "sem:evaluative-event": {"definition": "an <a href=\"#sem:event\">event</a> in which an evaluative judgment is made about the truth of the <a href=\"#sem:proposition\">proposition</a> expressed in its <a href=\"#cxn:complement\">complement</a>. Evaluative events may assume different <a href=\"#sem:epistemic-stance\">epistemic stances</a> toward the proposition expressed in their complement. <a href=\"#sem:commentative-event\">Commentative events</a> assume a positive epistemic stance; <a href=\"#sem:hoping-event\">hoping</a> and <a href=\"#sem:fearing-event\">fearing events</a> assume a <a href=\"#sem:neutral-epistemic-stance\">neutral epistemic stance</a>; and <a href=\"#sem:wishing-event\">wishing events</a> assume a <a href=\"#sem:negative-epistemic-stance\">negative epistemic stance</a>. (Section 18.2.2)"}, "sem:event": {"definition": "a superordinate category including both <a href=\"#sem:action-concept\">action concepts</a> and <a href=\"#sem:state\">state concepts</a>. The term <q>event</q> has other <a href=\"#sem:meaning\">meanings</a>, including what we call a <a href=\"#sem:telic\">telic event</a>. Other terms listed above are also used for <q>event</q> as it is defined here. (Sections <strong>2.1</strong>, <strong>6.1.1</strong>)"}, "sem:event-oriented": {"definition": "a stative <a href=\"#cxn:element\">element</a> in a <a href=\"#cxn:stative-complex-predicate\">stative complex predicate</a> that describes a <a href=\"#sem:state\">state</a> of the <a href=\"#sem:event\">event</a> denoted by the complex predicate. <em>Example</em>: in English <em>I ate the carrots slowly, slowly</em> is a property of the event of eating. Event-oriented contrasts with <a href=\"#sem:participant-oriented\">participant-oriented</a>. (Section 14.1)"}, "sem:evidentiality": {"definition": "a category related to <a href=\"#sem:epistemic-modality\">epistemic modality</a> which indicates the epistemic justification for believing a <a href=\"#sem:proposition\">proposition</a>. <em>Example</em>: English <em>I hear you're going to Stanford this fall</em> is an evidential construction, using the first singular simple present form <em>I hear...</em>, which indicates that my evidence for your going to Stanford in the fall is hearsay. (Section 12.3.4)"}, "sem:existence-event": {"definition": "a situation in which the existence of some entity is presented. Existential situations favor a <a href=\"#inf:thetic\">thetic</a> construal. <em>Example</em>: <em>There are apples in the kitchen</em> expresses the existence of the relevant set of apples. (Section 11.3.1)"}, "sem:experiencer": {"definition": "the person who experiences the internal mental phenomenon or bodily sensation in an <a href=\"#sem:experiential-event\">experiential event</a>. <em>Example</em>: in <em>Freddy saw the bear</em>, Freddy is the experiencer. The experiencer is almost always human. (Sections 6.1.2, <strong>7.4</strong>)"}, "sem:experiential-event": {"definition": "an <a href=\"#sem:event\">event</a> that involves a human internal mental or bodily experience. (Sections 6.1.2, <strong>7.4</strong>)"}, "sem:expertum": {"definition": "the experiential event conceptualized as a participant. <em>Example</em>: in Y\u00f3r\u00f9b\u00e1 <em>\u00e8\u0323r\u00f9\u00b4 b\u00e0 m\u00ed</em> <q>I felt afraid</q> [lit. <q>fear fell on me</q>] <em>\u00e8\u0323r\u00f9\u00b4</em> <q>fear</q> is the expertum. (Section 7.4)"}, "sem:fearing-event": {"definition": "an <a href=\"#sem:evaluative-event\">evaluative event</a> in which a negative evaluative judgment about a <a href=\"#sem:proposition\">proposition</a> expressed by the <a href=\"#cxn:complement\">complement</a> of the commentative event is made, and there is a <a href=\"#sem:neutral-epistemic-stance\">neutral epistemic stance</a> by the speaker toward the proposition. <em>Example</em>: in <em>Jill fears that Donald has won the election</em>, the commentative predicate <em>fears</em> expresses Jill's evaluation of Donald's winning the election, and also presupposes that the speaker does not know whether Donald has won the election. (Section 18.2.2)"}, "sem:figure": {"definition": "the object in a spatial scene whose location or path of motion is being described relative to a <a href=\"#sem:ground\">ground</a>. <em>Example</em>: in <em>Meagan ran into the cave</em>, Meagan is the figure, and her path of motion is described relative to the location of the cave. (Sections 7.3.1, 14.5)"}, "sem:figure-ground-spatial-relation": {"definition": "a spatial relation that holds between two <a href=\"#sem:object-concept\">objects</a> such that the ground object functions as a reference point for locating the figure. <em>Example</em>: <em>the bicycle in the garage</em> is a <a href=\"#cxn:locative-modification-construction\">locative modification construction</a> that expresses a figure\u2013ground spatial relation between the bicycle and the garage. (Sections 4.1.4, 10.4.1)"}, "sem:force": {"definition": "a <a href=\"#sem:semantic-role\">semantic role</a> including <a href=\"#sem:participant-role\">participant roles</a> for a <a href=\"#sem:participant-role\">participant</a> that initiates an event but is not volitional (usually because it is not human), i.e. is not an <a href=\"#sem:agent\">agent</a>. <em>Example</em>: in <em>Lightning shattered the old tree</em>, the lightning initiates the shattering event but is not an agent. (Section 6.1.2)"}, "sem:future-oriented": {"definition": "the event in question is a future event from the reference time of the <a href=\"#sem:deontic-modality\">deontic modal</a> situation. <em>Examples</em>: in English <em>You may leave now</em>, a <a href=\"#sem:subjective\">subjective</a> deontic modal construction, the event is in the future from the speech act time (that is, simple future). In English <em>Carol intended to close the door</em>, an <a href=\"#sem:objective\">objective</a> deontic modal construction, the event is in the future from the reported deontic modal event time: that is, closing the door is projected to a future from the past event of Carol's having the intention. (Section 12.4)"}, "sem:gender-class": {"definition": "a <a href=\"#sem:meaning\">semantic</a> category that is expressed as an <a href=\"#str:indexation-feature\">indexation feature</a>, and covers both distinctions based primarily on sex and animacy (<q>gender</q>) and distinctions based on animacy, sex, and various semantic properties of inanimate \u2013 or at least nonhuman \u2013 <a href=\"#sem:object-concept\">objects</a>. (Section 4.4.2)"}, "sem:generic-conditional-relation": {"definition": "a subtype of the <a href=\"#sem:conditional-relation\">conditional relation</a> in which an event causes another event generically or habitually. <em>Example</em>: <em>If/When/Whenever a dog starts barking, I run away</em> is an instance of a generic conditional relation and construction \u2013 it doesn't describe a specific instance of a dog barking causing me to run away; instead, it describes a general or habitual pattern of this causal sequence of events. (Section 17.3.1)"}, "sem:gradable-predicative-scale": {"definition": "in a <a href=\"#cxn:comparative-construction\">comparative construction</a> or an <a href=\"#cxn:equative-construction\">equative construction</a>, the <a href=\"#cxn:predicate\">predicate</a> that defines the <a href=\"#sem:scalar-model\">scale</a> on which the <a href=\"#sem:comparee\">comparee</a> and <a href=\"#sem:standard\">standard</a> are located. <em>Example</em>: in <em>Your cat is as big as my dog</em>, size is the gradable predicative scale on which it is asserted that the position of the cat is the same as the position of the dog. (Section 17.2.1)"}, "sem:ground": {"definition": "the reference point for locating a <a href=\"#sem:figure\">figure</a> in a spatial scene. <em>Example</em>: in <em>Meagan ran into the cave</em>, the cave serves as the ground for locating the path of motion of Meagan. (Sections 7.3.1, 14.5)"}, "sem:hoping-event": {"definition": "an <a href=\"#sem:evaluative-event\">evaluative event</a> in which a positive evaluative judgment about a <a href=\"#sem:proposition\">proposition</a> expressed by the <a href=\"#cxn:complement\">complement</a> of the commentative event is made, and there is a <a href=\"#sem:neutral-epistemic-stance\">neutral epistemic stance</a> by the speaker toward the proposition. <em>Example</em>: in <em>Jill hopes that Joe won the election</em>, the commentative predicate <em>hopes</em> expresses Jill's evaluation of Joe's winning the election, and also presupposes that the speaker does not know whether Joe has won the election. (Section 18.2.2)"}, "sem:human": {"definition": "a semantic <u>category</u> of <a href=\"#sem:object-concept\">objects</a> that denote persons. <em>Example</em>: <em>woman</em> denotes a human. (Section 3.1.2)"}, "sem:hypothetical": {"definition": "a superordinate category covering any <a href=\"#sem:epistemic-stance\">epistemic stance</a> apart from positive epistemic stance \u2013 in particular, <a href=\"#sem:neutral-epistemic-stance\">neutral</a> and <a href=\"#sem:negative-epistemic-stance\">negative epistemic stances</a>. <em>Examples</em>: <em>If she comes, I will come too</em> (neutral epistemic stance) and <em>If she had come, I would have come too</em> (negative epistemic stance) are both instances of situations construed by the speaker as hypothetical. (Section 17.3.1)"}, "sem:inanimate": {"definition": "a semantic <u>category</u> of <a href=\"#sem:object-concept\">objects</a> that denotes inanimate entities. <em>Example</em>: <em>rock</em> denotes an inanimate entity. (Section 3.1.2)"}, "sem:independent-time-reference": {"definition": "in a <a href=\"#cxn:complement-clause-construction\">complement clause construction</a>, this is the <a href=\"#sem:meaning\">semantic</a> property that the time reference of the <a href=\"#cxn:complement\">complement</a> <span class=\"separation\"/> <a href=\"#sem:event\">event</a> is not determined by the time reference of the <a href=\"#cxn:matrix-clause\">matrix clause</a> <span class=\"separation\"/> <a href=\"#sem:event\">event</a>. <em>Example</em>: in <em>Sally thinks John made / is making / will make the cake</em>, the time reference of John's making the cake is independent of the time reference of Sally's thought. (Section 18.2.2)"}, "sem:ingestion-event": {"definition": "an <a href=\"#sem:event\">event</a> which describes the ingestion of food or drink by a person or animal, causing the food to disappear but also causing a change in the physiological state of the person/animal. <em>Example</em>: <em>Elena ate a lot of veggie chips</em> is an instance of an ingestion event. (Section 7.4)"}, "sem:initiator": {"definition": "a <a href=\"#sem:participant-role\">participant role</a> defined in terms of the <a href=\"#sem:participant-role\">participant</a> acting on another participant in a <a href=\"#sem:causal-chain\">causal chain</a>. <em>Example</em>: in <em>The cats scratched the furniture</em>, the cats are the initiator of the causal chain cats &rarr; furniture. (Sections 6.1.1, 6.1.2)"}, "sem:instrument": {"definition": "a <a href=\"#sem:semantic-role\">semantic role</a> including <a href=\"#sem:participant-role\">participant roles</a> for a <a href=\"#sem:participant-role\">participant</a> that is manipulated by the agent to bring about an <a href=\"#sem:event\">event</a>. <em>Example</em>: in <em>Jack broke the window with a rock</em>, the agent (Jack) manipulates the rock to bring about the breaking of the window. (Sections 6.1.2, <strong>6.2.1</strong>)"}, "sem:interaction-event": {"definition": "an <a href=\"#sem:event\">event</a> in which one <a href=\"#sem:participant-role\">participant</a> acts on a second participant, but the change that occurs to the second participant is at least partly independent of the <a href=\"#sem:force\">force</a> <u>transmitted</u> by the first participant. <em>Examples</em>: interaction events include <a href=\"#sem:pursuit-event\">pursuit events</a>, events involving two agents such as ordering someone (to do something) or supervising someone, and events involving an agent and an event, state, social institution, and so on, such as managing a budget, avoiding situations, or conforming to institutional standards. (Section 7.3)"}, "sem:killing-injuring-event": {"definition": "an <a href=\"#sem:event\">event</a> describing the injuring of an individual, including to the point that the individual dies. <em>Example</em>: stabbing is a killing/injuring event. (Section 7.3.2)"}, "sem:kinship-relation": {"definition": "a relation that holds between a person and certain other persons by biological relations, or social relations such as marriage, and other socially defined kin relations. <em>Example</em>: <em>my mother</em> is an instance of a <a href=\"#cxn:possession-construction\">possession construction</a> expressing a kinship relation. (Section 4.1.4)"}, "sem:knowledge-event": {"definition": "a <a href=\"#sem:propositional-attitude-event\">propositional attitude event</a> in which a <a href=\"#sem:positive-epistemic-stance\">positive epistemic stance</a> toward the relevant <a href=\"#sem:proposition\">proposition</a> expressed is presupposed to be taken by the <u>speaker</u>. <em>Example</em>: in <em>Sally knows that Donald won the election</em>, Sally's belief with respect to the proposition that Donald won the election is reported by the speaker; and, in addition, a <a href=\"#sem:positive-epistemic-stance\">positive epistemic stance</a> is taken by the speaker toward that proposition (i.e., the speaker believes that Donald indeed won the election). (Section 18.2.2)"}, "sem:less-affected-p": {"definition": "a <a href=\"#def:function\">function</a> related to the function of the <a href=\"#cxn:antipassive-construction\">antipassive construction</a>, in which the <a href=\"#sem:p-role\">P</a> <span class=\"separation\"/> <a href=\"#sem:participant-role\">participant</a> is less <a href=\"#cxn:affecting-verb\">affected</a> than it is in the equivalent event expressed by <a href=\"#cxn:transitive-construction\">transitive construction</a>. <em>Example</em>: in <em>The coyote chewed on the deer bone</em>, the deer bone is a less affected P participant than in the transitive <em>The coyote chewed the deer bone</em>. (Section 8.4)"}, "sem:less-individuated-p": {"definition": "the basic <a href=\"#def:function\">function</a> of the <a href=\"#cxn:antipassive-construction\">antipassive construction</a>, in which the <a href=\"#sem:p-role\">P</a> <span class=\"separation\"/> <a href=\"#sem:participant-role\">participant</a> is less individuated (indefinite, nonspecific, generic, or even simply plural), since less individuation is an indicator of lower <a href=\"#inf:topicality\">salience</a>. <em>Example</em>: in West Greenlandic <em>inun-nik tuqut-si-vuq</em> <q>He killed people</q>, the P participant <q>people</q> is a plural and generic referent. (Section 8.4)"}, "sem:maleficiary": {"definition": "a <a href=\"#sem:semantic-role\">semantic role</a> including <a href=\"#sem:participant-role\">participant roles</a> for a <a href=\"#sem:participant-role\">participant</a> that is negatively affected by the outcome of the <a href=\"#sem:event\">event</a>. <em>Example</em>: in <em>My car broke down on me</em>, I am a maleficiary: I am negatively affected by the outcome of the event. (Section 6.1.2)"}, "sem:manipulative-event": {"definition": "an <a href=\"#sem:event\">event</a> where an <a href=\"#sem:agent\">agent</a> acts to bring about the event expressed by the <a href=\"#cxn:complement\">complement</a>. <em>Example</em>: in <em>Bruce convinced Greg to take him to San Rafael, convinced</em> denotes a manipulative event. Manipulative events include causative and permissive events. The complement event of manipulative events has <a href=\"#sem:dependent-time-reference\">dependent time reference</a>. (Section 18.2.2)"}, "sem:manner-of-motion-event": {"definition": "an event that describes motion of a <a href=\"#sem:figure\">figure</a> in terms of how the figure travels. <em>Example</em>: in <em>Sam strode into the room, stride</em> is a manner of motion verb expressing a manner of motion event. (Sections 7.3.1, 14.2)"}};
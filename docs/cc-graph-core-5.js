@@ -0,0 +1 @@
+DATA.shards[5] = {"sem:meaning": {"definition": "the information content that is conventionally conveyed by a <a href=\"#cxn:construction\">construction</a>. <em>Example</em>: a word such as <em>square</em> has the meaning of a particular shape. (Section 1.1)"}, "sem:means": {"definition": "the semantic relation between two <a href=\"#sem:event\">events</a> where one event accompanies the other event and further characterizes the other event in some way. <em>Example</em>: <em>He got into the army by lying about his age</em> is a <a href=\"#inf:figure-ground\">figure\u2013ground construal</a> of the means relation in an <a href=\"#cxn:adverbial-clause-construction\">adverbial clause construction</a>, and <em>He lied about his age and got into the army</em> is a <a href=\"#inf:complex-figure\">complex figure construal</a> of the relation in a <a href=\"#cxn:coordinate-clause-construction\">coordinate clause construction</a>. In the figure\u2013ground construal, the accompanying event is construed as the ground. (Section 15.3.1)"}, "sem:mental-space": {"definition": "a context of belief, desire, or another mental state of a person which includes <a href=\"#sem:proposition\">propositions</a> that are taken to be true in that context, and <a href=\"#sem:entity\">entities</a> that are taken to exist in that context. <em>Example</em>: in <em>Harry thinks that a mountain lion is in the pine tree</em>, the proposition that there is a mountain lion in the pine tree, and the existence of that particular mountain lion, is in the mental space of Harry's beliefs. (Sections 17.3.1, 18.2.2)"}, "sem:mirative": {"definition": "a speaker attitude of surprise toward the <a href=\"#sem:propositional-content\">propositional content</a> in the speaker's utterance. <em>Example</em>: Lhasa Tibetan has a distinct <a href=\"#cxn:construction\">construction</a> for expressing the mirative function with the form <em>'dug</em>: <em>nga-rdngul tog=tsam <strong>'dug</strong></em> <q>I have some money</q> expresses not only that the speaker has money, but that she is surprised to find this out. (Sections 12.1, 12.5.2)"}, "sem:modality": {"definition": "a category that represents a situation in terms of its reality status with respect to the speaker or another conceiver, including degree of certainty that the situation holds in reality (<a href=\"#sem:epistemic-modality\">epistemic modality</a>) and (un)desirability of, or intention to bring about, a not currently true situation (<a href=\"#sem:deontic-modality\">deontic modality</a>). (Section 12.1)"}, "sem:monovalent": {"definition": "an event with a <a href=\"#sem:valency\">valency</a> of one \u2013 that is, with one <a href=\"#sem:central-participant\">central participant role</a>. <em>Example</em>: sleeping is a monovalent event. (Section 6.1.2)"}, "sem:motion-event": {"definition": "a <a href=\"#sem:monovalent\">monovalent event</a> involving motion of a <a href=\"#sem:participant-role\">participant</a> from one place to another (translational motion). <em>Examples</em>: <em>fly</em> and <em>go</em> express motion events. Motion events contrast with <a href=\"#sem:bodily-motion-event\">bodily motion events</a>: motion events involve movement from one location to another, whereas bodily motion events involve internal motion of a body part. Motion events may express <a href=\"#sem:path-event\">path of motion</a> or <a href=\"#sem:manner-of-motion-event\">manner of motion</a>, or both. Motion events may be divided into <a href=\"#sem:departure\">departure</a>, <a href=\"#sem:passing\">passing</a>, and <a href=\"#sem:arrival\">arrival</a> phases of the path of motion. (Sections 7.2, 7.3.1, 14.4)"}, "sem:necessary-participant-sharing": {"definition": "in a <a href=\"#cxn:complement-clause-construction\">complement clause construction</a>, this is the <a href=\"#sem:meaning\">semantic</a> property that the <a href=\"#sem:meaning\">meaning</a> of the <a href=\"#cxn:complement-taking-predicate\">complement-taking predicate</a> requires that one or more <a href=\"#sem:participant-role\">participants</a> of the <a href=\"#cxn:complement\">complement</a> <span class=\"separation\"/> <a href=\"#sem:event\">event</a> is shared with the event denoted by the complement-taking predicate. <em>Example</em>: in <em>I told Fred to bring me a screwdriver</em>, the <a href=\"#sem:agent\">agent</a> of the complement bringing event is necessarily also the <a href=\"#sem:causee\">causee</a> of the manipulative event of telling. (Section 18.2.2)"}, "sem:negative-circumstantial": {"definition": "the semantic relation between two <a href=\"#sem:event\">events</a> where one event does not accompany the other event and further characterizes the other event in some way. In this respect, the negative circumstantial relation is a <q class=\"dq\">negative</q> version of the <a href=\"#sem:means\">means</a> or positive circumstantial relation. <em>Example</em>: <em>She carried the punch into the living room without spilling a drop</em> is a <a href=\"#inf:figure-ground\">figure\u2013ground construal</a> of the negative circumstantial relation in an <a href=\"#cxn:adverbial-clause-construction\">adverbial clause construction</a>, and <em>She carried the punch into the living room, and she didn't spill a drop!</em> is a <a href=\"#inf:complex-figure\">complex figure construal</a> of the relation in a <a href=\"#cxn:coordinate-clause-construction\">coordinate clause construction</a>. In the figure\u2013ground construal, the non-accompanying event is construed as the ground. (Section 15.3.1)"}, "sem:negative-epistemic-stance": {"definition": "a negative commitment on the part of the speaker to the actuality of a <a href=\"#sem:proposition\">proposition</a> expressed in a <a href=\"#cxn:clause\">clause</a>. <em>Example</em>: in <em>If you had pressed this button, the door would have opened</em>, the speaker has expressed a commitment to the proposition that you didn't press the button. (Section 17.3.1)"}, "sem:negative-polarity": {"definition": "indicates that the situation expressed in the utterance is false. <em>Example</em>: <em>Kit didn't find his glasses</em> expresses that Kit finding his glasses is false. This is the prototypical use of negative polarity. Negative polarity may be used to reject other aspects of the construal of the situation expressed in the utterance, as in <em>Kit didn't like the movie \u2013 he loved it!</em> (where the degree expressed by <em>like</em> is the information rejected). (Section 12.1)"}, "sem:neutral-epistemic-stance": {"definition": "no commitment on the part of the speaker to the actuality of a <a href=\"#sem:proposition\">proposition</a> expressed in a <a href=\"#cxn:clause\">clause</a>. <em>Example</em>: in <em>If you press this button, the door will open</em>, the speaker does not have a commitment to either your pressing the button or your not pressing the button. (Section 17.3.1)"}, "sem:nonrelational": {"definition": "a concept that does not inherently make reference to another entity: a property is a property of something, an action is performed by someone or something, but most members of the object class just <q class=\"dq\">are</q> without making reference to another entity. <em>Example</em>: a brick is a nonrelational entity: its existence is not dependent on another entity in the way that the color of the brick is dependent on the existence of the brick. (Section 2.1)"}, "sem:number": {"definition": "a semantic category that is often (though not always) expressed as an inflectional category, that denotes the cardinality of a referent. Typical values for number inflections are singular, plural, and dual, although there are other rarer values. <a href=\"#str:indexation\">Indexation</a> frequently indicates the number of the referent. (Section 4.4)"}, "sem:numeral": {"definition": "a word that specifies the precise cardinality of a set of referents. Numerals most typically are packaged as modifiers. Two common types of numerals are <a href=\"#sem:cardinal-numeral\">cardinal numerals</a> and <a href=\"#sem:ordinal-numeral\">ordinal numerals</a> (there are other types not discussed here); see also <a href=\"#sem:vague-numeral\">vague numerals</a>. <em>Example</em>: in <em>three women, three</em> is a cardinal numeral functioning as a modifier of <em>women</em>. (Section 4.1.3)"}, "sem:object-concept": {"definition": "concepts belonging to a <a href=\"#def:semantic-classes\">semantic class</a> including persons, animals, and physical objects of various kinds. <em>Example</em>: both boys and dogs as well as dishes are examples of object concepts. (Sections 2.1 and <strong>3.1.2</strong>, which includes an enumeration of types of object concepts)"}, "sem:objective": {"definition": "describing an <a href=\"#sem:entity\">entity</a> from an <q class=\"dq\">outside</q>, explicit perspective on the entity, in contrast to a <a href=\"#sem:subjective\">subjective</a> construal. <em>Example</em>: in the objective <a href=\"#sem:epistemic-modality\">epistemic modal</a> <span class=\"separation\"/> <a href=\"#cxn:construction\">construction</a> <em>Jim thought that Wendy was in Santa Fe</em>, the attitude about whether Wendy being in Santa Fe is true is that of Jim, not the speaker, and in the past, not at the time of the speech event; both of these pieces of information are explicitly expressed in the sentence (<em>Jim</em> and <em>thought</em>). It is also possible to construe speaker attitude at the speech event time as objective, as in <em>I think that Wendy was in Santa Fe</em>, where speaker (<em>I</em>) and speaker attitude (<em>think</em>) are explicitly expressed. (Section 12.3.4)"}, "sem:ownership": {"definition": "a culturally sanctioned relation of control between a person and a physical object, such as an artifact, foodstuff, or shelter, or a more abstract object of value such as shares in a company. <em>Example</em>: in a common interpretation of <em>Sally's truck</em>, Sally owns the truck. (Section 4.1.4)"}, "sem:p-role": {"definition": "the <a href=\"#sem:patient\">patient</a> or patient-like <a href=\"#sem:central-participant\">central participant role</a> in the prototypical <a href=\"#sem:bivalent\">bivalent event</a> (that is, a breaking event). <em>Example</em>: in <em>Jack broke the window</em>, the window plays the P role in the breaking event. (Section 6.3.1)"}, "sem:part-whole-relation": {"definition": "a relation between an <a href=\"#sem:object-concept\">object</a>, particularly an <a href=\"#sem:inanimate\">inanimate</a> object, and a part of that object. <em>Example</em>: <em>a drawer of the desk</em> is a <a href=\"#cxn:possession-construction\">possession construction</a> expressing a part\u2013whole relation. The part\u2013whole relation is a generalization of the <a href=\"#sem:body-part-relation\">body part relation</a>. (Section 4.1.4)"}, "sem:participant-oriented": {"definition": "a stative <a href=\"#cxn:element\">element</a> in a <a href=\"#cxn:stative-complex-predicate\">stative complex predicate</a> that describes a <a href=\"#sem:state\">state</a> of one of the <a href=\"#sem:participant-role\">participants</a> in the <a href=\"#sem:event\">event</a> denoted by the complex predicate. <em>Example</em>: in English <em>I ate the carrots raw</em>, <em>raw</em> is a property of the carrots, not the event of eating. Contrasts with <a href=\"#sem:event-oriented\">event-oriented</a>. (Section 14.1)"}, "sem:participant-role": {"definition": "the role that a particular participant performs in an <a href=\"#sem:event\">event</a> \u2013 specifically, what the participant does, or has done to them, in the course of the event. <em>Example</em>: in the eating event, there is an <q>eater</q> participant role and a <q>food</q> participant role, and different things happen with the <q>eater</q> and the <q>food</q> in the eating event. (Sections 6.1.1, 6.1.2)"}, "sem:passing": {"definition": "the intermediate phase of the <a href=\"#sem:path-event\">path</a> in a <a href=\"#sem:motion-event\">motion event</a>. <em>Example</em>: in the Lao <a href=\"#str:serial-verb-strategy\">serial verb</a> <span class=\"separation\"/> <a href=\"#cxn:construction\">construction</a> <em>man<sup>2</sup> l\u00e8\u00e8n<sup>1</sup> q\u00f2\u00f2k<sup>5</sup> caak<sup>5</sup> h\u00f9an<sup>2</sup> taam<sup>3</sup> thaang<sup>2</sup> h\u00f2\u00f2t<sup>4</sup> k\u00f2\u00f2n<sup>4</sup>-hiin<sup>3</sup></em> <q>He ran (exited) from the house, followed the path, reached the rock</q>, <em>taam<sup>3</sup></em> <q>follow</q> denotes the passing phase of the motion event. (Section 14.4)"}, "sem:path-event": {"definition": "an event that describes motion of a <a href=\"#sem:figure\">figure</a> along a spatial path relative to a <a href=\"#sem:ground\">ground</a>. <em>Example</em>: in <em>The guests entered the reception hall, enter</em> is a path of motion verb expressing a path of motion event. (Sections 7.3.1, 14.2)"}, "sem:patient": {"definition": "a <a href=\"#sem:semantic-role\">semantic role</a> including <a href=\"#sem:participant-role\">participant roles</a> for a <a href=\"#sem:participant-role\">participant</a> that undergoes a significant change as a result of the event occurring. <em>Example</em>: in <em>Jack broke the window</em>, the window is broken as a result of the breaking event. (Section 6.1.2)"}, "sem:perception-event": {"definition": "an <a href=\"#sem:experiential-event\">experiential event</a> involving one (or more) of the sensory modalities and directed toward a <a href=\"#sem:stimulus\">stimulus</a>. The stimulus may be either an <a href=\"#sem:object-concept\">object</a> or an <a href=\"#sem:event\">event</a>. <em>Example</em>: <em>Tim heard the macaw</em> is an example of a perception event, and <em>hear</em> is the perception verb (Section 7.4)."}, "sem:peripheral-participant": {"definition": "certain <a href=\"#sem:participant-role\">participants</a> are considered to be less central to the <a href=\"#sem:event\">event</a>, in particular those that do not initiate the event and those that are not strongly affected by the action. <em>Example</em>: in an eating event, the utensils used by the eater and the plate on which the food was located are peripheral participants in the event. Peripheral participants are quite diverse. (Section 6.1.1)"}, "sem:persistent": {"definition": "a concept that describes something that persists over time, and is construed to be a relatively inherent characteristic of the object over its lifetime. <em>Example</em>: being smart or being heavy (of a stone slab) are stable states. The stability of states is a matter of construal; a state construed as stable may change \u2013 for example, a tall tree whose top is broken off. (Section 2.1)"}, "sem:person-deixis": {"definition": "a semantic category found in personal pronouns and indexation, specifying the referent with respect to their role in the <a href=\"#def:speech-act-situation\">speech act situation</a>. The basic values are <a href=\"#sem:first-person\">first person</a>, <a href=\"#sem:second-person\">second person</a>, and <a href=\"#sem:third-person\">third person</a>. (Section 3.1.1)"}, "sem:phasal-aspect": {"definition": "a type of <a href=\"#sem:aspect\">aspect</a> that expresses the phases of an <a href=\"#sem:event\">event</a>: beginning, continuing, terminating, or completion. Phasal aspect is often, but not always, expressed by a <a href=\"#cxn:complement-taking-predicate\">complement-taking predicate</a> in a <a href=\"#cxn:complement-clause-construction\">complement clause construction</a>. <em>Example</em>: in <em>Bill started to play the piano, started</em> expresses phasal aspect \u2013 namely, the beginning phase of the complement event of playing the piano. (Section 18.2.2)"}, "sem:polarity": {"definition": "a category that describes the truth/falsity of the situation expressed in the utterance. Polarity is either <a href=\"#sem:positive-polarity\">positive</a> or <a href=\"#sem:negative-polarity\">negative</a>. (Section 12.1)"}, "sem:positive-epistemic-stance": {"definition": "a positive commitment on the part of the speaker to the actuality of a proposition expressed in a clause. <em>Example</em>: in <em>Since you pressed the button, the door opened</em>, the speaker has expressed a commitment to the proposition that you did press the button. (Section 17.3.1)"}, "sem:positive-polarity": {"definition": "indicates that the situation expressed in the utterance is true. <em>Example</em>: <em>Kit found his glasses</em> expresses that Kit finding his glasses is true. In the vast majority of languages, positive polarity is <a href=\"#str:zero-coding\">zero coded</a>, as in this example. (Section 12.1)"}, "sem:possession": {"definition": "a semantic relation between two objects, prototypically <a href=\"#sem:ownership\">ownership</a>, but also including weaker relations such as temporary ownership and physical contiguity. <em>Example</em>: in <em>I have a pen</em>, there is a possession relation between myself and the pen \u2013 I am the <a href=\"#sem:possessor\">possessor</a> and the pen is the <a href=\"#sem:possessum\">possessum</a>. This possession relation could be full ownership, temporary ownership (someone lent it to me), or physical contiguity (I have a pen at hand). Other object\u2013object relations such as <a href=\"#sem:body-part-relation\">body parts</a>, <a href=\"#sem:part-whole-relation\">part\u2013whole</a>, and <a href=\"#sem:kinship-relation\">kinship</a> are generally also included under possession relations. (Section 10.4.2)"}, "sem:possessor": {"definition": "the person who has control over the <a href=\"#sem:possessum\">possessum</a> in a <a href=\"#sem:possession\">possession relation</a>. <em>Example</em>: in <em>I have a car</em>, I am the possessor. The possessor may also serve as the <a href=\"#cxn:modifier\">modifier</a> in a <a href=\"#cxn:possessive-modification-construction\">possessive modification construction</a>. (Sections 4.1.4, 10.4.2)"}, "sem:possessum": {"definition": "the object that is controlled by the <a href=\"#sem:possessor\">possessor</a> in a <a href=\"#sem:possession\">possession relation</a>. <em>Example</em>: in <em>I have a car</em>, the car is the possessum. The possessum may also serve as the head in a <a href=\"#cxn:possessive-modification-construction\">possessive modification construction</a>. (Sections 4.1.4, 10.4.2)"}, "sem:posterior": {"definition": "a temporal sequential relation between two <a href=\"#sem:event\">events</a> such that the preceding event serves as the reference point for the following event. <em>Example</em>: in <em>He drove to the party after washing the car</em>, driving to the party has a posterior temporal relation with respect to washing the car. Used to describe a sequential temporal relation between events in a <a href=\"#inf:figure-ground\">figure\u2013ground information packaging</a>. (Section 15.1.3)"}, "sem:pretense-event": {"definition": "a <a href=\"#sem:propositional-attitude-event\">propositional attitude event</a> in which the speaker, or the <a href=\"#sem:experiencer\">experiencer</a> of the pretense event, presents the <a href=\"#sem:proposition\">proposition</a> expressed by the <a href=\"#cxn:complement\">complement</a> as true in an alternative reality or <a href=\"#sem:mental-space\">mental space</a>. <em>Example</em>: in <em>Ira pretended that the guests had already left</em>, the proposition that the guests had already left is presented as true in an alternative reality from the shared beliefs of the interlocutors (or, for that matter, Ira). There is a strong implicature that the proposition does not hold in reality (that is, the shared beliefs of the interlocutors). (Section 18.2.2)"}, "sem:property-concept": {"definition": "a concept belonging to a <a href=\"#def:semantic-classes\">semantic class</a> of <a href=\"#sem:relational\">relational</a>, 1-dimensional, usually scalar, and usually stable concepts. <em>Examples</em>: age, height, shape, and so on are property concepts \u2013 they are defined on a 1-dimensional scale, and many of them are stable properties of the <a href=\"#sem:object-concept\">object</a> they apply to. (Sections 2.1, and <strong>4.1.1</strong>, which includes an enumeration of types of property concepts)"}, "sem:proposition": {"definition": "a concept that denotes an <a href=\"#sem:event\">event</a> (with its attendant <a href=\"#sem:participant-role\">participants</a>, <a href=\"#sem:tense\">tense</a>, <a href=\"#sem:aspect\">aspect</a>, <a href=\"#sem:modality\">modality</a>, and <a href=\"#sem:polarity\">polarity</a>) that has a truth value in a particular context \u2013 that is, it may be true or false in that context. <em>Example</em>: in <em>John believes that Mary took the car to the repair shop</em>, <em>Mary took the car to the repair shop</em> is a proposition; it has a truth value in the context of John's beliefs. A <a href=\"#inf:pragmatic-assertion\">pragmatic assertion</a> expresses a proposition that is taken to be true in the speaker's beliefs. (Sections 11.1, 18.2.2)"}, "sem:propositional-attitude-event": {"definition": "an <a href=\"#sem:event\">event</a> of thinking, believing, and so on that expresses an attitude of the <a href=\"#sem:experiencer\">experiencer</a> toward the truth of the <a href=\"#sem:proposition\">proposition</a> expressed by the <a href=\"#cxn:complement\">complement</a>. <em>Example</em>: in <em>Aram thought that the pianist was very good</em>, the <a href=\"#cxn:complement-taking-predicate\">complement-taking predicate</a> <em>thought</em> denotes a propositional attitude event. Special cases of propositional attitude events are <a href=\"#sem:knowledge-event\">knowledge events</a> and <a href=\"#sem:pretense-event\">pretense events</a>. (Section 18.2.2)"}, "sem:propositional-content": {"definition": "the semantic content of a <a href=\"#cxn:clause\">clause</a>, separately from whether it is packaged as <a href=\"#inf:topic-comment\">topic\u2013comment</a>, <a href=\"#inf:thetic\">thetic</a>, or <a href=\"#inf:identificational\">identificational</a>. Propositional content corresponds basically to <q>who did what to whom</q>. <em>Example</em>: In <em>There's a coyote running down the street!, It's a coyote that's running down the street</em>, and <em>The coyote is running down the street</em>, the propositional content shared by the thetic, identificational, and topic\u2013comment constructions, respectively, is the current running <a href=\"#sem:event\">event</a> with a coyote as the runner and the street as the location of the running. (Section 11.1)"}, "sem:protasis": {"definition": "the proposition or <a href=\"#sem:event\">event</a> denoted by a <a href=\"#cxn:protasis-clause\">protasis</a> clause. <em>Example</em>: in <em>If you press this button, the door will open</em>, <em>If you press this button</em> is the protasis; <em>the door will open</em> is the <a href=\"#cxn:apodosis-clause\">apodosis</a>. Since the conditional relations are defined in terms of both logical implication and causal relation, the semantic use of <q>protasis</q> can be distinguished as <q>protasis proposition</q> or <q>protasis event</q>. (Section 17.3.1)"}, "sem:proximal": {"definition": "a <a href=\"#sem:contextual\">contextual</a> category of <a href=\"#sem:spatial-deixis\">deixis</a> defined as near the location of the speaker in the speech event. (Section 3.1.1)"}, "sem:punctual": {"definition": "an <a href=\"#sem:event\">event</a> that is construed as taking place in an <q class=\"dq\">instant</q> of time. <em>Example</em>: <em>The balloon popped</em> is a punctual event. (Section 6.2.1)"}, "sem:purpose": {"definition": "the semantic relation between two <a href=\"#sem:event\">events</a> where one event serves as the intended outcome as a result of bringing about the other event. <em>Example</em>: <em>I will grab a stick to defend myself</em> is a <a href=\"#inf:figure-ground\">figure\u2013ground construal</a> of the simultaneous relation in an <a href=\"#cxn:adverbial-clause-construction\">adverbial clause construction</a>, and <em>I will grab a stick and defend myself</em> is a <a href=\"#inf:complex-figure\">complex figure construal</a> of the relation in a <a href=\"#cxn:coordinate-clause-construction\">coordinate clause construction</a>. In the figure\u2013ground construal, the intended event is construed as the ground. The intended event is unrealized, which disfavors a complex figure construal (this problem is avoided in the example here because both events are future events). (Section 15.3.1)"}, "sem:pursuit-event": {"definition": "<a href=\"#sem:event\">events</a> in which one <a href=\"#sem:participant-role\">participant's</a> motion or location is directed toward another participant. <em>Examples</em>: pursuit events include following, chasing, searching for something, and waiting for someone/something; and <em>follow</em>, <em>chase</em>, <em>search (for)</em>, and <em>wait (for)</em> are pursuit verbs. (Section 7.3.3)"}, "sem:recipient": {"definition": "a <a href=\"#sem:semantic-role\">semantic role</a> including <a href=\"#sem:participant-role\">participant roles</a> for a <a href=\"#sem:participant-role\">participant</a> that receives an <a href=\"#sem:entity\">entity</a> from another participant. <em>Example</em>: in <em>I sent the forms to the accountant</em>, the accountant is the recipient of the forms sent. (Section 6.1.2)"}, "sem:reference-point": {"definition": "a point on the scale for a property that indicates a <q class=\"dq\">normal</q> value for the property concept word. Example: in regard to height of a person, <em>tall/short</em> means <q>taller/shorter than a <q class=\"dq\">normal</q> height</q>. The reference point is relative: tall for a person is short for a tree. The reference point can be expressed overtly, as in <em>She's kind of short <strong>for a basketball player</strong></em>. The term <q>reference point</q> is also used as a synonym for <q>anchor</q>; we will avoid that use in this book. (Section 4.1.2)"}, "sem:relational": {"definition": "a concept that inherently makes reference to another entity. <em>Example</em>: a property such as <q>smooth</q> is a property of something, an action such as <q>run</q> is performed by someone or something. (Section 2.1)"}, "sem:removal-event": {"definition": "an <a href=\"#sem:event\">event</a> describing removal of an <a href=\"#sem:object-concept\">object</a> from another object. <em>Example</em>: scrubbing is a removal event. (Section 7.3.2)"}, "sem:s-role": {"definition": "the one <a href=\"#sem:central-participant\">central participant role</a> in a <a href=\"#sem:monovalent\">monovalent event</a>. <em>Example</em>: in <em>Jack ran</em> or <em>Jack died</em>, Jack plays the S role in the running and dying events, respectively. It is not entirely clear what event best serves as the exemplar monovalent event for defining the S role (Sections 6.3.1, 6.3.3)"}, "sem:scalar-model": {"definition": "a range of situations that can be ranked from <q class=\"dq\">weakest</q> to <q class=\"dq\">strongest</q> \u2013 that is, least informative to most informative, on some relevant scale for the <a href=\"#sem:meaning\">meaning</a> of a sentence. <em>Example</em>: <em>He won't eat shrimp, let alone squid</em> makes sense by invoking a scalar model of <q class=\"dq\">things that you would not expect someone to be willing to eat</q>, such that being unwilling to eat shrimp is at the <q class=\"dq\">strong</q>, more informative, end of the scalar model, and being unwilling to eat squid is at the <q class=\"dq\">weak</q>, less informative end of the scalar model (in a culture where eating squid is considered more repulsive than eating shrimp). (Section 17.3.3)"}, "sem:semantic-role": {"definition": "a generalization across <a href=\"#sem:participant-role\">participant roles</a> that are semantically similar from one <a href=\"#sem:event\">event</a> class to another. <em>Example</em>: many events involve a person who volitionally initiates the event, and this more general role is typically called the <q>agent</q> role. (Section 6.1.1)"}, "sem:sensation-event": {"definition": "an <a href=\"#sem:experiential-event\">experiential event</a> involving an internal bodily or physiological sensation. <em>Example</em>: <em>My head aches</em> is an example of a sensation event. (Section 7.4)"}, "sem:simple-contrast": {"definition": "a semantic relation between two <a href=\"#sem:event\">events</a> in which there is only a simple contrast, or a construal of a simple contrast, between the two. Simple contrast is considered the prototype for <a href=\"#cxn:adversative-coordination\">adversative coordination</a>. <em>Example</em>: Ponapean <em>i laid ah e meir</em> [I fish <span class=\"sc\">conj</span> he sleep] <q>I fished, but he slept</q>, is an instance of simple contrast. (Section 15.2.1)"}, "sem:simultaneous": {"definition": "the semantic relation between two <a href=\"#sem:event\">events</a> where two events temporally coincide or overlap. <em>Example</em>: <em>He sang while she played the banjo</em> is a <a href=\"#inf:figure-ground\">figure\u2013ground construal</a> of the simultaneous relation in an <a href=\"#cxn:adverbial-clause-construction\">adverbial clause construction</a>, and <em>He sang and she played the banjo</em> is a <a href=\"#inf:complex-figure\">complex figure construal</a> of the relation in a <a href=\"#cxn:coordinate-clause-construction\">coordinate clause construction</a>. (Section 15.3.1)"}, "sem:spatial-deixis": {"definition": "a <a href=\"#sem:contextual\">contextual</a> factor defined in terms of the speech act event. We will use the term in its narrow sense of spatial location relative to the speaker and addressee in the speech event. <em>Example</em>: in <em>that book, that</em> is picking out the book deictically, via its location relative to the speaker. (Section 3.1.1)"}, "sem:speech-act-causal-relation": {"definition": "the semantic relation in a <a href=\"#sem:conditional-relation\">conditional</a>, <a href=\"#sem:causal\">causal</a>, <a href=\"#sem:concessive-relation\">concessive</a>, or <a href=\"#cxn:concessive-conditional-construction\">conditional concessive construction</a> that expresses a relation between a condition on performing a <a href=\"#inf:speech-acts\">speech act</a> and the performance of that speech act; and the construction expressing that relation. <em>Example</em>: in <em>Since you asked, ten isn't a prime number</em>, there is a speech act causal relation between the request of the speaker whether ten is a prime number, and the performance of the speech act asserting that ten isn't a prime number. A speech act causal relation contrasts with a <a href=\"#sem:content-causal-relation\">content causal relation</a> and an <a href=\"#sem:epistemic-causal-relation\">epistemic causal relation</a>. (Section 17.3.1)"}, "sem:standard": {"definition": "in a <a href=\"#cxn:comparative-construction\">comparative construction</a> or <a href=\"#cxn:equative-construction\">equative construction</a>, the <a href=\"#inf:reference\">referent</a> whose position on the <a href=\"#sem:gradable-predicative-scale\">gradable predicative scale</a> serves as the reference point for the position of the <a href=\"#sem:comparee\">comparee</a> on the predicative scale. <em>Example</em>: in <em>Your cat is bigger than my dog</em>, the dog serves as the standard for the position of the cat on the scale of size \u2013 it is asserted that the cat exceeds the dog on that scale. (Section 17.2.1)"}, "sem:state": {"definition": "a concept which is <a href=\"#sem:relational\">relational</a> and stative but transitory. <em>Example</em>: being sick or being happy are examples of states \u2013 they are stative, but the states of the object they apply to come and go. (Section 2.1)"}, "sem:stative": {"definition": "a concept construed as not involving change over the time course of the <a href=\"#sem:event\">event</a>. <em>Example</em>: being tall does not involve any change over the time course being described. (Sections 2.1, 6.2.1)"}, "sem:stimulus": {"definition": "the <a href=\"#sem:participant-role\">participant</a> in an <a href=\"#sem:experiential-event\">experiential event</a> which stimulates the internal mental or bodily experience in the <a href=\"#sem:experiencer\">experiencer</a>. <em>Example</em>: in <em>Freddy saw the bear</em>, the bear is the stimulus. (Sections 6.1.2, <strong>7.4</strong>)"}, "sem:subjective": {"definition": "describing an entity from the implicit perspective of the speaker and the speech event, e.g. the speech event time. <em>Example</em>: in the subjective <a href=\"#sem:epistemic-modality\">epistemic modal</a> <span class=\"separation\"/> <a href=\"#cxn:construction\">construction</a> <em>Wendy might be in Santa Fe</em>, the uncertainty about Wendy being in Santa Fe is that of the speaker at the time of the speech event, although neither of these pieces of information (the speaker or the time of the speech event) are explicitly expressed in the sentence. (Section 12.3.4)"}, "sem:subsequent-role": {"definition": "a <a href=\"#sem:participant-role\">participant role</a> that is subsequent to the participant role expressed as <a href=\"#inf:object-argument\">object</a> in the <a href=\"#sem:causal-chain\">causal chain</a> / <a href=\"#sem:causal-structure\">causal structure</a> of an <a href=\"#sem:event\">event</a>. <em>Example</em>: in <em>Terry made lunch for Sandy</em>, Sandy is subsequent to the lunch in the foodmaking causal chain (Terry &rarr; lunch &rarr; Sandy), and the lunch is expressed as object. (Section 6.1.2)"}, "sem:substitutive": {"definition": "the semantic relation between two <a href=\"#sem:event\">events</a> where one event is characterized by the substitution of a second event that is not normally a part of the first event. <em>Example</em>: <em>We barbecued chicken at home instead of going out to eat</em> is a <a href=\"#inf:figure-ground\">figure\u2013ground construal</a> of the simultaneous relation in an <a href=\"#cxn:adverbial-clause-construction\">adverbial clause construction</a>, and <em>We didn't go out to eat, and barbecued chicken at home (instead)</em> is a <a href=\"#inf:complex-figure\">complex figure construal</a> of the relation in a <a href=\"#cxn:coordinate-clause-construction\">coordinate clause construction</a>. In the figure\u2013ground construal, the substituted event is construed as the ground. (Section 15.3.1)"}, "sem:subtractive": {"definition": "the semantic relation between two <a href=\"#sem:event\">events</a> where one event is additionally characterized by the absence of a second event that is normally a part of the first event. In this respect, the subtractive relation is somewhat like a <q class=\"dq\">negative</q> version of the <a href=\"#sem:additive\">additive</a> relation. <em>Example</em>: <em>He did all the problems correctly except (that) he missed the proof on the last one</em> is a <a href=\"#inf:figure-ground\">figure\u2013ground construal</a> of the simultaneous relation in an <a href=\"#cxn:adverbial-clause-construction\">adverbial clause construction</a>, and <em>He did all the problems correctly but he missed the proof on the last one</em> is a <a href=\"#inf:complex-figure\">complex figure construal</a> of the relation in a <a href=\"#cxn:coordinate-clause-construction\">coordinate clause construction</a>. In the figure\u2013ground construal, the absent event is construed as the ground. (Section 15.3.1)"}, "sem:tamp": {"definition": "an abbreviation for the set of <a href=\"#sem:meaning\">semantic</a> categories of <a href=\"#sem:tense\">tense</a>, <a href=\"#sem:aspect\">aspect</a>, <a href=\"#sem:modality\">modality</a>, and <a href=\"#sem:polarity\">polarity</a>, which primarily describe certain semantic characteristics of the <a href=\"#sem:event\">event</a> denoted by a <a href=\"#cxn:predicate\">predicate</a>. TAMP is morphosyntactically generally associated with the predicate, typically as a predicate inflection or expressed in an <a href=\"#cxn:auxiliary-construction\">auxiliary construction</a>. (Section 13.1.2)"}, "sem:telic": {"definition": "an <a href=\"#sem:event\">event</a> in which the relevant <a href=\"#sem:participant-role\">participant</a> ends up in a <q class=\"dq\">natural</q> result <a href=\"#sem:state\">state</a>. <em>Example</em>: in <em>I crossed the street</em>, the natural result state is reaching the other side of the street, and the event is telic. (Section 6.2.1)"}, "sem:tense": {"definition": "a grammatical category, typically an inflectional category, that expresses the location of an event in time, usually with respect to the time of the speech act situation. In this textbook, tense is discussed primarily with respect to the expression of <a href=\"#sem:tamp\">TAMP</a> categories. (Sections 6.2.1, 13.4)"}, "sem:theme": {"definition": "a <a href=\"#sem:semantic-role\">semantic role</a> including <a href=\"#sem:participant-role\">participant roles</a> for a <a href=\"#sem:participant-role\">participant</a> that is the transferred <a href=\"#sem:entity\">entity</a> in a <a href=\"#sem:transfer-of-possession-event\">transfer event</a>. <em>Example</em>: in <em>I sent the forms to the accountant</em>, the entity transferred is the forms. The term <q>theme</q> is also used for the participant functioning as the <a href=\"#sem:figure\">figure</a> in <a href=\"#sem:motion-event\">motion</a>, <a href=\"#sem:application-event\">application</a>, <a href=\"#sem:removal-event\">removal</a>, and other events involving the movement of the participant. (Section 6.1.2)"}, "sem:time-stability": {"definition": "a scale of semantic <a href=\"#sem:event\">event</a> <span class=\"separation\"/> <a href=\"#sem:type\">types</a> that combines the two <a href=\"#sem:aspect\">aspectual</a> features of <a href=\"#sem:stative\">stative</a>/<a href=\"#sem:dynamic\">dynamic</a> and <u>persisting</u>/<a href=\"#sem:transitory\">transitory</a>. The scale, from most time-stable to least time-stable, is: stative &amp; persisting &gt; stative &amp; transitory &gt; dynamic &amp; transitory. (Section 10.2)"}, "sem:token": {"definition": "a particular entity with its own identity. <em>Examples</em>: a particular person such as Charlie Chaplin, or a specific table, are individuals. (Section 3.1.1)"}, "sem:transfer-of-possession-event": {"definition": "a <a href=\"#sem:trivalent\">trivalent event</a> involving physical transfer, usually also extended to <q class=\"dq\">mental transfer</q>, that is used in defining the <a href=\"#cxn:ditransitive-construction\">ditransitive construction</a>. <em>Examples</em>: giving and sending are physical transfer events (and <em>give</em> and <em>send</em> are transfer verbs), and showing and telling are <q class=\"dq\">mental transfer</q> events (and <em>show</em> and <em>tell</em> are <q class=\"dq\">mental transfer</q> verbs). (Section 7.5.1)"}, "sem:transitory": {"definition": "a concept that describes something that <q class=\"dq\">comes and goes</q> over time. <em>Example</em>: being cold is a state that may be true of a person at some point in time, but not true at another point in time. (Section 2.1)"}, "sem:trivalent": {"definition": "an event with a <a href=\"#sem:valency\">valency</a> of three \u2013 that is, with three <a href=\"#sem:central-participant\">central participant roles</a>. <em>Example</em>: giving is a trivalent event. (Section 6.1.2)"}, "sem:type": {"definition": "a general concept that generally subsumes multiple instances (<a href=\"#sem:token\">individuals</a>). <em>Example</em>: the category of tables is a type. (Section 3.1.1)"}, "sem:undirected-change": {"definition": "an <a href=\"#sem:event\">event</a> in which the change that a <a href=\"#sem:participant-role\">participant</a> undergoes in the course of an event is not in any particular <q class=\"dq\">direction</q>. <em>Example</em>: in <em>The ball was bouncing in the playpen</em>, the ball does not undergo an incremental or <q class=\"dq\">directed</q> change in either vertical or horizontal direction: the vertical motion is up and down, and the horizontal motion goes in any direction. (Section 6.2.1)"}, "sem:unexpected-co-occurrence": {"definition": "a semantic relation between two <a href=\"#sem:event\">events</a> in which two events are juxtposed and the second event is unexpected. Unexpected co-occurrence is often expressed with <a href=\"#cxn:adversative-coordination\">adversative coordination</a>. <em>Example</em>: Russian <em>Vanja prostudilsja, no posh\u00ebl v shkolu</em> [Vanja caught_cold <span class=\"sc\">conj</span> went to school] <q>Vanja caught a cold, but went to school</q> is an instance of the unexpected co-occurrence relation, using a <a href=\"#str:coordinator\">coordinator</a> <em>no</em> which is distinct from the coordinator <em>a</em> which is used for <a href=\"#sem:simple-contrast\">simple contrast</a>. (Section 15.2.1)"}, "sem:utterance-event": {"definition": "an <a href=\"#sem:event\">event</a> of saying in which one <a href=\"#sem:participant-role\">participant</a> is the <u>speaker</u> of the utterance and another participant is the utterance itself. <em>Example</em>: in <em>Sandy said, <q class=\"dq\">I'm buying the house</q>, said</em> denotes the utterance event. (Section 18.2.2)"}, "sem:valency": {"definition": "a class of <a href=\"#sem:event\">events</a> based on the number of <a href=\"#sem:central-participant\">central participant roles</a> in the event, also described as the valency of an event. Events are divided into three valency classes: <a href=\"#sem:monovalent\">monovalent events</a>, <a href=\"#sem:bivalent\">bivalent events</a>, and <a href=\"#sem:trivalent\">trivalent events</a>. (Section 6.1.2)"}, "sem:weather-event": {"definition": "a situation type describing the weather that is typically construed as <a href=\"#inf:thetic\">thetic</a>. <em>Examples</em>: <em>It's raining</em> and <em>The wind is blowing</em> are expressions of weather. Weather is sometimes described as an <a href=\"#sem:event\">event</a> without any (<a href=\"#inf:topicality\">salient</a>) <a href=\"#sem:participant-role\">participants</a>. Its tendency to be construed as thetic is attributed to the fact that weather is difficult to divide into a <a href=\"#inf:reference\">topic</a> and a <a href=\"#inf:predication\">comment</a> and be construed as <a href=\"#inf:topic-comment\">topic\u2013comment information packaging</a>. (Sections 11.3.1, 11.3.3)"}, "sem:wishing-event": {"definition": "an <a href=\"#sem:evaluative-event\">evaluative event</a> in which a positive evaluative judgment about a <a href=\"#sem:proposition\">proposition</a> expressed by the <a href=\"#cxn:complement\">complement</a> of the wishing event is made, and there is a <a href=\"#sem:negative-epistemic-stance\">negative epistemic stance</a> by the speaker toward the proposition. <em>Example</em>: in <em>Jill wishes that Joe had won the election</em>, the wishing predicate <em>wishes</em> expresses Jill's evaluation of Joe's winning the election, and also presupposes that the speaker believes that Joe didn't win the election. (Section 18.2.2)"}, "str:a-not-a": {"definition": "a strategy for <a href=\"#cxn:polarity-question-construction\">polarity question constructions</a> in which both the <a href=\"#sem:positive-polarity\">positive</a> and <a href=\"#sem:negative-polarity\">negative</a> form of the proposition are expressed. <em>Example</em>: Mandarin <em>t\u0101 z\u00e0i ji\u0101 bu z\u00e0i ji\u0101</em> [lit. <q>S/he at home not at home</q>] <q>Is s/he at home?</q> is an instance of the A\u2013not-A strategy for polarity questions. The A\u2013not-A strategy is essentially the recruitment of the <a href=\"#cxn:alternative-question\">alternative question</a> construction for the polarity question function."}, "str:absolute-deranking-system": {"definition": "a <a href=\"#str:system\">system</a> where both the <a href=\"#inf:same-subject\">same-subject</a> <span class=\"separation\"/> <a href=\"#cxn:reference-tracking-construction\">reference tracking construction</a> and the <a href=\"#inf:different-subject\">different-subject</a> reference tracking construction use a <a href=\"#str:deranking\">deranked strategy</a>. The deranked reference tracking construction may be the same for both same-subject and different-subject constructions. <em>Example</em>: Tamil <em>avaru kadite e\u027dudii\u0288\u0288u naaval mo\u027dipeyarttaaru</em> <q>He wrote poetry and then translated a novel</q> (same-subject) and <em>naan pa\u0273am ku\u0256uttu avan sinimaavukku poonaan</em> <q>I gave (him) money and he went to the movie</q> (different-subject) both use the deranked Adverbial Participle predicate forms \u2013 <em>e\u027dudii\u0288\u0288u</em> <q>write</q> [<span class=\"sc\">adv.part</span>] and <em>ku\u0256uttu</em> <q>give</q> [<span class=\"sc\">adv.part</span>] respectively. If the same-subject and different-subject constructions systematically use different deranked reference tracking constructions, then it is a <a href=\"#str:switch-reference-system\">switch-reference system</a>. (Section 16.3)"}, "str:absolutive-category": {"definition": "the category in the <a href=\"#str:ergative-alignment\">ergative alignment strategy</a> that <a href=\"#str:co-expression\">co-expresses</a> both <a href=\"#sem:s-role\">S</a> and <a href=\"#sem:p-role\">P roles</a>. <em>Example</em>: Yuwaalaraay <a href=\"#cxn:argument-phrase\">argument phrases</a> use the same <a href=\"#str:zero-coding\">zero</a> <span class=\"separation\"/> <a href=\"#str:flagging\">flag</a> to express the S and P roles, and hence this is an absolutive flag. (Section 6.3.1)"}, "str:accusative-alignment": {"definition": "a <a href=\"#str:system\">system</a> in which the <a href=\"#sem:a-role\">A</a> and <a href=\"#sem:s-role\">S roles</a> are expressed with the same <a href=\"#def:form\">form</a>, but the <a href=\"#sem:p-role\">P role</a> is expressed with a different form. <em>Example</em>: English <a href=\"#cxn:argument-phrase\">argument phrases</a> expressing the A and S roles are <a href=\"#str:indexed\">indexed</a> on Present Tense verbs (<em>Emily sing-s, Emily play-s the piano</em>), while an argument phrase expressing the P role is not indexed (in <em>Emily play-s the piano</em>, the verb does not index <em>the piano</em>). (Section 6.3.1)"}, "str:accusative-category": {"definition": "the <a href=\"#def:morphosyntax\">morphosyntactic</a> category in the <a href=\"#str:accusative-alignment\">accusative alignment system</a> that exclusively expresses the <a href=\"#sem:p-role\">P role</a>. <em>Example</em>: the English accusative <a href=\"#cxn:pronoun\">pronoun</a> forms <em>me</em>, <em>him</em>, <em>her</em>, <em>us</em>, and <em>them</em> are used only for the P role (the S and A roles use the <a href=\"#str:nominative-category\">nominative</a> forms <em>I</em>, <em>he</em>, <em>she</em>, <em>we</em>, and <em>they</em>), and represent the accusative <a href=\"#str:flagging\">flag</a> (morphologically manifested in English as base modification). (Section 6.3.1)"}, "str:action-nominal": {"definition": "a <a href=\"#str:deranking\">deranked</a> <span class=\"separation\"/> <a href=\"#cxn:predicate\">predicate</a> form that is capable of inflecting for <a href=\"#sem:semantic-role\">case</a> or of taking <a href=\"#str:adposition\">adpositions</a> in the same way as <a href=\"#cxn:noun\">nouns</a> do, and with reasonable productivity. <em>Example</em>: in <em>He remains under investigation</em>, <em>investigation</em> is an action nominal. Action nominals overwhelmingly lack predicate-like tense\u2013aspect\u2013mood and argument indexation inflections. (Section 15.3.2)"}, "str:active-alignment": {"definition": "a <a href=\"#str:system\">system</a> in which some <a href=\"#sem:s-role\">S roles</a> are co-expressed with the <a href=\"#sem:a-role\">A role</a>, and other S roles are co-expressed with the <a href=\"#sem:p-role\">P role</a>. <em>Example</em>: in Lakhota, the <a href=\"#str:index\">index</a> for the S role of <q>come</q> is the same <a href=\"#def:form\">form</a> as the index for the A role of <q>help</q>, but the index for the S role of <q>be sick</q> is the same form as the index for the P role of <q>help</q>. (Section 6.3.3)"}, "str:active-category": {"definition": "the <a href=\"#def:morphosyntax\">morphosyntactic</a> category in the <a href=\"#str:active-alignment\">active alignment system</a> that <a href=\"#str:co-expression\">co-expresses</a> some <a href=\"#sem:s-role\">S roles</a> \u2013 in particular, the S role of <q>walk</q> \u2013 and the <a href=\"#sem:a-role\">A role</a>. <em>Example</em>: in Lakhota, the index <em>ya-</em> <q>you (sg.)</q> in <em>\u00f3-ma-ya-kiye</em> <q>you help/helped me</q> and <em>ya-\u0294u</em> <q>you (sg.) are coming</q> expresses the active category. (Section 6.3.3)"}, "str:actual-information-packaging-strategy": {"definition": "a <a href=\"#str:strategy\">strategy</a> found with <a href=\"#cxn:nonprototypical-construction\">nonprototypical construction</a> types, such as <a href=\"#cxn:complement\">complement constructions</a> which express <a href=\"#inf:reference\">reference</a> to <a href=\"#sem:action-concept\">actions</a>. The actual IP strategy is to recruit the strategy used for the prototypical <a href=\"#sem:meaning\">semantic content</a> function of the <a href=\"#inf:information-packaging\">information packaging</a> function of the nonprototypical construction. <em>Example</em>: in the English Nominalization Construction exemplified by <em>the corporation's neglect of worker's rights</em>, the <a href=\"#sem:action-concept\">action concept</a> <em>neglect</em> that is being <a href=\"#inf:reference\">referred</a> to recruits the construction used for <a href=\"#sem:object-concept\">object</a> <span class=\"separation\"/> <a href=\"#inf:reference\">reference</a>, the prototypical <a href=\"#cxn:referring-phrase\">referring phrase</a> \u2013 it is preceded by the Possessive Phrase <em>the corporation's</em> and followed by the Genitive Oblique <em>of worker's rights</em>; contrast the different strategy found with the prototypical <a href=\"#sem:action-concept\">action</a> <span class=\"separation\"/> <a href=\"#inf:predication\">predication</a> construction <em>The corporation neglected worker's rights</em>. The actual IP strategy contrasts with the <a href=\"#str:semantic-information-packaging-strategy\">semantic IP strategy</a> and the <a href=\"#str:hybrid-information-packaging-strategy\">hybrid IP strategy</a>. (Section 2.4)"}, "str:adjective-impersonal-strategy": {"definition": "a <a href=\"#str:strategy\">strategy</a> used in the <a href=\"#cxn:stative-complex-predicate\">stative complex predicate construction</a> in which the <a href=\"#cxn:manner-complex-predicate\">manner</a> (more generally, <a href=\"#sem:stative\">stative</a>) <u>component</u> is expressed like an <a href=\"#cxn:adjective\">adjective</a> (<a href=\"#sem:property-concept\">property</a> <span class=\"separation\"/> <a href=\"#cxn:modifier\">modifier</a>) in an <a href=\"#cxn:argument-phrase\">argument phrase</a> that does not <a href=\"#str:index\">index</a> an <a href=\"#inf:participant\">argument</a> of the <a href=\"#sem:event\">event</a> <span class=\"separation\"/> <a href=\"#cxn:predicate\">predicate</a> in the complex predicate construction. <em>Example</em>: in Manchu <em>sargan jui hocikon ucule-he</em> <q>The girl sang beautifully</q>, <em>hocikon</em> <q>beautifully</q> does not index <em>sargan jui</em> <q>girl</q>. (Section 14.2)"}, "str:adjective-personal-strategy": {"definition": "a <a href=\"#str:strategy\">strategy</a> used in the <a href=\"#cxn:stative-complex-predicate\">stative complex predicate construction</a> in which the <a href=\"#cxn:manner-complex-predicate\">manner</a> (more generally, <a href=\"#sem:stative\">stative</a>) <u>component</u> is expressed like an <a href=\"#cxn:adjective\">adjective</a> (<a href=\"#sem:property-concept\">property</a> <span class=\"separation\"/> <a href=\"#cxn:modifier\">modifier</a>) in an <a href=\"#cxn:argument-phrase\">argument phrase</a> that <a href=\"#str:index\">indexes</a> an <a href=\"#sem:participant\">argument</a> of the <a href=\"#sem:event\">event</a> <span class=\"separation\"/> <a href=\"#cxn:predicate\">predicate</a> in the complex predicate construction. <em>Example</em>: in Latin <em>mendicus a me tristis stipem petivit</em> <q>The beggar asked me sadly for a gift</q>, the form <em>tristis</em> <q>sadly</q> indexes the subject <em>mendicus</em> <q>beggar</q> in <a href=\"#sem:semantic-role\">case</a>, <a href=\"#sem:number\">number</a> and <a href=\"#sem:gender-class\">gender\u2013class</a>. (Section 14.2)"}, "str:adjoined-strategy": {"definition": "a <a href=\"#str:strategy\">strategy</a> for the <a href=\"#cxn:relative-clause-construction\">relative clause construction</a> in which the <a href=\"#cxn:relative-clause\">relative clause</a> is juxtaposed to the <a href=\"#cxn:matrix-clause\">matrix clause</a>. <em>Example</em>: Warlpiri <em>\u014bat\u02b2ulu\u026du \u0273a yankiri pantu\u0273u</em> [<em>kut\u02b2alpa \u014bapa \u014ba\u0273u</em>] <q>I speared the emu which was drinking water</q> illustrates the adjoined strategy \u2013 the relative clause <em>kut\u02b2alpa \u014bapa \u014ba\u0273u</em> <q>which was drinking water</q> is juxtaposed to the matrix clause <em>\u014bat\u02b2ulu\u026du \u0273a yankiri pantu\u0273u</em> <q>I speared the emu</q>, and not adjacent to the relative clause head <em>yankiri</em> <q>emu</q>. The adjoined strategy is quite rare and largely found in Australian languages, where it is identical to the <u>temporal</u> <a href=\"#cxn:adverbial-clause-construction\">adverbial clause construction</a> and presumably recruited from it. (Section 19.2.3)"}, "str:adnominal-possessive-strategy": {"definition": "a <a href=\"#str:strategy\">strategy</a> for the <a href=\"#cxn:presentational-possession-construction\">presentational possession construction</a> in which the <a href=\"#sem:possessor\">possessor</a> is expressed not by an <a href=\"#cxn:argument-phrase\">argument phrase</a> but with a <a href=\"#cxn:possessive-modification-construction\">possessive modification construction</a>. <em>Example</em>: Mokilese <em>mine woaroa-n woal-o war</em> [exist <span class=\"sc\">clf-3sg</span> man-that canoe] <q>That man has a canoe</q> [lit. <q>That man's canoe exists</q>] is an instance of the adnominal possessive strategy. The adnominal possessive strategy is an instance of the <a href=\"#str:internal-possessor-strategy\">internal possessor strategy</a>. (Section 10.4.2)"}, "str:adposition": {"definition": "a <a href=\"#str:flagging\">flag</a> which occurs as an independent word, in contrast to a <a href=\"#str:case-affix\">case affix</a>. Adpositions are distinguished by position: <a href=\"#str:preposition\">preposition</a>, <a href=\"#str:postposition\">postposition</a>, and <a href=\"#str:circumposition\">circumposition</a>. (Section 4.3)"}, "str:adpositional-personal-strategy": {"definition": "a <a href=\"#str:strategy\">strategy</a> used in the <a href=\"#cxn:stative-complex-predicate\">stative complex predicate construction</a> in which the <a href=\"#sem:stative\">stative component</a> is expressed with a <a href=\"#str:flagging\">flag</a> just like an <a href=\"#cxn:argument-phrase\">argument phrase</a>, and in addition it <a href=\"#str:index\">indexes</a> a <a href=\"#sem:participant-role\">participant</a> in the <a href=\"#sem:event\">event</a>. <em>Example</em>: in Russian <em>on umer molodym</em> <q>He died young</q>, <em>molodym</em> <q>young</q> is in the Masculine Singular Instrumental form, indexing Masculine Singular <em>on</em> <q>he</q> as well as taking an <a href=\"#cxn:oblique-phrase\">oblique</a> Instrumental flag. (Section 14.2)"}, "str:adpositional-strategy": {"definition": "a <a href=\"#str:strategy\">strategy</a> used in the <a href=\"#cxn:stative-complex-predicate\">stative complex predicate construction</a> in which the <a href=\"#cxn:manner-complex-predicate\">manner</a> (more generally, <a href=\"#sem:stative\">stative</a>) <u>component</u> is expressed with a <a href=\"#str:flagging\">case marker</a> just like an <a href=\"#cxn:argument-phrase\">argument phrase</a>, either in the basic lexical form or in a nominalized form of the stative concept word. <em>Example</em>: in Mordvin <em>t'ejt'er-es mor-i mazi-ste</em> <q>The girls sings beautifully</q>, <em>mazi</em> <q>beautiful</q> takes the Elative <a href=\"#cxn:oblique-phrase\">oblique</a> flag <em>-ste</em>. (Section 14.2)"}, "str:adverbial-strategy": {"definition": "a <a href=\"#str:strategy\">strategy</a> used in the <a href=\"#cxn:stative-complex-predicate\">stative complex predicate construction</a> in which the <a href=\"#cxn:manner-complex-predicate\">manner</a> (more generally, <a href=\"#sem:stative\">stative</a>) <u>component</u> is expressed using a distinct and unique <a href=\"#def:morphosyntax\">morphosyntactic</a> form. <em>Example</em>: in English <em>The girl sang beautiful-ly</em>, <em>beautiful</em> uses the unique suffix <em>-ly</em> to combine with the <a href=\"#sem:event\">event</a> <span class=\"separation\"/> <a href=\"#cxn:predicate\">predicate</a> <em>sang</em>. The adverbial strategy is probably a more <a href=\"#def:grammaticalization\">grammaticalized</a> version of other strategies for stative complex predicates. (Section 14.2)"}};
@@ -0,0 +1 @@
+DATA.shards[6] = {"str:adverbializer": {"definition": "a morpheme that overtly expresses the semantic relation in an <a href=\"#cxn:adverbial-clause-construction\">adverbial clause construction</a>. <em>Example</em>: in <em>I left the party because I was tired, because</em> is the adverbializer. An adverbial clause construction with an adverbializer is an example of <a href=\"#str:syndetic\">syndetic</a> <span class=\"separation\"/> <a href=\"#cxn:subordinate-clause\">subordination</a>. If the morpheme is affixed to a <a href=\"#cxn:predicate\">predicate</a>, it is not an adverbializer but an overt marker of <a href=\"#str:deranking\">deranked</a> status. (Section 15.3.2)"}, "str:affixation": {"definition": "a strategy for encoding the relation in <a href=\"#inf:major-propositional-act\">major propositional acts</a> (<a href=\"#cxn:modifier\">modifier</a>\u2013<a href=\"#inf:reference\">referent</a>, <a href=\"#cxn:predicate\">predicate</a>\u2013<a href=\"#inf:reference\">argument</a>), in which one <a href=\"#cxn:element\">element</a> is an affix on the other. <em>Example</em>: in Somali <em>s\u0259\u0294li-hom</em> [photograph-his], <em>-hom</em> is typically analyzed as an affix expressing the <a href=\"#sem:possessor\">possessor</a>. (Section 4.2)"}, "str:agree-disagree-alignment": {"definition": "an <a href=\"#str:alignment-system\">alignment strategy</a> for the <a href=\"#cxn:polarity-response-construction\">polarity response construction</a> in which the answer agrees/disagrees with the polarity of the question. <em>Example</em>: in Gulf Arabic, the answers to the negative polarity question <em>maa \u0295indik fluus, muu chidhi?</em> <q>You don't have any money, right?</q> are <em>na\u0295am</em> <q>yes, I have no money</q> (agreeing with the speaker) or <em>bala</em> <q>no, I do have money</q> (disagreeing with the speaker). (Section 12.3.3)"}, "str:alignment-system": {"definition": "a <a href=\"#str:system\">system</a> defined by the <a href=\"#str:co-expression\">co-expression</a> of <a href=\"#inf:reference\">arguments</a> of <a href=\"#cxn:predicate\">predicates</a> in <a href=\"#cxn:intransitive-construction\">intransitive</a>, <a href=\"#cxn:transitive-construction\">transitive</a>, and <a href=\"#cxn:ditransitive-construction\">ditransitive constructions</a>. Example: English expresses the one argument of an intransitive verb construction (<em><strong>The cats</strong> slept</em>) in the same way as the semantically agentive argument of a <a href=\"#cxn:transitive-construction\">transitive</a> <span class=\"separation\"/> <a href=\"#cxn:verb\">verb</a> (<em><strong>The cats</strong> clawed the sofa</em>): both arguments are expressed preceding the verb. (Sections 1.4, <strong>6.3.1</strong>)"}, "str:allative-comparative": {"definition": "a <a href=\"#str:fixed-case\">fixed-case strategy</a> in <a href=\"#cxn:comparative-construction\">comparative constructions</a> in which there is a <a href=\"#cxn:clause\">clause</a> which attributes a <a href=\"#sem:gradable-predicative-scale\">gradable predicative scale</a> to the <a href=\"#sem:comparee\">comparee</a>, and the <a href=\"#sem:standard\">standard</a> is expressed as an <a href=\"#cxn:oblique-phrase\">oblique argument phrase</a> using a spatial <a href=\"#str:flagging\">flag</a> with an allative (<q>to</q>) <a href=\"#sem:meaning\">meaning</a>. <em>Example</em>: Nuer <em>diid ne g\u00e4n ke ji</em> <q>I am bigger than you</q> is an instance of the allative comparative \u2013 <em>diid ne g\u00e4n</em> asserts that I am big, and <em>ke ji</em> expresses the standard, you, with a flag <em>ke</em> meaning <q>to</q>. (Section 17.2.2)"}, "str:alternative-concessive-conditional-strategy": {"definition": "a strategy for expressing a <a href=\"#cxn:concessive-conditional-construction\">concessive conditional construction</a> where the <a href=\"#cxn:protasis-clause\">protasis</a>, which specifies the set of conditions for the concessive conditional, invokes the two polar alternatives possible in the <a href=\"#sem:scalar-model\">scalar model</a>; the <a href=\"#cxn:apodosis-clause\">apodosis</a> expresses the unexpected opposite of the expected causal relation between either alternative and the outcome, and so implies the same outcome no matter what. <em>Example</em>: <em>Whether he is right or not, we must support him</em> uses the alternative concessive conditional strategy \u2013 either he is right or he is wrong, and under either of those conditions that make up the scalar model, we must support him. (Section 17.3.3)"}, "str:animacy-based-split-ergativity": {"definition": "a <a href=\"#str:strategy\">strategy</a> for the <a href=\"#cxn:passive-inverse-voice\">passive\u2013inverse voice construction</a> in which there is a distinct, <a href=\"#str:overt-coding\">overt</a> <span class=\"separation\"/> <a href=\"#str:flagging\">flag</a> of higher-<a href=\"#inf:topicality\">salience</a> <span class=\"separation\"/> <a href=\"#sem:p-role\">P</a> <span class=\"separation\"/> <a href=\"#sem:participant-role\">participants</a> and also for lower-salience <a href=\"#sem:a-role\">A</a> <span class=\"separation\"/> <a href=\"#sem:participant-role\">participants</a>. <em>Example</em>: in Dyirbal, the Accusative Case suffix <em>-na</em> is used for <a href=\"#cxn:first-person-pronoun\">first</a> and <a href=\"#cxn:second-person-pronoun\">second pronominal</a> P participants, and the Ergative Case suffix <em>-\u014bu</em> is used for <a href=\"#cxn:third-person-pronoun\">third person</a> pronominal and <a href=\"#cxn:common-noun\">common noun</a> A participants. (Section 8.3)"}, "str:anterior-deranking": {"definition": "the variant of a <a href=\"#str:deranking\">deranking strategy</a> in which the deranked <a href=\"#cxn:clause\">clauses</a> precede the clause that is expressed like a simple <a href=\"#cxn:main-clause\">main clause</a>. <em>Example</em>: Japanese <em>ojiisanga yamade hataraite obaasanga miseno bano shita</em> <q>The old man worked at the mountain, and the old woman tended the store</q> is an instance of anterior deranking \u2013 the suffix <em>-te</em> on <em>hataraite</em> <q>worked</q> indicates that the anterior predicate is deranked. (Section 15.2.3)"}, "str:applicative-alignment": {"definition": "temporary: how the <a href=\"#sem:peripheral-participant\">peripheral participant</a>, coded as oblique in the <a href=\"#cxn:basic-voice\">basic voice construction</a>, is coded, i.e. (more) object-like or (more) oblique-like."}, "str:associative-equative": {"definition": "a <a href=\"#str:fixed-case\">fixed-case strategy</a> in <a href=\"#cxn:equative-construction\">equative constructions</a> in which there is a <a href=\"#cxn:clause\">clause</a> which attributes a <a href=\"#sem:gradable-predicative-scale\">gradable predicative scale</a> to the <a href=\"#sem:comparee\">comparee</a>, and the <a href=\"#sem:standard\">standard</a> is expressed as an <a href=\"#cxn:oblique-phrase\">oblique argument phrase</a> with a spatial <a href=\"#str:flagging\">flag</a> with an associative (<q>with</q>) <a href=\"#sem:meaning\">meaning</a>. <em>Example</em>: Mandarin Chinese <em>T\u0101 g\u0113n n\u01d0 y\u00edy\u00e0ng g\u0101o</em> <q>She is as tall as you</q> is an instance of an associative equative \u2013 the predicate is <em>y\u00edy\u00e0ng g\u0101o</em> <q>[is] one.manner tall</q> and the standard <em>n\u01d0</em> <q>you</q> uses the flag <em>g\u0113n</em> <q>with</q>. The associative marker may also be a <a href=\"#cxn:coordinate-construction\">coordinating</a> <span class=\"separation\"/> <a href=\"#str:conjunction\">conjunction</a>. (Section 17.2.4)"}, "str:asyndetic": {"definition": "the combination of <a href=\"#cxn:clause\">clauses</a> in <a href=\"#cxn:complex-sentence\">complex sentence constructions</a>, and of <a href=\"#cxn:coordinand\">coordinands</a> in <a href=\"#cxn:coordinate-construction\">coordinate constructions</a> (whether the coordinands are clauses or not), by simple <a href=\"#str:juxtaposition\">juxtaposition</a>. <em>Example</em>: in Lavukaleve <em>ngabakala ngauia tula</em> [my:paddle my:knife small] <q>my paddle and my small knife</q>, the coordinate construction is asyndetic. (Section 15.2.2)"}, "str:balancing": {"definition": "a <a href=\"#str:strategy\">strategy</a> in which the <a href=\"#cxn:predicate\">predicate</a> in a <a href=\"#cxn:complex-sentence\">complex sentence construction</a> or a <a href=\"#cxn:complex-predicate\">complex predicate construction</a> <span class=\"separation\"/> <a href=\"#str:recruitment-strategy\">recruits</a> the predicate construction in a simple predication, inflections and all. <em>Example</em>: <em>The robins drank water and the juncos ate fennel seeds</em> is an instance of a balanced <a href=\"#cxn:coordinate-clause-construction\">coordinate clause construction</a>: <em>drank</em> and <em>ate</em> are in the same <a href=\"#def:form\">form</a> as in the simple predications <em>The robins drank water</em> and <em>The juncos ate fennel seeds</em>. (Sections 14.2, <strong>15.2.3</strong>)"}, "str:bare-verb-stem": {"definition": "a <a href=\"#str:strategy\">strategy</a> for the <a href=\"#cxn:imperative-hortative-construction\">imperative\u2013hortative construction</a>, particularly the <a href=\"#sem:second-person\">second person</a> variant, in which the <a href=\"#cxn:verb\">verb</a> stem without any inflection is used. <em>Example</em>: English <em>Dance!</em> is an instance of the bare verb stem strategy for the second person imperative\u2013hortative. (Section 12.4.1)"}, "str:basic-word-order": {"definition": "a <a href=\"#str:strategy\">strategy</a> for expressing the categories of <a href=\"#cxn:subject-phrase\">subject</a> (S), <a href=\"#cxn:verb\">verb</a> (V), and <a href=\"#inf:object-argument\">object</a> (O) in a <a href=\"#cxn:transitive-construction\">transitive construction</a>, and <a href=\"#cxn:subject-phrase\">subject</a> in an <a href=\"#cxn:intransitive-construction\">intransitive construction</a>. Some linguists use <a href=\"#sem:a-role\">A</a> and <a href=\"#sem:p-role\">P</a> instead of S and O, respectively, in describing the basic word order of transitive constructions. Basic word order is distinguished from nonbasic word orders in terms of <a href=\"#inf:information-packaging\">information packaging</a> (basic word order represents <a href=\"#inf:topic-comment\">topic\u2013comment</a> information packaging); less <a href=\"#def:structural-coding\">structural coding</a>; and higher <a href=\"#def:token-frequency\">token frequency</a>. <em>Example</em>: the basic word order of English is SVO, as in <em>Jerry saw the bluebird on Sunday</em>. Some linguists analyze basic word order in terms of the pair of binary orders subject\u2013verb and object\u2013verb. Sometimes the order of oblique phrases is included; if so, the oblique phrase is abbreviated X; English is SVOX. (Section 6.2.2)"}, "str:biclausal-reciprocal": {"definition": "the <a href=\"#str:strategy\">strategy</a> of <a href=\"#str:recruitment-strategy\">recruiting</a> a <a href=\"#cxn:construction\">construction</a> with two <a href=\"#cxn:clause\">clauses</a> to use as a <a href=\"#cxn:reciprocal-construction\">reciprocal construction</a>. <em>Example</em>: Colloquial Cantonese <em>l\u00e9ih h\u00f3y\u00edh b\u014dng ng\u00f3h ng\u00f3h h\u00f3y\u00edh b\u014dng l\u00e9ih</em> <q>We can help each other</q> is literally <q>You can help me, I can help you</q>. (Section 7.2)"}, "str:bisyndetic": {"definition": "a <a href=\"#str:strategy\">strategy</a> used in <a href=\"#str:syndetic\">syndetic</a> <span class=\"separation\"/> <a href=\"#cxn:coordinate-construction\">coordination</a> where there are as many <a href=\"#str:coordinator\">coordinators</a> as <a href=\"#cxn:coordinand\">coordinands</a>. <em>Example</em>: in Upper Kuskokwim <em>dineje \u0294\u0268\u026c midzish \u0294\u0268\u026c</em> <q>moose and caribou</q>, the coordinator <em>\u0294\u0268\u026c</em> occurs with each coordinand. In some cases, the two coordinators are different, as in English <em>Either...or...</em>, as in <em>Either you leave or I leave</em>. (Section 15.2.2)"}, "str:case-affix": {"definition": "a <a href=\"#str:flagging\">flag</a> which occurs as an affix. <em>Example</em>: in Russian <em>kniga Ivan-a</em> <q>John's book</q>, <em>-a</em> is a Genitive case marking suffixed to <em>Ivan</em> <q>John</q>. (Section 4.3)"}, "str:causative-applicative-co-expression": {"definition": "a <a href=\"#str:system\">system</a> in which the <a href=\"#cxn:causative-construction\">causative construction</a> and an <a href=\"#cxn:applicative-construction\">applicative construction</a> are identical. <em>Example</em>: Kinyarwanda <em>Umugabo a-ra-andik-ii\u0161-a umugabo ib\u00e1r\u00fawa</em> <q>The man is making the man write a letter</q> is a causative construction with the overt suffix <em>-ii\u0161</em> on the verb, and <em>Umugabo a-ra-andik-ii\u0161-a ik\u00e1r\u00e1mu ib\u00e1r\u00fawa</em> <q>The man is writing a letter with a pen</q> is an applicative construction with the <a href=\"#sem:instrument\">instrument role</a> expressed as <a href=\"#cxn:applicative-object-phrase\">applicative object</a>, with the same suffix <em>-ii\u0161</em> on the verb. (Section 9.3)"}, "str:circumposition": {"definition": "an <a href=\"#str:adposition\">adposition</a> which occurs as two morphemes, one before and one after the <a href=\"#cxn:modifier\">modifier</a> or <a href=\"#inf:reference\">argument</a> <span class=\"separation\"/> <a href=\"#cxn:head\">head</a>. <em>Example</em>: in Pashto <em>ter maktaba poori</em> <q>as far as the school</q>, the <a href=\"#sem:meaning\">meaning</a> <q>as far as</q> is expressed by the combination of <em>ter</em> preceding <em>maktaba</em> <q>school</q> and <em>poori</em> following it. (Section 4.3)"}, "str:classifier": {"definition": "an <a href=\"#str:indexation\">indexical strategy</a> in which a <a href=\"#cxn:modifier\">modifier</a>, or sometimes a <a href=\"#cxn:predicate\">predicate</a>, is combined with a morpheme that indicates a set of contrasting <a href=\"#def:semantic-classes\">semantic classes</a> that denote a <a href=\"#inf:reference\">referent</a> which may also be denoted by an accompanying <a href=\"#cxn:referring-phrase\">referring phrase</a>. <em>Example</em>: in Chrau <em>du tong aq</em> <q>one crossbow</q>, <em>tong</em> is a classifier for long objects that refers to the crossbow (<em>aq</em>) and combined with the modifier <em>du</em> <q>one</q>. (Section 4.4.3)"}, "str:cleft-strategy": {"definition": "a <a href=\"#str:strategy\">strategy</a> for <a href=\"#cxn:identificational-construction\">identificational constructions</a> that uses an <a href=\"#cxn:equational-construction\">equational</a> <span class=\"separation\"/> <a href=\"#str:copula\">copula</a> to link the <a href=\"#inf:focus\">focus</a> and the <a href=\"#inf:presupposed-open-proposition\">presupposed open proposition</a> that makes up the remainder of the <a href=\"#cxn:clause\">clause</a>. <em>Example</em>: the English Pseudocleft Construction that is the second sentence in <em>Nikki Caine, 19, doesn't want to be a movie star. What she hopes to do is be a star on the horse-show circuit</em>, uses the cleft strategy: the equational copula <em>is</em> links the presupposed open proposition <em>what she hopes to do</em> and the focus <em>be a star on the horse-show circuit</em>. (Section 11.4.2)"}, "str:co-expression": {"definition": "a <a href=\"#str:system\">system</a> of two (or more) functionally related <a href=\"#cxn:construction\">constructions</a> that uses the same <a href=\"#def:form\">form</a> to express a <a href=\"#def:role\">role</a> in one construction and a role in the other construction. <em>Example</em>: Mandarin uses the same particle <em>de</em> for the <a href=\"#sem:object-concept\">object</a> <span class=\"separation\"/> <a href=\"#inf:modification\">modification</a> (<a href=\"#cxn:possessive-attributive-phrase\">genitive</a>) <a href=\"#cxn:construction\">construction</a> and for the <a href=\"#sem:action-concept\">action</a> <span class=\"separation\"/> <a href=\"#inf:modification\">modification</a> (<a href=\"#cxn:relative-clause\">relative clause</a>) <a href=\"#cxn:construction\">construction</a>. (Section 1.4)"}, "str:cognate-head-dependent-strategy": {"definition": "a <a href=\"#str:strategy\">strategy</a> for an <a href=\"#cxn:argument-complex-predicate\">argument complex predicate</a> in which the <a href=\"#cxn:verb\">verb</a> and the <a href=\"#cxn:noun\">noun</a> (<a href=\"#cxn:argument-phrase\">argument phrase</a>) are phonologically related (and sometimes even identical). <em>Example</em>: in Maale <em>\u0294\u00edz\u00ed \u0283ee\u0283i \u0283\u00e9\u00e9k'k'-\u00e1-ne</em> <q>He is urinating</q>, <em>\u0283ee\u0283i</em> <q>urine</q> and <em>\u0283\u00e9\u00e9k'k'</em> <q>urinate</q> are morphologically related as well as semantically extremely close. (Section 13.6)"}, "str:complementizer": {"definition": "a morpheme that overtly expresses the semantic relation in a <a href=\"#cxn:complement-clause-construction\">complement clause construction</a>. <em>Example</em>: in <em>She thought that he was tired, that</em> is the complementizer. A complement clause construction with a complementizer is an example of <a href=\"#str:syndetic\">syndetic</a> <span class=\"separation\"/> <a href=\"#cxn:subordinate-clause\">subordination</a>. If the morpheme is affixed to a <a href=\"#cxn:predicate\">predicate</a>, it is not a complementizer but an overt marker of <a href=\"#str:deranking\">deranked</a> status. (Section 18.3.1)"}, "str:compounding": {"definition": "a strategy for encoding the relation in <a href=\"#inf:major-propositional-act\">major propositional acts</a> (<a href=\"#cxn:modifier\">modifier</a>\u2013<a href=\"#inf:reference\">referent</a>, <a href=\"#cxn:predicate\">predicate</a>\u2013<a href=\"#inf:reference\">argument</a>), in which the two <a href=\"#cxn:element\">elements</a> are combined in a single word. <em>Example</em>: in <em>doorknob</em>, <em>door</em> and <em>knob</em> form an instance of compounding. The term <q>compounding</q> or <q>compound</q> is also used for the <a href=\"#cxn:typifying-construction\">typifying construction</a> and the <a href=\"#cxn:binominal-lexeme\">binominal lexeme construction</a>. (Section 4.2)"}, "str:conditional-deranking": {"definition": "a <a href=\"#str:system\">system</a> where a <a href=\"#inf:same-subject\">same-subject</a> <span class=\"separation\"/> <a href=\"#cxn:reference-tracking-construction\">reference tracking construction</a> uses a <a href=\"#str:deranking\">deranking strategy</a>, whereas the <a href=\"#inf:different-subject\">different-subject</a> reference tracking construction uses a <a href=\"#str:balancing\">balanced</a> strategy. <em>Example</em>: Wolof <em>dem na ma <strong>\u00e0 o</strong> ko</em> <q>I went and called him</q> [same-subject] uses a Serial Marker <em>\u00e0</em> and a deranked Subjunctive verb form <em>o</em>; <em>nyeu <strong>on na</strong> te wakh <strong>on na</strong> ma ko</em> <q>He came and I told (it to) him</q> uses the balanced construction with the simple verb form, the Past Tense <em>on</em> and the Indicative Marker <em>na</em>. (Section 16.3)"}, "str:conditional-discourse-reference-system": {"definition": "a <a href=\"#str:system\">system</a> where a <a href=\"#inf:same-subject\">same-subject</a> <span class=\"separation\"/> <a href=\"#cxn:reference-tracking-construction\">reference tracking construction</a> uses a different <a href=\"#str:strategy\">strategy</a> from the standard discourse reference strategies found in connected discourse. This is essentially the use of <a href=\"#str:zero-anaphora\">zero anaphora</a> in the same-subject reference tracking construction that is conditional on the construction rather than on the discourse context. <em>Example</em>: the coordination clause construction illustrated in <em>Bilbo<sub>i</sub> found a ring and \u00d8<sub>i</sub> put it in his pocket</em> uses zero anaphora in the second clause; zero anaphora is not generally allowed in discourse reference (*<em>Put it in his pocket</em>). (Section 16.2)"}, "str:conjoined-comparative": {"definition": "a <a href=\"#str:derived-case\">derived-case</a> <span class=\"separation\"/> <a href=\"#sem:comparative-relation\">comparative</a> <span class=\"separation\"/> <a href=\"#str:strategy\">strategy</a> which consists of a <a href=\"#cxn:coordinate-clause-construction\">coordinate clause construction</a> where the two <a href=\"#cxn:clause\">clauses</a> assert that the <a href=\"#sem:gradable-predicative-scale\">gradable predicative scale</a> applies to the <a href=\"#sem:comparee\">comparee</a> and the <a href=\"#sem:standard\">standard</a>. <em>Example</em>: Sika <em>dzarang tica gahar, dzarang rei kesik</em> <q>That horse is bigger than this horse</q> is an instance of the conjoined comparative \u2013 it conjoins <em>dzarang tica gahar</em> <q>That horse is big</q> and <em>dzarang rei kesik</em> <q>This horse is small</q>. (Section 17.2.2)"}, "str:conjoined-exceed-comparative": {"definition": "a rare <a href=\"#str:strategy\">strategy</a> for the <a href=\"#cxn:comparative-construction\">comparative construction</a> which recruits a <a href=\"#cxn:coordinate-clause-construction\">coordinate clause construction</a> (making it similar to the <a href=\"#str:conjoined-comparative\">conjoined comparative</a>), but where one <a href=\"#cxn:clause\">clause</a> expresses the <a href=\"#sem:proposition\">proposition</a> that the <a href=\"#sem:comparee\">comparee</a> exceeds the <a href=\"#sem:standard\">standard</a> (making it similar to the <a href=\"#str:exceed-comparative\">exceed comparative</a>), while the other clause expresses that the <a href=\"#sem:gradable-predicative-scale\">gradable predicative scale</a> applies to the comparee, or, sometimes, to the standard instead. <em>Example</em>: Acholi <em>gwok mera dit ki kato meri</em> <q>My dog is bigger than yours</q> is an instance of the conjoined exceed comparative strategy \u2013 the first clause <em>gwok mera dit</em> <q>my dog [is] big</q> attributes size to the comparee, the dog; the second clause <em>kato meri</em> <q>[it] exceeds yours</q> expresses the relation of the comparee to the standard, your dog; and the clauses are conjoined by <em>ki</em> <q>and</q>. (Section 17.2.3)"}, "str:conjunction": {"definition": "a free morpheme or clitic that encodes the relation between the <a href=\"#sem:event\">events</a> denoted by the two <a href=\"#cxn:clause\">clauses</a> in a <a href=\"#cxn:complex-sentence\">complex sentence construction</a>. A conjunction in a <a href=\"#cxn:coordinate-clause-construction\">coordinate clause construction</a> is a <a href=\"#str:coordinator\">coordinator</a>; in an <a href=\"#cxn:adverbial-clause-construction\">adverbial clause construction</a>, it is an <a href=\"#str:adverbializer\">adverbializer</a>; in a <a href=\"#cxn:complement-clause-construction\">complement clause construction</a>, it is a <a href=\"#str:complementizer\">complementizer</a>; and in a <a href=\"#cxn:relative-clause-construction\">relative clause construction</a>, it is a <a href=\"#str:relativizer\">relativizer</a>. (Section 15.2.2)"}, "str:contiguity-of-serial-verbs": {"definition": "alternative <a href=\"#str:strategy\">strategies</a> found with <a href=\"#str:serial-verb-strategy\">serial verb</a> and <a href=\"#cxn:auxiliary-construction\">auxiliary constructions</a>, whether they are contiguous or not. <em>Example</em>: in Jeh <em>\u0115n loh chi\u00e8u reng r\u016dp b\u00f9h cha cho\u0306\u0300'wan</em> <q>He went out and got somebody's pig and roasted and ate it</q>, the serial verbs <em>loh chi\u00e8u reng r\u016dp b\u00f9h cha</em> [exit go search catch roast eat] are all contiguous. Another alternative contiguity strategy in auxiliary constructions is to position the <a href=\"#cxn:auxiliary\">auxiliary</a> in a fixed position in the clause, typically second position, rather than relative to the position of the <a href=\"#cxn:verb\">verb</a> in the auxiliary construction. (Sections 13.2, 13.3.2)"}, "str:control-based-strategy": {"definition": "<u>monoclausal</u> <a href=\"#str:strategy\">strategies</a> for the <a href=\"#cxn:causative-construction\">causative construction</a> in which the <a href=\"#sem:causee\">causee</a> is coded differently depending on how much control the causee has in the outcome of the event. <em>Example</em>: in Hungarian, there is a contrast between encoding the causee in the Accusative Case when the causee has no control (<em>K\u00f6h\u00f6gtettem a gyerek<strong>-et</strong></em> <q>I made the boy [<span class=\"sc\">acc</span>] cough</q>) and encoding the causee in the Instrumental Case when the causee has some control over the outcome (<em>K\u00f6h\u00f6gtettem a gyerek-<strong>kel</strong></em> <q>I had the boy [<span class=\"sc\">inst</span>] cough</q>). (Section 9.2)"}, "str:controller": {"definition": "in a <a href=\"#cxn:construction\">construction</a> using the <a href=\"#str:indexation\">indexation strategy</a>, the <a href=\"#cxn:referring-phrase\">referring phrase</a> that denotes the same <a href=\"#inf:reference\">referent</a> that is denoted by the <a href=\"#str:index\">index</a>. <em>Example</em>: in Spanish <em>los libros rojos</em> <q>the red books</q>, <em>libros</em> is the controller; it denotes the same referent that the masculine singular nonperson index <em>-os</em> in <em>rojos</em> does. The controller is almost always a referring phrase. (Section 4.4)"}, "str:converb": {"definition": "a <a href=\"#str:deranking\">deranked</a> predicate form in an <a href=\"#str:asyndetic\">asyndetic</a> <span class=\"separation\"/> <a href=\"#str:deranking\">deranked</a> <span class=\"separation\"/> <a href=\"#cxn:adverbial-clause-construction\">adverbial clause construction</a> that lacks <a href=\"#cxn:subject-phrase\">subject</a> <span class=\"separation\"/> <a href=\"#str:person-indexation\">person indexation</a>. <em>Example</em>: in <em>Sitting in front of his desk, he noticed a bright light out the window, sitting</em> is a converb. Haspelmath (1995:5) excludes from the converb category forms that are deranked with subject person indexation that is different from that found with <a href=\"#inf:declarative\">declarative</a> <span class=\"separation\"/> <a href=\"#cxn:main-clause\">main clause</a> <span class=\"separation\"/> <a href=\"#inf:predication\">predication</a>."}, "str:converb-strategy": {"definition": "a <a href=\"#str:strategy\">strategy</a> used in the <a href=\"#cxn:stative-complex-predicate\">stative complex predicate construction</a> in which the <a href=\"#cxn:manner-complex-predicate\">manner</a> (more generally, <a href=\"#sem:stative\">stative</a>) <u>component</u> is packaged as a separate primary <a href=\"#inf:predication\">predication</a> <span class=\"separation\"/> <a href=\"#cxn:coordinate-construction\">coordinated</a> with the <a href=\"#sem:event\">event</a> predication using a <a href=\"#str:deranking\">deranked</a> <span class=\"separation\"/> <a href=\"#cxn:complex-sentence\">complex sentence</a> <span class=\"separation\"/> <a href=\"#str:strategy\">strategy</a>. However, the stative predicate does not index (any of) its argument(s). <em>Example</em>: in Turkana <em>\u00e8-p\u00e8s-e-t\u00e8 n\u026a-a-ron-o-n\u00ec\u0325</em> <q>They kick him badly</q> [lit. <q>They kick him, it being bad</q>] the form of <em>n\u026a-a-ron-o-n\u00ec\u0325</em> <q>be bad</q> is a Neuter deranked form, not indexing the third person plural subject of <q>kick</q>. (Section 14.2)"}, "str:coordinate-impersonal-strategy": {"definition": "a <a href=\"#str:strategy\">strategy</a> used in the <a href=\"#cxn:stative-complex-predicate\">stative complex predicate construction</a> in which the <a href=\"#cxn:manner-complex-predicate\">manner</a> (more generally, <a href=\"#sem:stative\">stative</a>) <u>component</u> is packaged as a separate primary <a href=\"#inf:predication\">predication</a> <span class=\"separation\"/> <a href=\"#cxn:coordinate-construction\">coordinated</a> with the <a href=\"#sem:event\">event</a> predication using a <a href=\"#str:balancing\">balanced</a> <span class=\"separation\"/> <a href=\"#cxn:complex-sentence\">complex sentence</a> <span class=\"separation\"/> <a href=\"#str:strategy\">strategy</a>. However, the stative predicate does not index (any of) its argument(s). <em>Example</em>: in Koasati <em>way\u00f3hka-k ho-palk\u00e1lki-pal\u00e1mni-n</em> <q>They fly all very fast</q> [lit. <q>They fly (and) it is fast</q>], the second clause <em>ho-palk\u00e1lki-pal\u00e1mni-n</em> recruits the form of a main clause predicate, but does not index the fliers. (Section 14.2)"}, "str:coordinate-personal-strategy": {"definition": "a <a href=\"#str:strategy\">strategy</a> used in the <a href=\"#cxn:stative-complex-predicate\">stative complex predicate construction</a> in which the <a href=\"#cxn:manner-complex-predicate\">manner</a> (more generally, <a href=\"#sem:stative\">stative</a>) <u>component</u> is packaged as a separate primary <a href=\"#inf:predication\">predication</a> <span class=\"separation\"/> <a href=\"#cxn:coordinate-construction\">coordinated</a> with the <a href=\"#sem:event\">event</a> predication using a <a href=\"#str:balancing\">balanced</a> <span class=\"separation\"/> <a href=\"#cxn:complex-sentence\">complex sentence</a> <span class=\"separation\"/> <a href=\"#str:strategy\">strategy</a>. In addition, the stative predicate <a href=\"#str:index\">indexes</a> (one of) its argument(s). <em>Example</em>: in Muna <em>ne-rimba no-tende</em> <q>he runs fast</q> [lit. <q>He is fast (and) he runs</q>], <em>ne-rimba</em> [<span class=\"sc\">3sg.rl</span>-be_fast] recruits the form of a simple predicate and indexes its subject argument. (Section 14.2)"}, "str:coordinator": {"definition": "a morpheme that overtly expresses the coordination relation in a <a href=\"#cxn:coordinate-construction\">coordinate construction</a>. <em>Example</em>: in <em>She picked up the pieces and dumped them in the wastebasket</em>, <em>and</em> is the coordinator. A coordinate construction with a coordinator is an example of <a href=\"#str:syndetic\">syndetic</a> coordination. If the morpheme is affixed to a predicate, it is not a coordinator but an overt marker of <a href=\"#str:deranking\">deranked</a> status. (Section 15.2.2)"}, "str:copula": {"definition": "a <a href=\"#str:strategy\">strategy</a> in which an additional morpheme is used in nonprototypical predication. Copulas can be divided into <a href=\"#str:verbal-copula\">verbal copulas</a> and <a href=\"#str:nonverbal-copula-strategy\">nonverbal copulas</a>. (Sections 1.4, <strong>10.2</strong>)"}, "str:copular-participle-strategy": {"definition": "a <a href=\"#str:strategy\">strategy</a> used in the <a href=\"#cxn:stative-complex-predicate\">stative complex predicate construction</a> in which the <a href=\"#cxn:manner-complex-predicate\">manner</a> (more generally, <a href=\"#sem:stative\">stative</a>) <u>component</u> recruits a <a href=\"#cxn:nonprototypical-predication-construction\">nonprototypical predication construction</a> that employs a <a href=\"#str:copula\">copula</a>, and in addition the copula is in a <a href=\"#str:deranking\">deranked</a> form. <em>Example</em>: in Malayalam <em>aval bhamgiy-aayi prasamgiccu</em> <q>She spoke beautifully</q>, <em>bhamgiy</em> <q>beauty</q> is suffixed with a deranked form of the copula <em>-aayi</em>. (Section 14.2)"}, "str:correlative-strategy": {"definition": "a <a href=\"#str:strategy\">strategy</a> for the <a href=\"#cxn:relative-clause-construction\">relative clause construction</a> in which the <a href=\"#cxn:relative-clause\">relative clause</a> is juxtaposed to the <a href=\"#cxn:matrix-clause\">matrix clause</a> (not unlike the <a href=\"#str:adjoined-strategy\">adjoined strategy</a>), the <a href=\"#sem:necessary-participant-sharing\">necessarily shared participant</a> is expressed in the relative clause (not unlike the <a href=\"#str:internally-headed-strategy\">internally headed strategy</a>) accompanied by a relative clause marking morpheme (which may be a <a href=\"#str:relative-pronoun-strategy\">relative pronoun</a> form), and the shared participant is also expressed in the matrix clause, as either a <a href=\"#cxn:noun\">noun</a> or a <a href=\"#cxn:pronoun\">pronoun</a>. <em>Example</em>: Hindi [<em>\u0101dm\u012b ne jis c\u0101k\u016b se murg\u012b ko m\u0101r\u0101th\u0101</em>] <em>us c\u0101k\u016b ko r\u0101m ne dekh\u0101</em> <q>Ram saw the knife with which the man killed the chicken</q> is an instance of the correlative strategy: the relative clause <em>\u0101dm\u012b ne jis c\u0101k\u016b se murg\u012b ko m\u0101r\u0101th\u0101</em> <q>The man killed the chicken with which knife</q> contains the relative clause head <em>c\u0101k\u016b</em> <q>knife</q>, modified by the relative pronoun <em>jis</em> <q>which</q>, and is preposed to the matrix clause <em>us c\u0101k\u016b ko r\u0101m ne dekh\u0101</em> <q>that knife Ram saw</q>, which contains a second expression of the relative clause head <em>us c\u0101k\u016b</em> <q>that knife</q>. (Section 19.2.3)"}, "str:degree-affix": {"definition": "a scalar <a href=\"#cxn:admodifier\">admodifier</a> expressed by an affix. <em>Example</em>: <em>-er</em> in <em>sillier</em> is a degree affix. (Section 4.1.2)"}, "str:degree-equative": {"definition": "a <a href=\"#str:fixed-case\">fixed-case strategy</a> in <a href=\"#cxn:equative-construction\">equative constructions</a> in which there is a <a href=\"#cxn:clause\">clause</a> which attributes a <a href=\"#sem:gradable-predicative-scale\">gradable predicative scale</a> to the <a href=\"#sem:comparee\">comparee</a>, and the <a href=\"#sem:standard\">standard</a> is expressed as a <a href=\"#cxn:nominal-attributive-phrase\">nominal modifier</a> of a word denoting <q>degree</q>, <q>manner</q>, or <q>quantity</q>. <em>Example</em>: Harar Oromo <em>is\u00edin akk\u00e1 isaan\u00ed d'eertuu</em> <q>She is as tall as them</q> is an instance of the degree equative strategy, with the predicate <em>d'eertuu</em> <q>is tall</q>, and the standard, <em>isaan\u00ed</em> <q>they [<span class=\"sc\">gen</span>]</q>, modifies <em>akk\u00e1</em> <q>manner</q>. (Section 17.2.4)"}, "str:degree-marker": {"definition": "a free morpheme or affix that expresses the relative degree of the gradable predicative scale applied to the comparee, in comparative and equative constructions. <em>Example</em>: in <em>taller</em>, the suffix <em>-er</em> is a degree marker. In addition to comparative and equative degree markers, some languages have a distinct <a href=\"#cxn:superlative-form\">superlative degree marker</a>, such as <em>-est</em> in English <em>tallest</em>. (Section 17.2.2)"}, "str:degree-modifier": {"definition": "a scalar <a href=\"#cxn:admodifier\">admodifier</a> expressed by an independent word. <em>Example</em>: <em>very</em> in <em>very happy</em> is a degree modifier. (Section 4.1.2)"}, "str:deranking": {"definition": "a <a href=\"#str:strategy\">strategy</a> in which the <a href=\"#cxn:predicate\">predicate</a> in a <a href=\"#cxn:complex-sentence\">complex sentence</a> or a <a href=\"#cxn:complex-predicate\">complex predicate construction</a> does not <a href=\"#str:recruitment-strategy\">recruit</a> the predicate construction in a simple predication, in contrast to the <a href=\"#str:balancing\">balanced</a> strategy. Instead, the deranked predicate either: (i) lacks the inflections of the predicate; (ii) uses different inflections from the predicate; (iii) has an affix that overtly codes its relation to the other predicate; or some combination of these three possibilities. <em>Example</em>: in <em>Reaching the top of the hill, Ron found a stone monument</em>, the predicate <em>reaching</em> is a deranked form: it lacks verbal inflections and is overtly coded by the suffix <em>-ing</em>. Deranked predicate forms are also called infinitives, gerunds, <a href=\"#str:participle\">participles</a>, verbal nouns, masdars, <a href=\"#str:action-nominal\">action nominals</a>, and nominalizations. (Sections 12.4.2, 14.2, <strong>15.2.3</strong>)"}, "str:derived-case": {"definition": "a set of strategies found in <a href=\"#sem:comparative-relation\">comparative</a> and <a href=\"#cxn:equative-construction\">equative constructions</a> in which the <a href=\"#str:flagging\">flagging</a> of the <a href=\"#sem:standard\">standard</a> is derived from the flagging of the <a href=\"#sem:comparee\">comparee</a>. <em>Example</em>: <em>I love you more than him</em> uses a derived-case strategy \u2013 the referring phrase referring to the standard, <em>him</em>, uses the Object flag because the referring phrase referring to the comparee, <em>you</em>, is in the Object case. Derived-case strategies include the <a href=\"#str:conjoined-comparative\">conjoined comparative strategy</a>, the <a href=\"#str:particle-comparative\">particle comparative</a> and <a href=\"#str:particle-equative\">equative</a> <span class=\"separation\"/> <a href=\"#str:strategy\">strategies</a>, the <a href=\"#str:conjoined-exceed-comparative\">conjoined exceed comparative strategy</a>, the <a href=\"#str:relative-based-equative\">relative-based equative strategy</a>, and the <a href=\"#str:relative-equal-equative\">relative equal equative strategy</a>. (Section 17.2.2)"}, "str:detached-topic-phrase": {"definition": "a strategy for expressing a <a href=\"#inf:reference\">topic</a> in which the topic <a href=\"#cxn:referring-phrase\">referring phrase</a> differs from the expression of a prototypical <a href=\"#cxn:subject-phrase\">subject</a> phrase. <em>Example</em>: in German <em>Peter, ich habe ihn heute nicht getroffen</em> <q>Peter, I have not met him today</q>, the topic phrase <em>Peter</em> is in intial position, prosodically separated from the rest of the clause, and there is a <a href=\"#cxn:pronoun\">pronoun</a> <em>ihn</em> <q>him</q> referring to Peter in the clause. Not all detached topics have all three of the <a href=\"#def:morphosyntax\">morphosyntactic</a> properties of the German example; there is a continuum from the prototypical subject/topic phrase and a <q class=\"dq\">fully</q> detached topic phrase. (Section 11.2.2)"}, "str:differential-object-marking": {"definition": "a strategy that is marginal for the <a href=\"#cxn:passive-inverse-voice\">passive\u2013inverse voice construction</a> in which there is a distinct, <a href=\"#str:overt-coding\">overt</a> <span class=\"separation\"/> <a href=\"#str:flagging\">flag</a> of higher <a href=\"#def:animacy-hierarchy\">animacy</a> / higher <a href=\"#inf:information-status\">information status</a> \u2013 that is, higher-<a href=\"#inf:topicality\">salience</a> \u2013 Ps. <em>Example</em>: in Spanish, <em>El director busca a un empleado</em> <q>The director is looking for a [specific] clerk</q>, the phrase <em>un empleado</em> <q>a clerk</q>, referring to the P participant, uses the overt flag <em>a</em>. Differential object marking is not usually considered a strategy of the passive\u2013inverse construction because the <a href=\"#sem:a-role\">A</a> <span class=\"separation\"/> <a href=\"#sem:participant-role\">participant</a> is not reduced in salience, although the P participant is higher in salience. (Section 8.3)"}, "str:direct-object-category": {"definition": "the <a href=\"#def:morphosyntax\">morphosyntactic</a> category in the <a href=\"#str:indirective-alignment\">indirective alignment system</a> that <a href=\"#str:co-expression\">co-expresses</a> both <a href=\"#sem:theme\">T</a> and <a href=\"#sem:p-role\">P roles</a>. <em>Example</em>: in <em>Randy gave the car to his daughter</em>, the T role (<em>the car</em>) is expressed in the same way as the P role in <em>Randy started the car</em>. (Section 7.5.2)"}, "str:direct-report": {"definition": "a <a href=\"#str:strategy\">strategy</a> for the <a href=\"#cxn:complement\">complement</a> of an <a href=\"#sem:utterance-event\">utterance event</a> in which the form as well as the content of an utterance is expressed. <em>Example</em>: in <em>Sandy said, <q>I'm buying the house</q></em>, the complement <em>I'm buying the house</em> is presented in its original form \u2013 the speaker is not asserting that s/he is buying the house. A direct report strategy may be accompanied by a <a href=\"#str:quotative-marker\">quotative marker</a>. Although the direct report strategy originates with utterance <a href=\"#cxn:complement-clause-construction\">complement clause constructions</a>, it is also used with other complement clause constructions lower in the <a href=\"#def:binding-hierarchy\">Binding Hierarchy</a>. (Sections <strong>18.2.2</strong>, 18.3.2)"}, "str:discourse-reference-system": {"definition": "a <a href=\"#str:system\">system</a> where both <a href=\"#inf:same-subject\">same-subject</a> and <a href=\"#inf:different-subject\">different-subject</a> <span class=\"separation\"/> <a href=\"#cxn:reference-tracking-construction\">reference tracking constructions</a> use the standard discourse reference strategies found in connected discourse. Discourse reference systems are found when both same-subject and different-subject constructions are <a href=\"#str:balancing\">balanced</a>. <em>Example</em>: in Spanish, <a href=\"#str:syndetic\">syndetic</a> <span class=\"separation\"/> <a href=\"#cxn:coordinate-construction\">coordinate constructions</a> such as <em>El Gobierno Nacional volvi\u00f3 a prorrogar los actuales mandatos en los sindicatos y \u00d8<sub>i</sub> suspend<strong>i\u00f3</strong> los preocesos electorales hasta 2021</em> express the same-subject relation in the same way as in connected discourse \u2013 namely, with zero anaphora and subject person indexation on the verb. (Section 16.2)"}, "str:domain": {"definition": "in a <a href=\"#cxn:construction\">construction</a> using the <a href=\"#str:indexation\">indexation strategy</a>, the construction as a whole that the <a href=\"#str:controller\">controller</a>, <a href=\"#str:target\">target</a>, and <a href=\"#str:index\">index</a> occur in. <em>Example</em>: in Spanish <em>los libros rojos</em> <q>the red books</q>, the domain is the <a href=\"#cxn:modification-construction\">modification construction</a> including the <a href=\"#cxn:modifier\">modifier</a> <em>rojos</em> <q>red</q> (the target), the modifier suffix <em>-os</em> <q>[Masculine Plural]</q>, and the <a href=\"#cxn:head\">head</a> <span class=\"separation\"/> <a href=\"#cxn:noun\">noun</a> <em>libros</em> <q>books</q> (the controller). (Section 4.4)"}, "str:double-coding-strategy": {"definition": "a <a href=\"#str:strategy\">strategy</a> used for <a href=\"#cxn:experiential-construction\">experiential constructions</a> in which both <a href=\"#sem:experiencer\">experiencer</a> and <a href=\"#sem:stimulus\">stimulus</a> are expressed with the same <a href=\"#cxn:core-argument-phrase\">core argument phrase</a> (either <a href=\"#cxn:subject-phrase\">subject</a> or <a href=\"#inf:object-argument\">object</a>). <em>Example</em>: in the Japanese sentence <em>Dare ga eiga ga suki desu ka</em> <q>Who likes movies?</q>, both the experiencer <em>dare</em> <q>who</q> and the stimulus <em>eiga</em> <q>movie</q> are expressed with the Subject <a href=\"#str:flagging\">flag</a> <em>ga</em>. (Section 7.4)"}, "str:double-expression": {"definition": "a <a href=\"#str:strategy\">strategy</a> for the expression of <a href=\"#sem:motion-event\">motion events</a> in which the <a href=\"#sem:path-event\">path of motion</a> is expressed as (at least) part of the <a href=\"#cxn:predicate\">predicate</a> and also as a <a href=\"#str:satellite\">satellite</a>. <em>Example</em>: in Russian <em>Ja vy-be\u017eal iz doma</em> <q>I ran out of the house</q>, the path of going out of the house is expressed both as part of the <a href=\"#cxn:verb\">verb</a> (the prefix <em>vy-</em> in <em>vy-be\u017eal</em>) and as the <a href=\"#str:flagging\">flag</a> <em>iz</em>. (Section 14.5)"}, "str:double-negation-strategy": {"definition": "a <a href=\"#str:strategy\">strategy</a> found in <a href=\"#cxn:negation-construction\">negation constructions</a>, particularly <a href=\"#cxn:declarative-negation-construction\">declarative negation constructions</a>, in which there are two morphemes that express <a href=\"#sem:negative-polarity\">negative polarity</a>. <em>Example</em>: in the French sentence <em>Je <strong>ne</strong> vois <strong>pas</strong> la lune</em> <q>I do not see the moon</q>, negative polarity is expressed by both <em>ne</em> and <em>pas</em>. (Section 12.2)"}, "str:double-oblique-strategy": {"definition": "a <a href=\"#str:strategy\">strategy</a> used for <a href=\"#cxn:experiential-construction\">experiential constructions</a> in which both <a href=\"#sem:experiencer\">experiencer</a> and <a href=\"#sem:stimulus\">stimulus</a> are expressed in an <a href=\"#cxn:oblique-phrase\">oblique argument phrase</a> (the two participant roles are usually expressed with different oblique <a href=\"#str:flagging\">flags</a>). <em>Example</em>: in Ancient Greek <em>m\u00e9lei moi to\u00fato:n h\u00f4:n ero:t\u00e1is</em> <q>I care about what you ask</q>, the experiencer argument phrase <em>moi</em> <q>I</q> uses the oblique (Dative) flag, and the stimulus argument phrase <em>to\u00fato:n h\u00f4:n ero:t\u00e1is</em> <q>what you ask</q> uses the oblique (Genitive) flag. (Section 7.4)"}, "str:doubling": {"definition": "expression of a <a href=\"#inf:reference\">referent</a> twice in a <a href=\"#cxn:clause\">clause</a>, by a <a href=\"#cxn:referring-phrase\">referring phrase</a> and simultaneously by an <a href=\"#str:index\">index</a>. (Section 3.3.3)"}, "str:dual-role-strategy": {"definition": "the <a href=\"#str:strategy\">strategy</a> of construing the <u>affected</u> <a href=\"#cxn:subject-phrase\">subject</a> <span class=\"separation\"/> <a href=\"#sem:participant-role\">participant</a> as playing two distinct <a href=\"#def:role\">roles</a> in a <a href=\"#sem:reflexive\">reflexive</a> or <a href=\"#sem:reciprocal\">reciprocal event</a>; hence, it is expressed by two distinct <a href=\"#cxn:argument-phrase\">argument phrases</a> in a <a href=\"#cxn:reflexive-construction\">reflexive construction</a> or a <a href=\"#cxn:reciprocal-construction\">reciprocal construction</a>. <em>Examples</em>: the Sa verb form <em>ir-ben-ir</em> [<span class=\"sc\">3du</span>-shoot-<span class=\"sc\">3du</span>] <q>They shoot them / they shoot themselves / they shoot each other</q> construes the plural participants as playing distinct roles, and thereby uses the transitive construction (<q>They shoot them</q>) to express either a reflexive event (<q>They shoot themselves</q>) or a reciprocal event (<q>They shoot each other</q>). (Section 7.2)"}, "str:echo-strategy": {"definition": "a <a href=\"#str:strategy\">strategy</a> for the <a href=\"#cxn:polarity-response-construction\">polarity response construction</a> in which the answer to a <a href=\"#cxn:polarity-question-construction\">polarity question</a> repeats part of the question. <em>Example</em>: in Welsh, the answers to the polarity question <em>A welwch chwi hwy?</em> [<span class=\"sc\">q</span> see you them] <q>Do you see them?</q> are either <em>Gwelaf</em> <q>I see (them)</q> or <em>Na gwelaf</em> <q>I don't see (them)</q>. (Section 12.3.3)"}, "str:ellipsis": {"definition": "a <a href=\"#str:strategy\">strategy</a> for <a href=\"#cxn:identificational-construction\">identificational constructions</a> in which the <a href=\"#inf:presupposed-open-proposition\">presupposed open proposition</a> is deleted, or sometimes expressed only by a <q>pro-verb</q>. <em>Example</em>: in English, elliptical responses to the question <em>Who took the cookies?</em> are <em>It was JIM, JIM</em>, or <em>JIM did</em> (with the pro-verb form <em>did</em>), in contrast to the full <a href=\"#str:prosody\">prosodic strategy</a> <em>JIM took the cookies</em> or the <a href=\"#inf:equational\">equational</a> <span class=\"separation\"/> <a href=\"#str:strategy\">strategy</a> <em>It was JIM who took the cookies</em>. (Section 11.4.2)"}, "str:encoding-strategy": {"definition": "a <a href=\"#str:strategy\">strategy</a> for a <a href=\"#cxn:construction\">construction</a> defined by the presence (or absence) of certain <a href=\"#def:morphosyntax\">morphosyntactic</a> structures that are defined in a <a href=\"#def:crosslinguistically-valid\">crosslinguistically valid</a> fashion. (Section 1.4)"}, "str:equal-equative": {"definition": "a <a href=\"#str:fixed-case\">fixed-case strategy</a> in <a href=\"#cxn:equative-construction\">equative constructions</a> in which there are two <a href=\"#cxn:predicate\">predicates</a>, one which attributes a <a href=\"#sem:gradable-predicative-scale\">gradable predicative scale</a> to the <a href=\"#sem:comparee\">comparee</a>, and another which asserts that the comparee is identical to the <a href=\"#sem:standard\">standard</a> on that scale. <em>Example</em>: Nkore-Kiga <em>noingana Mugasho oburaingwa</em> <q>You are as tall as Mugasho</q> [lit. <q>you-are-equal-to Mugasho in-height</q>] is an instance of the equal equative strategy. (Section 17.2.4)"}, "str:ergative-alignment": {"definition": "a <a href=\"#str:system\">system</a> in which the <a href=\"#sem:s-role\">S</a> and <a href=\"#sem:p-role\">P roles</a> are expressed with the same <a href=\"#def:form\">form</a>, but the <a href=\"#sem:a-role\">A role</a> is expressed with a different form. <em>Example</em>: in Yuwaalaraay, <a href=\"#cxn:argument-phrase\">argument phrases</a> expressing the A role use the Ergative <a href=\"#str:flagging\">flag</a> <em>-gu</em>, but argument phrases expressing both the S and P roles use the zero-coded Absolutive flag. (Section 6.3.1)"}, "str:ergative-category": {"definition": "the <a href=\"#def:morphosyntax\">morphosyntactic</a> category in the <a href=\"#str:ergative-alignment\">ergative alignment system</a> that exclusively expresses the <a href=\"#sem:a-role\">A role</a>. <em>Example</em>: The Yuwaalaraay <a href=\"#str:flagging\">flag</a> <em>-gu</em> exclusively expresses the A role, and hence is an ergative flag. (Section 6.3.1)"}, "str:exceed-comparative": {"definition": "a <a href=\"#str:fixed-case\">fixed-case strategy</a> in <a href=\"#cxn:comparative-construction\">comparative constructions</a> in which there are two <a href=\"#cxn:predicate\">predicates</a>, one which attributes a <a href=\"#sem:gradable-predicative-scale\">gradable predicative scale</a> to the <a href=\"#sem:comparee\">comparee</a>, and another which asserts that the comparee exceeds the <a href=\"#sem:standard\">standard</a> on that scale. <em>Example</em>: Swahili <em>mti huu ni mrefu ku-shinda ule</em> <q>This tree is taller than that (tree)</q> is an instance of the exceed comparative: the first part <em>mti huu ni mrefu</em> <q>this tree is big</q> attributes a degree of height to this tree, and the second part <em>ku-shinda ule</em> <q>exceed [<span class=\"sc\">inf</span>] that (tree)</q> asserts that this tree exceeds that tree in height. (Section 17.2.2)"}, "str:experiencer-oriented-strategy": {"definition": "a <a href=\"#str:strategy\">strategy</a> for an <a href=\"#cxn:experiential-construction\">experiential construction</a> in which the <a href=\"#sem:experiencer\">experiencer</a> <span class=\"separation\"/> <a href=\"#cxn:argument-phrase\">argument phrase</a> is <a href=\"#str:co-expression\">co-expressed</a> with the <a href=\"#cxn:subject-phrase\">subject</a> argument phrase of a <a href=\"#cxn:transitive-construction\">transitive</a> or <a href=\"#cxn:intransitive-construction\">intransitive construction</a>. <em>Example</em>: the <a href=\"#cxn:clause\">argument structure construction</a> found in <em>I fear dogs</em>, with the experiencer argument phrase <em>I</em> co-expressed with the prototypical subject in English, is an instance of the experiencer-oriented strategy. (Section 7.4)"}, "str:external-possessor-strategy": {"definition": "a <a href=\"#str:strategy\">strategy</a> in which a <a href=\"#inf:reference\">referent</a> in a <a href=\"#sem:possession\">possessive relation</a> to a <a href=\"#sem:participant-role\">participant</a> in an <a href=\"#sem:event\">event</a> (normally in the <a href=\"#sem:p-role\">P role</a> or sometimes the <a href=\"#sem:s-role\">S role</a> of the event) is expressed as an <a href=\"#inf:reference\">argument</a> of the <a href=\"#cxn:predicate\">predicate</a> instead of in a <a href=\"#cxn:possessive-modification-construction\">possessive modification construction</a>. <em>Example</em>: in Maasai <em>\u00e1a-b\u028aak-\u0131t\u00e1 \u0254ld\u00eda</em> <q>My dog is barking</q>, the portmanteau index <em>\u00e1a-</em> <a href=\"#str:index\">indexes</a> the owner of the dog as the <a href=\"#inf:mid-topicality\">object</> <a inf:reference>argument</a> of the predicate. (Section 7.5.3)"}, "str:externally-headed": {"definition": "a <a href=\"#cxn:relative-clause-construction\">relative clause construction</a> in which the <a href=\"#cxn:relative-clause-head\">relative clause head</a> is expressed as an <a href=\"#inf:reference\">argument</a> of the <a href=\"#cxn:matrix-clause\">matrix clause</a> <span class=\"separation\"/> <a href=\"#cxn:predicate\">predicate</a>. <em>Example</em>: in <em>I ate the cheesecake</em> [<em>that Carol baked</em>], <em>that Carol baked</em> is an externally headed relative clause; the relative clause head is <em>the cheesecake</em>, which is the Direct Object of the matrix predicate <em>ate</em>. The externally headed strategy is by far the most common strategy for relative clause constructions. Externally headed relative clauses may be <a href=\"#str:prenominal-strategy\">prenominal</a>, <a href=\"#str:postnominal-strategy\">postnominal</a>, or <a href=\"#str:extraposed-strategy\">extraposed</a>. Externally headed relative clauses may use a <a href=\"#str:gap-strategy\">gap</a>, <a href=\"#str:pronoun-retention-strategy\">pronoun-retention</a>, or <a href=\"#str:relative-pronoun-strategy\">relative pronoun strategy</a>. (Section 19.2.2)"}, "str:extraposed-strategy": {"definition": "a <a href=\"#str:word-order\">word order strategy</a> for <a href=\"#str:externally-headed\">externally headed</a> <span class=\"separation\"/> <a href=\"#cxn:relative-clause-construction\">relative clause constructions</a> in which the <a href=\"#cxn:relative-clause\">relative clause</a>, rather than being adjacent to the external <a href=\"#cxn:relative-clause-head\">relative clause head</a> (either <a href=\"#str:prenominal-strategy\">prenominal</a> or <a href=\"#str:postnominal-strategy\">postnominal</a>), instead follows the entire <a href=\"#cxn:matrix-clause\">matrix clause</a>. <em>Example</em>: <em>I found a linguistics book in a used bookstore last week</em> [<em>that I have been looking for for years</em>] is an instance of the extraposed strategy: the relative clause <em>that I have been looking for for years</em> does not immediately follow the external relative clause head <em>a linguistics book</em>, but instead follows the entire matrix clause <em>I found a linguistics book in a used bookstore last week</em>. (Section 19.2.4)"}, "str:figure-incorporating": {"definition": "a <a href=\"#str:strategy\">strategy</a> for the expression of <a href=\"#sem:motion-event\">motion events</a> in which the <a href=\"#inf:predication\">predication</a> incorporates the semantic type of the <a href=\"#sem:figure\">figure</a> of motion. <em>Example</em>: in Atsugewi <em>w'ost'aq'\u00edk: a</em> <q>Runny icky material [e.g. guts] is lying on the ground</q>, the verb <em>st'aq'</em> <q>lie [of runny, icky material]</q> incorporates the semantic type of the figure (the guts) as runny, icky material. (Section 14.5)"}, "str:fixed-case": {"definition": "a set of strategies found in <a href=\"#sem:comparative-relation\">comparative</a> and <a href=\"#cxn:equative-construction\">equative constructions</a> in which the <a href=\"#str:flagging\">flag</a> of the <a href=\"#sem:standard\">standard</a> is fixed (unchanging). <em>Example</em>: Mundari <em>sadom-ete hati mananga-i</em> <q>The elephant is bigger than the horse</q> is an instance of the fixed-case strategy: <em>sadom-ete</em> <q>horse-from</q> always occurs with the flag <em>-ete</em> <q>from</q>. (Section 17.2.2)"}, "str:flagging": {"definition": "a strategy for encoding the relation in <a href=\"#inf:major-propositional-act\">major propositional acts</a> (<a href=\"#cxn:modifier\">modifier</a>\u2013<a href=\"#inf:reference\">referent</a>, <a href=\"#cxn:predicate\">predicate</a>\u2013<a href=\"#inf:reference\">argument</a>), in which there is a third morpheme that encodes the semantic relation between the two concepts, where the dependent concept (<a href=\"#cxn:modifier\">modifier</a> in a <a href=\"#cxn:modification-construction\">modification construction</a>, <a href=\"#inf:reference\">argument</a> in a <a href=\"#cxn:clause\">clause</a>) is an <a href=\"#sem:object-concept\">object concept</a>. Flags subsume <a href=\"#str:adposition\">adpositions</a> and <a href=\"#str:case-affix\">case affixes</a>. <em>Examples</em>: in <em>the plate on the table, on</em> is a flag, and in <em>I dug the hole with a shovel, with</em> is a flag; both are adpositions. (Sections 4.3, 6.2.2)"}, "str:focus-marker": {"definition": "expression by a separate morpheme of the information in an <a href=\"#cxn:identificational-construction\">identificational construction</a> that is the <a href=\"#inf:focus\">focus</a>. <em>Example</em>: in Rendille <em>\u00ednam-\u00e9 y-imi</em> <q>The BOY came</q>, the suffix <em>-\u00e9</em> marks the Noun <em>\u00ednam-</em> <q>(the) boy</q> as the focus. (Section 11.4.2)"}, "str:fusion": {"definition": "a highly <a href=\"#def:grammaticalization\">grammaticalized</a> strategy for encoding the relation in <a href=\"#inf:major-propositional-act\">major propositional acts</a> (<a href=\"#cxn:modifier\">modifier</a>\u2013<a href=\"#inf:reference\">referent</a>, <a href=\"#cxn:predicate\">predicate</a>\u2013<a href=\"#inf:reference\">argument</a>), in which the two <a href=\"#cxn:element\">elements</a> are fused in a single morpheme. <em>Example</em>: Lakhota <em>ina</em> <q>my mother</q> fuses <q>my</q> and <q>mother</q>. (Section 4.5)"}, "str:gap-strategy": {"definition": "a <a href=\"#str:strategy\">strategy</a> for the expression of the <a href=\"#sem:necessary-participant-sharing\">necessarily shared participant</a> in the <a href=\"#cxn:relative-clause\">relative clause</a> of an <a href=\"#str:externally-headed\">externally headed</a> <span class=\"separation\"/> <a href=\"#cxn:relative-clause-construction\">relative clause construction</a>, in which the participant is not expressed at all in the relative clause. <em>Example</em>: <em>I ate the cheesecake</em> [<em>that Carol baked</em>] uses the gap strategy because the shared participant, the cheesecake, is expressed only as the external <a href=\"#cxn:relative-clause-head\">relative clause head</a>, and not at all in the relative clause <em>that Carol baked</em>. (Section 19.2.2)"}, "str:general-extender": {"definition": "a form used as part of a <a href=\"#cxn:non-exhaustive-list-coordination\">non-exhaustive coordination construction</a> that indicates the non-exhaustiveness of the list. <em>Example</em>: in the non-exhaustive coordination construction in <em>She sold baskets, pots, and stuff / and everything</em>, <em>and stuff</em> or <em>and everything</em> are general extenders. (Section 15.2.2)"}, "str:have-possessive-strategy": {"definition": "a <a href=\"#str:strategy\">strategy</a> for the <a href=\"#cxn:presentational-possession-construction\">presentational possession construction</a> in which the <a href=\"#sem:possessor\">possessor</a> is expressed in a <a href=\"#cxn:subject-phrase\">subject phrase</a>, and the <a href=\"#sem:possessum\">possessum</a> in an <a href=\"#cxn:object-phrase\">object phrase</a>. <em>Example</em>: English <em>Kerry has a laptop</em> is an instance of the have-possessive strategy. (Section 10.4.2)"}, "str:headless": {"definition": "a <a href=\"#str:strategy\">strategy</a> for the <a href=\"#cxn:anaphoric-head-construction\">anaphoric-head construction</a> in which there is no <a href=\"#str:overt-coding\">overt</a> morpheme that functions as the <a href=\"#cxn:head\">head</a>. <em>Example</em>: in <em>My bicycle is older than Greg's</em>, the anaphoric-head construction <em>Greg's</em> has no overt morpheme functioning as the head. (Section 5.4)"}, "str:hybrid-information-packaging-strategy": {"definition": "a <a href=\"#str:strategy\">strategy</a> found with <a href=\"#cxn:nonprototypical-construction\">nonprototypical construction</a> types, such as <a href=\"#cxn:complement\">complement constructions</a> which express <a href=\"#inf:reference\">reference</a> to <a href=\"#sem:action-concept\">actions</a>. The hybrid IP strategy uses a mixture of the <a href=\"#str:semantic-information-packaging-strategy\">semantic IP strategy</a> and the <a href=\"#str:actual-information-packaging-strategy\">actual IP strategy</a>. <em>Example</em>: in <em>Her drinking coffee (surprises me)</em>, the English Gerund Construction combines the Possessive Pronoun <em>her</em>, characteristic of the prototypical <a href=\"#sem:object-concept\">object</a> <span class=\"separation\"/> <a href=\"#inf:reference\">reference</a> construction and hence an instance of the actual information packaging of her drinking coffee (reference), with the Object form <em>coffee</em>, characteristic of the prototypical <a href=\"#sem:action-concept\">action</a> <span class=\"separation\"/> <a href=\"#inf:predication\">predication</a> construction and hence an instance of the prototypical information packaging function of the semantics of the action being referred to, namely predication. (Section 2.4)"}, "str:ideophones": {"definition": "a <a href=\"#str:strategy\">strategy</a> in which a concept is expressed by a phonologically distinctive word, in which there is argued to be some sort of sound-symbolic relationship between the phonological form and its <a href=\"#sem:meaning\">meaning</a>. A common function for which ideophones are used is as the <a href=\"#sem:stative\">stative</a> component of a <a href=\"#cxn:stative-complex-predicate\">stative complex predicate</a>; they are probably next most commonly used as <a href=\"#cxn:predicate-adjectival-construction\">property predications</a> or as <a href=\"#sem:property-concept\">property</a> <span class=\"separation\"/> <a href=\"#cxn:modifier\">modifiers</a> in <a href=\"#cxn:referring-phrase\">referring phrases</a>. <em>Example</em>: in Emai <em>\u00f3 o hian o\u00ed d\u00fad\u00fad\u00fa</em> <q>He cuts it [wood] energetically</q>, <em>d\u00fad\u00fad\u00fa</em> <q>energetically</q> is an ideophone that describes the manner of cutting using a reduplicated form; reduplication is a common characteristic of ideophones. (Section 14.4)"}, "str:inactive-category": {"definition": "the category in the <a href=\"#str:active-alignment\">active alignment system</a> that <a href=\"#str:co-expression\">co-expresses</a> some <a href=\"#sem:s-role\">S roles</a> \u2013 in particular, the S role of <q>die</q> \u2013 and the <a href=\"#sem:p-role\">P role</a>. <em>Example</em>: in Lakhota, the index <em>ma-</em> <q>I/me</q> in <em>\u00f3-ma-ya-kiye</em> <q>you help / helped me</q> and <em>ma-khu\u017ee</em> <q>I am sick</q> expresses the inactive category. (Section 6.3.3)"}, "str:incorporation-of-serial-verbs": {"definition": "alternative <a href=\"#str:strategy\">strategies</a> found with <a href=\"#str:serial-verb-strategy\">serial verb</a> and <a href=\"#cxn:auxiliary-construction\">auxiliary constructions</a>, whether they form a single word or not. <em>Example</em>: in Alamblak <em>y\u0115nt mi-ak-tita-r-t</em> <q>He carried the girl down there on his shoulders</q>, the verbs <em>ak</em> <q>get</q> and <em>tita</em> <q>carry on shoulders</q> form a single word. <a href=\"#str:noun-incorporation\">Noun incorporation</a> refers to a strategy found in other constructions. (Sections 13.2, 13.3.2)"}, "str:independent-referring-phrase-strategy": {"definition": "a <a href=\"#str:strategy\">strategy</a> for the <a href=\"#cxn:presentational-construction\">presentational construction</a> in which the <a href=\"#cxn:referring-phrase\">referring phrase</a> introducing the <a href=\"#inf:reference\">referent</a> in the discourse is the only <a href=\"#cxn:element\">element</a> in the construction. <em>Example</em>: in spoken English, the independent referring strategy is used, for example, in the Pear Stories narrative example <em>and then a little boy, /about/ a bic a red bicycle, that was too big for him, he stopped, ...</em>, <em>a little boy</em> is an independent referring phrase that is used to present a new referent in the discourse. (Section 10.4.3)"}, "str:independent-strategy": {"definition": "the <a href=\"#str:strategy\">strategy</a> for <a href=\"#sem:comparative-relation\">comparative</a> (and possibly <a href=\"#cxn:equative-construction\">equative</a>) <a href=\"#cxn:construction\">constructions</a> which directly expresses two of the <a href=\"#sem:proposition\">propositions</a> that form the <a href=\"#sem:meaning\">meaning</a> of the <a href=\"#sem:comparative-relation\">comparative</a>: that the <a href=\"#sem:gradable-predicative-scale\">gradable predicative scale</a> applies to the <a href=\"#sem:comparee\">comparee</a>, and that the scale applies to the <a href=\"#sem:standard\">standard</a>. That is to say, the independent strategy <a href=\"#str:recruitment-strategy\">recruits</a> a <a href=\"#inf:different-subject\">different-subject</a>, <a href=\"#sem:simultaneous\">simultaneous</a> <u>temporal</u> <a href=\"#cxn:complex-sentence\">complex sentence construction</a> (usually a <a href=\"#cxn:coordinate-clause-construction\">coordinate clause construction</a>) to express comparison. The <a href=\"#str:conjoined-comparative\">conjoined comparative</a> and <a href=\"#str:particle-comparative\">particle</a> <span class=\"separation\"/> <a href=\"#str:strategy\">strategies</a> are examples of the independent strategy. (Section 17.2.3)"}, "str:index": {"definition": "the morpheme in an <a href=\"#str:indexation\">indexical strategy</a> which <a href=\"#inf:reference\">refers</a> to (indexes) the referent. <em>Example</em>: in Spanish <em>las chicas cantaban</em> <q>the girls were singing</q>, the 3rd person plural suffix <em>-an</em> on the imperfective form of <q>sing</q> is the index, referring to the same referent as <em>las chicas</em> <q>the girls</q>. (Section 4.4)"}, "str:indexation": {"definition": "a strategy for encoding the relation in <a href=\"#inf:major-propositional-act\">major propositional acts</a> (<a href=\"#cxn:modifier\">modifier</a>\u2013<a href=\"#inf:reference\">referent</a>, <a href=\"#cxn:predicate\">predicate</a>\u2013<a href=\"#inf:reference\">argument</a>), in which there is a third morpheme that refers to the referent. The third morpheme is called an <a href=\"#str:index\">index</a>. <em>Example</em>: Spanish <em>las chicas cantaban</em> <q>the girls were singing</q> uses indexation to express the relation between the singing and the singers (the girls), with the 3rd person plural suffix <em>-an</em>. Indexation usually expresses the categories of <a href=\"#sem:person\">person</a>, <a href=\"#sem:number\">number</a>, and/or <a href=\"#sem:gender-class\">gender\u2013class</a>. Since <a href=\"#cxn:personal-pronoun\">personal pronouns</a> usually express only those categories, personal pronouns are arguably also indexes. Often the referent/argument is left unexpressed when the indexical strategy is employed \u2013 hence, the referent/argument is expressed only by the index. Indexical strategies include <a href=\"#str:person-indexation\">person indexation</a>, <a href=\"#str:nonperson-indexation\">nonperson indexation</a>, and <a href=\"#str:classifier\">classifiers</a>. (Sections 3.3.2, 4.4, 6.2.2)"}, "str:indexation-feature": {"definition": "in a <a href=\"#cxn:construction\">construction</a> using the <a href=\"#str:indexation\">indexation strategy</a>, the categories of the <a href=\"#inf:reference\">referent</a> that the <a href=\"#str:index\">index</a> expresses. Typical categories are <a href=\"#sem:person\">person</a>, <a href=\"#sem:gender-class\">gender\u2013class</a>, and <a href=\"#sem:number\">number</a>. <em>Example</em>: in Spanish <em>los libros roj-os</em> <q>the red books</q>, the suffix <em>-os</em> on the modifier <em>rojos</em> <q>red</q> indexes the plural number and masculine gender of <em>libros</em> <q>books</q>. (Section 4.4)"}, "str:indexed": {"definition": "a <a href=\"#str:strategy\">strategy</a> in which the <a href=\"#sem:stative\">stative</a> <span class=\"separation\"/> <a href=\"#cxn:predicate\">predicate</a> in a <a href=\"#cxn:stative-complex-predicate\">stative complex predicate construction</a> <span class=\"separation\"/> <a href=\"#str:index\">indexes</a> an <a href=\"#inf:reference\">argument</a> of the other (<a href=\"#sem:dynamic\">dynamic</a>) predicate in the construction. (Section 14.2)"}, "str:indirect-object-category": {"definition": "the <a href=\"#def:morphosyntax\">morphosyntactic</a> category in the <a href=\"#str:indirective-alignment\">indirective alignment system</a> that exclusively expresses the <a href=\"#sem:recipient\">R role</a>. <em>Example</em>: in <em>Randy gave the car to his daughter</em>, the <a href=\"#str:flagging\">flag</a> <em>to</em> exclusively expresses the R role. (Section 7.5.2)"}, "str:indirect-report": {"definition": "a strategy for the <a href=\"#cxn:complement\">complement</a> of an <a href=\"#sem:utterance-event\">utterance event</a> in which only the content of an utterance is expressed. <em>Example</em>: in <em>Sandy said that she was buying the house</em>, only the content of Sandy's utterance is reported (contrast with the direct report strategy in <em>Sandy said, <q>I'm buying the house</q></em>). (Section 18.2.2)"}, "str:indirective-alignment": {"definition": "a <a href=\"#str:system\">system</a> in which the <a href=\"#sem:p-role\">P</a> and <a href=\"#sem:theme\">T roles</a> are expressed with the same <a href=\"#def:form\">form</a>, but the <a href=\"#sem:recipient\">R role</a> is expressed with a different form. <em>Example</em>: in <em>Randy gave the car to his daughter</em>, the T role (<em>the car</em>) is expressed in the same way as the P role in <em>Randy started the car</em>, and the R role is expressed distinctly, with the <a href=\"#str:flagging\">flag</a> <em>to</em>. (Section 7.5.2)"}, "str:insubordination": {"definition": "the <a href=\"#str:recruitment-strategy\">recruitment</a> of <a href=\"#str:deranking\">deranked</a> <span class=\"separation\"/> <a href=\"#cxn:clause\">clause constructions</a> to express a <strong>nondeclarative main clause function</strong>. <em>Example</em>: <em>No smoking</em> recruits the English Gerund Verb form ending in <em>-ing</em> in order to express an <a href=\"#cxn:imperative-hortative-construction\">imperative</a>. (Section 15.2.3)"}, "str:internal-possessor-strategy": {"definition": "a <a href=\"#str:strategy\">strategy</a> in which an <a href=\"#sem:object-concept\">object</a> in an <a href=\"#sem:ownership\">ownership</a>, <a href=\"#sem:body-part-relation\">body part</a>, <a href=\"#sem:kinship-relation\">kinship</a>, etc., relation \u2013 that is, a relation typically expressed in a <a href=\"#cxn:possessive-modification-construction\">possessive modification construction</a> \u2013 to a <a href=\"#sem:participant-role\">participant</a> in an <a href=\"#sem:event\">event</a> (normally in the <a href=\"#sem:p-role\">P role</a> or sometimes the <a href=\"#sem:s-role\">S role</a> of the event) is expressed with a possessive modification construction, even if the object in that relation is also itself a participant in the event. <em>Example</em>: in Mokilese <em>ngoah insigeh-di kijinlikkoan-oaw nih-mw</em> <q>I wrote a letter to / for you</q>, <em>nih-mw</em> [<span class=\"sc\">clf-2sg.poss</span>] <q>your</q> is a possessive modifier of <em>kijinlikkoan-oaw</em> <q>a letter</q>, even though the addressee is also a central participant in the <a href=\"#sem:transfer-of-possession-event\">transfer event</a>. This Mokilese example is also an instance of the <a href=\"#str:internal-recipient-strategy\">internal recipient strategy</a>, but the internal possessor strategy also includes the expression of objects in an ownership, etc., relation that are not (necessarily) also participants in the event. The <a href=\"#str:adnominal-possessive-strategy\">adnominal possessive strategy</a> is also an instance of the internal possessor strategy. (Section 7.5.3)"}, "str:internal-recipient-strategy": {"definition": "a <a href=\"#str:strategy\">strategy</a> for the <a href=\"#cxn:ditransitive-construction\">ditransitive construction</a> in which the <a href=\"#sem:theme\">T role</a> and <a href=\"#sem:recipient\">R role</a> are co-expressed with the <a href=\"#cxn:possessive-modification-construction\">possessive modification construction</a>, so that the <a href=\"#cxn:noun\">noun</a> denoting the <a href=\"#sem:participant-role\">participant</a> in the T role is the <a href=\"#cxn:head\">head</a> and the noun denoting the participant in the R role is the possessive <a href=\"#cxn:modifier\">modifier</a>. <em>Example</em>: in Mokilese <em>ngoah insigeh-di kijinlikkoan-oaw nih-mw</em> <q>I wrote a letter to/for you</q>, <em>nih-mw</em> [<span class=\"sc\">clf-2sg.poss</span>] <q>your</q> is a possessive modifier of <em>kijinlikkoan-oaw</em> <q>a letter</q>. The internal recipient strategy is an instance of the <a href=\"#str:internal-possessor-strategy\">internal possessor strategy</a>. (Section 7.5.3)"}, "str:internally-headed-strategy": {"definition": "a <a href=\"#str:strategy\">strategy</a> for the expression of the <a href=\"#sem:necessary-participant-sharing\">necessarily shared participant</a> in the <a href=\"#cxn:relative-clause-construction\">relative clause construction</a>, in which the <a href=\"#cxn:relative-clause-head\">relative clause head</a> denoting the shared participant is expressed only inside the <a href=\"#cxn:relative-clause\">relative clause</a>. <em>Example</em>: in Imbabura Quechua [<em>kan kwitsaman kwintuta villashka</em>]<em>-ka ali kwitsami</em> <q>The girl to whom you told the story is a good girl</q>, the relative clause <em>kan kwitsaman kwintuta villashka</em> <q>you told the story to the girl</q> contains the relative clause head <em>kwitsaman</em> <q>(to) the girl</q>, and the girl is not expressed in the <a href=\"#cxn:matrix-clause\">matrix clause</a> ... <em>ali kwitsami</em> <q>... is a good girl</q>. The internally headed relative clause as a whole functions as an <a href=\"#inf:reference\">argument</a> of the matrix clause <a href=\"#cxn:predicate\">predicate</a> and may be recruited from the <a href=\"#cxn:complement-clause-construction\">complement clause construction</a>. The internally headed strategy is rare but fairly widely dispersed among the languages of the world. (Section 19.2.3)"}, "str:juxtaposition": {"definition": "a strategy for encoding the relation in <a href=\"#inf:major-propositional-act\">major propositional acts</a> (<a href=\"#cxn:modifier\">modifier</a>\u2013<a href=\"#inf:reference\">referent</a>, <a href=\"#cxn:predicate\">predicate</a>\u2013<a href=\"#inf:reference\">argument</a>), in which the two <a href=\"#cxn:element\">elements</a> are simply syntactically juxtaposed without any additional morpheme expressing the propositional act relation. <em>Example</em>: in <em>red ball</em>, the adjective <em>red</em> is simply juxtaposed to the noun <em>ball</em> to indicate that the referent of <em>ball</em> is modified by the property denoted by <em>red</em>. (Section 4.2)"}, "str:linker": {"definition": "a more highly <a href=\"#def:grammaticalization\">grammaticalized</a> strategy for encoding the relation in <a href=\"#inf:major-propositional-act\">major propositional acts</a> (<a href=\"#cxn:modifier\">modifier</a>\u2013<a href=\"#inf:reference\">referent</a>, <a href=\"#cxn:predicate\">predicate</a>\u2013<a href=\"#inf:reference\">argument</a>), in which there is an invariant third morpheme that signals the relationship between two <a href=\"#cxn:element\">elements</a>. <em>Example</em>: in English <em>Jerry's bicycle</em>, the invariant genitive form <em>-'s</em> is a linker. (Section 4.5)"}, "str:locational-possessive-strategy": {"definition": "a strategy for the <a href=\"#cxn:presentational-possession-construction\">presentational possession construction</a> in which the <a href=\"#sem:possessum\">possessum</a> is expressed in a <a href=\"#cxn:subject-phrase\">subject phrase</a> and the <a href=\"#sem:possessor\">possessor</a> in an <a href=\"#cxn:oblique-phrase\">oblique phrase</a> which is locative, or probably locative, in origin. <em>Example</em>: Russian <em>u menja ma\u0161ina</em> [at me car] <q>I have a car</q> is an instance of the locational possessive strategy. The locational possessive strategy essentially <a href=\"#str:recruitment-strategy\">recruits</a> a <a href=\"#cxn:locational-construction\">locative clause</a>, in particular a <a href=\"#cxn:presentational-location-construction\">presentational locative</a>, to express possession. (Section 10.4.2)"}, "str:locational-strategy": {"definition": "the <a href=\"#str:strategy\">strategy</a> of <a href=\"#str:recruitment-strategy\">recruiting</a> what was originally a <a href=\"#cxn:predicational-location-construction\">locative predication construction</a> for other <a href=\"#inf:predication\">predication</a> <span class=\"separation\"/> <a href=\"#cxn:construction\">constructions</a>, both <a href=\"#cxn:prototypical-construction\">prototypical</a> and <a href=\"#cxn:nonprototypical-predication-construction\">nonprototypical predication constructions</a>. An originally locative predication construction employs a <a href=\"#cxn:locative-phrase\">location predicate</a>, typically a <a href=\"#cxn:body-position-predicate\">body position verb</a>. <em>Example</em>: Amele <em>uqa me bil-i-a</em> [he good sit-<span class=\"sc\">3sg-prs</span>] <q>He is good</q> recruits the locative predication construction with the posture verb <q>sit</q> for property predication. (Section 10.2)"}};
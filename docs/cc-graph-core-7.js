@@ -0,0 +1 @@
+DATA.shards[7] = {"str:locative-comparative": {"definition": "a <a href=\"#str:fixed-case\">fixed-case strategy</a> in <a href=\"#cxn:comparative-construction\">comparative constructions</a> in which there is a <a href=\"#cxn:clause\">clause</a> which attributes a <a href=\"#sem:gradable-predicative-scale\">gradable predicative scale</a> to the <a href=\"#sem:comparee\">comparee</a>, and the <a href=\"#sem:standard\">standard</a> is expressed as an oblique <a href=\"#cxn:argument-phrase\">argument phrase</a> using a spatial flag with a locative (<q>on, at</q>) <a href=\"#sem:meaning\">meaning</a>. <em>Example</em>: Ubykh <em>yi-gune wo-gune-n ca-qasaqa-j</em> <q>This tree is taller than that tree</q> is an instance of the locative comparative: <em>yi-gune ca-qasaqa-j</em> asserts that this tree is bigger, and <em>wo-gune-n</em> expresses the standard, that tree, with a suffix <em>-n</em> meaning <q>on</q>. (Section 17.2.2)"}, "str:locus-of-inflection-of-serial-verbs": {"definition": "alternative <a href=\"#str:strategy\">strategies</a> found with <a href=\"#str:serial-verb-strategy\">serial verb</a> and <a href=\"#cxn:auxiliary-construction\">auxiliary constructions</a>, based on where the verbal inflections are located. There are several possibilities, including: inflection on the first <a href=\"#cxn:verb\">verb</a> (or inflection on the <a href=\"#cxn:auxiliary\">auxiliary</a>); inflection on the last verb (or inflection on the main verb in an auxiliary construction); same inflection on both/all verbs/auxiliaries; inflection split across the two verbs (or verb and auxiliary); or separate inflection (the last relevant to <u>basic</u> <a href=\"#cxn:eventive-complex-predicate\">eventive complex predicates</a> only). (Sections 13.2, 13.3.2)"}, "str:logophoric-system": {"definition": "a <a href=\"#str:system\">system</a> found with certain <a href=\"#cxn:complement-clause-construction\">complement clause constructions</a> where one <a href=\"#str:strategy\">strategy</a> is used when a <a href=\"#sem:participant-role\">participant</a> in the <a href=\"#cxn:complement\">complement</a> <span class=\"separation\"/> <a href=\"#sem:event\">event</a> is <a href=\"#inf:coreference\">coreferential</a> with the <u>speaker</u>, <u>addressee</u>, or <a href=\"#sem:experiencer\">experiencer</a> of an <a href=\"#sem:utterance-event\">utterance</a>, <a href=\"#sem:propositional-attitude-event\">propositional attitude</a>, <a href=\"#sem:knowledge-event\">knowledge</a>, or <a href=\"#sem:commentative-event\">commentative event</a> (the <a href=\"#cxn:logophoric-construction\">logophoric construction</a>), and a different strategy is used when there is no such coreference relation. <em>Example</em>: in Donno S\u0254 <em>Oumar Anta inyem\u025b\u00f1 waa be gi</em> <q>Oumar<sub>i</sub> said that Anta had seen him<sub>i</sub></q>, the reference to Oumar in the complement clause uses a special <a href=\"#cxn:pronoun\">pronoun</a> form <em>inyem\u025b\u00f1</em>, but in <em>Oumar Anta wo\u00f1 waa be gi</em> <q>Oumar<sub>i</sub> said that Anta had seen him<sub>k</sub></q>, the referent in the complement is not Oumar, and so the ordinary <a href=\"#sem:third-person\">third person</a> <span class=\"separation\"/> <a href=\"#cxn:anaphoric-pronoun\">anaphoric pronoun</a> <em>wo\u00f1</em> is used. (Section 18.4.2)"}, "str:long-distance-reflexive": {"definition": "a <a href=\"#str:strategy\">strategy</a> in which a <a href=\"#sem:reflexive\">reflexive</a> <span class=\"separation\"/> <a href=\"#cxn:pronoun\">pronoun</a> is used where the <a href=\"#cxn:referring-phrase\">referring phrase</a> denoting the referent with which the reflexive pronoun is <a href=\"#inf:coreference\">coreferential</a> does not occur in the same <a href=\"#cxn:clause\">clause</a> (more or less; the precise definition of <q>local</q> uses of the reflexive pronoun varies). In particular, in the context of this textbook, a reflexive pronoun is used in a <a href=\"#cxn:logophoric-construction\">logophoric construction</a>. <em>Example</em>: in Japanese <em>Takasi wa Taroo ni Yosiko ga zibun o nikundeiru koto o hanasita</em> <q>Takasi<sub>i</sub> told Taroo that Yosiko hated him<sub>i</sub></q>, the reflexive pronoun <em>zibun</em> in the <a href=\"#sem:utterance-event\">utterance</a> <span class=\"separation\"/> <a href=\"#cxn:complement\">complement</a> <em>Yosiko ga zibun o nikundeiru koto o</em> is coreferential with the <u>speaker participant</u> <em>Takasi</em> in the <a href=\"#cxn:matrix-clause\">matrix clause</a>. It appears that use of a long-distance reflexive in a logophoric construction is part of a larger range of uses of long-distance reflexives, and may not represent a true <a href=\"#str:logophoric-system\">logophoric system</a>. (Section 18.4.2)"}, "str:mensural-classifier": {"definition": "a <a href=\"#str:strategy\">strategy</a> used for the <a href=\"#cxn:mensural-modification-construction\">mensural construction</a> that is morphosyntactically similar to the <a href=\"#str:sortal-classifier\">(sortal) classifier strategy</a> used in the language. <em>Example</em>: in Cantonese <em>l\u00e9uhng w\u00fan faahn</em> <q>two bowls of rice</q>, <em>w\u00fan</em> <q>bowl</q> is a mensural classifier that recruits the same construction as is used for sortal classifiers in the language. (Section 5.2.2)"}, "str:merged-argument-structure-strategy": {"definition": "a <a href=\"#str:strategy\">strategy</a> found in <a href=\"#cxn:complement-clause-construction\">complement clause constructions</a> in which there is a single <a href=\"#cxn:clause\">argument structure construction</a> associated with the combination of the <a href=\"#cxn:complement-taking-predicate\">complement-taking predicate</a> and the <a href=\"#cxn:complement\">complement</a> <span class=\"separation\"/> <a href=\"#cxn:predicate\">predicate</a>. <em>Example</em>: French <em>J'ai fait manger le pain par le chat</em> <q>I made the cat eat the bread</q> has a single argument structure for the participants of the combined event of <q>making eat</q>: the <a href=\"#sem:causer\">causer</a> <em>J'</em> <q>I</q> is the Subject, the <a href=\"#sem:causee\">causee</a>/<a href=\"#sem:agent\">agent</a> <em>par le chat</em> <q>(by) the cat</q> is an Oblique, and the <a href=\"#sem:patient\">patient</a> of the eating event <em>le pain</em> <q>the bread</q> is the Object. A merged argument structure strategy is essentially a simple argument structure construction that is found with a biclausal complement clause construction, <a href=\"#str:balancing\">balanced</a> or <a href=\"#str:deranking\">deranked</a>. (Section 18.4.1)"}, "str:middle-voice": {"definition": "a <a href=\"#str:strategy\">strategy</a> for the <a href=\"#cxn:intransitive-construction\">intransitive construction</a> that <a href=\"#str:recruitment-strategy\">recruits</a> a <a href=\"#sem:reflexive\">reflexive</a> or <a href=\"#cxn:reciprocal-construction\">reciprocal construction</a>, for the expression of a subset of <a href=\"#sem:monovalent\">monovalent events</a>. <em>Example</em>: Ancient Greek <em>pete-sthai</em> <q>fly</q> is an example of a middle voice form, using the suffix <em>-sthai</em>. The middle voice construction may be a more <a href=\"#def:grammaticalization\">grammaticalized</a> form of the original construction. (Section 7.2)"}, "str:monoclausal-transitive-reciprocal-strategy": {"definition": "the <a href=\"#str:strategy\">strategy</a> of <a href=\"#str:recruitment-strategy\">recruiting</a> the <a href=\"#cxn:transitive-construction\">transitive construction</a> to use as a <a href=\"#cxn:reciprocal-construction\">reciprocal construction</a> but with only one <q>direction</q> of the reciprocal <a href=\"#sem:event\">event</a> directly expressed. <em>Example</em>: the Tonga sentence <em>Joni ba-la-yand-ana amukaintu wakwe</em> <q>John and his wife love each other</q> is literally <q>John mutually-loves his wife</q>, with <em>amukaintu wakwe</em> <q>his wife</q> as Direct Object and also an <a href=\"#str:overt-coding\">overt</a> Reciprocal suffix <em>-ana</em> on the <a href=\"#cxn:verb\">verb</a>. (Section 7.2)"}, "str:monosyndetic": {"definition": "a <a href=\"#str:strategy\">strategy</a> used in <a href=\"#str:syndetic\">syndetic</a> <span class=\"separation\"/> <a href=\"#cxn:coordinate-construction\">coordination</a> where there are fewer <a href=\"#str:coordinator\">coordinators</a> than <a href=\"#cxn:coordinand\">coordinands</a>. <em>Example</em>: the simplest example, which gives rise to the term, is one coordinator in a construction with two or more coordinands, as in <em>Iraqw and English</em> or <em>Jerry, Bobby, and Phil</em>. The term has been extended to coordination with multiple coordinands and one less coordinator than coordinand, as in Iraqw <em>Kwermuhl nee Tlawi nee Dongobesh nee Haydom nee Daudi</em> <q>Kwermuhl, Tlawi, Dongobesh, Haydom, and Daudi [place names]</q>. (Section 15.2.2)"}, "str:neutral-alignment": {"definition": "a <a href=\"#str:system\">system</a> in which all three of the <a href=\"#sem:a-role\">A</a>, <a href=\"#sem:p-role\">P</a>, and <a href=\"#sem:s-role\">S roles</a> are expressed with the same <a href=\"#def:form\">form</a>. <em>Example</em>: English <a href=\"#cxn:argument-phrase\">argument phrases</a> use the same (zero) <a href=\"#str:flagging\">flag</a> for A, P, and S roles: <em>Jack</em> [A] <em>broke the window</em> [P] and <em>Jack</em> [S] <em>died</em>. (Section 6.3.1)"}, "str:neutral-ditransitive-alignment": {"definition": "a <a href=\"#str:system\">system</a> in which all three of the <a href=\"#sem:p-role\">P</a>, <a href=\"#sem:theme\">T</a>, and <a href=\"#sem:recipient\">R roles</a> are expressed with the same <a href=\"#def:form\">form</a>. <em>Example</em>: the English Double Object Construction, as in <em>Carol sent the landlord the check</em>, expresses the T and R roles (<em>the check</em> and <em>the landlord</em>, respectively) in the same way as the P role in <em>Carol wrote the check</em> \u2013 namely, as postverbal <a href=\"#cxn:argument-phrase\">argument phrases</a> without a <a href=\"#str:flagging\">flag</a>. (Section 7.5.2)"}, "str:nominalizer": {"definition": "a form that signals that a word is being used to <a href=\"#inf:reference\">refer</a>, typically pertaining to a referent from a nonprototypical <a href=\"#def:semantic-classes\">semantic class</a> for <a href=\"#inf:reference\">reference</a>. <em>Example</em>: the suffix <em>-ness</em> in <em>oddness</em> and the suffix <em>-ment</em> in <em>movement</em> are used when a <a href=\"#sem:property-concept\">property</a> concept like <q>odd</q> or an <a href=\"#sem:action-concept\">action</a> concept like <q>move</q> are being referred to. (Section 3.4.2)"}, "str:nominative-category": {"definition": "the <a href=\"#def:morphosyntax\">morphosyntactic</a> category in the <a href=\"#str:accusative-alignment\">accusative alignment system</a> that <a href=\"#str:co-expression\">co-expresses</a> both <a href=\"#sem:a-role\">A</a> and <a href=\"#sem:s-role\">S roles</a>. <em>Example</em>: English verbs use the same <a href=\"#str:index\">index</a> in the Present Tense (3rd Person Singular <em>-s</em>, otherwise zero) for both A and S roles (<em>Emily sing-s, Emily play-s the piano</em>), hence the <em>-s/-\u00d8</em> index is a nominative index. (Section 6.3.1)"}, "str:non-indexed": {"definition": "a <a href=\"#str:strategy\">strategy</a> in which the <a href=\"#sem:stative\">stative</a> <span class=\"separation\"/> <a href=\"#cxn:predicate\">predicate</a> in a <a href=\"#cxn:stative-complex-predicate\">stative complex predicate construction</a> does not <a href=\"#str:index\">index</a> an <a href=\"#inf:reference\">argument</a> of the other (<a href=\"#sem:dynamic\">dynamic</a>) predicate in the construction. (Section 14.2)"}, "str:nonperson-indexation": {"definition": "an <a href=\"#str:indexation\">indexical strategy</a> in which certain categories, typically <a href=\"#sem:number\">number</a> and <a href=\"#sem:gender-class\">gender\u2013class</a>, but not the category of <a href=\"#sem:person\">person</a>, are encoded in the <a href=\"#str:index\">index</a>. <em>Example</em>: in Russian <em>molod-aja sosna</em> <q>young pine</q>, the suffix <em>-aja</em> on <em>molod-</em> <q>young</q> indexes its <a href=\"#inf:reference\">referent</a>, also referred to by <em>sosna</em> <q>pine</q>, by <a href=\"#sem:number\">number</a> and <a href=\"#sem:gender-class\">gender\u2013class</a> (Feminine Singular), and <a href=\"#sem:semantic-role\">case</a> (Nominative). (Section 4.4.2)"}, "str:nonverbal-copula-strategy": {"definition": "the <a href=\"#str:strategy\">strategy</a> for <a href=\"#cxn:nonprototypical-predication-construction\">nonprototypical predication</a> that employs an uninflecting <a href=\"#str:copula\">copula</a>, typically derived from a <a href=\"#cxn:personal-pronoun\">personal</a> or <a href=\"#cxn:demonstrative-pronoun\">demonstrative pronoun</a>, <a href=\"#inf:reference\">topic</a> <u>marker</u>, or <a href=\"#str:focus-marker\">focus marker</a>. <em>Example</em>: Nakanai <em>eia <strong>la</strong> taua sesele</em> <q>he is truly a spirit</q> uses the demonstrative form <em>la</em> for object predication. (Section 10.2)"}, "str:noun-incorporation": {"definition": "a <a href=\"#str:strategy\">strategy</a> used for a range of <a href=\"#def:function\">functions</a> but mostly for the <a href=\"#cxn:antipassive-construction\">antipassive construction</a> function, in which the <a href=\"#cxn:noun\">noun</a> expressing the <a href=\"#sem:p-role\">P</a> <span class=\"separation\"/> <a href=\"#sem:participant-role\">participant</a> is morphologically reduced and compounded with the <a href=\"#cxn:verb\">verb</a>. <em>Example</em>: in <em>He is off mountain-climbing</em>, the P participant, the mountain, is expressed by the noun <em>mountain</em> compounded with the verb form <em>climbing</em>. (Section 8.4)"}, "str:noun-modifying-clause-strategy": {"definition": "the <a href=\"#str:strategy\">strategy</a> of employing the same <a href=\"#def:morphosyntax\">morphosyntactic</a> structure for both the <a href=\"#cxn:noun-complement-clause-construction\">noun complement clause construction</a> and the <a href=\"#cxn:relative-clause-construction\">relative clause construction</a>. <em>Example</em>: Japanese uses the noun-modifying clause strategy \u2013 the same <a href=\"#str:externally-headed\">externally headed</a> strategy is used for both the relative clause construction ([<em>gakusei ga katta</em>] <em>hon</em> <q>the book that the student bought</q>) and the noun complement clause construction ([<em>gakusei ga hon o katta</em>] <em>zizitu</em> <q>the fact that the student bought the book</q>). (Section 19.2.4)"}, "str:omitted-p-strategy": {"definition": "a <a href=\"#str:strategy\">strategy</a> of the <a href=\"#cxn:antipassive-construction\">antipassive construction</a> in which the <a href=\"#sem:p-role\">P</a> <span class=\"separation\"/> <a href=\"#sem:participant-role\">participant</a> is unexpressed. <em>Example</em>: in <em>She ate</em>, the P participant (the food eaten) is left unexpressed. (Section 8.4)"}, "str:ordered-strategy": {"definition": "the <a href=\"#str:strategy\">strategy</a> for <a href=\"#cxn:comparative-construction\">comparative</a> (and possibly <a href=\"#cxn:equative-construction\">equative</a>) <a href=\"#cxn:construction\">constructions</a> which metaphorically expresses the comparison of the <a href=\"#sem:comparee\">comparee</a> and the <a href=\"#sem:standard\">standard</a> on the <a href=\"#sem:gradable-predicative-scale\">gradable predicative scale</a> as a spatial <a href=\"#sem:path-event\">path</a> between the comparee (as spatial <a href=\"#sem:figure\">figure</a>) and the standard (as the <a href=\"#sem:ground\">ground</a>). In comparative constructions, the ordered strategy <a href=\"#str:recruitment-strategy\">recruits</a> a <a href=\"#inf:different-subject\">different-subject</a>, <a href=\"#str:absolute-deranking-system\">absolutely deranked</a>, <a href=\"#sem:simultaneous\">simultaneous</a>, or <a href=\"#sem:consecutive\">consecutive</a> <u>temporal</u> <a href=\"#cxn:complex-sentence\">complex sentence construction</a> to express comparison. The <a href=\"#str:separative-comparative\">separative</a>, <a href=\"#str:allative-comparative\">allative</a>, and <a href=\"#str:locative-comparative\">locative comparatives</a> are examples of the ordered strategy. (Section 17.2.3)"}, "str:overt-coding": {"definition": "a <a href=\"#str:strategy\">strategy</a> in which the <a href=\"#def:function\">function</a> of the <a href=\"#cxn:construction\">construction</a> is expressed by an overt form in the construction. <em>Example</em>: in the English Predicate Nominal Construction illustrated by <em>She is a professor</em>, <em>be</em> overtly codes the <a href=\"#inf:predication\">predication</a> function for the <a href=\"#sem:object-concept\">object concept</a> denoted by <em>professor</em>. (Section 2.4)"}, "str:overtly-coded-single-role-strategy": {"definition": "the <a href=\"#str:strategy\">strategy</a> of <a href=\"#str:recruitment-strategy\">recruiting</a> the <a href=\"#cxn:intransitive-construction\">intransitive construction</a> for use in a <a href=\"#cxn:reflexive-construction\">reflexive construction</a> or a <a href=\"#cxn:reciprocal-construction\">reciprocal construction</a>, but with <a href=\"#str:overt-coding\">overt coding</a> of the predicate indicating the <a href=\"#sem:reflexive\">reflexive event</a> or <a href=\"#reciprocal\">reciprocal event</a> type. <em>Examples</em>: Abkhaz <em>l-\u00e7\u0259-l-k\u00b0abe-yt'</em> <q>she washed herself</q> is an Intransitive Verb form with the Reflexive prefix <em>\u00e7\u0259-</em>, and Swahili <em>wa-na-pend-an-a</em> <q>they love each other</q> is an Intransitive Verb form with the Reciprocal suffix <em>-an</em>. (Section 7.2)"}, "str:overtly-coded-verb": {"definition": "a <a href=\"#str:strategy\">strategy</a> with any of the different kinds of <a href=\"#cxn:clause\">voice constructions</a> in which there is <a href=\"#str:overt-coding\">overt coding</a> of the <a href=\"#def:function\">function</a> of the voice construction on the <a href=\"#cxn:verb\">verb</a>. <em>Example</em>: Hungarian <em>J\u00e1nos <strong>be</strong>-\u00fcltette a kerte-t f\u00e1k-kal</em> <q>John planted the garden with trees</q> is an applicative construction with the overt applicative prefix <em>be-</em> on the verb <em>\u00fcltette</em> <q>planted</q>. (Section 9.4)"}, "str:overtly-headed-strategy": {"definition": "a <a href=\"#str:strategy\">strategy</a> for the <a href=\"#cxn:anaphoric-head-construction\">anaphoric-head construction</a> in which there is an <a href=\"#str:overt-coding\">overt</a> morpheme that functions as the <a href=\"#cxn:head\">head</a>. <em>Example</em>: in <em>I took a red candy and Greg took a green one, a green one</em> is an example of the overtly headed strategy for the anaphoric-head construction, because <em>one</em> serves as an anaphoric head (with respect to <a href=\"#inf:type-identity\">type identity</a>) in the construction. (Section 5.4)"}, "str:partially-merged-argument-structure-strategy": {"definition": "a <a href=\"#str:strategy\">strategy</a> found in <a href=\"#cxn:complement-clause-construction\">complement clause constructions</a> in which the <a href=\"#cxn:clause\">argument structure construction</a> associated with the <a href=\"#cxn:complement-taking-predicate\">complement-taking predicate</a> (CTP) is only partially distinct from the argument structure construction associated with the <a href=\"#cxn:complement\">complement</a> <span class=\"separation\"/> <a href=\"#cxn:predicate\">predicate</a>. <em>Example</em>: in <em>I made him cook dinner</em>, the CTP <em>made</em> and the complement predicate <em>cook</em> each has its own Object (<em>him</em> and <em>dinner</em>, respectively), indicating that the argument structure constructions are at least partially distinct; but the <a href=\"#sem:necessary-participant-sharing\">necessarily shared participant</a> <em>him</em> is expressed only once, as the Object of the CTP. A partially merged argument structure strategy is typically, but not always, associated with a <a href=\"#str:deranking\">deranked</a> complement clause construction. A partially merged argument structure strategy always involves the expression of a <a href=\"#sem:participant-role\">participant</a> in the <a href=\"#cxn:complement\">complement</a> as an <a href=\"#cxn:argument-phrase\">argument phrase</a> dependent on the <a href=\"#cxn:matrix-clause\">matrix clause</a> predicate \u2013 or, eventually, the <a href=\"#cxn:complex-predicate\">complex predicate</a> made up of the former matrix clause and complement clause predicates. (Section 18.4.1)"}, "str:participial-strategy": {"definition": "a <a href=\"#str:strategy\">strategy</a> used in the <a href=\"#cxn:stative-complex-predicate\">stative complex predicate construction</a> in which the <a href=\"#cxn:manner-complex-predicate\">manner</a> (more generally, <a href=\"#sem:stative\">stative</a>) <u>component</u> is packaged as a separate primary <a href=\"#inf:predication\">predication</a> <span class=\"separation\"/> <a href=\"#cxn:coordinate-construction\">coordinated</a> with the <a href=\"#sem:event\">event</a> predication using a <a href=\"#str:deranking\">deranked</a> <span class=\"separation\"/> <a href=\"#cxn:complex-sentence\">complex sentence</a> <span class=\"separation\"/> <a href=\"#str:strategy\">strategy</a>. In addition, the stative predicate is predicated of, and ideally <a href=\"#str:index\">indexes</a>, (one of) its argument(s). <em>Example</em>: in Sanuma <em>opi-i a kali-palo-ma</em> <q>He worked slowly</q> [lit. <q>being slow, he worked</q>] <em>opi-i</em> <q>be slow</q> is in a deranked form with suffix <em>-i</em>; the suffix, however, indicates that <em>opi</em> <q>slow</q> has the same subject as <em>kali-palo-ma</em> <q>worked</q> \u2013 namely, <q>he</q>. (Section 14.2)"}, "str:participle": {"definition": "a <a href=\"#str:deranking\">deranked</a> <span class=\"separation\"/> <a href=\"#cxn:relative-clause\">relative clause</a> <span class=\"separation\"/> <a href=\"#cxn:predicate\">predicate</a>. <em>Example</em>: in <em>The car almost hit the roadrunner</em> [<em>eat<strong>ing</strong> a grasshopper</em>], <em>eating</em> is a participle in the relative clause <em>eating a grasshopper</em>. (Section 19.2.1)"}, "str:particle-comparative": {"definition": "a <a href=\"#str:derived-case\">derived-case</a> <span class=\"separation\"/> <a href=\"#sem:comparative-relation\">comparative</a> <span class=\"separation\"/> <a href=\"#str:strategy\">strategy</a> that consists of two <a href=\"#cxn:clause\">clauses</a> which assert that the <a href=\"#sem:gradable-predicative-scale\">gradable predicative scale</a> applies to the <a href=\"#sem:comparee\">comparee</a> and the <a href=\"#sem:standard\">standard</a>, but the second clause uses the <a href=\"#str:zero-copula\">zero copula strategy</a> for <a href=\"#cxn:predicate-identity-construction\">predicate identity</a>, and the <a href=\"#str:conjunction\">conjunction</a> is a particle with diverse etymological origins. <em>Example</em>: <em>Randy is older than Tom (is)</em> is an instance of the particle strategy: the clause <em>Randy is older</em> is followed by the particle <em>than</em> which introduces the standard phrase <em>Tom</em> without its own <a href=\"#cxn:predicate\">predicate</a> (only an optional auxiliary <em>is</em>). (Section 17.2.2)"}, "str:particle-equative": {"definition": "a <a href=\"#str:derived-case\">derived-case strategy</a> for <a href=\"#cxn:equative-construction\">equative constructions</a> which consists of a <a href=\"#cxn:matrix-clause\">matrix clause</a> which expresses that the <a href=\"#sem:gradable-predicative-scale\">gradable predicative scale</a> applies to the <a href=\"#sem:comparee\">comparee</a>, and a <a href=\"#cxn:dependent-clause\">dependent clause</a> expressing that the same scale applies to the <a href=\"#sem:standard\">standard</a>. The dependent clause is in the form of a particle acting as a <a href=\"#str:conjunction\">conjunction</a>, and the <a href=\"#cxn:argument-phrase\">argument phrase</a> expressing the standard; the <a href=\"#str:zero-copula\">zero copula strategy</a> is used for <a href=\"#cxn:predicate-identity-construction\">predicate identity</a>. <em>Example</em>: Chechen <em>a\u0127a d\u00f6\u0161u as sanna</em> <q>You read like I [do]</q> is an instance of the particle equative strategy: the matrix clause <em>a\u0127a d\u00f6\u0161u</em> <q>You read</q> predicates the scale of the comparee; the particle <em>sanna</em> <q>like</q> introduces the standand <em>as</em> <q>I</q>, which is in the same <a href=\"#sem:semantic-role\">case</a> as the comparee (the Ergative). (Section 17.2.4)"}, "str:perception-verb-strategy": {"definition": "a <a href=\"#str:strategy\">strategy</a> for the <a href=\"#cxn:presentational-construction\">presentational construction</a> in which the <a href=\"#cxn:referring-phrase\">referring phrase</a> introducing the <a href=\"#inf:reference\">referent</a> is expressed as the stimulus of a <a href=\"#sem:perception-event\">perception event</a>. <em>Example</em>: an English example from the Pear Stories narrative is <em>and um then you see this little girl. Coming on a bicycle in the opposite direction, ...</em> More grammaticalized versions of this strategy include French <em><strong>Voici</strong> un coffre ... <strong>Voil\u00e0</strong> un autre coffre</em> <q>Here is a treasure chest ... There is another treasure chest</q>. (Section 10.4.3)"}, "str:person-indexation": {"definition": "an <a href=\"#str:indexation\">indexical strategy</a> in which the category of <a href=\"#sem:person\">person</a> is encoded in the <a href=\"#str:index\">index</a>. Other categories, typically <a href=\"#sem:number\">number</a> and <a href=\"#sem:gender-class\">gender\u2013class</a>, may also be encoded in the index. <em>Example</em>: in Mam <em>t-kamb' meeb'a</em> <q>the orphan's prize</q>, the third person prefix <em>t-</em> on <em>kamb'</em> <q>prize</q> indexes the possessor, who is also referred to by <em>meeb'a</em> <q>orphan</q>. (Section 4.4.1)"}, "str:phenomime": {"definition": "the <a href=\"#str:ideophones\">ideophone strategy</a> used to express a <a href=\"#sem:property-concept\">property</a> of movement, visual appearance or light emission, texture, or taste. <em>Example</em>: Siwu <em>w\u00f9r\u00f9f\u00f9\u00f9</em> <q>fluffy</q> is a phenomime; it describes the texture of an object using an ideophone. (Section 14.4)"}, "str:phonomime": {"definition": "the <a href=\"#str:ideophones\">ideophone strategy</a> used to express a <a href=\"#sem:property-concept\">property</a> of sound emission. <em>Example</em>: Japanese <em>potapota potapota</em> <q>dripping</q> is a phonomime; it describes the sound of dripping using an ideophone. (Section 14.4)"}, "str:possessive-locative-strategy": {"definition": "a <a href=\"#str:strategy\">strategy</a> for the <a href=\"#cxn:presentational-construction\">presentational construction</a> in which the <a href=\"#cxn:referring-phrase\">referring phrase</a> introducing the <a href=\"#inf:reference\">referent</a> is expressed as the <a href=\"#sem:possessum\">possessum</a> in a <a href=\"#cxn:presentational-possession-construction\">presentational possession construction</a>. <em>Example</em>: Swahili <em>ku na mgeni nyumba-ni</em> [<span class=\"sc\">loc.clf</span> with stranger home-at] <q>There is a stranger at home</q>, uses the <a href=\"#str:with-possessive-strategy\">with-possessive strategy</a> of the presentational possessive construction to express the stranger as the possessum; the location at home is expressed by a locative phrase. (Section 10.4.3)"}, "str:posterior-deranking": {"definition": "the variant of a <a href=\"#str:deranking\">deranking strategy</a> in which the deranked <a href=\"#cxn:clause\">clauses</a> follow the clause that is expressed like a simple <a href=\"#cxn:main-clause\">main clause</a>. <em>Example</em>: Big <em>Nambas a-\u0259ln talei ka-vruh ka-vmi'i arna pitha</em> <q>So they left their knives and ran away and climbed over the hill...</q> is an instance of posterior deranking: the prefix <em>ka-</em> on <em>ka-vruh</em> <q>run away</q> and <em>ka-vmi'i</em> <q>go over</q> indicates that the posterior predicates are deranked. (Section 15.2.3)"}, "str:postnominal-strategy": {"definition": "a <a href=\"#str:word-order\">word order</a> strategy for <a href=\"#str:externally-headed\">externally headed</a> <span class=\"separation\"/> <a href=\"#cxn:relative-clause-construction\">relative clause constructions</a> in which the <a href=\"#cxn:relative-clause\">relative clause</a> follows the <a href=\"#cxn:relative-clause-head\">relative clause head</a>. <em>Example</em>: in <em>I ate the cheesecake</em> [<em>that Carol baked</em>], <em>that Carol baked</em> is postnominal because it follows <em>the cheesecake</em>. The postnominal strategy is much more common than the <a href=\"#str:prenominal-strategy\">prenominal</a> strategy. (Section 19.2.2)"}, "str:postposition": {"definition": "an <a href=\"#str:adposition\">adposition</a> which occurs after the <a href=\"#cxn:head\">head</a> of the <a href=\"#cxn:referring-phrase\">referring phrase</a>. <em>Example</em>: in Urarina <em>nii banaao asae</em> <q>under that leaf shelter</q>, <em>asae</em> <q>under</q> follows <em>nii banaao</em> <q>that leaf shelter</q>. (Section 4.3)"}, "str:predicational-locative-strategy": {"definition": "a <a href=\"#str:strategy\">strategy</a> for the <a href=\"#cxn:presentational-location-construction\">presentational location construction</a> (and <a href=\"#cxn:presentational-construction\">presentational</a> constructions in general) which recruits the <a href=\"#cxn:predicational-location-construction\">predicational location construction</a>. The predicational locative strategy has a fixed-order subtype, where the word order of figure phrase and locative phrase remains the same. <em>Example</em>: Welsh <em>mae car yma</em> <q>There is a car here</q> has the same word order as the predicational locative <em>Mae'r car yma</em> <q>The car is here</q>. The predicational locative strategy also has a reverse-order subtype, where the word order is reversed so that the locative phrase precedes the figure phrase. <em>Example</em>: <em>On the table was a large bowl</em> has the same structure as <em>The large bowl was on the table</em>, except that the order of <em>on the table</em> and <em>a/the large bowl</em> is reversed. More <a href=\"#def:grammaticalization\">grammaticalized</a> versions of this strategy include English <em><strong>There's</strong> a snake in the back yard</em>. (Section 10.4.3)"}, "str:predicational-strategy": {"definition": "a <a href=\"#str:strategy\">strategy</a> used in the <a href=\"#cxn:stative-complex-predicate\">stative complex predicate construction</a> in which the <a href=\"#cxn:manner-complex-predicate\">manner</a> or other <a href=\"#sem:stative\">stative component</a> is <a href=\"#inf:information-packaging\">packaged</a> as the sole <a href=\"#inf:predication\">predication</a>, and the <a href=\"#sem:event\">event</a> is packaged as the <a href=\"#inf:high-topicality\">subject</a> <span class=\"separation\"/> <a href=\"#inf:reference\">argument</a> of the manner predication. <em>Example</em>: in Mokilese <em>ah kijou dahr</em> <q>He runs fast</q> [lit. <q>his running is fast</q>], the speed is predicated of the event. (Section 14.2)"}, "str:predicativization-possessive-strategy": {"definition": "a <a href=\"#str:strategy\">strategy</a> for the <a href=\"#cxn:presentational-possession-construction\">presentational possession construction</a> in which the <a href=\"#sem:possessum\">possessum</a> is <u>incorporated</u> as part of the possessive <a href=\"#cxn:predicate\">predicate</a>. <em>Examples</em>: Tundra Yukaghir <em>m\u0101rqa-n l\u0101me-n'-\u014bi</em> [one dog-with-<span class=\"sc\">3pl.intr</span>] <q>They had one dog</q> is an instance of the flexional (inflected) subtype of the predicativization possessive strategy, and Pitjantjatjara <em>ngankulukula-tjara</em> [I spear-<span class=\"sc\">proprietive</span>] <q>I have a spear</q> [lit. <q>I am spear-having</q>] is an instance of the copular/zero (uninflected) subtype of the strategy. (Section 10.4.2)"}, "str:prenominal-strategy": {"definition": "a <a href=\"#str:word-order\">word order</a> strategy for <a href=\"#str:externally-headed\">externally headed</a> <span class=\"separation\"/> <a href=\"#cxn:relative-clause-construction\">relative clause constructions</a> in which the <a href=\"#cxn:relative-clause\">relative clause</a> precedes the <a href=\"#cxn:relative-clause-head\">relative clause head</a>. <em>Example</em>: in Turkish [<em>Hasan\u0131n Sinana ver-di\u011f-i</em>] <em>patatesi yedim</em> <q>I ate the potato that Hasan gave to Sinan</q>, the <em>Hasan\u0131n Sinana ver-di\u011f-i</em> <q>[that] Hasan gave to Sinan</q> is prenominal because it precedes the relative clause head <em>patatesi</em> <q>potato</q>. The prenominal strategy is much less common than the <a href=\"#str:postnominal-strategy\">postnominal</a> strategy, and is strongly correlated with <a href=\"#inf:object-argument\">object</a>\u2013<a href=\"#cxn:verb\">verb</a> word order. (Section 19.2.2)"}, "str:preposition": {"definition": "an <a href=\"#str:adposition\">adposition</a> which occurs before the <a href=\"#cxn:head\">head</a> of the <a href=\"#cxn:referring-phrase\">referring phrase</a>. <em>Example</em>: in <em>on the table, on</em> is an adposition that precedes <em>the table</em>. (Section 4.3)"}, "str:primary-object-category": {"definition": "the <a href=\"#def:morphosyntax\">morphosyntactic</a> category in the <a href=\"#str:secundative-alignment\">secundative alignment system</a> that <a href=\"#str:co-expression\">co-expresses</a> both <a href=\"#sem:recipient\">R</a> and <a href=\"#sem:p-role\">P roles</a>. <em>Example</em>: in Huichol <em>nee uuki uukari ne-wa-puuzeiyast\u0268a</em> <q>I showed the man to the girls</q>, the <a href=\"#str:index\">index</a> <em>wa-</em> <q><span class=\"sc\">3pl</span></q> is the same used to index <em>t\u0268\u0268ri</em> <q>children</q> in <em>uukaraawiciiz\u0268 t\u0268\u0268ri me-wa-zeiya</em> <q>The women see the children</q>, and hence represents the primary object category. (Section 7.5.2)"}, "str:pronoun-retention-strategy": {"definition": "a <a href=\"#str:strategy\">strategy</a> for the expression of the <a href=\"#sem:necessary-participant-sharing\">necessarily shared participant</a> in the <a href=\"#cxn:relative-clause\">relative clause</a> of an <a href=\"#str:externally-headed\">externally headed</a> <span class=\"separation\"/> <a href=\"#cxn:relative-clause-construction\">relative clause construction</a>, in which the participant is expressed in the relative clause by an <a href=\"#cxn:anaphoric-pronoun\">anaphoric pronoun</a>. <em>Example</em>: the Modern Hebrew construction illustrated by <em>hasarim</em> [<em>she-ha-nasi shalax otam la mitsraim</em>] <q>the ministers that the President sent to Egypt</q>, uses the pronoun-retention strategy: the anaphoric pronoun <em>otam</em> <q>them</q> occurs in the relative clause <em>she-ha-nasi shalax otam la mitsraim</em> <q>that the President sent them to Egypt</q>, and refers to the external <a href=\"#cxn:relative-clause-head\">relative clause head</a> <em>hasarim</em> <q>the ministers</q>. (Section 19.2.2)"}, "str:prosody": {"definition": "a phonological <a href=\"#str:strategy\">strategy</a> typically used for expressing certain <a href=\"#cxn:nonpredicational-construction\">nonpredicational clause constructions</a> and <a href=\"#cxn:speech-act-construction\">speech act</a> constructions. <em>Example</em>: prosody can be used in English to express a <a href=\"#cxn:thetic-construction\">thetic</a> construction: <em>(What's the matter?) My NECK hurts</em>. (Section 11.3.2)"}, "str:pseudo-partitive": {"definition": "a <a href=\"#str:strategy\">strategy</a> for <a href=\"#cxn:mensural-modification-construction\">mensural constructions</a> in which a <a href=\"#cxn:possessive-modification-construction\">possessive modification construction</a> is <a href=\"#str:recruitment-strategy\">recruited</a> (or was recruited, as the pseudo-partitive often differs from the counterpart modification construction) to express the mensural relation. (Section 5.2.2)"}, "str:psychomime": {"definition": "the <a href=\"#str:ideophones\">ideophone strategy</a> used to express an experiential property such as bodily sensation or emotion. <em>Example</em>: Japanese <em>kurakura</em> <q>dizzy</q> is a psychomime; it describes a physiological sensation (dizziness) using an ideophone. (Section 14.4)"}, "str:quotative-marker": {"definition": "a <a href=\"#str:complementizer\">complementizer</a> used with <a href=\"#str:direct-report\">direct reports</a>. <em>Example</em>: in Kobon <em>ban n\u00f6p hag\u00f6p</em> [<em>yad ram arabin</em>] <em>a g\u00f6p</em> <q>Who said to you, <q class=\"dq\">I am going home</q>?</q>, <em>a</em> is a quotative marker used with the direct report <a href=\"#sem:utterance-event\">utterance</a> <span class=\"separation\"/> <a href=\"#cxn:complement\">complement</a> <em>yad ram arabin</em> <q>I am going home</q>. Like the direct report <a href=\"#str:strategy\">strategy</a> it accompanies, a quotative marker originates with utterance <a href=\"#cxn:complement-clause-construction\">complement clause constructions</a> but is extended to other complement clause constructions lower in the <a href=\"#def:binding-hierarchy\">Binding Hierarchy</a>. (Section 18.3.2)"}, "str:recruitment-strategy": {"definition": "a <a href=\"#str:strategy\">strategy</a> for a <a href=\"#cxn:construction\">construction</a> that uses the same <a href=\"#def:morphosyntax\">morphosyntactic</a> form that is used for another construction. <em>Example</em>: in English, the expression of an illness (<em>Jane has pneumonia / a cold</em>) recruits the same strategy used for the <a href=\"#inf:predication\">predication</a> of <a href=\"#sem:possession\">possession</a> (<em>Jane has a convertible</em>). (Section 1.4)"}, "str:relational-strategy": {"definition": "a strategy for encoding the relation in <a href=\"#inf:major-propositional-act\">major propositional acts</a> (<a href=\"#cxn:modifier\">modifier</a>\u2013<a href=\"#inf:reference\">referent</a>, <a href=\"#cxn:predicate\">predicate</a>\u2013<a href=\"#inf:reference\">argument</a>), in which there is a third morpheme that encodes the semantic relation between the two concepts. Examples of relational strategies include <a href=\"#str:adposition\">adpositions</a> and <a href=\"#str:case-affix\">case affixes</a>. (Section 4.3)"}, "str:relative-based-equative": {"definition": "a <a href=\"#str:derived-case\">derived-case strategy</a> for <a href=\"#cxn:equative-construction\">equative constructions</a> which consists of a <a href=\"#cxn:relative-clause\">relative clause</a>-like <a href=\"#cxn:construction\">construction</a> where the <a href=\"#cxn:matrix-clause\">matrix clause</a> expresses that the <a href=\"#sem:gradable-predicative-scale\">gradable predicative scale</a> applies to the <a href=\"#sem:comparee\">comparee</a>, and a relative clause expresses that the same scale applies to the <a href=\"#sem:standard\">standard</a>. The relative clause is reduced to a <a href=\"#str:relativizer\">relativizer</a> and an <a href=\"#cxn:argument-phrase\">argument phrase</a> expressing the standard; the <a href=\"#str:zero-copula\">zero copula strategy</a> is used for <a href=\"#cxn:predicate-identity-construction\">predicate identity</a>. <em>Example</em>: Lithuanian <em>\u0160iandien taip \u0161alta kaip vakar</em> <q>Today it is as cold as yesterday</q> is an instance of the relative-based equative strategy: <em>\u0160iandien taip \u0161alta</em> <q>today [is] so cold</q> is the matrix clause, with the degree marker <em>taip</em> <q>so</q>, and <em>kaip vakar</em> <q>how yesterday</q> is the relative-based clause, with the pronoun <em>kaip</em> <q>how</q>, the standard, <q>yesterday</q>, and a zero predicate. Typically the relative-based equative recruits a correlative relative clause, with a <a href=\"#inf:free-choice-referent\">free</a> (<a href=\"#cxn:indefinite-pronoun\">indefinite head</a>) <a href=\"#cxn:relative-clause\">relative</a> or interrogative-based <a href=\"#str:relative-pronoun-strategy\">relative pronoun</a>. (Section 17.2.4)"}, "str:relative-equal-equative": {"definition": "a <a href=\"#str:strategy\">strategy</a> for <a href=\"#cxn:equative-construction\">equative constructions</a> which combines two predicates, one expressing equality of the comparee on the <a href=\"#sem:gradable-predicative-scale\">gradable predicative scale</a>, similar to the <a href=\"#str:equal-equative\">equal equative</a>, and the other expressing the standard in a structure similar to the <a href=\"#str:relative-based-equative\">relative-based equative</a>. Like the relative-based equative, but unlike the equal equative, the relative equal equative is a <a href=\"#str:derived-case\">derived-case</a> strategy. <em>Example</em>: Spanish <em>Douglas y Pedro son igual de altos que Mar\u00eda</em> <q>Douglas and Pedro are as tall as Mar\u00eda</q> is an instance of the relative equal equative; the matrix predicate is <em>son igual</em> <q>[they] are equal</q> and the deranked <em>de altos</em> describes the scale. (Section 17.2.4)"}, "str:relative-pronoun-strategy": {"definition": "a <a href=\"#str:strategy\">strategy</a> for the expression of the <a href=\"#sem:necessary-participant-sharing\">necessarily shared participant</a> in the <a href=\"#cxn:relative-clause\">relative clause</a> of an <a href=\"#str:externally-headed\">externally headed</a> <span class=\"separation\"/> <a href=\"#cxn:relative-clause-construction\">relative clause construction</a>, in which the participant in the relative clause is expressed by a <a href=\"#cxn:pronoun\">relative pronoun</a> unique to the relative clause construction. <em>Example</em>: in <em>He stole the emerald</em> [<em>which he gave to his wife</em>], the relative clause is introduced by the relative pronoun <em>which</em>, which refers to the emerald, which is also expressed by the external <a href=\"#cxn:relative-clause-head\">relative clause head</a> <em>the emerald</em>. The relative pronoun strategy is rare crosslinguistically, and largely restricted to the European area. (Section 19.2.2)"}, "str:relative-strategy": {"definition": "the <a href=\"#str:strategy\">strategy</a> for <a href=\"#sem:comparative-relation\">comparative</a> (and possibly <a href=\"#cxn:equative-construction\">equative</a>) <a href=\"#cxn:construction\">constructions</a> which directly expresses two of the <a href=\"#sem:proposition\">propositions</a> that form the <a href=\"#sem:meaning\">meaning</a> of the comparative \u2013 that the <a href=\"#sem:gradable-predicative-scale\">gradable predicative scale</a> applies to the <a href=\"#sem:comparee\">comparee</a>, and that the comparee exceeds the <a href=\"#sem:standard\">standard</a> on the scale. That is to say, the relative strategy <a href=\"#str:recruitment-strategy\">recruits</a> a <a href=\"#inf:same-subject\">same-subject</a>, <a href=\"#str:conditional-deranking\">conditionally deranked</a>, usually <a href=\"#sem:simultaneous\">simultaneous</a> <u>temporal</u> <a href=\"#cxn:complex-sentence\">complex sentence construction</a> to express comparison. The <a href=\"#str:exceed-comparative\">exceed comparative</a> is an example of the relative strategy; the <a href=\"#str:conjoined-exceed-comparative\">conjoined exceed strategy</a> appears to be a related type. (Section 17.2.3)"}, "str:relativizer": {"definition": "a form that signals that an <a href=\"#sem:action-concept\">action</a> is being used as a <a href=\"#cxn:modifier\">modifier</a> \u2013 that is, it signals a <a href=\"#cxn:relative-clause\">relative clause</a>. <em>Example</em>: in <em>I ate the cheesecake</em> [<em>that Carol baked</em>], <em>that</em> is the relativizer. A relativizer makes a <a href=\"#cxn:relative-clause-construction\">relative clause construction</a> <span class=\"separation\"/> <a href=\"#str:syndetic\">syndetic</a>. (Section 19.2.1)"}, "str:repeater": {"definition": "a <a href=\"#str:sortal-classifier\">sortal classifier</a> that is identical in <a href=\"#def:form\">form</a> to the <a href=\"#cxn:noun\">noun</a> it <a href=\"#inf:modification\">modifies</a>. <em>Example</em>: in Lao <em>hang2 sip2 hang2</em> [nest two <span class=\"sc\">clf</span>] <q>two nests</q>, the sortal classifier <em>hang2</em> is identical to the noun <em>hang2</em> <q>nest</q>. (Section 4.4.3)"}, "str:satellite": {"definition": "a <a href=\"#str:strategy\">strategy</a> for expressing a semantic component of an <a href=\"#sem:event\">event</a> (such as a <a href=\"#sem:motion-event\">motion event</a>) in an <a href=\"#cxn:element\">element</a> of the <a href=\"#cxn:clause\">clause</a> other than the <a href=\"#cxn:verb\">verb</a>. <em>Example</em>: in <em>Sam strode into the room</em>, the path of motion is expressed not by the verb (<em>stride</em>), but by the <a href=\"#inf:oblique-argument\">oblique</a> <span class=\"separation\"/> <a href=\"#str:flagging\">flag</a> <em>into (the room)</em>. (Sections 7.3.1, 14.2)"}, "str:satellite-framing-strategy": {"definition": "a <a href=\"#str:strategy\">strategy</a> for expressing <a href=\"#sem:event\">events</a> such that the manner of how the event comes about is expressed by a <a href=\"#cxn:manner-verb\">manner verb</a>, and the <a href=\"#sem:result-event\">result state</a> (including also paths of motion) is expressed in a <a href=\"#str:satellite\">satellite</a>. <em>Example</em>: <em>Sam strode into the room</em> uses the satellite-framing strategy \u2013 <em>stride</em> is a manner of motion verb, and the path of motion is expressed by the oblique phrase <em>into the room</em>. (Section 7.3.1)"}, "str:scalar-concessive-conditional-strategy": {"definition": "a strategy for expressing a <a href=\"#cxn:concessive-conditional-construction\">concessive conditional construction</a> where the <a href=\"#cxn:protasis-clause\">protasis</a>, which specifies the set of conditions for the concessive conditional, invokes the most informative or <q class=\"dq\">strongest</q> condition in the <a href=\"#sem:scalar-model\">scalar model</a>; the <a href=\"#cxn:apodosis-clause\">apodosis</a> expresses the unexpected opposite of the expected causal relation between the most extreme condition and the outcome, and so implies the same outcome under the less extreme conditions. <em>Example</em>: <em>Even if you drink (only) a little, your boss will fire you</em> uses the scalar concessive conditional strategy: drinking only a little is the least likely condition (in the scalar model of drinking to various degrees) to lead to your boss firing you, and yet it will lead to your boss firing you. (Section 17.3.3)"}, "str:second-position": {"definition": "a <a href=\"#str:strategy\">strategy</a> in which the <a href=\"#cxn:element\">element</a> in question is positioned after the first element in the phrase or <a href=\"#cxn:clause\">clause</a>. <em>Example</em>: in Tohono O'odham <em>ban 'o g cu: w\u012d huhu'id</em> [coyote <span class=\"sc\">aux</span> <span class=\"sc\">def</span> jackrabbit chase] <q>The coyote is chasing the jackrabbit</q>, the auxiliary <em>o'</em> is in second position in the clause. (Section 13.4)"}, "str:secondary-object-category": {"definition": "the <a href=\"#def:morphosyntax\">morphosyntactic</a> category in the <a href=\"#str:secundative-alignment\">secundative alignment system</a> that exclusively expresses the <a href=\"#sem:theme\">T role</a>. <em>Example</em>: in Huichol <em>nee uuki uukari ne-wa-puuzeiyast\u0268a</em> <q>I showed the man to the girls</q>, <em>uuki</em> <q>man</q> is exclusively expressed by the absence of <a href=\"#str:indexation\">indexation</a> on the <a href=\"#cxn:verb\">verb</a> form <em>ne-wa-puuzeiyast\u0268a</em> <q>I showed them</q>. (Section 7.5.2)"}, "str:secundative-alignment": {"definition": "a <a href=\"#str:system\">system</a> in which the <a href=\"#sem:p-role\">P</a> and <a href=\"#sem:recipient\">R roles</a> are expressed with the same <a href=\"#def:form\">form</a>, but the <a href=\"#sem:theme\">T role</a> is expressed with a different form. <em>Example</em>: in Huichol <em>nee uuki uukari ne-wa-puuzeiyast\u0268a</em> <q>I showed the man to the girls</q>, the <a href=\"#str:index\">index</a> <em>wa-</em> <q><span class=\"sc\">3pl</span></q> is the same used to index <em>t\u0268\u0268ri</em> <q>children</q> in <em>uukaraawiciiz\u0268 t\u0268\u0268ri me-wa-zeiya</em> <q>The women see the children</q>. (Section 7.5.2)"}, "str:semantic-information-packaging-strategy": {"definition": "a <a href=\"#str:strategy\">strategy</a> found with <a href=\"#cxn:nonprototypical-construction\">nonprototypical construction</a> types, such as <a href=\"#cxn:predicate-nominal-construction\">predicate nominal constructions</a> which express <a href=\"#inf:predication\">predication</a> of an <a href=\"#sem:object-concept\">object concept</a>. The semantic IP strategy is to <a href=\"#str:recruitment-strategy\">recruit</a> the strategy used for the prototypical <a href=\"#inf:information-packaging\">information packaging</a> function of the (actual) information packaging in the nonprototypical construction. <em>Example</em>: in the English Predicate Nominal Construction exemplified by <em>Rich is an excellent violinist</em>, the semantic <a href=\"#sem:object-concept\">object concept</a> <em>violinist</em> that is being predicated recruits the construction used for object <a href=\"#inf:reference\">reference</a>, the prototypical object construction: it is preceded by the article <em>an</em> and the adjective <em>excellent</em>. The semantic IP strategy contrasts with the <a href=\"#str:actual-information-packaging-strategy\">actual IP strategy</a> and the <a href=\"#str:hybrid-information-packaging-strategy\">hybrid IP strategy</a>. (Section 2.4)"}, "str:separative-comparative": {"definition": "a <a href=\"#str:fixed-case\">fixed-case strategy</a> in <a href=\"#cxn:comparative-construction\">comparative constructions</a> in which there is a <a href=\"#cxn:clause\">clause</a> which attributes a <a href=\"#sem:gradable-predicative-scale\">gradable predicative scale</a> to the <a href=\"#sem:comparee\">comparee</a>, and the <a href=\"#sem:standard\">standard</a> is expressed as an <a href=\"#cxn:oblique-phrase\">oblique argument phrase</a> with a spatial <a href=\"#str:flagging\">flag</a> with an ablative (<q>from</q>) <a href=\"#sem:meaning\">meaning</a>. <em>Example</em>: Mundari <em>sadom-ete hati mananga-i</em> <q>The elephant is bigger than the horse</q> is an instance of the separative comparative \u2013 <em>hati mananga-i</em> asserts that the elephant is big, and <em>sadom-ete</em> expresses the standard, the horse, with a suffix <em>-ete</em> meaning <q>from</q>. (Section 17.2.2)"}, "str:serial-verb-strategy": {"definition": "a <a href=\"#str:strategy\">strategy</a> for expressing an <a href=\"#cxn:eventive-complex-predicate\">eventive complex predicate</a> with two (or more) <a href=\"#cxn:element\">elements</a>, each expressing an <a href=\"#sem:event\">event</a>, without <a href=\"#str:overt-coding\">overt coding</a> of the relation between the two elements via a third linking morpheme. The serial verb strategy \u2013 that is, expression of an eventive complex predicate without an overt linking morpheme \u2013 combines with strategies for expressing the two event elements involving <a href=\"#str:contiguity-of-serial-verbs\">contiguity</a>, <a href=\"#str:incorporation-of-serial-verbs\">incorporation</a>, and <a href=\"#str:locus-of-inflection-of-serial-verbs\">locus of inflection</a>. <em>Example</em>: Sranan <em>Kofi naki Amba kiri</em> <q>Kofi killed [lit. <q>hit kill</q>] Amba</q> contains two event elements, <em>naki</em> <q>hit</q> and <em>kiri</em> <q>kill</q>, without any linking morpheme. (Section 13.2.2)"}, "str:simple-strategy": {"definition": "a <a href=\"#str:strategy\">strategy</a> for encoding the relation in <a href=\"#inf:major-propositional-act\">major propositional acts</a> (<a href=\"#cxn:modifier\">modifier</a>\u2013<a href=\"#inf:reference\">referent</a>, <a href=\"#cxn:predicate\">predicate</a>\u2013<a href=\"#inf:reference\">argument</a>), that does not involve the presence of a third morpheme. Simple strategies include <a href=\"#str:juxtaposition\">juxtaposition</a>, <a href=\"#str:compounding\">compounding</a>, and <a href=\"#str:affixation\">affixation</a>. (Section 4.2)"}, "str:single-role-strategy": {"definition": "the <a href=\"#str:strategy\">strategy</a> of construing the <u>affected</u> <a href=\"#cxn:subject-phrase\">subject</a> <span class=\"separation\"/> <a href=\"#sem:participant-role\">participant</a> as a single <a href=\"#def:role\">role</a> in a <a href=\"#sem:reflexive\">reflexive</a> or <a href=\"#sem:reciprocal\">reciprocal event</a>; hence, it is expressed by a single <a href=\"#cxn:argument-phrase\">argument phrase</a> in a <a href=\"#cxn:reflexive-construction\">reflexive construction</a> or a <a href=\"#cxn:reciprocal-construction\">reciprocal construction</a>. <em>Examples</em>: English <em>Sam shaved</em> and <em>Mary and Sue met</em> construe the participants \u2013 Sam, and Mary and Sue, respectively \u2013 as playing a single role in the shaving and meeting events. The single role strategy may also be overtly coded: the Abkhaz Reflexive <em>l-c\u031c\u0259-l-k\u00b0abe-yt'</em> <q>She washed (herself)</q> is an Intransitive Verb form with the Reflexive prefix <em>c\u031c\u0259-</em>, and the Swahili Reciprocal <em>wa-na-pend-an-a</em> <q>they love each other</q> is an Intransitive Verb form with the Reciprocal suffix <em>-an</em>. (Section 7.2)"}, "str:sortal-classifier": {"definition": "the third morpheme in a <a href=\"#str:classifier\">classifier</a> strategy. <em>Example</em>: in Chrau <em>du tong aq</em> <q>one crossbow</q>, <em>tong</em> is a sortal classifier for long objects that refers to the crossbow (<em>aq</em>) and combines with the <a href=\"#cxn:modifier\">modifier</a> <em>du</em> <q>one</q>. A sortal classifer contrasts with a <a href=\"#str:mensural-classifier\">mensural classifier</a> in that it does not measure out an amount of the object (crossbow), it simply classifies it by its <a href=\"#sem:type\">type</a> or sort. A <a href=\"#str:repeater\">repeater</a> is a special type of sortal classifier. (Section 5.2.2)"}, "str:special-form": {"definition": "a highly grammaticalized strategy for encoding the relation in <a href=\"#inf:major-propositional-act\">major propositional acts</a> (<a href=\"#cxn:modifier\">modifier</a>\u2013<a href=\"#inf:reference\">referent</a>, <a href=\"#cxn:predicate\">predicate</a>\u2013<a href=\"#inf:reference\">argument</a>), in which one of the two <a href=\"#cxn:element\">elements</a> is in a morphologically distinct form. <em>Example</em>: in Syrian Arabic <em>\u0294\u0259s\u0323s\u0323et\u0323 haz-zalame</em> <q>that fellow's story</q>, the Construct Form <em>\u0294\u0259s\u0323s\u0323et\u0323</em> <q>story</q> is an example of a special form used in this <a href=\"#cxn:nominal-modification-construction\">nominal modifier construction</a>. (Section 4.5)"}, "str:special-p-strategy": {"definition": "a <a href=\"#str:strategy\">strategy</a> of the <a href=\"#cxn:passive-inverse-voice\">passive\u2013inverse voice construction</a> in which the <a href=\"#sem:p-role\">P</a> <span class=\"separation\"/> <a href=\"#sem:participant-role\">participant</a> is encoded by a form that is not found for either the <a href=\"#sem:a-role\">A</a> <span class=\"separation\"/> <a href=\"#sem:participant-role\">participant</a> or the P participant in the <a href=\"#cxn:basic-voice\">basic voice construction</a>. <em>Example</em>: in Upriver Halkomelem <em>t\u0259\u0301s-l-\u0259m \u03b8\u00fa\u019b'\u00e0 t\u0259 sw\u00edy\u0259q\u0259</em> <q>She was bumped into by the man</q>, the P participant (the woman referred to by <q>she</q>) is <a href=\"#str:indexed\">indexed</a> by the suffix <em>-\u0259m</em>, which is distinct from the expression of A or P participants in the basic voice construction. (Section 8.3)"}, "str:specialized-dual-role-strategy": {"definition": "the <a href=\"#str:strategy\">strategy</a> of construing the <u>affected</u> <a href=\"#cxn:subject-phrase\">subject</a> <span class=\"separation\"/> <a href=\"#sem:participant-role\">participant</a> as playing two distinct <a href=\"#def:role\">roles</a> in a <a href=\"#sem:reflexive\">reflexive</a> or <a href=\"#sem:reciprocal\">reciprocal event</a>; hence, it is expressed by two distinct <a href=\"#cxn:argument-phrase\">argument phrases</a> in a <a href=\"#cxn:reflexive-construction\">reflexive construction</a> or a <a href=\"#cxn:reciprocal-construction\">reciprocal construction</a>, but with a special form functioning as the nonsubject argument phrase. <em>Examples</em>: English <em>I saw myself</em> and <em>Mary and Sue praised each other</em> construe the participants \u2013 I, and Mary and Sue, respectively \u2013 as playing two roles in the seeing and praising event, but with special object forms <em>myself</em> and <em>each other</em> to express that the events are a reflexive event and a reciprocal event, respectively. (Section 7.2)"}, "str:split-argument-structure-strategy": {"definition": "a <a href=\"#str:strategy\">strategy</a> found in <a href=\"#cxn:complement-clause-construction\">complement clause constructions</a> in which the <a href=\"#cxn:clause\">argument structure construction</a> associated with the <a href=\"#cxn:complement-taking-predicate\">complement-taking predicate</a> is completely distinct from the argument structure construction associated with the <a href=\"#cxn:complement\">complement</a> <span class=\"separation\"/> <a href=\"#cxn:predicate\">predicate</a>. <em>Example</em>: the sentence <em>Terry believes that the company will give her a raise next month</em> uses a split argument structure strategy: the CTP <em>believes</em> has its own Subject (<em>Terry</em>) and Object (the complement clause), and the complement predicate <em>will give</em> has its own Subject (<em>the company</em>), Objects (<em>her</em> and <em>a raise</em>), and Oblique (<em>next month</em>). (Section 18.4.1)"}, "str:split-structure": {"definition": "a strategy found for the expression of <a href=\"#cxn:thetic-construction\">thetic constructions</a>. In a split structure, the information normally expressed as the comment or <a href=\"#cxn:predicate\">predicate</a> in a <a href=\"#cxn:topic-comment-construction\">topic\u2013comment construction</a> may be expressed in a different <a href=\"#def:form\">form</a>, usually some sort of <a href=\"#cxn:subordinate-clause\">subordinate clause</a>-like form. The information normally expressed as the <a href=\"#inf:reference\">topic</a> in the topic\u2013comment construction may be expressed in a different form, usually with a <a href=\"#cxn:presentational-construction\">presentational construction</a>; or both types of information are expressed differently. <em>Example</em>: in French <em>Voil\u00e0 la sir\u00e8ne | qui hurle</em> [There's a siren | that's wailing] <q>The SIREN is wailing</q>, the <a href=\"#inf:interruption\">interruption</a> thetic construction expresses the participant (the siren) in a presentational construction, and expresses the event in a <a href=\"#cxn:relative-clause-construction\">relative clause construction</a>. (Section 11.3.2)"}, "str:stamp-strategy": {"definition": "a <a href=\"#str:strategy\">strategy</a> found with <a href=\"#cxn:auxiliary-construction\">auxiliary constructions</a> in which the <a href=\"#cxn:auxiliary\">auxiliary</a> <span class=\"separation\"/> <a href=\"#cxn:element\">element</a> expressing <a href=\"#sem:tamp\">TAMP</a> is morphologically combined with the <a href=\"#cxn:subject-phrase\">subject phrase</a>, usually a subject <a href=\"#cxn:pronoun\">pronoun</a>, rather than with the <a href=\"#cxn:verb\">verb</a> of the auxiliary construction. <em>Example</em>: English <em>I'll think about it</em>, the future auxiliary <em>will</em> is reduced and combined morphologically with the subject pronoun <em>I</em>. (Section 13.4)"}, "str:stimulus-oriented-strategy": {"definition": "a <a href=\"#str:strategy\">strategy</a> for an <a href=\"#cxn:experiential-construction\">experiential construction</a> in which the <a href=\"#sem:stimulus\">stimulus</a> <span class=\"separation\"/> <a href=\"#cxn:argument-phrase\">argument phrase</a> is <a href=\"#str:co-expression\">co-expressed</a> with the <a href=\"#cxn:subject-phrase\">subject</a> argument phrase of a <a href=\"#cxn:transitive-construction\">transitive</a> or <a href=\"#cxn:intransitive-construction\">intransitive construction</a>. <em>Example</em>: the <a href=\"#cxn:clause\">argument structure construction</a> found in <em>Dogs frighten me</em>, with the stimulus argument phrase <em>Dogs</em> co-expressed with the prototypical subject <a href=\"#sem:participant-role\">participant</a> in English, is an instance of the stimulus-oriented strategy. (Section 7.4)"}, "str:strategy": {"definition": "a <a href=\"#cxn:construction\">construction</a> in a language (or any language) used to express a particular combination of <a href=\"#sem:meaning\">semantic content</a> and <a href=\"#inf:information-packaging\">information packaging</a>, which is further distinguished by certain characteristics of <a href=\"#def:morphosyntax\">morphosyntactic</a> <span class=\"separation\"/> <a href=\"#def:form\">form</a> that can be defined in a crosslinguistically consistent fashion. <em>Example</em>: the English Predicate Nominal Construction, illustrated by <em>Sam is a bloodhound</em>, uses the <a href=\"#str:verbal-copula\">verbal copula</a> strategy, a particular type of morphosyntactic structure, to express the <a href=\"#cxn:predicate-nominal-construction\">predicate nominal construction</a>. (Section 1.4)"}, "str:summarizer": {"definition": "a <a href=\"#def:form\">form</a> used as part of an <a href=\"#cxn:exhaustive-list-coordination\">exhaustive coordination construction</a> that indicates that the list is exhaustive. <em>Example</em>: in Classical Tibetan <em>lus \u014bag yid gsum</em> [body speech mind three] <q>body, speech and mind</q>, the numeral functions as a summarizer for the exhaustive list. (Section 15.2.2)"}, "str:switch-reference-system": {"definition": "an <a href=\"#str:absolute-deranking-system\">absolute deranking system</a> where the <a href=\"#inf:same-subject\">same-subject</a> and <a href=\"#inf:different-subject\">different-subject</a> <span class=\"separation\"/> <a href=\"#cxn:reference-tracking-construction\">reference tracking constructions</a> systematically use different <a href=\"#str:deranking\">deranked</a> constructions. <em>Example</em>: in Tauya <em>nono imai-te-pa ai mene-a-te pai a\u0294ate-pa</em>... <q>She carried the child and came and stayed, they hit [= killed] the pigs and...</q> <em>imai-te-pa</em> [(<span class=\"sc\">3sg</span>)-carry-get-SS] is a deranked predicate <a href=\"#def:form\">form</a> with the same-subject deranking morpheme <em>-pa</em> since the following subject is also <q>she</q>, and <em>mene-a-te</em> [stay-3sg-DS] is a deranked predicate form with the different-subject deranking morpheme <em>-te</em> since the following subject switches to <q>they</q>. (Section 16.4)"}, "str:syndetic": {"definition": "the combination of <a href=\"#cxn:clause\">clauses</a> in <a href=\"#cxn:complex-sentence\">complex sentence constructions</a>, and of <a href=\"#cxn:coordinand\">coordinands</a> in <a href=\"#cxn:coordinate-construction\">coordinate constructions</a> (whether the coordinands are clauses or not), by an overt free or clitic morpheme. <em>Example</em>: <em>She picked up the pieces and dumped them in the wastebasket</em> is an instance of syndetic clause coordination, due to the presence of the coordinator <em>and</em>. Syndetic coordination may be <a href=\"#str:monosyndetic\">monosyndetic</a> or <a href=\"#str:bisyndetic\">bisyndetic</a>. (Section 15.2.2)"}, "str:system": {"definition": "a set of two or more different <a href=\"#str:strategy\">strategies</a> for different though closely related <a href=\"#cxn:construction\">constructions</a> that are defined by sets of <a href=\"#def:morphosyntax\">morphosyntactic</a> similarities (especially <a href=\"#str:co-expression\">co-expression</a>) and differences between the strategies for the different constructions. <em>Example</em>: <a href=\"#str:switch-reference-system\">switch-reference systems</a> represent a set of strategies for <a href=\"#inf:same-subject\">same-subject</a> and <a href=\"#inf:different-subject\">different-subject</a> <span class=\"separation\"/> <a href=\"#cxn:reference-tracking-construction\">reference tracking constructions</a>. (Section 1.4)"}, "str:tag": {"definition": "a strategy for <a href=\"#cxn:polarity-question-construction\">polarity question constructions</a> which consists of a word or phrase added to the <a href=\"#cxn:clause\">clause</a>, functioning to signal that the clause expresses a polarity question. <em>Example</em>: in the Russian polarity question <em>Ty ego sly\u0161al, pravda?</em> [lit. <q>You heard him, true?</q>], <em>pravda</em> <q>true?</q> is the tag. Tags typically make the polarity question into a biased question, unlike a simple interrogative marker. (Section 12.3.2)"}, "str:target": {"definition": "in a <a href=\"#cxn:construction\">construction</a> using the <a href=\"#str:indexation\">indexation strategy</a>, the <a href=\"#cxn:element\">element</a> of the construction with which the <a href=\"#str:index\">index</a> is combined, usually as an affix. <em>Example</em>: in Spanish <em>los libros rojos</em> <q>the red books</q>, the target is the modifier <em>rojos</em> <q>red</q>, which has the Masculine Plural index <em>-os</em> suffixed to it. (Section 4.4)"}, "str:tense-iconicity": {"definition": "a <a href=\"#str:strategy\">strategy</a> in which the temporal sequence of the <a href=\"#cxn:clause\">clauses</a> in a <u>sentence</u> necessarily mirrors the <a href=\"#sem:consecutive\">consecutive</a> temporal relation of the <a href=\"#sem:event\">events</a> denoted by the clauses. <em>Example</em>: in <em>He washed the car and drove to the party</em>, the temporal order of the clauses <em>He washed the car</em> and <em>drove to the party</em> mirrors the consecutive temporal relation of the events. (Section 15.1.3)"}, "str:topic-locational-hybrid-possessive-strategy": {"definition": "a <a href=\"#str:strategy\">strategy</a> for the <a href=\"#cxn:presentational-possession-construction\">presentational possession construction</a> in which the <a href=\"#sem:possessum\">possessum</a> is expressed in a <a href=\"#cxn:subject-phrase\">subject phrase</a>, usually the subject of a <a href=\"#cxn:verb\">verb</a> glossed as <q>exist</q>, and the <a href=\"#sem:possessor\">possessor</a> is expressed both as a <a href=\"#cxn:topic-phrase\">topic phrase</a> and as a <a href=\"#cxn:locative-phrase\">locative</a> <span class=\"separation\"/> <a href=\"#cxn:argument-phrase\">argument phrase</a> (like the <a href=\"#str:locational-possessive-strategy\">locational possessive strategy</a>) <a href=\"#inf:coreference\">coreferential</a> with the topic phrase. <em>Example</em>: Eastern Tarafit <em>l\u0263ula ttu\u0263a \u0263r-es id\u017e n w\u0259z\u025buq</em> [ogress was at-her one of little_donkey] <q>The ogress had a little donkey</q> is an instance of the topic-locational hybrid possessive strategy: the ogress is expressed as both a topic phrase <em>l\u0263ula</em> and as a coreferential locative argument phrase <em>\u0263r-es</em> <q>at her</q>. (Section 10.4.2)"}, "str:topic-possessive-strategy": {"definition": "a <a href=\"#str:strategy\">strategy</a> for the <a href=\"#cxn:presentational-possession-construction\">presentational possession construction</a> in which the <a href=\"#sem:possessor\">possessor</a> is expressed as a <a href=\"#cxn:topic-phrase\">topic phrase</a>, and the <a href=\"#sem:possessum\">possessum</a> is expressed in a <a href=\"#cxn:subject-phrase\">subject phrase</a>, usually the subject of a <a href=\"#cxn:verb\">verb</a> glossed as <q>exist</q>. <em>Example</em>: Cupe\u00f1o <em>ne\u0294 ne-mixen \u0294iket miyexwe</em> [I my net is] <q>I have a net</q> is an instance of the topic possessive strategy, with <q>I</q> expressed in a topic phrase and <q>my net</q> in a subject phrase. (Section 10.4.2)"}, "str:transitivity-based-strategy": {"definition": "<u>monoclausal</u> <a href=\"#str:strategy\">strategies</a> for the <a href=\"#cxn:causative-construction\">causative construction</a> in which the <a href=\"#sem:causee\">causee</a> in the <a href=\"#sem:causative-event\">causative event</a> is coded differently depending on the <a href=\"#sem:valency\">valency</a> of the corresponding <a href=\"#sem:base-event\">base event</a>. <em>Example</em>: in Turkish, the causee in a causative event is encoded in the Accusative Case if the base event is <a href=\"#sem:monovalent\">monovalent</a> (<em>Ali Hasan<strong>-t</strong> \u00f6l-d\u00fcr-d\u00fc</em> <q>Ali killed Hasan [<span class=\"sc\">acc</span>]</q>), and in the Dative Case if the base event is <a href=\"#sem:bivalent\">bivalent</a> (<em>Di\u015f\u00e7i mektub-u m\u00fcd\u00fcr<strong>-e</strong> imzala-t-t\u00ed</em> <q>The dentist got the director [<span class=\"sc\">dat</span>] to sign the letter</q>). (Section 9.2)"}, "str:tripartite-alignment": {"definition": "a <a href=\"#str:co-expression\">co-expression strategy</a> in which all three of the <a href=\"#sem:a-role\">A</a>, <a href=\"#sem:p-role\">P</a>, and <a href=\"#sem:s-role\">S roles</a> are expressed with different <a href=\"#def:form\">forms</a>. Tripartite alignment is extremely rare. (Section 6.3.1)"}, "str:universal-concessive-conditional-strategy": {"definition": "a strategy for expressing a <a href=\"#cxn:concessive-conditional-construction\">concessive conditional construction</a> where the <a href=\"#cxn:protasis-clause\">protasis</a>, which specifies the set of conditions for the concessive conditional, quantifies over all the alternatives possible in the <a href=\"#sem:scalar-model\">scalar model</a>; the <a href=\"#cxn:apodosis-clause\">apodosis</a> expresses that the outcome is the same under all conditions. <em>Example</em>: <em>However much advice you give him, he does exactly what he wants to do</em> uses the universal concessive conditional strategy: the protasis quantifies over all amounts of advice that you could give him, and the apodosis asserts that he does exactly what he wants to do under any of those conditions. (Section 17.3.3)"}, "str:verb-coding-strategy": {"definition": "a <a href=\"#str:strategy\">strategy</a> for the expression of the <a href=\"#sem:semantic-role\">semantic role</a> of the <a href=\"#cxn:relative-clause-head\">relative clause head</a> in the event denoted by the <a href=\"#cxn:relative-clause\">relative clause</a> of an <a href=\"#str:externally-headed\">externally headed</a> <span class=\"separation\"/> <a href=\"#cxn:relative-clause-construction\">relative clause construction</a>, in which the <a href=\"#cxn:predicate\">predicate</a> of the relative clause uses different <a href=\"#cxn:clause\">voice</a> <span class=\"separation\"/> <a href=\"#def:form\">forms</a> in order to specify the semantic role of the shared participant in the relative clause event. <em>Example</em>: in Luganda <em>ekiso</em> [<em>John kyeyattisa enkoko</em>] <q>the knife with which John killed the chicken</q>, the predicate <em>kyeyattisa</em> <q>killed</q> contains the <a href=\"#sem:instrument\">instrumental</a> <span class=\"separation\"/> <a href=\"#cxn:applicative-object-phrase\">applicative</a> suffix <em>-is</em> that indicates that the <a href=\"#cxn:relative-clause-head\">relative clause head</a> <em>ekiso</em> <q>knife</q> denotes the <a href=\"#sem:instrument\">instrument</a> participant in the killing event. Comrie (2003b) restricts verb-coding strategies to languages which use voice forms that are exclusively found in relative clause constructions (and thus would exclude the Luganda example); we follow the broader definition introduced in Keenan (1972). (Section 19.3)"}, "str:verb-framing-strategy": {"definition": "a <a href=\"#str:strategy\">strategy</a> for expressing <a href=\"#sem:motion-event\">motion events</a> such that the path of motion is expressed by a <a href=\"#cxn:path-verb\">path verb</a>. <em>Example</em>: <em>The guests entered the reception hall</em> uses the verb-framing strategy: the path verb <em>enter</em> describes a <a href=\"#sem:path-event\">path of motion event</a>. (Section 7.3.1)"}, "str:verbal-copula": {"definition": "a <a href=\"#str:strategy\">strategy</a> used for <a href=\"#cxn:nonprototypical-predication-construction\">nonprototypical predication</a>, which uses a morpheme different from the <a href=\"#sem:object-concept\">object</a> concept word, the <a href=\"#str:copula\">copula</a>, which is inflected for at least some of the categories that prototypical <a href=\"#inf:predication\">predication</a> <span class=\"separation\"/> <a href=\"#cxn:construction\">constructions</a> in the language \u2013 that is, predication constructions headed by a <a href=\"#cxn:verb\">verb</a> \u2013 also inflect for. Example: in the English Predicate Nominal Construction, illustrated by <em>Sam is a bloodhound</em>, <em>is</em> is a copula that inflects for <a href=\"#sem:person\">person</a>, <a href=\"#sem:number\">number</a>, and <a href=\"#sem:tense\">tense</a> like English Verbs do. (Sections 1.4, <strong>10.2</strong>)"}, "str:verbal-strategy": {"definition": "the <a href=\"#str:strategy\">strategy</a> of <a href=\"#str:recruitment-strategy\">recruiting</a> what was originally the <a href=\"#sem:action-concept\">action</a> <span class=\"separation\"/> <a href=\"#inf:predication\">predication</a> <span class=\"separation\"/> <a href=\"#cxn:construction\">construction</a> for <a href=\"#cxn:nonprototypical-predication-construction\">nonprototypical predication</a>. It is presumed that an originally action predication construction lacks an <a href=\"#cxn:auxiliary\">auxiliary</a>, and it expresses certain grammatical categories, in particular <a href=\"#str:person-indexation\">person indexation</a> and <a href=\"#cxn:negation-construction\">negation</a>. <em>Example</em>: Nahuatl <em>ni-ti:citl</em> [<span class=\"sc\">1sg</span>-doctor] <q>I am a doctor</q> recruits the action predication construction for <a href=\"#sem:object-concept\">object</a> <span class=\"separation\"/> <a href=\"#inf:predication\">predication</a>; cf. <em>ni-cho:ca</em> [<span class=\"sc\">1sg</span>-cry] <q>I am crying</q>. (Section 10.2)"}, "str:with-possessive-strategy": {"definition": "a <a href=\"#str:strategy\">strategy</a> for the <a href=\"#cxn:presentational-possession-construction\">presentational possession construction</a> in which the <a href=\"#sem:possessor\">possessor</a> is expressed in a <a href=\"#cxn:subject-phrase\">subject phrase</a>, and the <a href=\"#sem:possessum\">possessum</a> is expressed in a <a href=\"#sem:comitative\">comitative</a> <span class=\"separation\"/> <a href=\"#cxn:referring-phrase\">phrase</a>. <em>Example</em>: Amele <em>ija sigin <strong>ca</strong></em> [I knife <strong>with</strong>] <q>I have a knife</q> [lit. <q>I am with a knife</q>] is an instance of the with-possessive strategy. (Section 10.4.2)"}, "str:word-order": {"definition": "the relative order of two <a href=\"#cxn:element\">elements</a> in a <a href=\"#cxn:construction\">construction</a>. <em>Example</em>: in English <em>red book</em>, the <a href=\"#cxn:adjective\">adjective</a> <em>red</em> precedes the <a href=\"#cxn:noun\">noun</a> <em>book</em>; but in Spanish <em>libro rojo</em>, the adjective <em>rojo</em> <q>red</q> follows the noun <em>libro</em> <q>book</q>. (Sections <strong>4.2</strong>, 5.3, 6.2.2)"}, "str:yes-no-alignment": {"definition": "an <a href=\"#str:alignment-system\">alignment strategy</a> for the <a href=\"#cxn:polarity-response-construction\">polarity response construction</a> in which the answer to a negative <a href=\"#cxn:polarity-question-construction\">polarity question</a> aligns the polarity of the answer, not the polarity of the speaker's question. <em>Example</em>: in English, the answer to the negative polarity question <em>Do you not have any money?</em> where the addressee does not have any money is <em>No</em>; the polarity of the response matches the polarity of the answer (that the addressee does not have any money). (Section 12.3.3)"}, "str:yes-no-disagree-alignment": {"definition": "an <a href=\"#str:alignment-system\">alignment strategy</a> for the <a href=\"#cxn:polarity-response-construction\">polarity response construction</a> in which the answer to a negative <a href=\"#cxn:polarity-question-construction\">polarity question</a> aligns the polarity of the answer when the answer is negative, but uses a special disagreeing form when the answer is positive. <em>Example</em>: in French, when the question is <q>Do you not have any money?</q>, the answer <em>non</em> <q>no</q> indicates that the respondent has no money, but the answer <em>si</em> (different from the positive answer <em>oui</em> <q>yes</q>) indicates that the respondent disagrees with the speaker and indeed does have money. (Section 12.3.3)"}, "str:zero-anaphora": {"definition": "the absence of a <a href=\"#cxn:referring-phrase\">referring phrase</a> for a <a href=\"#inf:reference\">referent</a> in a construction. Zero anaphora is frequently used when the referent is <a href=\"#inf:active-referent\">active</a>. (Section 3.3.1)"}, "str:zero-coded-verb": {"definition": "a <a href=\"#str:strategy\">strategy</a> with any of the different kinds of <a href=\"#cxn:clause\">voice constructions</a> in which there is <a href=\"#str:zero-coding\">zero coding</a> of the <a href=\"#def:function\">function</a> of the voice construction on the <a href=\"#cxn:verb\">verb</a>. <em>Example</em>: <em>John planted the garden with trees</em> is an applicative construction without any overt coding of the applicative function on the verb <em>planted</em>. (Section 9.4)"}, "str:zero-coding": {"definition": "a <a href=\"#str:strategy\">strategy</a> in which there is no overt <a href=\"#def:form\">form</a> in the <a href=\"#cxn:construction\">construction</a> that encodes the relevant <a href=\"#def:function\">function</a> of the construction. <em>Example</em>: in the English Adjectival Modification Construction illustrated by <em>tall trees</em>, there is no overt form that codes the <a href=\"#inf:modification\">modification</a> function of the <a href=\"#sem:property-concept\">property concept</a> denoted by <em>tall</em>. (Section 2.4)"}, "str:zero-copula": {"definition": "the <a href=\"#str:strategy\">strategy</a> of <a href=\"#str:recruitment-strategy\">recruiting</a> a <a href=\"#cxn:construction\">construction</a> without any overt coding of <a href=\"#inf:predication\">predication</a> (i.e. no <a href=\"#str:copula\">copula</a>), and without any inflection, for different types of predication. <em>Example</em>: Tiwi <em>purukupa\u0279li ma\u0279tina</em> <q>Purukuparli is boss</q> simply juxtaposes the referring phrases for <q>Purukuparli</q> and <q>boss</q>. (Section 10.2)"}};
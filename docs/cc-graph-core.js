@@ -0,0 +1 @@
+var DATA = {"version": "1.0", "builddate": "2026-10-17, 02:10:35", "nodes": [{"id": "1", "name": "Chapter 1", "type": "section"}, {"id": "1.1", "name": "Section 1.1", "type": "section"}, {"id": "1.2", "name": "Section 1.2", "type": "section"}, {"id": "1.2.1", "name": "Section 1.2.1", "type": "section"}, {"id": "1.2.2", "name": "Section 1.2.2", "type": "section"}, {"id": "1.2.3", "name": "Section 1.2.3", "type": "section"}, {"id": "1.3", "name": "Section 1.3", "type": "section"}, {"id": "1.4", "name": "Section 1.4", "type": "section"}, {"id": "1.5", "name": "Section 1.5", "type": "section"}, {"id": "1.6", "name": "Section 1.6", "type": "section"}, {"id": "10", "name": "Chapter 10", "type": "section"}, {"id": "10.1", "name": "Section 10.1", "type": "section"}, {"id": "10.1.1", "name": "Section 10.1.1", "type": "section"}, {"id": "10.1.2", "name": "Section 10.1.2", "type": "section"}, {"id": "10.2", "name": "Section 10.2", "type": "section"}, {"id": "10.3", "name": "Section 10.3", "type": "section"}, {"id": "10.4", "name": "Section 10.4", "type": "section"}, {"id": "10.4.1", "name": "Section 10.4.1", "type": "section"}, {"id": "10.4.2", "name": "Section 10.4.2", "type": "section"}, {"id": "10.4.3", "name": "Section 10.4.3", "type": "section"}, {"id": "11", "name": "Chapter 11", "type": "section"}, {"id": "11.1", "name": "Section 11.1", "type": "section"}, {"id": "11.2", "name": "Section 11.2", "type": "section"}, {"id": "11.2.1", "name": "Section 11.2.1", "type": "section"}, {"id": "11.2.2", "name": "Section 11.2.2", "type": "section"}, {"id": "11.2.3", "name": "Section 11.2.3", "type": "section"}, {"id": "11.3", "name": "Section 11.3", "type": "section"}, {"id": "11.3.1", "name": "Section 11.3.1", "type": "section"}, {"id": "11.3.2", "name": "Section 11.3.2", "type": "section"}, {"id": "11.3.3", "name": "Section 11.3.3", "type": "section"}, {"id": "11.4", "name": "Section 11.4", "type": "section"}, {"id": "11.4.1", "name": "Section 11.4.1", "type": "section"}, {"id": "11.4.2", "name": "Section 11.4.2", "type": "section"}, {"id": "12", "name": "Chapter 12", "type": "section"}, {"id": "12.1", "name": "Section 12.1", "type": "section"}, {"id": "12.2", "name": "Section 12.2", "type": "section"}, {"id": "12.3", "name": "Section 12.3", "type": "section"}, {"id": "12.3.1", "name": "Section 12.3.1", "type": "section"}, {"id": "12.3.2", "name": "Section 12.3.2", "type": "section"}, {"id": "12.3.3", "name": "Section 12.3.3", "type": "section"}, {"id": "12.3.4", "name": "Section 12.3.4", "type": "section"}, {"id": "12.4", "name": "Section 12.4", "type": "section"}, {"id": "12.4.1", "name": "Section 12.4.1", "type": "section"}, {"id": "12.4.2", "name": "Section 12.4.2", "type": "section"}, {"id": "12.5", "name": "Section 12.5", "type": "section"}, {"id": "12.5.2", "name": "Section 12.5.2", "type": "section"}, {"id": "13", "name": "Chapter 13", "type": "section"}, {"id": "13.1", "name": "Section 13.1", "type": "section"}, {"id": "13.1.1", "name": "Section 13.1.1", "type": "section"}, {"id": "13.1.2", "name": "Section 13.1.2", "type": "section"}, {"id": "13.2", "name": "Section 13.2", "type": "section"}, {"id": "13.2.1", "name": "Section 13.2.1", "type": "section"}, {"id": "13.2.2", "name": "Section 13.2.2", "type": "section"}, {"id": "13.3", "name": "Section 13.3", "type": "section"}, {"id": "13.3.2", "name": "Section 13.3.2", "type": "section"}, {"id": "13.4", "name": "Section 13.4", "type": "section"}, {"id": "13.5", "name": "Section 13.5", "type": "section"}, {"id": "13.6", "name": "Section 13.6", "type": "section"}, {"id": "14", "name": "Chapter 14", "type": "section"}, {"id": "14.1", "name": "Section 14.1", "type": "section"}, {"id": "14.2", "name": "Section 14.2", "type": "section"}, {"id": "14.3", "name": "Section 14.3", "type": "section"}, {"id": "14.4", "name": "Section 14.4", "type": "section"}, {"id": "14.5", "name": "Section 14.5", "type": "section"}, {"id": "15", "name": "Chapter 15", "type": "section"}, {"id": "15.1", "name": "Section 15.1", "type": "section"}, {"id": "15.1.1", "name": "Section 15.1.1", "type": "section"}, {"id": "15.1.2", "name": "Section 15.1.2", "type": "section"}, {"id": "15.1.3", "name": "Section 15.1.3", "type": "section"}, {"id": "15.2", "name": "Section 15.2", "type": "section"}, {"id": "15.2.1", "name": "Section 15.2.1", "type": "section"}, {"id": "15.2.2", "name": "Section 15.2.2", "type": "section"}, {"id": "15.2.3", "name": "Section 15.2.3", "type": "section"}, {"id": "15.3", "name": "Section 15.3", "type": "section"}, {"id": "15.3.1", "name": "Section 15.3.1", "type": "section"}, {"id": "15.3.2", "name": "Section 15.3.2", "type": "section"}, {"id": "16", "name": "Chapter 16", "type": "section"}, {"id": "16.1", "name": "Section 16.1", "type": "section"}, {"id": "16.2", "name": "Section 16.2", "type": "section"}, {"id": "16.3", "name": "Section 16.3", "type": "section"}, {"id": "16.4", "name": "Section 16.4", "type": "section"}, {"id": "16.5", "name": "Section 16.5", "type": "section"}, {"id": "17", "name": "Chapter 17", "type": "section"}, {"id": "17.2", "name": "Section 17.2", "type": "section"}, {"id": "17.2.1", "name": "Section 17.2.1", "type": "section"}, {"id": "17.2.2", "name": "Section 17.2.2", "type": "section"}, {"id": "17.2.3", "name": "Section 17.2.3", "type": "section"}, {"id": "17.2.4", "name": "Section 17.2.4", "type": "section"}, {"id": "17.3", "name": "Section 17.3", "type": "section"}, {"id": "17.3.1", "name": "Section 17.3.1", "type": "section"}, {"id": "17.3.2", "name": "Section 17.3.2", "type": "section"}, {"id": "17.3.3", "name": "Section 17.3.3", "type": "section"}, {"id": "17.4", "name": "Section 17.4", "type": "section"}, {"id": "17.4.1", "name": "Section 17.4.1", "type": "section"}, {"id": "17.4.2", "name": "Section 17.4.2", "type": "section"}, {"id": "18", "name": "Chapter 18", "type": "section"}, {"id": "18.2", "name": "Section 18.2", "type": "section"}, {"id": "18.2.1", "name": "Section 18.2.1", "type": "section"}, {"id": "18.2.2", "name": "Section 18.2.2", "type": "section"}, {"id": "18.3", "name": "Section 18.3", "type": "section"}, {"id": "18.3.1", "name": "Section 18.3.1", "type": "section"}, {"id": "18.3.2", "name": "Section 18.3.2", "type": "section"}, {"id": "18.4", "name": "Section 18.4", "type": "section"}, {"id": "18.4.1", "name": "Section 18.4.1", "type": "section"}, {"id": "18.4.2", "name": "Section 18.4.2", "type": "section"}, {"id": "19", "name": "Chapter 19", "type": "section"}, {"id": "19.1", "name": "Section 19.1", "type": "section"}, {"id": "19.2", "name": "Section 19.2", "type": "section"}, {"id": "19.2.1", "name": "Section 19.2.1", "type": "section"}, {"id": "19.2.2", "name": "Section 19.2.2", "type": "section"}, {"id": "19.2.3", "name": "Section 19.2.3", "type": "section"}, {"id": "19.2.4", "name": "Section 19.2.4", "type": "section"}, {"id": "19.3", "name": "Section 19.3", "type": "section"}, {"id": "19.4", "name": "Section 19.4", "type": "section"}, {"id": "2", "name": "Chapter 2", "type": "section"}, {"id": "2.1", "name": "Section 2.1", "type": "section"}, {"id": "2.2", "name": "Section 2.2", "type": "section"}, {"id": "2.2.1", "name": "Section 2.2.1", "type": "section"}, {"id": "2.2.2", "name": "Section 2.2.2", "type": "section"}, {"id": "2.2.3", "name": "Section 2.2.3", "type": "section"}, {"id": "2.2.4", "name": "Section 2.2.4", "type": "section"}, {"id": "2.2.5", "name": "Section 2.2.5", "type": "section"}, {"id": "2.3", "name": "Section 2.3", "type": "section"}, {"id": "2.4", "name": "Section 2.4", "type": "section"}, {"id": "2.5", "name": "Section 2.5", "type": "section"}, {"id": "3", "name": "Chapter 3", "type": "section"}, {"id": "3.1", "name": "Section 3.1", "type": "section"}, {"id": "3.1.1", "name": "Section 3.1.1", "type": "section"}, {"id": "3.1.2", "name": "Section 3.1.2", "type": "section"}, {"id": "3.1.3", "name": "Section 3.1.3", "type": "section"}, {"id": "3.2", "name": "Section 3.2", "type": "section"}, {"id": "3.3", "name": "Section 3.3", "type": "section"}, {"id": "3.3.1", "name": "Section 3.3.1", "type": "section"}, {"id": "3.3.2", "name": "Section 3.3.2", "type": "section"}, {"id": "3.3.3", "name": "Section 3.3.3", "type": "section"}, {"id": "3.4", "name": "Section 3.4", "type": "section"}, {"id": "3.4.1", "name": "Section 3.4.1", "type": "section"}, {"id": "3.4.2", "name": "Section 3.4.2", "type": "section"}, {"id": "3.5", "name": "Section 3.5", "type": "section"}, {"id": "3.6", "name": "Section 3.6", "type": "section"}, {"id": "4", "name": "Chapter 4", "type": "section"}, {"id": "4.1", "name": "Section 4.1", "type": "section"}, {"id": "4.1.1", "name": "Section 4.1.1", "type": "section"}, {"id": "4.1.2", "name": "Section 4.1.2", "type": "section"}, {"id": "4.1.3", "name": "Section 4.1.3", "type": "section"}, {"id": "4.1.4", "name": "Section 4.1.4", "type": "section"}, {"id": "4.2", "name": "Section 4.2", "type": "section"}, {"id": "4.3", "name": "Section 4.3", "type": "section"}, {"id": "4.4", "name": "Section 4.4", "type": "section"}, {"id": "4.4.1", "name": "Section 4.4.1", "type": "section"}, {"id": "4.4.2", "name": "Section 4.4.2", "type": "section"}, {"id": "4.4.3", "name": "Section 4.4.3", "type": "section"}, {"id": "4.4.4", "name": "Section 4.4.4", "type": "section"}, {"id": "4.5", "name": "Section 4.5", "type": "section"}, {"id": "5", "name": "Chapter 5", "type": "section"}, {"id": "5.2", "name": "Section 5.2", "type": "section"}, {"id": "5.2.1", "name": "Section 5.2.1", "type": "section"}, {"id": "5.2.2", "name": "Section 5.2.2", "type": "section"}, {"id": "5.2.3", "name": "Section 5.2.3", "type": "section"}, {"id": "5.2.4", "name": "Section 5.2.4", "type": "section"}, {"id": "5.3", "name": "Section 5.3", "type": "section"}, {"id": "5.4", "name": "Section 5.4", "type": "section"}, {"id": "6", "name": "Chapter 6", "type": "section"}, {"id": "6.1", "name": "Section 6.1", "type": "section"}, {"id": "6.1.1", "name": "Section 6.1.1", "type": "section"}, {"id": "6.1.2", "name": "Section 6.1.2", "type": "section"}, {"id": "6.2", "name": "Section 6.2", "type": "section"}, {"id": "6.2.1", "name": "Section 6.2.1", "type": "section"}, {"id": "6.2.2", "name": "Section 6.2.2", "type": "section"}, {"id": "6.3", "name": "Section 6.3", "type": "section"}, {"id": "6.3.1", "name": "Section 6.3.1", "type": "section"}, {"id": "6.3.2", "name": "Section 6.3.2", "type": "section"}, {"id": "6.3.3", "name": "Section 6.3.3", "type": "section"}, {"id": "6.3.4", "name": "Section 6.3.4", "type": "section"}, {"id": "6.6", "name": "Section 6.6", "type": "section"}, {"id": "6.6.1", "name": "Section 6.6.1", "type": "section"}, {"id": "7", "name": "Chapter 7", "type": "section"}, {"id": "7.2", "name": "Section 7.2", "type": "section"}, {"id": "7.3", "name": "Section 7.3", "type": "section"}, {"id": "7.3.1", "name": "Section 7.3.1", "type": "section"}, {"id": "7.3.2", "name": "Section 7.3.2", "type": "section"}, {"id": "7.3.3", "name": "Section 7.3.3", "type": "section"}, {"id": "7.4", "name": "Section 7.4", "type": "section"}, {"id": "7.5", "name": "Section 7.5", "type": "section"}, {"id": "7.5.1", "name": "Section 7.5.1", "type": "section"}, {"id": "7.5.2", "name": "Section 7.5.2", "type": "section"}, {"id": "7.5.3", "name": "Section 7.5.3", "type": "section"}, {"id": "8", "name": "Chapter 8", "type": "section"}, {"id": "8.1", "name": "Section 8.1", "type": "section"}, {"id": "8.3", "name": "Section 8.3", "type": "section"}, {"id": "8.4", "name": "Section 8.4", "type": "section"}, {"id": "9", "name": "Chapter 9", "type": "section"}, {"id": "9.1", "name": "Section 9.1", "type": "section"}, {"id": "9.2", "name": "Section 9.2", "type": "section"}, {"id": "9.3", "name": "Section 9.3", "type": "section"}, {"id": "9.4", "name": "Section 9.4", "type": "section"}, {"id": "book", "name": "Book", "type": "section"}, {"id": "cxn:action-modification-construction", "name": "action modification construction", "type": "cxn", "notOriginal": true}, {"id": "cxn:additive-construction", "name": "additive construction", "type": "cxn", "notOriginal": true}, {"id": "cxn:additive-coordination", "name": "additive coordination", "type": "cxn", "notOriginal": true}, {"id": "cxn:adjectival-phrase", "name": "adjectival phrase", "type": "cxn", "alias": ["adjective attributive phrase"], "shard": 0}, {"id": "cxn:adjective", "name": "adjective", "type": "cxn", "shard": 0}, {"id": "cxn:adjective-modification-construction", "name": "adjective modification construction", "type": "cxn", "alias": ["adjective modification", "adjective modification (construction)"], "notOriginal": true}, {"id": "cxn:admodifier", "name": "admodifier", "type": "cxn", "shard": 0}, {"id": "cxn:adverbial-clause-construction", "name": "adverbial clause construction", "type": "cxn", "alias": ["adverbial clause", "adverbial clause (construction)", "adverbial subordinate construction"], "shard": 0}, {"id": "cxn:adverbial-dependent-clause", "name": "adverbial dependent clause", "type": "cxn", "shard": 0}, {"id": "cxn:adverbial-matrix-clause", "name": "adverbial matrix clause", "type": "cxn", "notOriginal": true}, {"id": "cxn:adversative-coordination", "name": "adversative coordination", "type": "cxn", "shard": 0}, {"id": "cxn:affecting-verb", "name": "affecting verb", "type": "cxn", "alias": ["affect"], "shard": 0}, {"id": "cxn:age-term", "name": "age term", "type": "cxn", "shard": 0}, {"id": "cxn:agentive-change-of-state-verb", "name": "agentive change of state verb", "type": "cxn", "shard": 0}, {"id": "cxn:alienable-possession-attributive-phrase", "name": "alienable possession attributive phrase", "type": "cxn", "notOriginal": true}, {"id": "cxn:alienable-possession-modification-construction", "name": "alienable possession modification construction", "type": "cxn", "alias": ["alienable possession", "alienable possession (modification construction)"], "shard": 0}, {"id": "cxn:alternative-question-construction", "name": "alternative question construction", "type": "cxn", "shard": 0}, {"id": "cxn:amount-term", "name": "amount term", "type": "cxn", "shard": 0}, {"id": "cxn:anaphoric-article", "name": "anaphoric article", "type": "cxn", "alias": ["anaphoric (definite) article", "anaphoric definite article"], "shard": 0}, {"id": "cxn:anaphoric-head-construction", "name": "anaphoric-head construction", "type": "cxn", "shard": 0}, {"id": "cxn:anaphoric-head-relative-clause-construction", "name": "anaphoric-head relative clause construction", "type": "cxn", "shard": 0}, {"id": "cxn:anaphoric-pronoun", "name": "anaphoric pronoun", "type": "cxn", "shard": 0}, {"id": "cxn:anchoring-construction", "name": "anchoring construction", "type": "cxn", "alias": ["anchoring (nominal modification) construction", "anchoring nominal modification construction"], "shard": 0}, {"id": "cxn:animal-noun", "name": "animal noun", "type": "cxn", "notOriginal": true}, {"id": "cxn:animal-plant-product-noun", "name": "animal\u2013plant product noun", "type": "cxn", "notOriginal": true}, {"id": "cxn:antipassive-construction", "name": "antipassive construction", "type": "cxn", "shard": 0}, {"id": "cxn:antipassive-oblique-phrase", "name": "antipassive oblique phrase", "type": "cxn", "notOriginal": true}, {"id": "cxn:antonym", "name": "antonym", "type": "cxn", "shard": 0}, {"id": "cxn:apodosis-clause", "name": "apodosis clause", "type": "cxn", "shard": 0}, {"id": "cxn:application-verb", "name": "application verb", "type": "cxn", "alias": ["putting verb"], "shard": 0}, {"id": "cxn:applicative-construction", "name": "applicative construction", "type": "cxn", "shard": 0}, {"id": "cxn:applicative-object-phrase", "name": "applicative object phrase", "type": "cxn", "shard": 0}, {"id": "cxn:apposition", "name": "apposition", "type": "cxn", "shard": 0}, {"id": "cxn:apprehensional-construction", "name": "apprehensional construction", "type": "cxn", "notOriginal": true}, {"id": "cxn:argument-complex-predicate", "name": "argument complex predicate", "type": "cxn", "shard": 0}, {"id": "cxn:argument-phrase", "name": "argument phrase", "type": "cxn", "shard": 0}, {"id": "cxn:argument-predicate-part", "name": "argument predicate part", "type": "cxn", "notOriginal": true}, {"id": "cxn:article", "name": "article", "type": "cxn", "shard": 0}, {"id": "cxn:associative-construction", "name": "associative construction", "type": "cxn", "shard": 0}, {"id": "cxn:attending-verb", "name": "attending verb", "type": "cxn", "shard": 0}, {"id": "cxn:attributive-phrase", "name": "attributive phrase", "type": "cxn", "shard": 0}, {"id": "cxn:auxiliary", "name": "auxiliary", "type": "cxn", "shard": 0}, {"id": "cxn:auxiliary-construction", "name": "auxiliary construction", "type": "cxn", "shard": 0}, {"id": "cxn:basic-voice", "name": "basic voice", "type": "cxn", "alias": ["active voice construction", "basic voice (construction)", "basic voice construction", "direct voice construction"], "shard": 0}, {"id": "cxn:binominal-lexeme", "name": "binominal lexeme", "type": "cxn", "alias": ["binominal lexeme (construction)", "binominal lexeme construction"], "shard": 0}, {"id": "cxn:bodily-motion-verb", "name": "bodily motion verb", "type": "cxn", "shard": 0}, {"id": "cxn:bodily-predicate", "name": "bodily predicate", "type": "cxn", "shard": 0}, {"id": "cxn:body-care-verb", "name": "body care verb", "type": "cxn", "shard": 0}, {"id": "cxn:body-part-noun", "name": "body part noun", "type": "cxn", "notOriginal": true}, {"id": "cxn:body-position-predicate", "name": "body position predicate", "type": "cxn", "alias": ["locative stative predicate", "maintain position predicate", "posture predicate"], "shard": 0}, {"id": "cxn:cardinal-numeral-term", "name": "cardinal numeral term", "type": "cxn", "shard": 0}, {"id": "cxn:causal-construction", "name": "causal construction", "type": "cxn", "notOriginal": true}, {"id": "cxn:causative-construction", "name": "causative construction", "type": "cxn", "shard": 0}, {"id": "cxn:causee-phrase", "name": "causee phrase", "type": "cxn", "notOriginal": true}, {"id": "cxn:causer-phrase", "name": "causer phrase", "type": "cxn", "notOriginal": true}, {"id": "cxn:chaining-construction", "name": "chaining construction", "type": "cxn", "shard": 0}, {"id": "cxn:change-in-position-verb", "name": "change in position verb", "type": "cxn", "alias": ["assume position verb", "change in (body) position verb", "change in body position verb", "change in posture verb"], "shard": 0}, {"id": "cxn:change-of-state-verb", "name": "change of state verb", "type": "cxn", "alias": ["COS verb"], "shard": 0}, {"id": "cxn:clause", "name": "clause", "type": "cxn", "alias": ["ASC", "argument structure construction", "voice construction"], "shard": 0}, {"id": "cxn:cognition-verb", "name": "cognition verb", "type": "cxn", "shard": 0}, {"id": "cxn:collective-construction", "name": "collective construction", "type": "cxn", "shard": 0}, {"id": "cxn:color-term", "name": "color term", "type": "cxn", "shard": 0}, {"id": "cxn:combining-verb", "name": "combining verb", "type": "cxn", "shard": 0}, {"id": "cxn:commentative-construction", "name": "commentative construction", "type": "cxn", "notOriginal": true}, {"id": "cxn:commentative-predicate", "name": "commentative predicate", "type": "cxn", "shard": 0}, {"id": "cxn:common-noun", "name": "common noun", "type": "cxn", "shard": 0}, {"id": "cxn:comparative-conditional-construction", "name": "comparative conditional construction", "type": "cxn", "shard": 0}, {"id": "cxn:comparative-construction", "name": "comparative construction", "type": "cxn", "shard": 0}, {"id": "cxn:comparative-form", "name": "comparative form", "type": "cxn", "shard": 0}, {"id": "cxn:comparative-pronoun", "name": "comparative pronoun", "type": "cxn", "shard": 0}, {"id": "cxn:complement", "name": "complement", "type": "cxn", "alias": ["complement (dependent clause)", "complement dependent clause"], "shard": 0}, {"id": "cxn:complement-clause-construction", "name": "complement clause construction", "type": "cxn", "shard": 0}, {"id": "cxn:complement-matrix-clause", "name": "complement matrix clause", "type": "cxn", "notOriginal": true}, {"id": "cxn:complement-taking-predicate", "name": "complement-taking predicate", "type": "cxn", "alias": ["CTP"], "shard": 0}, {"id": "cxn:complementary", "name": "complementary", "type": "cxn", "shard": 0}, {"id": "cxn:complex-predicate", "name": "complex predicate", "type": "cxn", "shard": 0}, {"id": "cxn:complex-predicate-part", "name": "complex predicate part", "type": "cxn", "notOriginal": true}, {"id": "cxn:complex-sentence", "name": "complex sentence", "type": "cxn", "shard": 0}, {"id": "cxn:concessive-conditional-construction", "name": "concessive conditional construction", "type": "cxn", "alias": ["concessive conditional", "concessive conditional (construction)", "conditional concessive construction"], "shard": 0}, {"id": "cxn:concessive-construction", "name": "concessive construction", "type": "cxn", "shard": 0}, {"id": "cxn:conditional-construction", "name": "conditional construction", "type": "cxn", "shard": 0}, {"id": "cxn:conditional-pronoun", "name": "conditional pronoun", "type": "cxn", "shard": 0}, {"id": "cxn:conjunctive-coordination", "name": "conjunctive coordination", "type": "cxn", "shard": 0}, {"id": "cxn:consecutive-coordination", "name": "consecutive coordination", "type": "cxn", "notOriginal": true}, {"id": "cxn:construction", "name": "construction", "type": "cxn", "shard": 0}, {"id": "cxn:contact-by-impact-verb", "name": "contact by impact verb", "type": "cxn", "shard": 0}, {"id": "cxn:container-term", "name": "container term", "type": "cxn", "shard": 0}, {"id": "cxn:controlled-predicate", "name": "controlled predicate", "type": "cxn", "shard": 0}, {"id": "cxn:coordinand", "name": "coordinand", "type": "cxn", "alias": ["conjunct"], "shard": 0}, {"id": "cxn:coordinate-clause-construction", "name": "coordinate clause construction", "type": "cxn", "alias": ["clause chaining", "coordinate clause", "coordinate clause (construction)", "cosubordination", "medial verb construction"], "shard": 0}, {"id": "cxn:coordinate-construction", "name": "coordinate construction", "type": "cxn", "alias": ["coordination"], "shard": 0}, {"id": "cxn:core-argument-phrase", "name": "core argument phrase", "type": "cxn", "shard": 0}, {"id": "cxn:damage-verb", "name": "damage verb", "type": "cxn", "shard": 0}, {"id": "cxn:declarative-construction", "name": "declarative construction", "type": "cxn", "shard": 0}, {"id": "cxn:declarative-negation-construction", "name": "declarative negation construction", "type": "cxn", "alias": ["declarative negation", "declarative negation (construction)"], "shard": 0}, {"id": "cxn:definite-article", "name": "definite article", "type": "cxn", "shard": 0}, {"id": "cxn:definite-pronoun", "name": "definite pronoun", "type": "cxn", "shard": 0}, {"id": "cxn:demonstrative-attributive", "name": "demonstrative attributive", "type": "cxn", "shard": 0}, {"id": "cxn:demonstrative-pronoun", "name": "demonstrative pronoun", "type": "cxn", "shard": 0}, {"id": "cxn:dependent", "name": "dependent", "type": "cxn", "shard": 0}, {"id": "cxn:dependent-clause", "name": "dependent clause", "type": "cxn", "shard": 0}, {"id": "cxn:depictive-complex-predicate", "name": "depictive complex predicate", "type": "cxn", "alias": ["depictive", "depictive (complex predicate)", "depictive secondary predicate"], "shard": 0}, {"id": "cxn:desiderative-construction", "name": "desiderative construction", "type": "cxn", "notOriginal": true}, {"id": "cxn:desiderative-predicate", "name": "desiderative predicate", "type": "cxn", "shard": 0}, {"id": "cxn:determiner", "name": "determiner", "type": "cxn", "shard": 0}, {"id": "cxn:dimension-term", "name": "dimension term", "type": "cxn", "shard": 0}, {"id": "cxn:direct-negation-pronoun", "name": "direct negation pronoun", "type": "cxn", "shard": 0}, {"id": "cxn:discourse-markers", "name": "discourse markers", "type": "cxn", "shard": 0}, {"id": "cxn:disjunctive-coordination", "name": "disjunctive coordination", "type": "cxn", "shard": 0}, {"id": "cxn:distributive-quantifier-term", "name": "distributive quantifier term", "type": "cxn", "shard": 0}, {"id": "cxn:ditransitive-a-phrase", "name": "ditransitive A phrase", "type": "cxn", "alias": ["ditransitive A argument phrase"], "notOriginal": true}, {"id": "cxn:ditransitive-construction", "name": "ditransitive construction", "type": "cxn", "alias": ["ditransitive", "ditransitive (construction)"], "shard": 0}, {"id": "cxn:downtoner", "name": "downtoner", "type": "cxn", "shard": 0}, {"id": "cxn:dynamic-predicate-part", "name": "dynamic predicate part", "type": "cxn", "notOriginal": true}, {"id": "cxn:element", "name": "element", "type": "cxn", "shard": 0}, {"id": "cxn:emotion-verb", "name": "emotion verb", "type": "cxn", "shard": 0}, {"id": "cxn:entity-central-construction", "name": "entity-central construction", "type": "cxn", "shard": 0}, {"id": "cxn:equational-construction", "name": "equational construction", "type": "cxn", "shard": 0}, {"id": "cxn:equative-construction", "name": "equative construction", "type": "cxn", "shard": 0}, {"id": "cxn:evaluative-construction", "name": "evaluative construction", "type": "cxn", "notOriginal": true}, {"id": "cxn:evaluative-predicate", "name": "evaluative predicate", "type": "cxn", "shard": 0}, {"id": "cxn:event-central-construction", "name": "event-central construction", "type": "cxn", "shard": 0}, {"id": "cxn:eventive-complex-predicate", "name": "eventive complex predicate", "type": "cxn", "shard": 0}, {"id": "cxn:eventive-predicate-part", "name": "eventive predicate part", "type": "cxn", "notOriginal": true}, {"id": "cxn:exclamative-construction", "name": "exclamative construction", "type": "cxn", "shard": 0}, {"id": "cxn:exclusive-disjunctive-coordination", "name": "exclusive disjunctive coordination", "type": "cxn", "shard": 1}, {"id": "cxn:exclusive-pronoun", "name": "exclusive pronoun", "type": "cxn", "shard": 1}, {"id": "cxn:exhaustive-list-coordination", "name": "exhaustive list coordination", "type": "cxn", "alias": ["exhaustive (list) coordination", "exhaustive coordination", "summary conjunction"], "shard": 1}, {"id": "cxn:existential-negation-construction", "name": "existential negation construction", "type": "cxn", "alias": ["existential negation", "existential negation (construction)"], "shard": 1}, {"id": "cxn:experience-verb", "name": "experience verb", "type": "cxn", "shard": 1}, {"id": "cxn:experiencer-phrase", "name": "experiencer-phrase", "type": "cxn", "notOriginal": true}, {"id": "cxn:experiential-construction", "name": "experiential construction", "type": "cxn", "shard": 1}, {"id": "cxn:experiential-verb", "name": "experiential verb", "type": "cxn", "shard": 1}, {"id": "cxn:extroverted-verb", "name": "extroverted verb", "type": "cxn", "shard": 1}, {"id": "cxn:fearing-construction", "name": "fearing construction", "type": "cxn", "notOriginal": true}, {"id": "cxn:fearing-predicate", "name": "fearing predicate", "type": "cxn", "shard": 1}, {"id": "cxn:figure-phrase", "name": "figure phrase", "type": "cxn", "notOriginal": true}, {"id": "cxn:first-person-pronoun", "name": "first person pronoun", "type": "cxn", "shard": 1}, {"id": "cxn:form-term", "name": "form term", "type": "cxn", "shard": 1}, {"id": "cxn:free-choice-pronoun", "name": "free choice pronoun", "type": "cxn", "shard": 1}, {"id": "cxn:free-modification-construction", "name": "free modification construction", "type": "cxn", "notOriginal": true}, {"id": "cxn:free-relative-clause-construction", "name": "free relative clause construction", "type": "cxn", "shard": 1}, {"id": "cxn:gender-term", "name": "gender term", "type": "cxn", "shard": 1}, {"id": "cxn:generic-article", "name": "generic article", "type": "cxn", "shard": 1}, {"id": "cxn:generic-conditional-construction", "name": "generic conditional construction", "type": "cxn", "shard": 1}, {"id": "cxn:generic-pronoun", "name": "generic pronoun", "type": "cxn", "shard": 1}, {"id": "cxn:ground-phrase", "name": "ground phrase", "type": "cxn", "notOriginal": true}, {"id": "cxn:group-term", "name": "group term", "type": "cxn", "shard": 1}, {"id": "cxn:hanging-topic-construction", "name": "hanging topic construction", "type": "cxn", "notOriginal": true}, {"id": "cxn:hanging-topic-phrase", "name": "hanging topic phrase", "type": "cxn", "shard": 1}, {"id": "cxn:head", "name": "head", "type": "cxn", "shard": 1}, {"id": "cxn:hoping-construction", "name": "hoping construction", "type": "cxn", "notOriginal": true}, {"id": "cxn:hoping-predicate", "name": "hoping predicate", "type": "cxn", "shard": 1}, {"id": "cxn:human-noun", "name": "human noun", "type": "cxn", "notOriginal": true}, {"id": "cxn:human-propensity-term", "name": "human propensity term", "type": "cxn", "alias": ["disposition"], "shard": 1}, {"id": "cxn:human-proper-noun", "name": "human proper noun", "type": "cxn", "notOriginal": true}, {"id": "cxn:identificational-construction", "name": "identificational construction", "type": "cxn", "shard": 1}, {"id": "cxn:imperative-hortative-construction", "name": "imperative\u2013hortative construction", "type": "cxn", "alias": ["hortative construction", "imperative construction"], "shard": 1}, {"id": "cxn:inalienable-possession-attributive-phrase", "name": "inalienable possession attributive phrase", "type": "cxn", "notOriginal": true}, {"id": "cxn:inalienable-possession-modification-construction", "name": "inalienable possession modification construction", "type": "cxn", "alias": ["inalienable possession"], "shard": 1}, {"id": "cxn:inclusive-disjunctive-coordination", "name": "inclusive disjunctive coordination", "type": "cxn", "shard": 1}, {"id": "cxn:inclusive-pronoun", "name": "inclusive pronoun", "type": "cxn", "shard": 1}, {"id": "cxn:inclusory-construction", "name": "inclusory construction", "type": "cxn", "shard": 1}, {"id": "cxn:indefinite-article", "name": "indefinite article", "type": "cxn", "shard": 1}, {"id": "cxn:indefinite-pronoun", "name": "indefinite pronoun", "type": "cxn", "shard": 1}, {"id": "cxn:indirect-negation-pronoun", "name": "indirect negation pronoun", "type": "cxn", "shard": 1}, {"id": "cxn:information-question-construction", "name": "information question construction", "type": "cxn", "shard": 1}, {"id": "cxn:information-question-response-construction", "name": "information question response construction", "type": "cxn", "alias": ["information (question) response construction", "information response construction"], "shard": 1}, {"id": "cxn:ingestion-verb", "name": "ingestion verb", "type": "cxn", "shard": 1}, {"id": "cxn:intensifier", "name": "intensifier", "type": "cxn", "shard": 1}, {"id": "cxn:interaction-verb", "name": "interaction verb", "type": "cxn", "shard": 1}, {"id": "cxn:interrogative-complement", "name": "interrogative complement", "type": "cxn", "shard": 1}, {"id": "cxn:interrogative-construction", "name": "interrogative construction", "type": "cxn", "shard": 1}, {"id": "cxn:interrogative-pronoun", "name": "interrogative pronoun", "type": "cxn", "shard": 1}, {"id": "cxn:intransitive-construction", "name": "intransitive construction", "type": "cxn", "shard": 1}, {"id": "cxn:introverted-verb", "name": "introverted verb", "type": "cxn", "shard": 1}, {"id": "cxn:irrealis-pronoun", "name": "irrealis pronoun", "type": "cxn", "shard": 1}, {"id": "cxn:killing-injuring-verb", "name": "killing/injuring verb", "type": "cxn", "alias": ["injuring verb", "killing verb"], "shard": 1}, {"id": "cxn:kinship-noun", "name": "kinship noun", "type": "cxn", "notOriginal": true}, {"id": "cxn:knowledge-construction", "name": "knowledge construction", "type": "cxn", "notOriginal": true}, {"id": "cxn:knowledge-predicate", "name": "knowledge predicate", "type": "cxn", "shard": 1}, {"id": "cxn:let-alone-construction", "name": "let alone construction", "type": "cxn", "shard": 1}, {"id": "cxn:locational-construction", "name": "locational construction", "type": "cxn", "alias": ["location clause", "location construction", "location(al) clause", "location(al) construction", "locational clause", "locative clause"], "shard": 1}, {"id": "cxn:locative-modification-construction", "name": "locative modification construction", "type": "cxn", "shard": 1}, {"id": "cxn:locative-phrase", "name": "locative phrase", "type": "cxn", "alias": ["locative (attributive) phrase", "locative attributive phrase"], "shard": 1}, {"id": "cxn:logophoric-construction", "name": "logophoric construction", "type": "cxn", "shard": 1}, {"id": "cxn:main-clause", "name": "main clause", "type": "cxn", "shard": 1}, {"id": "cxn:manipulative-construction", "name": "manipulative construction", "type": "cxn", "notOriginal": true}, {"id": "cxn:manipulative-predicate", "name": "manipulative predicate", "type": "cxn", "shard": 1}, {"id": "cxn:manner-complex-predicate", "name": "manner complex predicate", "type": "cxn", "alias": ["manner adverb"], "shard": 1}, {"id": "cxn:manner-of-motion-verb", "name": "manner of motion verb", "type": "cxn", "shard": 1}, {"id": "cxn:manner-verb", "name": "manner verb", "type": "cxn", "shard": 1}, {"id": "cxn:material-term", "name": "material term", "type": "cxn", "alias": ["substance term"], "shard": 1}, {"id": "cxn:matrix-clause", "name": "matrix clause", "type": "cxn", "shard": 1}, {"id": "cxn:means-construction", "name": "means construction", "type": "cxn", "notOriginal": true}, {"id": "cxn:measure-term", "name": "measure term", "type": "cxn", "shard": 1}, {"id": "cxn:measurement", "name": "measurement", "type": "cxn", "shard": 1}, {"id": "cxn:mensural-attributive-phrase", "name": "mensural attributive phrase", "type": "cxn", "notOriginal": true}, {"id": "cxn:mensural-modification-construction", "name": "mensural modification construction", "type": "cxn", "alias": ["mensural construction", "mensural modification", "mensural modification (construction)"], "shard": 1}, {"id": "cxn:mensural-term", "name": "mensural term", "type": "cxn", "shard": 1}, {"id": "cxn:modification-construction", "name": "modification construction", "type": "cxn", "alias": ["(referent) modification construction", "referent modification construction"], "shard": 1}, {"id": "cxn:modifier", "name": "modifier", "type": "cxn", "shard": 1}, {"id": "cxn:motion-construction", "name": "motion construction", "type": "cxn", "alias": ["motion ASC", "motion argument structure construction"], "notOriginal": true}, {"id": "cxn:motion-verb", "name": "motion verb", "type": "cxn", "shard": 1}, {"id": "cxn:natural-object-noun", "name": "natural object noun", "type": "cxn", "alias": ["substance noun"], "notOriginal": true}, {"id": "cxn:negation-construction", "name": "negation construction", "type": "cxn", "alias": ["negation", "negation (construction)"], "shard": 1}, {"id": "cxn:negative-circumstantial-construction", "name": "negative circumstantial construction", "type": "cxn", "notOriginal": true}, {"id": "cxn:negative-question-polarity-response-construction", "name": "negative question polarity response construction", "type": "cxn", "notOriginal": true}, {"id": "cxn:nominal-attributive-phrase", "name": "nominal attributive phrase", "type": "cxn", "notOriginal": true}, {"id": "cxn:nominal-modification-construction", "name": "nominal modification construction", "type": "cxn", "alias": ["nominal modifier construction"], "shard": 1}, {"id": "cxn:nominal-phrase", "name": "nominal phrase", "type": "cxn", "shard": 1}, {"id": "cxn:non-exhaustive-list-coordination", "name": "non-exhaustive list coordination", "type": "cxn", "alias": ["non-exhaustive coordination", "representative conjunction"], "shard": 1}, {"id": "cxn:nonanaphoric-definite-article", "name": "nonanaphoric definite article", "type": "cxn", "alias": ["nonanaphoric (definite) article", "nonanaphoric article"], "shard": 1}, {"id": "cxn:nonbasic-voice", "name": "nonbasic voice", "type": "cxn", "shard": 1}, {"id": "cxn:nonclausal-coordination", "name": "nonclausal coordination", "type": "cxn", "notOriginal": true}, {"id": "cxn:nonpredicational-construction", "name": "nonpredicational construction", "type": "cxn", "alias": ["nonpredicational clause"], "shard": 1}, {"id": "cxn:nonprototypical-construction", "name": "nonprototypical construction", "type": "cxn", "shard": 1}, {"id": "cxn:nonprototypical-predication-construction", "name": "nonprototypical predication construction", "type": "cxn", "alias": ["nonverbal predication"], "shard": 1}, {"id": "cxn:nonsubject-argument-phrase", "name": "nonsubject argument phrase", "type": "cxn", "notOriginal": true}, {"id": "cxn:noun", "name": "noun", "type": "cxn", "shard": 1}, {"id": "cxn:noun-complement", "name": "noun complement", "type": "cxn", "shard": 1}, {"id": "cxn:noun-complement-clause-construction", "name": "noun complement clause construction", "type": "cxn", "shard": 1}, {"id": "cxn:noun-complement-head", "name": "noun complement head", "type": "cxn", "notOriginal": true}, {"id": "cxn:noun-complement-matrix-clause", "name": "noun complement matrix clause", "type": "cxn", "notOriginal": true}, {"id": "cxn:noun-complement-referring-phrase", "name": "noun complement referring phrase", "type": "cxn", "notOriginal": true}, {"id": "cxn:numeral-attributive-phrase", "name": "numeral attributive phrase", "type": "cxn", "notOriginal": true}, {"id": "cxn:numeral-modification-construction", "name": "numeral modification construction", "type": "cxn", "alias": ["numeral construction", "numeral modification", "numeral modification (construction)"], "notOriginal": true}, {"id": "cxn:object-identity-construction", "name": "object identity construction", "type": "cxn", "shard": 1}, {"id": "cxn:object-phrase", "name": "object phrase", "type": "cxn", "alias": ["object (argument) phrase", "object argument phrase"], "shard": 1}, {"id": "cxn:oblique-phrase", "name": "oblique phrase", "type": "cxn", "alias": ["oblique (argument) phrase", "oblique argument phrase"], "shard": 1}, {"id": "cxn:ordinal-numeral-term", "name": "ordinal numeral term", "type": "cxn", "shard": 1}, {"id": "cxn:p-phrase", "name": "P phrase", "type": "cxn", "alias": ["P argument phrase"], "notOriginal": true}, {"id": "cxn:partitive-construction", "name": "partitive construction", "type": "cxn", "shard": 1}, {"id": "cxn:partitive-phrase", "name": "partitive phrase", "type": "cxn", "notOriginal": true}, {"id": "cxn:passive-inverse-a-phrase", "name": "passive-inverse A phrase", "type": "cxn", "alias": ["passive-inverse A argument phrase"], "notOriginal": true}, {"id": "cxn:passive-inverse-p-phrase", "name": "passive-inverse P phrase", "type": "cxn", "notOriginal": true}, {"id": "cxn:passive-inverse-voice", "name": "passive\u2013inverse voice", "type": "cxn", "alias": ["passive\u2013inverse construction", "passive\u2013inverse voice (construction)", "passive\u2013inverse voice construction"], "shard": 1}, {"id": "cxn:path-verb", "name": "path verb", "type": "cxn", "alias": ["path (of motion) verb", "path of motion verb"], "shard": 1}, {"id": "cxn:perception-clause", "name": "perception clause", "type": "cxn", "alias": ["perception ASC", "perception argument structure construction"], "notOriginal": true}, {"id": "cxn:perception-complement-clause-construction", "name": "perception complement clause construction", "type": "cxn", "notOriginal": true}, {"id": "cxn:perception-complement-taking-predicate", "name": "perception complement-taking predicate", "type": "cxn", "shard": 1}, {"id": "cxn:perception-verb", "name": "perception verb", "type": "cxn", "shard": 1}, {"id": "cxn:personal-pronoun", "name": "personal pronoun", "type": "cxn", "shard": 1}, {"id": "cxn:physical-property-term", "name": "physical property term", "type": "cxn", "shard": 1}, {"id": "cxn:piece-term", "name": "piece term", "type": "cxn", "shard": 1}, {"id": "cxn:place-noun", "name": "place noun", "type": "cxn", "notOriginal": true}, {"id": "cxn:place-proper-noun", "name": "place proper noun", "type": "cxn", "notOriginal": true}, {"id": "cxn:plant-noun", "name": "plant noun", "type": "cxn", "notOriginal": true}, {"id": "cxn:polarity-focus-construction", "name": "polarity focus construction", "type": "cxn", "alias": ["truth-value focus construction"], "shard": 1}, {"id": "cxn:polarity-question-construction", "name": "polarity question construction", "type": "cxn", "alias": ["Y/N question", "yes/no question"], "shard": 1}, {"id": "cxn:polarity-response-construction", "name": "polarity response construction", "type": "cxn", "shard": 1}, {"id": "cxn:positive-question-polarity-response-construction", "name": "positive question polarity response construction", "type": "cxn", "notOriginal": true}, {"id": "cxn:possessed-argument-construction", "name": "possessed argument construction", "type": "cxn", "notOriginal": true}, {"id": "cxn:possession-construction", "name": "possession construction", "type": "cxn", "alias": ["possession clause"], "shard": 1}, {"id": "cxn:possessive-attributive-phrase", "name": "possessive attributive phrase", "type": "cxn", "alias": ["genitive attributive phrase", "genitive phrase", "possessive modifier phrase"], "shard": 1}, {"id": "cxn:possessive-modification-construction", "name": "possessive modification construction", "type": "cxn", "alias": ["attributive possession construction", "possessive (modification) construction", "possessive construction"], "shard": 1}, {"id": "cxn:possessive-pronoun", "name": "possessive pronoun", "type": "cxn", "notOriginal": true}, {"id": "cxn:possessor-argument-phrase", "name": "possessor argument phrase", "type": "cxn", "notOriginal": true}, {"id": "cxn:pragmatically-nonspecific-article", "name": "pragmatically nonspecific article", "type": "cxn", "alias": ["pragmatically nonspecific (but semantically specific) (indefinite) article", "pragmatically nonspecific but semantically specific article", "pragmatically nonspecific but semantically specific indefinite article", "pragmatically nonspecific indefinite article"], "shard": 1}, {"id": "cxn:pragmatically-nonspecific-pronoun", "name": "pragmatically nonspecific pronoun", "type": "cxn", "alias": ["pragmatically nonspecific (but semantically specific) (indefinite) pronoun", "pragmatically nonspecific but semantically specific indefinite pronoun", "pragmatically nonspecific but semantically specific pronoun", "pragmatically nonspecific indefinite pronoun"], "notOriginal": true, "shard": 1}, {"id": "cxn:pragmatically-specific-article", "name": "pragmatically specific article", "type": "cxn", "alias": ["pragmatically specific (indefinite) article", "pragmatically specific indefinite article"], "shard": 1}, {"id": "cxn:pragmatically-specific-pronoun", "name": "pragmatically specific pronoun", "type": "cxn", "alias": ["pragmatically specific (indefinite) pronoun", "pragmatically specific indefinite pronoun"], "notOriginal": true, "shard": 1}, {"id": "cxn:predicate", "name": "predicate", "type": "cxn", "shard": 1}, {"id": "cxn:predicate-adjectival-construction", "name": "predicate adjectival construction", "type": "cxn", "alias": ["predicate adjectival", "predicate adjectival (construction)", "property predication", "property predication (construction)", "property predication construction"], "shard": 1}, {"id": "cxn:predicate-identity-construction", "name": "predicate identity construction", "type": "cxn", "shard": 1}, {"id": "cxn:predicate-nominal-construction", "name": "predicate nominal construction", "type": "cxn", "alias": ["object predication construction", "predicational construction"], "shard": 2}, {"id": "cxn:predicational-location-construction", "name": "predicational location construction", "type": "cxn", "alias": ["locative predication"], "shard": 2}, {"id": "cxn:predicational-possession-construction", "name": "predicational possession construction", "type": "cxn", "alias": ["belong possession"], "shard": 2}, {"id": "cxn:presentational-construction", "name": "presentational construction", "type": "cxn", "shard": 2}, {"id": "cxn:presentational-location-construction", "name": "presentational location construction", "type": "cxn", "alias": ["presentational locative"], "shard": 2}, {"id": "cxn:presentational-possession-construction", "name": "presentational possession construction", "type": "cxn", "alias": ["have possession"], "shard": 2}, {"id": "cxn:pretense-construction", "name": "pretense construction", "type": "cxn", "notOriginal": true}, {"id": "cxn:pretense-predicate", "name": "pretense predicate", "type": "cxn", "alias": ["pretence predicate"], "shard": 2}, {"id": "cxn:prohibitive-construction", "name": "prohibitive construction", "type": "cxn", "shard": 2}, {"id": "cxn:pronominal-argument-complex-predicate", "name": "pronominal argument complex predicate", "type": "cxn", "shard": 2}, {"id": "cxn:pronoun", "name": "pronoun", "type": "cxn", "shard": 2}, {"id": "cxn:proper-noun", "name": "proper noun", "type": "cxn", "alias": ["proper name"], "shard": 2}, {"id": "cxn:property-referring-phrase", "name": "property referring phrase", "type": "cxn", "shard": 2}, {"id": "cxn:proportional-quantifier-term", "name": "proportional quantifier term", "type": "cxn", "shard": 2}, {"id": "cxn:propositional-attitude-construction", "name": "propositional attitude construction", "type": "cxn", "notOriginal": true}, {"id": "cxn:propositional-attitude-predicate", "name": "propositional attitude predicate", "type": "cxn", "shard": 2}, {"id": "cxn:protasis-clause", "name": "protasis clause", "type": "cxn", "alias": ["antecedent"], "shard": 2}, {"id": "cxn:prototypical-construction", "name": "prototypical construction", "type": "cxn", "alias": ["prototypical", "prototypical (construction)"], "shard": 2}, {"id": "cxn:purpose-construction", "name": "purpose construction", "type": "cxn", "notOriginal": true}, {"id": "cxn:pursuit-verb", "name": "pursuit verb", "type": "cxn", "shard": 2}, {"id": "cxn:quantifier-attributive-phrase", "name": "quantifier attributive phrase", "type": "cxn", "notOriginal": true}, {"id": "cxn:quantifier-modification-construction", "name": "quantifier modification construction", "type": "cxn", "alias": ["quantifier construction", "quantifier modification", "quantifier modification (construction)"], "notOriginal": true}, {"id": "cxn:quantifier-term", "name": "quantifier term", "type": "cxn", "shard": 2}, {"id": "cxn:question-pronoun", "name": "question pronoun", "type": "cxn", "shard": 2}, {"id": "cxn:r-phrase", "name": "R phrase", "type": "cxn", "alias": ["R argument phrase"], "notOriginal": true}, {"id": "cxn:reciprocal-construction", "name": "reciprocal construction", "type": "cxn", "shard": 2}, {"id": "cxn:reference-tracking-construction", "name": "reference tracking construction", "type": "cxn", "alias": ["reference tracking", "reference-tracking"], "shard": 2}, {"id": "cxn:referent-expression", "name": "referent expression", "type": "cxn", "shard": 2}, {"id": "cxn:referring-phrase", "name": "referring phrase", "type": "cxn", "shard": 2}, {"id": "cxn:reflexive-construction", "name": "reflexive construction", "type": "cxn", "shard": 2}, {"id": "cxn:relative-clause", "name": "relative clause", "type": "cxn", "alias": ["relative dependent clause"], "shard": 2}, {"id": "cxn:relative-clause-construction", "name": "relative clause construction", "type": "cxn", "shard": 2}, {"id": "cxn:relative-clause-head", "name": "relative clause head", "type": "cxn", "shard": 2}, {"id": "cxn:relative-matrix-clause", "name": "relative matrix clause", "type": "cxn", "notOriginal": true}, {"id": "cxn:relativized-referring-phrase", "name": "relativized referring phrase", "type": "cxn", "notOriginal": true}, {"id": "cxn:removal-verb", "name": "removal verb", "type": "cxn", "shard": 2}, {"id": "cxn:response-construction", "name": "response construction", "type": "cxn", "shard": 2}, {"id": "cxn:result-verb", "name": "result verb", "type": "cxn", "shard": 2}, {"id": "cxn:resultative-complex-predicate", "name": "resultative complex predicate", "type": "cxn", "alias": ["resultative", "resultative (complex predicate)", "resultative secondary predicate"], "shard": 2}, {"id": "cxn:s-phrase", "name": "S phrase", "type": "cxn", "alias": ["S argument phrase"], "notOriginal": true}, {"id": "cxn:second-person-pronoun", "name": "second person pronoun", "type": "cxn", "shard": 2}, {"id": "cxn:semantically-nonspecific-article", "name": "semantically nonspecific article", "type": "cxn", "alias": ["(semantically) nonspecific (indefinite) article", "nonspecific article", "nonspecific indefinite article", "semantically nonspecific indefinite article"], "shard": 2}, {"id": "cxn:semantically-nonspecific-pronoun", "name": "semantically nonspecific pronoun", "type": "cxn", "alias": ["(semantically) nonspecific (indefinite) pronoun", "nonspecific indefinite pronoun", "nonspecific pronoun", "semantically nonspecific indefinite pronoun"], "shard": 2}, {"id": "cxn:sensation-verb", "name": "sensation verb", "type": "cxn", "shard": 2}, {"id": "cxn:set-member-attributive-phrase", "name": "set-member attributive phrase", "type": "cxn", "notOriginal": true}, {"id": "cxn:set-member-modification-construction", "name": "set-member modification construction", "type": "cxn", "alias": ["set-member", "set-member (modification) (construction)", "set-member construction", "set-member modification"], "notOriginal": true}, {"id": "cxn:set-member-term", "name": "set-member term", "type": "cxn", "shard": 2}, {"id": "cxn:shape-term", "name": "shape term", "type": "cxn", "shard": 2}, {"id": "cxn:simple-contrast-coordination", "name": "simple contrast coordination", "type": "cxn", "notOriginal": true}, {"id": "cxn:simple-predicate", "name": "simple predicate", "type": "cxn", "notOriginal": true}, {"id": "cxn:social-noun", "name": "social noun", "type": "cxn", "notOriginal": true}, {"id": "cxn:species-term", "name": "species term", "type": "cxn", "shard": 2}, {"id": "cxn:specific-known-pronoun", "name": "specific known pronoun", "type": "cxn", "shard": 2}, {"id": "cxn:specific-unknown-pronoun", "name": "specific unknown pronoun", "type": "cxn", "shard": 2}, {"id": "cxn:speech-act-construction", "name": "speech act construction", "type": "cxn", "alias": ["speech act", "speech act (construction)"], "shard": 2}, {"id": "cxn:spontaneous-verb", "name": "spontaneous verb", "type": "cxn", "shard": 2}, {"id": "cxn:spurious-complex-predicate", "name": "spurious complex predicate", "type": "cxn", "notOriginal": true}, {"id": "cxn:stative-complex-predicate", "name": "stative complex predicate", "type": "cxn", "shard": 2}, {"id": "cxn:stative-predicate-part", "name": "stative predicate part", "type": "cxn", "notOriginal": true}, {"id": "cxn:stimulus-phrase", "name": "stimulus-phrase", "type": "cxn", "notOriginal": true}, {"id": "cxn:subject-identity-construction", "name": "subject identity construction", "type": "cxn", "shard": 2}, {"id": "cxn:subject-phrase", "name": "subject phrase", "type": "cxn", "alias": ["subject", "subject (argument) phrase", "subject argument phrase"], "shard": 2}, {"id": "cxn:subordinate-clause", "name": "subordinate clause", "type": "cxn", "shard": 2}, {"id": "cxn:substitutive-construction", "name": "substitutive construction", "type": "cxn", "notOriginal": true}, {"id": "cxn:subtractive-construction", "name": "subtractive construction", "type": "cxn", "notOriginal": true}, {"id": "cxn:superlative-form", "name": "superlative form", "type": "cxn", "shard": 2}, {"id": "cxn:support-verb", "name": "support verb", "type": "cxn", "alias": ["coverb", "light verb"], "shard": 2}, {"id": "cxn:support-verb-construction", "name": "support verb construction", "type": "cxn", "alias": ["coverb construction", "light verb construction"], "shard": 2}, {"id": "cxn:t-phrase", "name": "T phrase", "type": "cxn", "alias": ["T argument phrase"], "notOriginal": true}, {"id": "cxn:temporal-construction", "name": "temporal construction", "type": "cxn", "notOriginal": true}, {"id": "cxn:temporary-predicate", "name": "temporary predicate", "type": "cxn", "shard": 2}, {"id": "cxn:thetic-construction", "name": "thetic construction", "type": "cxn", "shard": 2}, {"id": "cxn:third-person-pronoun", "name": "third person pronoun", "type": "cxn", "shard": 2}, {"id": "cxn:topic-comment-construction", "name": "topic\u2013comment construction", "type": "cxn", "shard": 2}, {"id": "cxn:topic-phrase", "name": "topic phrase", "type": "cxn", "shard": 2}, {"id": "cxn:transfer-verb", "name": "transfer verb", "type": "cxn", "shard": 2}, {"id": "cxn:transitive-a-phrase", "name": "transitive A phrase", "type": "cxn", "alias": ["transitive A argument phrase"], "notOriginal": true}, {"id": "cxn:transitive-construction", "name": "transitive construction", "type": "cxn", "alias": ["(mono)transitive (construction)", "monotransitive", "monotransitive construction", "transitive"], "shard": 2}, {"id": "cxn:typifying-construction", "name": "typifying construction", "type": "cxn", "alias": ["non-anchoring (nominal modification) construction", "non-anchoring construction", "non-anchoring nominal modification construction", "typifying (nominal modification) construction", "typifying nominal modification construction"], "shard": 2}, {"id": "cxn:uncontrolled-predicate", "name": "uncontrolled predicate", "type": "cxn", "shard": 2}, {"id": "cxn:unexpected-co-occurrence-coordination", "name": "unexpected co-occurrence coordination", "type": "cxn", "notOriginal": true}, {"id": "cxn:universal-pronoun", "name": "universal pronoun", "type": "cxn", "shard": 2}, {"id": "cxn:utterance-construction", "name": "utterance construction", "type": "cxn", "notOriginal": true}, {"id": "cxn:utterance-predicate", "name": "utterance predicate", "type": "cxn", "shard": 2}, {"id": "cxn:vague-numeral-term", "name": "vague numeral term", "type": "cxn", "shard": 2}, {"id": "cxn:value-term", "name": "value term", "type": "cxn", "shard": 2}, {"id": "cxn:verb", "name": "verb", "type": "cxn", "shard": 2}, {"id": "cxn:verbal-clause", "name": "verbal clause", "type": "cxn", "shard": 2}, {"id": "cxn:wishing-construction", "name": "wishing construction", "type": "cxn", "notOriginal": true}, {"id": "cxn:wishing-predicate", "name": "wishing predicate", "type": "cxn", "shard": 2}, {"id": "def:accessibility-hierarchy", "name": "Accessibility Hierarchy", "type": "def", "shard": 2}, {"id": "def:accessibility-scale", "name": "Accessibility Scale", "type": "def", "shard": 2}, {"id": "def:adjunct", "name": "adjunct", "type": "def", "shard": 2}, {"id": "def:agreement-hierarchy", "name": "Agreement Hierarchy", "type": "def", "shard": 2}, {"id": "def:animacy-hierarchy", "name": "Animacy Hierarchy", "type": "def", "shard": 2}, {"id": "def:behavioral-potential", "name": "behavioral potential", "type": "def", "shard": 2}, {"id": "def:binding-hierarchy", "name": "Binding Hierarchy", "type": "def", "alias": ["Complement Deranking-Argument Hierarchy"], "shard": 2}, {"id": "def:comparative-concept", "name": "comparative concept", "type": "def", "alias": ["crosslinguistic category"], "shard": 2}, {"id": "def:conceptual-space", "name": "conceptual space", "type": "def", "shard": 2}, {"id": "def:construction-grammar", "name": "construction grammar", "type": "def", "shard": 2}, {"id": "def:crosslinguistically-valid", "name": "crosslinguistically valid", "type": "def", "shard": 2}, {"id": "def:cumulation", "name": "cumulation", "type": "def", "shard": 2}, {"id": "def:explicitness", "name": "explicitness", "type": "def", "alias": ["explicit", "explicit(ness)", "recoverability"], "shard": 2}, {"id": "def:extended-animacy-hierarchy", "name": "Extended Animacy Hierarchy", "type": "def", "alias": ["Referentiality Hierarchy"], "shard": 2}, {"id": "def:false-cumulation", "name": "false cumulation", "type": "def", "shard": 2}, {"id": "def:file-metaphor", "name": "file metaphor", "type": "def", "shard": 2}, {"id": "def:form", "name": "form", "type": "def", "alias": ["expression"], "shard": 2}, {"id": "def:function", "name": "function", "type": "def", "shard": 2}, {"id": "def:functionalism", "name": "functionalism", "type": "def", "shard": 2}, {"id": "def:grammaticalization", "name": "grammaticalization", "type": "def", "alias": ["grammaticalize"], "shard": 2}, {"id": "def:identity-statements", "name": "identity statements", "type": "def", "shard": 2}, {"id": "def:interlinear-morpheme-translation", "name": "interlinear morpheme translation", "type": "def", "alias": ["IMT", "gloss"], "shard": 2}, {"id": "def:lexicalization", "name": "lexicalize, lexicalization", "type": "def", "alias": ["lexicalization", "lexicalize"], "shard": 2}, {"id": "def:metalanguage", "name": "metalanguage", "type": "def", "shard": 2}, {"id": "def:modification-predication-continuum", "name": "modification\u2013predication continuum", "type": "def", "shard": 2}, {"id": "def:modification-reference-continuum", "name": "modification\u2013reference continuum", "type": "def", "shard": 2}, {"id": "def:morphology", "name": "morphology", "type": "def", "shard": 2}, {"id": "def:morphosyntax", "name": "morphosyntax, morphosyntactic", "type": "def", "alias": ["morphosyntactic", "morphosyntax"], "shard": 2}, {"id": "def:object-language", "name": "object language", "type": "def", "shard": 2}, {"id": "def:ontological-categories", "name": "ontological categories", "type": "def", "shard": 2}, {"id": "def:ontology", "name": "ontology", "type": "def", "shard": 2}, {"id": "def:particularizing", "name": "particularizing", "type": "def", "shard": 2}, {"id": "def:preferred-argument-structure", "name": "preferred argument structure", "type": "def", "shard": 2}, {"id": "def:prenominal-integration", "name": "Prenominal Integration", "type": "def", "shard": 2}, {"id": "def:role", "name": "role", "type": "def", "alias": ["slot"], "shard": 2}, {"id": "def:semantic-classes", "name": "semantic classes", "type": "def", "shard": 3}, {"id": "def:semantic-map", "name": "semantic map", "type": "def", "shard": 3}, {"id": "def:semantic-map-model", "name": "semantic map model", "type": "def", "shard": 3}, {"id": "def:speech-act-situation", "name": "speech act situation", "type": "def", "shard": 3}, {"id": "def:structural-coding", "name": "structural coding", "type": "def", "shard": 3}, {"id": "def:syntax", "name": "syntax", "type": "def", "shard": 3}, {"id": "def:token-frequency", "name": "token frequency", "type": "def", "shard": 3}, {"id": "def:transitivity-hierarchy", "name": "Transitivity Hierarchy", "type": "def", "shard": 3}, {"id": "def:translation", "name": "translation", "type": "def", "alias": ["(free) translation", "free translation"], "shard": 3}, {"id": "def:typology", "name": "typology", "type": "def", "alias": ["(linguistic) typology", "linguistic typology"], "shard": 3}, {"id": "def:verbalization", "name": "verbalization", "type": "def", "alias": ["verbalization (of experience)", "verbalization of experience"], "shard": 3}, {"id": "def:word-class", "name": "word class", "type": "def", "alias": ["behavior", "distribution", "part of speech", "part(s) of speech", "parts of speech", "properties", "syntactic category"], "shard": 3}, {"id": "inf:aboutness", "name": "about, aboutness", "type": "inf", "alias": ["about", "aboutness"], "shard": 3}, {"id": "inf:accessibility", "name": "accessibility", "type": "inf", "alias": ["activation", "topic continuity"], "shard": 3}, {"id": "inf:active-referent", "name": "active referent", "type": "inf", "alias": ["active", "in focus"], "shard": 3}, {"id": "inf:actor", "name": "actor", "type": "inf", "shard": 3}, {"id": "inf:admodification", "name": "admodification", "type": "inf", "shard": 3}, {"id": "inf:alternative-proposition", "name": "alternative proposition", "type": "inf", "shard": 3}, {"id": "inf:alternative-question", "name": "alternative question", "type": "inf", "alias": ["alternative question (function)", "alternative question function"], "shard": 3}, {"id": "inf:anchor", "name": "anchor", "type": "inf", "shard": 3}, {"id": "inf:announcement", "name": "announcement", "type": "inf", "shard": 3}, {"id": "inf:appositive-modification", "name": "appositive modification", "type": "inf", "alias": ["nonrestrictive modification"], "shard": 3}, {"id": "inf:background-description", "name": "background description", "type": "inf", "shard": 3}, {"id": "inf:choosing-contrast", "name": "choosing contrast", "type": "inf", "shard": 3}, {"id": "inf:comparative-referent", "name": "comparative referent", "type": "inf", "shard": 3}, {"id": "inf:complementative", "name": "complementative", "type": "inf", "alias": ["predicative complement"], "shard": 3}, {"id": "inf:complex-figure", "name": "complex figure", "type": "inf", "alias": ["symmetric"], "shard": 3}, {"id": "inf:conditional-referent", "name": "conditional referent", "type": "inf", "shard": 3}, {"id": "inf:contrast", "name": "contrast", "type": "inf", "shard": 3}, {"id": "inf:coreference", "name": "coreference", "type": "inf", "alias": ["coreferential"], "shard": 3}, {"id": "inf:counterpresuppositional-contrast", "name": "counterpresuppositional contrast", "type": "inf", "shard": 3}, {"id": "inf:declarative", "name": "declarative", "type": "inf", "shard": 3}, {"id": "inf:different-subject", "name": "different-subject", "type": "inf", "alias": ["DS", "different subject"], "shard": 3}, {"id": "inf:direct-negation-referent", "name": "direct negation referent", "type": "inf", "shard": 3}, {"id": "inf:discourse-coherence", "name": "discourse coherence", "type": "inf", "alias": ["discourse relation"], "notOriginal": true}, {"id": "inf:discourse-connection", "name": "discourse connection", "type": "inf", "notOriginal": true}, {"id": "inf:discourse-deixis", "name": "discourse deixis", "type": "inf", "shard": 3}, {"id": "inf:discourse-structure", "name": "discourse structure", "type": "inf", "notOriginal": true}, {"id": "inf:entity-central", "name": "entity-central", "type": "inf", "shard": 3}, {"id": "inf:equational", "name": "equational", "type": "inf", "shard": 3}, {"id": "inf:event-central", "name": "event-central", "type": "inf", "shard": 3}, {"id": "inf:exclamative", "name": "exclamative", "type": "inf", "shard": 3}, {"id": "inf:expanding-contrast", "name": "expanding contrast", "type": "inf", "shard": 3}, {"id": "inf:explanation", "name": "explanation", "type": "inf", "shard": 3}, {"id": "inf:figure-ground", "name": "figure\u2013ground", "type": "inf", "alias": ["asymmetric"], "shard": 3}, {"id": "inf:focus", "name": "focus", "type": "inf", "shard": 3}, {"id": "inf:free-choice-referent", "name": "free choice referent", "type": "inf", "shard": 3}, {"id": "inf:generic-referent", "name": "generic referent", "type": "inf", "shard": 3}, {"id": "inf:high-accessibility", "name": "high accessibility", "type": "inf", "notOriginal": true}, {"id": "inf:high-topicality", "name": "high topicality", "type": "inf", "notOriginal": true}, {"id": "inf:highest-topicality", "name": "highest topicality", "type": "inf", "notOriginal": true}, {"id": "inf:identifiability", "name": "identifiability", "type": "inf", "shard": 3}, {"id": "inf:identificational", "name": "identificational", "type": "inf", "shard": 3}, {"id": "inf:identity-known", "name": "identity known", "type": "inf", "notOriginal": true}, {"id": "inf:identity-unknown", "name": "identity unknown", "type": "inf", "notOriginal": true}, {"id": "inf:imperative-hortative", "name": "imperative\u2013hortative", "type": "inf", "alias": ["hortative", "imperative"], "shard": 3}, {"id": "inf:inactive-referent", "name": "inactive referent", "type": "inf", "alias": ["inactive", "noncontaining inferrable"], "shard": 3}, {"id": "inf:indirect-negation-referent", "name": "indirect negation referent", "type": "inf", "shard": 3}, {"id": "inf:inferrable-referent", "name": "inferrable referent", "type": "inf", "alias": ["(containing) inferrable", "containing inferrable", "inferrable"], "shard": 3}, {"id": "inf:information-gap", "name": "information gap", "type": "inf", "shard": 3}, {"id": "inf:information-packaging", "name": "information packaging", "type": "inf", "alias": ["IP", "discourse function", "information structure"], "shard": 3}, {"id": "inf:information-question", "name": "information question", "type": "inf", "shard": 3}, {"id": "inf:information-question-response", "name": "information question response", "type": "inf", "alias": ["information (question) response", "information response"], "shard": 3}, {"id": "inf:information-status", "name": "information status", "type": "inf", "shard": 3}, {"id": "inf:interrogative", "name": "interrogative", "type": "inf", "alias": ["question"], "shard": 3}, {"id": "inf:interrogative-unit", "name": "interrogative unit", "type": "inf", "alias": ["interrogative (information) unit", "interrogative information unit"], "notOriginal": true}, {"id": "inf:interruption", "name": "interruption", "type": "inf", "shard": 3}, {"id": "inf:irrealis-referent", "name": "irrealis referent", "type": "inf", "alias": ["irrealis", "irrealis (referent)"], "shard": 3}, {"id": "inf:link", "name": "link", "type": "inf", "shard": 3}, {"id": "inf:listing-contrast", "name": "listing contrast", "type": "inf", "shard": 3}, {"id": "inf:logophoric-subject-identity", "name": "logophoric subject identity", "type": "inf", "notOriginal": true}, {"id": "inf:low-accessibility", "name": "low accessibility", "type": "inf", "notOriginal": true}, {"id": "inf:low-topicality", "name": "low topicality", "type": "inf", "notOriginal": true}, {"id": "inf:major-propositional-act", "name": "major propositional act", "type": "inf", "alias": ["(major) propositional act", "propositional act"], "shard": 3}, {"id": "inf:medium-accessibility", "name": "medium accessibility", "type": "inf", "notOriginal": true}, {"id": "inf:mid-topicality", "name": "mid topicality", "type": "inf", "notOriginal": true}, {"id": "inf:modification", "name": "modification", "type": "inf", "shard": 3}, {"id": "inf:negative-question-polarity-response", "name": "negative question polarity response", "type": "inf", "notOriginal": true}, {"id": "inf:non-high-topicality", "name": "non-high topicality", "type": "inf", "notOriginal": true}, {"id": "inf:non-low-topicality", "name": "non-low topicality", "type": "inf", "notOriginal": true}, {"id": "inf:nonspecific-referent", "name": "nonspecific referent", "type": "inf", "alias": ["(semantically) nonspecific (indefinite) referent", "nonspecific indefinite referent", "semantically nonspecific indefinite referent", "semantically nonspecific referent"], "shard": 3}, {"id": "inf:nonverbal-contrast", "name": "nonverbal contrast", "type": "inf", "shard": 3}, {"id": "inf:object-identity", "name": "object identity", "type": "inf", "notOriginal": true}, {"id": "inf:parallel-contrast", "name": "parallel contrast", "type": "inf", "shard": 3}, {"id": "inf:polarity-question", "name": "polarity question", "type": "inf", "alias": ["polarity question (function)", "polarity question function"], "shard": 3}, {"id": "inf:polarity-response", "name": "polarity response", "type": "inf", "alias": ["polarity answer"], "shard": 3}, {"id": "inf:poset", "name": "poset", "type": "inf", "shard": 3}, {"id": "inf:positive-question-polarity-response", "name": "positive question polarity response", "type": "inf", "notOriginal": true}, {"id": "inf:pragmatic-assertion", "name": "pragmatic assertion", "type": "inf", "alias": ["pragmatically asserted"], "shard": 3}, {"id": "inf:pragmatic-presupposition", "name": "pragmatic presupposition", "type": "inf", "alias": ["pragmatically non-asserted", "presuppose", "presupposition"], "shard": 3}, {"id": "inf:pragmatically-specific-referent", "name": "pragmatically specific referent", "type": "inf", "alias": ["pragmatically specific (indefinite) referent", "pragmatically specific indefinite referent"], "shard": 3}, {"id": "inf:predicate-identity", "name": "predicate identity", "type": "inf", "notOriginal": true}, {"id": "inf:predication", "name": "predication, predicational", "type": "inf", "alias": ["(object) predication", "comment", "object predication", "predication", "predicational"], "shard": 3}, {"id": "inf:presentational", "name": "presentational", "type": "inf", "shard": 3}, {"id": "inf:presupposed-open-proposition", "name": "presupposed open proposition", "type": "inf", "alias": ["POP"], "shard": 3}, {"id": "inf:prohibitive", "name": "prohibitive", "type": "inf", "shard": 3}, {"id": "inf:prop", "name": "prop", "type": "inf", "shard": 3}, {"id": "inf:question-referent", "name": "question referent", "type": "inf", "shard": 3}, {"id": "inf:reference", "name": "reference, referent", "type": "inf", "alias": ["reference", "referent"], "shard": 3}, {"id": "inf:referent-type-identity", "name": "referent type identity", "type": "inf", "notOriginal": true}, {"id": "inf:rejecting-contrast", "name": "rejecting contrast", "type": "inf", "shard": 3}, {"id": "inf:replacing-contrast", "name": "replacing contrast", "type": "inf", "shard": 3}, {"id": "inf:response", "name": "response", "type": "inf", "alias": ["answer"], "shard": 3}, {"id": "inf:restricting-contrast", "name": "restricting contrast", "type": "inf", "shard": 3}, {"id": "inf:restrictive-modification", "name": "restrictive modification", "type": "inf", "shard": 3}, {"id": "inf:same-subject", "name": "same-subject", "type": "inf", "alias": ["SS", "same subject", "subject identity"], "shard": 3}, {"id": "inf:selecting", "name": "selecting", "type": "inf", "shard": 3}, {"id": "inf:semantically-specific-referent", "name": "semantically specific referent", "type": "inf", "alias": ["pragmatically nonspecific (but semantically specific) (indefinite) referent", "pragmatically nonspecific but semantically specific indefinite referent", "pragmatically nonspecific but semantically specific referent", "pragmatically nonspecific indefinite referent", "pragmatically nonspecific referent"], "shard": 3}, {"id": "inf:semi-active-referent", "name": "semi-active referent", "type": "inf", "alias": ["accessible", "recognitional", "semi-active", "tracking"], "shard": 3}, {"id": "inf:setting", "name": "setting", "type": "inf", "shard": 3}, {"id": "inf:situating", "name": "situating", "type": "inf", "alias": ["anchoring"], "shard": 3}, {"id": "inf:specific-known-referent", "name": "specific known referent", "type": "inf", "shard": 3}, {"id": "inf:specific-unknown-referent", "name": "specific unknown referent", "type": "inf", "shard": 3}, {"id": "inf:speech-acts", "name": "speech acts", "type": "inf", "shard": 3}, {"id": "inf:subcategorizing", "name": "subcategorizing", "type": "inf", "alias": ["typifying"], "shard": 3}, {"id": "inf:theater-metaphor", "name": "theater metaphor", "type": "inf", "shard": 3}, {"id": "inf:thetic", "name": "thetic", "type": "inf", "alias": ["all new"], "shard": 3}, {"id": "inf:token-identity", "name": "token identity", "type": "inf", "shard": 3}, {"id": "inf:topic-comment", "name": "topic\u2013comment", "type": "inf", "shard": 3}, {"id": "inf:topicality", "name": "topicality, topical", "type": "inf", "alias": ["salience", "salient", "topical", "topicality"], "shard": 3}, {"id": "inf:trigger", "name": "trigger", "type": "inf", "shard": 3}, {"id": "inf:type-identifiable", "name": "type identifiable", "type": "inf", "shard": 4}, {"id": "inf:type-identity", "name": "type identity", "type": "inf", "shard": 4}, {"id": "inf:verbal-contrast", "name": "verbal contrast", "type": "inf", "shard": 4}, {"id": "sem:a-role", "name": "A role", "type": "sem", "alias": ["A", "A (role)"], "shard": 4}, {"id": "sem:achievement", "name": "achievement", "type": "sem", "shard": 4}, {"id": "sem:action-concept", "name": "action concept", "type": "sem", "alias": ["action", "action (concept)"], "shard": 4}, {"id": "sem:addition", "name": "addition", "type": "sem", "notOriginal": true}, {"id": "sem:additive", "name": "additive", "type": "sem", "shard": 4}, {"id": "sem:addressee", "name": "addressee", "type": "sem", "notOriginal": true}, {"id": "sem:affectee", "name": "affectee", "type": "sem", "notOriginal": true}, {"id": "sem:affecting", "name": "affecting", "type": "sem", "notOriginal": true}, {"id": "sem:age", "name": "age", "type": "sem", "notOriginal": true}, {"id": "sem:agent", "name": "agent", "type": "sem", "shard": 4}, {"id": "sem:agentive-change-of-state-event", "name": "agentive change of state event", "type": "sem", "shard": 4}, {"id": "sem:agentive-experience-event", "name": "agentive experience event", "type": "sem", "alias": ["agentive experience", "agentive experience (event)"], "notOriginal": true}, {"id": "sem:agentive-ingestion-event", "name": "agentive ingestion event", "type": "sem", "alias": ["agentive ingestion", "agentive ingestion (event)"], "notOriginal": true}, {"id": "sem:amount", "name": "amount", "type": "sem", "notOriginal": true}, {"id": "sem:animacy", "name": "animacy", "type": "sem", "notOriginal": true}, {"id": "sem:animate", "name": "animate", "type": "sem", "alias": ["(nonhuman) animate", "nonhuman animate"], "shard": 4}, {"id": "sem:antecedent-role", "name": "antecedent role", "type": "sem", "shard": 4}, {"id": "sem:anterior", "name": "anterior", "type": "sem", "shard": 4}, {"id": "sem:apodosis", "name": "apodosis", "type": "sem", "alias": ["consequent"], "shard": 4}, {"id": "sem:application-event", "name": "application event", "type": "sem", "alias": ["application", "application (event)", "putting event"], "shard": 4}, {"id": "sem:apprehensional", "name": "apprehensional", "type": "sem", "shard": 4}, {"id": "sem:arrangement", "name": "arrangement", "type": "sem", "notOriginal": true}, {"id": "sem:arrival", "name": "arrival", "type": "sem", "shard": 4}, {"id": "sem:aspect", "name": "aspect", "type": "sem", "alias": ["aspectual structure"], "shard": 4}, {"id": "sem:atelic", "name": "atelic", "type": "sem", "shard": 4}, {"id": "sem:attending", "name": "attending", "type": "sem", "notOriginal": true}, {"id": "sem:avalent", "name": "avalent", "type": "sem", "notOriginal": true}, {"id": "sem:base-event", "name": "base event", "type": "sem", "shard": 4}, {"id": "sem:beneficiary", "name": "beneficiary", "type": "sem", "shard": 4}, {"id": "sem:bivalent", "name": "bivalent", "type": "sem", "shard": 4}, {"id": "sem:bodily-action", "name": "bodily action", "type": "sem", "shard": 4}, {"id": "sem:bodily-motion-event", "name": "bodily motion event", "type": "sem", "shard": 4}, {"id": "sem:body-care-event", "name": "body care event", "type": "sem", "alias": ["body care", "body care (event)", "grooming event"], "shard": 4}, {"id": "sem:body-part-relation", "name": "body part relation", "type": "sem", "alias": ["body part", "body part (relation)"], "shard": 4}, {"id": "sem:body-position-event", "name": "body position event", "type": "sem", "alias": ["locative stative event", "maintain position event", "posture event"], "shard": 4}, {"id": "sem:cardinal-numeral", "name": "cardinal numeral", "type": "sem", "notOriginal": true}, {"id": "sem:categorical", "name": "categorical", "type": "sem", "notOriginal": true}, {"id": "sem:causal", "name": "causal", "type": "sem", "shard": 4}, {"id": "sem:causal-chain", "name": "causal chain", "type": "sem", "alias": ["transmission of force"], "shard": 4}, {"id": "sem:causal-chain-profile", "name": "causal chain profile", "type": "sem", "notOriginal": true}, {"id": "sem:causal-control", "name": "causal control", "type": "sem", "notOriginal": true}, {"id": "sem:causal-cyclicality", "name": "causal cyclicality", "type": "sem", "notOriginal": true}, {"id": "sem:causal-directionality", "name": "causal directionality", "type": "sem", "notOriginal": true}, {"id": "sem:causal-directness", "name": "causal directness", "type": "sem", "notOriginal": true}, {"id": "sem:causal-link", "name": "causal link", "type": "sem", "notOriginal": true}, {"id": "sem:causal-structure", "name": "causal structure", "type": "sem", "alias": ["force dynamics"], "shard": 4}, {"id": "sem:causative-event", "name": "causative event", "type": "sem", "shard": 4}, {"id": "sem:cause", "name": "cause", "type": "sem", "shard": 4}, {"id": "sem:caused-motion", "name": "caused motion", "type": "sem", "notOriginal": true}, {"id": "sem:causee", "name": "causee", "type": "sem", "shard": 4}, {"id": "sem:causer", "name": "causer", "type": "sem", "shard": 4}, {"id": "sem:central-participant", "name": "central participant", "type": "sem", "shard": 4}, {"id": "sem:chaining", "name": "chaining", "type": "sem", "notOriginal": true}, {"id": "sem:change-in-position-event", "name": "change in position event", "type": "sem", "alias": ["assume position event", "change in (body) position event", "change in body position event", "change in posture event"], "shard": 4}, {"id": "sem:change-of-state-event", "name": "change of state event", "type": "sem", "alias": ["COS", "COS (event)", "COS event", "change of state", "change of state (event)"], "shard": 4}, {"id": "sem:change-type", "name": "change type", "type": "sem", "notOriginal": true}, {"id": "sem:co-actor", "name": "co-actor", "type": "sem", "notOriginal": true}, {"id": "sem:cognition-event", "name": "cognition event", "type": "sem", "alias": ["cognition", "cognition (event)"], "shard": 4}, {"id": "sem:collective", "name": "collective", "type": "sem", "notOriginal": true}, {"id": "sem:color", "name": "color", "type": "sem", "notOriginal": true}, {"id": "sem:combining-event", "name": "combining event", "type": "sem", "alias": ["combining", "combining (event)"], "shard": 4}, {"id": "sem:comitative", "name": "comitative", "type": "sem", "shard": 4}, {"id": "sem:commentative-event", "name": "commentative event", "type": "sem", "alias": ["commentative", "commentative (event)"], "shard": 4}, {"id": "sem:communication-event", "name": "communication event", "type": "sem", "notOriginal": true}, {"id": "sem:comparative-conditional-relation", "name": "comparative conditional relation", "type": "sem", "alias": ["comparative conditional", "comparative conditional (relation)"], "shard": 4}, {"id": "sem:comparative-degree", "name": "comparative degree", "type": "sem", "notOriginal": true}, {"id": "sem:comparative-relation", "name": "comparative relation", "type": "sem", "alias": ["comparative", "comparative (relation)"], "notOriginal": true}, {"id": "sem:comparee", "name": "comparee", "type": "sem", "shard": 4}, {"id": "sem:completive", "name": "completive", "type": "sem", "notOriginal": true}, {"id": "sem:concessive-conditional-relation", "name": "concessive conditional relation", "type": "sem", "alias": ["conditional concessive relation"], "shard": 4}, {"id": "sem:concessive-relation", "name": "concessive relation", "type": "sem", "alias": ["concessive", "concessive (relation)"], "shard": 4}, {"id": "sem:concomitant-role", "name": "concomitant role", "type": "sem", "shard": 4}, {"id": "sem:conditional-relation", "name": "conditional relation", "type": "sem", "alias": ["conditional", "conditional (relation)"], "shard": 4}, {"id": "sem:consecutive", "name": "consecutive", "type": "sem", "shard": 4}, {"id": "sem:contact-by-impact-event", "name": "contact by impact event", "type": "sem", "alias": ["contact by impact", "contact by impact (event)"], "shard": 4}, {"id": "sem:contact-event", "name": "contact event", "type": "sem", "notOriginal": true}, {"id": "sem:container", "name": "container", "type": "sem", "notOriginal": true}, {"id": "sem:content-causal-relation", "name": "content causal relation", "type": "sem", "shard": 4}, {"id": "sem:contextual", "name": "contextual", "type": "sem", "alias": ["deictic"], "shard": 4}, {"id": "sem:continuative", "name": "continuative", "type": "sem", "alias": ["sem:preservative"], "notOriginal": true}, {"id": "sem:controlled", "name": "controlled", "type": "sem", "notOriginal": true}, {"id": "sem:creation-event", "name": "creation event", "type": "sem", "notOriginal": true}, {"id": "sem:damage-event", "name": "damage event", "type": "sem", "shard": 4}, {"id": "sem:degree", "name": "degree", "type": "sem", "shard": 4}, {"id": "sem:deontic-modality", "name": "deontic modality", "type": "sem", "shard": 4}, {"id": "sem:departure", "name": "departure", "type": "sem", "shard": 4}, {"id": "sem:dependent-time-reference", "name": "dependent time reference", "type": "sem", "shard": 4}, {"id": "sem:desiderative-event", "name": "desiderative event", "type": "sem", "alias": ["desiderative", "desiderative (event)"], "shard": 4}, {"id": "sem:dimension", "name": "dimension", "type": "sem", "notOriginal": true}, {"id": "sem:direct-causation", "name": "direct causation", "type": "sem", "notOriginal": true}, {"id": "sem:directed-change", "name": "directed change", "type": "sem", "shard": 4}, {"id": "sem:distal", "name": "distal", "type": "sem", "alias": ["distal (deixis)", "distal deixis"], "shard": 4}, {"id": "sem:distributive-quantifier", "name": "distributive quantifier", "type": "sem", "notOriginal": true}, {"id": "sem:downtoning", "name": "downtoning", "type": "sem", "notOriginal": true}, {"id": "sem:durative", "name": "durative", "type": "sem", "shard": 4}, {"id": "sem:durativity", "name": "durativity", "type": "sem", "notOriginal": true}, {"id": "sem:dynamic", "name": "dynamic", "type": "sem", "shard": 4}, {"id": "sem:emotion-event", "name": "emotion event", "type": "sem", "shard": 4}, {"id": "sem:endpoint", "name": "endpoint", "type": "sem", "shard": 4}, {"id": "sem:entity", "name": "entity", "type": "sem", "alias": ["entities"], "shard": 4}, {"id": "sem:epistemic-causal-relation", "name": "epistemic causal relation", "type": "sem", "shard": 4}, {"id": "sem:epistemic-modality", "name": "epistemic modality", "type": "sem", "alias": ["epistemic modal", "epistemic modal(ity)"], "shard": 4}, {"id": "sem:epistemic-stance", "name": "epistemic stance", "type": "sem", "alias": ["hypotheticality"], "shard": 4}, {"id": "sem:equative-relation", "name": "equative relation", "type": "sem", "notOriginal": true}, {"id": "sem:evaluative-event", "name": "evaluative event", "type": "sem", "alias": ["evaluative", "evaluative (event)"], "shard": 4}, {"id": "sem:event", "name": "event", "type": "sem", "alias": ["SOA", "event (concept)", "event concept", "eventuality", "situation", "state of affairs"], "shard": 4}, {"id": "sem:event-oriented", "name": "event-oriented", "type": "sem", "shard": 4}, {"id": "sem:event-relation", "name": "event relation", "type": "sem", "notOriginal": true}, {"id": "sem:eventive-participant-event", "name": "eventive participant event", "type": "sem", "notOriginal": true}, {"id": "sem:eventive-perception-event", "name": "eventive perception event", "type": "sem", "notOriginal": true}, {"id": "sem:evidentiality", "name": "evidentiality", "type": "sem", "shard": 4}, {"id": "sem:exclusive-disjunction", "name": "exclusive disjunction", "type": "sem", "notOriginal": true}, {"id": "sem:exhaustive-list", "name": "exhaustive list", "type": "sem", "notOriginal": true}, {"id": "sem:existence-event", "name": "existence event", "type": "sem", "alias": ["existential event"], "shard": 4}, {"id": "sem:experience", "name": "experience", "type": "sem", "notOriginal": true}, {"id": "sem:experiencer", "name": "experiencer", "type": "sem", "shard": 4}, {"id": "sem:experiential-event", "name": "experiential event", "type": "sem", "shard": 4}, {"id": "sem:expertum", "name": "expertum", "type": "sem", "shard": 4}, {"id": "sem:external-cause", "name": "external cause", "type": "sem", "notOriginal": true}, {"id": "sem:extroverted", "name": "extroverted", "type": "sem", "notOriginal": true}, {"id": "sem:fearing-event", "name": "fearing event", "type": "sem", "shard": 4}, {"id": "sem:figure", "name": "figure", "type": "sem", "shard": 4}, {"id": "sem:figure-ground-spatial-relation", "name": "figure-ground spatial relation", "type": "sem", "alias": ["figure\u2013ground spatial relation", "location relation", "spatial figure\u2013ground relation"], "shard": 4}, {"id": "sem:first-person", "name": "first person", "type": "sem", "alias": ["1st person"], "notOriginal": true}, {"id": "sem:force", "name": "force", "type": "sem", "shard": 4}, {"id": "sem:future-oriented", "name": "future-oriented", "type": "sem", "shard": 4}, {"id": "sem:gender-class", "name": "gender\u2013class", "type": "sem", "alias": ["class", "gender"], "shard": 4}, {"id": "sem:generic-conditional-relation", "name": "generic conditional relation", "type": "sem", "alias": ["generic conditional", "generic conditional (relation)"], "shard": 4}, {"id": "sem:gradable-predicative-scale", "name": "gradable predicative scale", "type": "sem", "alias": ["(gradable) predicative scale", "predicative scale"], "shard": 4}, {"id": "sem:gradient", "name": "gradient", "type": "sem", "notOriginal": true}, {"id": "sem:ground", "name": "ground", "type": "sem", "shard": 4}, {"id": "sem:group", "name": "group", "type": "sem", "notOriginal": true}, {"id": "sem:hearer", "name": "hearer", "type": "sem", "notOriginal": true}, {"id": "sem:hoping-event", "name": "hoping event", "type": "sem", "alias": ["hoping", "hoping (event)"], "shard": 4}, {"id": "sem:human", "name": "human", "type": "sem", "shard": 4}, {"id": "sem:human-propensity", "name": "human propensity", "type": "sem", "notOriginal": true}, {"id": "sem:hypothetical", "name": "hypothetical", "type": "sem", "alias": ["non-factive"], "shard": 4}, {"id": "sem:identity", "name": "identity", "type": "sem", "notOriginal": true}, {"id": "sem:inanimate", "name": "inanimate", "type": "sem", "shard": 4}, {"id": "sem:inceptive", "name": "inceptive", "type": "sem", "notOriginal": true}, {"id": "sem:inclusive-disjunction", "name": "inclusive disjunction", "type": "sem", "notOriginal": true}, {"id": "sem:independent-time-reference", "name": "independent time reference", "type": "sem", "shard": 4}, {"id": "sem:indirect-causation", "name": "indirect causation", "type": "sem", "notOriginal": true}, {"id": "sem:ingestion-event", "name": "ingestion event", "type": "sem", "shard": 4}, {"id": "sem:initiator", "name": "initiator", "type": "sem", "shard": 4}, {"id": "sem:instrument", "name": "instrument", "type": "sem", "shard": 4}, {"id": "sem:intensifying", "name": "intensifying", "type": "sem", "notOriginal": true}, {"id": "sem:interaction-event", "name": "interaction event", "type": "sem", "shard": 4}, {"id": "sem:introverted", "name": "introverted", "type": "sem", "notOriginal": true}, {"id": "sem:killing-injuring-event", "name": "killing/injuring event", "type": "sem", "alias": ["injuring event", "killing event"], "shard": 4}, {"id": "sem:kinship-relation", "name": "kinship relation", "type": "sem", "alias": ["kinship", "kinship (relation)"], "shard": 4}, {"id": "sem:knowledge-event", "name": "knowledge event", "type": "sem", "alias": ["knowledge", "knowledge (event)"], "shard": 4}, {"id": "sem:less-affected-p", "name": "less affected P", "type": "sem", "alias": ["LAP"], "shard": 4}, {"id": "sem:less-individuated-p", "name": "less individuated P", "type": "sem", "alias": ["LIP"], "shard": 4}, {"id": "sem:let-alone-relation", "name": "let alone relation", "type": "sem", "notOriginal": true}, {"id": "sem:maleficiary", "name": "maleficiary", "type": "sem", "shard": 4}, {"id": "sem:manipulative-event", "name": "manipulative event", "type": "sem", "alias": ["manipulative", "manipulative (event)"], "shard": 4}, {"id": "sem:manner", "name": "manner", "type": "sem", "notOriginal": true}, {"id": "sem:manner-of-motion-event", "name": "manner of motion event", "type": "sem", "alias": ["manner of motion", "manner of motion (event)"], "shard": 4}, {"id": "sem:manner-profile", "name": "manner profile", "type": "sem", "notOriginal": true}, {"id": "sem:material", "name": "material", "type": "sem", "notOriginal": true}, {"id": "sem:meaning", "name": "meaning", "type": "sem", "alias": ["information", "information (content)", "information content", "semantic", "semantic (content)", "semantic content"], "shard": 5}, {"id": "sem:means", "name": "means", "type": "sem", "alias": ["positive circumstantial"], "shard": 5}, {"id": "sem:measure", "name": "measure", "type": "sem", "notOriginal": true}, {"id": "sem:measuring", "name": "measuring", "type": "sem", "notOriginal": true}, {"id": "sem:mensural-concept", "name": "mensural concept", "type": "sem", "notOriginal": true}, {"id": "sem:mental-space", "name": "mental space", "type": "sem", "shard": 5}, {"id": "sem:message", "name": "message", "type": "sem", "notOriginal": true}, {"id": "sem:mirative", "name": "mirative", "type": "sem", "shard": 5}, {"id": "sem:modality", "name": "modality", "type": "sem", "shard": 5}, {"id": "sem:monovalent", "name": "monovalent", "type": "sem", "shard": 5}, {"id": "sem:motion-event", "name": "motion event", "type": "sem", "alias": ["motion", "motion (event)"], "shard": 5}, {"id": "sem:necessary-participant-sharing", "name": "necessary participant sharing", "type": "sem", "alias": ["necessarily shared participant"], "shard": 5}, {"id": "sem:negative-circumstantial", "name": "negative circumstantial", "type": "sem", "shard": 5}, {"id": "sem:negative-epistemic-stance", "name": "negative epistemic stance", "type": "sem", "shard": 5}, {"id": "sem:negative-polarity", "name": "negative polarity", "type": "sem", "alias": ["negative", "negative (polarity)"], "shard": 5}, {"id": "sem:neutral-epistemic-stance", "name": "neutral epistemic stance", "type": "sem", "shard": 5}, {"id": "sem:non-exhaustive-list", "name": "non-exhaustive list", "type": "sem", "notOriginal": true}, {"id": "sem:nonrelational", "name": "nonrelational", "type": "sem", "shard": 5}, {"id": "sem:number", "name": "number", "type": "sem", "shard": 5}, {"id": "sem:numeral", "name": "numeral", "type": "sem", "shard": 5}, {"id": "sem:object-concept", "name": "object concept", "type": "sem", "shard": 5}, {"id": "sem:objective", "name": "objective", "type": "sem", "shard": 5}, {"id": "sem:occupant", "name": "occupant", "type": "sem", "notOriginal": true}, {"id": "sem:ordinal-numeral", "name": "ordinal numeral", "type": "sem", "notOriginal": true}, {"id": "sem:orientation", "name": "orientation", "type": "sem", "notOriginal": true}, {"id": "sem:other", "name": "other", "type": "sem", "notOriginal": true}, {"id": "sem:ownership", "name": "ownership", "type": "sem", "alias": ["ownership (relation)", "ownership relation"], "shard": 5}, {"id": "sem:p-role", "name": "P role", "type": "sem", "alias": ["O", "O (role)", "O role", "P", "P (role)"], "shard": 5}, {"id": "sem:part-whole-relation", "name": "part\u2013whole relation", "type": "sem", "alias": ["part\u2013whole", "part\u2013whole (relation)"], "shard": 5}, {"id": "sem:participant-oriented", "name": "participant-oriented", "type": "sem", "shard": 5}, {"id": "sem:participant-role", "name": "participant role", "type": "sem", "alias": ["Frame Element", "microrole", "participant"], "shard": 5}, {"id": "sem:passing", "name": "passing", "type": "sem", "shard": 5}, {"id": "sem:path-event", "name": "path event", "type": "sem", "alias": ["path", "path of motion", "path of motion event"], "shard": 5}, {"id": "sem:patient", "name": "patient", "type": "sem", "shard": 5}, {"id": "sem:perception-event", "name": "perception event", "type": "sem", "alias": ["perception", "perception (event)"], "shard": 5}, {"id": "sem:peripheral-participant", "name": "peripheral participant", "type": "sem", "shard": 5}, {"id": "sem:persistent", "name": "persistent", "type": "sem", "alias": ["stable"], "shard": 5}, {"id": "sem:person", "name": "person", "type": "sem", "notOriginal": true}, {"id": "sem:person-deixis", "name": "person deixis", "type": "sem", "shard": 5}, {"id": "sem:phasal-aspect", "name": "phasal aspect", "type": "sem", "shard": 5}, {"id": "sem:physical-property", "name": "physical property", "type": "sem", "notOriginal": true}, {"id": "sem:piece", "name": "piece", "type": "sem", "notOriginal": true}, {"id": "sem:place", "name": "place", "type": "sem", "notOriginal": true}, {"id": "sem:polarity", "name": "polarity", "type": "sem", "shard": 5}, {"id": "sem:positive-epistemic-stance", "name": "positive epistemic stance", "type": "sem", "alias": ["factive"], "shard": 5}, {"id": "sem:positive-polarity", "name": "positive polarity", "type": "sem", "alias": ["positive", "positive (polarity)"], "shard": 5}, {"id": "sem:possession", "name": "possession", "type": "sem", "alias": ["possession (relation)", "possession relation", "possessive relation"], "shard": 5}, {"id": "sem:possessor", "name": "possessor", "type": "sem", "alias": ["possessor role"], "shard": 5}, {"id": "sem:possessum", "name": "possessum", "type": "sem", "alias": ["possessed role", "possessee role", "possessum role"], "shard": 5}, {"id": "sem:posterior", "name": "posterior", "type": "sem", "alias": ["sequential"], "shard": 5}, {"id": "sem:pretense-event", "name": "pretense event", "type": "sem", "alias": ["pretence event"], "shard": 5}, {"id": "sem:property-concept", "name": "property concept", "type": "sem", "alias": ["property", "quality"], "shard": 5}, {"id": "sem:proportional-quantifier", "name": "proportional quantifier", "type": "sem", "notOriginal": true}, {"id": "sem:proposition", "name": "proposition", "type": "sem", "shard": 5}, {"id": "sem:propositional-attitude-event", "name": "propositional attitude event", "type": "sem", "alias": ["propositional attitude", "propositional attitude (event)"], "shard": 5}, {"id": "sem:propositional-content", "name": "propositional content", "type": "sem", "shard": 5}, {"id": "sem:protasis", "name": "protasis", "type": "sem", "shard": 5}, {"id": "sem:proximal", "name": "proximal", "type": "sem", "alias": ["proximal (deixis)", "proximal deixis"], "shard": 5}, {"id": "sem:punctual", "name": "punctual", "type": "sem", "shard": 5}, {"id": "sem:purpose", "name": "purpose", "type": "sem", "shard": 5}, {"id": "sem:pursuit-event", "name": "pursuit event", "type": "sem", "shard": 5}, {"id": "sem:qualitative-event", "name": "qualitative event", "type": "sem", "notOriginal": true}, {"id": "sem:quantitative-relation", "name": "quantitative relation", "type": "sem", "notOriginal": true}, {"id": "sem:quantity", "name": "quantity", "type": "sem", "notOriginal": true}, {"id": "sem:recipient", "name": "recipient", "type": "sem", "alias": ["G", "G role", "R", "R role"], "shard": 5}, {"id": "sem:reciprocal", "name": "reciprocal", "type": "sem", "notOriginal": true}, {"id": "sem:reference-point", "name": "reference point", "type": "sem", "shard": 5}, {"id": "sem:reflexive", "name": "reflexive", "type": "sem", "notOriginal": true}, {"id": "sem:relational", "name": "relational", "type": "sem", "shard": 5}, {"id": "sem:relationality", "name": "relationality", "type": "sem", "notOriginal": true}, {"id": "sem:removal-event", "name": "removal event", "type": "sem", "alias": ["removal", "removal (event)"], "shard": 5}, {"id": "sem:result-profile", "name": "result profile", "type": "sem", "notOriginal": true}, {"id": "sem:s-role", "name": "S role", "type": "sem", "alias": ["S", "S (role)"], "shard": 5}, {"id": "sem:scalar-model", "name": "scalar model", "type": "sem", "shard": 5}, {"id": "sem:scale", "name": "scale", "type": "sem", "notOriginal": true}, {"id": "sem:second-person", "name": "second person", "type": "sem", "alias": ["2nd person"], "notOriginal": true}, {"id": "sem:semantic-role", "name": "semantic role", "type": "sem", "alias": ["case", "thematic role"], "shard": 5}, {"id": "sem:sensation-event", "name": "sensation event", "type": "sem", "alias": ["(bodily) sensation event", "bodily sensation event"], "shard": 5}, {"id": "sem:set-member", "name": "set member", "type": "sem", "notOriginal": true}, {"id": "sem:shape", "name": "shape", "type": "sem", "notOriginal": true}, {"id": "sem:simple-contrast", "name": "simple contrast", "type": "sem", "shard": 5}, {"id": "sem:simultaneous", "name": "simultaneous", "type": "sem", "alias": ["overlap"], "shard": 5}, {"id": "sem:social-event", "name": "social event", "type": "sem", "notOriginal": true}, {"id": "sem:social-role", "name": "social role", "type": "sem", "notOriginal": true}, {"id": "sem:social-role-event", "name": "social role event", "type": "sem", "notOriginal": true}, {"id": "sem:sociative-causation", "name": "sociative causation", "type": "sem", "notOriginal": true}, {"id": "sem:spatial-deixis", "name": "spatial deixis", "type": "sem", "alias": ["(spatial) deixis", "deixis", "situational"], "shard": 5}, {"id": "sem:spatial-event", "name": "spatial event", "type": "sem", "notOriginal": true}, {"id": "sem:speaker", "name": "speaker", "type": "sem", "notOriginal": true}, {"id": "sem:species", "name": "species", "type": "sem", "notOriginal": true}, {"id": "sem:speech-act-causal-relation", "name": "speech act causal relation", "type": "sem", "shard": 5}, {"id": "sem:spontaneous", "name": "spontaneous", "type": "sem", "notOriginal": true}, {"id": "sem:standard", "name": "standard", "type": "sem", "shard": 5}, {"id": "sem:state", "name": "state", "type": "sem", "alias": ["state (concept)", "state concept", "temporary state", "transitory state"], "shard": 5}, {"id": "sem:stative", "name": "stative", "type": "sem", "shard": 5}, {"id": "sem:stativity", "name": "stativity", "type": "sem", "notOriginal": true}, {"id": "sem:stimulus", "name": "stimulus", "type": "sem", "shard": 5}, {"id": "sem:subjective", "name": "subjective", "type": "sem", "shard": 5}, {"id": "sem:subsequent-role", "name": "subsequent role", "type": "sem", "shard": 5}, {"id": "sem:substitution", "name": "substitution", "type": "sem", "notOriginal": true}, {"id": "sem:substitutive", "name": "substitutive", "type": "sem", "shard": 5}, {"id": "sem:subtraction", "name": "subtraction", "type": "sem", "notOriginal": true}, {"id": "sem:subtractive", "name": "subtractive", "type": "sem", "shard": 5}, {"id": "sem:superlative-degree", "name": "superlative degree", "type": "sem", "notOriginal": true}, {"id": "sem:tamp", "name": "TAMP", "type": "sem", "shard": 5}, {"id": "sem:telic", "name": "telic", "type": "sem", "alias": ["telic (event)", "telic event"], "shard": 5}, {"id": "sem:telicity", "name": "telicity", "type": "sem", "notOriginal": true}, {"id": "sem:tense", "name": "tense", "type": "sem", "shard": 5}, {"id": "sem:terminative", "name": "terminative", "type": "sem", "notOriginal": true}, {"id": "sem:theme", "name": "theme", "type": "sem", "alias": ["T", "T role"], "shard": 5}, {"id": "sem:thing", "name": "thing", "type": "sem", "notOriginal": true}, {"id": "sem:third-person", "name": "third person", "type": "sem", "alias": ["3rd person"], "notOriginal": true}, {"id": "sem:time", "name": "time", "type": "sem", "notOriginal": true}, {"id": "sem:time-reference", "name": "time reference", "type": "sem", "notOriginal": true}, {"id": "sem:time-stability", "name": "time-stability", "type": "sem", "shard": 5}, {"id": "sem:token", "name": "token", "type": "sem", "alias": ["individual", "instance"], "shard": 5}, {"id": "sem:topic", "name": "topic", "type": "sem", "notOriginal": true}, {"id": "sem:transfer-of-possession-event", "name": "transfer of possession event", "type": "sem", "shard": 5}, {"id": "sem:transitoriness", "name": "transitoriness", "type": "sem", "notOriginal": true}, {"id": "sem:transitory", "name": "transitory", "type": "sem", "shard": 5}, {"id": "sem:trivalent", "name": "trivalent", "type": "sem", "shard": 5}, {"id": "sem:type", "name": "type", "type": "sem", "alias": ["category"], "shard": 5}, {"id": "sem:uncontrolled", "name": "uncontrolled", "type": "sem", "notOriginal": true}, {"id": "sem:undergoer", "name": "undergoer", "type": "sem", "notOriginal": true}, {"id": "sem:undirected-change", "name": "undirected change", "type": "sem", "shard": 5}, {"id": "sem:unexpected-co-occurrence", "name": "unexpected co-occurrence", "type": "sem", "shard": 5}, {"id": "sem:utterance-event", "name": "utterance event", "type": "sem", "alias": ["utterance", "utterance (event)"], "shard": 5}, {"id": "sem:vague-numeral", "name": "vague numeral", "type": "sem", "notOriginal": true}, {"id": "sem:valency", "name": "valency, valency class", "type": "sem", "alias": ["valency", "valency class"], "shard": 5}, {"id": "sem:value", "name": "value", "type": "sem", "notOriginal": true}, {"id": "sem:weather-event", "name": "weather event", "type": "sem", "shard": 5}, {"id": "sem:wishing-event", "name": "wishing event", "type": "sem", "shard": 5}, {"id": "str:a-not-a", "name": "A\u2013not-A", "type": "str", "shard": 5}, {"id": "str:absolute-deranking-system", "name": "absolute deranking system", "type": "str", "shard": 5}, {"id": "str:absolutive-category", "name": "absolutive category", "type": "str", "shard": 5}, {"id": "str:accusative-alignment", "name": "accusative alignment", "type": "str", "alias": ["accusative alignment (system)", "accusative alignment system"], "shard": 5}, {"id": "str:accusative-category", "name": "accusative category", "type": "str", "shard": 5}, {"id": "str:action-nominal", "name": "action nominal", "type": "str", "shard": 5}, {"id": "str:active-alignment", "name": "active alignment", "type": "str", "alias": ["active alignment (system)", "active alignment system"], "shard": 5}, {"id": "str:active-category", "name": "active category", "type": "str", "alias": ["actor category", "agentive", "agentive (category)", "agentive category"], "shard": 5}, {"id": "str:actual-information-packaging-strategy", "name": "actual information packaging strategy", "type": "str", "alias": ["actual IP strategy", "actual information packaging", "actual information packaging (strategy)"], "shard": 5}, {"id": "str:adjective-impersonal-strategy", "name": "adjective impersonal strategy", "type": "str", "shard": 5}, {"id": "str:adjective-personal-strategy", "name": "adjective personal strategy", "type": "str", "shard": 5}, {"id": "str:adjoined-strategy", "name": "adjoined strategy", "type": "str", "alias": ["adjoined", "adjoined (strategy)"], "shard": 5}, {"id": "str:adnominal-possessive-strategy", "name": "adnominal possessive strategy", "type": "str", "alias": ["adnominal possessive", "adnominal possessive (strategy)", "genitive strategy"], "shard": 5}, {"id": "str:adposition", "name": "adposition", "type": "str", "shard": 5}, {"id": "str:adpositional-personal-strategy", "name": "adpositional personal strategy", "type": "str", "shard": 5}, {"id": "str:adpositional-strategy", "name": "adpositional strategy", "type": "str", "shard": 5}, {"id": "str:adverbial-clause-strategy", "name": "adverbial clause strategy", "type": "str", "notOriginal": true}, {"id": "str:adverbial-strategy", "name": "adverbial strategy", "type": "str", "shard": 5}, {"id": "str:adverbializer", "name": "adverbializer", "type": "str", "shard": 6}, {"id": "str:affixal-negation", "name": "affixal negation", "type": "str", "notOriginal": true}, {"id": "str:affixation", "name": "affixation", "type": "str", "shard": 6}, {"id": "str:agree-disagree-alignment", "name": "agree/disagree alignment", "type": "str", "alias": ["agree/disagree alignment (strategy)", "agree/disagree alignment strategy"], "shard": 6}, {"id": "str:alignment-system", "name": "alignment system", "type": "str", "alias": ["alignment", "alignment (strategy)", "alignment strategy"], "shard": 6}, {"id": "str:allative-comparative", "name": "allative comparative", "type": "str", "shard": 6}, {"id": "str:alternative-concessive-conditional-strategy", "name": "alternative concessive conditional strategy", "type": "str", "shard": 6}, {"id": "str:anchoring-nominal-strategy", "name": "anchoring nominal strategy", "type": "str", "notOriginal": true}, {"id": "str:animacy-based-split-ergativity", "name": "animacy-based split ergativity", "type": "str", "shard": 6}, {"id": "str:anterior-deranking", "name": "anterior deranking", "type": "str", "shard": 6}, {"id": "str:anterior-zero", "name": "anterior zero", "type": "str", "notOriginal": true}, {"id": "str:antipassive-alignment", "name": "antipassive alignment", "type": "str", "notOriginal": true}, {"id": "str:applicative-alignment", "name": "applicative alignment", "type": "str", "notOriginal": true, "shard": 6}, {"id": "str:associative-equative", "name": "associative equative", "type": "str", "shard": 6}, {"id": "str:associative-strategy", "name": "associative strategy", "type": "str", "notOriginal": true}, {"id": "str:asyndetic", "name": "asyndetic", "type": "str", "shard": 6}, {"id": "str:balancing", "name": "balanced, balancing", "type": "str", "alias": ["balanced", "balancing"], "shard": 6}, {"id": "str:bare-verb-stem", "name": "bare verb stem", "type": "str", "shard": 6}, {"id": "str:base-object-inertia", "name": "base object inertia", "type": "str", "notOriginal": true}, {"id": "str:basic-word-order", "name": "basic word order", "type": "str", "shard": 6}, {"id": "str:biclausal-reciprocal", "name": "biclausal reciprocal", "type": "str", "shard": 6}, {"id": "str:bisyndetic", "name": "bisyndetic", "type": "str", "shard": 6}, {"id": "str:case-affix", "name": "case affix", "type": "str", "shard": 6}, {"id": "str:causative-alignment", "name": "causative alignment", "type": "str", "notOriginal": true}, {"id": "str:causative-applicative-co-expression", "name": "causative\u2013applicative co-expression", "type": "str", "shard": 6}, {"id": "str:causative-coordinate-strategy", "name": "causative coordinate strategy", "type": "str", "notOriginal": true}, {"id": "str:causative-predicational-strategy", "name": "causative predicational strategy", "type": "str", "notOriginal": true}, {"id": "str:circumposition", "name": "circumposition", "type": "str", "shard": 6}, {"id": "str:classifier", "name": "classifier", "type": "str", "shard": 6}, {"id": "str:clause-alignment", "name": "clause alignment", "type": "str", "alias": ["clause (dis)alignment", "clause disalignment"], "notOriginal": true}, {"id": "str:cleft-strategy", "name": "cleft strategy", "type": "str", "shard": 6}, {"id": "str:co-expression", "name": "co-expression", "type": "str", "alias": ["co-express", "co-expression (strategy)", "co-expression strategy"], "shard": 6}, {"id": "str:cognate-head-dependent-strategy", "name": "cognate head-dependent strategy", "type": "str", "alias": ["cognate object", "cognate object (strategy)", "cognate object strategy"], "shard": 6}, {"id": "str:complement-disalignment", "name": "complement disalignment", "type": "str", "notOriginal": true}, {"id": "str:complementizer", "name": "complementizer", "type": "str", "shard": 6}, {"id": "str:complex-predicate-asc-strategy", "name": "complex predicate ASC strategy", "type": "str", "notOriginal": true}, {"id": "str:compounding", "name": "compounding", "type": "str", "shard": 6}, {"id": "str:conditional-deranking", "name": "conditional deranking", "type": "str", "alias": ["conditional deranking (system)", "conditional deranking system", "conditionally deranked"], "shard": 6}, {"id": "str:conditional-discourse-reference-system", "name": "conditional discourse reference system", "type": "str", "shard": 6}, {"id": "str:conjoined-comparative", "name": "conjoined comparative", "type": "str", "shard": 6}, {"id": "str:conjoined-exceed-comparative", "name": "conjoined exceed comparative", "type": "str", "alias": ["conjoined exceed", "conjoined exceed (comparative)"], "shard": 6}, {"id": "str:conjunction", "name": "conjunction", "type": "str", "shard": 6}, {"id": "str:contiguity-of-serial-verbs", "name": "contiguity of serial verbs", "type": "str", "shard": 6}, {"id": "str:control-based-strategy", "name": "control-based strategy", "type": "str", "shard": 6}, {"id": "str:controller", "name": "controller", "type": "str", "shard": 6}, {"id": "str:converb", "name": "converb", "type": "str", "shard": 6}, {"id": "str:converb-strategy", "name": "converb strategy", "type": "str", "shard": 6}, {"id": "str:coordinate-clause-strategy", "name": "coordinate clause strategy", "type": "str", "notOriginal": true}, {"id": "str:coordinate-impersonal-strategy", "name": "coordinate impersonal strategy", "type": "str", "shard": 6}, {"id": "str:coordinate-personal-strategy", "name": "coordinate personal strategy", "type": "str", "shard": 6}, {"id": "str:coordinator", "name": "coordinator", "type": "str", "shard": 6}, {"id": "str:copula", "name": "copula", "type": "str", "shard": 6}, {"id": "str:copular-participle-strategy", "name": "copular participle strategy", "type": "str", "shard": 6}, {"id": "str:correlative-strategy", "name": "correlative strategy", "type": "str", "alias": ["correlative", "correlative (strategy)"], "shard": 6}, {"id": "str:declarative-marker", "name": "declarative marker", "type": "str", "notOriginal": true}, {"id": "str:definite-article-strategy", "name": "definite article strategy", "type": "str", "notOriginal": true}, {"id": "str:degree-affix", "name": "degree affix", "type": "str", "shard": 6}, {"id": "str:degree-equative", "name": "degree equative", "type": "str", "shard": 6}, {"id": "str:degree-marker", "name": "degree marker", "type": "str", "shard": 6}, {"id": "str:degree-modifier", "name": "degree modifier", "type": "str", "alias": ["degree adverb"], "shard": 6}, {"id": "str:demonstrative-strategy", "name": "demonstrative strategy", "type": "str", "notOriginal": true}, {"id": "str:deranking", "name": "deranked, deranking", "type": "str", "alias": ["deranked", "deranking", "gerund", "infinitive", "masdars", "nominalization", "verbal noun"], "shard": 6}, {"id": "str:derived-case", "name": "derived-case", "type": "str", "shard": 6}, {"id": "str:detached-complement-strategy", "name": "detached complement strategy", "type": "str", "notOriginal": true}, {"id": "str:detached-topic-phrase", "name": "detached topic phrase", "type": "str", "alias": ["detached", "detached (topic phrase)"], "shard": 6}, {"id": "str:differential-object-marking", "name": "differential object marking", "type": "str", "shard": 6}, {"id": "str:direct-object-category", "name": "direct object category", "type": "str", "shard": 6}, {"id": "str:direct-question-strategy", "name": "direct question strategy", "type": "str", "notOriginal": true}, {"id": "str:direct-report", "name": "direct report", "type": "str", "shard": 6}, {"id": "str:discourse-reference-system", "name": "discourse reference system", "type": "str", "shard": 6}, {"id": "str:ditransitive-alignment", "name": "ditransitive alignment", "type": "str", "notOriginal": true}, {"id": "str:domain", "name": "domain", "type": "str", "shard": 6}, {"id": "str:double-coding-strategy", "name": "double-coding strategy", "type": "str", "shard": 6}, {"id": "str:double-expression", "name": "double expression", "type": "str", "alias": ["double framing", "double marking"], "shard": 6}, {"id": "str:double-negation-strategy", "name": "double negation strategy", "type": "str", "shard": 6}, {"id": "str:double-oblique-strategy", "name": "double-oblique strategy", "type": "str", "shard": 6}, {"id": "str:doubling", "name": "doubling", "type": "str", "shard": 6}, {"id": "str:dual-role-strategy", "name": "dual role strategy", "type": "str", "shard": 6}, {"id": "str:echo-strategy", "name": "echo strategy", "type": "str", "shard": 6}, {"id": "str:ellipsis", "name": "ellipsis", "type": "str", "shard": 6}, {"id": "str:encoding-strategy", "name": "encoding strategy", "type": "str", "shard": 6}, {"id": "str:equal-equative", "name": "equal equative", "type": "str", "shard": 6}, {"id": "str:ergative-alignment", "name": "ergative alignment", "type": "str", "alias": ["ergative alignment (system)", "ergative alignment system"], "shard": 6}, {"id": "str:ergative-category", "name": "ergative category", "type": "str", "shard": 6}, {"id": "str:exceed-comparative", "name": "exceed comparative", "type": "str", "shard": 6}, {"id": "str:existential-negative-strategy", "name": "existential negative strategy", "type": "str", "notOriginal": true}, {"id": "str:experiencer-oriented-strategy", "name": "experiencer-oriented strategy", "type": "str", "alias": ["experiencer-subject strategy"], "shard": 6}, {"id": "str:experiential-alignment", "name": "experiential alignment", "type": "str", "alias": ["experiential (dis)alignment", "experiential disalignment"], "notOriginal": true}, {"id": "str:external-possessor-strategy", "name": "external possessor strategy", "type": "str", "shard": 6}, {"id": "str:externally-headed", "name": "externally headed", "type": "str", "shard": 6}, {"id": "str:extraposed-strategy", "name": "extraposed strategy", "type": "str", "alias": ["extraposed", "extraposed (strategy)"], "shard": 6}, {"id": "str:figure-incorporating", "name": "figure-incorporating", "type": "str", "shard": 6}, {"id": "str:first-person-plural-strategy", "name": "first person plural strategy", "type": "str", "notOriginal": true}, {"id": "str:fixed-case", "name": "fixed-case", "type": "str", "shard": 6}, {"id": "str:flagging", "name": "flag, flagging", "type": "str", "alias": ["case marker", "flag", "flagging"], "shard": 6}, {"id": "str:focus-marker", "name": "focus marker", "type": "str", "shard": 6}, {"id": "str:fusion", "name": "fusion", "type": "str", "shard": 6}, {"id": "str:gap-strategy", "name": "gap strategy", "type": "str", "alias": ["gap", "gap (strategy)"], "shard": 6}, {"id": "str:general-extender", "name": "general extender", "type": "str", "shard": 6}, {"id": "str:have-possessive-strategy", "name": "have-possessive strategy", "type": "str", "alias": ["action strategy"], "shard": 6}, {"id": "str:headless", "name": "headless", "type": "str", "alias": ["null anaphoric head"], "shard": 6}, {"id": "str:human-noun-strategy", "name": "human noun strategy", "type": "str", "notOriginal": true}, {"id": "str:hybrid-information-packaging-strategy", "name": "hybrid information packaging strategy", "type": "str", "alias": ["hybrid IP strategy"], "shard": 6}, {"id": "str:identificational-strategy", "name": "identificational strategy", "type": "str", "notOriginal": true}, {"id": "str:ideophones", "name": "ideophones", "type": "str", "alias": ["ideophone strategy", "mimetics"], "shard": 6}, {"id": "str:inactive-category", "name": "inactive category", "type": "str", "alias": ["patientive category", "stative category"], "shard": 6}, {"id": "str:inclusory-strategy", "name": "inclusory strategy", "type": "str", "notOriginal": true}, {"id": "str:incorporation-of-serial-verbs", "name": "incorporation of serial verbs", "type": "str", "alias": ["morphological boundness of serial verbs"], "shard": 6}, {"id": "str:independent-referring-phrase-strategy", "name": "independent referring phrase strategy", "type": "str", "shard": 6}, {"id": "str:independent-strategy", "name": "independent strategy", "type": "str", "shard": 6}, {"id": "str:index", "name": "index", "type": "str", "shard": 6}, {"id": "str:indexation", "name": "indexation", "type": "str", "alias": ["agreement", "indexical strategy"], "shard": 6}, {"id": "str:indexation-feature", "name": "indexation feature", "type": "str", "alias": ["agreement feature"], "shard": 6}, {"id": "str:indexed", "name": "indexed", "type": "str", "shard": 6}, {"id": "str:indirect-object-category", "name": "indirect object category", "type": "str", "shard": 6}, {"id": "str:indirect-report", "name": "indirect report", "type": "str", "shard": 6}, {"id": "str:indirective-alignment", "name": "indirective alignment", "type": "str", "alias": ["indirective alignment (system)", "indirective alignment system"], "shard": 6}, {"id": "str:information-packaging-alignment", "name": "information packaging alignment", "type": "str", "alias": ["information packaging (dis)alignment", "information packaging disalignment"], "notOriginal": true}, {"id": "str:insubordination", "name": "insubordination", "type": "str", "shard": 6}, {"id": "str:internal-possessor-strategy", "name": "internal possessor strategy", "type": "str", "shard": 6}, {"id": "str:internal-recipient-strategy", "name": "internal recipient strategy", "type": "str", "shard": 6}, {"id": "str:internally-headed-strategy", "name": "internally headed strategy", "type": "str", "alias": ["internally headed", "internally headed (strategy)"], "shard": 6}, {"id": "str:interrogative-complementizer", "name": "interrogative complementizer", "type": "str", "notOriginal": true}, {"id": "str:interrogative-pronoun-strategy", "name": "interrogative pronoun strategy", "type": "str", "notOriginal": true}, {"id": "str:juxtaposition", "name": "juxtaposition", "type": "str", "shard": 6}, {"id": "str:linker", "name": "linker", "type": "str", "shard": 6}, {"id": "str:locational-possessive-strategy", "name": "locational possessive strategy", "type": "str", "alias": ["goal strategy", "location strategy", "locational possessive", "locational possessive (strategy)"], "shard": 6}, {"id": "str:locational-strategy", "name": "locational strategy", "type": "str", "alias": ["locational", "locational (strategy)"], "shard": 6}, {"id": "str:locative-comparative", "name": "locative comparative", "type": "str", "shard": 7}, {"id": "str:locus-of-inflection-of-serial-verbs", "name": "locus of inflection of serial verbs", "type": "str", "shard": 7}, {"id": "str:logophoric-system", "name": "logophoric system", "type": "str", "shard": 7}, {"id": "str:long-distance-reflexive", "name": "long-distance reflexive", "type": "str", "shard": 7}, {"id": "str:mensural-classifier", "name": "mensural classifier", "type": "str", "shard": 7}, {"id": "str:merged-argument-structure-strategy", "name": "merged argument structure strategy", "type": "str", "shard": 7}, {"id": "str:middle-voice", "name": "middle voice", "type": "str", "shard": 7}, {"id": "str:monoclausal-transitive-reciprocal-strategy", "name": "monoclausal transitive reciprocal strategy", "type": "str", "shard": 7}, {"id": "str:monosyndetic", "name": "monosyndetic", "type": "str", "shard": 7}, {"id": "str:negative-auxiliary-strategy", "name": "negative auxiliary strategy", "type": "str", "notOriginal": true}, {"id": "str:negative-fusion", "name": "negative fusion", "type": "str", "notOriginal": true}, {"id": "str:negative-particle", "name": "negative particle", "type": "str", "notOriginal": true}, {"id": "str:neutral-alignment", "name": "neutral alignment", "type": "str", "alias": ["neutral (transitive) alignment (system)", "neutral alignment system", "neutral transitive alignment", "neutral transitive alignment system"], "shard": 7}, {"id": "str:neutral-ditransitive-alignment", "name": "neutral ditransitive alignment", "type": "str", "alias": ["double object alignment", "double object alignment (system)", "double object alignment system", "neutral ditransitive alignment (system)", "neutral ditransitive alignment system"], "shard": 7}, {"id": "str:nominalizer", "name": "nominalizer", "type": "str", "shard": 7}, {"id": "str:nominative-category", "name": "nominative category", "type": "str", "shard": 7}, {"id": "str:non-externally-headed", "name": "non-externally headed", "type": "str", "notOriginal": true}, {"id": "str:non-indexed", "name": "non-indexed", "type": "str", "shard": 7}, {"id": "str:non-nominative-flag-index", "name": "non-nominative flag\u2013index", "type": "str", "notOriginal": true}, {"id": "str:nonperson-indexation", "name": "nonperson indexation", "type": "str", "shard": 7}, {"id": "str:nonspecific-article-strategy", "name": "nonspecific article strategy", "type": "str", "notOriginal": true}, {"id": "str:nonspecific-pronoun-strategy", "name": "nonspecific pronoun strategy", "type": "str", "notOriginal": true}, {"id": "str:nonverbal-copula-strategy", "name": "nonverbal copula strategy", "type": "str", "alias": ["nonverbal copula", "nonverbal copula (strategy)"], "shard": 7}, {"id": "str:noun-incorporation", "name": "noun incorporation", "type": "str", "shard": 7}, {"id": "str:noun-modifying-clause-strategy", "name": "noun-modifying clause strategy", "type": "str", "alias": ["noun-modifying clause", "noun-modifying clause (strategy)"], "shard": 7}, {"id": "str:numeral-strategy", "name": "numeral strategy", "type": "str", "notOriginal": true}, {"id": "str:object-equative", "name": "object equative", "type": "str", "notOriginal": true}, {"id": "str:oblique-p-strategy", "name": "oblique P strategy", "type": "str", "notOriginal": true}, {"id": "str:omitted-a-strategy", "name": "omitted A strategy", "type": "str", "notOriginal": true}, {"id": "str:omitted-p-strategy", "name": "omitted P strategy", "type": "str", "shard": 7}, {"id": "str:ordered-strategy", "name": "ordered strategy", "type": "str", "shard": 7}, {"id": "str:overt-article", "name": "overt article", "type": "str", "notOriginal": true}, {"id": "str:overt-coding", "name": "overt coding, overtly coded", "type": "str", "alias": ["overt code", "overt coding", "overt coding (strategy)", "overt coding strategy", "overt strategy", "overtly coded", "overtly coded (strategy)", "overtly coded strategy"], "shard": 7}, {"id": "str:overt-pronoun", "name": "overt pronoun", "type": "str", "alias": ["nonnull pronoun"], "notOriginal": true}, {"id": "str:overtly-coded-single-role-strategy", "name": "overtly coded single role strategy", "type": "str", "alias": ["derived intransitive"], "shard": 7}, {"id": "str:overtly-coded-verb", "name": "overtly coded verb", "type": "str", "alias": ["overtly verb-coded voice strategy"], "shard": 7}, {"id": "str:overtly-headed-strategy", "name": "overtly headed strategy", "type": "str", "alias": ["overt anaphoric head strategy", "overt head strategy"], "shard": 7}, {"id": "str:partially-merged-argument-structure-strategy", "name": "partially merged argument structure strategy", "type": "str", "shard": 7}, {"id": "str:participial-strategy", "name": "participial strategy", "type": "str", "shard": 7}, {"id": "str:participle", "name": "participle", "type": "str", "shard": 7}, {"id": "str:particle-comparative", "name": "particle comparative", "type": "str", "shard": 7}, {"id": "str:particle-equative", "name": "particle equative", "type": "str", "shard": 7}, {"id": "str:passive-inverse-alignment", "name": "passive-inverse alignment", "type": "str", "notOriginal": true}, {"id": "str:perception-verb-strategy", "name": "perception verb strategy", "type": "str", "shard": 7}, {"id": "str:person-indexation", "name": "person indexation", "type": "str", "shard": 7}, {"id": "str:phenomime", "name": "phenomime", "type": "str", "shard": 7}, {"id": "str:phonomime", "name": "phonomime", "type": "str", "shard": 7}, {"id": "str:polarity-response-alignment", "name": "polarity response alignment", "type": "str", "notOriginal": true}, {"id": "str:possessive-locative-strategy", "name": "possessive locative strategy", "type": "str", "shard": 7}, {"id": "str:posterior-deranking", "name": "posterior deranking", "type": "str", "shard": 7}, {"id": "str:posterior-zero", "name": "posterior zero", "type": "str", "notOriginal": true}, {"id": "str:postnominal-strategy", "name": "postnominal strategy", "type": "str", "alias": ["postnominal", "postnominal (strategy)"], "shard": 7}, {"id": "str:postposition", "name": "postposition", "type": "str", "shard": 7}, {"id": "str:predicational-locative-strategy", "name": "predicational locative strategy", "type": "str", "shard": 7}, {"id": "str:predicational-strategy", "name": "predicational strategy", "type": "str", "shard": 7}, {"id": "str:predicativization-possessive-strategy", "name": "predicativization possessive strategy", "type": "str", "shard": 7}, {"id": "str:prenominal-strategy", "name": "prenominal strategy", "type": "str", "alias": ["prenominal", "prenominal (strategy)"], "shard": 7}, {"id": "str:preposition", "name": "preposition", "type": "str", "shard": 7}, {"id": "str:primary-object-category", "name": "primary object category", "type": "str", "shard": 7}, {"id": "str:pronoun-retention-strategy", "name": "pronoun-retention strategy", "type": "str", "alias": ["pronoun-retention", "pronoun-retention (strategy)"], "shard": 7}, {"id": "str:prosody", "name": "prosody", "type": "str", "shard": 7}, {"id": "str:pseudo-partitive", "name": "pseudo-partitive", "type": "str", "shard": 7}, {"id": "str:psychomime", "name": "psychomime", "type": "str", "shard": 7}, {"id": "str:question-marker", "name": "question marker", "type": "str", "notOriginal": true}, {"id": "str:quotative-marker", "name": "quotative marker", "type": "str", "shard": 7}, {"id": "str:reciprocal-strategy", "name": "reciprocal strategy", "type": "str", "notOriginal": true}, {"id": "str:recruitment-strategy", "name": "recruitment strategy", "type": "str", "alias": ["recruit", "recruit(ing)", "recruiting", "recruitment", "recruitment (strategy)"], "shard": 7}, {"id": "str:reference-tracking-system", "name": "reference tracking system", "type": "str", "notOriginal": true}, {"id": "str:reflexive-strategy", "name": "reflexive strategy", "type": "str", "notOriginal": true}, {"id": "str:relational-strategy", "name": "relational strategy", "type": "str", "shard": 7}, {"id": "str:relative-based-equative", "name": "relative-based equative", "type": "str", "shard": 7}, {"id": "str:relative-equal-equative", "name": "relative equal equative", "type": "str", "shard": 7}, {"id": "str:relative-pronoun-strategy", "name": "relative pronoun strategy", "type": "str", "shard": 7}, {"id": "str:relative-strategy", "name": "relative strategy", "type": "str", "shard": 7}, {"id": "str:relativizer", "name": "relativizer", "type": "str", "shard": 7}, {"id": "str:repeater", "name": "repeater", "type": "str", "shard": 7}, {"id": "str:satellite", "name": "satellite", "type": "str", "shard": 7}, {"id": "str:satellite-framing-strategy", "name": "satellite-framing strategy", "type": "str", "shard": 7}, {"id": "str:scalar-concessive-conditional-strategy", "name": "scalar concessive conditional strategy", "type": "str", "shard": 7}, {"id": "str:second-position", "name": "second position", "type": "str", "shard": 7}, {"id": "str:secondary-object-category", "name": "secondary object category", "type": "str", "shard": 7}, {"id": "str:secundative-alignment", "name": "secundative alignment", "type": "str", "alias": ["secundative (ditransitive) alignment (system)", "secundative alignment system", "secundative ditransitive alignment", "secundative ditransitive alignment system"], "shard": 7}, {"id": "str:semantic-information-packaging-strategy", "name": "semantic information packaging strategy", "type": "str", "alias": ["semantic IP strategy"], "shard": 7}, {"id": "str:separative-comparative", "name": "separative comparative", "type": "str", "shard": 7}, {"id": "str:serial-verb-strategy", "name": "serial verb strategy", "type": "str", "alias": ["serial verb", "serial verb (strategy)"], "shard": 7}, {"id": "str:simple-strategy", "name": "simple strategy", "type": "str", "shard": 7}, {"id": "str:single-role-strategy", "name": "single role strategy", "type": "str", "shard": 7}, {"id": "str:sortal-classifier", "name": "sortal classifier", "type": "str", "shard": 7}, {"id": "str:special-form", "name": "special form", "type": "str", "alias": ["base modification"], "shard": 7}, {"id": "str:special-p-strategy", "name": "special P strategy", "type": "str", "shard": 7}, {"id": "str:specialized-dual-role-strategy", "name": "specialized dual role strategy", "type": "str", "shard": 7}, {"id": "str:split-argument-structure-strategy", "name": "split argument structure strategy", "type": "str", "shard": 7}, {"id": "str:split-structure", "name": "split structure", "type": "str", "shard": 7}, {"id": "str:stamp-strategy", "name": "STAMP strategy", "type": "str", "shard": 7}, {"id": "str:stimulus-oriented-strategy", "name": "stimulus-oriented strategy", "type": "str", "alias": ["experiencer-object strategy"], "shard": 7}, {"id": "str:strategy", "name": "strategy", "type": "str", "alias": ["strategies"], "shard": 7}, {"id": "str:subject-predicate-alignment", "name": "subject-predicate alignment", "type": "str", "alias": ["subject-predicate (dis)alignment", "subject-predicate disalignment"], "notOriginal": true}, {"id": "str:summarizer", "name": "summarizer", "type": "str", "shard": 7}, {"id": "str:switch-reference-system", "name": "switch-reference system", "type": "str", "shard": 7}, {"id": "str:syndetic", "name": "syndetic", "type": "str", "shard": 7}, {"id": "str:system", "name": "system", "type": "str", "shard": 7}, {"id": "str:tag", "name": "tag", "type": "str", "shard": 7}, {"id": "str:target", "name": "target", "type": "str", "shard": 7}, {"id": "str:tense-iconicity", "name": "tense iconicity", "type": "str", "shard": 7}, {"id": "str:thetic-marker", "name": "thetic marker", "type": "str", "notOriginal": true}, {"id": "str:topic-locational-hybrid-possessive-strategy", "name": "topic-locational hybrid possessive strategy", "type": "str", "shard": 7}, {"id": "str:topic-marker", "name": "topic marker", "type": "str", "notOriginal": true}, {"id": "str:topic-possessive-strategy", "name": "topic possessive strategy", "type": "str", "alias": ["distributed subject possessive strategy", "double subject possessive strategy"], "shard": 7}, {"id": "str:transitive-alignment", "name": "transitive alignment", "type": "str", "notOriginal": true}, {"id": "str:transitivity-based-strategy", "name": "transitivity-based strategy", "type": "str", "shard": 7}, {"id": "str:tripartite-alignment", "name": "tripartite alignment", "type": "str", "shard": 7}, {"id": "str:unique-equative", "name": "unique equative", "type": "str", "notOriginal": true}, {"id": "str:universal-concessive-conditional-strategy", "name": "universal concessive conditional strategy", "type": "str", "shard": 7}, {"id": "str:universal-pronoun-strategy", "name": "universal pronoun strategy", "type": "str", "notOriginal": true}, {"id": "str:utterance-clause-alignment", "name": "utterance clause alignment", "type": "str", "alias": ["utterance clause (dis)alignment", "utterance clause disalignment"], "notOriginal": true}, {"id": "str:verb-coding-strategy", "name": "verb-coding strategy", "type": "str", "alias": ["verb-coding"], "shard": 7}, {"id": "str:verb-framing-strategy", "name": "verb-framing strategy", "type": "str", "shard": 7}, {"id": "str:verbal-copula", "name": "verbal copula", "type": "str", "shard": 7}, {"id": "str:verbal-strategy", "name": "verbal strategy", "type": "str", "shard": 7}, {"id": "str:with-possessive-strategy", "name": "with-possessive strategy", "type": "str", "alias": ["companion strategy"], "shard": 7}, {"id": "str:word-order", "name": "word order", "type": "str", "shard": 7}, {"id": "str:yes-no-alignment", "name": "yes/no alignment", "type": "str", "alias": ["yes/no alignment (strategy)", "yes/no alignment strategy"], "shard": 7}, {"id": "str:yes-no-disagree-alignment", "name": "yes/no/disagree alignment", "type": "str", "alias": ["yes/no/disagree alignment (strategy)", "yes/no/disagree alignment strategy"], "shard": 7}, {"id": "str:zero-anaphora", "name": "zero anaphora", "type": "str", "alias": ["DNI", "definite null instantiation", "null anaphora"], "shard": 7}, {"id": "str:zero-article", "name": "zero article", "type": "str", "notOriginal": true}, {"id": "str:zero-coded-verb", "name": "zero coded verb", "type": "str", "alias": ["zero verb-coded voice strategy"], "shard": 7}, {"id": "str:zero-coding", "name": "zero coding, zero coded", "type": "str", "alias": ["zero code", "zero coded", "zero coded (strategy)", "zero coded strategy", "zero coding", "zero coding (strategy)", "zero coding strategy"], "shard": 7}, {"id": "str:zero-copula", "name": "zero copula", "type": "str", "shard": 7}], "edges": [{"start": "1", "end": "1.1", "rel": "Sections"}, {"start": "1", "end": "1.2", "rel": "Sections"}, {"start": "1", "end": "1.3", "rel": "Sections"}, {"start": "1", "end": "1.4", "rel": "Sections"}, {"start": "1", "end": "1.5", "rel": "Sections"}, {"start": "1", "end": "1.6", "rel": "Sections"}, {"start": "1.1", "end": "def:construction-grammar", "rel": "Sections"}, {"start": "1.1", "end": "def:form", "rel": "Sections"}, {"start": "1.1", "end": "def:function", "rel": "Sections"}, {"start": "1.1", "end": "def:functionalism", "rel": "Sections"}, {"start": "1.1", "end": "def:grammaticalization", "rel": "Sections"}, {"start": "1.1", "end": "def:morphology", "rel": "Sections"}, {"start": "1.1", "end": "def:morphosyntax", "rel": "Sections"}, {"start": "1.1", "end": "def:role", "rel": "Sections"}, {"start": "1.1", "end": "def:syntax", "rel": "Sections"}, {"start": "1.1", "end": "def:typology", "rel": "Sections"}, {"start": "1.1", "end": "inf:information-packaging", "rel": "Sections"}, {"start": "1.1", "end": "sem:meaning", "rel": "Sections"}, {"start": "1.2", "end": "1.2.1", "rel": "Sections"}, {"start": "1.2", "end": "1.2.2", "rel": "Sections"}, {"start": "1.2", "end": "1.2.3", "rel": "Sections"}, {"start": "1.2.1", "end": "def:word-class", "rel": "Sections"}, {"start": "1.2.2", "end": "def:semantic-classes", "rel": "Sections"}, {"start": "1.2.3", "end": "cxn:construction", "rel": "Sections"}, {"start": "1.3", "end": "cxn:clause", "rel": "Sections"}, {"start": "1.3", "end": "cxn:complex-sentence", "rel": "Sections"}, {"start": "1.3", "end": "inf:information-packaging", "rel": "Sections"}, {"start": "1.3", "end": "inf:major-propositional-act", "rel": "Sections"}, {"start": "1.3", "end": "inf:modification", "rel": "Sections"}, {"start": "1.3", "end": "inf:predication", "rel": "Sections"}, {"start": "1.3", "end": "inf:reference", "rel": "Sections"}, {"start": "1.4", "end": "cxn:predicate-nominal-construction", "rel": "Sections"}, {"start": "1.4", "end": "def:comparative-concept", "rel": "Sections"}, {"start": "1.4", "end": "def:crosslinguistically-valid", "rel": "Sections"}, {"start": "1.4", "end": "str:alignment-system", "rel": "Sections"}, {"start": "1.4", "end": "str:co-expression", "rel": "Sections"}, {"start": "1.4", "end": "str:copula", "rel": "Sections"}, {"start": "1.4", "end": "str:encoding-strategy", "rel": "Sections"}, {"start": "1.4", "end": "str:recruitment-strategy", "rel": "Sections"}, {"start": "1.4", "end": "str:strategy", "rel": "Sections"}, {"start": "1.4", "end": "str:system", "rel": "Sections"}, {"start": "1.4", "end": "str:verbal-copula", "rel": "Sections"}, {"start": "1.5", "end": "cxn:predicate-adjectival-construction", "rel": "Sections"}, {"start": "1.6", "end": "def:cumulation", "rel": "Sections"}, {"start": "1.6", "end": "def:false-cumulation", "rel": "Sections"}, {"start": "1.6", "end": "def:interlinear-morpheme-translation", "rel": "Sections"}, {"start": "1.6", "end": "def:metalanguage", "rel": "Sections"}, {"start": "1.6", "end": "def:object-language", "rel": "Sections"}, {"start": "1.6", "end": "def:translation", "rel": "Sections"}, {"start": "10", "end": "10.1", "rel": "Sections"}, {"start": "10", "end": "10.2", "rel": "Sections"}, {"start": "10", "end": "10.3", "rel": "Sections"}, {"start": "10", "end": "10.4", "rel": "Sections"}, {"start": "10.1", "end": "10.1.1", "rel": "Sections"}, {"start": "10.1", "end": "10.1.2", "rel": "Sections"}, {"start": "10.1.1", "end": "cxn:nonprototypical-predication-construction", "rel": "Sections"}, {"start": "10.1.2", "end": "cxn:entity-central-construction", "rel": "Sections"}, {"start": "10.1.2", "end": "cxn:equational-construction", "rel": "Sections"}, {"start": "10.1.2", "end": "cxn:event-central-construction", "rel": "Sections"}, {"start": "10.1.2", "end": "cxn:identificational-construction", "rel": "Sections"}, {"start": "10.1.2", "end": "cxn:nonpredicational-construction", "rel": "Sections"}, {"start": "10.1.2", "end": "cxn:presentational-construction", "rel": "Sections"}, {"start": "10.1.2", "end": "cxn:thetic-construction", "rel": "Sections"}, {"start": "10.1.2", "end": "cxn:topic-comment-construction", "rel": "Sections"}, {"start": "10.1.2", "end": "def:file-metaphor", "rel": "Sections"}, {"start": "10.1.2", "end": "def:identity-statements", "rel": "Sections"}, {"start": "10.1.2", "end": "inf:entity-central", "rel": "Sections"}, {"start": "10.1.2", "end": "inf:equational", "rel": "Sections"}, {"start": "10.1.2", "end": "inf:event-central", "rel": "Sections"}, {"start": "10.1.2", "end": "inf:identificational", "rel": "Sections"}, {"start": "10.1.2", "end": "inf:presentational", "rel": "Sections"}, {"start": "10.1.2", "end": "inf:thetic", "rel": "Sections"}, {"start": "10.1.2", "end": "inf:topic-comment", "rel": "Sections"}, {"start": "10.2", "end": "sem:time-stability", "rel": "Sections"}, {"start": "10.2", "end": "str:copula", "rel": "Sections"}, {"start": "10.2", "end": "str:locational-strategy", "rel": "Sections"}, {"start": "10.2", "end": "str:nonverbal-copula-strategy", "rel": "Sections"}, {"start": "10.2", "end": "str:verbal-copula", "rel": "Sections"}, {"start": "10.2", "end": "str:verbal-strategy", "rel": "Sections"}, {"start": "10.2", "end": "str:zero-copula", "rel": "Sections"}, {"start": "10.3", "end": "cxn:predicate-adjectival-construction", "rel": "Sections"}, {"start": "10.3", "end": "cxn:predicate-nominal-construction", "rel": "Sections"}, {"start": "10.4", "end": "10.4.1", "rel": "Sections"}, {"start": "10.4", "end": "10.4.2", "rel": "Sections"}, {"start": "10.4", "end": "10.4.3", "rel": "Sections"}, {"start": "10.4", "end": "cxn:presentational-construction", "rel": "Sections"}, {"start": "10.4", "end": "inf:presentational", "rel": "Sections"}, {"start": "10.4.1", "end": "cxn:locational-construction", "rel": "Sections"}, {"start": "10.4.1", "end": "cxn:predicational-location-construction", "rel": "Sections"}, {"start": "10.4.1", "end": "cxn:presentational-location-construction", "rel": "Sections"}, {"start": "10.4.1", "end": "sem:figure-ground-spatial-relation", "rel": "Sections"}, {"start": "10.4.2", "end": "cxn:possession-construction", "rel": "Sections"}, {"start": "10.4.2", "end": "cxn:predicational-possession-construction", "rel": "Sections"}, {"start": "10.4.2", "end": "cxn:presentational-possession-construction", "rel": "Sections"}, {"start": "10.4.2", "end": "sem:possession", "rel": "Sections"}, {"start": "10.4.2", "end": "sem:possessor", "rel": "Sections"}, {"start": "10.4.2", "end": "sem:possessum", "rel": "Sections"}, {"start": "10.4.2", "end": "str:adnominal-possessive-strategy", "rel": "Sections"}, {"start": "10.4.2", "end": "str:have-possessive-strategy", "rel": "Sections"}, {"start": "10.4.2", "end": "str:locational-possessive-strategy", "rel": "Sections"}, {"start": "10.4.2", "end": "str:predicativization-possessive-strategy", "rel": "Sections"}, {"start": "10.4.2", "end": "str:topic-locational-hybrid-possessive-strategy", "rel": "Sections"}, {"start": "10.4.2", "end": "str:topic-possessive-strategy", "rel": "Sections"}, {"start": "10.4.2", "end": "str:with-possessive-strategy", "rel": "Sections"}, {"start": "10.4.3", "end": "cxn:presentational-location-construction", "rel": "Sections"}, {"start": "10.4.3", "end": "str:independent-referring-phrase-strategy", "rel": "Sections"}, {"start": "10.4.3", "end": "str:perception-verb-strategy", "rel": "Sections"}, {"start": "10.4.3", "end": "str:possessive-locative-strategy", "rel": "Sections"}, {"start": "10.4.3", "end": "str:predicational-locative-strategy", "rel": "Sections"}, {"start": "11", "end": "11.1", "rel": "Sections"}, {"start": "11", "end": "11.2", "rel": "Sections"}, {"start": "11", "end": "11.3", "rel": "Sections"}, {"start": "11", "end": "11.4", "rel": "Sections"}, {"start": "11.1", "end": "cxn:identificational-construction", "rel": "Sections"}, {"start": "11.1", "end": "cxn:thetic-construction", "rel": "Sections"}, {"start": "11.1", "end": "cxn:topic-comment-construction", "rel": "Sections"}, {"start": "11.1", "end": "inf:identificational", "rel": "Sections"}, {"start": "11.1", "end": "inf:thetic", "rel": "Sections"}, {"start": "11.1", "end": "inf:topic-comment", "rel": "Sections"}, {"start": "11.1", "end": "sem:proposition", "rel": "Sections"}, {"start": "11.1", "end": "sem:propositional-content", "rel": "Sections"}, {"start": "11.2", "end": "11.2.1", "rel": "Sections"}, {"start": "11.2", "end": "11.2.2", "rel": "Sections"}, {"start": "11.2", "end": "11.2.3", "rel": "Sections"}, {"start": "11.2.1", "end": "cxn:topic-comment-construction", "rel": "Sections"}, {"start": "11.2.1", "end": "inf:aboutness", "rel": "Sections"}, {"start": "11.2.1", "end": "inf:topic-comment", "rel": "Sections"}, {"start": "11.2.2", "end": "str:detached-topic-phrase", "rel": "Sections"}, {"start": "11.2.3", "end": "cxn:hanging-topic-phrase", "rel": "Sections"}, {"start": "11.2.3", "end": "inf:link", "rel": "Sections"}, {"start": "11.2.3", "end": "inf:poset", "rel": "Sections"}, {"start": "11.2.3", "end": "inf:trigger", "rel": "Sections"}, {"start": "11.3", "end": "11.3.1", "rel": "Sections"}, {"start": "11.3", "end": "11.3.2", "rel": "Sections"}, {"start": "11.3", "end": "11.3.3", "rel": "Sections"}, {"start": "11.3.1", "end": "cxn:entity-central-construction", "rel": "Sections"}, {"start": "11.3.1", "end": "cxn:event-central-construction", "rel": "Sections"}, {"start": "11.3.1", "end": "cxn:thetic-construction", "rel": "Sections"}, {"start": "11.3.1", "end": "inf:announcement", "rel": "Sections"}, {"start": "11.3.1", "end": "inf:background-description", "rel": "Sections"}, {"start": "11.3.1", "end": "inf:entity-central", "rel": "Sections"}, {"start": "11.3.1", "end": "inf:event-central", "rel": "Sections"}, {"start": "11.3.1", "end": "inf:explanation", "rel": "Sections"}, {"start": "11.3.1", "end": "inf:interruption", "rel": "Sections"}, {"start": "11.3.1", "end": "inf:thetic", "rel": "Sections"}, {"start": "11.3.1", "end": "sem:existence-event", "rel": "Sections"}, {"start": "11.3.1", "end": "sem:weather-event", "rel": "Sections"}, {"start": "11.3.2", "end": "str:prosody", "rel": "Sections"}, {"start": "11.3.2", "end": "str:split-structure", "rel": "Sections"}, {"start": "11.3.3", "end": "sem:weather-event", "rel": "Sections"}, {"start": "11.4", "end": "11.4.1", "rel": "Sections"}, {"start": "11.4", "end": "11.4.2", "rel": "Sections"}, {"start": "11.4.1", "end": "cxn:identificational-construction", "rel": "Sections"}, {"start": "11.4.1", "end": "cxn:polarity-focus-construction", "rel": "Sections"}, {"start": "11.4.1", "end": "inf:alternative-proposition", "rel": "Sections"}, {"start": "11.4.1", "end": "inf:choosing-contrast", "rel": "Sections"}, {"start": "11.4.1", "end": "inf:contrast", "rel": "Sections"}, {"start": "11.4.1", "end": "inf:counterpresuppositional-contrast", "rel": "Sections"}, {"start": "11.4.1", "end": "inf:expanding-contrast", "rel": "Sections"}, {"start": "11.4.1", "end": "inf:focus", "rel": "Sections"}, {"start": "11.4.1", "end": "inf:identificational", "rel": "Sections"}, {"start": "11.4.1", "end": "inf:information-gap", "rel": "Sections"}, {"start": "11.4.1", "end": "inf:listing-contrast", "rel": "Sections"}, {"start": "11.4.1", "end": "inf:nonverbal-contrast", "rel": "Sections"}, {"start": "11.4.1", "end": "inf:parallel-contrast", "rel": "Sections"}, {"start": "11.4.1", "end": "inf:pragmatic-presupposition", "rel": "Sections"}, {"start": "11.4.1", "end": "inf:presupposed-open-proposition", "rel": "Sections"}, {"start": "11.4.1", "end": "inf:rejecting-contrast", "rel": "Sections"}, {"start": "11.4.1", "end": "inf:replacing-contrast", "rel": "Sections"}, {"start": "11.4.1", "end": "inf:restricting-contrast", "rel": "Sections"}, {"start": "11.4.1", "end": "inf:verbal-contrast", "rel": "Sections"}, {"start": "11.4.2", "end": "str:cleft-strategy", "rel": "Sections"}, {"start": "11.4.2", "end": "str:ellipsis", "rel": "Sections"}, {"start": "11.4.2", "end": "str:focus-marker", "rel": "Sections"}, {"start": "12", "end": "12.1", "rel": "Sections"}, {"start": "12", "end": "12.2", "rel": "Sections"}, {"start": "12", "end": "12.3", "rel": "Sections"}, {"start": "12", "end": "12.4", "rel": "Sections"}, {"start": "12", "end": "12.5", "rel": "Sections"}, {"start": "12.1", "end": "cxn:declarative-construction", "rel": "Sections"}, {"start": "12.1", "end": "cxn:exclamative-construction", "rel": "Sections"}, {"start": "12.1", "end": "cxn:imperative-hortative-construction", "rel": "Sections"}, {"start": "12.1", "end": "cxn:interrogative-construction", "rel": "Sections"}, {"start": "12.1", "end": "cxn:speech-act-construction", "rel": "Sections"}, {"start": "12.1", "end": "inf:declarative", "rel": "Sections"}, {"start": "12.1", "end": "inf:exclamative", "rel": "Sections"}, {"start": "12.1", "end": "inf:imperative-hortative", "rel": "Sections"}, {"start": "12.1", "end": "inf:interrogative", "rel": "Sections"}, {"start": "12.1", "end": "inf:speech-acts", "rel": "Sections"}, {"start": "12.1", "end": "sem:deontic-modality", "rel": "Sections"}, {"start": "12.1", "end": "sem:epistemic-modality", "rel": "Sections"}, {"start": "12.1", "end": "sem:mirative", "rel": "Sections"}, {"start": "12.1", "end": "sem:modality", "rel": "Sections"}, {"start": "12.1", "end": "sem:negative-polarity", "rel": "Sections"}, {"start": "12.1", "end": "sem:polarity", "rel": "Sections"}, {"start": "12.1", "end": "sem:positive-polarity", "rel": "Sections"}, {"start": "12.2", "end": "cxn:declarative-negation-construction", "rel": "Sections"}, {"start": "12.2", "end": "cxn:existential-negation-construction", "rel": "Sections"}, {"start": "12.2", "end": "cxn:negation-construction", "rel": "Sections"}, {"start": "12.2", "end": "str:double-negation-strategy", "rel": "Sections"}, {"start": "12.3", "end": "12.3.1", "rel": "Sections"}, {"start": "12.3", "end": "12.3.2", "rel": "Sections"}, {"start": "12.3", "end": "12.3.3", "rel": "Sections"}, {"start": "12.3", "end": "12.3.4", "rel": "Sections"}, {"start": "12.3", "end": "cxn:interrogative-construction", "rel": "Sections"}, {"start": "12.3", "end": "inf:interrogative", "rel": "Sections"}, {"start": "12.3.1", "end": "cxn:alternative-question-construction", "rel": "Sections"}, {"start": "12.3.1", "end": "cxn:information-question-construction", "rel": "Sections"}, {"start": "12.3.1", "end": "cxn:interrogative-pronoun", "rel": "Sections"}, {"start": "12.3.1", "end": "cxn:polarity-question-construction", "rel": "Sections"}, {"start": "12.3.1", "end": "inf:alternative-question", "rel": "Sections"}, {"start": "12.3.1", "end": "inf:information-question", "rel": "Sections"}, {"start": "12.3.1", "end": "inf:polarity-question", "rel": "Sections"}, {"start": "12.3.2", "end": "str:tag", "rel": "Sections"}, {"start": "12.3.3", "end": "cxn:information-question-response-construction", "rel": "Sections"}, {"start": "12.3.3", "end": "cxn:polarity-response-construction", "rel": "Sections"}, {"start": "12.3.3", "end": "inf:information-question-response", "rel": "Sections"}, {"start": "12.3.3", "end": "inf:polarity-response", "rel": "Sections"}, {"start": "12.3.3", "end": "str:agree-disagree-alignment", "rel": "Sections"}, {"start": "12.3.3", "end": "str:echo-strategy", "rel": "Sections"}, {"start": "12.3.3", "end": "str:yes-no-alignment", "rel": "Sections"}, {"start": "12.3.3", "end": "str:yes-no-disagree-alignment", "rel": "Sections"}, {"start": "12.3.4", "end": "cxn:interrogative-complement", "rel": "Sections"}, {"start": "12.3.4", "end": "sem:epistemic-modality", "rel": "Sections"}, {"start": "12.3.4", "end": "sem:evidentiality", "rel": "Sections"}, {"start": "12.3.4", "end": "sem:objective", "rel": "Sections"}, {"start": "12.3.4", "end": "sem:subjective", "rel": "Sections"}, {"start": "12.4", "end": "12.4.1", "rel": "Sections"}, {"start": "12.4", "end": "12.4.2", "rel": "Sections"}, {"start": "12.4", "end": "cxn:imperative-hortative-construction", "rel": "Sections"}, {"start": "12.4", "end": "inf:imperative-hortative", "rel": "Sections"}, {"start": "12.4", "end": "sem:deontic-modality", "rel": "Sections"}, {"start": "12.4", "end": "sem:future-oriented", "rel": "Sections"}, {"start": "12.4.1", "end": "cxn:negation-construction", "rel": "Sections"}, {"start": "12.4.1", "end": "cxn:prohibitive-construction", "rel": "Sections"}, {"start": "12.4.1", "end": "inf:prohibitive", "rel": "Sections"}, {"start": "12.4.1", "end": "str:bare-verb-stem", "rel": "Sections"}, {"start": "12.4.2", "end": "str:deranking", "rel": "Sections"}, {"start": "12.5", "end": "12.5.2", "rel": "Sections"}, {"start": "12.5", "end": "cxn:exclamative-construction", "rel": "Sections"}, {"start": "12.5", "end": "inf:exclamative", "rel": "Sections"}, {"start": "12.5.2", "end": "sem:mirative", "rel": "Sections"}, {"start": "13", "end": "13.1", "rel": "Sections"}, {"start": "13", "end": "13.2", "rel": "Sections"}, {"start": "13", "end": "13.3", "rel": "Sections"}, {"start": "13", "end": "13.4", "rel": "Sections"}, {"start": "13", "end": "13.5", "rel": "Sections"}, {"start": "13", "end": "13.6", "rel": "Sections"}, {"start": "13.1", "end": "13.1.1", "rel": "Sections"}, {"start": "13.1", "end": "13.1.2", "rel": "Sections"}, {"start": "13.1.1", "end": "cxn:complex-predicate", "rel": "Sections"}, {"start": "13.1.2", "end": "cxn:eventive-complex-predicate", "rel": "Sections"}, {"start": "13.1.2", "end": "cxn:stative-complex-predicate", "rel": "Sections"}, {"start": "13.1.2", "end": "def:lexicalization", "rel": "Sections"}, {"start": "13.1.2", "end": "sem:tamp", "rel": "Sections"}, {"start": "13.2", "end": "13.2.1", "rel": "Sections"}, {"start": "13.2", "end": "13.2.2", "rel": "Sections"}, {"start": "13.2", "end": "str:contiguity-of-serial-verbs", "rel": "Sections"}, {"start": "13.2", "end": "str:incorporation-of-serial-verbs", "rel": "Sections"}, {"start": "13.2", "end": "str:locus-of-inflection-of-serial-verbs", "rel": "Sections"}, {"start": "13.2.1", "end": "inf:pragmatic-assertion", "rel": "Sections"}, {"start": "13.2.2", "end": "str:serial-verb-strategy", "rel": "Sections"}, {"start": "13.3", "end": "13.3.2", "rel": "Sections"}, {"start": "13.3.2", "end": "str:contiguity-of-serial-verbs", "rel": "Sections"}, {"start": "13.3.2", "end": "str:incorporation-of-serial-verbs", "rel": "Sections"}, {"start": "13.3.2", "end": "str:locus-of-inflection-of-serial-verbs", "rel": "Sections"}, {"start": "13.4", "end": "cxn:auxiliary", "rel": "Sections"}, {"start": "13.4", "end": "cxn:auxiliary-construction", "rel": "Sections"}, {"start": "13.4", "end": "def:lexicalization", "rel": "Sections"}, {"start": "13.4", "end": "sem:tense", "rel": "Sections"}, {"start": "13.4", "end": "str:second-position", "rel": "Sections"}, {"start": "13.4", "end": "str:stamp-strategy", "rel": "Sections"}, {"start": "13.5", "end": "cxn:support-verb", "rel": "Sections"}, {"start": "13.5", "end": "cxn:support-verb-construction", "rel": "Sections"}, {"start": "13.6", "end": "cxn:argument-complex-predicate", "rel": "Sections"}, {"start": "13.6", "end": "cxn:pronominal-argument-complex-predicate", "rel": "Sections"}, {"start": "13.6", "end": "str:cognate-head-dependent-strategy", "rel": "Sections"}, {"start": "14", "end": "14.1", "rel": "Sections"}, {"start": "14", "end": "14.2", "rel": "Sections"}, {"start": "14", "end": "14.3", "rel": "Sections"}, {"start": "14", "end": "14.4", "rel": "Sections"}, {"start": "14", "end": "14.5", "rel": "Sections"}, {"start": "14.1", "end": "cxn:depictive-complex-predicate", "rel": "Sections"}, {"start": "14.1", "end": "cxn:manner-complex-predicate", "rel": "Sections"}, {"start": "14.1", "end": "cxn:resultative-complex-predicate", "rel": "Sections"}, {"start": "14.1", "end": "cxn:stative-complex-predicate", "rel": "Sections"}, {"start": "14.1", "end": "sem:event-oriented", "rel": "Sections"}, {"start": "14.1", "end": "sem:participant-oriented", "rel": "Sections"}, {"start": "14.2", "end": "cxn:manner-of-motion-verb", "rel": "Sections"}, {"start": "14.2", "end": "cxn:path-verb", "rel": "Sections"}, {"start": "14.2", "end": "sem:manner-of-motion-event", "rel": "Sections"}, {"start": "14.2", "end": "sem:path-event", "rel": "Sections"}, {"start": "14.2", "end": "str:adjective-impersonal-strategy", "rel": "Sections"}, {"start": "14.2", "end": "str:adjective-personal-strategy", "rel": "Sections"}, {"start": "14.2", "end": "str:adpositional-personal-strategy", "rel": "Sections"}, {"start": "14.2", "end": "str:adpositional-strategy", "rel": "Sections"}, {"start": "14.2", "end": "str:adverbial-strategy", "rel": "Sections"}, {"start": "14.2", "end": "str:balancing", "rel": "Sections"}, {"start": "14.2", "end": "str:converb-strategy", "rel": "Sections"}, {"start": "14.2", "end": "str:coordinate-impersonal-strategy", "rel": "Sections"}, {"start": "14.2", "end": "str:coordinate-personal-strategy", "rel": "Sections"}, {"start": "14.2", "end": "str:copular-participle-strategy", "rel": "Sections"}, {"start": "14.2", "end": "str:deranking", "rel": "Sections"}, {"start": "14.2", "end": "str:indexed", "rel": "Sections"}, {"start": "14.2", "end": "str:non-indexed", "rel": "Sections"}, {"start": "14.2", "end": "str:participial-strategy", "rel": "Sections"}, {"start": "14.2", "end": "str:predicational-strategy", "rel": "Sections"}, {"start": "14.2", "end": "str:satellite", "rel": "Sections"}, {"start": "14.3", "end": "def:modification-predication-continuum", "rel": "Sections"}, {"start": "14.3", "end": "inf:appositive-modification", "rel": "Sections"}, {"start": "14.3", "end": "inf:complementative", "rel": "Sections"}, {"start": "14.3", "end": "inf:restrictive-modification", "rel": "Sections"}, {"start": "14.4", "end": "cxn:motion-verb", "rel": "Sections"}, {"start": "14.4", "end": "sem:arrival", "rel": "Sections"}, {"start": "14.4", "end": "sem:departure", "rel": "Sections"}, {"start": "14.4", "end": "sem:motion-event", "rel": "Sections"}, {"start": "14.4", "end": "sem:passing", "rel": "Sections"}, {"start": "14.4", "end": "str:ideophones", "rel": "Sections"}, {"start": "14.4", "end": "str:phenomime", "rel": "Sections"}, {"start": "14.4", "end": "str:phonomime", "rel": "Sections"}, {"start": "14.4", "end": "str:psychomime", "rel": "Sections"}, {"start": "14.5", "end": "sem:figure", "rel": "Sections"}, {"start": "14.5", "end": "sem:ground", "rel": "Sections"}, {"start": "14.5", "end": "str:double-expression", "rel": "Sections"}, {"start": "14.5", "end": "str:figure-incorporating", "rel": "Sections"}, {"start": "15", "end": "15.1", "rel": "Sections"}, {"start": "15", "end": "15.2", "rel": "Sections"}, {"start": "15", "end": "15.3", "rel": "Sections"}, {"start": "15.1", "end": "15.1.1", "rel": "Sections"}, {"start": "15.1", "end": "15.1.2", "rel": "Sections"}, {"start": "15.1", "end": "15.1.3", "rel": "Sections"}, {"start": "15.1.1", "end": "cxn:complex-sentence", "rel": "Sections"}, {"start": "15.1.1", "end": "cxn:discourse-markers", "rel": "Sections"}, {"start": "15.1.2", "end": "cxn:dependent-clause", "rel": "Sections"}, {"start": "15.1.2", "end": "cxn:main-clause", "rel": "Sections"}, {"start": "15.1.2", "end": "cxn:subordinate-clause", "rel": "Sections"}, {"start": "15.1.2", "end": "inf:pragmatic-assertion", "rel": "Sections"}, {"start": "15.1.3", "end": "inf:complex-figure", "rel": "Sections"}, {"start": "15.1.3", "end": "inf:figure-ground", "rel": "Sections"}, {"start": "15.1.3", "end": "sem:anterior", "rel": "Sections"}, {"start": "15.1.3", "end": "sem:consecutive", "rel": "Sections"}, {"start": "15.1.3", "end": "sem:posterior", "rel": "Sections"}, {"start": "15.1.3", "end": "str:tense-iconicity", "rel": "Sections"}, {"start": "15.2", "end": "15.2.1", "rel": "Sections"}, {"start": "15.2", "end": "15.2.2", "rel": "Sections"}, {"start": "15.2", "end": "15.2.3", "rel": "Sections"}, {"start": "15.2.1", "end": "cxn:adversative-coordination", "rel": "Sections"}, {"start": "15.2.1", "end": "cxn:conjunctive-coordination", "rel": "Sections"}, {"start": "15.2.1", "end": "cxn:coordinand", "rel": "Sections"}, {"start": "15.2.1", "end": "cxn:coordinate-clause-construction", "rel": "Sections"}, {"start": "15.2.1", "end": "cxn:disjunctive-coordination", "rel": "Sections"}, {"start": "15.2.1", "end": "cxn:exclusive-disjunctive-coordination", "rel": "Sections"}, {"start": "15.2.1", "end": "cxn:exhaustive-list-coordination", "rel": "Sections"}, {"start": "15.2.1", "end": "cxn:inclusive-disjunctive-coordination", "rel": "Sections"}, {"start": "15.2.1", "end": "cxn:non-exhaustive-list-coordination", "rel": "Sections"}, {"start": "15.2.1", "end": "sem:additive", "rel": "Sections"}, {"start": "15.2.1", "end": "sem:simple-contrast", "rel": "Sections"}, {"start": "15.2.1", "end": "sem:unexpected-co-occurrence", "rel": "Sections"}, {"start": "15.2.2", "end": "str:asyndetic", "rel": "Sections"}, {"start": "15.2.2", "end": "str:bisyndetic", "rel": "Sections"}, {"start": "15.2.2", "end": "str:conjunction", "rel": "Sections"}, {"start": "15.2.2", "end": "str:coordinator", "rel": "Sections"}, {"start": "15.2.2", "end": "str:general-extender", "rel": "Sections"}, {"start": "15.2.2", "end": "str:monosyndetic", "rel": "Sections"}, {"start": "15.2.2", "end": "str:summarizer", "rel": "Sections"}, {"start": "15.2.2", "end": "str:syndetic", "rel": "Sections"}, {"start": "15.2.3", "end": "str:anterior-deranking", "rel": "Sections"}, {"start": "15.2.3", "end": "str:balancing", "rel": "Sections"}, {"start": "15.2.3", "end": "str:deranking", "rel": "Sections"}, {"start": "15.2.3", "end": "str:insubordination", "rel": "Sections"}, {"start": "15.2.3", "end": "str:posterior-deranking", "rel": "Sections"}, {"start": "15.3", "end": "15.3.1", "rel": "Sections"}, {"start": "15.3", "end": "15.3.2", "rel": "Sections"}, {"start": "15.3.1", "end": "cxn:adverbial-clause-construction", "rel": "Sections"}, {"start": "15.3.1", "end": "cxn:adverbial-dependent-clause", "rel": "Sections"}, {"start": "15.3.1", "end": "sem:apprehensional", "rel": "Sections"}, {"start": "15.3.1", "end": "sem:causal", "rel": "Sections"}, {"start": "15.3.1", "end": "sem:means", "rel": "Sections"}, {"start": "15.3.1", "end": "sem:negative-circumstantial", "rel": "Sections"}, {"start": "15.3.1", "end": "sem:purpose", "rel": "Sections"}, {"start": "15.3.1", "end": "sem:simultaneous", "rel": "Sections"}, {"start": "15.3.1", "end": "sem:substitutive", "rel": "Sections"}, {"start": "15.3.1", "end": "sem:subtractive", "rel": "Sections"}, {"start": "15.3.2", "end": "str:action-nominal", "rel": "Sections"}, {"start": "15.3.2", "end": "str:adverbializer", "rel": "Sections"}, {"start": "16", "end": "16.1", "rel": "Sections"}, {"start": "16", "end": "16.2", "rel": "Sections"}, {"start": "16", "end": "16.3", "rel": "Sections"}, {"start": "16", "end": "16.4", "rel": "Sections"}, {"start": "16", "end": "16.5", "rel": "Sections"}, {"start": "16.1", "end": "cxn:reference-tracking-construction", "rel": "Sections"}, {"start": "16.1", "end": "inf:coreference", "rel": "Sections"}, {"start": "16.1", "end": "inf:different-subject", "rel": "Sections"}, {"start": "16.1", "end": "inf:same-subject", "rel": "Sections"}, {"start": "16.2", "end": "str:conditional-discourse-reference-system", "rel": "Sections"}, {"start": "16.2", "end": "str:discourse-reference-system", "rel": "Sections"}, {"start": "16.3", "end": "str:absolute-deranking-system", "rel": "Sections"}, {"start": "16.3", "end": "str:conditional-deranking", "rel": "Sections"}, {"start": "16.4", "end": "str:switch-reference-system", "rel": "Sections"}, {"start": "16.5", "end": "cxn:object-identity-construction", "rel": "Sections"}, {"start": "16.5", "end": "cxn:predicate-identity-construction", "rel": "Sections"}, {"start": "16.5", "end": "cxn:subject-identity-construction", "rel": "Sections"}, {"start": "17", "end": "17.2", "rel": "Sections"}, {"start": "17", "end": "17.3", "rel": "Sections"}, {"start": "17", "end": "17.4", "rel": "Sections"}, {"start": "17.2", "end": "17.2.1", "rel": "Sections"}, {"start": "17.2", "end": "17.2.2", "rel": "Sections"}, {"start": "17.2", "end": "17.2.3", "rel": "Sections"}, {"start": "17.2", "end": "17.2.4", "rel": "Sections"}, {"start": "17.2.1", "end": "cxn:comparative-construction", "rel": "Sections"}, {"start": "17.2.1", "end": "sem:causal", "rel": "Sections"}, {"start": "17.2.1", "end": "sem:comparee", "rel": "Sections"}, {"start": "17.2.1", "end": "sem:gradable-predicative-scale", "rel": "Sections"}, {"start": "17.2.1", "end": "sem:standard", "rel": "Sections"}, {"start": "17.2.2", "end": "str:allative-comparative", "rel": "Sections"}, {"start": "17.2.2", "end": "str:conjoined-comparative", "rel": "Sections"}, {"start": "17.2.2", "end": "str:degree-marker", "rel": "Sections"}, {"start": "17.2.2", "end": "str:derived-case", "rel": "Sections"}, {"start": "17.2.2", "end": "str:exceed-comparative", "rel": "Sections"}, {"start": "17.2.2", "end": "str:fixed-case", "rel": "Sections"}, {"start": "17.2.2", "end": "str:locative-comparative", "rel": "Sections"}, {"start": "17.2.2", "end": "str:particle-comparative", "rel": "Sections"}, {"start": "17.2.2", "end": "str:separative-comparative", "rel": "Sections"}, {"start": "17.2.3", "end": "str:conjoined-exceed-comparative", "rel": "Sections"}, {"start": "17.2.3", "end": "str:independent-strategy", "rel": "Sections"}, {"start": "17.2.3", "end": "str:ordered-strategy", "rel": "Sections"}, {"start": "17.2.3", "end": "str:relative-strategy", "rel": "Sections"}, {"start": "17.2.4", "end": "cxn:equative-construction", "rel": "Sections"}, {"start": "17.2.4", "end": "sem:comparee", "rel": "Sections"}, {"start": "17.2.4", "end": "str:associative-equative", "rel": "Sections"}, {"start": "17.2.4", "end": "str:degree-equative", "rel": "Sections"}, {"start": "17.2.4", "end": "str:equal-equative", "rel": "Sections"}, {"start": "17.2.4", "end": "str:particle-equative", "rel": "Sections"}, {"start": "17.2.4", "end": "str:relative-based-equative", "rel": "Sections"}, {"start": "17.2.4", "end": "str:relative-equal-equative", "rel": "Sections"}, {"start": "17.3", "end": "17.3.1", "rel": "Sections"}, {"start": "17.3", "end": "17.3.2", "rel": "Sections"}, {"start": "17.3", "end": "17.3.3", "rel": "Sections"}, {"start": "17.3.1", "end": "cxn:apodosis-clause", "rel": "Sections"}, {"start": "17.3.1", "end": "cxn:conditional-construction", "rel": "Sections"}, {"start": "17.3.1", "end": "cxn:generic-conditional-construction", "rel": "Sections"}, {"start": "17.3.1", "end": "cxn:protasis-clause", "rel": "Sections"}, {"start": "17.3.1", "end": "sem:apodosis", "rel": "Sections"}, {"start": "17.3.1", "end": "sem:conditional-relation", "rel": "Sections"}, {"start": "17.3.1", "end": "sem:content-causal-relation", "rel": "Sections"}, {"start": "17.3.1", "end": "sem:epistemic-causal-relation", "rel": "Sections"}, {"start": "17.3.1", "end": "sem:epistemic-stance", "rel": "Sections"}, {"start": "17.3.1", "end": "sem:generic-conditional-relation", "rel": "Sections"}, {"start": "17.3.1", "end": "sem:hypothetical", "rel": "Sections"}, {"start": "17.3.1", "end": "sem:mental-space", "rel": "Sections"}, {"start": "17.3.1", "end": "sem:negative-epistemic-stance", "rel": "Sections"}, {"start": "17.3.1", "end": "sem:neutral-epistemic-stance", "rel": "Sections"}, {"start": "17.3.1", "end": "sem:positive-epistemic-stance", "rel": "Sections"}, {"start": "17.3.1", "end": "sem:protasis", "rel": "Sections"}, {"start": "17.3.1", "end": "sem:speech-act-causal-relation", "rel": "Sections"}, {"start": "17.3.2", "end": "cxn:concessive-construction", "rel": "Sections"}, {"start": "17.3.2", "end": "sem:causal", "rel": "Sections"}, {"start": "17.3.2", "end": "sem:concessive-relation", "rel": "Sections"}, {"start": "17.3.3", "end": "cxn:concessive-conditional-construction", "rel": "Sections"}, {"start": "17.3.3", "end": "sem:concessive-conditional-relation", "rel": "Sections"}, {"start": "17.3.3", "end": "sem:scalar-model", "rel": "Sections"}, {"start": "17.3.3", "end": "str:alternative-concessive-conditional-strategy", "rel": "Sections"}, {"start": "17.3.3", "end": "str:scalar-concessive-conditional-strategy", "rel": "Sections"}, {"start": "17.3.3", "end": "str:universal-concessive-conditional-strategy", "rel": "Sections"}, {"start": "17.4", "end": "17.4.1", "rel": "Sections"}, {"start": "17.4", "end": "17.4.2", "rel": "Sections"}, {"start": "17.4.1", "end": "cxn:comparative-conditional-construction", "rel": "Sections"}, {"start": "17.4.1", "end": "sem:comparative-conditional-relation", "rel": "Sections"}, {"start": "17.4.2", "end": "cxn:let-alone-construction", "rel": "Sections"}, {"start": "18", "end": "18.2", "rel": "Sections"}, {"start": "18", "end": "18.3", "rel": "Sections"}, {"start": "18", "end": "18.4", "rel": "Sections"}, {"start": "18.2", "end": "18.2.1", "rel": "Sections"}, {"start": "18.2", "end": "18.2.2", "rel": "Sections"}, {"start": "18.2.1", "end": "cxn:complement", "rel": "Sections"}, {"start": "18.2.1", "end": "cxn:complement-clause-construction", "rel": "Sections"}, {"start": "18.2.1", "end": "cxn:complement-taking-predicate", "rel": "Sections"}, {"start": "18.2.2", "end": "cxn:commentative-predicate", "rel": "Sections"}, {"start": "18.2.2", "end": "cxn:desiderative-predicate", "rel": "Sections"}, {"start": "18.2.2", "end": "cxn:evaluative-predicate", "rel": "Sections"}, {"start": "18.2.2", "end": "cxn:fearing-predicate", "rel": "Sections"}, {"start": "18.2.2", "end": "cxn:hoping-predicate", "rel": "Sections"}, {"start": "18.2.2", "end": "cxn:knowledge-predicate", "rel": "Sections"}, {"start": "18.2.2", "end": "cxn:manipulative-predicate", "rel": "Sections"}, {"start": "18.2.2", "end": "cxn:perception-complement-taking-predicate", "rel": "Sections"}, {"start": "18.2.2", "end": "cxn:pretense-predicate", "rel": "Sections"}, {"start": "18.2.2", "end": "cxn:propositional-attitude-predicate", "rel": "Sections"}, {"start": "18.2.2", "end": "cxn:utterance-predicate", "rel": "Sections"}, {"start": "18.2.2", "end": "cxn:wishing-predicate", "rel": "Sections"}, {"start": "18.2.2", "end": "sem:achievement", "rel": "Sections"}, {"start": "18.2.2", "end": "sem:commentative-event", "rel": "Sections"}, {"start": "18.2.2", "end": "sem:dependent-time-reference", "rel": "Sections"}, {"start": "18.2.2", "end": "sem:desiderative-event", "rel": "Sections"}, {"start": "18.2.2", "end": "sem:evaluative-event", "rel": "Sections"}, {"start": "18.2.2", "end": "sem:fearing-event", "rel": "Sections"}, {"start": "18.2.2", "end": "sem:hoping-event", "rel": "Sections"}, {"start": "18.2.2", "end": "sem:independent-time-reference", "rel": "Sections"}, {"start": "18.2.2", "end": "sem:knowledge-event", "rel": "Sections"}, {"start": "18.2.2", "end": "sem:manipulative-event", "rel": "Sections"}, {"start": "18.2.2", "end": "sem:mental-space", "rel": "Sections"}, {"start": "18.2.2", "end": "sem:necessary-participant-sharing", "rel": "Sections"}, {"start": "18.2.2", "end": "sem:phasal-aspect", "rel": "Sections"}, {"start": "18.2.2", "end": "sem:pretense-event", "rel": "Sections"}, {"start": "18.2.2", "end": "sem:proposition", "rel": "Sections"}, {"start": "18.2.2", "end": "sem:propositional-attitude-event", "rel": "Sections"}, {"start": "18.2.2", "end": "sem:utterance-event", "rel": "Sections"}, {"start": "18.2.2", "end": "sem:wishing-event", "rel": "Sections"}, {"start": "18.2.2", "end": "str:direct-report", "rel": "Sections"}, {"start": "18.2.2", "end": "str:indirect-report", "rel": "Sections"}, {"start": "18.3", "end": "18.3.1", "rel": "Sections"}, {"start": "18.3", "end": "18.3.2", "rel": "Sections"}, {"start": "18.3.1", "end": "cxn:interrogative-complement", "rel": "Sections"}, {"start": "18.3.1", "end": "def:binding-hierarchy", "rel": "Sections"}, {"start": "18.3.1", "end": "str:complementizer", "rel": "Sections"}, {"start": "18.3.2", "end": "str:direct-report", "rel": "Sections"}, {"start": "18.3.2", "end": "str:quotative-marker", "rel": "Sections"}, {"start": "18.4", "end": "18.4.1", "rel": "Sections"}, {"start": "18.4", "end": "18.4.2", "rel": "Sections"}, {"start": "18.4.1", "end": "str:merged-argument-structure-strategy", "rel": "Sections"}, {"start": "18.4.1", "end": "str:partially-merged-argument-structure-strategy", "rel": "Sections"}, {"start": "18.4.1", "end": "str:split-argument-structure-strategy", "rel": "Sections"}, {"start": "18.4.2", "end": "cxn:logophoric-construction", "rel": "Sections"}, {"start": "18.4.2", "end": "str:logophoric-system", "rel": "Sections"}, {"start": "18.4.2", "end": "str:long-distance-reflexive", "rel": "Sections"}, {"start": "19", "end": "19.1", "rel": "Sections"}, {"start": "19", "end": "19.2", "rel": "Sections"}, {"start": "19", "end": "19.3", "rel": "Sections"}, {"start": "19", "end": "19.4", "rel": "Sections"}, {"start": "19.1", "end": "cxn:relative-clause", "rel": "Sections"}, {"start": "19.1", "end": "cxn:relative-clause-construction", "rel": "Sections"}, {"start": "19.1", "end": "cxn:relative-clause-head", "rel": "Sections"}, {"start": "19.2", "end": "19.2.1", "rel": "Sections"}, {"start": "19.2", "end": "19.2.2", "rel": "Sections"}, {"start": "19.2", "end": "19.2.3", "rel": "Sections"}, {"start": "19.2", "end": "19.2.4", "rel": "Sections"}, {"start": "19.2.1", "end": "str:participle", "rel": "Sections"}, {"start": "19.2.1", "end": "str:relativizer", "rel": "Sections"}, {"start": "19.2.2", "end": "str:externally-headed", "rel": "Sections"}, {"start": "19.2.2", "end": "str:gap-strategy", "rel": "Sections"}, {"start": "19.2.2", "end": "str:postnominal-strategy", "rel": "Sections"}, {"start": "19.2.2", "end": "str:prenominal-strategy", "rel": "Sections"}, {"start": "19.2.2", "end": "str:pronoun-retention-strategy", "rel": "Sections"}, {"start": "19.2.2", "end": "str:relative-pronoun-strategy", "rel": "Sections"}, {"start": "19.2.3", "end": "str:adjoined-strategy", "rel": "Sections"}, {"start": "19.2.3", "end": "str:correlative-strategy", "rel": "Sections"}, {"start": "19.2.3", "end": "str:internally-headed-strategy", "rel": "Sections"}, {"start": "19.2.4", "end": "cxn:noun-complement", "rel": "Sections"}, {"start": "19.2.4", "end": "cxn:noun-complement-clause-construction", "rel": "Sections"}, {"start": "19.2.4", "end": "str:extraposed-strategy", "rel": "Sections"}, {"start": "19.2.4", "end": "str:noun-modifying-clause-strategy", "rel": "Sections"}, {"start": "19.3", "end": "def:accessibility-hierarchy", "rel": "Sections"}, {"start": "19.3", "end": "def:explicitness", "rel": "Sections"}, {"start": "19.3", "end": "str:verb-coding-strategy", "rel": "Sections"}, {"start": "19.4", "end": "cxn:anaphoric-head-construction", "rel": "Sections"}, {"start": "19.4", "end": "cxn:anaphoric-head-relative-clause-construction", "rel": "Sections"}, {"start": "19.4", "end": "cxn:free-relative-clause-construction", "rel": "Sections"}, {"start": "2", "end": "2.1", "rel": "Sections"}, {"start": "2", "end": "2.2", "rel": "Sections"}, {"start": "2", "end": "2.3", "rel": "Sections"}, {"start": "2", "end": "2.4", "rel": "Sections"}, {"start": "2", "end": "2.5", "rel": "Sections"}, {"start": "2.1", "end": "def:file-metaphor", "rel": "Sections"}, {"start": "2.1", "end": "def:ontology", "rel": "Sections"}, {"start": "2.1", "end": "inf:modification", "rel": "Sections"}, {"start": "2.1", "end": "inf:predication", "rel": "Sections"}, {"start": "2.1", "end": "inf:reference", "rel": "Sections"}, {"start": "2.1", "end": "sem:action-concept", "rel": "Sections"}, {"start": "2.1", "end": "sem:dynamic", "rel": "Sections"}, {"start": "2.1", "end": "sem:entity", "rel": "Sections"}, {"start": "2.1", "end": "sem:event", "rel": "Sections"}, {"start": "2.1", "end": "sem:nonrelational", "rel": "Sections"}, {"start": "2.1", "end": "sem:object-concept", "rel": "Sections"}, {"start": "2.1", "end": "sem:persistent", "rel": "Sections"}, {"start": "2.1", "end": "sem:property-concept", "rel": "Sections"}, {"start": "2.1", "end": "sem:relational", "rel": "Sections"}, {"start": "2.1", "end": "sem:state", "rel": "Sections"}, {"start": "2.1", "end": "sem:stative", "rel": "Sections"}, {"start": "2.1", "end": "sem:transitory", "rel": "Sections"}, {"start": "2.2", "end": "2.2.1", "rel": "Sections"}, {"start": "2.2", "end": "2.2.2", "rel": "Sections"}, {"start": "2.2", "end": "2.2.3", "rel": "Sections"}, {"start": "2.2", "end": "2.2.4", "rel": "Sections"}, {"start": "2.2", "end": "2.2.5", "rel": "Sections"}, {"start": "2.2.1", "end": "cxn:dependent", "rel": "Sections"}, {"start": "2.2.1", "end": "cxn:element", "rel": "Sections"}, {"start": "2.2.1", "end": "cxn:head", "rel": "Sections"}, {"start": "2.2.2", "end": "cxn:admodifier", "rel": "Sections"}, {"start": "2.2.2", "end": "cxn:argument-phrase", "rel": "Sections"}, {"start": "2.2.2", "end": "cxn:attributive-phrase", "rel": "Sections"}, {"start": "2.2.2", "end": "cxn:clause", "rel": "Sections"}, {"start": "2.2.2", "end": "cxn:complex-predicate", "rel": "Sections"}, {"start": "2.2.2", "end": "cxn:referring-phrase", "rel": "Sections"}, {"start": "2.2.2", "end": "cxn:topic-comment-construction", "rel": "Sections"}, {"start": "2.2.2", "end": "inf:admodification", "rel": "Sections"}, {"start": "2.2.2", "end": "inf:topic-comment", "rel": "Sections"}, {"start": "2.2.2", "end": "sem:degree", "rel": "Sections"}, {"start": "2.2.3", "end": "cxn:adjectival-phrase", "rel": "Sections"}, {"start": "2.2.3", "end": "cxn:adjective", "rel": "Sections"}, {"start": "2.2.3", "end": "cxn:nominal-phrase", "rel": "Sections"}, {"start": "2.2.3", "end": "cxn:noun", "rel": "Sections"}, {"start": "2.2.3", "end": "cxn:prototypical-construction", "rel": "Sections"}, {"start": "2.2.3", "end": "cxn:verb", "rel": "Sections"}, {"start": "2.2.3", "end": "cxn:verbal-clause", "rel": "Sections"}, {"start": "2.2.4", "end": "cxn:clause", "rel": "Sections"}, {"start": "2.2.4", "end": "cxn:modification-construction", "rel": "Sections"}, {"start": "2.2.4", "end": "cxn:modifier", "rel": "Sections"}, {"start": "2.2.4", "end": "cxn:predicate", "rel": "Sections"}, {"start": "2.2.4", "end": "cxn:referent-expression", "rel": "Sections"}, {"start": "2.2.5", "end": "cxn:complement", "rel": "Sections"}, {"start": "2.2.5", "end": "cxn:nominal-modification-construction", "rel": "Sections"}, {"start": "2.2.5", "end": "cxn:nonprototypical-construction", "rel": "Sections"}, {"start": "2.2.5", "end": "cxn:predicate-adjectival-construction", "rel": "Sections"}, {"start": "2.2.5", "end": "cxn:predicate-nominal-construction", "rel": "Sections"}, {"start": "2.2.5", "end": "cxn:property-referring-phrase", "rel": "Sections"}, {"start": "2.2.5", "end": "cxn:relative-clause-construction", "rel": "Sections"}, {"start": "2.3", "end": "def:grammaticalization", "rel": "Sections"}, {"start": "2.4", "end": "def:behavioral-potential", "rel": "Sections"}, {"start": "2.4", "end": "str:actual-information-packaging-strategy", "rel": "Sections"}, {"start": "2.4", "end": "str:hybrid-information-packaging-strategy", "rel": "Sections"}, {"start": "2.4", "end": "str:overt-coding", "rel": "Sections"}, {"start": "2.4", "end": "str:semantic-information-packaging-strategy", "rel": "Sections"}, {"start": "2.4", "end": "str:zero-coding", "rel": "Sections"}, {"start": "2.5", "end": "def:behavioral-potential", "rel": "Sections"}, {"start": "2.5", "end": "def:structural-coding", "rel": "Sections"}, {"start": "2.5", "end": "def:token-frequency", "rel": "Sections"}, {"start": "3", "end": "3.1", "rel": "Sections"}, {"start": "3", "end": "3.2", "rel": "Sections"}, {"start": "3", "end": "3.3", "rel": "Sections"}, {"start": "3", "end": "3.4", "rel": "Sections"}, {"start": "3", "end": "3.5", "rel": "Sections"}, {"start": "3", "end": "3.6", "rel": "Sections"}, {"start": "3.1", "end": "3.1.1", "rel": "Sections"}, {"start": "3.1", "end": "3.1.2", "rel": "Sections"}, {"start": "3.1", "end": "3.1.3", "rel": "Sections"}, {"start": "3.1", "end": "cxn:noun", "rel": "Sections"}, {"start": "3.1", "end": "cxn:personal-pronoun", "rel": "Sections"}, {"start": "3.1", "end": "cxn:referring-phrase", "rel": "Sections"}, {"start": "3.1.1", "end": "cxn:common-noun", "rel": "Sections"}, {"start": "3.1.1", "end": "cxn:demonstrative-pronoun", "rel": "Sections"}, {"start": "3.1.1", "end": "cxn:exclusive-pronoun", "rel": "Sections"}, {"start": "3.1.1", "end": "cxn:first-person-pronoun", "rel": "Sections"}, {"start": "3.1.1", "end": "cxn:inclusive-pronoun", "rel": "Sections"}, {"start": "3.1.1", "end": "cxn:pronoun", "rel": "Sections"}, {"start": "3.1.1", "end": "cxn:proper-noun", "rel": "Sections"}, {"start": "3.1.1", "end": "cxn:second-person-pronoun", "rel": "Sections"}, {"start": "3.1.1", "end": "cxn:third-person-pronoun", "rel": "Sections"}, {"start": "3.1.1", "end": "def:speech-act-situation", "rel": "Sections"}, {"start": "3.1.1", "end": "inf:generic-referent", "rel": "Sections"}, {"start": "3.1.1", "end": "sem:contextual", "rel": "Sections"}, {"start": "3.1.1", "end": "sem:distal", "rel": "Sections"}, {"start": "3.1.1", "end": "sem:person-deixis", "rel": "Sections"}, {"start": "3.1.1", "end": "sem:proximal", "rel": "Sections"}, {"start": "3.1.1", "end": "sem:spatial-deixis", "rel": "Sections"}, {"start": "3.1.1", "end": "sem:token", "rel": "Sections"}, {"start": "3.1.1", "end": "sem:type", "rel": "Sections"}, {"start": "3.1.2", "end": "def:animacy-hierarchy", "rel": "Sections"}, {"start": "3.1.2", "end": "def:extended-animacy-hierarchy", "rel": "Sections"}, {"start": "3.1.2", "end": "sem:animate", "rel": "Sections"}, {"start": "3.1.2", "end": "sem:human", "rel": "Sections"}, {"start": "3.1.2", "end": "sem:inanimate", "rel": "Sections"}, {"start": "3.1.2", "end": "sem:object-concept", "rel": "Sections"}, {"start": "3.1.3", "end": "cxn:demonstrative-attributive", "rel": "Sections"}, {"start": "3.1.3", "end": "cxn:demonstrative-pronoun", "rel": "Sections"}, {"start": "3.1.3", "end": "def:ontological-categories", "rel": "Sections"}, {"start": "3.1.3", "end": "inf:accessibility", "rel": "Sections"}, {"start": "3.2", "end": "cxn:article", "rel": "Sections"}, {"start": "3.2", "end": "cxn:demonstrative-attributive", "rel": "Sections"}, {"start": "3.2", "end": "cxn:demonstrative-pronoun", "rel": "Sections"}, {"start": "3.2", "end": "cxn:determiner", "rel": "Sections"}, {"start": "3.2", "end": "def:particularizing", "rel": "Sections"}, {"start": "3.2", "end": "inf:identifiability", "rel": "Sections"}, {"start": "3.2", "end": "inf:information-status", "rel": "Sections"}, {"start": "3.3", "end": "3.3.1", "rel": "Sections"}, {"start": "3.3", "end": "3.3.2", "rel": "Sections"}, {"start": "3.3", "end": "3.3.3", "rel": "Sections"}, {"start": "3.3.1", "end": "cxn:anaphoric-article", "rel": "Sections"}, {"start": "3.3.1", "end": "cxn:anaphoric-pronoun", "rel": "Sections"}, {"start": "3.3.1", "end": "cxn:nonanaphoric-definite-article", "rel": "Sections"}, {"start": "3.3.1", "end": "def:accessibility-scale", "rel": "Sections"}, {"start": "3.3.1", "end": "inf:accessibility", "rel": "Sections"}, {"start": "3.3.1", "end": "inf:active-referent", "rel": "Sections"}, {"start": "3.3.1", "end": "inf:inactive-referent", "rel": "Sections"}, {"start": "3.3.1", "end": "inf:inferrable-referent", "rel": "Sections"}, {"start": "3.3.1", "end": "inf:semi-active-referent", "rel": "Sections"}, {"start": "3.3.1", "end": "str:zero-anaphora", "rel": "Sections"}, {"start": "3.3.2", "end": "str:indexation", "rel": "Sections"}, {"start": "3.3.3", "end": "inf:discourse-deixis", "rel": "Sections"}, {"start": "3.3.3", "end": "str:doubling", "rel": "Sections"}, {"start": "3.4", "end": "3.4.1", "rel": "Sections"}, {"start": "3.4", "end": "3.4.2", "rel": "Sections"}, {"start": "3.4.1", "end": "cxn:pragmatically-nonspecific-article", "rel": "Sections"}, {"start": "3.4.1", "end": "cxn:pragmatically-nonspecific-pronoun", "rel": "Sections"}, {"start": "3.4.1", "end": "cxn:pragmatically-specific-article", "rel": "Sections"}, {"start": "3.4.1", "end": "cxn:pragmatically-specific-pronoun", "rel": "Sections"}, {"start": "3.4.1", "end": "inf:actor", "rel": "Sections"}, {"start": "3.4.1", "end": "inf:pragmatically-specific-referent", "rel": "Sections"}, {"start": "3.4.1", "end": "inf:prop", "rel": "Sections"}, {"start": "3.4.1", "end": "inf:semantically-specific-referent", "rel": "Sections"}, {"start": "3.4.1", "end": "inf:setting", "rel": "Sections"}, {"start": "3.4.1", "end": "inf:theater-metaphor", "rel": "Sections"}, {"start": "3.4.2", "end": "cxn:interrogative-pronoun", "rel": "Sections"}, {"start": "3.4.2", "end": "str:nominalizer", "rel": "Sections"}, {"start": "3.5", "end": "cxn:comparative-pronoun", "rel": "Sections"}, {"start": "3.5", "end": "cxn:conditional-pronoun", "rel": "Sections"}, {"start": "3.5", "end": "cxn:direct-negation-pronoun", "rel": "Sections"}, {"start": "3.5", "end": "cxn:free-choice-pronoun", "rel": "Sections"}, {"start": "3.5", "end": "cxn:indirect-negation-pronoun", "rel": "Sections"}, {"start": "3.5", "end": "cxn:irrealis-pronoun", "rel": "Sections"}, {"start": "3.5", "end": "cxn:question-pronoun", "rel": "Sections"}, {"start": "3.5", "end": "cxn:semantically-nonspecific-article", "rel": "Sections"}, {"start": "3.5", "end": "cxn:semantically-nonspecific-pronoun", "rel": "Sections"}, {"start": "3.5", "end": "cxn:specific-known-pronoun", "rel": "Sections"}, {"start": "3.5", "end": "cxn:specific-unknown-pronoun", "rel": "Sections"}, {"start": "3.5", "end": "cxn:universal-pronoun", "rel": "Sections"}, {"start": "3.5", "end": "def:conceptual-space", "rel": "Sections"}, {"start": "3.5", "end": "def:semantic-map", "rel": "Sections"}, {"start": "3.5", "end": "def:semantic-map-model", "rel": "Sections"}, {"start": "3.5", "end": "inf:comparative-referent", "rel": "Sections"}, {"start": "3.5", "end": "inf:conditional-referent", "rel": "Sections"}, {"start": "3.5", "end": "inf:direct-negation-referent", "rel": "Sections"}, {"start": "3.5", "end": "inf:free-choice-referent", "rel": "Sections"}, {"start": "3.5", "end": "inf:indirect-negation-referent", "rel": "Sections"}, {"start": "3.5", "end": "inf:irrealis-referent", "rel": "Sections"}, {"start": "3.5", "end": "inf:nonspecific-referent", "rel": "Sections"}, {"start": "3.5", "end": "inf:question-referent", "rel": "Sections"}, {"start": "3.5", "end": "inf:specific-known-referent", "rel": "Sections"}, {"start": "3.5", "end": "inf:specific-unknown-referent", "rel": "Sections"}, {"start": "3.5", "end": "inf:type-identifiable", "rel": "Sections"}, {"start": "3.6", "end": "cxn:generic-article", "rel": "Sections"}, {"start": "3.6", "end": "cxn:generic-pronoun", "rel": "Sections"}, {"start": "3.6", "end": "inf:generic-referent", "rel": "Sections"}, {"start": "4", "end": "4.1", "rel": "Sections"}, {"start": "4", "end": "4.2", "rel": "Sections"}, {"start": "4", "end": "4.3", "rel": "Sections"}, {"start": "4", "end": "4.4", "rel": "Sections"}, {"start": "4", "end": "4.5", "rel": "Sections"}, {"start": "4", "end": "cxn:modification-construction", "rel": "Sections"}, {"start": "4.1", "end": "4.1.1", "rel": "Sections"}, {"start": "4.1", "end": "4.1.2", "rel": "Sections"}, {"start": "4.1", "end": "4.1.3", "rel": "Sections"}, {"start": "4.1", "end": "4.1.4", "rel": "Sections"}, {"start": "4.1.1", "end": "cxn:adjective", "rel": "Sections"}, {"start": "4.1.1", "end": "cxn:attributive-phrase", "rel": "Sections"}, {"start": "4.1.1", "end": "def:verbalization", "rel": "Sections"}, {"start": "4.1.1", "end": "inf:selecting", "rel": "Sections"}, {"start": "4.1.1", "end": "inf:situating", "rel": "Sections"}, {"start": "4.1.1", "end": "inf:subcategorizing", "rel": "Sections"}, {"start": "4.1.1", "end": "sem:property-concept", "rel": "Sections"}, {"start": "4.1.2", "end": "cxn:admodifier", "rel": "Sections"}, {"start": "4.1.2", "end": "cxn:age-term", "rel": "Sections"}, {"start": "4.1.2", "end": "cxn:antonym", "rel": "Sections"}, {"start": "4.1.2", "end": "cxn:color-term", "rel": "Sections"}, {"start": "4.1.2", "end": "cxn:comparative-form", "rel": "Sections"}, {"start": "4.1.2", "end": "cxn:complementary", "rel": "Sections"}, {"start": "4.1.2", "end": "cxn:dimension-term", "rel": "Sections"}, {"start": "4.1.2", "end": "cxn:downtoner", "rel": "Sections"}, {"start": "4.1.2", "end": "cxn:gender-term", "rel": "Sections"}, {"start": "4.1.2", "end": "cxn:human-propensity-term", "rel": "Sections"}, {"start": "4.1.2", "end": "cxn:intensifier", "rel": "Sections"}, {"start": "4.1.2", "end": "cxn:material-term", "rel": "Sections"}, {"start": "4.1.2", "end": "cxn:measurement", "rel": "Sections"}, {"start": "4.1.2", "end": "cxn:physical-property-term", "rel": "Sections"}, {"start": "4.1.2", "end": "cxn:shape-term", "rel": "Sections"}, {"start": "4.1.2", "end": "cxn:superlative-form", "rel": "Sections"}, {"start": "4.1.2", "end": "cxn:value-term", "rel": "Sections"}, {"start": "4.1.2", "end": "inf:subcategorizing", "rel": "Sections"}, {"start": "4.1.2", "end": "sem:reference-point", "rel": "Sections"}, {"start": "4.1.2", "end": "str:degree-affix", "rel": "Sections"}, {"start": "4.1.2", "end": "str:degree-modifier", "rel": "Sections"}, {"start": "4.1.3", "end": "cxn:amount-term", "rel": "Sections"}, {"start": "4.1.3", "end": "cxn:cardinal-numeral-term", "rel": "Sections"}, {"start": "4.1.3", "end": "cxn:container-term", "rel": "Sections"}, {"start": "4.1.3", "end": "cxn:distributive-quantifier-term", "rel": "Sections"}, {"start": "4.1.3", "end": "cxn:form-term", "rel": "Sections"}, {"start": "4.1.3", "end": "cxn:group-term", "rel": "Sections"}, {"start": "4.1.3", "end": "cxn:measure-term", "rel": "Sections"}, {"start": "4.1.3", "end": "cxn:mensural-term", "rel": "Sections"}, {"start": "4.1.3", "end": "cxn:ordinal-numeral-term", "rel": "Sections"}, {"start": "4.1.3", "end": "cxn:piece-term", "rel": "Sections"}, {"start": "4.1.3", "end": "cxn:proportional-quantifier-term", "rel": "Sections"}, {"start": "4.1.3", "end": "cxn:quantifier-term", "rel": "Sections"}, {"start": "4.1.3", "end": "cxn:set-member-term", "rel": "Sections"}, {"start": "4.1.3", "end": "cxn:species-term", "rel": "Sections"}, {"start": "4.1.3", "end": "cxn:vague-numeral-term", "rel": "Sections"}, {"start": "4.1.3", "end": "inf:selecting", "rel": "Sections"}, {"start": "4.1.3", "end": "sem:numeral", "rel": "Sections"}, {"start": "4.1.4", "end": "cxn:alienable-possession-modification-construction", "rel": "Sections"}, {"start": "4.1.4", "end": "cxn:inalienable-possession-modification-construction", "rel": "Sections"}, {"start": "4.1.4", "end": "cxn:locative-modification-construction", "rel": "Sections"}, {"start": "4.1.4", "end": "cxn:locative-phrase", "rel": "Sections"}, {"start": "4.1.4", "end": "cxn:nominal-modification-construction", "rel": "Sections"}, {"start": "4.1.4", "end": "cxn:possessive-attributive-phrase", "rel": "Sections"}, {"start": "4.1.4", "end": "cxn:possessive-modification-construction", "rel": "Sections"}, {"start": "4.1.4", "end": "sem:body-part-relation", "rel": "Sections"}, {"start": "4.1.4", "end": "sem:figure-ground-spatial-relation", "rel": "Sections"}, {"start": "4.1.4", "end": "sem:kinship-relation", "rel": "Sections"}, {"start": "4.1.4", "end": "sem:ownership", "rel": "Sections"}, {"start": "4.1.4", "end": "sem:part-whole-relation", "rel": "Sections"}, {"start": "4.1.4", "end": "sem:possessor", "rel": "Sections"}, {"start": "4.1.4", "end": "sem:possessum", "rel": "Sections"}, {"start": "4.2", "end": "str:affixation", "rel": "Sections"}, {"start": "4.2", "end": "str:compounding", "rel": "Sections"}, {"start": "4.2", "end": "str:juxtaposition", "rel": "Sections"}, {"start": "4.2", "end": "str:simple-strategy", "rel": "Sections"}, {"start": "4.2", "end": "str:word-order", "rel": "Sections"}, {"start": "4.3", "end": "str:adposition", "rel": "Sections"}, {"start": "4.3", "end": "str:case-affix", "rel": "Sections"}, {"start": "4.3", "end": "str:circumposition", "rel": "Sections"}, {"start": "4.3", "end": "str:flagging", "rel": "Sections"}, {"start": "4.3", "end": "str:postposition", "rel": "Sections"}, {"start": "4.3", "end": "str:preposition", "rel": "Sections"}, {"start": "4.3", "end": "str:relational-strategy", "rel": "Sections"}, {"start": "4.4", "end": "4.4.1", "rel": "Sections"}, {"start": "4.4", "end": "4.4.2", "rel": "Sections"}, {"start": "4.4", "end": "4.4.3", "rel": "Sections"}, {"start": "4.4", "end": "4.4.4", "rel": "Sections"}, {"start": "4.4", "end": "sem:number", "rel": "Sections"}, {"start": "4.4", "end": "str:controller", "rel": "Sections"}, {"start": "4.4", "end": "str:domain", "rel": "Sections"}, {"start": "4.4", "end": "str:index", "rel": "Sections"}, {"start": "4.4", "end": "str:indexation", "rel": "Sections"}, {"start": "4.4", "end": "str:indexation-feature", "rel": "Sections"}, {"start": "4.4", "end": "str:target", "rel": "Sections"}, {"start": "4.4.1", "end": "def:cumulation", "rel": "Sections"}, {"start": "4.4.1", "end": "str:person-indexation", "rel": "Sections"}, {"start": "4.4.2", "end": "sem:gender-class", "rel": "Sections"}, {"start": "4.4.2", "end": "str:nonperson-indexation", "rel": "Sections"}, {"start": "4.4.3", "end": "str:classifier", "rel": "Sections"}, {"start": "4.4.3", "end": "str:repeater", "rel": "Sections"}, {"start": "4.4.4", "end": "cxn:associative-construction", "rel": "Sections"}, {"start": "4.4.4", "end": "cxn:inclusory-construction", "rel": "Sections"}, {"start": "4.4.4", "end": "def:agreement-hierarchy", "rel": "Sections"}, {"start": "4.5", "end": "str:fusion", "rel": "Sections"}, {"start": "4.5", "end": "str:linker", "rel": "Sections"}, {"start": "4.5", "end": "str:special-form", "rel": "Sections"}, {"start": "5", "end": "5.2", "rel": "Sections"}, {"start": "5", "end": "5.3", "rel": "Sections"}, {"start": "5", "end": "5.4", "rel": "Sections"}, {"start": "5", "end": "cxn:modification-construction", "rel": "Sections"}, {"start": "5.2", "end": "5.2.1", "rel": "Sections"}, {"start": "5.2", "end": "5.2.2", "rel": "Sections"}, {"start": "5.2", "end": "5.2.3", "rel": "Sections"}, {"start": "5.2", "end": "5.2.4", "rel": "Sections"}, {"start": "5.2.1", "end": "cxn:anchoring-construction", "rel": "Sections"}, {"start": "5.2.1", "end": "cxn:binominal-lexeme", "rel": "Sections"}, {"start": "5.2.1", "end": "cxn:typifying-construction", "rel": "Sections"}, {"start": "5.2.1", "end": "inf:anchor", "rel": "Sections"}, {"start": "5.2.2", "end": "cxn:mensural-modification-construction", "rel": "Sections"}, {"start": "5.2.2", "end": "cxn:partitive-construction", "rel": "Sections"}, {"start": "5.2.2", "end": "str:mensural-classifier", "rel": "Sections"}, {"start": "5.2.2", "end": "str:pseudo-partitive", "rel": "Sections"}, {"start": "5.2.2", "end": "str:sortal-classifier", "rel": "Sections"}, {"start": "5.2.3", "end": "cxn:inalienable-possession-modification-construction", "rel": "Sections"}, {"start": "5.2.4", "end": "def:modification-reference-continuum", "rel": "Sections"}, {"start": "5.3", "end": "def:prenominal-integration", "rel": "Sections"}, {"start": "5.3", "end": "str:word-order", "rel": "Sections"}, {"start": "5.4", "end": "cxn:anaphoric-head-construction", "rel": "Sections"}, {"start": "5.4", "end": "cxn:apposition", "rel": "Sections"}, {"start": "5.4", "end": "inf:token-identity", "rel": "Sections"}, {"start": "5.4", "end": "inf:type-identity", "rel": "Sections"}, {"start": "5.4", "end": "str:headless", "rel": "Sections"}, {"start": "5.4", "end": "str:overtly-headed-strategy", "rel": "Sections"}, {"start": "6", "end": "6.1", "rel": "Sections"}, {"start": "6", "end": "6.2", "rel": "Sections"}, {"start": "6", "end": "6.3", "rel": "Sections"}, {"start": "6", "end": "6.6", "rel": "Sections"}, {"start": "6", "end": "sem:action-concept", "rel": "Sections"}, {"start": "6.1", "end": "6.1.1", "rel": "Sections"}, {"start": "6.1", "end": "6.1.2", "rel": "Sections"}, {"start": "6.1.1", "end": "cxn:basic-voice", "rel": "Sections"}, {"start": "6.1.1", "end": "cxn:clause", "rel": "Sections"}, {"start": "6.1.1", "end": "cxn:core-argument-phrase", "rel": "Sections"}, {"start": "6.1.1", "end": "cxn:object-phrase", "rel": "Sections"}, {"start": "6.1.1", "end": "cxn:oblique-phrase", "rel": "Sections"}, {"start": "6.1.1", "end": "cxn:subject-phrase", "rel": "Sections"}, {"start": "6.1.1", "end": "cxn:verb", "rel": "Sections"}, {"start": "6.1.1", "end": "inf:topicality", "rel": "Sections"}, {"start": "6.1.1", "end": "sem:aspect", "rel": "Sections"}, {"start": "6.1.1", "end": "sem:causal-chain", "rel": "Sections"}, {"start": "6.1.1", "end": "sem:causal-structure", "rel": "Sections"}, {"start": "6.1.1", "end": "sem:central-participant", "rel": "Sections"}, {"start": "6.1.1", "end": "sem:endpoint", "rel": "Sections"}, {"start": "6.1.1", "end": "sem:event", "rel": "Sections"}, {"start": "6.1.1", "end": "sem:initiator", "rel": "Sections"}, {"start": "6.1.1", "end": "sem:participant-role", "rel": "Sections"}, {"start": "6.1.1", "end": "sem:peripheral-participant", "rel": "Sections"}, {"start": "6.1.1", "end": "sem:semantic-role", "rel": "Sections"}, {"start": "6.1.2", "end": "cxn:change-of-state-verb", "rel": "Sections"}, {"start": "6.1.2", "end": "cxn:ditransitive-construction", "rel": "Sections"}, {"start": "6.1.2", "end": "cxn:experiential-verb", "rel": "Sections"}, {"start": "6.1.2", "end": "cxn:intransitive-construction", "rel": "Sections"}, {"start": "6.1.2", "end": "cxn:transitive-construction", "rel": "Sections"}, {"start": "6.1.2", "end": "sem:agent", "rel": "Sections"}, {"start": "6.1.2", "end": "sem:antecedent-role", "rel": "Sections"}, {"start": "6.1.2", "end": "sem:beneficiary", "rel": "Sections"}, {"start": "6.1.2", "end": "sem:bivalent", "rel": "Sections"}, {"start": "6.1.2", "end": "sem:causal-chain", "rel": "Sections"}, {"start": "6.1.2", "end": "sem:causal-structure", "rel": "Sections"}, {"start": "6.1.2", "end": "sem:cause", "rel": "Sections"}, {"start": "6.1.2", "end": "sem:change-of-state-event", "rel": "Sections"}, {"start": "6.1.2", "end": "sem:comitative", "rel": "Sections"}, {"start": "6.1.2", "end": "sem:concomitant-role", "rel": "Sections"}, {"start": "6.1.2", "end": "sem:endpoint", "rel": "Sections"}, {"start": "6.1.2", "end": "sem:experiencer", "rel": "Sections"}, {"start": "6.1.2", "end": "sem:experiential-event", "rel": "Sections"}, {"start": "6.1.2", "end": "sem:force", "rel": "Sections"}, {"start": "6.1.2", "end": "sem:initiator", "rel": "Sections"}, {"start": "6.1.2", "end": "sem:instrument", "rel": "Sections"}, {"start": "6.1.2", "end": "sem:maleficiary", "rel": "Sections"}, {"start": "6.1.2", "end": "sem:monovalent", "rel": "Sections"}, {"start": "6.1.2", "end": "sem:participant-role", "rel": "Sections"}, {"start": "6.1.2", "end": "sem:patient", "rel": "Sections"}, {"start": "6.1.2", "end": "sem:recipient", "rel": "Sections"}, {"start": "6.1.2", "end": "sem:stimulus", "rel": "Sections"}, {"start": "6.1.2", "end": "sem:subsequent-role", "rel": "Sections"}, {"start": "6.1.2", "end": "sem:theme", "rel": "Sections"}, {"start": "6.1.2", "end": "sem:trivalent", "rel": "Sections"}, {"start": "6.1.2", "end": "sem:valency", "rel": "Sections"}, {"start": "6.2", "end": "6.2.1", "rel": "Sections"}, {"start": "6.2", "end": "6.2.2", "rel": "Sections"}, {"start": "6.2.1", "end": "cxn:agentive-change-of-state-verb", "rel": "Sections"}, {"start": "6.2.1", "end": "cxn:change-of-state-verb", "rel": "Sections"}, {"start": "6.2.1", "end": "cxn:transitive-construction", "rel": "Sections"}, {"start": "6.2.1", "end": "sem:agentive-change-of-state-event", "rel": "Sections"}, {"start": "6.2.1", "end": "sem:atelic", "rel": "Sections"}, {"start": "6.2.1", "end": "sem:change-of-state-event", "rel": "Sections"}, {"start": "6.2.1", "end": "sem:directed-change", "rel": "Sections"}, {"start": "6.2.1", "end": "sem:durative", "rel": "Sections"}, {"start": "6.2.1", "end": "sem:dynamic", "rel": "Sections"}, {"start": "6.2.1", "end": "sem:instrument", "rel": "Sections"}, {"start": "6.2.1", "end": "sem:punctual", "rel": "Sections"}, {"start": "6.2.1", "end": "sem:stative", "rel": "Sections"}, {"start": "6.2.1", "end": "sem:telic", "rel": "Sections"}, {"start": "6.2.1", "end": "sem:tense", "rel": "Sections"}, {"start": "6.2.1", "end": "sem:undirected-change", "rel": "Sections"}, {"start": "6.2.2", "end": "sem:aspect", "rel": "Sections"}, {"start": "6.2.2", "end": "str:basic-word-order", "rel": "Sections"}, {"start": "6.2.2", "end": "str:flagging", "rel": "Sections"}, {"start": "6.2.2", "end": "str:indexation", "rel": "Sections"}, {"start": "6.2.2", "end": "str:word-order", "rel": "Sections"}, {"start": "6.3", "end": "6.3.1", "rel": "Sections"}, {"start": "6.3", "end": "6.3.2", "rel": "Sections"}, {"start": "6.3", "end": "6.3.3", "rel": "Sections"}, {"start": "6.3", "end": "6.3.4", "rel": "Sections"}, {"start": "6.3.1", "end": "sem:a-role", "rel": "Sections"}, {"start": "6.3.1", "end": "sem:p-role", "rel": "Sections"}, {"start": "6.3.1", "end": "sem:s-role", "rel": "Sections"}, {"start": "6.3.1", "end": "str:absolutive-category", "rel": "Sections"}, {"start": "6.3.1", "end": "str:accusative-alignment", "rel": "Sections"}, {"start": "6.3.1", "end": "str:accusative-category", "rel": "Sections"}, {"start": "6.3.1", "end": "str:alignment-system", "rel": "Sections"}, {"start": "6.3.1", "end": "str:ergative-alignment", "rel": "Sections"}, {"start": "6.3.1", "end": "str:ergative-category", "rel": "Sections"}, {"start": "6.3.1", "end": "str:neutral-alignment", "rel": "Sections"}, {"start": "6.3.1", "end": "str:nominative-category", "rel": "Sections"}, {"start": "6.3.1", "end": "str:tripartite-alignment", "rel": "Sections"}, {"start": "6.3.2", "end": "cxn:object-phrase", "rel": "Sections"}, {"start": "6.3.2", "end": "cxn:oblique-phrase", "rel": "Sections"}, {"start": "6.3.2", "end": "cxn:subject-phrase", "rel": "Sections"}, {"start": "6.3.3", "end": "cxn:bodily-predicate", "rel": "Sections"}, {"start": "6.3.3", "end": "cxn:body-position-predicate", "rel": "Sections"}, {"start": "6.3.3", "end": "cxn:controlled-predicate", "rel": "Sections"}, {"start": "6.3.3", "end": "cxn:intransitive-construction", "rel": "Sections"}, {"start": "6.3.3", "end": "cxn:temporary-predicate", "rel": "Sections"}, {"start": "6.3.3", "end": "cxn:uncontrolled-predicate", "rel": "Sections"}, {"start": "6.3.3", "end": "sem:bodily-action", "rel": "Sections"}, {"start": "6.3.3", "end": "sem:body-position-event", "rel": "Sections"}, {"start": "6.3.3", "end": "sem:s-role", "rel": "Sections"}, {"start": "6.3.3", "end": "str:active-alignment", "rel": "Sections"}, {"start": "6.3.3", "end": "str:active-category", "rel": "Sections"}, {"start": "6.3.3", "end": "str:inactive-category", "rel": "Sections"}, {"start": "6.3.4", "end": "cxn:passive-inverse-voice", "rel": "Sections"}, {"start": "6.3.4", "end": "cxn:spontaneous-verb", "rel": "Sections"}, {"start": "6.6", "end": "6.6.1", "rel": "Sections"}, {"start": "6.6.1", "end": "cxn:argument-phrase", "rel": "Sections"}, {"start": "7", "end": "7.2", "rel": "Sections"}, {"start": "7", "end": "7.3", "rel": "Sections"}, {"start": "7", "end": "7.4", "rel": "Sections"}, {"start": "7", "end": "7.5", "rel": "Sections"}, {"start": "7", "end": "sem:action-concept", "rel": "Sections"}, {"start": "7.2", "end": "cxn:bodily-motion-verb", "rel": "Sections"}, {"start": "7.2", "end": "cxn:body-care-verb", "rel": "Sections"}, {"start": "7.2", "end": "cxn:chaining-construction", "rel": "Sections"}, {"start": "7.2", "end": "cxn:change-in-position-verb", "rel": "Sections"}, {"start": "7.2", "end": "cxn:collective-construction", "rel": "Sections"}, {"start": "7.2", "end": "cxn:extroverted-verb", "rel": "Sections"}, {"start": "7.2", "end": "cxn:introverted-verb", "rel": "Sections"}, {"start": "7.2", "end": "cxn:motion-verb", "rel": "Sections"}, {"start": "7.2", "end": "cxn:reciprocal-construction", "rel": "Sections"}, {"start": "7.2", "end": "cxn:reflexive-construction", "rel": "Sections"}, {"start": "7.2", "end": "cxn:spontaneous-verb", "rel": "Sections"}, {"start": "7.2", "end": "sem:bodily-motion-event", "rel": "Sections"}, {"start": "7.2", "end": "sem:body-care-event", "rel": "Sections"}, {"start": "7.2", "end": "sem:change-in-position-event", "rel": "Sections"}, {"start": "7.2", "end": "sem:motion-event", "rel": "Sections"}, {"start": "7.2", "end": "str:biclausal-reciprocal", "rel": "Sections"}, {"start": "7.2", "end": "str:dual-role-strategy", "rel": "Sections"}, {"start": "7.2", "end": "str:middle-voice", "rel": "Sections"}, {"start": "7.2", "end": "str:monoclausal-transitive-reciprocal-strategy", "rel": "Sections"}, {"start": "7.2", "end": "str:overtly-coded-single-role-strategy", "rel": "Sections"}, {"start": "7.2", "end": "str:single-role-strategy", "rel": "Sections"}, {"start": "7.2", "end": "str:specialized-dual-role-strategy", "rel": "Sections"}, {"start": "7.3", "end": "7.3.1", "rel": "Sections"}, {"start": "7.3", "end": "7.3.2", "rel": "Sections"}, {"start": "7.3", "end": "7.3.3", "rel": "Sections"}, {"start": "7.3", "end": "cxn:interaction-verb", "rel": "Sections"}, {"start": "7.3", "end": "sem:interaction-event", "rel": "Sections"}, {"start": "7.3.1", "end": "cxn:manner-of-motion-verb", "rel": "Sections"}, {"start": "7.3.1", "end": "cxn:motion-verb", "rel": "Sections"}, {"start": "7.3.1", "end": "cxn:path-verb", "rel": "Sections"}, {"start": "7.3.1", "end": "sem:figure", "rel": "Sections"}, {"start": "7.3.1", "end": "sem:ground", "rel": "Sections"}, {"start": "7.3.1", "end": "sem:manner-of-motion-event", "rel": "Sections"}, {"start": "7.3.1", "end": "sem:motion-event", "rel": "Sections"}, {"start": "7.3.1", "end": "sem:path-event", "rel": "Sections"}, {"start": "7.3.1", "end": "str:satellite", "rel": "Sections"}, {"start": "7.3.1", "end": "str:satellite-framing-strategy", "rel": "Sections"}, {"start": "7.3.1", "end": "str:verb-framing-strategy", "rel": "Sections"}, {"start": "7.3.2", "end": "cxn:application-verb", "rel": "Sections"}, {"start": "7.3.2", "end": "cxn:combining-verb", "rel": "Sections"}, {"start": "7.3.2", "end": "cxn:contact-by-impact-verb", "rel": "Sections"}, {"start": "7.3.2", "end": "cxn:damage-verb", "rel": "Sections"}, {"start": "7.3.2", "end": "cxn:killing-injuring-verb", "rel": "Sections"}, {"start": "7.3.2", "end": "cxn:manner-verb", "rel": "Sections"}, {"start": "7.3.2", "end": "cxn:removal-verb", "rel": "Sections"}, {"start": "7.3.2", "end": "cxn:result-verb", "rel": "Sections"}, {"start": "7.3.2", "end": "sem:application-event", "rel": "Sections"}, {"start": "7.3.2", "end": "sem:combining-event", "rel": "Sections"}, {"start": "7.3.2", "end": "sem:contact-by-impact-event", "rel": "Sections"}, {"start": "7.3.2", "end": "sem:damage-event", "rel": "Sections"}, {"start": "7.3.2", "end": "sem:killing-injuring-event", "rel": "Sections"}, {"start": "7.3.2", "end": "sem:removal-event", "rel": "Sections"}, {"start": "7.3.3", "end": "cxn:pursuit-verb", "rel": "Sections"}, {"start": "7.3.3", "end": "cxn:transitive-construction", "rel": "Sections"}, {"start": "7.3.3", "end": "def:transitivity-hierarchy", "rel": "Sections"}, {"start": "7.3.3", "end": "sem:pursuit-event", "rel": "Sections"}, {"start": "7.4", "end": "cxn:affecting-verb", "rel": "Sections"}, {"start": "7.4", "end": "cxn:attending-verb", "rel": "Sections"}, {"start": "7.4", "end": "cxn:cognition-verb", "rel": "Sections"}, {"start": "7.4", "end": "cxn:emotion-verb", "rel": "Sections"}, {"start": "7.4", "end": "cxn:experience-verb", "rel": "Sections"}, {"start": "7.4", "end": "cxn:experiential-construction", "rel": "Sections"}, {"start": "7.4", "end": "cxn:experiential-verb", "rel": "Sections"}, {"start": "7.4", "end": "cxn:ingestion-verb", "rel": "Sections"}, {"start": "7.4", "end": "cxn:sensation-verb", "rel": "Sections"}, {"start": "7.4", "end": "sem:causer", "rel": "Sections"}, {"start": "7.4", "end": "sem:cognition-event", "rel": "Sections"}, {"start": "7.4", "end": "sem:emotion-event", "rel": "Sections"}, {"start": "7.4", "end": "sem:experiencer", "rel": "Sections"}, {"start": "7.4", "end": "sem:experiential-event", "rel": "Sections"}, {"start": "7.4", "end": "sem:expertum", "rel": "Sections"}, {"start": "7.4", "end": "sem:ingestion-event", "rel": "Sections"}, {"start": "7.4", "end": "sem:sensation-event", "rel": "Sections"}, {"start": "7.4", "end": "sem:stimulus", "rel": "Sections"}, {"start": "7.4", "end": "str:double-coding-strategy", "rel": "Sections"}, {"start": "7.4", "end": "str:double-oblique-strategy", "rel": "Sections"}, {"start": "7.4", "end": "str:experiencer-oriented-strategy", "rel": "Sections"}, {"start": "7.4", "end": "str:stimulus-oriented-strategy", "rel": "Sections"}, {"start": "7.5", "end": "7.5.1", "rel": "Sections"}, {"start": "7.5", "end": "7.5.2", "rel": "Sections"}, {"start": "7.5", "end": "7.5.3", "rel": "Sections"}, {"start": "7.5.1", "end": "cxn:ditransitive-construction", "rel": "Sections"}, {"start": "7.5.1", "end": "cxn:transfer-verb", "rel": "Sections"}, {"start": "7.5.1", "end": "sem:transfer-of-possession-event", "rel": "Sections"}, {"start": "7.5.2", "end": "str:direct-object-category", "rel": "Sections"}, {"start": "7.5.2", "end": "str:indirect-object-category", "rel": "Sections"}, {"start": "7.5.2", "end": "str:indirective-alignment", "rel": "Sections"}, {"start": "7.5.2", "end": "str:neutral-ditransitive-alignment", "rel": "Sections"}, {"start": "7.5.2", "end": "str:primary-object-category", "rel": "Sections"}, {"start": "7.5.2", "end": "str:secondary-object-category", "rel": "Sections"}, {"start": "7.5.2", "end": "str:secundative-alignment", "rel": "Sections"}, {"start": "7.5.3", "end": "str:external-possessor-strategy", "rel": "Sections"}, {"start": "7.5.3", "end": "str:internal-possessor-strategy", "rel": "Sections"}, {"start": "7.5.3", "end": "str:internal-recipient-strategy", "rel": "Sections"}, {"start": "8", "end": "8.1", "rel": "Sections"}, {"start": "8", "end": "8.3", "rel": "Sections"}, {"start": "8", "end": "8.4", "rel": "Sections"}, {"start": "8.1", "end": "cxn:basic-voice", "rel": "Sections"}, {"start": "8.1", "end": "cxn:nonbasic-voice", "rel": "Sections"}, {"start": "8.1", "end": "def:preferred-argument-structure", "rel": "Sections"}, {"start": "8.3", "end": "cxn:passive-inverse-voice", "rel": "Sections"}, {"start": "8.3", "end": "str:animacy-based-split-ergativity", "rel": "Sections"}, {"start": "8.3", "end": "str:differential-object-marking", "rel": "Sections"}, {"start": "8.3", "end": "str:special-p-strategy", "rel": "Sections"}, {"start": "8.4", "end": "cxn:antipassive-construction", "rel": "Sections"}, {"start": "8.4", "end": "sem:less-affected-p", "rel": "Sections"}, {"start": "8.4", "end": "sem:less-individuated-p", "rel": "Sections"}, {"start": "8.4", "end": "str:noun-incorporation", "rel": "Sections"}, {"start": "8.4", "end": "str:omitted-p-strategy", "rel": "Sections"}, {"start": "9", "end": "9.1", "rel": "Sections"}, {"start": "9", "end": "9.2", "rel": "Sections"}, {"start": "9", "end": "9.3", "rel": "Sections"}, {"start": "9", "end": "9.4", "rel": "Sections"}, {"start": "9.1", "end": "cxn:applicative-construction", "rel": "Sections"}, {"start": "9.1", "end": "cxn:causative-construction", "rel": "Sections"}, {"start": "9.1", "end": "sem:base-event", "rel": "Sections"}, {"start": "9.2", "end": "cxn:causative-construction", "rel": "Sections"}, {"start": "9.2", "end": "sem:causative-event", "rel": "Sections"}, {"start": "9.2", "end": "sem:causee", "rel": "Sections"}, {"start": "9.2", "end": "sem:causer", "rel": "Sections"}, {"start": "9.2", "end": "str:control-based-strategy", "rel": "Sections"}, {"start": "9.2", "end": "str:transitivity-based-strategy", "rel": "Sections"}, {"start": "9.3", "end": "cxn:applicative-construction", "rel": "Sections"}, {"start": "9.3", "end": "cxn:applicative-object-phrase", "rel": "Sections"}, {"start": "9.3", "end": "str:causative-applicative-co-expression", "rel": "Sections"}, {"start": "9.4", "end": "str:overtly-coded-verb", "rel": "Sections"}, {"start": "9.4", "end": "str:zero-coded-verb", "rel": "Sections"}, {"start": "book", "end": "1", "rel": "Sections"}, {"start": "book", "end": "10", "rel": "Sections"}, {"start": "book", "end": "11", "rel": "Sections"}, {"start": "book", "end": "12", "rel": "Sections"}, {"start": "book", "end": "13", "rel": "Sections"}, {"start": "book", "end": "14", "rel": "Sections"}, {"start": "book", "end": "15", "rel": "Sections"}, {"start": "book", "end": "16", "rel": "Sections"}, {"start": "book", "end": "17", "rel": "Sections"}, {"start": "book", "end": "18", "rel": "Sections"}, {"start": "book", "end": "19", "rel": "Sections"}, {"start": "book", "end": "2", "rel": "Sections"}, {"start": "book", "end": "3", "rel": "Sections"}, {"start": "book", "end": "4", "rel": "Sections"}, {"start": "book", "end": "5", "rel": "Sections"}, {"start": "book", "end": "6", "rel": "Sections"}, {"start": "book", "end": "7", "rel": "Sections"}, {"start": "book", "end": "8", "rel": "Sections"}, {"start": "book", "end": "9", "rel": "Sections"}, {"start": "cxn:action-modification-construction", "end": "cxn:relative-clause", "rel": "ConstituentOf"}, {"start": "cxn:additive-construction", "end": "sem:additive", "rel": "FunctionOf"}, {"start": "cxn:additive-coordination", "end": "sem:additive", "rel": "FunctionOf"}, {"start": "cxn:adjectival-phrase", "end": "cxn:adjective", "rel": "HeadOf"}, {"start": "cxn:adjectival-phrase", "end": "sem:property-concept", "rel": "FunctionOf"}, {"start": "cxn:adjective", "end": "cxn:age-term", "rel": "SubtypeOf"}, {"start": "cxn:adjective", "end": "cxn:antonym", "rel": "SubtypeOf"}, {"start": "cxn:adjective", "end": "cxn:color-term", "rel": "SubtypeOf"}, {"start": "cxn:adjective", "end": "cxn:complementary", "rel": "SubtypeOf"}, {"start": "cxn:adjective", "end": "cxn:dimension-term", "rel": "SubtypeOf"}, {"start": "cxn:adjective", "end": "cxn:gender-term", "rel": "SubtypeOf"}, {"start": "cxn:adjective", "end": "cxn:human-propensity-term", "rel": "SubtypeOf"}, {"start": "cxn:adjective", "end": "cxn:material-term", "rel": "SubtypeOf"}, {"start": "cxn:adjective", "end": "cxn:physical-property-term", "rel": "SubtypeOf"}, {"start": "cxn:adjective", "end": "cxn:shape-term", "rel": "SubtypeOf"}, {"start": "cxn:adjective", "end": "cxn:value-term", "rel": "SubtypeOf"}, {"start": "cxn:adjective-modification-construction", "end": "cxn:adjectival-phrase", "rel": "ConstituentOf"}, {"start": "cxn:admodifier", "end": "cxn:comparative-form", "rel": "SubtypeOf"}, {"start": "cxn:admodifier", "end": "cxn:downtoner", "rel": "SubtypeOf"}, {"start": "cxn:admodifier", "end": "cxn:intensifier", "rel": "SubtypeOf"}, {"start": "cxn:admodifier", "end": "cxn:measurement", "rel": "SubtypeOf"}, {"start": "cxn:admodifier", "end": "cxn:superlative-form", "rel": "SubtypeOf"}, {"start": "cxn:admodifier", "end": "inf:admodification", "rel": "FunctionOf"}, {"start": "cxn:admodifier", "end": "sem:degree", "rel": "FunctionOf"}, {"start": "cxn:admodifier", "end": "str:degree-marker", "rel": "ExpressionOf"}, {"start": "cxn:admodifier", "end": "str:degree-modifier", "rel": "ExpressionOf"}, {"start": "cxn:adverbial-clause-construction", "end": "cxn:adverbial-dependent-clause", "rel": "ConstituentOf"}, {"start": "cxn:adverbial-clause-construction", "end": "cxn:adverbial-matrix-clause", "rel": "HeadOf"}, {"start": "cxn:adverbial-clause-construction", "end": "inf:figure-ground", "rel": "FunctionOf"}, {"start": "cxn:adverbial-clause-construction", "end": "str:adverbial-clause-strategy", "rel": "RecruitedFrom"}, {"start": "cxn:adverbial-clause-construction", "end": "str:adverbializer", "rel": "ExpressionOf"}, {"start": "cxn:adverbial-clause-construction", "end": "str:long-distance-reflexive", "rel": "ExpressionOf"}, {"start": "cxn:adverbial-dependent-clause", "end": "inf:pragmatic-presupposition", "rel": "FunctionOf"}, {"start": "cxn:adverbial-dependent-clause", "end": "str:action-nominal", "rel": "ExpressionOf"}, {"start": "cxn:adverbial-dependent-clause", "end": "str:converb", "rel": "ExpressionOf"}, {"start": "cxn:adversative-coordination", "end": "cxn:simple-contrast-coordination", "rel": "SubtypeOf"}, {"start": "cxn:adversative-coordination", "end": "cxn:unexpected-co-occurrence-coordination", "rel": "SubtypeOf"}, {"start": "cxn:affecting-verb", "end": "sem:affecting", "rel": "FunctionOf"}, {"start": "cxn:age-term", "end": "sem:age", "rel": "FunctionOf"}, {"start": "cxn:agentive-change-of-state-verb", "end": "sem:agentive-change-of-state-event", "rel": "FunctionOf"}, {"start": "cxn:alienable-possession-attributive-phrase", "end": "sem:ownership", "rel": "FunctionOf"}, {"start": "cxn:alienable-possession-modification-construction", "end": "cxn:alienable-possession-attributive-phrase", "rel": "ConstituentOf"}, {"start": "cxn:alternative-question-construction", "end": "inf:alternative-question", "rel": "FunctionOf"}, {"start": "cxn:amount-term", "end": "sem:amount", "rel": "FunctionOf"}, {"start": "cxn:anaphoric-article", "end": "inf:medium-accessibility", "rel": "FunctionOf"}, {"start": "cxn:anaphoric-head-construction", "end": "cxn:anaphoric-head-relative-clause-construction", "rel": "SubtypeOf"}, {"start": "cxn:anaphoric-head-construction", "end": "inf:identity-unknown", "rel": "FunctionOf"}, {"start": "cxn:anaphoric-head-construction", "end": "inf:type-identifiable", "rel": "FunctionOf"}, {"start": "cxn:anaphoric-head-construction", "end": "str:headless", "rel": "ExpressionOf"}, {"start": "cxn:anaphoric-head-construction", "end": "str:overtly-headed-strategy", "rel": "ExpressionOf"}, {"start": "cxn:anaphoric-pronoun", "end": "inf:active-referent", "rel": "FunctionOf"}, {"start": "cxn:anaphoric-pronoun", "end": "str:demonstrative-strategy", "rel": "ExpressionOf"}, {"start": "cxn:anaphoric-pronoun", "end": "str:overt-pronoun", "rel": "ExpressionOf"}, {"start": "cxn:anaphoric-pronoun", "end": "str:zero-anaphora", "rel": "ExpressionOf"}, {"start": "cxn:anchoring-construction", "end": "inf:situating", "rel": "FunctionOf"}, {"start": "cxn:anchoring-construction", "end": "str:anchoring-nominal-strategy", "rel": "RecruitedFrom"}, {"start": "cxn:animal-noun", "end": "sem:thing", "rel": "FunctionOf"}, {"start": "cxn:animal-plant-product-noun", "end": "sem:thing", "rel": "FunctionOf"}, {"start": "cxn:antipassive-construction", "end": "cxn:antipassive-oblique-phrase", "rel": "ConstituentOf"}, {"start": "cxn:antipassive-construction", "end": "str:antipassive-alignment", "rel": "ExpressionOf"}, {"start": "cxn:antipassive-oblique-phrase", "end": "sem:less-affected-p", "rel": "FunctionOf"}, {"start": "cxn:antipassive-oblique-phrase", "end": "sem:less-individuated-p", "rel": "FunctionOf"}, {"start": "cxn:antonym", "end": "sem:gradient", "rel": "FunctionOf"}, {"start": "cxn:apodosis-clause", "end": "sem:apodosis", "rel": "FunctionOf"}, {"start": "cxn:application-verb", "end": "sem:application-event", "rel": "FunctionOf"}, {"start": "cxn:applicative-construction", "end": "cxn:applicative-object-phrase", "rel": "ConstituentOf"}, {"start": "cxn:applicative-construction", "end": "str:applicative-alignment", "rel": "ExpressionOf"}, {"start": "cxn:applicative-construction", "end": "str:causative-applicative-co-expression", "rel": "ExpressionOf"}, {"start": "cxn:apposition", "end": "inf:appositive-modification", "rel": "FunctionOf"}, {"start": "cxn:apprehensional-construction", "end": "sem:apprehensional", "rel": "FunctionOf"}, {"start": "cxn:argument-complex-predicate", "end": "cxn:argument-predicate-part", "rel": "ConstituentOf"}, {"start": "cxn:argument-complex-predicate", "end": "cxn:eventive-predicate-part", "rel": "ConstituentOf"}, {"start": "cxn:argument-complex-predicate", "end": "cxn:pronominal-argument-complex-predicate", "rel": "SubtypeOf"}, {"start": "cxn:argument-complex-predicate", "end": "str:cognate-head-dependent-strategy", "rel": "ExpressionOf"}, {"start": "cxn:argument-phrase", "end": "cxn:complement", "rel": "SubtypeOf"}, {"start": "cxn:argument-phrase", "end": "cxn:core-argument-phrase", "rel": "SubtypeOf"}, {"start": "cxn:argument-phrase", "end": "cxn:nonsubject-argument-phrase", "rel": "SubtypeOf"}, {"start": "cxn:argument-phrase", "end": "cxn:oblique-phrase", "rel": "SubtypeOf"}, {"start": "cxn:argument-phrase", "end": "cxn:possessor-argument-phrase", "rel": "SubtypeOf"}, {"start": "cxn:argument-phrase", "end": "inf:reference", "rel": "FunctionOf"}, {"start": "cxn:argument-phrase", "end": "inf:topicality", "rel": "FunctionOf"}, {"start": "cxn:argument-phrase", "end": "sem:participant-role", "rel": "FunctionOf"}, {"start": "cxn:article", "end": "cxn:definite-article", "rel": "SubtypeOf"}, {"start": "cxn:article", "end": "cxn:generic-article", "rel": "SubtypeOf"}, {"start": "cxn:article", "end": "cxn:indefinite-article", "rel": "SubtypeOf"}, {"start": "cxn:article", "end": "inf:information-status", "rel": "FunctionOf"}, {"start": "cxn:article", "end": "str:overt-article", "rel": "ExpressionOf"}, {"start": "cxn:article", "end": "str:zero-article", "rel": "ExpressionOf"}, {"start": "cxn:associative-construction", "end": "sem:other", "rel": "FunctionOf"}, {"start": "cxn:associative-construction", "end": "str:associative-strategy", "rel": "ExpressionOf"}, {"start": "cxn:attending-verb", "end": "sem:attending", "rel": "FunctionOf"}, {"start": "cxn:attributive-phrase", "end": "cxn:adjectival-phrase", "rel": "SubtypeOf"}, {"start": "cxn:attributive-phrase", "end": "cxn:admodifier", "rel": "ConstituentOf"}, {"start": "cxn:attributive-phrase", "end": "cxn:anaphoric-article", "rel": "SubtypeOf"}, {"start": "cxn:attributive-phrase", "end": "cxn:demonstrative-attributive", "rel": "SubtypeOf"}, {"start": "cxn:attributive-phrase", "end": "cxn:determiner", "rel": "SubtypeOf"}, {"start": "cxn:attributive-phrase", "end": "cxn:generic-article", "rel": "SubtypeOf"}, {"start": "cxn:attributive-phrase", "end": "cxn:mensural-attributive-phrase", "rel": "SubtypeOf"}, {"start": "cxn:attributive-phrase", "end": "cxn:modifier", "rel": "HeadOf"}, {"start": "cxn:attributive-phrase", "end": "cxn:nominal-attributive-phrase", "rel": "SubtypeOf"}, {"start": "cxn:attributive-phrase", "end": "cxn:nonanaphoric-definite-article", "rel": "SubtypeOf"}, {"start": "cxn:attributive-phrase", "end": "cxn:numeral-attributive-phrase", "rel": "SubtypeOf"}, {"start": "cxn:attributive-phrase", "end": "cxn:pragmatically-nonspecific-article", "rel": "SubtypeOf"}, {"start": "cxn:attributive-phrase", "end": "cxn:pragmatically-specific-article", "rel": "SubtypeOf"}, {"start": "cxn:attributive-phrase", "end": "cxn:quantifier-attributive-phrase", "rel": "SubtypeOf"}, {"start": "cxn:attributive-phrase", "end": "cxn:relative-clause", "rel": "SubtypeOf"}, {"start": "cxn:attributive-phrase", "end": "cxn:semantically-nonspecific-article", "rel": "SubtypeOf"}, {"start": "cxn:attributive-phrase", "end": "cxn:set-member-attributive-phrase", "rel": "SubtypeOf"}, {"start": "cxn:attributive-phrase", "end": "inf:modification", "rel": "FunctionOf"}, {"start": "cxn:attributive-phrase", "end": "sem:entity", "rel": "FunctionOf"}, {"start": "cxn:auxiliary", "end": "sem:tamp", "rel": "FunctionOf"}, {"start": "cxn:auxiliary-construction", "end": "cxn:auxiliary", "rel": "ConstituentOf"}, {"start": "cxn:auxiliary-construction", "end": "cxn:eventive-predicate-part", "rel": "HeadOf"}, {"start": "cxn:auxiliary-construction", "end": "str:contiguity-of-serial-verbs", "rel": "ExpressionOf"}, {"start": "cxn:auxiliary-construction", "end": "str:incorporation-of-serial-verbs", "rel": "ExpressionOf"}, {"start": "cxn:auxiliary-construction", "end": "str:locus-of-inflection-of-serial-verbs", "rel": "ExpressionOf"}, {"start": "cxn:auxiliary-construction", "end": "str:negative-auxiliary-strategy", "rel": "RecruitedFrom"}, {"start": "cxn:auxiliary-construction", "end": "str:second-position", "rel": "ExpressionOf"}, {"start": "cxn:auxiliary-construction", "end": "str:stamp-strategy", "rel": "ExpressionOf"}, {"start": "cxn:basic-voice", "end": "cxn:chaining-construction", "rel": "SubtypeOf"}, {"start": "cxn:basic-voice", "end": "cxn:collective-construction", "rel": "SubtypeOf"}, {"start": "cxn:basic-voice", "end": "cxn:ditransitive-construction", "rel": "SubtypeOf"}, {"start": "cxn:basic-voice", "end": "cxn:experiential-construction", "rel": "SubtypeOf"}, {"start": "cxn:basic-voice", "end": "cxn:intransitive-construction", "rel": "SubtypeOf"}, {"start": "cxn:basic-voice", "end": "cxn:motion-construction", "rel": "SubtypeOf"}, {"start": "cxn:basic-voice", "end": "cxn:possessed-argument-construction", "rel": "SubtypeOf"}, {"start": "cxn:basic-voice", "end": "cxn:reciprocal-construction", "rel": "SubtypeOf"}, {"start": "cxn:basic-voice", "end": "cxn:reflexive-construction", "rel": "SubtypeOf"}, {"start": "cxn:basic-voice", "end": "cxn:transitive-construction", "rel": "SubtypeOf"}, {"start": "cxn:basic-voice", "end": "str:applicative-alignment", "rel": "ModeledOn"}, {"start": "cxn:basic-voice", "end": "str:causative-alignment", "rel": "ModeledOn"}, {"start": "cxn:basic-voice", "end": "str:subject-predicate-alignment", "rel": "ModeledOn"}, {"start": "cxn:binominal-lexeme", "end": "inf:subcategorizing", "rel": "FunctionOf"}, {"start": "cxn:bodily-motion-verb", "end": "sem:bodily-motion-event", "rel": "FunctionOf"}, {"start": "cxn:bodily-predicate", "end": "sem:bodily-action", "rel": "FunctionOf"}, {"start": "cxn:body-care-verb", "end": "sem:body-care-event", "rel": "FunctionOf"}, {"start": "cxn:body-part-noun", "end": "sem:thing", "rel": "FunctionOf"}, {"start": "cxn:body-position-predicate", "end": "sem:body-position-event", "rel": "FunctionOf"}, {"start": "cxn:cardinal-numeral-term", "end": "str:numeral-strategy", "rel": "RecruitedFrom"}, {"start": "cxn:causal-construction", "end": "sem:causal", "rel": "FunctionOf"}, {"start": "cxn:causative-construction", "end": "cxn:causee-phrase", "rel": "ConstituentOf"}, {"start": "cxn:causative-construction", "end": "cxn:causer-phrase", "rel": "ConstituentOf"}, {"start": "cxn:causative-construction", "end": "str:causative-alignment", "rel": "ExpressionOf"}, {"start": "cxn:causative-construction", "end": "str:causative-applicative-co-expression", "rel": "ExpressionOf"}, {"start": "cxn:causee-phrase", "end": "sem:causee", "rel": "FunctionOf"}, {"start": "cxn:causer-phrase", "end": "sem:causer", "rel": "FunctionOf"}, {"start": "cxn:chaining-construction", "end": "sem:chaining", "rel": "FunctionOf"}, {"start": "cxn:chaining-construction", "end": "str:dual-role-strategy", "rel": "ExpressionOf"}, {"start": "cxn:chaining-construction", "end": "str:reciprocal-strategy", "rel": "ExpressionOf"}, {"start": "cxn:chaining-construction", "end": "str:reflexive-strategy", "rel": "ExpressionOf"}, {"start": "cxn:change-in-position-verb", "end": "sem:change-in-position-event", "rel": "FunctionOf"}, {"start": "cxn:change-of-state-verb", "end": "cxn:agentive-change-of-state-verb", "rel": "SubtypeOf"}, {"start": "cxn:change-of-state-verb", "end": "sem:change-of-state-event", "rel": "FunctionOf"}, {"start": "cxn:clause", "end": "cxn:argument-phrase", "rel": "ConstituentOf"}, {"start": "cxn:clause", "end": "cxn:basic-voice", "rel": "SubtypeOf"}, {"start": "cxn:clause", "end": "cxn:nonbasic-voice", "rel": "SubtypeOf"}, {"start": "cxn:clause", "end": "cxn:nonprototypical-predication-construction", "rel": "SubtypeOf"}, {"start": "cxn:clause", "end": "cxn:verbal-clause", "rel": "SubtypeOf"}, {"start": "cxn:clause", "end": "inf:predication", "rel": "FunctionOf"}, {"start": "cxn:clause", "end": "sem:event", "rel": "FunctionOf"}, {"start": "cxn:clause", "end": "str:basic-word-order", "rel": "ExpressionOf"}, {"start": "cxn:clause", "end": "str:complex-predicate-asc-strategy", "rel": "ExpressionOf"}, {"start": "cxn:clause", "end": "str:doubling", "rel": "ExpressionOf"}, {"start": "cxn:clause", "end": "str:flagging", "rel": "ExpressionOf"}, {"start": "cxn:clause", "end": "str:indexation", "rel": "ExpressionOf"}, {"start": "cxn:clause", "end": "str:overtly-coded-verb", "rel": "ExpressionOf"}, {"start": "cxn:clause", "end": "str:zero-coded-verb", "rel": "ExpressionOf"}, {"start": "cxn:cognition-verb", "end": "sem:cognition-event", "rel": "FunctionOf"}, {"start": "cxn:collective-construction", "end": "sem:collective", "rel": "FunctionOf"}, {"start": "cxn:collective-construction", "end": "str:reciprocal-strategy", "rel": "ExpressionOf"}, {"start": "cxn:collective-construction", "end": "str:reflexive-strategy", "rel": "ExpressionOf"}, {"start": "cxn:color-term", "end": "sem:color", "rel": "FunctionOf"}, {"start": "cxn:combining-verb", "end": "sem:combining-event", "rel": "FunctionOf"}, {"start": "cxn:commentative-construction", "end": "cxn:commentative-predicate", "rel": "HeadOf"}, {"start": "cxn:commentative-construction", "end": "sem:commentative-event", "rel": "FunctionOf"}, {"start": "cxn:common-noun", "end": "cxn:animal-noun", "rel": "SubtypeOf"}, {"start": "cxn:common-noun", "end": "cxn:animal-plant-product-noun", "rel": "SubtypeOf"}, {"start": "cxn:common-noun", "end": "cxn:body-part-noun", "rel": "SubtypeOf"}, {"start": "cxn:common-noun", "end": "cxn:human-noun", "rel": "SubtypeOf"}, {"start": "cxn:common-noun", "end": "cxn:kinship-noun", "rel": "SubtypeOf"}, {"start": "cxn:common-noun", "end": "cxn:natural-object-noun", "rel": "SubtypeOf"}, {"start": "cxn:common-noun", "end": "cxn:place-noun", "rel": "SubtypeOf"}, {"start": "cxn:common-noun", "end": "cxn:plant-noun", "rel": "SubtypeOf"}, {"start": "cxn:common-noun", "end": "cxn:social-noun", "rel": "SubtypeOf"}, {"start": "cxn:common-noun", "end": "sem:type", "rel": "FunctionOf"}, {"start": "cxn:comparative-conditional-construction", "end": "sem:comparative-conditional-relation", "rel": "FunctionOf"}, {"start": "cxn:comparative-construction", "end": "sem:comparative-relation", "rel": "FunctionOf"}, {"start": "cxn:comparative-construction", "end": "str:allative-comparative", "rel": "ExpressionOf"}, {"start": "cxn:comparative-construction", "end": "str:conjoined-comparative", "rel": "ExpressionOf"}, {"start": "cxn:comparative-construction", "end": "str:conjoined-exceed-comparative", "rel": "ExpressionOf"}, {"start": "cxn:comparative-construction", "end": "str:degree-marker", "rel": "ExpressionOf"}, {"start": "cxn:comparative-construction", "end": "str:exceed-comparative", "rel": "ExpressionOf"}, {"start": "cxn:comparative-construction", "end": "str:locative-comparative", "rel": "ExpressionOf"}, {"start": "cxn:comparative-construction", "end": "str:particle-comparative", "rel": "ExpressionOf"}, {"start": "cxn:comparative-construction", "end": "str:separative-comparative", "rel": "ExpressionOf"}, {"start": "cxn:comparative-form", "end": "sem:comparative-degree", "rel": "FunctionOf"}, {"start": "cxn:comparative-pronoun", "end": "inf:comparative-referent", "rel": "FunctionOf"}, {"start": "cxn:complement", "end": "cxn:interrogative-complement", "rel": "SubtypeOf"}, {"start": "cxn:complement", "end": "str:action-nominal", "rel": "ExpressionOf"}, {"start": "cxn:complement-clause-construction", "end": "cxn:complement", "rel": "ConstituentOf"}, {"start": "cxn:complement-clause-construction", "end": "cxn:complement-matrix-clause", "rel": "HeadOf"}, {"start": "cxn:complement-clause-construction", "end": "cxn:desiderative-construction", "rel": "SubtypeOf"}, {"start": "cxn:complement-clause-construction", "end": "cxn:evaluative-construction", "rel": "SubtypeOf"}, {"start": "cxn:complement-clause-construction", "end": "cxn:logophoric-construction", "rel": "SubtypeOf"}, {"start": "cxn:complement-clause-construction", "end": "cxn:manipulative-construction", "rel": "SubtypeOf"}, {"start": "cxn:complement-clause-construction", "end": "cxn:perception-complement-clause-construction", "rel": "SubtypeOf"}, {"start": "cxn:complement-clause-construction", "end": "cxn:propositional-attitude-construction", "rel": "SubtypeOf"}, {"start": "cxn:complement-clause-construction", "end": "cxn:utterance-construction", "rel": "SubtypeOf"}, {"start": "cxn:complement-clause-construction", "end": "sem:event", "rel": "FunctionOf"}, {"start": "cxn:complement-clause-construction", "end": "str:complement-disalignment", "rel": "ExpressionOf"}, {"start": "cxn:complement-clause-construction", "end": "str:complementizer", "rel": "ExpressionOf"}, {"start": "cxn:complement-clause-construction", "end": "str:long-distance-reflexive", "rel": "ExpressionOf"}, {"start": "cxn:complement-clause-construction", "end": "str:merged-argument-structure-strategy", "rel": "ExpressionOf"}, {"start": "cxn:complement-clause-construction", "end": "str:partially-merged-argument-structure-strategy", "rel": "ExpressionOf"}, {"start": "cxn:complement-clause-construction", "end": "str:split-argument-structure-strategy", "rel": "ExpressionOf"}, {"start": "cxn:complement-matrix-clause", "end": "cxn:complement-taking-predicate", "rel": "HeadOf"}, {"start": "cxn:complement-taking-predicate", "end": "cxn:desiderative-predicate", "rel": "SubtypeOf"}, {"start": "cxn:complement-taking-predicate", "end": "cxn:evaluative-predicate", "rel": "SubtypeOf"}, {"start": "cxn:complement-taking-predicate", "end": "cxn:manipulative-predicate", "rel": "SubtypeOf"}, {"start": "cxn:complement-taking-predicate", "end": "cxn:perception-complement-taking-predicate", "rel": "SubtypeOf"}, {"start": "cxn:complement-taking-predicate", "end": "cxn:propositional-attitude-predicate", "rel": "SubtypeOf"}, {"start": "cxn:complement-taking-predicate", "end": "cxn:utterance-predicate", "rel": "SubtypeOf"}, {"start": "cxn:complementary", "end": "sem:categorical", "rel": "FunctionOf"}, {"start": "cxn:complex-predicate", "end": "cxn:argument-complex-predicate", "rel": "SubtypeOf"}, {"start": "cxn:complex-predicate", "end": "cxn:auxiliary-construction", "rel": "SubtypeOf"}, {"start": "cxn:complex-predicate", "end": "cxn:complex-predicate-part", "rel": "ConstituentOf"}, {"start": "cxn:complex-predicate", "end": "cxn:eventive-complex-predicate", "rel": "SubtypeOf"}, {"start": "cxn:complex-predicate", "end": "cxn:stative-complex-predicate", "rel": "SubtypeOf"}, {"start": "cxn:complex-predicate", "end": "cxn:support-verb-construction", "rel": "SubtypeOf"}, {"start": "cxn:complex-predicate-part", "end": "cxn:argument-predicate-part", "rel": "SubtypeOf"}, {"start": "cxn:complex-predicate-part", "end": "cxn:auxiliary", "rel": "SubtypeOf"}, {"start": "cxn:complex-predicate-part", "end": "cxn:eventive-predicate-part", "rel": "SubtypeOf"}, {"start": "cxn:complex-predicate-part", "end": "cxn:support-verb", "rel": "SubtypeOf"}, {"start": "cxn:complex-sentence", "end": "cxn:additive-construction", "rel": "SubtypeOf"}, {"start": "cxn:complex-sentence", "end": "cxn:adverbial-clause-construction", "rel": "SubtypeOf"}, {"start": "cxn:complex-sentence", "end": "cxn:apprehensional-construction", "rel": "SubtypeOf"}, {"start": "cxn:complex-sentence", "end": "cxn:causal-construction", "rel": "SubtypeOf"}, {"start": "cxn:complex-sentence", "end": "cxn:comparative-conditional-construction", "rel": "SubtypeOf"}, {"start": "cxn:complex-sentence", "end": "cxn:comparative-construction", "rel": "SubtypeOf"}, {"start": "cxn:complex-sentence", "end": "cxn:complement-clause-construction", "rel": "SubtypeOf"}, {"start": "cxn:complex-sentence", "end": "cxn:concessive-conditional-construction", "rel": "SubtypeOf"}, {"start": "cxn:complex-sentence", "end": "cxn:concessive-construction", "rel": "SubtypeOf"}, {"start": "cxn:complex-sentence", "end": "cxn:conditional-construction", "rel": "SubtypeOf"}, {"start": "cxn:complex-sentence", "end": "cxn:coordinate-clause-construction", "rel": "SubtypeOf"}, {"start": "cxn:complex-sentence", "end": "cxn:dependent-clause", "rel": "ConstituentOf"}, {"start": "cxn:complex-sentence", "end": "cxn:equative-construction", "rel": "SubtypeOf"}, {"start": "cxn:complex-sentence", "end": "cxn:let-alone-construction", "rel": "SubtypeOf"}, {"start": "cxn:complex-sentence", "end": "cxn:main-clause", "rel": "ConstituentOf"}, {"start": "cxn:complex-sentence", "end": "cxn:matrix-clause", "rel": "ConstituentOf"}, {"start": "cxn:complex-sentence", "end": "cxn:means-construction", "rel": "SubtypeOf"}, {"start": "cxn:complex-sentence", "end": "cxn:negative-circumstantial-construction", "rel": "SubtypeOf"}, {"start": "cxn:complex-sentence", "end": "cxn:noun-complement-clause-construction", "rel": "SubtypeOf"}, {"start": "cxn:complex-sentence", "end": "cxn:purpose-construction", "rel": "SubtypeOf"}, {"start": "cxn:complex-sentence", "end": "cxn:reference-tracking-construction", "rel": "SubtypeOf"}, {"start": "cxn:complex-sentence", "end": "cxn:relative-clause-construction", "rel": "SubtypeOf"}, {"start": "cxn:complex-sentence", "end": "cxn:subordinate-clause", "rel": "ConstituentOf"}, {"start": "cxn:complex-sentence", "end": "cxn:substitutive-construction", "rel": "SubtypeOf"}, {"start": "cxn:complex-sentence", "end": "cxn:subtractive-construction", "rel": "SubtypeOf"}, {"start": "cxn:complex-sentence", "end": "cxn:temporal-construction", "rel": "SubtypeOf"}, {"start": "cxn:complex-sentence", "end": "inf:discourse-coherence", "rel": "FunctionOf"}, {"start": "cxn:complex-sentence", "end": "sem:event-relation", "rel": "FunctionOf"}, {"start": "cxn:complex-sentence", "end": "str:asyndetic", "rel": "ExpressionOf"}, {"start": "cxn:complex-sentence", "end": "str:clause-alignment", "rel": "ExpressionOf"}, {"start": "cxn:complex-sentence", "end": "str:syndetic", "rel": "ExpressionOf"}, {"start": "cxn:concessive-conditional-construction", "end": "sem:concessive-conditional-relation", "rel": "FunctionOf"}, {"start": "cxn:concessive-conditional-construction", "end": "str:adverbial-clause-strategy", "rel": "ExpressionOf"}, {"start": "cxn:concessive-conditional-construction", "end": "str:alternative-concessive-conditional-strategy", "rel": "ExpressionOf"}, {"start": "cxn:concessive-conditional-construction", "end": "str:coordinate-clause-strategy", "rel": "ExpressionOf"}, {"start": "cxn:concessive-conditional-construction", "end": "str:scalar-concessive-conditional-strategy", "rel": "ExpressionOf"}, {"start": "cxn:concessive-conditional-construction", "end": "str:universal-concessive-conditional-strategy", "rel": "ExpressionOf"}, {"start": "cxn:concessive-construction", "end": "sem:concessive-relation", "rel": "FunctionOf"}, {"start": "cxn:concessive-construction", "end": "str:adverbial-clause-strategy", "rel": "ExpressionOf"}, {"start": "cxn:concessive-construction", "end": "str:coordinate-clause-strategy", "rel": "ExpressionOf"}, {"start": "cxn:conditional-construction", "end": "cxn:apodosis-clause", "rel": "ConstituentOf"}, {"start": "cxn:conditional-construction", "end": "cxn:generic-conditional-construction", "rel": "SubtypeOf"}, {"start": "cxn:conditional-construction", "end": "cxn:protasis-clause", "rel": "ConstituentOf"}, {"start": "cxn:conditional-construction", "end": "sem:conditional-relation", "rel": "FunctionOf"}, {"start": "cxn:conditional-construction", "end": "str:adverbial-clause-strategy", "rel": "ExpressionOf"}, {"start": "cxn:conditional-construction", "end": "str:coordinate-clause-strategy", "rel": "ExpressionOf"}, {"start": "cxn:conditional-pronoun", "end": "inf:conditional-referent", "rel": "FunctionOf"}, {"start": "cxn:conjunctive-coordination", "end": "cxn:additive-coordination", "rel": "SubtypeOf"}, {"start": "cxn:conjunctive-coordination", "end": "cxn:consecutive-coordination", "rel": "SubtypeOf"}, {"start": "cxn:consecutive-coordination", "end": "sem:consecutive", "rel": "FunctionOf"}, {"start": "cxn:construction", "end": "cxn:admodifier", "rel": "SubtypeOf"}, {"start": "cxn:construction", "end": "cxn:apodosis-clause", "rel": "SubtypeOf"}, {"start": "cxn:construction", "end": "cxn:attributive-phrase", "rel": "SubtypeOf"}, {"start": "cxn:construction", "end": "cxn:complex-predicate-part", "rel": "SubtypeOf"}, {"start": "cxn:construction", "end": "cxn:complex-sentence", "rel": "SubtypeOf"}, {"start": "cxn:construction", "end": "cxn:coordinand", "rel": "SubtypeOf"}, {"start": "cxn:construction", "end": "cxn:coordinate-construction", "rel": "SubtypeOf"}, {"start": "cxn:construction", "end": "cxn:dependent-clause", "rel": "SubtypeOf"}, {"start": "cxn:construction", "end": "cxn:discourse-markers", "rel": "SubtypeOf"}, {"start": "cxn:construction", "end": "cxn:element", "rel": "SubtypeOf"}, {"start": "cxn:construction", "end": "cxn:main-clause", "rel": "SubtypeOf"}, {"start": "cxn:construction", "end": "cxn:matrix-clause", "rel": "SubtypeOf"}, {"start": "cxn:construction", "end": "cxn:modifier", "rel": "SubtypeOf"}, {"start": "cxn:construction", "end": "cxn:nonprototypical-construction", "rel": "SubtypeOf"}, {"start": "cxn:construction", "end": "cxn:predicate", "rel": "SubtypeOf"}, {"start": "cxn:construction", "end": "cxn:protasis-clause", "rel": "SubtypeOf"}, {"start": "cxn:construction", "end": "cxn:prototypical-construction", "rel": "SubtypeOf"}, {"start": "cxn:construction", "end": "cxn:referent-expression", "rel": "SubtypeOf"}, {"start": "cxn:construction", "end": "cxn:referring-phrase", "rel": "SubtypeOf"}, {"start": "cxn:construction", "end": "cxn:speech-act-construction", "rel": "SubtypeOf"}, {"start": "cxn:construction", "end": "cxn:subordinate-clause", "rel": "SubtypeOf"}, {"start": "cxn:construction", "end": "inf:information-packaging", "rel": "FunctionOf"}, {"start": "cxn:construction", "end": "sem:meaning", "rel": "FunctionOf"}, {"start": "cxn:construction", "end": "str:encoding-strategy", "rel": "ExpressionOf"}, {"start": "cxn:construction", "end": "str:fusion", "rel": "ExpressionOf"}, {"start": "cxn:construction", "end": "str:overt-coding", "rel": "ExpressionOf"}, {"start": "cxn:contact-by-impact-verb", "end": "sem:contact-by-impact-event", "rel": "FunctionOf"}, {"start": "cxn:container-term", "end": "sem:container", "rel": "FunctionOf"}, {"start": "cxn:controlled-predicate", "end": "sem:controlled", "rel": "FunctionOf"}, {"start": "cxn:coordinand", "end": "inf:major-propositional-act", "rel": "FunctionOf"}, {"start": "cxn:coordinand", "end": "sem:entity", "rel": "FunctionOf"}, {"start": "cxn:coordinate-clause-construction", "end": "cxn:adversative-coordination", "rel": "SubtypeOf"}, {"start": "cxn:coordinate-clause-construction", "end": "cxn:conjunctive-coordination", "rel": "SubtypeOf"}, {"start": "cxn:coordinate-clause-construction", "end": "cxn:disjunctive-coordination", "rel": "SubtypeOf"}, {"start": "cxn:coordinate-clause-construction", "end": "cxn:exhaustive-list-coordination", "rel": "SubtypeOf"}, {"start": "cxn:coordinate-clause-construction", "end": "cxn:non-exhaustive-list-coordination", "rel": "SubtypeOf"}, {"start": "cxn:coordinate-clause-construction", "end": "str:anterior-deranking", "rel": "ExpressionOf"}, {"start": "cxn:coordinate-clause-construction", "end": "str:biclausal-reciprocal", "rel": "RecruitedFrom"}, {"start": "cxn:coordinate-clause-construction", "end": "str:coordinate-clause-strategy", "rel": "RecruitedFrom"}, {"start": "cxn:coordinate-clause-construction", "end": "str:posterior-deranking", "rel": "ExpressionOf"}, {"start": "cxn:coordinate-construction", "end": "cxn:coordinand", "rel": "ConstituentOf"}, {"start": "cxn:coordinate-construction", "end": "cxn:coordinate-clause-construction", "rel": "SubtypeOf"}, {"start": "cxn:coordinate-construction", "end": "cxn:nonclausal-coordination", "rel": "SubtypeOf"}, {"start": "cxn:coordinate-construction", "end": "inf:complex-figure", "rel": "FunctionOf"}, {"start": "cxn:coordinate-construction", "end": "sem:entity", "rel": "FunctionOf"}, {"start": "cxn:coordinate-construction", "end": "str:bisyndetic", "rel": "ExpressionOf"}, {"start": "cxn:coordinate-construction", "end": "str:coordinator", "rel": "ExpressionOf"}, {"start": "cxn:coordinate-construction", "end": "str:monosyndetic", "rel": "ExpressionOf"}, {"start": "cxn:coordinate-construction", "end": "str:tense-iconicity", "rel": "ExpressionOf"}, {"start": "cxn:core-argument-phrase", "end": "cxn:experiencer-phrase", "rel": "SubtypeOf"}, {"start": "cxn:core-argument-phrase", "end": "cxn:object-phrase", "rel": "SubtypeOf"}, {"start": "cxn:core-argument-phrase", "end": "cxn:passive-inverse-p-phrase", "rel": "SubtypeOf"}, {"start": "cxn:core-argument-phrase", "end": "cxn:stimulus-phrase", "rel": "SubtypeOf"}, {"start": "cxn:core-argument-phrase", "end": "cxn:subject-phrase", "rel": "SubtypeOf"}, {"start": "cxn:core-argument-phrase", "end": "inf:non-low-topicality", "rel": "FunctionOf"}, {"start": "cxn:core-argument-phrase", "end": "sem:central-participant", "rel": "FunctionOf"}, {"start": "cxn:damage-verb", "end": "sem:damage-event", "rel": "FunctionOf"}, {"start": "cxn:declarative-construction", "end": "cxn:declarative-negation-construction", "rel": "SubtypeOf"}, {"start": "cxn:declarative-construction", "end": "cxn:nonpredicational-construction", "rel": "SubtypeOf"}, {"start": "cxn:declarative-construction", "end": "cxn:topic-comment-construction", "rel": "SubtypeOf"}, {"start": "cxn:declarative-construction", "end": "inf:declarative", "rel": "FunctionOf"}, {"start": "cxn:declarative-construction", "end": "str:clause-alignment", "rel": "ModeledOn"}, {"start": "cxn:declarative-construction", "end": "str:declarative-marker", "rel": "ExpressionOf"}, {"start": "cxn:declarative-negation-construction", "end": "cxn:existential-negation-construction", "rel": "SubtypeOf"}, {"start": "cxn:declarative-negation-construction", "end": "str:affixal-negation", "rel": "ExpressionOf"}, {"start": "cxn:declarative-negation-construction", "end": "str:double-negation-strategy", "rel": "ExpressionOf"}, {"start": "cxn:declarative-negation-construction", "end": "str:existential-negative-strategy", "rel": "ExpressionOf"}, {"start": "cxn:declarative-negation-construction", "end": "str:identificational-strategy", "rel": "ExpressionOf"}, {"start": "cxn:declarative-negation-construction", "end": "str:negative-auxiliary-strategy", "rel": "ExpressionOf"}, {"start": "cxn:declarative-negation-construction", "end": "str:negative-particle", "rel": "ExpressionOf"}, {"start": "cxn:definite-article", "end": "cxn:anaphoric-article", "rel": "SubtypeOf"}, {"start": "cxn:definite-article", "end": "cxn:nonanaphoric-definite-article", "rel": "SubtypeOf"}, {"start": "cxn:definite-article", "end": "inf:accessibility", "rel": "FunctionOf"}, {"start": "cxn:definite-article", "end": "str:definite-article-strategy", "rel": "RecruitedFrom"}, {"start": "cxn:definite-pronoun", "end": "cxn:anaphoric-pronoun", "rel": "SubtypeOf"}, {"start": "cxn:definite-pronoun", "end": "cxn:personal-pronoun", "rel": "SubtypeOf"}, {"start": "cxn:definite-pronoun", "end": "inf:active-referent", "rel": "FunctionOf"}, {"start": "cxn:definite-pronoun", "end": "inf:discourse-deixis", "rel": "FunctionOf"}, {"start": "cxn:definite-pronoun", "end": "inf:inactive-referent", "rel": "FunctionOf"}, {"start": "cxn:definite-pronoun", "end": "inf:inferrable-referent", "rel": "FunctionOf"}, {"start": "cxn:definite-pronoun", "end": "inf:semi-active-referent", "rel": "FunctionOf"}, {"start": "cxn:demonstrative-attributive", "end": "sem:spatial-deixis", "rel": "FunctionOf"}, {"start": "cxn:demonstrative-pronoun", "end": "sem:spatial-deixis", "rel": "FunctionOf"}, {"start": "cxn:demonstrative-pronoun", "end": "str:demonstrative-strategy", "rel": "RecruitedFrom"}, {"start": "cxn:dependent-clause", "end": "cxn:adverbial-dependent-clause", "rel": "SubtypeOf"}, {"start": "cxn:dependent-clause", "end": "cxn:complement", "rel": "SubtypeOf"}, {"start": "cxn:dependent-clause", "end": "cxn:noun-complement", "rel": "SubtypeOf"}, {"start": "cxn:dependent-clause", "end": "cxn:relative-clause", "rel": "SubtypeOf"}, {"start": "cxn:dependent-clause", "end": "inf:major-propositional-act", "rel": "FunctionOf"}, {"start": "cxn:dependent-clause", "end": "sem:event", "rel": "FunctionOf"}, {"start": "cxn:depictive-complex-predicate", "end": "sem:participant-oriented", "rel": "FunctionOf"}, {"start": "cxn:depictive-complex-predicate", "end": "sem:simultaneous", "rel": "FunctionOf"}, {"start": "cxn:desiderative-construction", "end": "cxn:desiderative-predicate", "rel": "HeadOf"}, {"start": "cxn:desiderative-construction", "end": "sem:desiderative-event", "rel": "FunctionOf"}, {"start": "cxn:determiner", "end": "cxn:article", "rel": "SubtypeOf"}, {"start": "cxn:determiner", "end": "cxn:demonstrative-attributive", "rel": "SubtypeOf"}, {"start": "cxn:determiner", "end": "sem:contextual", "rel": "FunctionOf"}, {"start": "cxn:dimension-term", "end": "sem:dimension", "rel": "FunctionOf"}, {"start": "cxn:direct-negation-pronoun", "end": "inf:direct-negation-referent", "rel": "FunctionOf"}, {"start": "cxn:discourse-markers", "end": "inf:discourse-connection", "rel": "FunctionOf"}, {"start": "cxn:discourse-markers", "end": "sem:relational", "rel": "FunctionOf"}, {"start": "cxn:disjunctive-coordination", "end": "cxn:exclusive-disjunctive-coordination", "rel": "SubtypeOf"}, {"start": "cxn:disjunctive-coordination", "end": "cxn:inclusive-disjunctive-coordination", "rel": "SubtypeOf"}, {"start": "cxn:distributive-quantifier-term", "end": "sem:distributive-quantifier", "rel": "FunctionOf"}, {"start": "cxn:ditransitive-a-phrase", "end": "sem:a-role", "rel": "FunctionOf"}, {"start": "cxn:ditransitive-construction", "end": "cxn:ditransitive-a-phrase", "rel": "ConstituentOf"}, {"start": "cxn:ditransitive-construction", "end": "cxn:r-phrase", "rel": "ConstituentOf"}, {"start": "cxn:ditransitive-construction", "end": "cxn:t-phrase", "rel": "ConstituentOf"}, {"start": "cxn:ditransitive-construction", "end": "sem:trivalent", "rel": "FunctionOf"}, {"start": "cxn:ditransitive-construction", "end": "str:ditransitive-alignment", "rel": "ExpressionOf"}, {"start": "cxn:ditransitive-construction", "end": "str:external-possessor-strategy", "rel": "RecruitedFrom"}, {"start": "cxn:ditransitive-construction", "end": "str:internal-recipient-strategy", "rel": "ExpressionOf"}, {"start": "cxn:downtoner", "end": "sem:downtoning", "rel": "FunctionOf"}, {"start": "cxn:dynamic-predicate-part", "end": "sem:dynamic", "rel": "FunctionOf"}, {"start": "cxn:element", "end": "cxn:dependent", "rel": "SubtypeOf"}, {"start": "cxn:element", "end": "cxn:head", "rel": "SubtypeOf"}, {"start": "cxn:emotion-verb", "end": "sem:emotion-event", "rel": "FunctionOf"}, {"start": "cxn:entity-central-construction", "end": "cxn:presentational-construction", "rel": "SubtypeOf"}, {"start": "cxn:entity-central-construction", "end": "inf:entity-central", "rel": "FunctionOf"}, {"start": "cxn:equational-construction", "end": "inf:equational", "rel": "FunctionOf"}, {"start": "cxn:equational-construction", "end": "str:cleft-strategy", "rel": "RecruitedFrom"}, {"start": "cxn:equative-construction", "end": "sem:equative-relation", "rel": "FunctionOf"}, {"start": "cxn:equative-construction", "end": "str:associative-equative", "rel": "ExpressionOf"}, {"start": "cxn:equative-construction", "end": "str:degree-equative", "rel": "ExpressionOf"}, {"start": "cxn:equative-construction", "end": "str:equal-equative", "rel": "ExpressionOf"}, {"start": "cxn:equative-construction", "end": "str:object-equative", "rel": "ExpressionOf"}, {"start": "cxn:equative-construction", "end": "str:particle-equative", "rel": "ExpressionOf"}, {"start": "cxn:equative-construction", "end": "str:relative-based-equative", "rel": "ExpressionOf"}, {"start": "cxn:equative-construction", "end": "str:relative-equal-equative", "rel": "ExpressionOf"}, {"start": "cxn:equative-construction", "end": "str:unique-equative", "rel": "ExpressionOf"}, {"start": "cxn:evaluative-construction", "end": "cxn:commentative-construction", "rel": "SubtypeOf"}, {"start": "cxn:evaluative-construction", "end": "cxn:evaluative-predicate", "rel": "HeadOf"}, {"start": "cxn:evaluative-construction", "end": "cxn:fearing-construction", "rel": "SubtypeOf"}, {"start": "cxn:evaluative-construction", "end": "cxn:hoping-construction", "rel": "SubtypeOf"}, {"start": "cxn:evaluative-construction", "end": "cxn:wishing-construction", "rel": "SubtypeOf"}, {"start": "cxn:evaluative-construction", "end": "sem:evaluative-event", "rel": "FunctionOf"}, {"start": "cxn:evaluative-predicate", "end": "cxn:commentative-predicate", "rel": "SubtypeOf"}, {"start": "cxn:evaluative-predicate", "end": "cxn:fearing-predicate", "rel": "SubtypeOf"}, {"start": "cxn:evaluative-predicate", "end": "cxn:hoping-predicate", "rel": "SubtypeOf"}, {"start": "cxn:evaluative-predicate", "end": "cxn:wishing-predicate", "rel": "SubtypeOf"}, {"start": "cxn:event-central-construction", "end": "inf:event-central", "rel": "FunctionOf"}, {"start": "cxn:eventive-complex-predicate", "end": "cxn:dynamic-predicate-part", "rel": "ConstituentOf"}, {"start": "cxn:eventive-complex-predicate", "end": "str:contiguity-of-serial-verbs", "rel": "ExpressionOf"}, {"start": "cxn:eventive-complex-predicate", "end": "str:incorporation-of-serial-verbs", "rel": "ExpressionOf"}, {"start": "cxn:eventive-complex-predicate", "end": "str:locus-of-inflection-of-serial-verbs", "rel": "ExpressionOf"}, {"start": "cxn:eventive-predicate-part", "end": "cxn:dynamic-predicate-part", "rel": "SubtypeOf"}, {"start": "cxn:eventive-predicate-part", "end": "cxn:stative-predicate-part", "rel": "SubtypeOf"}, {"start": "cxn:exclamative-construction", "end": "inf:exclamative", "rel": "FunctionOf"}, {"start": "cxn:exclusive-disjunctive-coordination", "end": "sem:exclusive-disjunction", "rel": "FunctionOf"}, {"start": "cxn:exclusive-pronoun", "end": "sem:speaker", "rel": "FunctionOf"}, {"start": "cxn:exhaustive-list-coordination", "end": "cxn:exclusive-disjunctive-coordination", "rel": "SubtypeOf"}, {"start": "cxn:exhaustive-list-coordination", "end": "str:summarizer", "rel": "ExpressionOf"}, {"start": "cxn:existential-negation-construction", "end": "sem:existence-event", "rel": "FunctionOf"}, {"start": "cxn:existential-negation-construction", "end": "str:existential-negative-strategy", "rel": "RecruitedFrom"}, {"start": "cxn:existential-negation-construction", "end": "str:negative-fusion", "rel": "ExpressionOf"}, {"start": "cxn:experience-verb", "end": "sem:experience", "rel": "FunctionOf"}, {"start": "cxn:experiencer-phrase", "end": "sem:experiencer", "rel": "FunctionOf"}, {"start": "cxn:experiential-construction", "end": "cxn:experiencer-phrase", "rel": "ConstituentOf"}, {"start": "cxn:experiential-construction", "end": "cxn:experiential-verb", "rel": "HeadOf"}, {"start": "cxn:experiential-construction", "end": "cxn:stimulus-phrase", "rel": "ConstituentOf"}, {"start": "cxn:experiential-construction", "end": "sem:experiential-event", "rel": "FunctionOf"}, {"start": "cxn:experiential-construction", "end": "str:experiential-alignment", "rel": "ExpressionOf"}, {"start": "cxn:experiential-verb", "end": "cxn:affecting-verb", "rel": "SubtypeOf"}, {"start": "cxn:experiential-verb", "end": "cxn:attending-verb", "rel": "SubtypeOf"}, {"start": "cxn:experiential-verb", "end": "cxn:bodily-predicate", "rel": "SubtypeOf"}, {"start": "cxn:experiential-verb", "end": "cxn:cognition-verb", "rel": "SubtypeOf"}, {"start": "cxn:experiential-verb", "end": "cxn:emotion-verb", "rel": "SubtypeOf"}, {"start": "cxn:experiential-verb", "end": "cxn:experience-verb", "rel": "SubtypeOf"}, {"start": "cxn:experiential-verb", "end": "cxn:sensation-verb", "rel": "SubtypeOf"}, {"start": "cxn:extroverted-verb", "end": "sem:extroverted", "rel": "FunctionOf"}, {"start": "cxn:fearing-construction", "end": "cxn:fearing-predicate", "rel": "HeadOf"}, {"start": "cxn:fearing-construction", "end": "sem:fearing-event", "rel": "FunctionOf"}, {"start": "cxn:figure-phrase", "end": "sem:figure", "rel": "FunctionOf"}, {"start": "cxn:first-person-pronoun", "end": "cxn:exclusive-pronoun", "rel": "SubtypeOf"}, {"start": "cxn:first-person-pronoun", "end": "cxn:inclusive-pronoun", "rel": "SubtypeOf"}, {"start": "cxn:first-person-pronoun", "end": "sem:first-person", "rel": "FunctionOf"}, {"start": "cxn:first-person-pronoun", "end": "str:first-person-plural-strategy", "rel": "RecruitedFrom"}, {"start": "cxn:form-term", "end": "sem:arrangement", "rel": "FunctionOf"}, {"start": "cxn:free-choice-pronoun", "end": "inf:free-choice-referent", "rel": "FunctionOf"}, {"start": "cxn:free-modification-construction", "end": "cxn:free-relative-clause-construction", "rel": "SubtypeOf"}, {"start": "cxn:free-modification-construction", "end": "inf:free-choice-referent", "rel": "FunctionOf"}, {"start": "cxn:free-modification-construction", "end": "inf:irrealis-referent", "rel": "FunctionOf"}, {"start": "cxn:free-modification-construction", "end": "inf:pragmatically-specific-referent", "rel": "FunctionOf"}, {"start": "cxn:free-modification-construction", "end": "inf:semantically-specific-referent", "rel": "FunctionOf"}, {"start": "cxn:free-modification-construction", "end": "str:headless", "rel": "ExpressionOf"}, {"start": "cxn:free-modification-construction", "end": "str:overtly-headed-strategy", "rel": "ExpressionOf"}, {"start": "cxn:gender-term", "end": "sem:gender-class", "rel": "FunctionOf"}, {"start": "cxn:generic-article", "end": "sem:type", "rel": "FunctionOf"}, {"start": "cxn:generic-article", "end": "str:definite-article-strategy", "rel": "ExpressionOf"}, {"start": "cxn:generic-article", "end": "str:nonspecific-article-strategy", "rel": "ExpressionOf"}, {"start": "cxn:generic-conditional-construction", "end": "sem:generic-conditional-relation", "rel": "FunctionOf"}, {"start": "cxn:generic-pronoun", "end": "inf:generic-referent", "rel": "FunctionOf"}, {"start": "cxn:generic-pronoun", "end": "sem:type", "rel": "FunctionOf"}, {"start": "cxn:generic-pronoun", "end": "str:first-person-plural-strategy", "rel": "ExpressionOf"}, {"start": "cxn:generic-pronoun", "end": "str:human-noun-strategy", "rel": "ExpressionOf"}, {"start": "cxn:generic-pronoun", "end": "str:nonspecific-pronoun-strategy", "rel": "ExpressionOf"}, {"start": "cxn:ground-phrase", "end": "sem:ground", "rel": "FunctionOf"}, {"start": "cxn:group-term", "end": "sem:group", "rel": "FunctionOf"}, {"start": "cxn:hanging-topic-construction", "end": "cxn:hanging-topic-phrase", "rel": "ConstituentOf"}, {"start": "cxn:hoping-construction", "end": "cxn:hoping-predicate", "rel": "HeadOf"}, {"start": "cxn:hoping-construction", "end": "sem:hoping-event", "rel": "FunctionOf"}, {"start": "cxn:human-noun", "end": "sem:person", "rel": "FunctionOf"}, {"start": "cxn:human-noun", "end": "str:human-noun-strategy", "rel": "RecruitedFrom"}, {"start": "cxn:human-propensity-term", "end": "sem:human-propensity", "rel": "FunctionOf"}, {"start": "cxn:human-proper-noun", "end": "sem:person", "rel": "FunctionOf"}, {"start": "cxn:identificational-construction", "end": "cxn:equational-construction", "rel": "SubtypeOf"}, {"start": "cxn:identificational-construction", "end": "cxn:polarity-focus-construction", "rel": "SubtypeOf"}, {"start": "cxn:identificational-construction", "end": "inf:identificational", "rel": "FunctionOf"}, {"start": "cxn:identificational-construction", "end": "str:cleft-strategy", "rel": "ExpressionOf"}, {"start": "cxn:identificational-construction", "end": "str:ellipsis", "rel": "ExpressionOf"}, {"start": "cxn:identificational-construction", "end": "str:focus-marker", "rel": "ExpressionOf"}, {"start": "cxn:identificational-construction", "end": "str:identificational-strategy", "rel": "RecruitedFrom"}, {"start": "cxn:imperative-hortative-construction", "end": "cxn:prohibitive-construction", "rel": "SubtypeOf"}, {"start": "cxn:imperative-hortative-construction", "end": "inf:imperative-hortative", "rel": "FunctionOf"}, {"start": "cxn:imperative-hortative-construction", "end": "str:bare-verb-stem", "rel": "ExpressionOf"}, {"start": "cxn:imperative-hortative-construction", "end": "str:insubordination", "rel": "ExpressionOf"}, {"start": "cxn:inalienable-possession-attributive-phrase", "end": "sem:body-part-relation", "rel": "FunctionOf"}, {"start": "cxn:inalienable-possession-attributive-phrase", "end": "sem:kinship-relation", "rel": "FunctionOf"}, {"start": "cxn:inalienable-possession-modification-construction", "end": "cxn:inalienable-possession-attributive-phrase", "rel": "ConstituentOf"}, {"start": "cxn:inclusive-disjunctive-coordination", "end": "sem:inclusive-disjunction", "rel": "FunctionOf"}, {"start": "cxn:inclusive-pronoun", "end": "sem:hearer", "rel": "FunctionOf"}, {"start": "cxn:inclusive-pronoun", "end": "sem:speaker", "rel": "FunctionOf"}, {"start": "cxn:inclusory-construction", "end": "sem:hearer", "rel": "FunctionOf"}, {"start": "cxn:inclusory-construction", "end": "sem:other", "rel": "FunctionOf"}, {"start": "cxn:inclusory-construction", "end": "sem:speaker", "rel": "FunctionOf"}, {"start": "cxn:inclusory-construction", "end": "str:inclusory-strategy", "rel": "ExpressionOf"}, {"start": "cxn:indefinite-article", "end": "cxn:pragmatically-nonspecific-article", "rel": "SubtypeOf"}, {"start": "cxn:indefinite-article", "end": "cxn:pragmatically-specific-article", "rel": "SubtypeOf"}, {"start": "cxn:indefinite-article", "end": "cxn:semantically-nonspecific-article", "rel": "SubtypeOf"}, {"start": "cxn:indefinite-article", "end": "inf:identity-unknown", "rel": "FunctionOf"}, {"start": "cxn:indefinite-article", "end": "inf:type-identifiable", "rel": "FunctionOf"}, {"start": "cxn:indefinite-pronoun", "end": "cxn:pragmatically-nonspecific-pronoun", "rel": "SubtypeOf"}, {"start": "cxn:indefinite-pronoun", "end": "cxn:pragmatically-specific-pronoun", "rel": "SubtypeOf"}, {"start": "cxn:indefinite-pronoun", "end": "cxn:semantically-nonspecific-pronoun", "rel": "SubtypeOf"}, {"start": "cxn:indefinite-pronoun", "end": "cxn:specific-known-pronoun", "rel": "SubtypeOf"}, {"start": "cxn:indefinite-pronoun", "end": "cxn:specific-unknown-pronoun", "rel": "SubtypeOf"}, {"start": "cxn:indefinite-pronoun", "end": "inf:generic-referent", "rel": "FunctionOf"}, {"start": "cxn:indefinite-pronoun", "end": "inf:nonspecific-referent", "rel": "FunctionOf"}, {"start": "cxn:indefinite-pronoun", "end": "inf:pragmatically-specific-referent", "rel": "FunctionOf"}, {"start": "cxn:indefinite-pronoun", "end": "inf:semantically-specific-referent", "rel": "FunctionOf"}, {"start": "cxn:indirect-negation-pronoun", "end": "inf:indirect-negation-referent", "rel": "FunctionOf"}, {"start": "cxn:information-question-construction", "end": "inf:information-question", "rel": "FunctionOf"}, {"start": "cxn:information-question-response-construction", "end": "inf:information-question-response", "rel": "FunctionOf"}, {"start": "cxn:information-question-response-construction", "end": "str:ellipsis", "rel": "ExpressionOf"}, {"start": "cxn:ingestion-verb", "end": "sem:ingestion-event", "rel": "FunctionOf"}, {"start": "cxn:intensifier", "end": "sem:intensifying", "rel": "FunctionOf"}, {"start": "cxn:interaction-verb", "end": "sem:interaction-event", "rel": "FunctionOf"}, {"start": "cxn:interrogative-complement", "end": "inf:identificational", "rel": "FunctionOf"}, {"start": "cxn:interrogative-complement", "end": "str:direct-question-strategy", "rel": "ExpressionOf"}, {"start": "cxn:interrogative-complement", "end": "str:interrogative-complementizer", "rel": "ExpressionOf"}, {"start": "cxn:interrogative-construction", "end": "cxn:alternative-question-construction", "rel": "SubtypeOf"}, {"start": "cxn:interrogative-construction", "end": "cxn:information-question-construction", "rel": "SubtypeOf"}, {"start": "cxn:interrogative-construction", "end": "cxn:polarity-question-construction", "rel": "SubtypeOf"}, {"start": "cxn:interrogative-construction", "end": "inf:interrogative", "rel": "FunctionOf"}, {"start": "cxn:interrogative-construction", "end": "str:direct-question-strategy", "rel": "RecruitedFrom"}, {"start": "cxn:interrogative-construction", "end": "str:identificational-strategy", "rel": "ExpressionOf"}, {"start": "cxn:interrogative-construction", "end": "str:question-marker", "rel": "ExpressionOf"}, {"start": "cxn:interrogative-construction", "end": "str:tag", "rel": "ExpressionOf"}, {"start": "cxn:interrogative-pronoun", "end": "inf:interrogative-unit", "rel": "FunctionOf"}, {"start": "cxn:interrogative-pronoun", "end": "str:interrogative-pronoun-strategy", "rel": "RecruitedFrom"}, {"start": "cxn:intransitive-construction", "end": "cxn:s-phrase", "rel": "ConstituentOf"}, {"start": "cxn:intransitive-construction", "end": "sem:monovalent", "rel": "FunctionOf"}, {"start": "cxn:intransitive-construction", "end": "str:active-alignment", "rel": "ExpressionOf"}, {"start": "cxn:intransitive-construction", "end": "str:middle-voice", "rel": "ExpressionOf"}, {"start": "cxn:intransitive-construction", "end": "str:single-role-strategy", "rel": "RecruitedFrom"}, {"start": "cxn:intransitive-construction", "end": "str:transitive-alignment", "rel": "ModeledOn"}, {"start": "cxn:introverted-verb", "end": "sem:introverted", "rel": "FunctionOf"}, {"start": "cxn:irrealis-pronoun", "end": "inf:irrealis-referent", "rel": "FunctionOf"}, {"start": "cxn:killing-injuring-verb", "end": "sem:killing-injuring-event", "rel": "FunctionOf"}, {"start": "cxn:kinship-noun", "end": "sem:kinship-relation", "rel": "FunctionOf"}, {"start": "cxn:kinship-noun", "end": "sem:person", "rel": "FunctionOf"}, {"start": "cxn:knowledge-construction", "end": "cxn:knowledge-predicate", "rel": "HeadOf"}, {"start": "cxn:knowledge-construction", "end": "sem:knowledge-event", "rel": "FunctionOf"}, {"start": "cxn:let-alone-construction", "end": "sem:let-alone-relation", "rel": "FunctionOf"}, {"start": "cxn:locational-construction", "end": "cxn:predicational-location-construction", "rel": "SubtypeOf"}, {"start": "cxn:locational-construction", "end": "cxn:presentational-location-construction", "rel": "SubtypeOf"}, {"start": "cxn:locative-modification-construction", "end": "cxn:locative-phrase", "rel": "ConstituentOf"}, {"start": "cxn:locative-modification-construction", "end": "sem:figure-ground-spatial-relation", "rel": "FunctionOf"}, {"start": "cxn:locative-phrase", "end": "sem:ground", "rel": "FunctionOf"}, {"start": "cxn:logophoric-construction", "end": "inf:logophoric-subject-identity", "rel": "FunctionOf"}, {"start": "cxn:logophoric-construction", "end": "str:logophoric-system", "rel": "ExpressionOf"}, {"start": "cxn:main-clause", "end": "inf:pragmatic-assertion", "rel": "FunctionOf"}, {"start": "cxn:main-clause", "end": "sem:event", "rel": "FunctionOf"}, {"start": "cxn:main-clause", "end": "str:complement-disalignment", "rel": "ModeledOn"}, {"start": "cxn:main-clause", "end": "str:logophoric-system", "rel": "ModeledOn"}, {"start": "cxn:main-clause", "end": "str:reference-tracking-system", "rel": "ModeledOn"}, {"start": "cxn:manipulative-construction", "end": "cxn:manipulative-predicate", "rel": "HeadOf"}, {"start": "cxn:manipulative-construction", "end": "sem:manipulative-event", "rel": "FunctionOf"}, {"start": "cxn:manner-complex-predicate", "end": "sem:event-oriented", "rel": "FunctionOf"}, {"start": "cxn:manner-complex-predicate", "end": "sem:simultaneous", "rel": "FunctionOf"}, {"start": "cxn:manner-of-motion-verb", "end": "sem:manner-of-motion-event", "rel": "FunctionOf"}, {"start": "cxn:manner-verb", "end": "cxn:manner-of-motion-verb", "rel": "SubtypeOf"}, {"start": "cxn:manner-verb", "end": "sem:manner-profile", "rel": "FunctionOf"}, {"start": "cxn:material-term", "end": "sem:material", "rel": "FunctionOf"}, {"start": "cxn:matrix-clause", "end": "cxn:adverbial-matrix-clause", "rel": "SubtypeOf"}, {"start": "cxn:matrix-clause", "end": "cxn:complement-matrix-clause", "rel": "SubtypeOf"}, {"start": "cxn:matrix-clause", "end": "cxn:noun-complement-matrix-clause", "rel": "SubtypeOf"}, {"start": "cxn:matrix-clause", "end": "cxn:relative-matrix-clause", "rel": "SubtypeOf"}, {"start": "cxn:matrix-clause", "end": "inf:major-propositional-act", "rel": "FunctionOf"}, {"start": "cxn:matrix-clause", "end": "sem:event", "rel": "FunctionOf"}, {"start": "cxn:means-construction", "end": "sem:means", "rel": "FunctionOf"}, {"start": "cxn:measure-term", "end": "sem:measure", "rel": "FunctionOf"}, {"start": "cxn:measurement", "end": "sem:measuring", "rel": "FunctionOf"}, {"start": "cxn:mensural-attributive-phrase", "end": "cxn:mensural-term", "rel": "HeadOf"}, {"start": "cxn:mensural-attributive-phrase", "end": "sem:mensural-concept", "rel": "FunctionOf"}, {"start": "cxn:mensural-modification-construction", "end": "cxn:mensural-attributive-phrase", "rel": "ConstituentOf"}, {"start": "cxn:mensural-modification-construction", "end": "str:mensural-classifier", "rel": "ExpressionOf"}, {"start": "cxn:mensural-modification-construction", "end": "str:pseudo-partitive", "rel": "ExpressionOf"}, {"start": "cxn:mensural-term", "end": "cxn:container-term", "rel": "SubtypeOf"}, {"start": "cxn:mensural-term", "end": "cxn:form-term", "rel": "SubtypeOf"}, {"start": "cxn:mensural-term", "end": "cxn:group-term", "rel": "SubtypeOf"}, {"start": "cxn:mensural-term", "end": "cxn:measure-term", "rel": "SubtypeOf"}, {"start": "cxn:mensural-term", "end": "cxn:piece-term", "rel": "SubtypeOf"}, {"start": "cxn:mensural-term", "end": "cxn:species-term", "rel": "SubtypeOf"}, {"start": "cxn:modification-construction", "end": "cxn:action-modification-construction", "rel": "SubtypeOf"}, {"start": "cxn:modification-construction", "end": "cxn:adjective-modification-construction", "rel": "SubtypeOf"}, {"start": "cxn:modification-construction", "end": "cxn:anaphoric-head-construction", "rel": "SubtypeOf"}, {"start": "cxn:modification-construction", "end": "cxn:anchoring-construction", "rel": "SubtypeOf"}, {"start": "cxn:modification-construction", "end": "cxn:attributive-phrase", "rel": "ConstituentOf"}, {"start": "cxn:modification-construction", "end": "cxn:free-modification-construction", "rel": "SubtypeOf"}, {"start": "cxn:modification-construction", "end": "cxn:mensural-modification-construction", "rel": "SubtypeOf"}, {"start": "cxn:modification-construction", "end": "cxn:nominal-modification-construction", "rel": "SubtypeOf"}, {"start": "cxn:modification-construction", "end": "cxn:numeral-modification-construction", "rel": "SubtypeOf"}, {"start": "cxn:modification-construction", "end": "cxn:quantifier-modification-construction", "rel": "SubtypeOf"}, {"start": "cxn:modification-construction", "end": "cxn:referent-expression", "rel": "HeadOf"}, {"start": "cxn:modification-construction", "end": "cxn:set-member-modification-construction", "rel": "SubtypeOf"}, {"start": "cxn:modification-construction", "end": "cxn:typifying-construction", "rel": "SubtypeOf"}, {"start": "cxn:modification-construction", "end": "str:affixation", "rel": "ExpressionOf"}, {"start": "cxn:modification-construction", "end": "str:classifier", "rel": "ExpressionOf"}, {"start": "cxn:modification-construction", "end": "str:compounding", "rel": "ExpressionOf"}, {"start": "cxn:modification-construction", "end": "str:degree-affix", "rel": "ExpressionOf"}, {"start": "cxn:modification-construction", "end": "str:flagging", "rel": "ExpressionOf"}, {"start": "cxn:modification-construction", "end": "str:indexation", "rel": "ExpressionOf"}, {"start": "cxn:modification-construction", "end": "str:juxtaposition", "rel": "ExpressionOf"}, {"start": "cxn:modification-construction", "end": "str:linker", "rel": "ExpressionOf"}, {"start": "cxn:modification-construction", "end": "str:repeater", "rel": "ExpressionOf"}, {"start": "cxn:modification-construction", "end": "str:sortal-classifier", "rel": "ExpressionOf"}, {"start": "cxn:modifier", "end": "cxn:adjective", "rel": "SubtypeOf"}, {"start": "cxn:modifier", "end": "cxn:cardinal-numeral-term", "rel": "SubtypeOf"}, {"start": "cxn:modifier", "end": "cxn:mensural-term", "rel": "SubtypeOf"}, {"start": "cxn:modifier", "end": "cxn:quantifier-term", "rel": "SubtypeOf"}, {"start": "cxn:modifier", "end": "cxn:set-member-term", "rel": "SubtypeOf"}, {"start": "cxn:motion-construction", "end": "cxn:figure-phrase", "rel": "ConstituentOf"}, {"start": "cxn:motion-construction", "end": "cxn:ground-phrase", "rel": "ConstituentOf"}, {"start": "cxn:motion-construction", "end": "cxn:motion-verb", "rel": "HeadOf"}, {"start": "cxn:motion-construction", "end": "sem:motion-event", "rel": "FunctionOf"}, {"start": "cxn:motion-construction", "end": "str:double-expression", "rel": "ExpressionOf"}, {"start": "cxn:motion-construction", "end": "str:figure-incorporating", "rel": "ExpressionOf"}, {"start": "cxn:motion-construction", "end": "str:satellite-framing-strategy", "rel": "ExpressionOf"}, {"start": "cxn:motion-construction", "end": "str:serial-verb-strategy", "rel": "ExpressionOf"}, {"start": "cxn:motion-construction", "end": "str:verb-framing-strategy", "rel": "ExpressionOf"}, {"start": "cxn:motion-verb", "end": "cxn:path-verb", "rel": "SubtypeOf"}, {"start": "cxn:natural-object-noun", "end": "sem:thing", "rel": "FunctionOf"}, {"start": "cxn:negation-construction", "end": "cxn:declarative-negation-construction", "rel": "SubtypeOf"}, {"start": "cxn:negation-construction", "end": "cxn:existential-negation-construction", "rel": "SubtypeOf"}, {"start": "cxn:negation-construction", "end": "cxn:prohibitive-construction", "rel": "SubtypeOf"}, {"start": "cxn:negation-construction", "end": "sem:negative-polarity", "rel": "FunctionOf"}, {"start": "cxn:negative-circumstantial-construction", "end": "sem:negative-circumstantial", "rel": "FunctionOf"}, {"start": "cxn:negative-question-polarity-response-construction", "end": "inf:negative-question-polarity-response", "rel": "FunctionOf"}, {"start": "cxn:negative-question-polarity-response-construction", "end": "str:polarity-response-alignment", "rel": "ExpressionOf"}, {"start": "cxn:nominal-attributive-phrase", "end": "cxn:locative-phrase", "rel": "SubtypeOf"}, {"start": "cxn:nominal-attributive-phrase", "end": "cxn:partitive-phrase", "rel": "SubtypeOf"}, {"start": "cxn:nominal-attributive-phrase", "end": "cxn:possessive-attributive-phrase", "rel": "SubtypeOf"}, {"start": "cxn:nominal-attributive-phrase", "end": "sem:object-concept", "rel": "FunctionOf"}, {"start": "cxn:nominal-modification-construction", "end": "cxn:binominal-lexeme", "rel": "SubtypeOf"}, {"start": "cxn:nominal-modification-construction", "end": "cxn:locative-modification-construction", "rel": "SubtypeOf"}, {"start": "cxn:nominal-modification-construction", "end": "cxn:nominal-attributive-phrase", "rel": "ConstituentOf"}, {"start": "cxn:nominal-modification-construction", "end": "cxn:partitive-construction", "rel": "SubtypeOf"}, {"start": "cxn:nominal-modification-construction", "end": "cxn:possessive-modification-construction", "rel": "SubtypeOf"}, {"start": "cxn:nominal-phrase", "end": "cxn:associative-construction", "rel": "SubtypeOf"}, {"start": "cxn:nominal-phrase", "end": "cxn:noun", "rel": "HeadOf"}, {"start": "cxn:nominal-phrase", "end": "sem:object-concept", "rel": "FunctionOf"}, {"start": "cxn:non-exhaustive-list-coordination", "end": "cxn:inclusive-disjunctive-coordination", "rel": "SubtypeOf"}, {"start": "cxn:non-exhaustive-list-coordination", "end": "sem:exhaustive-list", "rel": "FunctionOf"}, {"start": "cxn:non-exhaustive-list-coordination", "end": "str:general-extender", "rel": "ExpressionOf"}, {"start": "cxn:nonanaphoric-definite-article", "end": "inf:low-accessibility", "rel": "FunctionOf"}, {"start": "cxn:nonbasic-voice", "end": "cxn:antipassive-construction", "rel": "SubtypeOf"}, {"start": "cxn:nonbasic-voice", "end": "cxn:applicative-construction", "rel": "SubtypeOf"}, {"start": "cxn:nonbasic-voice", "end": "cxn:causative-construction", "rel": "SubtypeOf"}, {"start": "cxn:nonbasic-voice", "end": "cxn:passive-inverse-voice", "rel": "SubtypeOf"}, {"start": "cxn:nonclausal-coordination", "end": "sem:object-concept", "rel": "FunctionOf"}, {"start": "cxn:nonpredicational-construction", "end": "cxn:identificational-construction", "rel": "SubtypeOf"}, {"start": "cxn:nonpredicational-construction", "end": "cxn:thetic-construction", "rel": "SubtypeOf"}, {"start": "cxn:nonprototypical-construction", "end": "cxn:nonbasic-voice", "rel": "SubtypeOf"}, {"start": "cxn:nonprototypical-construction", "end": "cxn:nonprototypical-predication-construction", "rel": "SubtypeOf"}, {"start": "cxn:nonprototypical-construction", "end": "str:actual-information-packaging-strategy", "rel": "ExpressionOf"}, {"start": "cxn:nonprototypical-construction", "end": "str:hybrid-information-packaging-strategy", "rel": "ExpressionOf"}, {"start": "cxn:nonprototypical-construction", "end": "str:information-packaging-alignment", "rel": "ExpressionOf"}, {"start": "cxn:nonprototypical-construction", "end": "str:semantic-information-packaging-strategy", "rel": "ExpressionOf"}, {"start": "cxn:nonprototypical-predication-construction", "end": "cxn:predicate-adjectival-construction", "rel": "SubtypeOf"}, {"start": "cxn:nonprototypical-predication-construction", "end": "cxn:predicate-nominal-construction", "rel": "SubtypeOf"}, {"start": "cxn:nonprototypical-predication-construction", "end": "cxn:predicational-location-construction", "rel": "SubtypeOf"}, {"start": "cxn:nonprototypical-predication-construction", "end": "cxn:predicational-possession-construction", "rel": "SubtypeOf"}, {"start": "cxn:nonprototypical-predication-construction", "end": "sem:state", "rel": "FunctionOf"}, {"start": "cxn:nonprototypical-predication-construction", "end": "str:locational-strategy", "rel": "ExpressionOf"}, {"start": "cxn:nonprototypical-predication-construction", "end": "str:nonverbal-copula-strategy", "rel": "ExpressionOf"}, {"start": "cxn:nonprototypical-predication-construction", "end": "str:verbal-copula", "rel": "ExpressionOf"}, {"start": "cxn:nonprototypical-predication-construction", "end": "str:verbal-strategy", "rel": "ExpressionOf"}, {"start": "cxn:nonprototypical-predication-construction", "end": "str:zero-copula", "rel": "ExpressionOf"}, {"start": "cxn:nonsubject-argument-phrase", "end": "cxn:causee-phrase", "rel": "SubtypeOf"}, {"start": "cxn:nonsubject-argument-phrase", "end": "cxn:ground-phrase", "rel": "SubtypeOf"}, {"start": "cxn:nonsubject-argument-phrase", "end": "cxn:object-phrase", "rel": "SubtypeOf"}, {"start": "cxn:nonsubject-argument-phrase", "end": "cxn:oblique-phrase", "rel": "SubtypeOf"}, {"start": "cxn:nonsubject-argument-phrase", "end": "cxn:passive-inverse-a-phrase", "rel": "SubtypeOf"}, {"start": "cxn:nonsubject-argument-phrase", "end": "inf:non-high-topicality", "rel": "FunctionOf"}, {"start": "cxn:noun", "end": "cxn:common-noun", "rel": "SubtypeOf"}, {"start": "cxn:noun", "end": "cxn:pronoun", "rel": "SubtypeOf"}, {"start": "cxn:noun", "end": "cxn:proper-noun", "rel": "SubtypeOf"}, {"start": "cxn:noun-complement", "end": "inf:modification", "rel": "FunctionOf"}, {"start": "cxn:noun-complement", "end": "sem:event", "rel": "FunctionOf"}, {"start": "cxn:noun-complement-clause-construction", "end": "cxn:noun-complement", "rel": "ConstituentOf"}, {"start": "cxn:noun-complement-clause-construction", "end": "cxn:noun-complement-matrix-clause", "rel": "HeadOf"}, {"start": "cxn:noun-complement-clause-construction", "end": "sem:event", "rel": "FunctionOf"}, {"start": "cxn:noun-complement-clause-construction", "end": "sem:participant-role", "rel": "FunctionOf"}, {"start": "cxn:noun-complement-clause-construction", "end": "str:noun-modifying-clause-strategy", "rel": "ExpressionOf"}, {"start": "cxn:noun-complement-matrix-clause", "end": "cxn:noun-complement-referring-phrase", "rel": "ConstituentOf"}, {"start": "cxn:noun-complement-referring-phrase", "end": "cxn:noun-complement-head", "rel": "HeadOf"}, {"start": "cxn:noun-complement-referring-phrase", "end": "sem:peripheral-participant", "rel": "FunctionOf"}, {"start": "cxn:numeral-attributive-phrase", "end": "cxn:cardinal-numeral-term", "rel": "HeadOf"}, {"start": "cxn:numeral-attributive-phrase", "end": "sem:cardinal-numeral", "rel": "FunctionOf"}, {"start": "cxn:numeral-modification-construction", "end": "cxn:numeral-attributive-phrase", "rel": "ConstituentOf"}, {"start": "cxn:object-identity-construction", "end": "inf:object-identity", "rel": "FunctionOf"}, {"start": "cxn:object-identity-construction", "end": "str:anterior-zero", "rel": "ExpressionOf"}, {"start": "cxn:object-identity-construction", "end": "str:overt-coding", "rel": "ExpressionOf"}, {"start": "cxn:object-identity-construction", "end": "str:posterior-zero", "rel": "ExpressionOf"}, {"start": "cxn:object-phrase", "end": "cxn:applicative-object-phrase", "rel": "SubtypeOf"}, {"start": "cxn:object-phrase", "end": "cxn:p-phrase", "rel": "SubtypeOf"}, {"start": "cxn:object-phrase", "end": "cxn:r-phrase", "rel": "SubtypeOf"}, {"start": "cxn:object-phrase", "end": "cxn:t-phrase", "rel": "SubtypeOf"}, {"start": "cxn:object-phrase", "end": "inf:mid-topicality", "rel": "FunctionOf"}, {"start": "cxn:oblique-phrase", "end": "cxn:antipassive-oblique-phrase", "rel": "SubtypeOf"}, {"start": "cxn:oblique-phrase", "end": "inf:low-topicality", "rel": "FunctionOf"}, {"start": "cxn:oblique-phrase", "end": "sem:peripheral-participant", "rel": "FunctionOf"}, {"start": "cxn:ordinal-numeral-term", "end": "sem:ordinal-numeral", "rel": "FunctionOf"}, {"start": "cxn:p-phrase", "end": "sem:p-role", "rel": "FunctionOf"}, {"start": "cxn:partitive-construction", "end": "cxn:partitive-phrase", "rel": "ConstituentOf"}, {"start": "cxn:partitive-construction", "end": "cxn:piece-term", "rel": "HeadOf"}, {"start": "cxn:partitive-construction", "end": "inf:situating", "rel": "FunctionOf"}, {"start": "cxn:partitive-construction", "end": "sem:object-concept", "rel": "FunctionOf"}, {"start": "cxn:partitive-construction", "end": "sem:piece", "rel": "FunctionOf"}, {"start": "cxn:partitive-construction", "end": "str:pseudo-partitive", "rel": "RecruitedFrom"}, {"start": "cxn:passive-inverse-a-phrase", "end": "sem:a-role", "rel": "FunctionOf"}, {"start": "cxn:passive-inverse-p-phrase", "end": "sem:p-role", "rel": "FunctionOf"}, {"start": "cxn:passive-inverse-voice", "end": "cxn:passive-inverse-a-phrase", "rel": "ConstituentOf"}, {"start": "cxn:passive-inverse-voice", "end": "cxn:passive-inverse-p-phrase", "rel": "ConstituentOf"}, {"start": "cxn:passive-inverse-voice", "end": "str:passive-inverse-alignment", "rel": "ExpressionOf"}, {"start": "cxn:passive-inverse-voice", "end": "str:special-p-strategy", "rel": "ExpressionOf"}, {"start": "cxn:path-verb", "end": "sem:path-event", "rel": "FunctionOf"}, {"start": "cxn:perception-clause", "end": "cxn:perception-verb", "rel": "HeadOf"}, {"start": "cxn:perception-clause", "end": "sem:perception-event", "rel": "FunctionOf"}, {"start": "cxn:perception-clause", "end": "str:perception-verb-strategy", "rel": "RecruitedFrom"}, {"start": "cxn:perception-complement-clause-construction", "end": "cxn:perception-complement-taking-predicate", "rel": "HeadOf"}, {"start": "cxn:perception-complement-clause-construction", "end": "sem:eventive-perception-event", "rel": "FunctionOf"}, {"start": "cxn:personal-pronoun", "end": "cxn:first-person-pronoun", "rel": "SubtypeOf"}, {"start": "cxn:personal-pronoun", "end": "cxn:inclusory-construction", "rel": "SubtypeOf"}, {"start": "cxn:personal-pronoun", "end": "cxn:second-person-pronoun", "rel": "SubtypeOf"}, {"start": "cxn:personal-pronoun", "end": "cxn:third-person-pronoun", "rel": "SubtypeOf"}, {"start": "cxn:personal-pronoun", "end": "sem:object-concept", "rel": "FunctionOf"}, {"start": "cxn:personal-pronoun", "end": "sem:person-deixis", "rel": "FunctionOf"}, {"start": "cxn:physical-property-term", "end": "sem:physical-property", "rel": "FunctionOf"}, {"start": "cxn:place-noun", "end": "sem:place", "rel": "FunctionOf"}, {"start": "cxn:place-proper-noun", "end": "sem:place", "rel": "FunctionOf"}, {"start": "cxn:plant-noun", "end": "sem:thing", "rel": "FunctionOf"}, {"start": "cxn:polarity-focus-construction", "end": "sem:polarity", "rel": "FunctionOf"}, {"start": "cxn:polarity-question-construction", "end": "inf:polarity-question", "rel": "FunctionOf"}, {"start": "cxn:polarity-question-construction", "end": "str:a-not-a", "rel": "ExpressionOf"}, {"start": "cxn:polarity-response-construction", "end": "cxn:negative-question-polarity-response-construction", "rel": "SubtypeOf"}, {"start": "cxn:polarity-response-construction", "end": "cxn:positive-question-polarity-response-construction", "rel": "SubtypeOf"}, {"start": "cxn:polarity-response-construction", "end": "inf:polarity-response", "rel": "FunctionOf"}, {"start": "cxn:polarity-response-construction", "end": "str:echo-strategy", "rel": "ExpressionOf"}, {"start": "cxn:positive-question-polarity-response-construction", "end": "inf:positive-question-polarity-response", "rel": "FunctionOf"}, {"start": "cxn:positive-question-polarity-response-construction", "end": "str:polarity-response-alignment", "rel": "ModeledOn"}, {"start": "cxn:possessed-argument-construction", "end": "cxn:possessor-argument-phrase", "rel": "ConstituentOf"}, {"start": "cxn:possessed-argument-construction", "end": "sem:possession", "rel": "FunctionOf"}, {"start": "cxn:possessed-argument-construction", "end": "str:external-possessor-strategy", "rel": "ExpressionOf"}, {"start": "cxn:possessed-argument-construction", "end": "str:internal-possessor-strategy", "rel": "RecruitedFrom"}, {"start": "cxn:possession-construction", "end": "cxn:predicational-possession-construction", "rel": "SubtypeOf"}, {"start": "cxn:possession-construction", "end": "cxn:presentational-possession-construction", "rel": "SubtypeOf"}, {"start": "cxn:possessive-attributive-phrase", "end": "cxn:alienable-possession-attributive-phrase", "rel": "SubtypeOf"}, {"start": "cxn:possessive-attributive-phrase", "end": "cxn:inalienable-possession-attributive-phrase", "rel": "SubtypeOf"}, {"start": "cxn:possessive-attributive-phrase", "end": "cxn:possessive-pronoun", "rel": "SubtypeOf"}, {"start": "cxn:possessive-attributive-phrase", "end": "sem:possession", "rel": "FunctionOf"}, {"start": "cxn:possessive-modification-construction", "end": "cxn:alienable-possession-modification-construction", "rel": "SubtypeOf"}, {"start": "cxn:possessive-modification-construction", "end": "cxn:inalienable-possession-modification-construction", "rel": "SubtypeOf"}, {"start": "cxn:possessive-modification-construction", "end": "cxn:possessive-attributive-phrase", "rel": "ConstituentOf"}, {"start": "cxn:possessive-modification-construction", "end": "sem:possession", "rel": "FunctionOf"}, {"start": "cxn:possessive-pronoun", "end": "sem:person-deixis", "rel": "FunctionOf"}, {"start": "cxn:possessor-argument-phrase", "end": "sem:possessor", "rel": "FunctionOf"}, {"start": "cxn:pragmatically-nonspecific-article", "end": "inf:prop", "rel": "FunctionOf"}, {"start": "cxn:pragmatically-nonspecific-pronoun", "end": "inf:semantically-specific-referent", "rel": "FunctionOf"}, {"start": "cxn:pragmatically-specific-article", "end": "inf:actor", "rel": "FunctionOf"}, {"start": "cxn:pragmatically-specific-pronoun", "end": "inf:pragmatically-specific-referent", "rel": "FunctionOf"}, {"start": "cxn:pragmatically-specific-pronoun", "end": "str:interrogative-pronoun-strategy", "rel": "ExpressionOf"}, {"start": "cxn:pragmatically-specific-pronoun", "end": "str:numeral-strategy", "rel": "ExpressionOf"}, {"start": "cxn:predicate", "end": "cxn:body-position-predicate", "rel": "SubtypeOf"}, {"start": "cxn:predicate", "end": "cxn:complement-taking-predicate", "rel": "SubtypeOf"}, {"start": "cxn:predicate", "end": "cxn:complex-predicate", "rel": "SubtypeOf"}, {"start": "cxn:predicate", "end": "cxn:controlled-predicate", "rel": "SubtypeOf"}, {"start": "cxn:predicate", "end": "cxn:simple-predicate", "rel": "SubtypeOf"}, {"start": "cxn:predicate", "end": "cxn:temporary-predicate", "rel": "SubtypeOf"}, {"start": "cxn:predicate", "end": "cxn:uncontrolled-predicate", "rel": "SubtypeOf"}, {"start": "cxn:predicate-adjectival-construction", "end": "sem:property-concept", "rel": "FunctionOf"}, {"start": "cxn:predicate-identity-construction", "end": "inf:predicate-identity", "rel": "FunctionOf"}, {"start": "cxn:predicate-identity-construction", "end": "str:anterior-zero", "rel": "ExpressionOf"}, {"start": "cxn:predicate-identity-construction", "end": "str:overt-coding", "rel": "ExpressionOf"}, {"start": "cxn:predicate-identity-construction", "end": "str:posterior-zero", "rel": "ExpressionOf"}, {"start": "cxn:predicate-nominal-construction", "end": "sem:object-concept", "rel": "FunctionOf"}, {"start": "cxn:predicational-location-construction", "end": "sem:figure-ground-spatial-relation", "rel": "FunctionOf"}, {"start": "cxn:predicational-location-construction", "end": "str:predicational-locative-strategy", "rel": "RecruitedFrom"}, {"start": "cxn:predicational-possession-construction", "end": "sem:possession", "rel": "FunctionOf"}, {"start": "cxn:presentational-construction", "end": "cxn:presentational-location-construction", "rel": "SubtypeOf"}, {"start": "cxn:presentational-construction", "end": "cxn:presentational-possession-construction", "rel": "SubtypeOf"}, {"start": "cxn:presentational-construction", "end": "inf:presentational", "rel": "FunctionOf"}, {"start": "cxn:presentational-construction", "end": "str:independent-referring-phrase-strategy", "rel": "ExpressionOf"}, {"start": "cxn:presentational-construction", "end": "str:perception-verb-strategy", "rel": "ExpressionOf"}, {"start": "cxn:presentational-location-construction", "end": "sem:figure-ground-spatial-relation", "rel": "FunctionOf"}, {"start": "cxn:presentational-location-construction", "end": "str:locational-possessive-strategy", "rel": "RecruitedFrom"}, {"start": "cxn:presentational-location-construction", "end": "str:possessive-locative-strategy", "rel": "RecruitedFrom"}, {"start": "cxn:presentational-location-construction", "end": "str:predicational-locative-strategy", "rel": "ExpressionOf"}, {"start": "cxn:presentational-possession-construction", "end": "sem:possession", "rel": "FunctionOf"}, {"start": "cxn:presentational-possession-construction", "end": "str:adnominal-possessive-strategy", "rel": "ExpressionOf"}, {"start": "cxn:presentational-possession-construction", "end": "str:have-possessive-strategy", "rel": "ExpressionOf"}, {"start": "cxn:presentational-possession-construction", "end": "str:locational-possessive-strategy", "rel": "ExpressionOf"}, {"start": "cxn:presentational-possession-construction", "end": "str:predicativization-possessive-strategy", "rel": "ExpressionOf"}, {"start": "cxn:presentational-possession-construction", "end": "str:topic-locational-hybrid-possessive-strategy", "rel": "ExpressionOf"}, {"start": "cxn:presentational-possession-construction", "end": "str:topic-possessive-strategy", "rel": "ExpressionOf"}, {"start": "cxn:presentational-possession-construction", "end": "str:with-possessive-strategy", "rel": "ExpressionOf"}, {"start": "cxn:pretense-construction", "end": "cxn:pretense-predicate", "rel": "HeadOf"}, {"start": "cxn:pretense-construction", "end": "sem:pretense-event", "rel": "FunctionOf"}, {"start": "cxn:prohibitive-construction", "end": "str:negative-fusion", "rel": "ExpressionOf"}, {"start": "cxn:pronoun", "end": "cxn:anaphoric-pronoun", "rel": "SubtypeOf"}, {"start": "cxn:pronoun", "end": "cxn:definite-pronoun", "rel": "SubtypeOf"}, {"start": "cxn:pronoun", "end": "cxn:demonstrative-pronoun", "rel": "SubtypeOf"}, {"start": "cxn:pronoun", "end": "cxn:generic-pronoun", "rel": "SubtypeOf"}, {"start": "cxn:pronoun", "end": "cxn:indefinite-pronoun", "rel": "SubtypeOf"}, {"start": "cxn:pronoun", "end": "cxn:interrogative-pronoun", "rel": "SubtypeOf"}, {"start": "cxn:pronoun", "end": "cxn:personal-pronoun", "rel": "SubtypeOf"}, {"start": "cxn:pronoun", "end": "cxn:possessive-pronoun", "rel": "SubtypeOf"}, {"start": "cxn:pronoun", "end": "cxn:pragmatically-nonspecific-pronoun", "rel": "SubtypeOf"}, {"start": "cxn:pronoun", "end": "cxn:pragmatically-specific-pronoun", "rel": "SubtypeOf"}, {"start": "cxn:pronoun", "end": "cxn:semantically-nonspecific-pronoun", "rel": "SubtypeOf"}, {"start": "cxn:pronoun", "end": "cxn:specific-known-pronoun", "rel": "SubtypeOf"}, {"start": "cxn:pronoun", "end": "cxn:specific-unknown-pronoun", "rel": "SubtypeOf"}, {"start": "cxn:pronoun", "end": "cxn:universal-pronoun", "rel": "SubtypeOf"}, {"start": "cxn:pronoun", "end": "sem:contextual", "rel": "FunctionOf"}, {"start": "cxn:proper-noun", "end": "cxn:human-proper-noun", "rel": "SubtypeOf"}, {"start": "cxn:proper-noun", "end": "cxn:place-proper-noun", "rel": "SubtypeOf"}, {"start": "cxn:proper-noun", "end": "sem:token", "rel": "FunctionOf"}, {"start": "cxn:property-referring-phrase", "end": "sem:property-concept", "rel": "FunctionOf"}, {"start": "cxn:proportional-quantifier-term", "end": "sem:proportional-quantifier", "rel": "FunctionOf"}, {"start": "cxn:propositional-attitude-construction", "end": "cxn:knowledge-construction", "rel": "SubtypeOf"}, {"start": "cxn:propositional-attitude-construction", "end": "cxn:pretense-construction", "rel": "SubtypeOf"}, {"start": "cxn:propositional-attitude-construction", "end": "cxn:propositional-attitude-predicate", "rel": "HeadOf"}, {"start": "cxn:propositional-attitude-construction", "end": "sem:propositional-attitude-event", "rel": "FunctionOf"}, {"start": "cxn:propositional-attitude-predicate", "end": "cxn:knowledge-predicate", "rel": "SubtypeOf"}, {"start": "cxn:propositional-attitude-predicate", "end": "cxn:pretense-predicate", "rel": "SubtypeOf"}, {"start": "cxn:protasis-clause", "end": "sem:protasis", "rel": "FunctionOf"}, {"start": "cxn:prototypical-construction", "end": "cxn:adjectival-phrase", "rel": "SubtypeOf"}, {"start": "cxn:prototypical-construction", "end": "cxn:adjective", "rel": "SubtypeOf"}, {"start": "cxn:prototypical-construction", "end": "cxn:basic-voice", "rel": "SubtypeOf"}, {"start": "cxn:prototypical-construction", "end": "cxn:declarative-construction", "rel": "SubtypeOf"}, {"start": "cxn:prototypical-construction", "end": "cxn:nominal-phrase", "rel": "SubtypeOf"}, {"start": "cxn:prototypical-construction", "end": "cxn:noun", "rel": "SubtypeOf"}, {"start": "cxn:prototypical-construction", "end": "cxn:topic-comment-construction", "rel": "SubtypeOf"}, {"start": "cxn:prototypical-construction", "end": "cxn:verb", "rel": "SubtypeOf"}, {"start": "cxn:prototypical-construction", "end": "cxn:verbal-clause", "rel": "SubtypeOf"}, {"start": "cxn:prototypical-construction", "end": "str:information-packaging-alignment", "rel": "ModeledOn"}, {"start": "cxn:purpose-construction", "end": "sem:purpose", "rel": "FunctionOf"}, {"start": "cxn:pursuit-verb", "end": "sem:pursuit-event", "rel": "FunctionOf"}, {"start": "cxn:quantifier-attributive-phrase", "end": "cxn:quantifier-term", "rel": "HeadOf"}, {"start": "cxn:quantifier-attributive-phrase", "end": "sem:distributive-quantifier", "rel": "FunctionOf"}, {"start": "cxn:quantifier-attributive-phrase", "end": "sem:proportional-quantifier", "rel": "FunctionOf"}, {"start": "cxn:quantifier-attributive-phrase", "end": "sem:vague-numeral", "rel": "FunctionOf"}, {"start": "cxn:quantifier-modification-construction", "end": "cxn:quantifier-attributive-phrase", "rel": "ConstituentOf"}, {"start": "cxn:quantifier-term", "end": "cxn:amount-term", "rel": "SubtypeOf"}, {"start": "cxn:quantifier-term", "end": "cxn:distributive-quantifier-term", "rel": "SubtypeOf"}, {"start": "cxn:quantifier-term", "end": "cxn:proportional-quantifier-term", "rel": "SubtypeOf"}, {"start": "cxn:quantifier-term", "end": "cxn:vague-numeral-term", "rel": "SubtypeOf"}, {"start": "cxn:question-pronoun", "end": "inf:question-referent", "rel": "FunctionOf"}, {"start": "cxn:r-phrase", "end": "sem:recipient", "rel": "FunctionOf"}, {"start": "cxn:reciprocal-construction", "end": "sem:reciprocal", "rel": "FunctionOf"}, {"start": "cxn:reciprocal-construction", "end": "str:biclausal-reciprocal", "rel": "ExpressionOf"}, {"start": "cxn:reciprocal-construction", "end": "str:dual-role-strategy", "rel": "ExpressionOf"}, {"start": "cxn:reciprocal-construction", "end": "str:middle-voice", "rel": "RecruitedFrom"}, {"start": "cxn:reciprocal-construction", "end": "str:monoclausal-transitive-reciprocal-strategy", "rel": "ExpressionOf"}, {"start": "cxn:reciprocal-construction", "end": "str:overtly-coded-single-role-strategy", "rel": "ExpressionOf"}, {"start": "cxn:reciprocal-construction", "end": "str:reciprocal-strategy", "rel": "RecruitedFrom"}, {"start": "cxn:reciprocal-construction", "end": "str:reflexive-strategy", "rel": "ExpressionOf"}, {"start": "cxn:reciprocal-construction", "end": "str:single-role-strategy", "rel": "ExpressionOf"}, {"start": "cxn:reference-tracking-construction", "end": "cxn:object-identity-construction", "rel": "SubtypeOf"}, {"start": "cxn:reference-tracking-construction", "end": "cxn:predicate-identity-construction", "rel": "SubtypeOf"}, {"start": "cxn:reference-tracking-construction", "end": "cxn:subject-identity-construction", "rel": "SubtypeOf"}, {"start": "cxn:reference-tracking-construction", "end": "inf:coreference", "rel": "FunctionOf"}, {"start": "cxn:reference-tracking-construction", "end": "str:reference-tracking-system", "rel": "ExpressionOf"}, {"start": "cxn:reference-tracking-construction", "end": "str:switch-reference-system", "rel": "ExpressionOf"}, {"start": "cxn:referent-expression", "end": "cxn:noun", "rel": "SubtypeOf"}, {"start": "cxn:referent-expression", "end": "cxn:noun-complement-head", "rel": "SubtypeOf"}, {"start": "cxn:referring-phrase", "end": "cxn:apposition", "rel": "SubtypeOf"}, {"start": "cxn:referring-phrase", "end": "cxn:argument-phrase", "rel": "SubtypeOf"}, {"start": "cxn:referring-phrase", "end": "cxn:modification-construction", "rel": "SubtypeOf"}, {"start": "cxn:referring-phrase", "end": "cxn:nominal-phrase", "rel": "SubtypeOf"}, {"start": "cxn:referring-phrase", "end": "cxn:noun-complement-referring-phrase", "rel": "SubtypeOf"}, {"start": "cxn:referring-phrase", "end": "cxn:property-referring-phrase", "rel": "SubtypeOf"}, {"start": "cxn:referring-phrase", "end": "cxn:referent-expression", "rel": "HeadOf"}, {"start": "cxn:referring-phrase", "end": "cxn:relative-clause-head", "rel": "SubtypeOf"}, {"start": "cxn:referring-phrase", "end": "cxn:relativized-referring-phrase", "rel": "SubtypeOf"}, {"start": "cxn:referring-phrase", "end": "cxn:topic-phrase", "rel": "SubtypeOf"}, {"start": "cxn:referring-phrase", "end": "inf:reference", "rel": "FunctionOf"}, {"start": "cxn:referring-phrase", "end": "sem:entity", "rel": "FunctionOf"}, {"start": "cxn:referring-phrase", "end": "str:independent-referring-phrase-strategy", "rel": "RecruitedFrom"}, {"start": "cxn:referring-phrase", "end": "str:nominalizer", "rel": "ExpressionOf"}, {"start": "cxn:reflexive-construction", "end": "sem:reflexive", "rel": "FunctionOf"}, {"start": "cxn:reflexive-construction", "end": "str:dual-role-strategy", "rel": "ExpressionOf"}, {"start": "cxn:reflexive-construction", "end": "str:middle-voice", "rel": "RecruitedFrom"}, {"start": "cxn:reflexive-construction", "end": "str:reciprocal-strategy", "rel": "ExpressionOf"}, {"start": "cxn:reflexive-construction", "end": "str:reflexive-strategy", "rel": "RecruitedFrom"}, {"start": "cxn:reflexive-construction", "end": "str:single-role-strategy", "rel": "ExpressionOf"}, {"start": "cxn:relative-clause", "end": "str:participle", "rel": "ExpressionOf"}, {"start": "cxn:relative-clause-construction", "end": "cxn:anaphoric-head-relative-clause-construction", "rel": "SubtypeOf"}, {"start": "cxn:relative-clause-construction", "end": "cxn:free-relative-clause-construction", "rel": "SubtypeOf"}, {"start": "cxn:relative-clause-construction", "end": "cxn:relative-clause", "rel": "ConstituentOf"}, {"start": "cxn:relative-clause-construction", "end": "cxn:relative-matrix-clause", "rel": "HeadOf"}, {"start": "cxn:relative-clause-construction", "end": "sem:event", "rel": "FunctionOf"}, {"start": "cxn:relative-clause-construction", "end": "str:externally-headed", "rel": "ExpressionOf"}, {"start": "cxn:relative-clause-construction", "end": "str:non-externally-headed", "rel": "ExpressionOf"}, {"start": "cxn:relative-clause-construction", "end": "str:noun-modifying-clause-strategy", "rel": "RecruitedFrom"}, {"start": "cxn:relative-clause-construction", "end": "str:relativizer", "rel": "ExpressionOf"}, {"start": "cxn:relative-clause-construction", "end": "str:verb-coding-strategy", "rel": "ExpressionOf"}, {"start": "cxn:relative-matrix-clause", "end": "cxn:relativized-referring-phrase", "rel": "ConstituentOf"}, {"start": "cxn:relativized-referring-phrase", "end": "cxn:relative-clause-head", "rel": "HeadOf"}, {"start": "cxn:removal-verb", "end": "sem:removal-event", "rel": "FunctionOf"}, {"start": "cxn:response-construction", "end": "cxn:information-question-response-construction", "rel": "SubtypeOf"}, {"start": "cxn:response-construction", "end": "cxn:polarity-response-construction", "rel": "SubtypeOf"}, {"start": "cxn:response-construction", "end": "inf:response", "rel": "FunctionOf"}, {"start": "cxn:result-verb", "end": "cxn:path-verb", "rel": "SubtypeOf"}, {"start": "cxn:result-verb", "end": "sem:result-profile", "rel": "FunctionOf"}, {"start": "cxn:resultative-complex-predicate", "end": "sem:participant-oriented", "rel": "FunctionOf"}, {"start": "cxn:resultative-complex-predicate", "end": "sem:posterior", "rel": "FunctionOf"}, {"start": "cxn:s-phrase", "end": "sem:s-role", "rel": "FunctionOf"}, {"start": "cxn:second-person-pronoun", "end": "sem:second-person", "rel": "FunctionOf"}, {"start": "cxn:semantically-nonspecific-article", "end": "inf:type-identifiable", "rel": "FunctionOf"}, {"start": "cxn:semantically-nonspecific-article", "end": "str:nonspecific-article-strategy", "rel": "RecruitedFrom"}, {"start": "cxn:semantically-nonspecific-pronoun", "end": "cxn:comparative-pronoun", "rel": "SubtypeOf"}, {"start": "cxn:semantically-nonspecific-pronoun", "end": "cxn:conditional-pronoun", "rel": "SubtypeOf"}, {"start": "cxn:semantically-nonspecific-pronoun", "end": "cxn:direct-negation-pronoun", "rel": "SubtypeOf"}, {"start": "cxn:semantically-nonspecific-pronoun", "end": "cxn:free-choice-pronoun", "rel": "SubtypeOf"}, {"start": "cxn:semantically-nonspecific-pronoun", "end": "cxn:indirect-negation-pronoun", "rel": "SubtypeOf"}, {"start": "cxn:semantically-nonspecific-pronoun", "end": "cxn:irrealis-pronoun", "rel": "SubtypeOf"}, {"start": "cxn:semantically-nonspecific-pronoun", "end": "cxn:question-pronoun", "rel": "SubtypeOf"}, {"start": "cxn:semantically-nonspecific-pronoun", "end": "inf:nonspecific-referent", "rel": "FunctionOf"}, {"start": "cxn:semantically-nonspecific-pronoun", "end": "str:nonspecific-pronoun-strategy", "rel": "RecruitedFrom"}, {"start": "cxn:semantically-nonspecific-pronoun", "end": "str:universal-pronoun-strategy", "rel": "ExpressionOf"}, {"start": "cxn:sensation-verb", "end": "sem:sensation-event", "rel": "FunctionOf"}, {"start": "cxn:set-member-attributive-phrase", "end": "cxn:set-member-term", "rel": "HeadOf"}, {"start": "cxn:set-member-attributive-phrase", "end": "sem:set-member", "rel": "FunctionOf"}, {"start": "cxn:set-member-modification-construction", "end": "cxn:set-member-attributive-phrase", "rel": "ConstituentOf"}, {"start": "cxn:set-member-term", "end": "cxn:ordinal-numeral-term", "rel": "SubtypeOf"}, {"start": "cxn:shape-term", "end": "sem:shape", "rel": "FunctionOf"}, {"start": "cxn:simple-contrast-coordination", "end": "sem:simple-contrast", "rel": "FunctionOf"}, {"start": "cxn:simple-predicate", "end": "cxn:verb", "rel": "SubtypeOf"}, {"start": "cxn:social-noun", "end": "sem:person", "rel": "FunctionOf"}, {"start": "cxn:species-term", "end": "sem:species", "rel": "FunctionOf"}, {"start": "cxn:specific-known-pronoun", "end": "inf:specific-known-referent", "rel": "FunctionOf"}, {"start": "cxn:specific-unknown-pronoun", "end": "inf:specific-unknown-referent", "rel": "FunctionOf"}, {"start": "cxn:speech-act-construction", "end": "cxn:declarative-construction", "rel": "SubtypeOf"}, {"start": "cxn:speech-act-construction", "end": "cxn:exclamative-construction", "rel": "SubtypeOf"}, {"start": "cxn:speech-act-construction", "end": "cxn:imperative-hortative-construction", "rel": "SubtypeOf"}, {"start": "cxn:speech-act-construction", "end": "cxn:interrogative-construction", "rel": "SubtypeOf"}, {"start": "cxn:speech-act-construction", "end": "cxn:negation-construction", "rel": "SubtypeOf"}, {"start": "cxn:speech-act-construction", "end": "cxn:response-construction", "rel": "SubtypeOf"}, {"start": "cxn:speech-act-construction", "end": "inf:speech-acts", "rel": "FunctionOf"}, {"start": "cxn:speech-act-construction", "end": "sem:propositional-content", "rel": "FunctionOf"}, {"start": "cxn:speech-act-construction", "end": "str:utterance-clause-alignment", "rel": "ModeledOn"}, {"start": "cxn:spontaneous-verb", "end": "sem:spontaneous", "rel": "FunctionOf"}, {"start": "cxn:stative-complex-predicate", "end": "cxn:depictive-complex-predicate", "rel": "SubtypeOf"}, {"start": "cxn:stative-complex-predicate", "end": "cxn:dynamic-predicate-part", "rel": "ConstituentOf"}, {"start": "cxn:stative-complex-predicate", "end": "cxn:manner-complex-predicate", "rel": "SubtypeOf"}, {"start": "cxn:stative-complex-predicate", "end": "cxn:resultative-complex-predicate", "rel": "SubtypeOf"}, {"start": "cxn:stative-complex-predicate", "end": "cxn:spurious-complex-predicate", "rel": "SubtypeOf"}, {"start": "cxn:stative-complex-predicate", "end": "cxn:stative-predicate-part", "rel": "ConstituentOf"}, {"start": "cxn:stative-complex-predicate", "end": "str:adjective-impersonal-strategy", "rel": "ExpressionOf"}, {"start": "cxn:stative-complex-predicate", "end": "str:adjective-personal-strategy", "rel": "ExpressionOf"}, {"start": "cxn:stative-complex-predicate", "end": "str:adpositional-personal-strategy", "rel": "ExpressionOf"}, {"start": "cxn:stative-complex-predicate", "end": "str:adpositional-strategy", "rel": "ExpressionOf"}, {"start": "cxn:stative-complex-predicate", "end": "str:adverbial-strategy", "rel": "ExpressionOf"}, {"start": "cxn:stative-complex-predicate", "end": "str:causative-coordinate-strategy", "rel": "ExpressionOf"}, {"start": "cxn:stative-complex-predicate", "end": "str:causative-predicational-strategy", "rel": "ExpressionOf"}, {"start": "cxn:stative-complex-predicate", "end": "str:converb-strategy", "rel": "ExpressionOf"}, {"start": "cxn:stative-complex-predicate", "end": "str:coordinate-impersonal-strategy", "rel": "ExpressionOf"}, {"start": "cxn:stative-complex-predicate", "end": "str:coordinate-personal-strategy", "rel": "ExpressionOf"}, {"start": "cxn:stative-complex-predicate", "end": "str:copular-participle-strategy", "rel": "ExpressionOf"}, {"start": "cxn:stative-complex-predicate", "end": "str:participial-strategy", "rel": "ExpressionOf"}, {"start": "cxn:stative-complex-predicate", "end": "str:phenomime", "rel": "ExpressionOf"}, {"start": "cxn:stative-complex-predicate", "end": "str:phonomime", "rel": "ExpressionOf"}, {"start": "cxn:stative-complex-predicate", "end": "str:predicational-strategy", "rel": "ExpressionOf"}, {"start": "cxn:stative-complex-predicate", "end": "str:psychomime", "rel": "ExpressionOf"}, {"start": "cxn:stative-predicate-part", "end": "sem:stative", "rel": "FunctionOf"}, {"start": "cxn:stimulus-phrase", "end": "sem:stimulus", "rel": "FunctionOf"}, {"start": "cxn:subject-identity-construction", "end": "cxn:logophoric-construction", "rel": "SubtypeOf"}, {"start": "cxn:subject-identity-construction", "end": "inf:same-subject", "rel": "FunctionOf"}, {"start": "cxn:subject-identity-construction", "end": "str:anterior-zero", "rel": "ExpressionOf"}, {"start": "cxn:subject-identity-construction", "end": "str:overt-coding", "rel": "ExpressionOf"}, {"start": "cxn:subject-identity-construction", "end": "str:posterior-zero", "rel": "ExpressionOf"}, {"start": "cxn:subject-phrase", "end": "cxn:causer-phrase", "rel": "SubtypeOf"}, {"start": "cxn:subject-phrase", "end": "cxn:ditransitive-a-phrase", "rel": "SubtypeOf"}, {"start": "cxn:subject-phrase", "end": "cxn:figure-phrase", "rel": "SubtypeOf"}, {"start": "cxn:subject-phrase", "end": "cxn:s-phrase", "rel": "SubtypeOf"}, {"start": "cxn:subject-phrase", "end": "cxn:transitive-a-phrase", "rel": "SubtypeOf"}, {"start": "cxn:subject-phrase", "end": "inf:high-topicality", "rel": "FunctionOf"}, {"start": "cxn:subordinate-clause", "end": "inf:pragmatic-presupposition", "rel": "FunctionOf"}, {"start": "cxn:subordinate-clause", "end": "sem:event", "rel": "FunctionOf"}, {"start": "cxn:subordinate-clause", "end": "str:insubordination", "rel": "RecruitedFrom"}, {"start": "cxn:substitutive-construction", "end": "sem:substitutive", "rel": "FunctionOf"}, {"start": "cxn:subtractive-construction", "end": "sem:subtractive", "rel": "FunctionOf"}, {"start": "cxn:superlative-form", "end": "sem:superlative-degree", "rel": "FunctionOf"}, {"start": "cxn:support-verb-construction", "end": "cxn:eventive-predicate-part", "rel": "HeadOf"}, {"start": "cxn:support-verb-construction", "end": "cxn:support-verb", "rel": "ConstituentOf"}, {"start": "cxn:t-phrase", "end": "sem:theme", "rel": "FunctionOf"}, {"start": "cxn:temporal-construction", "end": "sem:anterior", "rel": "FunctionOf"}, {"start": "cxn:temporal-construction", "end": "sem:posterior", "rel": "FunctionOf"}, {"start": "cxn:temporal-construction", "end": "sem:simultaneous", "rel": "FunctionOf"}, {"start": "cxn:temporary-predicate", "end": "sem:state", "rel": "FunctionOf"}, {"start": "cxn:thetic-construction", "end": "cxn:entity-central-construction", "rel": "SubtypeOf"}, {"start": "cxn:thetic-construction", "end": "cxn:event-central-construction", "rel": "SubtypeOf"}, {"start": "cxn:thetic-construction", "end": "inf:thetic", "rel": "FunctionOf"}, {"start": "cxn:thetic-construction", "end": "str:ellipsis", "rel": "ExpressionOf"}, {"start": "cxn:thetic-construction", "end": "str:subject-predicate-alignment", "rel": "ExpressionOf"}, {"start": "cxn:thetic-construction", "end": "str:thetic-marker", "rel": "ExpressionOf"}, {"start": "cxn:third-person-pronoun", "end": "sem:third-person", "rel": "FunctionOf"}, {"start": "cxn:topic-comment-construction", "end": "cxn:clause", "rel": "SubtypeOf"}, {"start": "cxn:topic-comment-construction", "end": "cxn:hanging-topic-construction", "rel": "SubtypeOf"}, {"start": "cxn:topic-comment-construction", "end": "cxn:predicate", "rel": "HeadOf"}, {"start": "cxn:topic-comment-construction", "end": "cxn:topic-phrase", "rel": "ConstituentOf"}, {"start": "cxn:topic-comment-construction", "end": "inf:topic-comment", "rel": "FunctionOf"}, {"start": "cxn:topic-comment-construction", "end": "str:detached-topic-phrase", "rel": "ExpressionOf"}, {"start": "cxn:topic-comment-construction", "end": "str:topic-marker", "rel": "ExpressionOf"}, {"start": "cxn:topic-phrase", "end": "cxn:hanging-topic-phrase", "rel": "SubtypeOf"}, {"start": "cxn:topic-phrase", "end": "inf:highest-topicality", "rel": "FunctionOf"}, {"start": "cxn:transfer-verb", "end": "sem:transfer-of-possession-event", "rel": "FunctionOf"}, {"start": "cxn:transitive-a-phrase", "end": "sem:a-role", "rel": "FunctionOf"}, {"start": "cxn:transitive-construction", "end": "cxn:p-phrase", "rel": "ConstituentOf"}, {"start": "cxn:transitive-construction", "end": "cxn:transitive-a-phrase", "rel": "ConstituentOf"}, {"start": "cxn:transitive-construction", "end": "sem:bivalent", "rel": "FunctionOf"}, {"start": "cxn:transitive-construction", "end": "str:active-alignment", "rel": "ModeledOn"}, {"start": "cxn:transitive-construction", "end": "str:antipassive-alignment", "rel": "ModeledOn"}, {"start": "cxn:transitive-construction", "end": "str:ditransitive-alignment", "rel": "ModeledOn"}, {"start": "cxn:transitive-construction", "end": "str:dual-role-strategy", "rel": "RecruitedFrom"}, {"start": "cxn:transitive-construction", "end": "str:experiential-alignment", "rel": "ModeledOn"}, {"start": "cxn:transitive-construction", "end": "str:monoclausal-transitive-reciprocal-strategy", "rel": "RecruitedFrom"}, {"start": "cxn:transitive-construction", "end": "str:passive-inverse-alignment", "rel": "ModeledOn"}, {"start": "cxn:transitive-construction", "end": "str:transitive-alignment", "rel": "ExpressionOf"}, {"start": "cxn:typifying-construction", "end": "inf:subcategorizing", "rel": "FunctionOf"}, {"start": "cxn:typifying-construction", "end": "str:anchoring-nominal-strategy", "rel": "ExpressionOf"}, {"start": "cxn:uncontrolled-predicate", "end": "sem:uncontrolled", "rel": "FunctionOf"}, {"start": "cxn:unexpected-co-occurrence-coordination", "end": "sem:unexpected-co-occurrence", "rel": "FunctionOf"}, {"start": "cxn:universal-pronoun", "end": "sem:type", "rel": "FunctionOf"}, {"start": "cxn:universal-pronoun", "end": "str:universal-pronoun-strategy", "rel": "RecruitedFrom"}, {"start": "cxn:utterance-construction", "end": "cxn:utterance-predicate", "rel": "HeadOf"}, {"start": "cxn:utterance-construction", "end": "sem:utterance-event", "rel": "FunctionOf"}, {"start": "cxn:utterance-construction", "end": "str:direct-report", "rel": "ExpressionOf"}, {"start": "cxn:utterance-construction", "end": "str:indirect-report", "rel": "ExpressionOf"}, {"start": "cxn:utterance-construction", "end": "str:quotative-marker", "rel": "ExpressionOf"}, {"start": "cxn:vague-numeral-term", "end": "sem:vague-numeral", "rel": "FunctionOf"}, {"start": "cxn:value-term", "end": "sem:value", "rel": "FunctionOf"}, {"start": "cxn:verb", "end": "cxn:application-verb", "rel": "SubtypeOf"}, {"start": "cxn:verb", "end": "cxn:bodily-motion-verb", "rel": "SubtypeOf"}, {"start": "cxn:verb", "end": "cxn:body-care-verb", "rel": "SubtypeOf"}, {"start": "cxn:verb", "end": "cxn:change-in-position-verb", "rel": "SubtypeOf"}, {"start": "cxn:verb", "end": "cxn:change-of-state-verb", "rel": "SubtypeOf"}, {"start": "cxn:verb", "end": "cxn:combining-verb", "rel": "SubtypeOf"}, {"start": "cxn:verb", "end": "cxn:contact-by-impact-verb", "rel": "SubtypeOf"}, {"start": "cxn:verb", "end": "cxn:damage-verb", "rel": "SubtypeOf"}, {"start": "cxn:verb", "end": "cxn:experiential-verb", "rel": "SubtypeOf"}, {"start": "cxn:verb", "end": "cxn:extroverted-verb", "rel": "SubtypeOf"}, {"start": "cxn:verb", "end": "cxn:ingestion-verb", "rel": "SubtypeOf"}, {"start": "cxn:verb", "end": "cxn:interaction-verb", "rel": "SubtypeOf"}, {"start": "cxn:verb", "end": "cxn:introverted-verb", "rel": "SubtypeOf"}, {"start": "cxn:verb", "end": "cxn:killing-injuring-verb", "rel": "SubtypeOf"}, {"start": "cxn:verb", "end": "cxn:manner-of-motion-verb", "rel": "SubtypeOf"}, {"start": "cxn:verb", "end": "cxn:manner-verb", "rel": "SubtypeOf"}, {"start": "cxn:verb", "end": "cxn:motion-verb", "rel": "SubtypeOf"}, {"start": "cxn:verb", "end": "cxn:perception-verb", "rel": "SubtypeOf"}, {"start": "cxn:verb", "end": "cxn:pursuit-verb", "rel": "SubtypeOf"}, {"start": "cxn:verb", "end": "cxn:removal-verb", "rel": "SubtypeOf"}, {"start": "cxn:verb", "end": "cxn:result-verb", "rel": "SubtypeOf"}, {"start": "cxn:verb", "end": "cxn:spontaneous-verb", "rel": "SubtypeOf"}, {"start": "cxn:verb", "end": "cxn:transfer-verb", "rel": "SubtypeOf"}, {"start": "cxn:verbal-clause", "end": "cxn:perception-clause", "rel": "SubtypeOf"}, {"start": "cxn:verbal-clause", "end": "cxn:verb", "rel": "HeadOf"}, {"start": "cxn:verbal-clause", "end": "sem:action-concept", "rel": "FunctionOf"}, {"start": "cxn:wishing-construction", "end": "cxn:wishing-predicate", "rel": "HeadOf"}, {"start": "cxn:wishing-construction", "end": "sem:wishing-event", "rel": "FunctionOf"}, {"start": "inf:accessibility", "end": "inf:high-accessibility", "rel": "SubtypeOf"}, {"start": "inf:accessibility", "end": "inf:low-accessibility", "rel": "SubtypeOf"}, {"start": "inf:accessibility", "end": "inf:medium-accessibility", "rel": "SubtypeOf"}, {"start": "inf:active-referent", "end": "inf:high-accessibility", "rel": "AttributeOf"}, {"start": "inf:active-referent", "end": "inf:identity-known", "rel": "AttributeOf"}, {"start": "inf:admodification", "end": "inf:pragmatic-presupposition", "rel": "AttributeOf"}, {"start": "inf:alternative-proposition", "end": "inf:pragmatic-presupposition", "rel": "AttributeOf"}, {"start": "inf:complex-figure", "end": "inf:pragmatic-assertion", "rel": "ConstituentOf"}, {"start": "inf:contrast", "end": "inf:counterpresuppositional-contrast", "rel": "SubtypeOf"}, {"start": "inf:contrast", "end": "inf:parallel-contrast", "rel": "SubtypeOf"}, {"start": "inf:coreference", "end": "inf:token-identity", "rel": "SubtypeOf"}, {"start": "inf:coreference", "end": "inf:type-identity", "rel": "SubtypeOf"}, {"start": "inf:counterpresuppositional-contrast", "end": "inf:alternative-proposition", "rel": "ConstituentOf"}, {"start": "inf:counterpresuppositional-contrast", "end": "inf:choosing-contrast", "rel": "SubtypeOf"}, {"start": "inf:counterpresuppositional-contrast", "end": "inf:expanding-contrast", "rel": "SubtypeOf"}, {"start": "inf:counterpresuppositional-contrast", "end": "inf:rejecting-contrast", "rel": "SubtypeOf"}, {"start": "inf:counterpresuppositional-contrast", "end": "inf:replacing-contrast", "rel": "SubtypeOf"}, {"start": "inf:counterpresuppositional-contrast", "end": "inf:restricting-contrast", "rel": "SubtypeOf"}, {"start": "inf:declarative", "end": "inf:identificational", "rel": "SubtypeOf"}, {"start": "inf:declarative", "end": "inf:thetic", "rel": "SubtypeOf"}, {"start": "inf:declarative", "end": "inf:topic-comment", "rel": "SubtypeOf"}, {"start": "inf:discourse-coherence", "end": "inf:coreference", "rel": "ConstituentOf"}, {"start": "inf:discourse-coherence", "end": "inf:discourse-connection", "rel": "ConstituentOf"}, {"start": "inf:discourse-coherence", "end": "inf:speech-acts", "rel": "ConstituentOf"}, {"start": "inf:discourse-connection", "end": "inf:complex-figure", "rel": "SubtypeOf"}, {"start": "inf:discourse-connection", "end": "inf:figure-ground", "rel": "SubtypeOf"}, {"start": "inf:discourse-deixis", "end": "inf:identity-known", "rel": "AttributeOf"}, {"start": "inf:discourse-deixis", "end": "inf:low-accessibility", "rel": "AttributeOf"}, {"start": "inf:discourse-structure", "end": "inf:aboutness", "rel": "SubtypeOf"}, {"start": "inf:discourse-structure", "end": "inf:admodification", "rel": "SubtypeOf"}, {"start": "inf:discourse-structure", "end": "inf:alternative-proposition", "rel": "SubtypeOf"}, {"start": "inf:discourse-structure", "end": "inf:coreference", "rel": "SubtypeOf"}, {"start": "inf:discourse-structure", "end": "inf:discourse-coherence", "rel": "SubtypeOf"}, {"start": "inf:discourse-structure", "end": "inf:discourse-connection", "rel": "SubtypeOf"}, {"start": "inf:discourse-structure", "end": "inf:focus", "rel": "SubtypeOf"}, {"start": "inf:discourse-structure", "end": "inf:information-status", "rel": "SubtypeOf"}, {"start": "inf:discourse-structure", "end": "inf:major-propositional-act", "rel": "SubtypeOf"}, {"start": "inf:discourse-structure", "end": "inf:poset", "rel": "SubtypeOf"}, {"start": "inf:discourse-structure", "end": "inf:pragmatic-assertion", "rel": "SubtypeOf"}, {"start": "inf:discourse-structure", "end": "inf:pragmatic-presupposition", "rel": "SubtypeOf"}, {"start": "inf:discourse-structure", "end": "inf:presupposed-open-proposition", "rel": "SubtypeOf"}, {"start": "inf:discourse-structure", "end": "inf:speech-acts", "rel": "SubtypeOf"}, {"start": "inf:discourse-structure", "end": "inf:theater-metaphor", "rel": "SubtypeOf"}, {"start": "inf:discourse-structure", "end": "inf:topicality", "rel": "SubtypeOf"}, {"start": "inf:entity-central", "end": "inf:presentational", "rel": "SubtypeOf"}, {"start": "inf:event-central", "end": "inf:announcement", "rel": "SubtypeOf"}, {"start": "inf:event-central", "end": "inf:background-description", "rel": "SubtypeOf"}, {"start": "inf:event-central", "end": "inf:explanation", "rel": "SubtypeOf"}, {"start": "inf:event-central", "end": "inf:interruption", "rel": "SubtypeOf"}, {"start": "inf:figure-ground", "end": "inf:pragmatic-assertion", "rel": "ConstituentOf"}, {"start": "inf:figure-ground", "end": "inf:pragmatic-presupposition", "rel": "ConstituentOf"}, {"start": "inf:focus", "end": "inf:pragmatic-assertion", "rel": "AttributeOf"}, {"start": "inf:high-topicality", "end": "inf:highest-topicality", "rel": "SubtypeOf"}, {"start": "inf:identifiability", "end": "inf:identity-known", "rel": "SubtypeOf"}, {"start": "inf:identifiability", "end": "inf:identity-unknown", "rel": "SubtypeOf"}, {"start": "inf:identifiability", "end": "inf:type-identifiable", "rel": "SubtypeOf"}, {"start": "inf:identificational", "end": "inf:contrast", "rel": "SubtypeOf"}, {"start": "inf:identificational", "end": "inf:focus", "rel": "ConstituentOf"}, {"start": "inf:identificational", "end": "inf:information-gap", "rel": "SubtypeOf"}, {"start": "inf:identificational", "end": "inf:presupposed-open-proposition", "rel": "ConstituentOf"}, {"start": "inf:imperative-hortative", "end": "inf:prohibitive", "rel": "SubtypeOf"}, {"start": "inf:inactive-referent", "end": "inf:identity-known", "rel": "AttributeOf"}, {"start": "inf:inactive-referent", "end": "inf:low-accessibility", "rel": "AttributeOf"}, {"start": "inf:inferrable-referent", "end": "inf:identity-known", "rel": "AttributeOf"}, {"start": "inf:inferrable-referent", "end": "inf:low-accessibility", "rel": "AttributeOf"}, {"start": "inf:information-gap", "end": "inf:equational", "rel": "SubtypeOf"}, {"start": "inf:information-gap", "end": "inf:interrogative", "rel": "SubtypeOf"}, {"start": "inf:information-gap", "end": "inf:response", "rel": "SubtypeOf"}, {"start": "inf:information-packaging", "end": "inf:discourse-structure", "rel": "SubtypeOf"}, {"start": "inf:information-status", "end": "inf:accessibility", "rel": "SubtypeOf"}, {"start": "inf:information-status", "end": "inf:identifiability", "rel": "SubtypeOf"}, {"start": "inf:interrogative", "end": "inf:alternative-question", "rel": "SubtypeOf"}, {"start": "inf:interrogative", "end": "inf:information-question", "rel": "SubtypeOf"}, {"start": "inf:interrogative", "end": "inf:polarity-question", "rel": "SubtypeOf"}, {"start": "inf:interrogative-unit", "end": "inf:identity-unknown", "rel": "AttributeOf"}, {"start": "inf:major-propositional-act", "end": "inf:modification", "rel": "SubtypeOf"}, {"start": "inf:major-propositional-act", "end": "inf:predication", "rel": "SubtypeOf"}, {"start": "inf:major-propositional-act", "end": "inf:reference", "rel": "SubtypeOf"}, {"start": "inf:modification", "end": "inf:admodification", "rel": "ConstituentOf"}, {"start": "inf:modification", "end": "inf:pragmatic-presupposition", "rel": "AttributeOf"}, {"start": "inf:modification", "end": "inf:selecting", "rel": "SubtypeOf"}, {"start": "inf:modification", "end": "inf:situating", "rel": "SubtypeOf"}, {"start": "inf:modification", "end": "inf:subcategorizing", "rel": "SubtypeOf"}, {"start": "inf:non-high-topicality", "end": "inf:low-topicality", "rel": "SubtypeOf"}, {"start": "inf:non-high-topicality", "end": "inf:mid-topicality", "rel": "SubtypeOf"}, {"start": "inf:non-low-topicality", "end": "inf:high-topicality", "rel": "SubtypeOf"}, {"start": "inf:non-low-topicality", "end": "inf:mid-topicality", "rel": "SubtypeOf"}, {"start": "inf:nonspecific-referent", "end": "inf:comparative-referent", "rel": "SubtypeOf"}, {"start": "inf:nonspecific-referent", "end": "inf:conditional-referent", "rel": "SubtypeOf"}, {"start": "inf:nonspecific-referent", "end": "inf:direct-negation-referent", "rel": "SubtypeOf"}, {"start": "inf:nonspecific-referent", "end": "inf:free-choice-referent", "rel": "SubtypeOf"}, {"start": "inf:nonspecific-referent", "end": "inf:indirect-negation-referent", "rel": "SubtypeOf"}, {"start": "inf:nonspecific-referent", "end": "inf:irrealis-referent", "rel": "SubtypeOf"}, {"start": "inf:nonspecific-referent", "end": "inf:question-referent", "rel": "SubtypeOf"}, {"start": "inf:nonspecific-referent", "end": "inf:type-identifiable", "rel": "AttributeOf"}, {"start": "inf:parallel-contrast", "end": "inf:listing-contrast", "rel": "SubtypeOf"}, {"start": "inf:parallel-contrast", "end": "inf:nonverbal-contrast", "rel": "SubtypeOf"}, {"start": "inf:parallel-contrast", "end": "inf:verbal-contrast", "rel": "SubtypeOf"}, {"start": "inf:polarity-response", "end": "inf:negative-question-polarity-response", "rel": "SubtypeOf"}, {"start": "inf:polarity-response", "end": "inf:positive-question-polarity-response", "rel": "SubtypeOf"}, {"start": "inf:poset", "end": "inf:link", "rel": "ConstituentOf"}, {"start": "inf:poset", "end": "inf:trigger", "rel": "ConstituentOf"}, {"start": "inf:pragmatically-specific-referent", "end": "inf:identity-unknown", "rel": "AttributeOf"}, {"start": "inf:predication", "end": "inf:pragmatic-assertion", "rel": "AttributeOf"}, {"start": "inf:presupposed-open-proposition", "end": "inf:pragmatic-presupposition", "rel": "AttributeOf"}, {"start": "inf:reference", "end": "inf:active-referent", "rel": "SubtypeOf"}, {"start": "inf:reference", "end": "inf:discourse-deixis", "rel": "SubtypeOf"}, {"start": "inf:reference", "end": "inf:generic-referent", "rel": "SubtypeOf"}, {"start": "inf:reference", "end": "inf:inactive-referent", "rel": "SubtypeOf"}, {"start": "inf:reference", "end": "inf:inferrable-referent", "rel": "SubtypeOf"}, {"start": "inf:reference", "end": "inf:information-status", "rel": "AttributeOf"}, {"start": "inf:reference", "end": "inf:interrogative-unit", "rel": "SubtypeOf"}, {"start": "inf:reference", "end": "inf:link", "rel": "SubtypeOf"}, {"start": "inf:reference", "end": "inf:modification", "rel": "ConstituentOf"}, {"start": "inf:reference", "end": "inf:nonspecific-referent", "rel": "SubtypeOf"}, {"start": "inf:reference", "end": "inf:pragmatic-presupposition", "rel": "AttributeOf"}, {"start": "inf:reference", "end": "inf:pragmatically-specific-referent", "rel": "SubtypeOf"}, {"start": "inf:reference", "end": "inf:semantically-specific-referent", "rel": "SubtypeOf"}, {"start": "inf:reference", "end": "inf:semi-active-referent", "rel": "SubtypeOf"}, {"start": "inf:reference", "end": "inf:theater-metaphor", "rel": "AttributeOf"}, {"start": "inf:reference", "end": "inf:topicality", "rel": "AttributeOf"}, {"start": "inf:reference", "end": "inf:trigger", "rel": "SubtypeOf"}, {"start": "inf:response", "end": "inf:information-question-response", "rel": "SubtypeOf"}, {"start": "inf:response", "end": "inf:polarity-response", "rel": "SubtypeOf"}, {"start": "inf:semantically-specific-referent", "end": "inf:identity-unknown", "rel": "AttributeOf"}, {"start": "inf:semantically-specific-referent", "end": "inf:specific-known-referent", "rel": "SubtypeOf"}, {"start": "inf:semantically-specific-referent", "end": "inf:specific-unknown-referent", "rel": "SubtypeOf"}, {"start": "inf:semi-active-referent", "end": "inf:identity-known", "rel": "AttributeOf"}, {"start": "inf:semi-active-referent", "end": "inf:medium-accessibility", "rel": "AttributeOf"}, {"start": "inf:situating", "end": "inf:anchor", "rel": "ConstituentOf"}, {"start": "inf:speech-acts", "end": "inf:declarative", "rel": "SubtypeOf"}, {"start": "inf:speech-acts", "end": "inf:exclamative", "rel": "SubtypeOf"}, {"start": "inf:speech-acts", "end": "inf:imperative-hortative", "rel": "SubtypeOf"}, {"start": "inf:speech-acts", "end": "inf:interrogative", "rel": "SubtypeOf"}, {"start": "inf:speech-acts", "end": "inf:response", "rel": "SubtypeOf"}, {"start": "inf:subcategorizing", "end": "inf:appositive-modification", "rel": "SubtypeOf"}, {"start": "inf:subcategorizing", "end": "inf:complementative", "rel": "SubtypeOf"}, {"start": "inf:subcategorizing", "end": "inf:restrictive-modification", "rel": "SubtypeOf"}, {"start": "inf:theater-metaphor", "end": "inf:actor", "rel": "ConstituentOf"}, {"start": "inf:theater-metaphor", "end": "inf:prop", "rel": "ConstituentOf"}, {"start": "inf:theater-metaphor", "end": "inf:setting", "rel": "ConstituentOf"}, {"start": "inf:thetic", "end": "inf:entity-central", "rel": "SubtypeOf"}, {"start": "inf:thetic", "end": "inf:event-central", "rel": "SubtypeOf"}, {"start": "inf:thetic", "end": "inf:pragmatic-assertion", "rel": "AttributeOf"}, {"start": "inf:token-identity", "end": "inf:different-subject", "rel": "SubtypeOf"}, {"start": "inf:token-identity", "end": "inf:logophoric-subject-identity", "rel": "SubtypeOf"}, {"start": "inf:token-identity", "end": "inf:object-identity", "rel": "SubtypeOf"}, {"start": "inf:token-identity", "end": "inf:same-subject", "rel": "SubtypeOf"}, {"start": "inf:topic-comment", "end": "inf:aboutness", "rel": "ConstituentOf"}, {"start": "inf:topic-comment", "end": "inf:major-propositional-act", "rel": "ConstituentOf"}, {"start": "inf:topic-comment", "end": "inf:predication", "rel": "ConstituentOf"}, {"start": "inf:topic-comment", "end": "inf:reference", "rel": "ConstituentOf"}, {"start": "inf:topicality", "end": "inf:high-topicality", "rel": "SubtypeOf"}, {"start": "inf:topicality", "end": "inf:low-topicality", "rel": "SubtypeOf"}, {"start": "inf:topicality", "end": "inf:mid-topicality", "rel": "SubtypeOf"}, {"start": "inf:topicality", "end": "inf:non-high-topicality", "rel": "SubtypeOf"}, {"start": "inf:topicality", "end": "inf:non-low-topicality", "rel": "SubtypeOf"}, {"start": "inf:type-identity", "end": "inf:predicate-identity", "rel": "SubtypeOf"}, {"start": "inf:type-identity", "end": "inf:referent-type-identity", "rel": "SubtypeOf"}, {"start": "sem:action-concept", "end": "sem:dynamic", "rel": "AttributeOf"}, {"start": "sem:action-concept", "end": "sem:relational", "rel": "AttributeOf"}, {"start": "sem:action-concept", "end": "sem:transitory", "rel": "AttributeOf"}, {"start": "sem:affectee", "end": "sem:beneficiary", "rel": "SubtypeOf"}, {"start": "sem:affectee", "end": "sem:maleficiary", "rel": "SubtypeOf"}, {"start": "sem:agent", "end": "sem:a-role", "rel": "SubtypeOf"}, {"start": "sem:agentive-change-of-state-event", "end": "sem:a-role", "rel": "RoleOf"}, {"start": "sem:agentive-change-of-state-event", "end": "sem:p-role", "rel": "RoleOf"}, {"start": "sem:amount", "end": "sem:stative", "rel": "AttributeOf"}, {"start": "sem:amount", "end": "sem:transitory", "rel": "AttributeOf"}, {"start": "sem:animacy", "end": "sem:animate", "rel": "SubtypeOf"}, {"start": "sem:animacy", "end": "sem:human", "rel": "SubtypeOf"}, {"start": "sem:animacy", "end": "sem:inanimate", "rel": "SubtypeOf"}, {"start": "sem:antecedent-role", "end": "sem:concomitant-role", "rel": "SubtypeOf"}, {"start": "sem:apprehensional", "end": "sem:epistemic-stance", "rel": "AttributeOf"}, {"start": "sem:aspect", "end": "sem:achievement", "rel": "AttributeOf"}, {"start": "sem:aspect", "end": "sem:change-type", "rel": "AttributeOf"}, {"start": "sem:aspect", "end": "sem:durativity", "rel": "AttributeOf"}, {"start": "sem:aspect", "end": "sem:phasal-aspect", "rel": "AttributeOf"}, {"start": "sem:aspect", "end": "sem:stativity", "rel": "AttributeOf"}, {"start": "sem:aspect", "end": "sem:telicity", "rel": "AttributeOf"}, {"start": "sem:aspect", "end": "sem:transitoriness", "rel": "AttributeOf"}, {"start": "sem:cardinal-numeral", "end": "sem:stative", "rel": "AttributeOf"}, {"start": "sem:cardinal-numeral", "end": "sem:transitory", "rel": "AttributeOf"}, {"start": "sem:causal", "end": "sem:causal-link", "rel": "AttributeOf"}, {"start": "sem:causal", "end": "sem:epistemic-stance", "rel": "AttributeOf"}, {"start": "sem:causal-chain", "end": "sem:antecedent-role", "rel": "ConstituentOf"}, {"start": "sem:causal-chain", "end": "sem:endpoint", "rel": "ConstituentOf"}, {"start": "sem:causal-chain", "end": "sem:initiator", "rel": "ConstituentOf"}, {"start": "sem:causal-chain", "end": "sem:subsequent-role", "rel": "ConstituentOf"}, {"start": "sem:causal-chain-profile", "end": "sem:manner-profile", "rel": "SubtypeOf"}, {"start": "sem:causal-chain-profile", "end": "sem:result-profile", "rel": "SubtypeOf"}, {"start": "sem:causal-control", "end": "sem:controlled", "rel": "SubtypeOf"}, {"start": "sem:causal-control", "end": "sem:spontaneous", "rel": "SubtypeOf"}, {"start": "sem:causal-control", "end": "sem:uncontrolled", "rel": "SubtypeOf"}, {"start": "sem:causal-cyclicality", "end": "sem:chaining", "rel": "SubtypeOf"}, {"start": "sem:causal-cyclicality", "end": "sem:collective", "rel": "SubtypeOf"}, {"start": "sem:causal-cyclicality", "end": "sem:extroverted", "rel": "SubtypeOf"}, {"start": "sem:causal-cyclicality", "end": "sem:introverted", "rel": "SubtypeOf"}, {"start": "sem:causal-cyclicality", "end": "sem:reciprocal", "rel": "SubtypeOf"}, {"start": "sem:causal-cyclicality", "end": "sem:reflexive", "rel": "SubtypeOf"}, {"start": "sem:causal-directionality", "end": "sem:affecting", "rel": "SubtypeOf"}, {"start": "sem:causal-directionality", "end": "sem:attending", "rel": "SubtypeOf"}, {"start": "sem:causal-directionality", "end": "sem:experience", "rel": "SubtypeOf"}, {"start": "sem:causal-directness", "end": "sem:direct-causation", "rel": "SubtypeOf"}, {"start": "sem:causal-directness", "end": "sem:indirect-causation", "rel": "SubtypeOf"}, {"start": "sem:causal-directness", "end": "sem:sociative-causation", "rel": "SubtypeOf"}, {"start": "sem:causal-link", "end": "sem:content-causal-relation", "rel": "SubtypeOf"}, {"start": "sem:causal-link", "end": "sem:epistemic-causal-relation", "rel": "SubtypeOf"}, {"start": "sem:causal-link", "end": "sem:speech-act-causal-relation", "rel": "SubtypeOf"}, {"start": "sem:causal-structure", "end": "sem:base-event", "rel": "ConstituentOf"}, {"start": "sem:causal-structure", "end": "sem:causal-chain", "rel": "SubtypeOf"}, {"start": "sem:causal-structure", "end": "sem:causal-chain-profile", "rel": "AttributeOf"}, {"start": "sem:causal-structure", "end": "sem:causal-control", "rel": "AttributeOf"}, {"start": "sem:causal-structure", "end": "sem:causal-cyclicality", "rel": "AttributeOf"}, {"start": "sem:causal-structure", "end": "sem:causal-directionality", "rel": "AttributeOf"}, {"start": "sem:causal-structure", "end": "sem:causal-directness", "rel": "AttributeOf"}, {"start": "sem:causal-structure", "end": "sem:causative-event", "rel": "ConstituentOf"}, {"start": "sem:central-participant", "end": "sem:endpoint", "rel": "SubtypeOf"}, {"start": "sem:central-participant", "end": "sem:initiator", "rel": "SubtypeOf"}, {"start": "sem:change-of-state-event", "end": "sem:s-role", "rel": "RoleOf"}, {"start": "sem:change-type", "end": "sem:directed-change", "rel": "SubtypeOf"}, {"start": "sem:change-type", "end": "sem:undirected-change", "rel": "SubtypeOf"}, {"start": "sem:co-actor", "end": "sem:addressee", "rel": "SubtypeOf"}, {"start": "sem:co-actor", "end": "sem:affectee", "rel": "SubtypeOf"}, {"start": "sem:co-actor", "end": "sem:causee", "rel": "SubtypeOf"}, {"start": "sem:co-actor", "end": "sem:comitative", "rel": "SubtypeOf"}, {"start": "sem:co-actor", "end": "sem:experiencer", "rel": "SubtypeOf"}, {"start": "sem:co-actor", "end": "sem:occupant", "rel": "SubtypeOf"}, {"start": "sem:co-actor", "end": "sem:possessor", "rel": "SubtypeOf"}, {"start": "sem:co-actor", "end": "sem:recipient", "rel": "SubtypeOf"}, {"start": "sem:communication-event", "end": "sem:addressee", "rel": "RoleOf"}, {"start": "sem:communication-event", "end": "sem:message", "rel": "RoleOf"}, {"start": "sem:communication-event", "end": "sem:topic", "rel": "RoleOf"}, {"start": "sem:comparative-conditional-relation", "end": "sem:scalar-model", "rel": "AttributeOf"}, {"start": "sem:comparative-relation", "end": "sem:comparee", "rel": "RoleOf"}, {"start": "sem:comparative-relation", "end": "sem:gradable-predicative-scale", "rel": "ConstituentOf"}, {"start": "sem:comparative-relation", "end": "sem:standard", "rel": "RoleOf"}, {"start": "sem:concessive-conditional-relation", "end": "sem:causal-link", "rel": "AttributeOf"}, {"start": "sem:concessive-conditional-relation", "end": "sem:epistemic-stance", "rel": "AttributeOf"}, {"start": "sem:concessive-conditional-relation", "end": "sem:scalar-model", "rel": "AttributeOf"}, {"start": "sem:concessive-relation", "end": "sem:causal-link", "rel": "AttributeOf"}, {"start": "sem:concessive-relation", "end": "sem:epistemic-stance", "rel": "AttributeOf"}, {"start": "sem:conditional-relation", "end": "sem:apodosis", "rel": "ConstituentOf"}, {"start": "sem:conditional-relation", "end": "sem:causal-link", "rel": "AttributeOf"}, {"start": "sem:conditional-relation", "end": "sem:epistemic-stance", "rel": "AttributeOf"}, {"start": "sem:conditional-relation", "end": "sem:generic-conditional-relation", "rel": "SubtypeOf"}, {"start": "sem:conditional-relation", "end": "sem:protasis", "rel": "ConstituentOf"}, {"start": "sem:contextual", "end": "sem:person-deixis", "rel": "SubtypeOf"}, {"start": "sem:contextual", "end": "sem:spatial-deixis", "rel": "SubtypeOf"}, {"start": "sem:degree", "end": "sem:comparative-degree", "rel": "SubtypeOf"}, {"start": "sem:degree", "end": "sem:downtoning", "rel": "SubtypeOf"}, {"start": "sem:degree", "end": "sem:intensifying", "rel": "SubtypeOf"}, {"start": "sem:degree", "end": "sem:measuring", "rel": "SubtypeOf"}, {"start": "sem:degree", "end": "sem:superlative-degree", "rel": "SubtypeOf"}, {"start": "sem:deontic-modality", "end": "sem:future-oriented", "rel": "AttributeOf"}, {"start": "sem:desiderative-event", "end": "sem:epistemic-stance", "rel": "AttributeOf"}, {"start": "sem:desiderative-event", "end": "sem:necessary-participant-sharing", "rel": "AttributeOf"}, {"start": "sem:desiderative-event", "end": "sem:time-reference", "rel": "AttributeOf"}, {"start": "sem:distributive-quantifier", "end": "sem:stative", "rel": "AttributeOf"}, {"start": "sem:distributive-quantifier", "end": "sem:transitory", "rel": "AttributeOf"}, {"start": "sem:durativity", "end": "sem:durative", "rel": "SubtypeOf"}, {"start": "sem:durativity", "end": "sem:punctual", "rel": "SubtypeOf"}, {"start": "sem:entity", "end": "sem:aspect", "rel": "ConstituentOf"}, {"start": "sem:entity", "end": "sem:contextual", "rel": "AttributeOf"}, {"start": "sem:entity", "end": "sem:event", "rel": "SubtypeOf"}, {"start": "sem:entity", "end": "sem:event-relation", "rel": "SubtypeOf"}, {"start": "sem:entity", "end": "sem:identity", "rel": "AttributeOf"}, {"start": "sem:entity", "end": "sem:number", "rel": "AttributeOf"}, {"start": "sem:entity", "end": "sem:object-concept", "rel": "SubtypeOf"}, {"start": "sem:entity", "end": "sem:quantity", "rel": "SubtypeOf"}, {"start": "sem:entity", "end": "sem:relationality", "rel": "AttributeOf"}, {"start": "sem:entity", "end": "sem:time", "rel": "SubtypeOf"}, {"start": "sem:epistemic-modality", "end": "sem:objective", "rel": "SubtypeOf"}, {"start": "sem:epistemic-modality", "end": "sem:subjective", "rel": "SubtypeOf"}, {"start": "sem:epistemic-stance", "end": "sem:hypothetical", "rel": "SubtypeOf"}, {"start": "sem:epistemic-stance", "end": "sem:positive-epistemic-stance", "rel": "SubtypeOf"}, {"start": "sem:equative-relation", "end": "sem:comparee", "rel": "RoleOf"}, {"start": "sem:equative-relation", "end": "sem:gradable-predicative-scale", "rel": "ConstituentOf"}, {"start": "sem:equative-relation", "end": "sem:standard", "rel": "RoleOf"}, {"start": "sem:evaluative-event", "end": "sem:commentative-event", "rel": "SubtypeOf"}, {"start": "sem:evaluative-event", "end": "sem:epistemic-stance", "rel": "AttributeOf"}, {"start": "sem:evaluative-event", "end": "sem:fearing-event", "rel": "SubtypeOf"}, {"start": "sem:evaluative-event", "end": "sem:hoping-event", "rel": "SubtypeOf"}, {"start": "sem:evaluative-event", "end": "sem:necessary-participant-sharing", "rel": "AttributeOf"}, {"start": "sem:evaluative-event", "end": "sem:time-reference", "rel": "AttributeOf"}, {"start": "sem:evaluative-event", "end": "sem:wishing-event", "rel": "SubtypeOf"}, {"start": "sem:event", "end": "sem:action-concept", "rel": "SubtypeOf"}, {"start": "sem:event", "end": "sem:causal-structure", "rel": "ConstituentOf"}, {"start": "sem:event", "end": "sem:eventive-participant-event", "rel": "SubtypeOf"}, {"start": "sem:event", "end": "sem:experiential-event", "rel": "SubtypeOf"}, {"start": "sem:event", "end": "sem:manner", "rel": "AttributeOf"}, {"start": "sem:event", "end": "sem:monovalent", "rel": "AttributeOf"}, {"start": "sem:event", "end": "sem:participant-role", "rel": "RoleOf"}, {"start": "sem:event", "end": "sem:qualitative-event", "rel": "SubtypeOf"}, {"start": "sem:event", "end": "sem:quantitative-relation", "rel": "SubtypeOf"}, {"start": "sem:event", "end": "sem:semantic-role", "rel": "RoleOf"}, {"start": "sem:event", "end": "sem:social-event", "rel": "SubtypeOf"}, {"start": "sem:event", "end": "sem:spatial-event", "rel": "SubtypeOf"}, {"start": "sem:event", "end": "sem:valency", "rel": "AttributeOf"}, {"start": "sem:event-relation", "end": "sem:addition", "rel": "SubtypeOf"}, {"start": "sem:event-relation", "end": "sem:additive", "rel": "SubtypeOf"}, {"start": "sem:event-relation", "end": "sem:anterior", "rel": "SubtypeOf"}, {"start": "sem:event-relation", "end": "sem:apprehensional", "rel": "SubtypeOf"}, {"start": "sem:event-relation", "end": "sem:causal", "rel": "SubtypeOf"}, {"start": "sem:event-relation", "end": "sem:comparative-conditional-relation", "rel": "SubtypeOf"}, {"start": "sem:event-relation", "end": "sem:comparative-relation", "rel": "SubtypeOf"}, {"start": "sem:event-relation", "end": "sem:concessive-conditional-relation", "rel": "SubtypeOf"}, {"start": "sem:event-relation", "end": "sem:concessive-relation", "rel": "SubtypeOf"}, {"start": "sem:event-relation", "end": "sem:conditional-relation", "rel": "SubtypeOf"}, {"start": "sem:event-relation", "end": "sem:consecutive", "rel": "SubtypeOf"}, {"start": "sem:event-relation", "end": "sem:equative-relation", "rel": "SubtypeOf"}, {"start": "sem:event-relation", "end": "sem:exclusive-disjunction", "rel": "SubtypeOf"}, {"start": "sem:event-relation", "end": "sem:exhaustive-list", "rel": "SubtypeOf"}, {"start": "sem:event-relation", "end": "sem:inclusive-disjunction", "rel": "SubtypeOf"}, {"start": "sem:event-relation", "end": "sem:let-alone-relation", "rel": "SubtypeOf"}, {"start": "sem:event-relation", "end": "sem:means", "rel": "SubtypeOf"}, {"start": "sem:event-relation", "end": "sem:negative-circumstantial", "rel": "SubtypeOf"}, {"start": "sem:event-relation", "end": "sem:non-exhaustive-list", "rel": "SubtypeOf"}, {"start": "sem:event-relation", "end": "sem:orientation", "rel": "AttributeOf"}, {"start": "sem:event-relation", "end": "sem:posterior", "rel": "SubtypeOf"}, {"start": "sem:event-relation", "end": "sem:purpose", "rel": "SubtypeOf"}, {"start": "sem:event-relation", "end": "sem:simple-contrast", "rel": "SubtypeOf"}, {"start": "sem:event-relation", "end": "sem:simultaneous", "rel": "SubtypeOf"}, {"start": "sem:event-relation", "end": "sem:substitution", "rel": "SubtypeOf"}, {"start": "sem:event-relation", "end": "sem:substitutive", "rel": "SubtypeOf"}, {"start": "sem:event-relation", "end": "sem:subtraction", "rel": "SubtypeOf"}, {"start": "sem:event-relation", "end": "sem:subtractive", "rel": "SubtypeOf"}, {"start": "sem:event-relation", "end": "sem:unexpected-co-occurrence", "rel": "SubtypeOf"}, {"start": "sem:eventive-participant-event", "end": "sem:desiderative-event", "rel": "SubtypeOf"}, {"start": "sem:eventive-participant-event", "end": "sem:evaluative-event", "rel": "SubtypeOf"}, {"start": "sem:eventive-participant-event", "end": "sem:eventive-perception-event", "rel": "SubtypeOf"}, {"start": "sem:eventive-participant-event", "end": "sem:manipulative-event", "rel": "SubtypeOf"}, {"start": "sem:eventive-participant-event", "end": "sem:propositional-attitude-event", "rel": "SubtypeOf"}, {"start": "sem:eventive-participant-event", "end": "sem:utterance-event", "rel": "SubtypeOf"}, {"start": "sem:experiential-event", "end": "sem:agentive-experience-event", "rel": "SubtypeOf"}, {"start": "sem:experiential-event", "end": "sem:agentive-ingestion-event", "rel": "SubtypeOf"}, {"start": "sem:experiential-event", "end": "sem:cognition-event", "rel": "SubtypeOf"}, {"start": "sem:experiential-event", "end": "sem:emotion-event", "rel": "SubtypeOf"}, {"start": "sem:experiential-event", "end": "sem:experiencer", "rel": "RoleOf"}, {"start": "sem:experiential-event", "end": "sem:expertum", "rel": "RoleOf"}, {"start": "sem:experiential-event", "end": "sem:ingestion-event", "rel": "SubtypeOf"}, {"start": "sem:experiential-event", "end": "sem:perception-event", "rel": "SubtypeOf"}, {"start": "sem:experiential-event", "end": "sem:sensation-event", "rel": "SubtypeOf"}, {"start": "sem:experiential-event", "end": "sem:stimulus", "rel": "RoleOf"}, {"start": "sem:external-cause", "end": "sem:agent", "rel": "SubtypeOf"}, {"start": "sem:external-cause", "end": "sem:cause", "rel": "SubtypeOf"}, {"start": "sem:external-cause", "end": "sem:causee", "rel": "SubtypeOf"}, {"start": "sem:external-cause", "end": "sem:causer", "rel": "SubtypeOf"}, {"start": "sem:external-cause", "end": "sem:comitative", "rel": "SubtypeOf"}, {"start": "sem:external-cause", "end": "sem:force", "rel": "SubtypeOf"}, {"start": "sem:external-cause", "end": "sem:instrument", "rel": "SubtypeOf"}, {"start": "sem:hearer", "end": "sem:second-person", "rel": "AttributeOf"}, {"start": "sem:hypothetical", "end": "sem:negative-epistemic-stance", "rel": "SubtypeOf"}, {"start": "sem:hypothetical", "end": "sem:neutral-epistemic-stance", "rel": "SubtypeOf"}, {"start": "sem:identity", "end": "sem:token", "rel": "SubtypeOf"}, {"start": "sem:identity", "end": "sem:type", "rel": "SubtypeOf"}, {"start": "sem:let-alone-relation", "end": "sem:scalar-model", "rel": "AttributeOf"}, {"start": "sem:manipulative-event", "end": "sem:epistemic-stance", "rel": "AttributeOf"}, {"start": "sem:manipulative-event", "end": "sem:necessary-participant-sharing", "rel": "AttributeOf"}, {"start": "sem:manipulative-event", "end": "sem:time-reference", "rel": "AttributeOf"}, {"start": "sem:meaning", "end": "sem:entity", "rel": "SubtypeOf"}, {"start": "sem:means", "end": "sem:epistemic-stance", "rel": "AttributeOf"}, {"start": "sem:mensural-concept", "end": "sem:arrangement", "rel": "SubtypeOf"}, {"start": "sem:mensural-concept", "end": "sem:container", "rel": "SubtypeOf"}, {"start": "sem:mensural-concept", "end": "sem:group", "rel": "SubtypeOf"}, {"start": "sem:mensural-concept", "end": "sem:measure", "rel": "SubtypeOf"}, {"start": "sem:mensural-concept", "end": "sem:piece", "rel": "SubtypeOf"}, {"start": "sem:mensural-concept", "end": "sem:species", "rel": "SubtypeOf"}, {"start": "sem:mensural-concept", "end": "sem:stative", "rel": "AttributeOf"}, {"start": "sem:mensural-concept", "end": "sem:transitory", "rel": "AttributeOf"}, {"start": "sem:mental-space", "end": "sem:mirative", "rel": "SubtypeOf"}, {"start": "sem:mental-space", "end": "sem:modality", "rel": "SubtypeOf"}, {"start": "sem:mental-space", "end": "sem:polarity", "rel": "SubtypeOf"}, {"start": "sem:mental-space", "end": "sem:tense", "rel": "SubtypeOf"}, {"start": "sem:modality", "end": "sem:deontic-modality", "rel": "SubtypeOf"}, {"start": "sem:modality", "end": "sem:epistemic-modality", "rel": "SubtypeOf"}, {"start": "sem:modality", "end": "sem:evidentiality", "rel": "SubtypeOf"}, {"start": "sem:motion-event", "end": "sem:arrival", "rel": "ConstituentOf"}, {"start": "sem:motion-event", "end": "sem:departure", "rel": "ConstituentOf"}, {"start": "sem:motion-event", "end": "sem:manner-of-motion-event", "rel": "SubtypeOf"}, {"start": "sem:motion-event", "end": "sem:passing", "rel": "ConstituentOf"}, {"start": "sem:motion-event", "end": "sem:path-event", "rel": "SubtypeOf"}, {"start": "sem:negative-circumstantial", "end": "sem:epistemic-stance", "rel": "AttributeOf"}, {"start": "sem:numeral", "end": "sem:cardinal-numeral", "rel": "SubtypeOf"}, {"start": "sem:numeral", "end": "sem:ordinal-numeral", "rel": "SubtypeOf"}, {"start": "sem:object-concept", "end": "sem:animacy", "rel": "AttributeOf"}, {"start": "sem:object-concept", "end": "sem:hearer", "rel": "SubtypeOf"}, {"start": "sem:object-concept", "end": "sem:nonrelational", "rel": "AttributeOf"}, {"start": "sem:object-concept", "end": "sem:other", "rel": "SubtypeOf"}, {"start": "sem:object-concept", "end": "sem:persistent", "rel": "AttributeOf"}, {"start": "sem:object-concept", "end": "sem:person", "rel": "SubtypeOf"}, {"start": "sem:object-concept", "end": "sem:place", "rel": "SubtypeOf"}, {"start": "sem:object-concept", "end": "sem:property-concept", "rel": "AttributeOf"}, {"start": "sem:object-concept", "end": "sem:speaker", "rel": "SubtypeOf"}, {"start": "sem:object-concept", "end": "sem:stative", "rel": "AttributeOf"}, {"start": "sem:object-concept", "end": "sem:thing", "rel": "SubtypeOf"}, {"start": "sem:orientation", "end": "sem:event-oriented", "rel": "SubtypeOf"}, {"start": "sem:orientation", "end": "sem:participant-oriented", "rel": "SubtypeOf"}, {"start": "sem:other", "end": "sem:third-person", "rel": "AttributeOf"}, {"start": "sem:p-role", "end": "sem:less-affected-p", "rel": "SubtypeOf"}, {"start": "sem:p-role", "end": "sem:less-individuated-p", "rel": "SubtypeOf"}, {"start": "sem:participant-role", "end": "sem:central-participant", "rel": "SubtypeOf"}, {"start": "sem:participant-role", "end": "sem:peripheral-participant", "rel": "SubtypeOf"}, {"start": "sem:participant-role", "end": "sem:subsequent-role", "rel": "SubtypeOf"}, {"start": "sem:patient", "end": "sem:p-role", "rel": "SubtypeOf"}, {"start": "sem:perception-event", "end": "sem:epistemic-stance", "rel": "AttributeOf"}, {"start": "sem:perception-event", "end": "sem:necessary-participant-sharing", "rel": "AttributeOf"}, {"start": "sem:perception-event", "end": "sem:time-reference", "rel": "AttributeOf"}, {"start": "sem:peripheral-participant", "end": "sem:antecedent-role", "rel": "SubtypeOf"}, {"start": "sem:person", "end": "sem:human", "rel": "AttributeOf"}, {"start": "sem:person-deixis", "end": "sem:first-person", "rel": "SubtypeOf"}, {"start": "sem:person-deixis", "end": "sem:second-person", "rel": "SubtypeOf"}, {"start": "sem:person-deixis", "end": "sem:third-person", "rel": "SubtypeOf"}, {"start": "sem:phasal-aspect", "end": "sem:completive", "rel": "SubtypeOf"}, {"start": "sem:phasal-aspect", "end": "sem:continuative", "rel": "SubtypeOf"}, {"start": "sem:phasal-aspect", "end": "sem:inceptive", "rel": "SubtypeOf"}, {"start": "sem:phasal-aspect", "end": "sem:terminative", "rel": "SubtypeOf"}, {"start": "sem:place", "end": "sem:inanimate", "rel": "AttributeOf"}, {"start": "sem:polarity", "end": "sem:negative-polarity", "rel": "SubtypeOf"}, {"start": "sem:polarity", "end": "sem:positive-polarity", "rel": "SubtypeOf"}, {"start": "sem:possession", "end": "sem:body-part-relation", "rel": "SubtypeOf"}, {"start": "sem:possession", "end": "sem:kinship-relation", "rel": "SubtypeOf"}, {"start": "sem:possession", "end": "sem:ownership", "rel": "SubtypeOf"}, {"start": "sem:possession", "end": "sem:part-whole-relation", "rel": "SubtypeOf"}, {"start": "sem:possession", "end": "sem:possessor", "rel": "RoleOf"}, {"start": "sem:possession", "end": "sem:possessum", "rel": "RoleOf"}, {"start": "sem:property-concept", "end": "sem:age", "rel": "SubtypeOf"}, {"start": "sem:property-concept", "end": "sem:color", "rel": "SubtypeOf"}, {"start": "sem:property-concept", "end": "sem:dimension", "rel": "SubtypeOf"}, {"start": "sem:property-concept", "end": "sem:gender-class", "rel": "SubtypeOf"}, {"start": "sem:property-concept", "end": "sem:human-propensity", "rel": "SubtypeOf"}, {"start": "sem:property-concept", "end": "sem:material", "rel": "SubtypeOf"}, {"start": "sem:property-concept", "end": "sem:persistent", "rel": "AttributeOf"}, {"start": "sem:property-concept", "end": "sem:physical-property", "rel": "SubtypeOf"}, {"start": "sem:property-concept", "end": "sem:reference-point", "rel": "ConstituentOf"}, {"start": "sem:property-concept", "end": "sem:relational", "rel": "AttributeOf"}, {"start": "sem:property-concept", "end": "sem:scale", "rel": "AttributeOf"}, {"start": "sem:property-concept", "end": "sem:shape", "rel": "SubtypeOf"}, {"start": "sem:property-concept", "end": "sem:stative", "rel": "AttributeOf"}, {"start": "sem:property-concept", "end": "sem:value", "rel": "SubtypeOf"}, {"start": "sem:proportional-quantifier", "end": "sem:stative", "rel": "AttributeOf"}, {"start": "sem:proportional-quantifier", "end": "sem:transitory", "rel": "AttributeOf"}, {"start": "sem:proposition", "end": "sem:mental-space", "rel": "ConstituentOf"}, {"start": "sem:proposition", "end": "sem:propositional-content", "rel": "ConstituentOf"}, {"start": "sem:propositional-attitude-event", "end": "sem:epistemic-stance", "rel": "AttributeOf"}, {"start": "sem:propositional-attitude-event", "end": "sem:knowledge-event", "rel": "SubtypeOf"}, {"start": "sem:propositional-attitude-event", "end": "sem:necessary-participant-sharing", "rel": "AttributeOf"}, {"start": "sem:propositional-attitude-event", "end": "sem:pretense-event", "rel": "SubtypeOf"}, {"start": "sem:propositional-attitude-event", "end": "sem:time-reference", "rel": "AttributeOf"}, {"start": "sem:propositional-content", "end": "sem:event", "rel": "ConstituentOf"}, {"start": "sem:propositional-content", "end": "sem:participant-role", "rel": "ConstituentOf"}, {"start": "sem:purpose", "end": "sem:epistemic-stance", "rel": "AttributeOf"}, {"start": "sem:qualitative-event", "end": "sem:agentive-change-of-state-event", "rel": "SubtypeOf"}, {"start": "sem:qualitative-event", "end": "sem:bodily-action", "rel": "SubtypeOf"}, {"start": "sem:qualitative-event", "end": "sem:body-care-event", "rel": "SubtypeOf"}, {"start": "sem:qualitative-event", "end": "sem:change-of-state-event", "rel": "SubtypeOf"}, {"start": "sem:qualitative-event", "end": "sem:contact-by-impact-event", "rel": "SubtypeOf"}, {"start": "sem:qualitative-event", "end": "sem:contact-event", "rel": "SubtypeOf"}, {"start": "sem:qualitative-event", "end": "sem:creation-event", "rel": "SubtypeOf"}, {"start": "sem:qualitative-event", "end": "sem:damage-event", "rel": "SubtypeOf"}, {"start": "sem:qualitative-event", "end": "sem:existence-event", "rel": "SubtypeOf"}, {"start": "sem:qualitative-event", "end": "sem:killing-injuring-event", "rel": "SubtypeOf"}, {"start": "sem:qualitative-event", "end": "sem:patient", "rel": "RoleOf"}, {"start": "sem:qualitative-event", "end": "sem:property-concept", "rel": "SubtypeOf"}, {"start": "sem:qualitative-event", "end": "sem:state", "rel": "SubtypeOf"}, {"start": "sem:qualitative-event", "end": "sem:weather-event", "rel": "SubtypeOf"}, {"start": "sem:quantitative-relation", "end": "sem:amount", "rel": "SubtypeOf"}, {"start": "sem:quantitative-relation", "end": "sem:cardinal-numeral", "rel": "SubtypeOf"}, {"start": "sem:quantitative-relation", "end": "sem:distributive-quantifier", "rel": "SubtypeOf"}, {"start": "sem:quantitative-relation", "end": "sem:mensural-concept", "rel": "SubtypeOf"}, {"start": "sem:quantitative-relation", "end": "sem:numeral", "rel": "SubtypeOf"}, {"start": "sem:quantitative-relation", "end": "sem:proportional-quantifier", "rel": "SubtypeOf"}, {"start": "sem:quantitative-relation", "end": "sem:set-member", "rel": "SubtypeOf"}, {"start": "sem:quantitative-relation", "end": "sem:vague-numeral", "rel": "SubtypeOf"}, {"start": "sem:relationality", "end": "sem:nonrelational", "rel": "SubtypeOf"}, {"start": "sem:relationality", "end": "sem:relational", "rel": "SubtypeOf"}, {"start": "sem:scale", "end": "sem:categorical", "rel": "SubtypeOf"}, {"start": "sem:scale", "end": "sem:degree", "rel": "AttributeOf"}, {"start": "sem:scale", "end": "sem:gradient", "rel": "SubtypeOf"}, {"start": "sem:semantic-role", "end": "sem:co-actor", "rel": "SubtypeOf"}, {"start": "sem:semantic-role", "end": "sem:expertum", "rel": "SubtypeOf"}, {"start": "sem:semantic-role", "end": "sem:external-cause", "rel": "SubtypeOf"}, {"start": "sem:semantic-role", "end": "sem:ground", "rel": "SubtypeOf"}, {"start": "sem:semantic-role", "end": "sem:social-role", "rel": "SubtypeOf"}, {"start": "sem:semantic-role", "end": "sem:undergoer", "rel": "SubtypeOf"}, {"start": "sem:set-member", "end": "sem:ordinal-numeral", "rel": "SubtypeOf"}, {"start": "sem:set-member", "end": "sem:stative", "rel": "AttributeOf"}, {"start": "sem:set-member", "end": "sem:transitory", "rel": "AttributeOf"}, {"start": "sem:social-event", "end": "sem:co-actor", "rel": "RoleOf"}, {"start": "sem:social-event", "end": "sem:communication-event", "rel": "SubtypeOf"}, {"start": "sem:social-event", "end": "sem:interaction-event", "rel": "SubtypeOf"}, {"start": "sem:social-event", "end": "sem:possession", "rel": "SubtypeOf"}, {"start": "sem:social-event", "end": "sem:social-role-event", "rel": "SubtypeOf"}, {"start": "sem:social-event", "end": "sem:transfer-of-possession-event", "rel": "SubtypeOf"}, {"start": "sem:social-role-event", "end": "sem:occupant", "rel": "RoleOf"}, {"start": "sem:social-role-event", "end": "sem:social-role", "rel": "RoleOf"}, {"start": "sem:spatial-deixis", "end": "sem:distal", "rel": "SubtypeOf"}, {"start": "sem:spatial-deixis", "end": "sem:proximal", "rel": "SubtypeOf"}, {"start": "sem:spatial-event", "end": "sem:application-event", "rel": "SubtypeOf"}, {"start": "sem:spatial-event", "end": "sem:bodily-motion-event", "rel": "SubtypeOf"}, {"start": "sem:spatial-event", "end": "sem:body-position-event", "rel": "SubtypeOf"}, {"start": "sem:spatial-event", "end": "sem:caused-motion", "rel": "SubtypeOf"}, {"start": "sem:spatial-event", "end": "sem:change-in-position-event", "rel": "SubtypeOf"}, {"start": "sem:spatial-event", "end": "sem:combining-event", "rel": "SubtypeOf"}, {"start": "sem:spatial-event", "end": "sem:figure", "rel": "RoleOf"}, {"start": "sem:spatial-event", "end": "sem:figure-ground-spatial-relation", "rel": "SubtypeOf"}, {"start": "sem:spatial-event", "end": "sem:ground", "rel": "RoleOf"}, {"start": "sem:spatial-event", "end": "sem:motion-event", "rel": "SubtypeOf"}, {"start": "sem:spatial-event", "end": "sem:pursuit-event", "rel": "SubtypeOf"}, {"start": "sem:spatial-event", "end": "sem:removal-event", "rel": "SubtypeOf"}, {"start": "sem:speaker", "end": "sem:first-person", "rel": "AttributeOf"}, {"start": "sem:state", "end": "sem:relational", "rel": "AttributeOf"}, {"start": "sem:state", "end": "sem:stative", "rel": "AttributeOf"}, {"start": "sem:stativity", "end": "sem:dynamic", "rel": "SubtypeOf"}, {"start": "sem:stativity", "end": "sem:stative", "rel": "SubtypeOf"}, {"start": "sem:tamp", "end": "sem:aspect", "rel": "SubtypeOf"}, {"start": "sem:tamp", "end": "sem:modality", "rel": "SubtypeOf"}, {"start": "sem:tamp", "end": "sem:polarity", "rel": "SubtypeOf"}, {"start": "sem:tamp", "end": "sem:tense", "rel": "SubtypeOf"}, {"start": "sem:telicity", "end": "sem:atelic", "rel": "SubtypeOf"}, {"start": "sem:telicity", "end": "sem:telic", "rel": "SubtypeOf"}, {"start": "sem:thing", "end": "sem:animate", "rel": "AttributeOf"}, {"start": "sem:thing", "end": "sem:inanimate", "rel": "AttributeOf"}, {"start": "sem:time-reference", "end": "sem:dependent-time-reference", "rel": "SubtypeOf"}, {"start": "sem:time-reference", "end": "sem:independent-time-reference", "rel": "SubtypeOf"}, {"start": "sem:time-stability", "end": "sem:stativity", "rel": "SubtypeOf"}, {"start": "sem:time-stability", "end": "sem:transitoriness", "rel": "SubtypeOf"}, {"start": "sem:transfer-of-possession-event", "end": "sem:recipient", "rel": "RoleOf"}, {"start": "sem:transfer-of-possession-event", "end": "sem:theme", "rel": "RoleOf"}, {"start": "sem:transitoriness", "end": "sem:persistent", "rel": "SubtypeOf"}, {"start": "sem:transitoriness", "end": "sem:transitory", "rel": "SubtypeOf"}, {"start": "sem:undergoer", "end": "sem:affectee", "rel": "SubtypeOf"}, {"start": "sem:undergoer", "end": "sem:experiencer", "rel": "SubtypeOf"}, {"start": "sem:undergoer", "end": "sem:figure", "rel": "SubtypeOf"}, {"start": "sem:undergoer", "end": "sem:message", "rel": "SubtypeOf"}, {"start": "sem:undergoer", "end": "sem:patient", "rel": "SubtypeOf"}, {"start": "sem:undergoer", "end": "sem:possessor", "rel": "SubtypeOf"}, {"start": "sem:undergoer", "end": "sem:possessum", "rel": "SubtypeOf"}, {"start": "sem:undergoer", "end": "sem:s-role", "rel": "SubtypeOf"}, {"start": "sem:undergoer", "end": "sem:stimulus", "rel": "SubtypeOf"}, {"start": "sem:undergoer", "end": "sem:theme", "rel": "SubtypeOf"}, {"start": "sem:undergoer", "end": "sem:topic", "rel": "SubtypeOf"}, {"start": "sem:utterance-event", "end": "sem:epistemic-stance", "rel": "AttributeOf"}, {"start": "sem:utterance-event", "end": "sem:necessary-participant-sharing", "rel": "AttributeOf"}, {"start": "sem:utterance-event", "end": "sem:time-reference", "rel": "AttributeOf"}, {"start": "sem:vague-numeral", "end": "sem:stative", "rel": "AttributeOf"}, {"start": "sem:vague-numeral", "end": "sem:transitory", "rel": "AttributeOf"}, {"start": "sem:valency", "end": "sem:avalent", "rel": "SubtypeOf"}, {"start": "sem:valency", "end": "sem:bivalent", "rel": "SubtypeOf"}, {"start": "sem:valency", "end": "sem:monovalent", "rel": "SubtypeOf"}, {"start": "sem:valency", "end": "sem:trivalent", "rel": "SubtypeOf"}, {"start": "str:absolute-deranking-system", "end": "str:switch-reference-system", "rel": "SubtypeOf"}, {"start": "str:accusative-alignment", "end": "str:accusative-category", "rel": "ConstituentOf"}, {"start": "str:accusative-alignment", "end": "str:nominative-category", "rel": "ConstituentOf"}, {"start": "str:active-alignment", "end": "str:active-category", "rel": "ConstituentOf"}, {"start": "str:active-alignment", "end": "str:inactive-category", "rel": "ConstituentOf"}, {"start": "str:adposition", "end": "str:circumposition", "rel": "SubtypeOf"}, {"start": "str:adposition", "end": "str:postposition", "rel": "SubtypeOf"}, {"start": "str:adposition", "end": "str:preposition", "rel": "SubtypeOf"}, {"start": "str:affixation", "end": "str:degree-affix", "rel": "SubtypeOf"}, {"start": "str:affixation", "end": "str:degree-marker", "rel": "SubtypeOf"}, {"start": "str:affixation", "end": "str:degree-modifier", "rel": "SubtypeOf"}, {"start": "str:alignment-system", "end": "str:active-alignment", "rel": "SubtypeOf"}, {"start": "str:alignment-system", "end": "str:antipassive-alignment", "rel": "SubtypeOf"}, {"start": "str:alignment-system", "end": "str:applicative-alignment", "rel": "SubtypeOf"}, {"start": "str:alignment-system", "end": "str:causative-alignment", "rel": "SubtypeOf"}, {"start": "str:alignment-system", "end": "str:clause-alignment", "rel": "SubtypeOf"}, {"start": "str:alignment-system", "end": "str:complement-disalignment", "rel": "SubtypeOf"}, {"start": "str:alignment-system", "end": "str:ditransitive-alignment", "rel": "SubtypeOf"}, {"start": "str:alignment-system", "end": "str:experiential-alignment", "rel": "SubtypeOf"}, {"start": "str:alignment-system", "end": "str:information-packaging-alignment", "rel": "SubtypeOf"}, {"start": "str:alignment-system", "end": "str:passive-inverse-alignment", "rel": "SubtypeOf"}, {"start": "str:alignment-system", "end": "str:polarity-response-alignment", "rel": "SubtypeOf"}, {"start": "str:alignment-system", "end": "str:subject-predicate-alignment", "rel": "SubtypeOf"}, {"start": "str:alignment-system", "end": "str:transitive-alignment", "rel": "SubtypeOf"}, {"start": "str:alignment-system", "end": "str:utterance-clause-alignment", "rel": "SubtypeOf"}, {"start": "str:antipassive-alignment", "end": "str:noun-incorporation", "rel": "SubtypeOf"}, {"start": "str:antipassive-alignment", "end": "str:oblique-p-strategy", "rel": "SubtypeOf"}, {"start": "str:antipassive-alignment", "end": "str:omitted-p-strategy", "rel": "SubtypeOf"}, {"start": "str:applicative-alignment", "end": "str:base-object-inertia", "rel": "SubtypeOf"}, {"start": "str:applicative-alignment", "end": "str:noun-incorporation", "rel": "SubtypeOf"}, {"start": "str:applicative-alignment", "end": "str:oblique-p-strategy", "rel": "SubtypeOf"}, {"start": "str:causative-alignment", "end": "str:control-based-strategy", "rel": "SubtypeOf"}, {"start": "str:causative-alignment", "end": "str:transitivity-based-strategy", "rel": "SubtypeOf"}, {"start": "str:classifier", "end": "str:repeater", "rel": "SubtypeOf"}, {"start": "str:classifier", "end": "str:sortal-classifier", "rel": "SubtypeOf"}, {"start": "str:clause-alignment", "end": "str:balancing", "rel": "SubtypeOf"}, {"start": "str:clause-alignment", "end": "str:deranking", "rel": "SubtypeOf"}, {"start": "str:co-expression", "end": "str:causative-applicative-co-expression", "rel": "SubtypeOf"}, {"start": "str:complement-disalignment", "end": "str:detached-complement-strategy", "rel": "SubtypeOf"}, {"start": "str:complementizer", "end": "str:interrogative-complementizer", "rel": "SubtypeOf"}, {"start": "str:complementizer", "end": "str:quotative-marker", "rel": "SubtypeOf"}, {"start": "str:conjunction", "end": "str:adverbializer", "rel": "SubtypeOf"}, {"start": "str:conjunction", "end": "str:complementizer", "rel": "SubtypeOf"}, {"start": "str:conjunction", "end": "str:coordinator", "rel": "SubtypeOf"}, {"start": "str:conjunction", "end": "str:relativizer", "rel": "SubtypeOf"}, {"start": "str:copula", "end": "str:nonverbal-copula-strategy", "rel": "SubtypeOf"}, {"start": "str:copula", "end": "str:verbal-copula", "rel": "SubtypeOf"}, {"start": "str:deranking", "end": "str:action-nominal", "rel": "ConstituentOf"}, {"start": "str:deranking", "end": "str:anterior-deranking", "rel": "SubtypeOf"}, {"start": "str:deranking", "end": "str:converb", "rel": "ConstituentOf"}, {"start": "str:deranking", "end": "str:participle", "rel": "ConstituentOf"}, {"start": "str:deranking", "end": "str:posterior-deranking", "rel": "SubtypeOf"}, {"start": "str:derived-case", "end": "str:conjoined-comparative", "rel": "SubtypeOf"}, {"start": "str:derived-case", "end": "str:conjoined-exceed-comparative", "rel": "SubtypeOf"}, {"start": "str:derived-case", "end": "str:particle-comparative", "rel": "SubtypeOf"}, {"start": "str:derived-case", "end": "str:particle-equative", "rel": "SubtypeOf"}, {"start": "str:derived-case", "end": "str:relative-based-equative", "rel": "SubtypeOf"}, {"start": "str:derived-case", "end": "str:relative-equal-equative", "rel": "SubtypeOf"}, {"start": "str:ditransitive-alignment", "end": "str:indirective-alignment", "rel": "SubtypeOf"}, {"start": "str:ditransitive-alignment", "end": "str:neutral-ditransitive-alignment", "rel": "SubtypeOf"}, {"start": "str:ditransitive-alignment", "end": "str:secundative-alignment", "rel": "SubtypeOf"}, {"start": "str:dual-role-strategy", "end": "str:specialized-dual-role-strategy", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:a-not-a", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:adjective-impersonal-strategy", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:adjective-personal-strategy", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:adnominal-possessive-strategy", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:adpositional-personal-strategy", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:adpositional-strategy", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:adverbial-strategy", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:affixal-negation", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:alternative-concessive-conditional-strategy", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:associative-strategy", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:bare-verb-stem", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:causative-coordinate-strategy", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:causative-predicational-strategy", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:cognate-head-dependent-strategy", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:converb-strategy", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:coordinate-impersonal-strategy", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:coordinate-personal-strategy", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:copular-participle-strategy", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:derived-case", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:detached-topic-phrase", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:double-expression", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:double-negation-strategy", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:doubling", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:echo-strategy", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:ellipsis", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:externally-headed", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:figure-incorporating", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:fixed-case", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:fusion", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:general-extender", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:have-possessive-strategy", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:ideophones", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:inclusory-strategy", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:independent-strategy", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:indexation", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:locational-strategy", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:long-distance-reflexive", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:mensural-classifier", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:merged-argument-structure-strategy", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:negative-particle", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:non-externally-headed", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:ordered-strategy", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:overt-coding", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:partially-merged-argument-structure-strategy", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:participial-strategy", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:possessive-locative-strategy", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:predicational-strategy", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:predicativization-possessive-strategy", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:prosody", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:satellite-framing-strategy", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:scalar-concessive-conditional-strategy", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:serial-verb-strategy", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:special-form", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:special-p-strategy", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:split-argument-structure-strategy", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:summarizer", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:tag", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:tense-iconicity", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:topic-locational-hybrid-possessive-strategy", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:topic-possessive-strategy", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:universal-concessive-conditional-strategy", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:verb-framing-strategy", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:with-possessive-strategy", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:word-order", "rel": "SubtypeOf"}, {"start": "str:encoding-strategy", "end": "str:zero-coding", "rel": "SubtypeOf"}, {"start": "str:ergative-alignment", "end": "str:absolutive-category", "rel": "ConstituentOf"}, {"start": "str:ergative-alignment", "end": "str:ergative-category", "rel": "ConstituentOf"}, {"start": "str:experiential-alignment", "end": "str:double-coding-strategy", "rel": "SubtypeOf"}, {"start": "str:experiential-alignment", "end": "str:double-oblique-strategy", "rel": "SubtypeOf"}, {"start": "str:experiential-alignment", "end": "str:experiencer-oriented-strategy", "rel": "SubtypeOf"}, {"start": "str:experiential-alignment", "end": "str:stimulus-oriented-strategy", "rel": "SubtypeOf"}, {"start": "str:externally-headed", "end": "str:extraposed-strategy", "rel": "SubtypeOf"}, {"start": "str:externally-headed", "end": "str:gap-strategy", "rel": "SubtypeOf"}, {"start": "str:externally-headed", "end": "str:postnominal-strategy", "rel": "SubtypeOf"}, {"start": "str:externally-headed", "end": "str:prenominal-strategy", "rel": "SubtypeOf"}, {"start": "str:externally-headed", "end": "str:pronoun-retention-strategy", "rel": "SubtypeOf"}, {"start": "str:externally-headed", "end": "str:relative-pronoun-strategy", "rel": "SubtypeOf"}, {"start": "str:fixed-case", "end": "str:allative-comparative", "rel": "SubtypeOf"}, {"start": "str:fixed-case", "end": "str:associative-equative", "rel": "SubtypeOf"}, {"start": "str:fixed-case", "end": "str:degree-equative", "rel": "SubtypeOf"}, {"start": "str:fixed-case", "end": "str:equal-equative", "rel": "SubtypeOf"}, {"start": "str:fixed-case", "end": "str:exceed-comparative", "rel": "SubtypeOf"}, {"start": "str:fixed-case", "end": "str:locative-comparative", "rel": "SubtypeOf"}, {"start": "str:fixed-case", "end": "str:object-equative", "rel": "SubtypeOf"}, {"start": "str:fixed-case", "end": "str:separative-comparative", "rel": "SubtypeOf"}, {"start": "str:fixed-case", "end": "str:unique-equative", "rel": "SubtypeOf"}, {"start": "str:flagging", "end": "str:adposition", "rel": "SubtypeOf"}, {"start": "str:flagging", "end": "str:case-affix", "rel": "SubtypeOf"}, {"start": "str:fusion", "end": "str:negative-fusion", "rel": "SubtypeOf"}, {"start": "str:ideophones", "end": "str:phenomime", "rel": "SubtypeOf"}, {"start": "str:ideophones", "end": "str:phonomime", "rel": "SubtypeOf"}, {"start": "str:ideophones", "end": "str:psychomime", "rel": "SubtypeOf"}, {"start": "str:independent-strategy", "end": "str:conjoined-comparative", "rel": "SubtypeOf"}, {"start": "str:independent-strategy", "end": "str:particle-comparative", "rel": "SubtypeOf"}, {"start": "str:independent-strategy", "end": "str:particle-equative", "rel": "SubtypeOf"}, {"start": "str:independent-strategy", "end": "str:relative-based-equative", "rel": "SubtypeOf"}, {"start": "str:indexation", "end": "str:classifier", "rel": "SubtypeOf"}, {"start": "str:indexation", "end": "str:controller", "rel": "ConstituentOf"}, {"start": "str:indexation", "end": "str:domain", "rel": "ConstituentOf"}, {"start": "str:indexation", "end": "str:index", "rel": "ConstituentOf"}, {"start": "str:indexation", "end": "str:indexation-feature", "rel": "ConstituentOf"}, {"start": "str:indexation", "end": "str:nonperson-indexation", "rel": "SubtypeOf"}, {"start": "str:indexation", "end": "str:person-indexation", "rel": "SubtypeOf"}, {"start": "str:indexation", "end": "str:target", "rel": "ConstituentOf"}, {"start": "str:indirective-alignment", "end": "str:direct-object-category", "rel": "ConstituentOf"}, {"start": "str:indirective-alignment", "end": "str:indirect-object-category", "rel": "ConstituentOf"}, {"start": "str:information-packaging-alignment", "end": "str:actual-information-packaging-strategy", "rel": "SubtypeOf"}, {"start": "str:information-packaging-alignment", "end": "str:hybrid-information-packaging-strategy", "rel": "SubtypeOf"}, {"start": "str:information-packaging-alignment", "end": "str:semantic-information-packaging-strategy", "rel": "SubtypeOf"}, {"start": "str:internal-possessor-strategy", "end": "str:internal-recipient-strategy", "rel": "SubtypeOf"}, {"start": "str:non-externally-headed", "end": "str:adjoined-strategy", "rel": "SubtypeOf"}, {"start": "str:non-externally-headed", "end": "str:correlative-strategy", "rel": "SubtypeOf"}, {"start": "str:non-externally-headed", "end": "str:internally-headed-strategy", "rel": "SubtypeOf"}, {"start": "str:ordered-strategy", "end": "str:allative-comparative", "rel": "SubtypeOf"}, {"start": "str:ordered-strategy", "end": "str:associative-equative", "rel": "SubtypeOf"}, {"start": "str:ordered-strategy", "end": "str:locative-comparative", "rel": "SubtypeOf"}, {"start": "str:ordered-strategy", "end": "str:separative-comparative", "rel": "SubtypeOf"}, {"start": "str:overt-coding", "end": "str:complex-predicate-asc-strategy", "rel": "SubtypeOf"}, {"start": "str:overt-coding", "end": "str:conjunction", "rel": "SubtypeOf"}, {"start": "str:overt-coding", "end": "str:copula", "rel": "SubtypeOf"}, {"start": "str:overt-coding", "end": "str:declarative-marker", "rel": "SubtypeOf"}, {"start": "str:overt-coding", "end": "str:focus-marker", "rel": "SubtypeOf"}, {"start": "str:overt-coding", "end": "str:indexed", "rel": "SubtypeOf"}, {"start": "str:overt-coding", "end": "str:linker", "rel": "SubtypeOf"}, {"start": "str:overt-coding", "end": "str:nominalizer", "rel": "SubtypeOf"}, {"start": "str:overt-coding", "end": "str:overt-article", "rel": "SubtypeOf"}, {"start": "str:overt-coding", "end": "str:overt-pronoun", "rel": "SubtypeOf"}, {"start": "str:overt-coding", "end": "str:overtly-coded-single-role-strategy", "rel": "SubtypeOf"}, {"start": "str:overt-coding", "end": "str:overtly-coded-verb", "rel": "SubtypeOf"}, {"start": "str:overt-coding", "end": "str:overtly-headed-strategy", "rel": "SubtypeOf"}, {"start": "str:overt-coding", "end": "str:question-marker", "rel": "SubtypeOf"}, {"start": "str:overt-coding", "end": "str:relational-strategy", "rel": "SubtypeOf"}, {"start": "str:overt-coding", "end": "str:relative-strategy", "rel": "SubtypeOf"}, {"start": "str:overt-coding", "end": "str:specialized-dual-role-strategy", "rel": "SubtypeOf"}, {"start": "str:overt-coding", "end": "str:syndetic", "rel": "SubtypeOf"}, {"start": "str:overt-coding", "end": "str:thetic-marker", "rel": "SubtypeOf"}, {"start": "str:overt-coding", "end": "str:topic-marker", "rel": "SubtypeOf"}, {"start": "str:overt-coding", "end": "str:verb-coding-strategy", "rel": "SubtypeOf"}, {"start": "str:passive-inverse-alignment", "end": "str:animacy-based-split-ergativity", "rel": "SubtypeOf"}, {"start": "str:passive-inverse-alignment", "end": "str:differential-object-marking", "rel": "SubtypeOf"}, {"start": "str:passive-inverse-alignment", "end": "str:omitted-a-strategy", "rel": "SubtypeOf"}, {"start": "str:polarity-response-alignment", "end": "str:agree-disagree-alignment", "rel": "SubtypeOf"}, {"start": "str:polarity-response-alignment", "end": "str:yes-no-alignment", "rel": "SubtypeOf"}, {"start": "str:polarity-response-alignment", "end": "str:yes-no-disagree-alignment", "rel": "SubtypeOf"}, {"start": "str:recruitment-strategy", "end": "str:adverbial-clause-strategy", "rel": "SubtypeOf"}, {"start": "str:recruitment-strategy", "end": "str:anchoring-nominal-strategy", "rel": "SubtypeOf"}, {"start": "str:recruitment-strategy", "end": "str:biclausal-reciprocal", "rel": "SubtypeOf"}, {"start": "str:recruitment-strategy", "end": "str:cleft-strategy", "rel": "SubtypeOf"}, {"start": "str:recruitment-strategy", "end": "str:coordinate-clause-strategy", "rel": "SubtypeOf"}, {"start": "str:recruitment-strategy", "end": "str:definite-article-strategy", "rel": "SubtypeOf"}, {"start": "str:recruitment-strategy", "end": "str:demonstrative-strategy", "rel": "SubtypeOf"}, {"start": "str:recruitment-strategy", "end": "str:direct-question-strategy", "rel": "SubtypeOf"}, {"start": "str:recruitment-strategy", "end": "str:dual-role-strategy", "rel": "SubtypeOf"}, {"start": "str:recruitment-strategy", "end": "str:existential-negative-strategy", "rel": "SubtypeOf"}, {"start": "str:recruitment-strategy", "end": "str:external-possessor-strategy", "rel": "SubtypeOf"}, {"start": "str:recruitment-strategy", "end": "str:first-person-plural-strategy", "rel": "SubtypeOf"}, {"start": "str:recruitment-strategy", "end": "str:human-noun-strategy", "rel": "SubtypeOf"}, {"start": "str:recruitment-strategy", "end": "str:identificational-strategy", "rel": "SubtypeOf"}, {"start": "str:recruitment-strategy", "end": "str:independent-referring-phrase-strategy", "rel": "SubtypeOf"}, {"start": "str:recruitment-strategy", "end": "str:insubordination", "rel": "SubtypeOf"}, {"start": "str:recruitment-strategy", "end": "str:internal-possessor-strategy", "rel": "SubtypeOf"}, {"start": "str:recruitment-strategy", "end": "str:interrogative-pronoun-strategy", "rel": "SubtypeOf"}, {"start": "str:recruitment-strategy", "end": "str:locational-possessive-strategy", "rel": "SubtypeOf"}, {"start": "str:recruitment-strategy", "end": "str:middle-voice", "rel": "SubtypeOf"}, {"start": "str:recruitment-strategy", "end": "str:monoclausal-transitive-reciprocal-strategy", "rel": "SubtypeOf"}, {"start": "str:recruitment-strategy", "end": "str:negative-auxiliary-strategy", "rel": "SubtypeOf"}, {"start": "str:recruitment-strategy", "end": "str:nonspecific-article-strategy", "rel": "SubtypeOf"}, {"start": "str:recruitment-strategy", "end": "str:nonspecific-pronoun-strategy", "rel": "SubtypeOf"}, {"start": "str:recruitment-strategy", "end": "str:noun-modifying-clause-strategy", "rel": "SubtypeOf"}, {"start": "str:recruitment-strategy", "end": "str:numeral-strategy", "rel": "SubtypeOf"}, {"start": "str:recruitment-strategy", "end": "str:perception-verb-strategy", "rel": "SubtypeOf"}, {"start": "str:recruitment-strategy", "end": "str:predicational-locative-strategy", "rel": "SubtypeOf"}, {"start": "str:recruitment-strategy", "end": "str:pseudo-partitive", "rel": "SubtypeOf"}, {"start": "str:recruitment-strategy", "end": "str:reciprocal-strategy", "rel": "SubtypeOf"}, {"start": "str:recruitment-strategy", "end": "str:reflexive-strategy", "rel": "SubtypeOf"}, {"start": "str:recruitment-strategy", "end": "str:single-role-strategy", "rel": "SubtypeOf"}, {"start": "str:recruitment-strategy", "end": "str:universal-pronoun-strategy", "rel": "SubtypeOf"}, {"start": "str:reference-tracking-system", "end": "str:absolute-deranking-system", "rel": "SubtypeOf"}, {"start": "str:reference-tracking-system", "end": "str:conditional-deranking", "rel": "SubtypeOf"}, {"start": "str:reference-tracking-system", "end": "str:conditional-discourse-reference-system", "rel": "SubtypeOf"}, {"start": "str:reference-tracking-system", "end": "str:discourse-reference-system", "rel": "SubtypeOf"}, {"start": "str:relational-strategy", "end": "str:flagging", "rel": "SubtypeOf"}, {"start": "str:relative-strategy", "end": "str:conjoined-exceed-comparative", "rel": "SubtypeOf"}, {"start": "str:relative-strategy", "end": "str:degree-equative", "rel": "SubtypeOf"}, {"start": "str:relative-strategy", "end": "str:equal-equative", "rel": "SubtypeOf"}, {"start": "str:relative-strategy", "end": "str:exceed-comparative", "rel": "SubtypeOf"}, {"start": "str:relative-strategy", "end": "str:relative-equal-equative", "rel": "SubtypeOf"}, {"start": "str:satellite-framing-strategy", "end": "str:satellite", "rel": "ConstituentOf"}, {"start": "str:secundative-alignment", "end": "str:primary-object-category", "rel": "ConstituentOf"}, {"start": "str:secundative-alignment", "end": "str:secondary-object-category", "rel": "ConstituentOf"}, {"start": "str:serial-verb-strategy", "end": "str:contiguity-of-serial-verbs", "rel": "SubtypeOf"}, {"start": "str:serial-verb-strategy", "end": "str:incorporation-of-serial-verbs", "rel": "SubtypeOf"}, {"start": "str:serial-verb-strategy", "end": "str:locus-of-inflection-of-serial-verbs", "rel": "SubtypeOf"}, {"start": "str:serial-verb-strategy", "end": "str:second-position", "rel": "SubtypeOf"}, {"start": "str:serial-verb-strategy", "end": "str:stamp-strategy", "rel": "SubtypeOf"}, {"start": "str:simple-strategy", "end": "str:affixation", "rel": "SubtypeOf"}, {"start": "str:simple-strategy", "end": "str:compounding", "rel": "SubtypeOf"}, {"start": "str:simple-strategy", "end": "str:juxtaposition", "rel": "SubtypeOf"}, {"start": "str:single-role-strategy", "end": "str:overtly-coded-single-role-strategy", "rel": "SubtypeOf"}, {"start": "str:strategy", "end": "str:encoding-strategy", "rel": "SubtypeOf"}, {"start": "str:strategy", "end": "str:recruitment-strategy", "rel": "SubtypeOf"}, {"start": "str:strategy", "end": "str:system", "rel": "SubtypeOf"}, {"start": "str:subject-predicate-alignment", "end": "str:non-nominative-flag-index", "rel": "SubtypeOf"}, {"start": "str:subject-predicate-alignment", "end": "str:noun-incorporation", "rel": "SubtypeOf"}, {"start": "str:subject-predicate-alignment", "end": "str:split-structure", "rel": "SubtypeOf"}, {"start": "str:syndetic", "end": "str:bisyndetic", "rel": "SubtypeOf"}, {"start": "str:syndetic", "end": "str:conjunction", "rel": "ConstituentOf"}, {"start": "str:syndetic", "end": "str:monosyndetic", "rel": "SubtypeOf"}, {"start": "str:system", "end": "str:alignment-system", "rel": "SubtypeOf"}, {"start": "str:system", "end": "str:co-expression", "rel": "SubtypeOf"}, {"start": "str:system", "end": "str:logophoric-system", "rel": "SubtypeOf"}, {"start": "str:system", "end": "str:reference-tracking-system", "rel": "SubtypeOf"}, {"start": "str:transitive-alignment", "end": "str:accusative-alignment", "rel": "SubtypeOf"}, {"start": "str:transitive-alignment", "end": "str:ergative-alignment", "rel": "SubtypeOf"}, {"start": "str:transitive-alignment", "end": "str:neutral-alignment", "rel": "SubtypeOf"}, {"start": "str:transitive-alignment", "end": "str:tripartite-alignment", "rel": "SubtypeOf"}, {"start": "str:utterance-clause-alignment", "end": "str:direct-report", "rel": "SubtypeOf"}, {"start": "str:utterance-clause-alignment", "end": "str:indirect-report", "rel": "SubtypeOf"}, {"start": "str:word-order", "end": "str:anterior-deranking", "rel": "SubtypeOf"}, {"start": "str:word-order", "end": "str:basic-word-order", "rel": "SubtypeOf"}, {"start": "str:word-order", "end": "str:extraposed-strategy", "rel": "SubtypeOf"}, {"start": "str:word-order", "end": "str:posterior-deranking", "rel": "SubtypeOf"}, {"start": "str:word-order", "end": "str:postnominal-strategy", "rel": "SubtypeOf"}, {"start": "str:word-order", "end": "str:prenominal-strategy", "rel": "SubtypeOf"}, {"start": "str:zero-coding", "end": "str:anterior-zero", "rel": "SubtypeOf"}, {"start": "str:zero-coding", "end": "str:asyndetic", "rel": "SubtypeOf"}, {"start": "str:zero-coding", "end": "str:headless", "rel": "SubtypeOf"}, {"start": "str:zero-coding", "end": "str:non-indexed", "rel": "SubtypeOf"}, {"start": "str:zero-coding", "end": "str:posterior-zero", "rel": "SubtypeOf"}, {"start": "str:zero-coding", "end": "str:simple-strategy", "rel": "SubtypeOf"}, {"start": "str:zero-coding", "end": "str:verbal-strategy", "rel": "SubtypeOf"}, {"start": "str:zero-coding", "end": "str:zero-anaphora", "rel": "SubtypeOf"}, {"start": "str:zero-coding", "end": "str:zero-article", "rel": "SubtypeOf"}, {"start": "str:zero-coding", "end": "str:zero-coded-verb", "rel": "SubtypeOf"}, {"start": "str:zero-coding", "end": "str:zero-copula", "rel": "SubtypeOf"}], "shards": ["cc-graph-core-0.js", "cc-graph-core-1.js", "cc-graph-core-2.js", "cc-graph-core-3.js", "cc-graph-core-4.js", "cc-graph-core-5.js", "cc-graph-core-6.js", "cc-graph-core-7.js"]};
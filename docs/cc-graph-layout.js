@@ -0,0 +1,45 @@
+///////////////////////////////////////////////////////////////////////////////
+// Start the graphs from the layouts that were computed when building the database (cc-graphs.js),
+// instead of letting vis-network stabilize them from scratch.
+// Every time a graph is selected (from the menu, on load, or from a link such as cc-graph.html#g=cxn&id=...),
+// its positions are added to the nodes in DATA, before the graph visualizer builds the graph from them
+// (x and y are the node positions in vis-network).
+
+// The layout settings when there are no positions
+const UNPLACED_LAYOUT = {
+    improvedLayout: SETTINGS.network.layout.improvedLayout,
+    iterations: SETTINGS.network.physics.stabilization.iterations,
+};
+
+function place_nodes(graph) {
+    const positions = SETTINGS.graphs[graph]?.positions || {};
+    let placed = 0;
+    for (const node of DATA.nodes) {
+        if (node.id in positions) {
+            [node.x, node.y] = positions[node.id];
+            placed++;
+        } else {
+            delete node.x;
+            delete node.y;
+        }
+    }
+    // Nodes with positions only need to be relaxed a little, and no initial layout
+    SETTINGS.network.layout.improvedLayout = placed ? false : UNPLACED_LAYOUT.improvedLayout;
+    SETTINGS.network.physics.stabilization.iterations = placed ? 20 : UNPLACED_LAYOUT.iterations;
+}
+
+function selected_graph() {
+    const graph = document.getElementById("gvGraphType")?.value;
+    return graph || new URLSearchParams(window.location.hash.slice(1)).get("g");
+}
+
+// All ways of showing a graph go through selectGraph, which is defined by the graph visualizer
+// after this script, so it is wrapped when the page has been parsed, before the visualizer starts
+window.addEventListener("DOMContentLoaded", () => {
+    const selectGraph = window.selectGraph;
+    if (typeof selectGraph !== "function") return;
+    window.selectGraph = function(...args) {
+        place_nodes(selected_graph());
+        return selectGraph.apply(this, args);
+    };
+});
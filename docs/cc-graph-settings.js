@@ -51,50 +51,9 @@ SETTINGS.edges = {
 
 // Attributes for the different graphs
 // Currently supporting: name, defaultrelation, nodes, edges
-SETTINGS.graphs = {
-    cxn: {
-        name: "Constructions",
-        defaultrelation: "SubtypeOf",
-        nodes: {cxn: true},
-        edges: {SubtypeOf: true, ConstituentOf: true, HeadOf: true},
-    },
-    str: {
-        name: "Strategies",
-        defaultrelation: "SubtypeOf",
-        nodes: {str: true},
-        edges: {SubtypeOf: true, ConstituentOf: true},
-    },
-    sem: {
-        name: "Semantic CCs",
-        defaultrelation: "SubtypeOf",
-        nodes: {sem: true},
-        edges: {SubtypeOf: true, ConstituentOf: true, AttributeOf: true, RoleOf: true},
-    },
-    inf: {
-        name: "Information packaging",
-        defaultrelation: "SubtypeOf",
-        nodes: {inf: true},
-        edges: {SubtypeOf: true, ConstituentOf: true, AttributeOf: true},
-    },
-    cxn_str: {
-        name: "Cxn ↔︎ Strategies",
-        defaultrelation: "ExpressionOf",
-        nodes: {cxn: true, str: true},
-        edges: {SubtypeOf: true, ExpressionOf: true, ModeledOn: true, RecruitedFrom: true, ConstituentOf: true, HeadOf: true},
-    },
-    cxn_sem_inf: {
-        name: "Cxn ↔︎ Sem. + Inf.",
-        defaultrelation: "FunctionOf",
-        nodes: {cxn: true, inf: true, sem: true},
-        edges: {SubtypeOf: true, ConstituentOf: true, HeadOf: true, FunctionOf: true},
-    },
-    sections: {
-        name: "CCs by book section",
-        defaultrelation: "Sections",
-        nodes: {section: true, cxn: true, str: true, inf: true, sem: true},
-        edges: {Sections: true, SubtypeOf: true, ConstituentOf: true, HeadOf: true},
-    }
-};
+// The graphs are defined in cc-graphs.json, and cc-graphs.js is exported from it together with
+// the precomputed positions of the nodes in each graph (with ccdb_parser.py --format layout)
+SETTINGS.graphs = GRAPHS.graphs;
 
 // General settings
 SETTINGS.general = {
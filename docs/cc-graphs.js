@@ -0,0 +1 @@
+var GRAPHS = {"version": "1.0", "graphs": {"cxn": {"name": "Constructions", "defaultrelation": "SubtypeOf", "nodes": {"cxn": true}, "edges": {"SubtypeOf": true, "ConstituentOf": true, "HeadOf": true}, "positions": {"cxn:action-modification-construction": [-361, 94], "cxn:additive-construction": [-205, -723], "cxn:additive-coordination": [-571, -1368], "cxn:adjectival-phrase": [-343, 179], "cxn:adjective": [-620, 124], "cxn:adjective-modification-construction": [-342, 328], "cxn:admodifier": [-633, -315], "cxn:adverbial-clause-construction": [27, -506], "cxn:adverbial-dependent-clause": [16, -402], "cxn:adverbial-matrix-clause": [108, -452], "cxn:adversative-coordination": [-601, -1140], "cxn:affecting-verb": [1305, 712], "cxn:age-term": [-812, 0], "cxn:agentive-change-of-state-verb": [1080, 912], "cxn:alienable-possession-attributive-phrase": [-849, 942], "cxn:alienable-possession-modification-construction": [-923, 944], "cxn:alternative-question-construction": [-1358, 0], "cxn:amount-term": [-1202, 322], "cxn:anaphoric-article": [-751, -43], "cxn:anaphoric-head-construction": [-290, 166], "cxn:anaphoric-head-relative-clause-construction": [-206, 0], "cxn:anaphoric-pronoun": [-478, 1405], "cxn:anchoring-construction": [-365, 451], "cxn:animal-noun": [112, 1394], "cxn:animal-plant-product-noun": [142, 1472], "cxn:antipassive-construction": [745, -264], "cxn:antipassive-oblique-phrase": [727, -175], "cxn:antonym": [-851, 161], "cxn:apodosis-clause": [-261, -373], "cxn:application-verb": [650, 743], "cxn:applicative-construction": [843, -279], "cxn:applicative-object-phrase": [1008, -231], "cxn:apposition": [70, 274], "cxn:apprehensional-construction": [-190, -674], "cxn:argument-complex-predicate": [196, -1209], "cxn:argument-phrase": [450, -50], "cxn:argument-predicate-part": [103, -1065], "cxn:article": [-850, -223], "cxn:associative-construction": [22, 624], "cxn:attending-verb": [1271, 679], "cxn:attributive-phrase": [-592, 30], "cxn:auxiliary": [97, -1015], "cxn:auxiliary-construction": [202, -1095], "cxn:basic-voice": [663, 195], "cxn:binominal-lexeme": [-672, 737], "cxn:bodily-motion-verb": [841, 705], "cxn:bodily-predicate": [1319, 665], "cxn:body-care-verb": [823, 638], "cxn:body-part-noun": [192, 1442], "cxn:body-position-predicate": [413, -486], "cxn:cardinal-numeral-term": [-717, 241], "cxn:causal-construction": [28, -642], "cxn:causative-construction": [867, -215], "cxn:causee-phrase": [912, -156], "cxn:causer-phrase": [1053, -142], "cxn:chaining-construction": [798, 286], "cxn:change-in-position-verb": [881, 711], "cxn:change-of-state-verb": [932, 779], "cxn:clause": [491, -40], "cxn:cognition-verb": [1338, 624], "cxn:collective-construction": [746, 307], "cxn:color-term": [-861, 53], "cxn:combining-verb": [795, 691], "cxn:commentative-construction": [893, -1184], "cxn:commentative-predicate": [991, -1186], "cxn:common-noun": [75, 1278], "cxn:comparative-conditional-construction": [47, -688], "cxn:comparative-construction": [-233, -685], "cxn:comparative-form": [-780, -450], "cxn:comparative-pronoun": [-356, 1768], "cxn:complement": [291, -383], "cxn:complement-clause-construction": [436, -753], "cxn:complement-matrix-clause": [342, -604], "cxn:complement-taking-predicate": [615, -764], "cxn:complementary": [-805, 167], "cxn:complex-predicate": [261, -959], "cxn:complex-predicate-part": [47, -803], "cxn:complex-sentence": [-79, -597], "cxn:concessive-conditional-construction": [-72, -700], "cxn:concessive-construction": [-135, -677], "cxn:conditional-construction": [-270, -504], "cxn:conditional-pronoun": [-296, 1774], "cxn:conjunctive-coordination": [-502, -1180], "cxn:consecutive-coordination": [-558, -1330], "cxn:construction": [-207, -230], "cxn:contact-by-impact-verb": [746, 712], "cxn:container-term": [-1107, 467], "cxn:controlled-predicate": [397, -527], "cxn:coordinand": [-328, -417], "cxn:coordinate-clause-construction": [-417, -910], "cxn:coordinate-construction": [-361, -573], "cxn:core-argument-phrase": [821, 16], "cxn:damage-verb": [818, 745], "cxn:declarative-construction": [-232, -118], "cxn:declarative-negation-construction": [-503, -23], "cxn:definite-article": [-856, -143], "cxn:definite-pronoun": [-521, 1460], "cxn:demonstrative-attributive": [-637, -91], "cxn:demonstrative-pronoun": [-321, 1397], "cxn:dependent": [-555, -537], "cxn:dependent-clause": [-51, -327], "cxn:depictive-complex-predicate": [411, -1570], "cxn:desiderative-construction": [550, -871], "cxn:desiderative-predicate": [662, -896], "cxn:determiner": [-706, -153], "cxn:dimension-term": [-820, 206], "cxn:direct-negation-pronoun": [-410, 1794], "cxn:discourse-markers": [-326, -261], "cxn:disjunctive-coordination": [-555, -1077], "cxn:distributive-quantifier-term": [-1189, 284], "cxn:ditransitive-a-phrase": [1133, 43], "cxn:ditransitive-construction": [946, 60], "cxn:downtoner": [-756, -481], "cxn:dynamic-predicate-part": [274, -1294], "cxn:element": [-439, -406], "cxn:emotion-verb": [1260, 730], "cxn:entity-central-construction": [288, -1118], "cxn:equational-construction": [-363, -1035], "cxn:equative-construction": [-138, -730], "cxn:evaluative-construction": [758, -1058], "cxn:evaluative-predicate": [873, -1070], "cxn:event-central-construction": [-27, -1160], "cxn:eventive-complex-predicate": [310, -1180], "cxn:eventive-predicate-part": [166, -1134], "cxn:exclamative-construction": [-920, -175], "cxn:exclusive-disjunctive-coordination": [-596, -1200], "cxn:exclusive-pronoun": [-843, 1914], "cxn:exhaustive-list-coordination": [-511, -1090], "cxn:existential-negation-construction": [-623, 68], "cxn:experience-verb": [1293, 622], "cxn:experiencer-phrase": [928, 161], "cxn:experiential-construction": [937, 327], "cxn:experiential-verb": [1130, 592], "cxn:extroverted-verb": [866, 672], "cxn:fearing-construction": [933, -1158], "cxn:fearing-predicate": [1028, -1160], "cxn:figure-phrase": [1080, 168], "cxn:first-person-pronoun": [-743, 1799], "cxn:form-term": [-1044, 521], "cxn:free-choice-pronoun": [-402, 1848], "cxn:free-modification-construction": [-280, 191], "cxn:free-relative-clause-construction": [-234, -3], "cxn:gender-term": [-827, 37], "cxn:generic-article": [-747, -150], "cxn:generic-conditional-construction": [-407, -614], "cxn:generic-pronoun": [-511, 1350], "cxn:ground-phrase": [869, 89], "cxn:group-term": [-1069, 468], "cxn:hanging-topic-construction": [233, 105], "cxn:hanging-topic-phrase": [240, 210], "cxn:head": [-589, -510], "cxn:hoping-construction": [897, -1219], "cxn:hoping-predicate": [991, -1224], "cxn:human-noun": [92, 1473], "cxn:human-propensity-term": [-788, 124], "cxn:human-proper-noun": [-7, 1145], "cxn:identificational-construction": [-317, -867], "cxn:imperative-hortative-construction": [-942, -5], "cxn:inalienable-possession-attributive-phrase": [-808, 979], "cxn:inalienable-possession-modification-construction": [-880, 979], "cxn:inclusive-disjunctive-coordination": [-662, -1132], "cxn:inclusive-pronoun": [-797, 1950], "cxn:inclusory-construction": [-677, 1680], "cxn:indefinite-article": [-844, -175], "cxn:indefinite-pronoun": [-396, 1495], "cxn:indirect-negation-pronoun": [-337, 1807], "cxn:information-question-construction": [-1346, -40], "cxn:information-question-response-construction": [-1322, -154], "cxn:ingestion-verb": [776, 756], "cxn:intensifier": [-800, -410], "cxn:interaction-verb": [873, 633], "cxn:interrogative-complement": [377, -446], "cxn:interrogative-construction": [-1138, -30], "cxn:interrogative-pronoun": [-521, 1396], "cxn:intransitive-construction": [874, 188], "cxn:introverted-verb": [746, 816], "cxn:irrealis-pronoun": [-481, 1766], "cxn:killing-injuring-verb": [728, 764], "cxn:kinship-noun": [203, 1394], "cxn:knowledge-construction": [1007, -895], "cxn:knowledge-predicate": [1091, -912], "cxn:let-alone-construction": [10, -736], "cxn:locational-construction": [770, -958], "cxn:locative-modification-construction": [-747, 707], "cxn:locative-phrase": [-767, 626], "cxn:logophoric-construction": [345, -904], "cxn:main-clause": [-175, -435], "cxn:manipulative-construction": [589, -852], "cxn:manipulative-predicate": [714, -836], "cxn:manner-complex-predicate": [344, -1569], "cxn:manner-of-motion-verb": [674, 791], "cxn:manner-verb": [707, 802], "cxn:material-term": [-875, 85], "cxn:matrix-clause": [46, -383], "cxn:means-construction": [-13, -699], "cxn:measure-term": [-1108, 424], "cxn:measurement": [-815, -465], "cxn:mensural-attributive-phrase": [-702, 283], "cxn:mensural-modification-construction": [-546, 369], "cxn:mensural-term": [-930, 387], "cxn:modification-construction": [-396, 288], "cxn:modifier": [-667, 113], "cxn:motion-construction": [893, 251], "cxn:motion-verb": [888, 470], "cxn:natural-object-noun": [74, 1427], "cxn:negation-construction": [-734, 24], "cxn:negative-circumstantial-construction": [-143, -786], "cxn:negative-question-polarity-response-construction": [-1636, -97], "cxn:nominal-attributive-phrase": [-697, 478], "cxn:nominal-modification-construction": [-651, 589], "cxn:nominal-phrase": [-11, 464], "cxn:non-exhaustive-list-coordination": [-578, -1039], "cxn:nonanaphoric-definite-article": [-706, -106], "cxn:nonbasic-voice": [628, -223], "cxn:nonclausal-coordination": [-497, -709], "cxn:nonpredicational-construction": [-181, -598], "cxn:nonprototypical-construction": [281, -285], "cxn:nonprototypical-predication-construction": [608, -415], "cxn:nonsubject-argument-phrase": [756, -63], "cxn:noun": [-94, 780], "cxn:noun-complement": [-73, -379], "cxn:noun-complement-clause-construction": [-36, -416], "cxn:noun-complement-head": [-77, 169], "cxn:noun-complement-matrix-clause": [4, -225], "cxn:noun-complement-referring-phrase": [-22, 7], "cxn:numeral-attributive-phrase": [-615, 201], "cxn:numeral-modification-construction": [-513, 296], "cxn:object-identity-construction": [-49, -1068], "cxn:object-phrase": [970, -73], "cxn:oblique-phrase": [625, -86], "cxn:ordinal-numeral-term": [-965, 373], "cxn:p-phrase": [1107, -11], "cxn:partitive-construction": [-840, 644], "cxn:partitive-phrase": [-825, 597], "cxn:passive-inverse-a-phrase": [860, -138], "cxn:passive-inverse-p-phrase": [897, -102], "cxn:passive-inverse-voice": [811, -193], "cxn:path-verb": [1015, 562], "cxn:perception-clause": [523, 503], "cxn:perception-complement-clause-construction": [603, -822], "cxn:perception-complement-taking-predicate": [712, -868], "cxn:perception-verb": [603, 620], "cxn:personal-pronoun": [-603, 1581], "cxn:physical-property-term": [-825, 131], "cxn:piece-term": [-961, 567], "cxn:place-noun": [41, 1452], "cxn:place-proper-noun": [-9, 1111], "cxn:plant-noun": [147, 1426], "cxn:polarity-focus-construction": [-408, -1009], "cxn:polarity-question-construction": [-1335, 29], "cxn:polarity-response-construction": [-1453, -113], "cxn:positive-question-polarity-response-construction": [-1631, -148], "cxn:possessed-argument-construction": [663, 127], "cxn:possession-construction": [808, -912], "cxn:possessive-attributive-phrase": [-717, 828], "cxn:possessive-modification-construction": [-799, 825], "cxn:possessive-pronoun": [-571, 1087], "cxn:possessor-argument-phrase": [572, 47], "cxn:pragmatically-nonspecific-article": [-777, -67], "cxn:pragmatically-nonspecific-pronoun": [-350, 1471], "cxn:pragmatically-specific-article": [-771, -98], "cxn:pragmatically-specific-pronoun": [-382, 1444], "cxn:predicate": [297, -412], "cxn:predicate-adjectival-construction": [765, -507], "cxn:predicate-identity-construction": [-96, -1061], "cxn:predicate-nominal-construction": [776, -464], "cxn:predicational-location-construction": [732, -694], "cxn:predicational-possession-construction": [761, -662], "cxn:presentational-construction": [546, -1182], "cxn:presentational-location-construction": [704, -1156], "cxn:presentational-possession-construction": [720, -1110], "cxn:pretense-construction": [982, -944], "cxn:pretense-predicate": [1070, -963], "cxn:prohibitive-construction": [-964, 71], "cxn:pronominal-argument-complex-predicate": [187, -1418], "cxn:pronoun": [-390, 1313], "cxn:proper-noun": [-41, 997], "cxn:property-referring-phrase": [3, 289], "cxn:proportional-quantifier-term": [-1215, 229], "cxn:propositional-attitude-construction": [794, -852], "cxn:propositional-attitude-predicate": [908, -869], "cxn:protasis-clause": [-296, -365], "cxn:prototypical-construction": [59, 240], "cxn:purpose-construction": [-96, -776], "cxn:pursuit-verb": [784, 797], "cxn:quantifier-attributive-phrase": [-770, 203], "cxn:quantifier-modification-construction": [-597, 301], "cxn:quantifier-term": [-1017, 231], "cxn:question-pronoun": [-436, 1754], "cxn:r-phrase": [1077, -14], "cxn:reciprocal-construction": [700, 320], "cxn:reference-tracking-construction": [-19, -895], "cxn:referent-expression": [-162, 265], "cxn:referring-phrase": [-9, 129], "cxn:reflexive-construction": [761, 247], "cxn:relative-clause": [-309, -110], "cxn:relative-clause-construction": [-161, -218], "cxn:relative-clause-head": [62, 147], "cxn:relative-matrix-clause": [-12, -149], "cxn:relativized-referring-phrase": [32, 33], "cxn:removal-verb": [826, 802], "cxn:response-construction": [-1134, -112], "cxn:result-verb": [907, 600], "cxn:resultative-complex-predicate": [381, -1547], "cxn:s-phrase": [1052, 151], "cxn:second-person-pronoun": [-731, 1673], "cxn:semantically-nonspecific-article": [-734, -113], "cxn:semantically-nonspecific-pronoun": [-388, 1655], "cxn:sensation-verb": [1315, 575], "cxn:set-member-attributive-phrase": [-652, 232], "cxn:set-member-modification-construction": [-537, 332], "cxn:set-member-term": [-804, 278], "cxn:shape-term": [-777, 89], "cxn:simple-contrast-coordination": [-695, -1279], "cxn:simple-predicate": [502, 96], "cxn:social-noun": [179, 1364], "cxn:species-term": [-1089, 513], "cxn:specific-known-pronoun": [-446, 1470], "cxn:specific-unknown-pronoun": [-424, 1436], "cxn:speech-act-construction": [-711, -95], "cxn:spontaneous-verb": [693, 717], "cxn:spurious-complex-predicate": [444, -1539], "cxn:stative-complex-predicate": [346, -1371], "cxn:stative-predicate-part": [231, -1335], "cxn:stimulus-phrase": [957, 177], "cxn:subject-identity-construction": [174, -945], "cxn:subject-phrase": [1047, 31], "cxn:subordinate-clause": [-148, -421], "cxn:substitutive-construction": [-180, -757], "cxn:subtractive-construction": [-72, -742], "cxn:superlative-form": [-837, -413], "cxn:support-verb": [143, -1011], "cxn:support-verb-construction": [234, -1112], "cxn:t-phrase": [1076, -51], "cxn:temporal-construction": [-41, -773], "cxn:temporary-predicate": [455, -470], "cxn:thetic-construction": [13, -950], "cxn:third-person-pronoun": [-670, 1733], "cxn:topic-comment-construction": [156, -50], "cxn:topic-phrase": [147, 119], "cxn:transfer-verb": [862, 773], "cxn:transitive-a-phrase": [1148, 84], "cxn:transitive-construction": [960, 104], "cxn:typifying-construction": [-414, 451], "cxn:uncontrolled-predicate": [438, -410], "cxn:unexpected-co-occurrence-coordination": [-736, -1292], "cxn:universal-pronoun": [-305, 1444], "cxn:utterance-construction": [536, -912], "cxn:utterance-predicate": [643, -934], "cxn:vague-numeral-term": [-1229, 274], "cxn:value-term": [-851, 13], "cxn:verb": [696, 592], "cxn:verbal-clause": [437, 314], "cxn:wishing-construction": [864, -1247], "cxn:wishing-predicate": [955, -1253]}}, "str": {"name": "Strategies", "defaultrelation": "SubtypeOf", "nodes": {"str": true}, "edges": {"SubtypeOf": true, "ConstituentOf": true}, "positions": {"str:a-not-a": [-146, -830], "str:absolute-deranking-system": [-810, 1117], "str:absolutive-category": [251, 1995], "str:accusative-alignment": [119, 1927], "str:accusative-category": [77, 2045], "str:action-nominal": [-595, 711], "str:active-alignment": [216, 1532], "str:active-category": [293, 1685], "str:actual-information-packaging-strategy": [355, 1581], "str:adjective-impersonal-strategy": [-208, -479], "str:adjective-personal-strategy": [-426, -696], "str:adjoined-strategy": [-803, -724], "str:adnominal-possessive-strategy": [-234, -846], "str:adposition": [1459, -53], "str:adpositional-personal-strategy": [-138, -686], "str:adpositional-strategy": [-138, -572], "str:adverbial-clause-strategy": [-181, 430], "str:adverbial-strategy": [-114, -849], "str:adverbializer": [1034, -229], "str:affixal-negation": [-249, -760], "str:affixation": [341, -1789], "str:agree-disagree-alignment": [623, 1314], "str:alignment-system": [133, 1303], "str:allative-comparative": [237, -857], "str:alternative-concessive-conditional-strategy": [-311, -639], "str:anchoring-nominal-strategy": [-222, 470], "str:animacy-based-split-ergativity": [460, 1556], "str:anterior-deranking": [-478, 227], "str:anterior-zero": [-10, -1404], "str:antipassive-alignment": [258, 1263], "str:applicative-alignment": [270, 1321], "str:associative-equative": [240, -895], "str:associative-strategy": [-333, -531], "str:asyndetic": [146, -1361], "str:balancing": [-213, 1104], "str:bare-verb-stem": [-105, -716], "str:base-object-inertia": [379, 1378], "str:basic-word-order": [-571, -70], "str:biclausal-reciprocal": [-334, 570], "str:bisyndetic": [904, -89], "str:case-affix": [1334, -56], "str:causative-alignment": [-12, 1468], "str:causative-applicative-co-expression": [-437, 1083], "str:causative-coordinate-strategy": [-307, -714], "str:causative-predicational-strategy": [-194, -825], "str:circumposition": [1587, 9], "str:classifier": [-872, -1301], "str:clause-alignment": [-171, 977], "str:cleft-strategy": [-479, 578], "str:co-expression": [-343, 963], "str:cognate-head-dependent-strategy": [-422, -740], "str:complement-disalignment": [106, 1440], "str:complementizer": [1166, -303], "str:complex-predicate-asc-strategy": [637, -197], "str:compounding": [303, -1684], "str:conditional-deranking": [-745, 1048], "str:conditional-discourse-reference-system": [-726, 1091], "str:conjoined-comparative": [123, -478], "str:conjoined-exceed-comparative": [301, -582], "str:conjunction": [880, -273], "str:contiguity-of-serial-verbs": [-331, -1274], "str:control-based-strategy": [-131, 1564], "str:controller": [-808, -1143], "str:converb": [-619, 672], "str:converb-strategy": [-381, -739], "str:coordinate-clause-strategy": [-379, 654], "str:coordinate-impersonal-strategy": [-304, -827], "str:coordinate-personal-strategy": [-234, -522], "str:coordinator": [1029, -280], "str:copula": [734, -390], "str:copular-participle-strategy": [-379, -597], "str:correlative-strategy": [-789, -806], "str:declarative-marker": [648, -243], "str:definite-article-strategy": [-299, 377], "str:degree-affix": [411, -1911], "str:degree-equative": [368, -693], "str:degree-marker": [449, -1873], "str:degree-modifier": [360, -1928], "str:demonstrative-strategy": [-520, 496], "str:deranking": [-443, 595], "str:derived-case": [104, -579], "str:detached-complement-strategy": [90, 1552], "str:detached-topic-phrase": [-50, -664], "str:differential-object-marking": [480, 1590], "str:direct-object-category": [953, 1615], "str:direct-question-strategy": [-378, 587], "str:direct-report": [-135, 1483], "str:discourse-reference-system": [-694, 1124], "str:ditransitive-alignment": [536, 1456], "str:domain": [-717, -1252], "str:double-coding-strategy": [-97, 1740], "str:double-expression": [-409, -658], "str:double-negation-strategy": [-309, -771], "str:double-oblique-strategy": [-26, 1724], "str:doubling": [-372, -533], "str:dual-role-strategy": [-13, 248], "str:echo-strategy": [-159, -877], "str:ellipsis": [-391, -789], "str:encoding-strategy": [-217, -669], "str:equal-equative": [397, -726], "str:ergative-alignment": [234, 1887], "str:ergative-category": [311, 1999], "str:exceed-comparative": [401, -697], "str:existential-negative-strategy": [-254, 636], "str:experiencer-oriented-strategy": [-129, 1680], "str:experiential-alignment": [-11, 1583], "str:external-possessor-strategy": [-430, 392], "str:externally-headed": [-553, -393], "str:extraposed-strategy": [-574, -245], "str:figure-incorporating": [-258, -812], "str:first-person-plural-strategy": [-153, 545], "str:fixed-case": [212, -782], "str:flagging": [1185, -98], "str:focus-marker": [552, -226], "str:fusion": [-506, -654], "str:gap-strategy": [-739, -308], "str:general-extender": [-72, -623], "str:have-possessive-strategy": [-123, -625], "str:headless": [191, -1356], "str:human-noun-strategy": [-507, 446], "str:hybrid-information-packaging-strategy": [350, 1624], "str:identificational-strategy": [-485, 496], "str:ideophones": [-402, -1002], "str:inactive-category": [239, 1677], "str:inclusory-strategy": [-258, -880], "str:incorporation-of-serial-verbs": [-340, -1226], "str:independent-referring-phrase-strategy": [-232, 391], "str:independent-strategy": [42, -559], "str:index": [-782, -1234], "str:indexation": [-653, -1073], "str:indexation-feature": [-740, -1215], "str:indexed": [528, -127], "str:indirect-object-category": [974, 1567], "str:indirect-report": [-155, 1437], "str:indirective-alignment": [809, 1538], "str:information-packaging-alignment": [263, 1499], "str:insubordination": [-338, 652], "str:internal-possessor-strategy": [-161, 640], "str:internal-recipient-strategy": [-62, 752], "str:internally-headed-strategy": [-797, -766], "str:interrogative-complementizer": [1322, -348], "str:interrogative-pronoun-strategy": [-370, 361], "str:juxtaposition": [243, -1714], "str:linker": [571, -295], "str:locational-possessive-strategy": [-424, 560], "str:locational-strategy": [-188, -554], "str:locative-comparative": [198, -883], "str:locus-of-inflection-of-serial-verbs": [-285, -1232], "str:logophoric-system": [-246, 922], "str:long-distance-reflexive": [-183, -764], "str:mensural-classifier": [-85, -569], "str:merged-argument-structure-strategy": [-310, -493], "str:middle-voice": [-256, 537], "str:monoclausal-transitive-reciprocal-strategy": [-479, 402], "str:monosyndetic": [931, -135], "str:negative-auxiliary-strategy": [-383, 416], "str:negative-fusion": [-698, -642], "str:negative-particle": [-202, -880], "str:neutral-alignment": [161, 1835], "str:neutral-ditransitive-alignment": [684, 1496], "str:nominalizer": [544, -174], "str:nominative-category": [130, 2077], "str:non-externally-headed": [-608, -735], "str:non-indexed": [176, -1313], "str:non-nominative-flag-index": [468, 1168], "str:nonperson-indexation": [-831, -1186], "str:nonspecific-article-strategy": [-507, 544], "str:nonspecific-pronoun-strategy": [-444, 519], "str:nonverbal-copula-strategy": [889, -428], "str:noun-incorporation": [337, 1281], "str:noun-modifying-clause-strategy": [-197, 529], "str:numeral-strategy": [-459, 446], "str:object-equative": [361, -908], "str:oblique-p-strategy": [306, 1349], "str:omitted-a-strategy": [509, 1537], "str:omitted-p-strategy": [326, 1181], "str:ordered-strategy": [84, -828], "str:overt-article": [554, -356], "str:overt-coding": [468, -286], "str:overt-pronoun": [484, -162], "str:overtly-coded-single-role-strategy": [222, -12], "str:overtly-coded-verb": [598, -190], "str:overtly-headed-strategy": [587, -139], "str:partially-merged-argument-structure-strategy": [-169, -503], "str:participial-strategy": [-364, -698], "str:participle": [-556, 741], "str:particle-comparative": [166, -537], "str:particle-equative": [177, -583], "str:passive-inverse-alignment": [366, 1463], "str:perception-verb-strategy": [-209, 588], "str:person-indexation": [-779, -1181], "str:phenomime": [-464, -1189], "str:phonomime": [-491, -1157], "str:polarity-response-alignment": [450, 1308], "str:possessive-locative-strategy": [-353, -830], "str:posterior-deranking": [-455, 217], "str:posterior-zero": [101, -1439], "str:postnominal-strategy": [-542, -238], "str:postposition": [1617, -26], "str:predicational-locative-strategy": [-409, 626], "str:predicational-strategy": [-329, -583], "str:predicativization-possessive-strategy": [-51, -710], "str:prenominal-strategy": [-590, -221], "str:preposition": [1602, -77], "str:primary-object-category": [841, 1720], "str:pronoun-retention-strategy": [-758, -373], "str:prosody": [-47, -760], "str:pseudo-partitive": [-402, 488], "str:psychomime": [-528, -1134], "str:question-marker": [646, -303], "str:quotative-marker": [1338, -303], "str:reciprocal-strategy": [-304, 627], "str:recruitment-strategy": [-312, 469], "str:reference-tracking-system": [-587, 997], "str:reflexive-strategy": [-268, 589], "str:relational-strategy": [842, -180], "str:relative-based-equative": [163, -499], "str:relative-equal-equative": [299, -544], "str:relative-pronoun-strategy": [-723, -351], "str:relative-strategy": [415, -553], "str:relativizer": [1046, -318], "str:repeater": [-1014, -1403], "str:satellite": [-604, -935], "str:satellite-framing-strategy": [-447, -833], "str:scalar-concessive-conditional-strategy": [-245, -591], "str:second-position": [-273, -1278], "str:secondary-object-category": [872, 1673], "str:secundative-alignment": [742, 1602], "str:semantic-information-packaging-strategy": [290, 1617], "str:separative-comparative": [205, -919], "str:serial-verb-strategy": [-271, -1081], "str:simple-strategy": [210, -1562], "str:single-role-strategy": [-42, 235], "str:sortal-classifier": [-973, -1440], "str:special-form": [-427, -619], "str:special-p-strategy": [-371, -646], "str:specialized-dual-role-strategy": [250, -1], "str:split-argument-structure-strategy": [-123, -521], "str:split-structure": [475, 1221], "str:stamp-strategy": [-229, -1244], "str:stimulus-oriented-strategy": [-73, 1699], "str:strategy": [-242, 106], "str:subject-predicate-alignment": [341, 1228], "str:summarizer": [-306, -864], "str:switch-reference-system": [-950, 1205], "str:syndetic": [768, -190], "str:system": [-220, 789], "str:tag": [-82, -818], "str:target": [-833, -1108], "str:tense-iconicity": [-85, -767], "str:thetic-marker": [628, -346], "str:topic-locational-hybrid-possessive-strategy": [-352, -781], "str:topic-marker": [612, -266], "str:topic-possessive-strategy": [-261, -481], "str:transitive-alignment": [146, 1689], "str:transitivity-based-strategy": [-83, 1582], "str:tripartite-alignment": [100, 1821], "str:unique-equative": [387, -868], "str:universal-concessive-conditional-strategy": [-131, -780], "str:universal-pronoun-strategy": [-151, 482], "str:utterance-clause-alignment": [-34, 1394], "str:verb-coding-strategy": [593, -378], "str:verb-framing-strategy": [-285, -541], "str:verbal-copula": [877, -477], "str:verbal-strategy": [35, -1433], "str:with-possessive-strategy": [-404, -567], "str:word-order": [-438, -155], "str:yes-no-alignment": [600, 1357], "str:yes-no-disagree-alignment": [600, 1277], "str:zero-anaphora": [96, -1356], "str:zero-article": [78, -1402], "str:zero-coded-verb": [31, -1387], "str:zero-coding": [39, -1242], "str:zero-copula": [147, -1404]}}, "sem": {"name": "Semantic CCs", "defaultrelation": "SubtypeOf", "nodes": {"sem": true}, "edges": {"SubtypeOf": true, "ConstituentOf": true, "AttributeOf": true, "RoleOf": true}, "positions": {"sem:a-role": [1004, -169], "sem:achievement": [-343, 758], "sem:action-concept": [222, 312], "sem:addition": [-518, -1132], "sem:additive": [-443, -1160], "sem:addressee": [695, -740], "sem:affectee": [842, -722], "sem:affecting": [-744, 1055], "sem:age": [574, 774], "sem:agent": [1024, -386], "sem:agentive-change-of-state-event": [839, 23], "sem:agentive-experience-event": [126, -536], "sem:agentive-ingestion-event": [167, -561], "sem:amount": [419, 558], "sem:animacy": [-36, 592], "sem:animate": [-74, 701], "sem:antecedent-role": [-492, 431], "sem:anterior": [-421, -1099], "sem:apodosis": [-759, -1243], "sem:application-event": [970, -203], "sem:apprehensional": [-446, -892], "sem:arrangement": [767, 802], "sem:arrival": [1363, -153], "sem:aspect": [-298, 616], "sem:atelic": [-157, 1125], "sem:attending": [-795, 1029], "sem:avalent": [413, -17], "sem:base-event": [-562, 679], "sem:beneficiary": [996, -851], "sem:bivalent": [414, -80], "sem:bodily-action": [695, 195], "sem:bodily-motion-event": [976, -124], "sem:body-care-event": [690, 258], "sem:body-part-relation": [819, -974], "sem:body-position-event": [932, -226], "sem:cardinal-numeral": [434, 512], "sem:categorical": [819, 1163], "sem:causal": [-593, -927], "sem:causal-chain": [-424, 508], "sem:causal-chain-profile": [-690, 821], "sem:causal-control": [-682, 786], "sem:causal-cyclicality": [-619, 1084], "sem:causal-directionality": [-653, 896], "sem:causal-directness": [-779, 752], "sem:causal-link": [-730, -1058], "sem:causal-structure": [-438, 622], "sem:causative-event": [-518, 730], "sem:cause": [1068, -588], "sem:caused-motion": [934, -95], "sem:causee": [832, -607], "sem:causer": [1086, -623], "sem:central-participant": [-297, 458], "sem:chaining": [-651, 1256], "sem:change-in-position-event": [954, -268], "sem:change-of-state-event": [660, -48], "sem:change-type": [-266, 924], "sem:co-actor": [661, -603], "sem:cognition-event": [218, -506], "sem:collective": [-617, 1283], "sem:color": [510, 803], "sem:combining-event": [926, -176], "sem:comitative": [843, -641], "sem:commentative-event": [-661, -664], "sem:communication-event": [644, -627], "sem:comparative-conditional-relation": [-368, -1069], "sem:comparative-degree": [1115, 1442], "sem:comparative-relation": [-375, -1281], "sem:comparee": [-396, -1415], "sem:completive": [-480, 1157], "sem:concessive-conditional-relation": [-546, -970], "sem:concessive-relation": [-594, -951], "sem:concomitant-role": [-629, 454], "sem:conditional-relation": [-641, -1070], "sem:consecutive": [-528, -1093], "sem:contact-by-impact-event": [718, 308], "sem:contact-event": [772, 227], "sem:container": [711, 832], "sem:content-causal-relation": [-844, -1181], "sem:contextual": [-585, -27], "sem:continuative": [-429, 1161], "sem:controlled": [-829, 870], "sem:creation-event": [662, 300], "sem:damage-event": [735, 234], "sem:degree": [998, 1295], "sem:deontic-modality": [-1340, 568], "sem:departure": [1361, -249], "sem:dependent-time-reference": [-471, -511], "sem:desiderative-event": [-323, -612], "sem:dimension": [573, 724], "sem:direct-causation": [-963, 789], "sem:directed-change": [-257, 1116], "sem:distal": [-1051, -71], "sem:distributive-quantifier": [396, 500], "sem:downtoning": [1125, 1394], "sem:durative": [-334, 1119], "sem:durativity": [-327, 918], "sem:dynamic": [139, 471], "sem:emotion-event": [210, -581], "sem:endpoint": [-373, 562], "sem:entity": [-269, -68], "sem:epistemic-causal-relation": [-877, -1156], "sem:epistemic-modality": [-1372, 659], "sem:epistemic-stance": [-476, -784], "sem:equative-relation": [-399, -1285], "sem:evaluative-event": [-504, -594], "sem:event": [152, 2], "sem:event-oriented": [-600, -1471], "sem:event-relation": [-429, -960], "sem:eventive-participant-event": [-225, -417], "sem:eventive-perception-event": [-192, -490], "sem:evidentiality": [-1260, 610], "sem:exclusive-disjunction": [-502, -1167], "sem:exhaustive-list": [-590, -1032], "sem:existence-event": [751, 175], "sem:experience": [-747, 1014], "sem:experiencer": [469, -522], "sem:experiential-event": [189, -424], "sem:expertum": [365, -404], "sem:external-cause": [901, -539], "sem:extroverted": [-731, 1259], "sem:fearing-event": [-695, -618], "sem:figure": [786, -358], "sem:figure-ground-spatial-relation": [999, -225], "sem:first-person": [-387, 251], "sem:force": [1057, -672], "sem:future-oriented": [-1503, 574], "sem:gender-class": [473, 779], "sem:generic-conditional-relation": [-723, -1244], "sem:gradable-predicative-scale": [-375, -1440], "sem:gradient": [865, 1134], "sem:ground": [675, -271], "sem:group": [784, 704], "sem:hearer": [-218, 287], "sem:hoping-event": [-657, -611], "sem:human": [-11, 682], "sem:human-propensity": [430, 801], "sem:hypothetical": [-759, -848], "sem:identity": [-540, -124], "sem:inanimate": [-103, 631], "sem:inceptive": [-456, 1121], "sem:inclusive-disjunction": [-294, -1093], "sem:independent-time-reference": [-468, -643], "sem:indirect-causation": [-972, 837], "sem:ingestion-event": [247, -545], "sem:initiator": [-409, 568], "sem:instrument": [1033, -642], "sem:intensifying": [1137, 1353], "sem:interaction-event": [546, -581], "sem:introverted": [-697, 1230], "sem:killing-injuring-event": [758, 280], "sem:kinship-relation": [734, -1020], "sem:knowledge-event": [-561, -529], "sem:less-affected-p": [1139, 53], "sem:less-individuated-p": [1151, 5], "sem:let-alone-relation": [-347, -1032], "sem:maleficiary": [961, -882], "sem:manipulative-event": [-332, -632], "sem:manner": [123, -77], "sem:manner-of-motion-event": [1376, -190], "sem:manner-profile": [-854, 915], "sem:material": [386, 805], "sem:meaning": [-327, -163], "sem:means": [-405, -879], "sem:measure": [799, 748], "sem:measuring": [1037, 1450], "sem:mensural-concept": [604, 665], "sem:mental-space": [-925, 415], "sem:message": [734, -622], "sem:mirative": [-1085, 384], "sem:modality": [-1119, 565], "sem:monovalent": [239, -34], "sem:motion-event": [1196, -207], "sem:necessary-participant-sharing": [-364, -620], "sem:negative-circumstantial": [-519, -893], "sem:negative-epistemic-stance": [-937, -869], "sem:negative-polarity": [-1216, 460], "sem:neutral-epistemic-stance": [-923, -917], "sem:non-exhaustive-list": [-389, -1132], "sem:nonrelational": [-3, 276], "sem:number": [-386, -52], "sem:numeral": [538, 498], "sem:object-concept": [14, 397], "sem:objective": [-1512, 738], "sem:occupant": [584, -716], "sem:ordinal-numeral": [605, 563], "sem:orientation": [-526, -1292], "sem:other": [-172, 304], "sem:ownership": [773, -1036], "sem:p-role": [976, -15], "sem:part-whole-relation": [804, -1010], "sem:participant-oriented": [-559, -1494], "sem:participant-role": [-152, 250], "sem:passing": [1357, -289], "sem:path-event": [1391, -226], "sem:patient": [732, -128], "sem:perception-event": [-186, -596], "sem:peripheral-participant": [-338, 344], "sem:persistent": [184, 571], "sem:person": [7, 546], "sem:person-deixis": [-489, 132], "sem:phasal-aspect": [-426, 975], "sem:physical-property": [483, 843], "sem:piece": [760, 752], "sem:place": [-71, 516], "sem:polarity": [-1043, 497], "sem:positive-epistemic-stance": [-624, -813], "sem:positive-polarity": [-1208, 508], "sem:possession": [700, -837], "sem:possessor": [723, -692], "sem:possessum": [757, -718], "sem:posterior": [-337, -1112], "sem:pretense-event": [-573, -589], "sem:property-concept": [428, 645], "sem:proportional-quantifier": [390, 549], "sem:proposition": [-596, 276], "sem:propositional-attitude-event": [-428, -575], "sem:propositional-content": [-226, 148], "sem:protasis": [-781, -1211], "sem:proximal": [-1056, -123], "sem:punctual": [-338, 1073], "sem:purpose": [-486, -876], "sem:pursuit-event": [907, -276], "sem:qualitative-event": [587, 192], "sem:quantitative-relation": [401, 409], "sem:quantity": [-406, -104], "sem:recipient": [629, -753], "sem:reciprocal": [-682, 1287], "sem:reference-point": [544, 823], "sem:reflexive": [-745, 1217], "sem:relational": [231, 379], "sem:relationality": [-25, 163], "sem:removal-event": [912, -133], "sem:result-profile": [-842, 956], "sem:s-role": [700, -287], "sem:scalar-model": [-431, -1044], "sem:scale": [743, 1018], "sem:second-person": [-399, 202], "sem:semantic-role": [539, -357], "sem:sensation-event": [118, -481], "sem:set-member": [467, 537], "sem:shape": [436, 840], "sem:simple-contrast": [-277, -1051], "sem:simultaneous": [-331, -1144], "sem:social-event": [482, -480], "sem:social-role": [571, -500], "sem:social-role-event": [531, -615], "sem:sociative-causation": [-935, 849], "sem:spatial-deixis": [-885, -72], "sem:spatial-event": [789, -168], "sem:speaker": [-207, 338], "sem:species": [730, 791], "sem:speech-act-causal-relation": [-883, -1113], "sem:spontaneous": [-816, 829], "sem:standard": [-337, -1423], "sem:state": [410, 352], "sem:stative": [316, 536], "sem:stativity": [31, 599], "sem:stimulus": [427, -480], "sem:subjective": [-1526, 687], "sem:subsequent-role": [-301, 395], "sem:substitution": [-570, -1105], "sem:substitutive": [-393, -1174], "sem:subtraction": [-549, -1051], "sem:subtractive": [-489, -1071], "sem:superlative-degree": [1075, 1418], "sem:tamp": [-782, 563], "sem:telic": [-140, 1080], "sem:telicity": [-206, 920], "sem:tense": [-930, 516], "sem:terminative": [-530, 1123], "sem:theme": [664, -664], "sem:thing": [-67, 575], "sem:third-person": [-349, 208], "sem:time": [-363, -124], "sem:time-reference": [-376, -579], "sem:time-stability": [60, 736], "sem:token": [-699, -176], "sem:topic": [764, -622], "sem:transfer-of-possession-event": [563, -658], "sem:transitoriness": [47, 634], "sem:transitory": [338, 556], "sem:trivalent": [364, -127], "sem:type": [-705, -127], "sem:uncontrolled": [-774, 905], "sem:undergoer": [682, -498], "sem:undirected-change": [-224, 1093], "sem:unexpected-co-occurrence": [-465, -1123], "sem:utterance-event": [-346, -598], "sem:vague-numeral": [355, 494], "sem:valency": [314, -45], "sem:value": [532, 756], "sem:weather-event": [702, 141], "sem:wishing-event": [-675, -562]}}, "inf": {"name": "Information packaging", "defaultrelation": "SubtypeOf", "nodes": {"inf": true}, "edges": {"SubtypeOf": true, "ConstituentOf": true, "AttributeOf": true}, "positions": {"inf:aboutness": [29, 8], "inf:accessibility": [-324, 339], "inf:active-referent": [-281, 318], "inf:actor": [-4, 349], "inf:admodification": [25, 155], "inf:alternative-proposition": [270, 32], "inf:alternative-question": [321, -577], "inf:anchor": [196, 587], "inf:announcement": [684, 503], "inf:appositive-modification": [29, 723], "inf:background-description": [725, 518], "inf:choosing-contrast": [694, 78], "inf:comparative-referent": [-647, -31], "inf:complementative": [127, 710], "inf:complex-figure": [165, -79], "inf:conditional-referent": [-664, 19], "inf:contrast": [576, -134], "inf:coreference": [-299, -181], "inf:counterpresuppositional-contrast": [599, 12], "inf:declarative": [236, -15], "inf:different-subject": [-685, -413], "inf:direct-negation-referent": [-686, -57], "inf:discourse-coherence": [-49, -175], "inf:discourse-connection": [61, -95], "inf:discourse-deixis": [-278, 261], "inf:discourse-structure": [-9, -26], "inf:entity-central": [534, 281], "inf:equational": [492, -392], "inf:event-central": [604, 410], "inf:exclamative": [195, -363], "inf:expanding-contrast": [764, 21], "inf:explanation": [649, 544], "inf:figure-ground": [117, 18], "inf:focus": [193, -59], "inf:free-choice-referent": [-588, -165], "inf:generic-referent": [-192, 248], "inf:high-accessibility": [-323, 443], "inf:high-topicality": [-267, -412], "inf:highest-topicality": [-310, -567], "inf:identifiability": [-429, 146], "inf:identificational": [340, -126], "inf:identity-known": [-367, 250], "inf:identity-unknown": [-472, 216], "inf:imperative-hortative": [142, -444], "inf:inactive-referent": [-324, 209], "inf:indirect-negation-referent": [-683, -120], "inf:inferrable-referent": [-297, 233], "inf:information-gap": [375, -329], "inf:information-packaging": [10, -149], "inf:information-question": [271, -581], "inf:information-question-response": [449, -540], "inf:information-status": [-243, 127], "inf:interrogative": [284, -442], "inf:interrogative-unit": [-385, 182], "inf:interruption": [737, 454], "inf:irrealis-referent": [-638, -159], "inf:link": [-195, 39], "inf:listing-contrast": [888, -279], "inf:logophoric-subject-identity": [-594, -507], "inf:low-accessibility": [-328, 304], "inf:low-topicality": [-172, -340], "inf:major-propositional-act": [-41, 141], "inf:medium-accessibility": [-409, 411], "inf:mid-topicality": [-256, -310], "inf:modification": [0, 304], "inf:negative-question-polarity-response": [487, -784], "inf:non-high-topicality": [-213, -335], "inf:non-low-topicality": [-271, -347], "inf:nonspecific-referent": [-538, -32], "inf:nonverbal-contrast": [851, -319], "inf:object-identity": [-639, -487], "inf:parallel-contrast": [771, -226], "inf:polarity-question": [361, -538], "inf:polarity-response": [452, -652], "inf:poset": [-143, -27], "inf:positive-question-polarity-response": [542, -756], "inf:pragmatic-assertion": [191, 56], "inf:pragmatic-presupposition": [45, 100], "inf:pragmatically-specific-referent": [-379, 142], "inf:predicate-identity": [-714, -42], "inf:predication": [94, 130], "inf:presentational": [644, 332], "inf:presupposed-open-proposition": [157, -25], "inf:prohibitive": [129, -584], "inf:prop": [-53, 367], "inf:question-referent": [-640, -102], "inf:reference": [-226, 142], "inf:referent-type-identity": [-733, -108], "inf:rejecting-contrast": [726, -44], "inf:replacing-contrast": [724, 10], "inf:response": [347, -447], "inf:restricting-contrast": [740, 81], "inf:restrictive-modification": [80, 725], "inf:same-subject": [-672, -458], "inf:selecting": [52, 438], "inf:semantically-specific-referent": [-441, 309], "inf:semi-active-referent": [-360, 291], "inf:setting": [-98, 359], "inf:situating": [115, 470], "inf:specific-known-referent": [-530, 449], "inf:specific-unknown-referent": [-570, 407], "inf:speech-acts": [159, -255], "inf:subcategorizing": [54, 581], "inf:theater-metaphor": [-72, 216], "inf:thetic": [397, 193], "inf:token-identity": [-542, -377], "inf:topic-comment": [11, 77], "inf:topicality": [-200, -195], "inf:trigger": [-236, 18], "inf:type-identifiable": [-550, 79], "inf:type-identity": [-555, -124], "inf:verbal-contrast": [903, -227]}}, "cxn_str": {"name": "Cxn \u2194\ufe0e Strategies", "defaultrelation": "ExpressionOf", "nodes": {"cxn": true, "str": true}, "edges": {"SubtypeOf": true, "ExpressionOf": true, "ModeledOn": true, "RecruitedFrom": true, "ConstituentOf": true, "HeadOf": true}, "positions": {"cxn:action-modification-construction": [-681, -602], "cxn:additive-construction": [95, -931], "cxn:additive-coordination": [-578, -1515], "cxn:adjectival-phrase": [-759, 102], "cxn:adjective": [-1115, 288], "cxn:adjective-modification-construction": [-755, -209], "cxn:admodifier": [-662, -662], "cxn:adverbial-clause-construction": [10, -586], "cxn:adverbial-dependent-clause": [-46, -650], "cxn:adverbial-matrix-clause": [-127, -708], "cxn:adversative-coordination": [-377, -1225], "cxn:affecting-verb": [77, 1805], "cxn:age-term": [-1365, 428], "cxn:agentive-change-of-state-verb": [-384, 1728], "cxn:alienable-possession-attributive-phrase": [-1620, -440], "cxn:alienable-possession-modification-construction": [-1638, -586], "cxn:alternative-question-construction": [779, 117], "cxn:amount-term": [-1577, -489], "cxn:anaphoric-article": [-975, -168], "cxn:anaphoric-head-construction": [-446, -568], "cxn:anaphoric-head-relative-clause-construction": [-435, -699], "cxn:anaphoric-pronoun": [-615, 199], "cxn:anchoring-construction": [-673, -348], "cxn:animal-noun": [-1279, 1051], "cxn:animal-plant-product-noun": [-1360, 1072], "cxn:antipassive-construction": [672, 517], "cxn:antipassive-oblique-phrase": [558, 605], "cxn:antonym": [-1380, 330], "cxn:apodosis-clause": [-363, -369], "cxn:application-verb": [-195, 1459], "cxn:applicative-construction": [731, 542], "cxn:applicative-object-phrase": [738, 779], "cxn:apposition": [-599, -8], "cxn:apprehensional-construction": [154, -917], "cxn:argument-complex-predicate": [0, 87], "cxn:argument-phrase": [153, 275], "cxn:argument-predicate-part": [-171, 125], "cxn:article": [-680, -219], "cxn:associative-construction": [-299, 100], "cxn:attending-verb": [101, 1833], "cxn:attributive-phrase": [-799, -299], "cxn:auxiliary": [-123, 302], "cxn:auxiliary-construction": [62, 317], "cxn:basic-voice": [255, 559], "cxn:binominal-lexeme": [-1267, -722], "cxn:bodily-motion-verb": [-230, 1451], "cxn:bodily-predicate": [153, 1786], "cxn:body-care-verb": [-118, 1399], "cxn:body-part-noun": [-1319, 1104], "cxn:body-position-predicate": [-35, 476], "cxn:cardinal-numeral-term": [-902, -21], "cxn:causal-construction": [125, -928], "cxn:causative-construction": [714, 605], "cxn:causee-phrase": [631, 752], "cxn:causer-phrase": [723, 868], "cxn:chaining-construction": [33, 566], "cxn:change-in-position-verb": [-319, 1329], "cxn:change-of-state-verb": [-313, 1499], "cxn:clause": [80, -15], "cxn:cognition-verb": [126, 1811], "cxn:collective-construction": [8, 615], "cxn:color-term": [-1322, 362], "cxn:combining-verb": [-202, 1426], "cxn:commentative-construction": [1218, -966], "cxn:commentative-predicate": [1254, -855], "cxn:common-noun": [-1160, 914], "cxn:comparative-conditional-construction": [166, -949], "cxn:comparative-construction": [200, -903], "cxn:comparative-form": [-823, -874], "cxn:comparative-pronoun": [-1111, 817], "cxn:complement": [196, -286], "cxn:complement-clause-construction": [559, -603], "cxn:complement-matrix-clause": [305, -549], "cxn:complement-taking-predicate": [605, -414], "cxn:complementary": [-1398, 290], "cxn:complex-predicate": [225, 124], "cxn:complex-predicate-part": [-57, 100], "cxn:complex-sentence": [62, -664], "cxn:concessive-conditional-construction": [82, -434], "cxn:concessive-construction": [-95, -493], "cxn:conditional-construction": [-213, -505], "cxn:conditional-pronoun": [-1178, 799], "cxn:conjunctive-coordination": [-432, -1249], "cxn:consecutive-coordination": [-539, -1507], "cxn:construction": [-225, -204], "cxn:contact-by-impact-verb": [-249, 1424], "cxn:container-term": [-1596, -277], "cxn:controlled-predicate": [-70, 500], "cxn:coordinand": [-338, -446], "cxn:coordinate-clause-construction": [-209, -798], "cxn:coordinate-construction": [-231, -634], "cxn:core-argument-phrase": [394, 758], "cxn:damage-verb": [-364, 1343], "cxn:declarative-construction": [43, 131], "cxn:declarative-negation-construction": [140, 94], "cxn:definite-article": [-836, -90], "cxn:definite-pronoun": [-783, 422], "cxn:demonstrative-attributive": [-1001, -359], "cxn:demonstrative-pronoun": [-811, 429], "cxn:dependent": [-885, 74], "cxn:dependent-clause": [-137, -483], "cxn:depictive-complex-predicate": [969, -92], "cxn:desiderative-construction": [787, -701], "cxn:desiderative-predicate": [827, -562], "cxn:determiner": [-893, -305], "cxn:dimension-term": [-1407, 336], "cxn:direct-negation-pronoun": [-1204, 711], "cxn:discourse-markers": [-447, -212], "cxn:disjunctive-coordination": [-225, -1120], "cxn:distributive-quantifier-term": [-1561, -456], "cxn:ditransitive-a-phrase": [525, 1041], "cxn:ditransitive-construction": [454, 805], "cxn:downtoner": [-851, -838], "cxn:dynamic-predicate-part": [425, 105], "cxn:element": [-640, -14], "cxn:emotion-verb": [198, 1810], "cxn:entity-central-construction": [359, 454], "cxn:equational-construction": [80, 540], "cxn:equative-construction": [400, -916], "cxn:evaluative-construction": [1015, -833], "cxn:evaluative-predicate": [1046, -703], "cxn:event-central-construction": [665, 605], "cxn:eventive-complex-predicate": [239, 308], "cxn:eventive-predicate-part": [187, 150], "cxn:exclamative-construction": [532, 60], "cxn:exclusive-disjunctive-coordination": [-133, -1177], "cxn:exclusive-pronoun": [-872, 1093], "cxn:exhaustive-list-coordination": [-39, -909], "cxn:existential-negation-construction": [87, 144], "cxn:experience-verb": [214, 1780], "cxn:experiencer-phrase": [422, 1037], "cxn:experiential-construction": [329, 1068], "cxn:experiential-verb": [119, 1570], "cxn:extroverted-verb": [-147, 1446], "cxn:fearing-construction": [1228, -934], "cxn:fearing-predicate": [1258, -824], "cxn:figure-phrase": [406, 787], "cxn:first-person-pronoun": [-769, 858], "cxn:form-term": [-1581, -235], "cxn:free-choice-pronoun": [-1225, 784], "cxn:free-modification-construction": [-449, -604], "cxn:free-relative-clause-construction": [-424, -752], "cxn:gender-term": [-1346, 320], "cxn:generic-article": [-725, -67], "cxn:generic-conditional-construction": [-368, -717], "cxn:generic-pronoun": [-748, 552], "cxn:ground-phrase": [379, 702], "cxn:group-term": [-1557, -278], "cxn:hanging-topic-construction": [-354, 301], "cxn:hanging-topic-phrase": [-482, 346], "cxn:head": [-866, 111], "cxn:hoping-construction": [1183, -969], "cxn:hoping-predicate": [1223, -867], "cxn:human-noun": [-884, 735], "cxn:human-propensity-term": [-1345, 397], "cxn:human-proper-noun": [-1129, 1049], "cxn:identificational-construction": [198, 350], "cxn:imperative-hortative-construction": [105, -94], "cxn:inalienable-possession-attributive-phrase": [-1645, -405], "cxn:inalienable-possession-modification-construction": [-1665, -546], "cxn:inclusive-disjunctive-coordination": [-135, -1231], "cxn:inclusive-pronoun": [-900, 1068], "cxn:inclusory-construction": [-415, 368], "cxn:indefinite-article": [-912, -188], "cxn:indefinite-pronoun": [-1035, 513], "cxn:indirect-negation-pronoun": [-1149, 748], "cxn:information-question-construction": [788, 80], "cxn:information-question-response-construction": [722, 179], "cxn:ingestion-verb": [-235, 1382], "cxn:intensifier": [-889, -811], "cxn:interaction-verb": [-194, 1373], "cxn:interrogative-complement": [288, -312], "cxn:interrogative-construction": [490, 42], "cxn:interrogative-pronoun": [-839, 468], "cxn:intransitive-construction": [440, 631], "cxn:introverted-verb": [-153, 1377], "cxn:irrealis-pronoun": [-1208, 750], "cxn:killing-injuring-verb": [-291, 1433], "cxn:kinship-noun": [-1327, 1047], "cxn:knowledge-construction": [1013, -1061], "cxn:knowledge-predicate": [1042, -961], "cxn:let-alone-construction": [-38, -934], "cxn:locational-construction": [352, 524], "cxn:locative-modification-construction": [-1298, -673], "cxn:locative-phrase": [-1346, -594], "cxn:logophoric-construction": [489, -540], "cxn:main-clause": [269, -375], "cxn:manipulative-construction": [742, -770], "cxn:manipulative-predicate": [750, -630], "cxn:manner-complex-predicate": [975, -121], "cxn:manner-of-motion-verb": [-282, 1395], "cxn:manner-verb": [-321, 1403], "cxn:material-term": [-1358, 273], "cxn:matrix-clause": [-113, -517], "cxn:means-construction": [114, -971], "cxn:measure-term": [-1557, -342], "cxn:measurement": [-880, -853], "cxn:mensural-attributive-phrase": [-959, -324], "cxn:mensural-modification-construction": [-570, -310], "cxn:mensural-term": [-1339, -271], "cxn:modification-construction": [-582, -487], "cxn:modifier": [-932, -165], "cxn:motion-construction": [321, 469], "cxn:motion-verb": [95, 940], "cxn:natural-object-noun": [-1354, 1020], "cxn:negation-construction": [225, 89], "cxn:negative-circumstantial-construction": [4, -926], "cxn:negative-question-polarity-response-construction": [1245, 146], "cxn:nominal-attributive-phrase": [-1169, -423], "cxn:nominal-modification-construction": [-1086, -546], "cxn:nominal-phrase": [-504, 253], "cxn:non-exhaustive-list-coordination": [-40, -963], "cxn:nonanaphoric-definite-article": [-984, -196], "cxn:nonbasic-voice": [472, 352], "cxn:nonclausal-coordination": [-391, -905], "cxn:nonpredicational-construction": [285, 317], "cxn:nonprototypical-construction": [171, 237], "cxn:nonprototypical-predication-construction": [405, 109], "cxn:nonsubject-argument-phrase": [435, 608], "cxn:noun": [-765, 492], "cxn:noun-complement": [-295, -643], "cxn:noun-complement-clause-construction": [-214, -535], "cxn:noun-complement-head": [-723, -144], "cxn:noun-complement-matrix-clause": [-388, -451], "cxn:noun-complement-referring-phrase": [-555, -234], "cxn:numeral-attributive-phrase": [-946, -266], "cxn:numeral-modification-construction": [-848, -459], "cxn:object-identity-construction": [190, -470], "cxn:object-phrase": [559, 856], "cxn:oblique-phrase": [370, 511], "cxn:ordinal-numeral-term": [-1363, -455], "cxn:p-phrase": [645, 872], "cxn:partitive-construction": [-1026, -313], "cxn:partitive-phrase": [-1237, -412], "cxn:passive-inverse-a-phrase": [627, 622], "cxn:passive-inverse-p-phrase": [612, 699], "cxn:passive-inverse-voice": [685, 443], "cxn:path-verb": [64, 1226], "cxn:perception-clause": [-218, 778], "cxn:perception-complement-clause-construction": [765, -739], "cxn:perception-complement-taking-predicate": [802, -601], "cxn:perception-verb": [-250, 1041], "cxn:personal-pronoun": [-754, 622], "cxn:physical-property-term": [-1384, 367], "cxn:piece-term": [-1273, -327], "cxn:place-noun": [-1273, 1087], "cxn:place-proper-noun": [-1105, 1040], "cxn:plant-noun": [-1383, 1005], "cxn:polarity-focus-construction": [254, 623], "cxn:polarity-question-construction": [748, -16], "cxn:polarity-response-construction": [1013, 44], "cxn:positive-question-polarity-response-construction": [1240, 169], "cxn:possessed-argument-construction": [108, 699], "cxn:possession-construction": [705, 125], "cxn:possessive-attributive-phrase": [-1412, -290], "cxn:possessive-modification-construction": [-1440, -524], "cxn:possessive-pronoun": [-1221, 90], "cxn:possessor-argument-phrase": [160, 574], "cxn:pragmatically-nonspecific-article": [-1021, -239], "cxn:pragmatically-nonspecific-pronoun": [-1138, 510], "cxn:pragmatically-specific-article": [-1021, -271], "cxn:pragmatically-specific-pronoun": [-843, 385], "cxn:predicate": [65, 190], "cxn:predicate-adjectival-construction": [649, 214], "cxn:predicate-identity-construction": [184, -494], "cxn:predicate-nominal-construction": [633, 247], "cxn:predicational-location-construction": [313, 363], "cxn:predicational-possession-construction": [697, 204], "cxn:presentational-construction": [129, 308], "cxn:presentational-location-construction": [257, 320], "cxn:presentational-possession-construction": [425, 44], "cxn:pretense-construction": [1034, -1025], "cxn:pretense-predicate": [1047, -919], "cxn:prohibitive-construction": [204, 9], "cxn:pronominal-argument-complex-predicate": [-218, 170], "cxn:pronoun": [-937, 432], "cxn:proper-noun": [-988, 841], "cxn:property-referring-phrase": [-609, 20], "cxn:proportional-quantifier-term": [-1553, -516], "cxn:propositional-attitude-construction": [860, -876], "cxn:propositional-attitude-predicate": [886, -746], "cxn:protasis-clause": [-338, -373], "cxn:prototypical-construction": [-336, 397], "cxn:purpose-construction": [71, -901], "cxn:pursuit-verb": [-157, 1419], "cxn:quantifier-attributive-phrase": [-1075, -428], "cxn:quantifier-modification-construction": [-890, -531], "cxn:quantifier-term": [-1332, -403], "cxn:question-pronoun": [-1145, 798], "cxn:r-phrase": [581, 1001], "cxn:reciprocal-construction": [5, 290], "cxn:reference-tracking-construction": [364, -610], "cxn:referent-expression": [-575, -34], "cxn:referring-phrase": [-380, -37], "cxn:reflexive-construction": [40, 528], "cxn:relative-clause": [-474, -522], "cxn:relative-clause-construction": [-211, -588], "cxn:relative-clause-head": [-575, -150], "cxn:relative-matrix-clause": [-372, -490], "cxn:relativized-referring-phrase": [-499, -269], "cxn:removal-verb": [-258, 1351], "cxn:response-construction": [697, 41], "cxn:result-verb": [-55, 1339], "cxn:resultative-complex-predicate": [969, -169], "cxn:s-phrase": [493, 883], "cxn:second-person-pronoun": [-851, 818], "cxn:semantically-nonspecific-article": [-793, -61], "cxn:semantically-nonspecific-pronoun": [-996, 643], "cxn:sensation-verb": [163, 1830], "cxn:set-member-attributive-phrase": [-1005, -441], "cxn:set-member-modification-construction": [-857, -557], "cxn:set-member-term": [-1167, -346], "cxn:shape-term": [-1385, 397], "cxn:simple-contrast-coordination": [-445, -1474], "cxn:simple-predicate": [-75, 724], "cxn:social-noun": [-1263, 1122], "cxn:species-term": [-1582, -316], "cxn:specific-known-pronoun": [-1123, 562], "cxn:specific-unknown-pronoun": [-1119, 529], "cxn:speech-act-construction": [299, -24], "cxn:spontaneous-verb": [-349, 1377], "cxn:spurious-complex-predicate": [994, -160], "cxn:stative-complex-predicate": [684, -135], "cxn:stative-predicate-part": [481, 49], "cxn:stimulus-phrase": [394, 1040], "cxn:subject-identity-construction": [255, -483], "cxn:subject-phrase": [536, 928], "cxn:subordinate-clause": [-107, -370], "cxn:substitutive-construction": [69, -954], "cxn:subtractive-construction": [40, -921], "cxn:superlative-form": [-854, -892], "cxn:support-verb": [-136, 250], "cxn:support-verb-construction": [41, 223], "cxn:t-phrase": [549, 1009], "cxn:temporal-construction": [30, -959], "cxn:temporary-predicate": [-116, 442], "cxn:thetic-construction": [490, 393], "cxn:third-person-pronoun": [-886, 817], "cxn:topic-comment-construction": [-141, 147], "cxn:topic-phrase": [-386, 180], "cxn:transfer-verb": [-300, 1362], "cxn:transitive-a-phrase": [622, 904], "cxn:transitive-construction": [565, 645], "cxn:typifying-construction": [-683, -325], "cxn:uncontrolled-predicate": [-76, 461], "cxn:unexpected-co-occurrence-coordination": [-490, -1464], "cxn:universal-pronoun": [-870, 550], "cxn:utterance-construction": [781, -609], "cxn:utterance-predicate": [792, -543], "cxn:vague-numeral-term": [-1533, -548], "cxn:value-term": [-1319, 429], "cxn:verb": [-192, 1180], "cxn:verbal-clause": [-144, 590], "cxn:wishing-construction": [1244, -906], "cxn:wishing-predicate": [1276, -797], "str:a-not-a": [651, -165], "str:absolute-deranking-system": [742, -715], "str:absolutive-category": [1424, 1149], "str:accusative-alignment": [1283, 1000], "str:accusative-category": [1500, 1151], "str:action-nominal": [87, -517], "str:active-alignment": [746, 689], "str:active-category": [958, 857], "str:actual-information-packaging-strategy": [227, 479], "str:adjective-impersonal-strategy": [599, -206], "str:adjective-personal-strategy": [641, -257], "str:adjoined-strategy": [-265, -521], "str:adnominal-possessive-strategy": [518, -133], "str:adposition": [-397, -1079], "str:adpositional-personal-strategy": [639, -302], "str:adpositional-strategy": [566, -212], "str:adverbial-clause-strategy": [-127, -280], "str:adverbial-strategy": [569, -278], "str:adverbializer": [9, -800], "str:affixal-negation": [267, -80], "str:affixation": [-562, -755], "str:agree-disagree-alignment": [1457, 317], "str:alignment-system": [678, 363], "str:allative-comparative": [381, -982], "str:alternative-concessive-conditional-strategy": [267, -419], "str:anchoring-nominal-strategy": [-529, -98], "str:animacy-based-split-ergativity": [1153, 617], "str:anterior-deranking": [-42, -742], "str:anterior-zero": [126, -479], "str:antipassive-alignment": [820, 588], "str:applicative-alignment": [686, 592], "str:associative-equative": [527, -960], "str:associative-strategy": [1, -84], "str:asyndetic": [1, -603], "str:balancing": [420, -325], "str:bare-verb-stem": [225, -231], "str:base-object-inertia": [935, 702], "str:basic-word-order": [113, -336], "str:biclausal-reciprocal": [-167, -184], "str:bisyndetic": [-277, -805], "str:case-affix": [-320, -871], "str:causative-alignment": [625, 656], "str:causative-applicative-co-expression": [879, 440], "str:causative-coordinate-strategy": [558, -248], "str:causative-predicational-strategy": [589, -319], "str:circumposition": [-478, -1333], "str:classifier": [-429, -719], "str:clause-alignment": [274, -181], "str:cleft-strategy": [-46, 393], "str:co-expression": [852, 186], "str:cognate-head-dependent-strategy": [170, -97], "str:complement-disalignment": [610, -172], "str:complementizer": [398, -738], "str:complex-predicate-asc-strategy": [-25, -144], "str:compounding": [-617, -643], "str:conditional-deranking": [855, -591], "str:conditional-discourse-reference-system": [862, -628], "str:conjoined-comparative": [405, -862], "str:conjoined-exceed-comparative": [356, -885], "str:conjunction": [38, -663], "str:contiguity-of-serial-verbs": [101, 403], "str:control-based-strategy": [788, 863], "str:controller": [-48, -1011], "str:converb": [-44, -784], "str:converb-strategy": [610, -278], "str:coordinate-clause-strategy": [-179, -339], "str:coordinate-impersonal-strategy": [656, -277], "str:coordinate-personal-strategy": [596, -259], "str:coordinator": [-144, -821], "str:copula": [363, -69], "str:copular-participle-strategy": [630, -229], "str:correlative-strategy": [-276, -443], "str:declarative-marker": [-41, -54], "str:definite-article-strategy": [-587, 72], "str:degree-affix": [-708, -713], "str:degree-equative": [459, -931], "str:degree-marker": [-307, -846], "str:degree-modifier": [-725, -857], "str:demonstrative-strategy": [-563, 330], "str:deranking": [22, -565], "str:derived-case": [440, -702], "str:detached-complement-strategy": [880, -264], "str:detached-topic-phrase": [90, -64], "str:differential-object-marking": [1162, 641], "str:direct-object-category": [1521, 903], "str:direct-question-strategy": [151, 0], "str:direct-report": [852, -372], "str:discourse-reference-system": [895, -575], "str:ditransitive-alignment": [896, 726], "str:domain": [-81, -1036], "str:double-coding-strategy": [828, 1111], "str:double-expression": [357, 121], "str:double-negation-strategy": [310, -71], "str:double-oblique-strategy": [760, 1125], "str:doubling": [211, -178], "str:dual-role-strategy": [126, 402], "str:echo-strategy": [744, -137], "str:ellipsis": [456, 155], "str:encoding-strategy": [341, -265], "str:equal-equative": [436, -945], "str:ergative-alignment": [1228, 1010], "str:ergative-category": [1395, 1185], "str:exceed-comparative": [341, -950], "str:existential-negative-strategy": [-60, 200], "str:experiencer-oriented-strategy": [837, 1075], "str:experiential-alignment": [673, 883], "str:external-possessor-strategy": [84, 587], "str:externally-headed": [136, -735], "str:extraposed-strategy": [182, -838], "str:figure-incorporating": [369, 144], "str:first-person-plural-strategy": [-552, 563], "str:fixed-case": [443, -819], "str:flagging": [-225, -580], "str:focus-marker": [105, 53], "str:fusion": [54, -184], "str:gap-strategy": [95, -1016], "str:general-extender": [185, -665], "str:have-possessive-strategy": [483, -130], "str:headless": [-299, -530], "str:human-noun-strategy": [-592, 506], "str:hybrid-information-packaging-strategy": [254, 458], "str:identificational-strategy": [152, 195], "str:ideophones": [744, -250], "str:inactive-category": [927, 893], "str:inclusory-strategy": [-53, 55], "str:incorporation-of-serial-verbs": [112, 430], "str:independent-referring-phrase-strategy": [-183, 193], "str:independent-strategy": [457, -659], "str:index": [-51, -1042], "str:indexation": [-48, -703], "str:indexation-feature": [-3, -1016], "str:indexed": [-80, -357], "str:indirect-object-category": [1540, 869], "str:indirect-report": [874, -376], "str:indirective-alignment": [1298, 818], "str:information-packaging-alignment": [180, 416], "str:insubordination": [-144, -73], "str:internal-possessor-strategy": [-51, 596], "str:internal-recipient-strategy": [183, 814], "str:internally-headed-strategy": [-293, -484], "str:interrogative-complementizer": [409, -577], "str:interrogative-pronoun-strategy": [-608, 359], "str:juxtaposition": [-598, -666], "str:linker": [-303, -373], "str:locational-possessive-strategy": [130, 184], "str:locational-strategy": [461, -68], "str:locative-comparative": [410, -983], "str:locus-of-inflection-of-serial-verbs": [136, 421], "str:logophoric-system": [507, -335], "str:long-distance-reflexive": [319, -529], "str:mensural-classifier": [-118, -292], "str:merged-argument-structure-strategy": [509, -484], "str:middle-voice": [79, 467], "str:monoclausal-transitive-reciprocal-strategy": [144, 451], "str:monosyndetic": [-241, -813], "str:negative-auxiliary-strategy": [-58, 252], "str:negative-fusion": [77, 4], "str:negative-particle": [287, -57], "str:neutral-alignment": [1087, 947], "str:neutral-ditransitive-alignment": [1116, 849], "str:nominalizer": [-216, -153], "str:nominative-category": [1500, 1116], "str:non-externally-headed": [-70, -425], "str:non-indexed": [24, -537], "str:non-nominative-flag-index": [852, 824], "str:nonperson-indexation": [22, -1035], "str:nonspecific-article-strategy": [-581, 102], "str:nonspecific-pronoun-strategy": [-635, 470], "str:nonverbal-copula-strategy": [564, 47], "str:noun-incorporation": [829, 673], "str:noun-modifying-clause-strategy": [-261, -245], "str:numeral-strategy": [-663, 203], "str:object-equative": [516, -1050], "str:oblique-p-strategy": [910, 654], "str:omitted-a-strategy": [1171, 583], "str:omitted-p-strategy": [1060, 689], "str:ordered-strategy": [426, -752], "str:overt-article": [-357, -243], "str:overt-coding": [22, -264], "str:overt-pronoun": [-326, -32], "str:overtly-coded-single-role-strategy": [9, 101], "str:overtly-coded-verb": [77, -169], "str:overtly-headed-strategy": [-269, -465], "str:partially-merged-argument-structure-strategy": [542, -471], "str:participial-strategy": [600, -231], "str:participle": [-263, -662], "str:particle-comparative": [413, -846], "str:particle-equative": [523, -854], "str:passive-inverse-alignment": [911, 551], "str:perception-verb-strategy": [-154, 488], "str:person-indexation": [-102, -1013], "str:phenomime": [899, -208], "str:phonomime": [906, -179], "str:polarity-response-alignment": [1203, 316], "str:possessive-locative-strategy": [349, 56], "str:posterior-deranking": [-33, -760], "str:posterior-zero": [129, -509], "str:postnominal-strategy": [213, -829], "str:postposition": [-523, -1316], "str:predicational-locative-strategy": [48, 346], "str:predicational-strategy": [614, -303], "str:predicativization-possessive-strategy": [490, -159], "str:prenominal-strategy": [148, -837], "str:preposition": [-436, -1341], "str:primary-object-category": [1440, 1001], "str:pronoun-retention-strategy": [168, -1028], "str:prosody": [547, -420], "str:pseudo-partitive": [-639, -87], "str:psychomime": [914, -221], "str:question-marker": [319, -138], "str:quotative-marker": [661, -823], "str:reciprocal-strategy": [-90, 453], "str:recruitment-strategy": [-230, 210], "str:reference-tracking-system": [643, -479], "str:reflexive-strategy": [-100, 441], "str:relational-strategy": [-79, -463], "str:relative-based-equative": [541, -839], "str:relative-equal-equative": [465, -880], "str:relative-pronoun-strategy": [199, -1009], "str:relative-strategy": [295, -726], "str:relativizer": [-153, -774], "str:repeater": [-623, -716], "str:satellite": [641, 320], "str:satellite-framing-strategy": [442, 170], "str:scalar-concessive-conditional-strategy": [296, -442], "str:second-position": [28, 436], "str:secondary-object-category": [1467, 970], "str:secundative-alignment": [1251, 889], "str:semantic-information-packaging-strategy": [198, 496], "str:separative-comparative": [402, -960], "str:serial-verb-strategy": [186, 264], "str:simple-strategy": [-408, -599], "str:single-role-strategy": [67, 381], "str:sortal-classifier": [-618, -740], "str:special-form": [544, -388], "str:special-p-strategy": [593, 97], "str:specialized-dual-role-strategy": [56, 80], "str:split-argument-structure-strategy": [496, -460], "str:split-structure": [876, 794], "str:stamp-strategy": [54, 463], "str:stimulus-oriented-strategy": [795, 1123], "str:strategy": [188, 8], "str:subject-predicate-alignment": [656, 622], "str:summarizer": [190, -624], "str:switch-reference-system": [598, -766], "str:syndetic": [-102, -631], "str:system": [598, -46], "str:tag": [541, -89], "str:target": [-17, -1045], "str:tense-iconicity": [61, -481], "str:thetic-marker": [278, 73], "str:topic-locational-hybrid-possessive-strategy": [527, -112], "str:topic-marker": [-121, -59], "str:topic-possessive-strategy": [451, -136], "str:transitive-alignment": [904, 767], "str:transitivity-based-strategy": [810, 821], "str:tripartite-alignment": [1116, 909], "str:unique-equative": [524, -1071], "str:universal-concessive-conditional-strategy": [296, -414], "str:universal-pronoun-strategy": [-660, 455], "str:utterance-clause-alignment": [709, -71], "str:verb-coding-strategy": [-138, -437], "str:verb-framing-strategy": [390, 136], "str:verbal-copula": [545, 89], "str:verbal-strategy": [221, -143], "str:with-possessive-strategy": [482, -104], "str:word-order": [154, -627], "str:yes-no-alignment": [1473, 352], "str:yes-no-disagree-alignment": [1454, 386], "str:zero-anaphora": [-361, -85], "str:zero-article": [-408, -308], "str:zero-coded-verb": [-2, -216], "str:zero-coding": [-52, -355], "str:zero-copula": [199, -133]}}, "cxn_sem_inf": {"name": "Cxn \u2194\ufe0e Sem. + Inf.", "defaultrelation": "FunctionOf", "nodes": {"cxn": true, "inf": true, "sem": true}, "edges": {"SubtypeOf": true, "ConstituentOf": true, "HeadOf": true, "FunctionOf": true}, "positions": {"cxn:action-modification-construction": [-618, -102], "cxn:additive-construction": [-1013, -353], "cxn:additive-coordination": [-1594, -315], "cxn:adjectival-phrase": [-351, 523], "cxn:adjective": [-306, 898], "cxn:adjective-modification-construction": [-500, 280], "cxn:admodifier": [-817, 504], "cxn:adverbial-clause-construction": [-419, -389], "cxn:adverbial-dependent-clause": [-311, -302], "cxn:adverbial-matrix-clause": [-274, -341], "cxn:adversative-coordination": [-1511, -143], "cxn:affecting-verb": [1357, 1323], "cxn:age-term": [-364, 1145], "cxn:agentive-change-of-state-verb": [441, 1476], "cxn:alienable-possession-attributive-phrase": [-549, 731], "cxn:alienable-possession-modification-construction": [-512, 819], "cxn:alternative-question-construction": [1080, -534], "cxn:amount-term": [61, 627], "cxn:anaphoric-article": [-673, -448], "cxn:anaphoric-head-construction": [-702, -411], "cxn:anaphoric-head-relative-clause-construction": [-557, -297], "cxn:anaphoric-pronoun": [-1319, -35], "cxn:anchoring-construction": [-594, -140], "cxn:animal-noun": [-1222, 654], "cxn:animal-plant-product-noun": [-1175, 707], "cxn:antipassive-construction": [455, 651], "cxn:antipassive-oblique-phrase": [412, 712], "cxn:antonym": [-375, 1250], "cxn:apodosis-clause": [-716, 29], "cxn:application-verb": [817, 1101], "cxn:applicative-construction": [540, 588], "cxn:applicative-object-phrase": [672, 572], "cxn:apposition": [-662, 379], "cxn:apprehensional-construction": [-936, -431], "cxn:argument-complex-predicate": [-67, -1090], "cxn:argument-phrase": [8, 234], "cxn:argument-predicate-part": [-123, -930], "cxn:article": [-824, -419], "cxn:associative-construction": [-669, 537], "cxn:attending-verb": [1313, 1358], "cxn:attributive-phrase": [-547, -30], "cxn:auxiliary": [-29, -939], "cxn:auxiliary-construction": [-49, -1022], "cxn:basic-voice": [649, 720], "cxn:binominal-lexeme": [-598, 309], "cxn:bodily-motion-verb": [763, 1132], "cxn:bodily-predicate": [800, 1258], "cxn:body-care-verb": [616, 1273], "cxn:body-part-noun": [-1242, 673], "cxn:body-position-predicate": [504, 87], "cxn:cardinal-numeral-term": [-344, 295], "cxn:causal-construction": [-846, -482], "cxn:causative-construction": [719, 394], "cxn:causee-phrase": [865, 321], "cxn:causer-phrase": [976, 361], "cxn:chaining-construction": [867, 972], "cxn:change-in-position-verb": [710, 1140], "cxn:change-of-state-verb": [547, 1322], "cxn:clause": [199, 427], "cxn:cognition-verb": [1123, 1025], "cxn:collective-construction": [930, 950], "cxn:color-term": [-418, 1121], "cxn:combining-verb": [783, 1091], "cxn:commentative-construction": [874, -1020], "cxn:commentative-predicate": [940, -1120], "cxn:common-noun": [-1079, 544], "cxn:comparative-conditional-construction": [-859, -518], "cxn:comparative-construction": [-949, -334], "cxn:comparative-form": [-1024, 787], "cxn:comparative-pronoun": [-1847, -483], "cxn:complement": [-7, -137], "cxn:complement-clause-construction": [111, -496], "cxn:complement-matrix-clause": [90, -416], "cxn:complement-taking-predicate": [430, -637], "cxn:complementary": [-436, 1269], "cxn:complex-predicate": [-52, -791], "cxn:complex-predicate-part": [-173, -659], "cxn:complex-sentence": [-631, -327], "cxn:concessive-conditional-construction": [-891, -504], "cxn:concessive-construction": [-830, -567], "cxn:conditional-construction": [-904, -66], "cxn:conditional-pronoun": [-1850, -543], "cxn:conjunctive-coordination": [-1502, -233], "cxn:consecutive-coordination": [-1646, -388], "cxn:construction": [-320, 0], "cxn:contact-by-impact-verb": [582, 1228], "cxn:container-term": [318, -344], "cxn:controlled-predicate": [652, -78], "cxn:coordinand": [-515, -56], "cxn:coordinate-clause-construction": [-1162, -157], "cxn:coordinate-construction": [-694, -83], "cxn:core-argument-phrase": [520, 466], "cxn:damage-verb": [544, 1259], "cxn:declarative-construction": [208, -10], "cxn:declarative-negation-construction": [487, -61], "cxn:definite-article": [-783, -620], "cxn:definite-pronoun": [-1186, 10], "cxn:demonstrative-attributive": [-956, -331], "cxn:demonstrative-pronoun": [-1401, -365], "cxn:dependent": [-959, 406], "cxn:dependent-clause": [-264, -78], "cxn:depictive-complex-predicate": [-711, -1143], "cxn:desiderative-construction": [328, -660], "cxn:desiderative-predicate": [455, -781], "cxn:determiner": [-878, -243], "cxn:dimension-term": [-440, 1101], "cxn:direct-negation-pronoun": [-1883, -412], "cxn:discourse-markers": [-576, -426], "cxn:disjunctive-coordination": [-1470, -86], "cxn:distributive-quantifier-term": [-65, 627], "cxn:ditransitive-a-phrase": [1011, 464], "cxn:ditransitive-construction": [1008, 626], "cxn:downtoner": [-984, 805], "cxn:dynamic-predicate-part": [-225, -1309], "cxn:element": [-710, 254], "cxn:emotion-verb": [1164, 996], "cxn:entity-central-construction": [253, -479], "cxn:equational-construction": [378, -514], "cxn:equative-construction": [-930, -337], "cxn:evaluative-construction": [625, -853], "cxn:evaluative-predicate": [745, -963], "cxn:event-central-construction": [352, -1038], "cxn:eventive-complex-predicate": [-109, -1117], "cxn:eventive-predicate-part": [-178, -1074], "cxn:exclamative-construction": [607, -305], "cxn:exclusive-disjunctive-coordination": [-1587, -103], "cxn:exclusive-pronoun": [-1220, 310], "cxn:exhaustive-list-coordination": [-1453, -51], "cxn:existential-negation-construction": [542, 129], "cxn:experience-verb": [1316, 1310], "cxn:experiencer-phrase": [885, 554], "cxn:experiential-construction": [877, 792], "cxn:experiential-verb": [1064, 1135], "cxn:extroverted-verb": [848, 1308], "cxn:fearing-construction": [819, -1052], "cxn:fearing-predicate": [876, -1158], "cxn:figure-phrase": [1065, 611], "cxn:first-person-pronoun": [-1225, 176], "cxn:form-term": [356, -240], "cxn:free-choice-pronoun": [-1615, -545], "cxn:free-modification-construction": [-1038, -252], "cxn:free-relative-clause-construction": [-725, -205], "cxn:gender-term": [-322, 1156], "cxn:generic-article": [-906, -85], "cxn:generic-conditional-construction": [-1186, 64], "cxn:generic-pronoun": [-1352, 50], "cxn:ground-phrase": [764, 495], "cxn:group-term": [353, -320], "cxn:hanging-topic-construction": [-49, 346], "cxn:hanging-topic-phrase": [-155, 451], "cxn:head": [-927, 438], "cxn:hoping-construction": [823, -1020], "cxn:hoping-predicate": [853, -1123], "cxn:human-noun": [-1141, 658], "cxn:human-propensity-term": [-290, 1153], "cxn:human-proper-noun": [-1189, 591], "cxn:identificational-construction": [162, -397], "cxn:imperative-hortative-construction": [644, -338], "cxn:inalienable-possession-attributive-phrase": [-530, 716], "cxn:inalienable-possession-modification-construction": [-528, 795], "cxn:inclusive-disjunctive-coordination": [-1574, -167], "cxn:inclusive-pronoun": [-1121, 296], "cxn:inclusory-construction": [-991, 298], "cxn:indefinite-article": [-715, -550], "cxn:indefinite-pronoun": [-1394, -215], "cxn:indirect-negation-pronoun": [-1851, -516], "cxn:information-question-construction": [1050, -523], "cxn:information-question-response-construction": [1121, -335], "cxn:ingestion-verb": [854, 1061], "cxn:intensifier": [-1022, 823], "cxn:interaction-verb": [503, 1150], "cxn:interrogative-complement": [40, -67], "cxn:interrogative-construction": [845, -415], "cxn:interrogative-pronoun": [-1340, -122], "cxn:intransitive-construction": [1010, 724], "cxn:introverted-verb": [889, 1291], "cxn:irrealis-pronoun": [-1597, -515], "cxn:killing-injuring-verb": [587, 1261], "cxn:kinship-noun": [-876, 706], "cxn:knowledge-construction": [601, -1048], "cxn:knowledge-predicate": [673, -1144], "cxn:let-alone-construction": [-813, -535], "cxn:locational-construction": [362, 336], "cxn:locative-modification-construction": [69, 310], "cxn:locative-phrase": [245, 271], "cxn:logophoric-construction": [-133, -821], "cxn:main-clause": [-286, -95], "cxn:manipulative-construction": [354, -700], "cxn:manipulative-predicate": [486, -819], "cxn:manner-complex-predicate": [-727, -1197], "cxn:manner-of-motion-verb": [907, 1216], "cxn:manner-verb": [875, 1352], "cxn:material-term": [-264, 1143], "cxn:matrix-clause": [-228, -116], "cxn:means-construction": [-882, -550], "cxn:measure-term": [310, -293], "cxn:measurement": [-1063, 788], "cxn:mensural-attributive-phrase": [-121, -147], "cxn:mensural-modification-construction": [-359, -122], "cxn:mensural-term": [139, -148], "cxn:modification-construction": [-597, 0], "cxn:modifier": [-219, 273], "cxn:motion-construction": [906, 757], "cxn:motion-verb": [945, 1045], "cxn:natural-object-noun": [-1251, 630], "cxn:negation-construction": [584, -250], "cxn:negative-circumstantial-construction": [-909, -456], "cxn:negative-question-polarity-response-construction": [1520, -371], "cxn:nominal-attributive-phrase": [-307, 244], "cxn:nominal-modification-construction": [-340, 265], "cxn:nominal-phrase": [-454, 422], "cxn:non-exhaustive-list-coordination": [-1427, -197], "cxn:nonanaphoric-definite-article": [-711, -445], "cxn:nonbasic-voice": [400, 462], "cxn:nonclausal-coordination": [-780, 146], "cxn:nonpredicational-construction": [264, -407], "cxn:nonprototypical-construction": [11, 314], "cxn:nonprototypical-predication-construction": [-28, 568], "cxn:nonsubject-argument-phrase": [497, 354], "cxn:noun": [-716, 331], "cxn:noun-complement": [-253, 86], "cxn:noun-complement-clause-construction": [-220, 48], "cxn:noun-complement-head": [-448, 376], "cxn:noun-complement-matrix-clause": [-229, 159], "cxn:noun-complement-referring-phrase": [-260, 407], "cxn:numeral-attributive-phrase": [-367, 142], "cxn:numeral-modification-construction": [-526, 94], "cxn:object-identity-construction": [-575, -1073], "cxn:object-phrase": [742, 450], "cxn:oblique-phrase": [229, 469], "cxn:ordinal-numeral-term": [-259, 559], "cxn:p-phrase": [854, 635], "cxn:partitive-construction": [-324, 58], "cxn:partitive-phrase": [-247, 139], "cxn:passive-inverse-a-phrase": [760, 362], "cxn:passive-inverse-p-phrase": [664, 609], "cxn:passive-inverse-voice": [631, 483], "cxn:path-verb": [1110, 1233], "cxn:perception-clause": [531, 937], "cxn:perception-complement-clause-construction": [376, -664], "cxn:perception-complement-taking-predicate": [513, -782], "cxn:perception-verb": [618, 1121], "cxn:personal-pronoun": [-1059, 88], "cxn:physical-property-term": [-459, 1092], "cxn:piece-term": [-70, -88], "cxn:place-noun": [-1072, 673], "cxn:place-proper-noun": [-1090, 613], "cxn:plant-noun": [-1192, 682], "cxn:polarity-focus-construction": [280, -754], "cxn:polarity-question-construction": [1079, -497], "cxn:polarity-response-construction": [1287, -341], "cxn:positive-question-polarity-response-construction": [1514, -424], "cxn:possessed-argument-construction": [277, 630], "cxn:possession-construction": [-40, 531], "cxn:possessive-attributive-phrase": [-533, 476], "cxn:possessive-modification-construction": [-422, 604], "cxn:possessive-pronoun": [-935, 155], "cxn:possessor-argument-phrase": [477, 393], "cxn:pragmatically-nonspecific-article": [-579, -399], "cxn:pragmatically-nonspecific-pronoun": [-1413, -149], "cxn:pragmatically-specific-article": [-613, -406], "cxn:pragmatically-specific-pronoun": [-1352, -187], "cxn:predicate": [267, -120], "cxn:predicate-adjectival-construction": [-139, 860], "cxn:predicate-identity-construction": [-651, -1038], "cxn:predicate-nominal-construction": [-389, 485], "cxn:predicational-location-construction": [231, 501], "cxn:predicational-possession-construction": [-98, 688], "cxn:presentational-construction": [206, -112], "cxn:presentational-location-construction": [346, 161], "cxn:presentational-possession-construction": [13, 297], "cxn:pretense-construction": [572, -1066], "cxn:pretense-predicate": [641, -1176], "cxn:prohibitive-construction": [770, -355], "cxn:pronominal-argument-complex-predicate": [-37, -1333], "cxn:pronoun": [-1246, -76], "cxn:proper-noun": [-1076, 484], "cxn:property-referring-phrase": [-381, 652], "cxn:proportional-quantifier-term": [13, 561], "cxn:propositional-attitude-construction": [427, -853], "cxn:propositional-attitude-predicate": [552, -960], "cxn:protasis-clause": [-707, 3], "cxn:prototypical-construction": [9, 504], "cxn:purpose-construction": [-896, -404], "cxn:pursuit-verb": [800, 1164], "cxn:quantifier-attributive-phrase": [-238, 286], "cxn:quantifier-modification-construction": [-435, 173], "cxn:quantifier-term": [-85, 491], "cxn:question-pronoun": [-1881, -454], "cxn:r-phrase": [1046, 461], "cxn:reciprocal-construction": [852, 996], "cxn:reference-tracking-construction": [-556, -789], "cxn:referent-expression": [-526, 189], "cxn:referring-phrase": [-433, 222], "cxn:reflexive-construction": [896, 960], "cxn:relative-clause": [-461, -103], "cxn:relative-clause-construction": [-387, -95], "cxn:relative-clause-head": [-556, 362], "cxn:relative-matrix-clause": [-406, 48], "cxn:relativized-referring-phrase": [-525, 247], "cxn:removal-verb": [748, 1172], "cxn:response-construction": [894, -288], "cxn:result-verb": [947, 1314], "cxn:resultative-complex-predicate": [-756, -1121], "cxn:s-phrase": [1085, 560], "cxn:second-person-pronoun": [-1167, -33], "cxn:semantically-nonspecific-article": [-676, -378], "cxn:semantically-nonspecific-pronoun": [-1638, -385], "cxn:sensation-verb": [1158, 1042], "cxn:set-member-attributive-phrase": [-389, 200], "cxn:set-member-modification-construction": [-544, 140], "cxn:set-member-term": [-311, 393], "cxn:shape-term": [-388, 1096], "cxn:simple-contrast-coordination": [-1662, -219], "cxn:simple-predicate": [499, 445], "cxn:social-noun": [-1149, 627], "cxn:species-term": [375, -270], "cxn:specific-known-pronoun": [-1503, -158], "cxn:specific-unknown-pronoun": [-1477, -196], "cxn:speech-act-construction": [400, -200], "cxn:spontaneous-verb": [1000, 849], "cxn:spurious-complex-predicate": [-456, -1415], "cxn:stative-complex-predicate": [-423, -1160], "cxn:stative-predicate-part": [-279, -1366], "cxn:stimulus-phrase": [834, 580], "cxn:subject-identity-construction": [-373, -965], "cxn:subject-phrase": [819, 464], "cxn:subordinate-clause": [-262, -103], "cxn:substitutive-construction": [-865, -430], "cxn:subtractive-construction": [-918, -513], "cxn:superlative-form": [-1082, 767], "cxn:support-verb": [-154, -897], "cxn:support-verb-construction": [-95, -1008], "cxn:t-phrase": [1059, 502], "cxn:temporal-construction": [-869, -665], "cxn:temporary-predicate": [253, 233], "cxn:thetic-construction": [295, -730], "cxn:third-person-pronoun": [-1213, -76], "cxn:topic-comment-construction": [48, 176], "cxn:topic-phrase": [-109, 308], "cxn:transfer-verb": [499, 1198], "cxn:transitive-a-phrase": [1001, 507], "cxn:transitive-construction": [967, 690], "cxn:typifying-construction": [-781, 124], "cxn:uncontrolled-predicate": [680, -58], "cxn:unexpected-co-occurrence-coordination": [-1654, -273], "cxn:universal-pronoun": [-1400, 114], "cxn:utterance-construction": [310, -699], "cxn:utterance-predicate": [427, -813], "cxn:vague-numeral-term": [-1, 592], "cxn:value-term": [-345, 1101], "cxn:verb": [659, 1029], "cxn:verbal-clause": [347, 710], "cxn:wishing-construction": [860, -999], "cxn:wishing-predicate": [908, -1116], "inf:aboutness": [-236, -212], "inf:accessibility": [-812, -830], "inf:active-referent": [-1107, -60], "inf:actor": [-556, -630], "inf:admodification": [-598, 159], "inf:alternative-proposition": [-708, 379], "inf:alternative-question": [982, -558], "inf:anchor": [-453, -395], "inf:announcement": [457, -1462], "inf:appositive-modification": [-845, 413], "inf:background-description": [425, -1477], "inf:choosing-contrast": [-1282, 1038], "inf:comparative-referent": [-1725, -455], "inf:complementative": [-1000, 385], "inf:complex-figure": [-530, -259], "inf:conditional-referent": [-1745, -488], "inf:contrast": [-633, 638], "inf:coreference": [-405, -672], "inf:counterpresuppositional-contrast": [-1050, 879], "inf:declarative": [57, -273], "inf:different-subject": [-457, -1275], "inf:direct-negation-referent": [-1761, -389], "inf:discourse-coherence": [-222, -397], "inf:discourse-connection": [-395, -369], "inf:discourse-deixis": [-1076, 32], "inf:discourse-structure": [-321, -184], "inf:entity-central": [247, -629], "inf:equational": [529, -444], "inf:event-central": [364, -1231], "inf:exclamative": [535, -392], "inf:expanding-contrast": [-1292, 1073], "inf:explanation": [393, -1465], "inf:figure-ground": [-330, -421], "inf:focus": [-151, -130], "inf:free-choice-referent": [-1370, -443], "inf:generic-referent": [-1191, -56], "inf:high-accessibility": [-941, -1075], "inf:high-topicality": [442, 321], "inf:highest-topicality": [187, 337], "inf:identifiability": [-857, -828], "inf:identificational": [-83, 19], "inf:identity-known": [-1015, -1071], "inf:identity-unknown": [-788, -683], "inf:imperative-hortative": [616, -462], "inf:inactive-referent": [-1048, -24], "inf:indirect-negation-referent": [-1717, -504], "inf:inferrable-referent": [-1076, -24], "inf:information-gap": [431, -239], "inf:information-packaging": [-274, -173], "inf:information-question": [965, -584], "inf:information-question-response": [1031, -369], "inf:information-status": [-657, -563], "inf:interrogative": [732, -448], "inf:interrogative-unit": [-1107, -127], "inf:interruption": [487, -1453], "inf:irrealis-referent": [-1359, -420], "inf:link": [-802, -189], "inf:listing-contrast": [-1083, 1409], "inf:logophoric-subject-identity": [-261, -1042], "inf:low-accessibility": [-819, -735], "inf:low-topicality": [270, 300], "inf:major-propositional-act": [-419, -17], "inf:medium-accessibility": [-736, -726], "inf:mid-topicality": [456, 281], "inf:modification": [-591, 56], "inf:negative-question-polarity-response": [1451, -401], "inf:non-high-topicality": [357, 232], "inf:non-low-topicality": [370, 289], "inf:nonspecific-referent": [-1463, -342], "inf:nonverbal-contrast": [-1054, 1377], "inf:object-identity": [-533, -1227], "inf:parallel-contrast": [-939, 1151], "inf:polarity-question": [996, -534], "inf:polarity-response": [1205, -374], "inf:poset": [-615, -206], "inf:positive-question-polarity-response": [1447, -455], "inf:pragmatic-assertion": [-372, -277], "inf:pragmatic-presupposition": [-266, -291], "inf:pragmatically-specific-referent": [-1152, -182], "inf:predicate-identity": [-674, -1173], "inf:predication": [-112, 164], "inf:presentational": [241, -416], "inf:presupposed-open-proposition": [-165, -162], "inf:prohibitive": [834, -591], "inf:prop": [-519, -624], "inf:question-referent": [-1752, -427], "inf:reference": [-817, -42], "inf:referent-type-identity": [-707, -1241], "inf:rejecting-contrast": [-1222, 1107], "inf:replacing-contrast": [-1254, 1073], "inf:response": [768, -322], "inf:restricting-contrast": [-1248, 1112], "inf:restrictive-modification": [-1021, 356], "inf:same-subject": [-446, -1154], "inf:selecting": [-787, 83], "inf:semantically-specific-referent": [-1250, -213], "inf:semi-active-referent": [-1054, 15], "inf:setting": [-436, -796], "inf:situating": [-462, -147], "inf:specific-known-referent": [-1514, -282], "inf:specific-unknown-referent": [-1533, -268], "inf:speech-acts": [282, -339], "inf:subcategorizing": [-814, 268], "inf:theater-metaphor": [-419, -547], "inf:thetic": [217, -762], "inf:token-identity": [-429, -1049], "inf:topic-comment": [-270, -32], "inf:topicality": [168, 146], "inf:trigger": [-802, -160], "inf:type-identifiable": [-755, -628], "inf:type-identity": [-584, -1008], "inf:verbal-contrast": [-1107, 1373], "sem:a-role": [1051, 345], "sem:achievement": [-2767, -4669], "sem:action-concept": [257, 459], "sem:addition": [-1298, -665], "sem:additive": [-1315, -388], "sem:addressee": [1663, 349], "sem:affectee": [1621, 502], "sem:affecting": [1559, 1461], "sem:age": [-344, 1255], "sem:agent": [1329, 269], "sem:agentive-change-of-state-event": [316, 1285], "sem:agentive-experience-event": [893, 712], "sem:agentive-ingestion-event": [898, 645], "sem:amount": [120, 478], "sem:animacy": [4546, -2047], "sem:animate": [4488, -2029], "sem:antecedent-role": [-16, 973], "sem:anterior": [-1091, -714], "sem:apodosis": [-994, 66], "sem:application-event": [770, 923], "sem:apprehensional": [-1160, -547], "sem:arrangement": [459, -233], "sem:arrival": [1292, 1065], "sem:aspect": [-193, -636], "sem:atelic": [4572, -2771], "sem:attending": [1507, 1523], "sem:avalent": [1696, 882], "sem:base-event": [73, 978], "sem:beneficiary": [1847, 560], "sem:bivalent": [1264, 778], "sem:bodily-action": [508, 1176], "sem:bodily-motion-event": [711, 945], "sem:body-care-event": [415, 1213], "sem:body-part-relation": [-382, 789], "sem:body-position-event": [613, 363], "sem:cardinal-numeral": [-120, 227], "sem:categorical": [-509, 1556], "sem:causal": [-1036, -602], "sem:causal-chain": [109, 891], "sem:causal-chain-profile": [1155, 1730], "sem:causal-control": [1135, 226], "sem:causal-cyclicality": [1110, 1323], "sem:causal-directionality": [1613, 1549], "sem:causal-directness": [1041, -4946], "sem:causal-link": [-4732, 2632], "sem:causal-structure": [89, 712], "sem:causative-event": [99, 960], "sem:cause": [1707, 166], "sem:caused-motion": [762, 808], "sem:causee": [1235, 288], "sem:causer": [1252, 300], "sem:central-participant": [266, 657], "sem:chaining": [1032, 1190], "sem:change-in-position-event": [666, 947], "sem:change-of-state-event": [368, 1252], "sem:change-type": [2912, 4371], "sem:co-actor": [1410, 383], "sem:cognition-event": [949, 851], "sem:collective": [1130, 1155], "sem:color": [-444, 1219], "sem:combining-event": [733, 907], "sem:comitative": [1610, 305], "sem:commentative-event": [984, -960], "sem:communication-event": [79, 1079], "sem:comparative-conditional-relation": [-1071, -609], "sem:comparative-degree": [-1169, 969], "sem:comparative-relation": [-1211, -419], "sem:comparee": [5154, 1798], "sem:completive": [5100, -771], "sem:concessive-conditional-relation": [-1104, -620], "sem:concessive-relation": [-1040, -669], "sem:concomitant-role": [-40, 1243], "sem:conditional-relation": [-1128, -98], "sem:consecutive": [-1447, -513], "sem:contact-by-impact-event": [397, 1175], "sem:contact-event": [240, 1198], "sem:container": [413, -343], "sem:content-causal-relation": [-4674, 2584], "sem:contextual": [-1184, -294], "sem:continuative": [5080, -900], "sem:controlled": [962, 30], "sem:creation-event": [195, 1203], "sem:damage-event": [352, 1214], "sem:degree": [-1093, 863], "sem:deontic-modality": [390, -1749], "sem:departure": [1328, 1036], "sem:dependent-time-reference": [3563, -4034], "sem:desiderative-event": [489, -622], "sem:dimension": [-443, 1194], "sem:direct-causation": [1092, -5013], "sem:directed-change": [2857, 4410], "sem:distal": [-1552, -756], "sem:distributive-quantifier": [-53, 433], "sem:downtoning": [-1119, 994], "sem:durative": [-18, 5174], "sem:durativity": [-80, 5148], "sem:dynamic": [-219, -1616], "sem:emotion-event": [987, 820], "sem:endpoint": [217, 891], "sem:entity": [-502, -143], "sem:epistemic-causal-relation": [-4793, 2597], "sem:epistemic-modality": [461, -1889], "sem:epistemic-stance": [437, -4737], "sem:equative-relation": [-1195, -376], "sem:evaluative-event": [803, -812], "sem:event": [78, 199], "sem:event-oriented": [-815, -1447], "sem:event-relation": [-1117, -481], "sem:eventive-participant-event": [463, -444], "sem:eventive-perception-event": [557, -621], "sem:evidentiality": [434, -1754], "sem:exclusive-disjunction": [-1417, -298], "sem:exhaustive-list": [-1378, -410], "sem:existence-event": [419, 564], "sem:experience": [1493, 1446], "sem:experiencer": [1216, 493], "sem:experiential-event": [689, 649], "sem:expertum": [1535, 297], "sem:external-cause": [1492, 251], "sem:extroverted": [1032, 1465], "sem:fearing-event": [955, -1017], "sem:figure": [1318, 633], "sem:figure-ground-spatial-relation": [365, 427], "sem:first-person": [-1296, 26], "sem:force": [1704, 236], "sem:future-oriented": [3959, 3816], "sem:gender-class": [-290, 1272], "sem:generic-conditional-relation": [-1332, 71], "sem:gradable-predicative-scale": [-1375, -390], "sem:gradient": [-436, 1537], "sem:ground": [788, 310], "sem:group": [422, -291], "sem:hearer": [-946, 346], "sem:hoping-event": [946, -983], "sem:human": [4571, -2114], "sem:human-propensity": [-246, 1248], "sem:hypothetical": [354, -4764], "sem:identity": [-1426, 372], "sem:inanimate": [4605, -2003], "sem:inceptive": [5202, -803], "sem:inclusive-disjunction": [-1394, -325], "sem:independent-time-reference": [3591, -3923], "sem:indirect-causation": [1095, -4897], "sem:ingestion-event": [844, 877], "sem:initiator": [237, 908], "sem:instrument": [1695, 198], "sem:intensifying": [-1170, 1005], "sem:interaction-event": [294, 1050], "sem:introverted": [1080, 1447], "sem:killing-injuring-event": [390, 1211], "sem:kinship-relation": [-562, 760], "sem:knowledge-event": [702, -1011], "sem:less-affected-p": [566, 834], "sem:less-individuated-p": [587, 812], "sem:let-alone-relation": [-1011, -631], "sem:maleficiary": [1858, 518], "sem:manipulative-event": [522, -642], "sem:manner": [-12, -5494], "sem:manner-of-motion-event": [1112, 1172], "sem:manner-profile": [1037, 1599], "sem:material": [-271, 1242], "sem:meaning": [-420, -109], "sem:means": [-1098, -666], "sem:measure": [384, -330], "sem:measuring": [-1213, 955], "sem:mensural-concept": [237, -162], "sem:mental-space": [347, -1145], "sem:message": [1553, 589], "sem:mirative": [461, -1369], "sem:modality": [343, -1515], "sem:monovalent": [1298, 805], "sem:motion-event": [1067, 947], "sem:necessary-participant-sharing": [4452, -3214], "sem:negative-circumstantial": [-1125, -576], "sem:negative-epistemic-stance": [328, -4841], "sem:negative-polarity": [554, -664], "sem:neutral-epistemic-stance": [284, -4742], "sem:non-exhaustive-list": [-1322, -621], "sem:nonrelational": [-1288, -1309], "sem:number": [-1407, -5237], "sem:numeral": [-33, 345], "sem:object-concept": [-710, 297], "sem:objective": [550, -2090], "sem:occupant": [1658, 387], "sem:ordinal-numeral": [-139, 464], "sem:orientation": [-870, -1543], "sem:other": [-831, 442], "sem:ownership": [-391, 813], "sem:p-role": [771, 752], "sem:part-whole-relation": [-239, 878], "sem:participant-oriented": [-800, -1336], "sem:participant-role": [77, 347], "sem:passing": [1295, 1033], "sem:path-event": [1228, 1133], "sem:patient": [1100, 690], "sem:perception-event": [670, 845], "sem:peripheral-participant": [-8, 618], "sem:persistent": [-219, -2647], "sem:person": [-979, 559], "sem:person-deixis": [-1142, -83], "sem:phasal-aspect": [5132, -842], "sem:physical-property": [-415, 1221], "sem:piece": [-13, -96], "sem:place": [-921, 542], "sem:polarity": [390, -991], "sem:positive-epistemic-stance": [510, -4742], "sem:positive-polarity": [491, -1222], "sem:possession": [-198, 662], "sem:possessor": [1023, 411], "sem:possessum": [1560, 625], "sem:posterior": [-968, -825], "sem:pretense-event": [665, -980], "sem:property-concept": [-269, 1036], "sem:proportional-quantifier": [-47, 397], "sem:proposition": [285, -638], "sem:propositional-attitude-event": [595, -798], "sem:propositional-content": [207, -103], "sem:protasis": [-977, 29], "sem:proximal": [-1531, -786], "sem:punctual": [-141, 5174], "sem:purpose": [-1098, -511], "sem:pursuit-event": [751, 968], "sem:qualitative-event": [239, 949], "sem:quantitative-relation": [61, 242], "sem:quantity": [-500, -328], "sem:recipient": [1296, 417], "sem:reciprocal": [1018, 1221], "sem:reference-point": [-358, 1303], "sem:reflexive": [1070, 1177], "sem:relational": [-874, -799], "sem:relationality": [-1119, -1101], "sem:removal-event": [708, 973], "sem:result-profile": [1101, 1575], "sem:s-role": [1298, 562], "sem:scalar-model": [-4734, -2734], "sem:scale": [-508, 1699], "sem:second-person": [-1243, -161], "sem:semantic-role": [1292, 333], "sem:sensation-event": [972, 866], "sem:set-member": [-154, 299], "sem:shape": [-375, 1203], "sem:simple-contrast": [-1445, -371], "sem:simultaneous": [-896, -887], "sem:social-event": [112, 798], "sem:social-role": [1536, 342], "sem:social-role-event": [117, 1064], "sem:sociative-causation": [975, -4976], "sem:spatial-deixis": [-1331, -554], "sem:spatial-event": [612, 692], "sem:speaker": [-1023, 325], "sem:species": [460, -286], "sem:speech-act-causal-relation": [-4733, 2702], "sem:spontaneous": [1170, 555], "sem:standard": [-3751, -3945], "sem:state": [191, 611], "sem:stative": [-273, -1675], "sem:stativity": [-240, -1878], "sem:stimulus": [1111, 580], "sem:subjective": [509, -2099], "sem:subsequent-role": [87, 691], "sem:substitution": [-1300, -703], "sem:substitutive": [-1055, -530], "sem:subtraction": [-1340, -667], "sem:subtractive": [-1138, -632], "sem:superlative-degree": [-1246, 941], "sem:tamp": [126, -1080], "sem:telic": [4638, -2655], "sem:telicity": [4601, -2710], "sem:tense": [248, -1265], "sem:terminative": [5182, -899], "sem:theme": [1310, 503], "sem:thing": [-1065, 573], "sem:third-person": [-1290, -176], "sem:time": [-542, -339], "sem:time-reference": [3598, -3983], "sem:time-stability": [-241, -2192], "sem:token": [-1354, 509], "sem:topic": [1551, 551], "sem:transfer-of-possession-event": [294, 1088], "sem:transitoriness": [-242, -2474], "sem:transitory": [-270, -2647], "sem:trivalent": [1298, 729], "sem:type": [-1212, 206], "sem:uncontrolled": [1003, 42], "sem:undergoer": [1337, 535], "sem:undirected-change": [2979, 4366], "sem:unexpected-co-occurrence": [-1455, -428], "sem:utterance-event": [474, -660], "sem:vague-numeral": [-23, 408], "sem:valency": [1470, 821], "sem:value": [-318, 1253], "sem:weather-event": [226, 1235], "sem:wishing-event": [993, -982]}}, "sections": {"name": "CCs by book section", "defaultrelation": "Sections", "nodes": {"section": true, "cxn": true, "str": true, "inf": true, "sem": true}, "edges": {"Sections": true, "SubtypeOf": true, "ConstituentOf": true, "HeadOf": true}, "positions": {"1": [38, 205], "1.1": [-162, 142], "1.2": [453, 415], "1.2.1": [816, 586], "1.2.2": [804, 642], "1.2.3": [8, 194], "1.3": [-360, 172], "1.4": [73, 16], "1.5": [-233, 163], "1.6": [216, 250], "10": [-322, 17], "10.1": [-699, -27], "10.1.1": [-782, 37], "10.1.2": [-943, -83], "10.2": [94, 189], "10.3": [-491, 3], "10.4": [-762, -58], "10.4.1": [-890, 141], "10.4.2": [-404, -160], "10.4.3": [-935, -27], "11": [-394, -110], "11.1": [-517, -206], "11.2": [-698, -44], "11.2.1": [-707, 84], "11.2.2": [-550, -340], "11.2.3": [-913, 265], "11.3": [-421, -50], "11.3.1": [-940, 26], "11.3.2": [175, -126], "11.3.3": [-609, 110], "11.4": [-757, -218], "11.4.1": [-1205, -364], "11.4.2": [-398, -82], "12": [-525, -453], "12.1": [-785, -584], "12.2": [-720, -679], "12.3": [-907, -469], "12.3.1": [-1260, -56], "12.3.2": [-663, -613], "12.3.3": [-851, -772], "12.3.4": [-505, -744], "12.4": [-721, -764], "12.4.1": [-778, -886], "12.4.2": [-316, -758], "12.5": [-836, -690], "12.5.2": [-805, -949], "13": [637, -606], "13.1": [735, -814], "13.1.1": [642, -660], "13.1.2": [532, -825], "13.2": [786, -963], "13.2.1": [271, -767], "13.2.2": [952, -1120], "13.3": [988, -875], "13.3.2": [1173, -1106], "13.4": [799, -736], "13.5": [791, -758], "13.6": [648, -836], "14": [393, -424], "14.1": [926, -1009], "14.2": [274, -322], "14.3": [13, 54], "14.4": [67, -295], "14.5": [444, -490], "15": [-20, -538], "15.1": [-321, -715], "15.1.1": [-525, -645], "15.1.2": [-417, -537], "15.1.3": [-418, -915], "15.2": [47, -722], "15.2.1": [-471, -1189], "15.2.2": [666, -412], "15.2.3": [-127, -421], "15.3": [33, -975], "15.3.1": [-281, -1274], "15.3.2": [431, -900], "16": [749, 420], "16.1": [335, 496], "16.2": [1153, 600], "16.3": [1147, 661], "16.4": [1155, 709], "16.5": [640, 33], "17": [14, -752], "17.2": [236, -1115], "17.2.1": [43, -1487], "17.2.2": [365, -903], "17.2.3": [489, -982], "17.2.4": [390, -1179], "17.3": [-276, -1135], "17.3.1": [-695, -1179], "17.3.2": [-324, -1384], "17.3.3": [-51, -1182], "17.4": [-109, -1181], "17.4.1": [-231, -1398], "17.4.2": [-236, -1358], "18": [551, -486], "18.2": [499, -852], "18.2.1": [215, -702], "18.2.2": [615, -1211], "18.3": [935, -691], "18.3.1": [730, -643], "18.3.2": [1220, -876], "18.4": [712, -701], "18.4.1": [544, -809], "18.4.2": [658, -562], "19": [-63, -120], "19.1": [-394, 44], "19.2": [113, -590], "19.2.1": [499, -678], "19.2.2": [-96, -727], "19.2.3": [488, -994], "19.2.4": [-373, -419], "19.3": [218, -51], "19.4": [-283, 213], "2": [232, 480], "2.1": [69, 691], "2.2": [-303, 458], "2.2.1": [-767, 343], "2.2.2": [-235, 403], "2.2.3": [-396, 750], "2.2.4": [-260, 424], "2.2.5": [-353, 187], "2.3": [356, 748], "2.4": [738, 387], "2.5": [382, 755], "3": [-638, 797], "3.1": [-893, 1063], "3.1.1": [-1564, 1308], "3.1.2": [-367, 1381], "3.1.3": [-1111, 1196], "3.2": [-995, 1010], "3.3": [-408, 663], "3.3.1": [-705, 937], "3.3.2": [18, 551], "3.3.3": [-346, 293], "3.4": [-828, 873], "3.4.1": [-1138, 949], "3.4.2": [-554, 681], "3.5": [-1172, 1450], "3.6": [-996, 1054], "4": [96, 524], "4.1": [-243, 907], "4.1.1": [-329, 1031], "4.1.2": [-490, 1101], "4.1.3": [-43, 1389], "4.1.4": [-577, 507], "4.2": [-4, 226], "4.3": [521, 878], "4.4": [391, 804], "4.4.1": [658, 890], "4.4.2": [460, 1086], "4.4.3": [572, 1020], "4.4.4": [-156, 1064], "4.5": [297, 49], "5": [-158, 503], "5.2": [-478, 859], "5.2.1": [-640, 1100], "5.2.2": [-296, 663], "5.2.3": [-770, 865], "5.2.4": [-604, 1137], "5.3": [-94, 163], "5.4": [55, 757], "6": [533, 288], "6.1": [761, 262], "6.1.1": [578, 267], "6.1.2": [955, 145], "6.2": [650, 279], "6.2.1": [892, 348], "6.2.2": [354, 185], "6.3": [931, 258], "6.3.1": [1433, -25], "6.3.2": [860, 528], "6.3.3": [638, 128], "6.3.4": [659, 487], "6.6": [503, 566], "6.6.1": [317, 620], "7": [408, 363], "7.2": [-111, 423], "7.3": [305, 426], "7.3.1": [280, -51], "7.3.2": [202, 728], "7.3.3": [471, 618], "7.4": [1079, 203], "7.5": [257, 800], "7.5.1": [497, 890], "7.5.2": [868, 1007], "7.5.3": [-453, 753], "8": [691, 208], "8.1": [561, 436], "8.3": [948, 220], "8.4": [1196, 303], "9": [732, 237], "9.1": [981, 461], "9.2": [1151, 206], "9.3": [886, 418], "9.4": [906, 393], "book": [140, 13], "cxn:action-modification-construction": [-569, 560], "cxn:additive-construction": [-548, -965], "cxn:additive-coordination": [-871, -1730], "cxn:adjectival-phrase": [-508, 858], "cxn:adjective": [-508, 1102], "cxn:adjective-modification-construction": [-528, 996], "cxn:admodifier": [-526, 714], "cxn:adverbial-clause-construction": [-396, -1008], "cxn:adverbial-dependent-clause": [-383, -866], "cxn:adverbial-matrix-clause": [-520, -810], "cxn:adversative-coordination": [-662, -1485], "cxn:affecting-verb": [1232, 254], "cxn:age-term": [-521, 1347], "cxn:agentive-change-of-state-verb": [1016, 444], "cxn:alienable-possession-attributive-phrase": [-1214, 717], "cxn:alienable-possession-modification-construction": [-969, 623], "cxn:alternative-question-construction": [-1400, -260], "cxn:amount-term": [-118, 1561], "cxn:anaphoric-article": [-781, 1135], "cxn:anaphoric-head-construction": [-261, 543], "cxn:anaphoric-head-relative-clause-construction": [-396, 224], "cxn:anaphoric-pronoun": [-1059, 1189], "cxn:anchoring-construction": [-556, 1048], "cxn:animal-noun": [-2154, 1211], "cxn:animal-plant-product-noun": [-2182, 1239], "cxn:antipassive-construction": [869, 492], "cxn:antipassive-oblique-phrase": [815, 693], "cxn:antonym": [-621, 1295], "cxn:apodosis-clause": [-607, -642], "cxn:application-verb": [252, 859], "cxn:applicative-construction": [811, 540], "cxn:applicative-object-phrase": [998, 627], "cxn:apposition": [-245, 745], "cxn:apprehensional-construction": [-512, -1024], "cxn:argument-complex-predicate": [617, -731], "cxn:argument-phrase": [155, 396], "cxn:argument-predicate-part": [490, -707], "cxn:article": [-994, 1238], "cxn:associative-construction": [-420, 1027], "cxn:attending-verb": [1212, 301], "cxn:attributive-phrase": [-618, 844], "cxn:auxiliary": [586, -693], "cxn:auxiliary-construction": [698, -637], "cxn:basic-voice": [329, 501], "cxn:binominal-lexeme": [-746, 965], "cxn:bodily-motion-verb": [14, 644], "cxn:bodily-predicate": [956, 186], "cxn:body-care-verb": [23, 580], "cxn:body-part-noun": [-2190, 1166], "cxn:body-position-predicate": [369, 0], "cxn:cardinal-numeral-term": [-271, 1207], "cxn:causal-construction": [-444, -992], "cxn:causative-construction": [901, 517], "cxn:causee-phrase": [848, 756], "cxn:causer-phrase": [1051, 728], "cxn:chaining-construction": [83, 606], "cxn:change-in-position-verb": [64, 577], "cxn:change-of-state-verb": [734, 408], "cxn:clause": [-19, 326], "cxn:cognition-verb": [1232, 296], "cxn:collective-construction": [75, 543], "cxn:color-term": [-502, 1329], "cxn:combining-verb": [285, 797], "cxn:commentative-construction": [585, -1681], "cxn:commentative-predicate": [588, -1490], "cxn:common-noun": [-1877, 1137], "cxn:comparative-conditional-construction": [-319, -1122], "cxn:comparative-construction": [-177, -1167], "cxn:comparative-form": [-651, 1007], "cxn:comparative-pronoun": [-1373, 1686], "cxn:complement": [-10, -304], "cxn:complement-clause-construction": [155, -964], "cxn:complement-matrix-clause": [-77, -808], "cxn:complement-taking-predicate": [259, -922], "cxn:complementary": [-616, 1334], "cxn:complex-predicate": [411, -408], "cxn:complex-predicate-part": [268, -481], "cxn:complex-sentence": [-349, -706], "cxn:concessive-conditional-construction": [-254, -1057], "cxn:concessive-construction": [-385, -1114], "cxn:conditional-construction": [-655, -908], "cxn:conditional-pronoun": [-1339, 1666], "cxn:conjunctive-coordination": [-708, -1477], "cxn:consecutive-coordination": [-826, -1743], "cxn:construction": [-424, -37], "cxn:contact-by-impact-verb": [265, 831], "cxn:container-term": [-59, 1596], "cxn:controlled-predicate": [374, -45], "cxn:coordinand": [-494, -620], "cxn:coordinate-clause-construction": [-590, -1126], "cxn:coordinate-construction": [-608, -620], "cxn:core-argument-phrase": [640, 566], "cxn:damage-verb": [298, 837], "cxn:declarative-construction": [-714, -150], "cxn:declarative-negation-construction": [-896, -557], "cxn:definite-article": [-898, 1320], "cxn:definite-pronoun": [-1270, 1353], "cxn:demonstrative-attributive": [-914, 1094], "cxn:demonstrative-pronoun": [-1295, 1186], "cxn:dependent": [-1009, 274], "cxn:dependent-clause": [-396, -355], "cxn:depictive-complex-predicate": [1083, -1161], "cxn:desiderative-construction": [196, -1245], "cxn:desiderative-predicate": [369, -1222], "cxn:determiner": [-868, 1119], "cxn:dimension-term": [-570, 1350], "cxn:direct-negation-pronoun": [-1378, 1659], "cxn:discourse-markers": [-569, -355], "cxn:disjunctive-coordination": [-611, -1365], "cxn:distributive-quantifier-term": [-83, 1554], "cxn:ditransitive-a-phrase": [923, 830], "cxn:ditransitive-construction": [745, 622], "cxn:downtoner": [-610, 1024], "cxn:dynamic-predicate-part": [891, -874], "cxn:element": [-789, 168], "cxn:emotion-verb": [1179, 313], "cxn:entity-central-construction": [-1100, -95], "cxn:equational-construction": [-1168, -222], "cxn:equative-construction": [-1, -1038], "cxn:evaluative-construction": [445, -1443], "cxn:evaluative-predicate": [504, -1315], "cxn:event-central-construction": [-1127, -100], "cxn:eventive-complex-predicate": [676, -722], "cxn:eventive-predicate-part": [690, -758], "cxn:exclamative-construction": [-994, -668], "cxn:exclusive-disjunctive-coordination": [-583, -1443], "cxn:exclusive-pronoun": [-1707, 1493], "cxn:exhaustive-list-coordination": [-618, -1342], "cxn:existential-negation-construction": [-986, -781], "cxn:experience-verb": [1249, 296], "cxn:experiencer-phrase": [879, 670], "cxn:experiential-construction": [789, 461], "cxn:experiential-verb": [950, 336], "cxn:extroverted-verb": [11, 622], "cxn:fearing-construction": [615, -1646], "cxn:fearing-predicate": [639, -1444], "cxn:figure-phrase": [698, 744], "cxn:first-person-pronoun": [-1525, 1435], "cxn:form-term": [-147, 1632], "cxn:free-choice-pronoun": [-1339, 1712], "cxn:free-modification-construction": [-533, 553], "cxn:free-relative-clause-construction": [-491, 225], "cxn:gender-term": [-547, 1341], "cxn:generic-article": [-889, 1113], "cxn:generic-conditional-construction": [-832, -1157], "cxn:generic-pronoun": [-1232, 1232], "cxn:ground-phrase": [580, 769], "cxn:group-term": [-91, 1615], "cxn:hanging-topic-construction": [-816, 159], "cxn:hanging-topic-phrase": [-962, 251], "cxn:head": [-986, 292], "cxn:hoping-construction": [572, -1660], "cxn:hoping-predicate": [625, -1473], "cxn:human-noun": [-2193, 1205], "cxn:human-propensity-term": [-587, 1301], "cxn:human-proper-noun": [-1763, 1196], "cxn:identificational-construction": [-998, -287], "cxn:imperative-hortative-construction": [-936, -739], "cxn:inalienable-possession-attributive-phrase": [-1164, 792], "cxn:inalienable-possession-modification-construction": [-923, 690], "cxn:inclusive-disjunctive-coordination": [-619, -1447], "cxn:inclusive-pronoun": [-1691, 1468], "cxn:inclusory-construction": [-659, 1249], "cxn:indefinite-article": [-1036, 1261], "cxn:indefinite-pronoun": [-1413, 1369], "cxn:indirect-negation-pronoun": [-1301, 1697], "cxn:information-question-construction": [-1401, -284], "cxn:information-question-response-construction": [-1156, -919], "cxn:ingestion-verb": [697, 426], "cxn:intensifier": [-638, 1038], "cxn:interaction-verb": [370, 628], "cxn:interrogative-complement": [115, -623], "cxn:interrogative-construction": [-1162, -415], "cxn:interrogative-pronoun": [-1101, 602], "cxn:intransitive-construction": [724, 381], "cxn:introverted-verb": [3, 595], "cxn:irrealis-pronoun": [-1338, 1691], "cxn:killing-injuring-verb": [290, 862], "cxn:kinship-noun": [-2149, 1176], "cxn:knowledge-construction": [426, -1664], "cxn:knowledge-predicate": [525, -1489], "cxn:let-alone-construction": [-340, -1120], "cxn:locational-construction": [-1130, 79], "cxn:locative-modification-construction": [-774, 674], "cxn:locative-phrase": [-812, 716], "cxn:logophoric-construction": [435, -649], "cxn:main-clause": [-447, -415], "cxn:manipulative-construction": [232, -1263], "cxn:manipulative-predicate": [366, -1196], "cxn:manner-complex-predicate": [1093, -1131], "cxn:manner-of-motion-verb": [267, 153], "cxn:manner-verb": [252, 474], "cxn:material-term": [-568, 1317], "cxn:matrix-clause": [-430, -479], "cxn:means-construction": [-544, -939], "cxn:measure-term": [-120, 1612], "cxn:measurement": [-630, 992], "cxn:mensural-attributive-phrase": [-429, 1177], "cxn:mensural-modification-construction": [-381, 970], "cxn:mensural-term": [-202, 1382], "cxn:modification-construction": [-410, 771], "cxn:modifier": [-340, 844], "cxn:motion-construction": [449, 548], "cxn:motion-verb": [181, 201], "cxn:natural-object-noun": [-2124, 1228], "cxn:negation-construction": [-934, -759], "cxn:negative-circumstantial-construction": [-543, -987], "cxn:negative-question-polarity-response-construction": [-1517, -1204], "cxn:nominal-attributive-phrase": [-810, 855], "cxn:nominal-modification-construction": [-613, 679], "cxn:nominal-phrase": [-606, 764], "cxn:non-exhaustive-list-coordination": [-645, -1337], "cxn:nonanaphoric-definite-article": [-800, 1121], "cxn:nonbasic-voice": [451, 428], "cxn:nonclausal-coordination": [-861, -843], "cxn:nonpredicational-construction": [-1007, -210], "cxn:nonprototypical-construction": [-125, 208], "cxn:nonprototypical-predication-construction": [-490, 104], "cxn:nonsubject-argument-phrase": [584, 652], "cxn:noun": [-1012, 871], "cxn:noun-complement": [-577, -468], "cxn:noun-complement-clause-construction": [-552, -507], "cxn:noun-complement-head": [-846, 398], "cxn:noun-complement-matrix-clause": [-639, -237], "cxn:noun-complement-referring-phrase": [-702, 191], "cxn:numeral-attributive-phrase": [-501, 1167], "cxn:numeral-modification-construction": [-481, 1103], "cxn:object-identity-construction": [493, -96], "cxn:object-phrase": [807, 610], "cxn:oblique-phrase": [577, 517], "cxn:ordinal-numeral-term": [-189, 1512], "cxn:p-phrase": [975, 684], "cxn:partitive-construction": [-469, 979], "cxn:partitive-phrase": [-731, 1083], "cxn:passive-inverse-a-phrase": [788, 811], "cxn:passive-inverse-p-phrase": [823, 768], "cxn:passive-inverse-voice": [770, 555], "cxn:path-verb": [254, 54], "cxn:perception-clause": [-3, 936], "cxn:perception-complement-clause-construction": [245, -1240], "cxn:perception-complement-taking-predicate": [389, -1199], "cxn:perception-verb": [183, 885], "cxn:personal-pronoun": [-1166, 1319], "cxn:physical-property-term": [-592, 1334], "cxn:piece-term": [-263, 1298], "cxn:place-noun": [-2129, 1283], "cxn:place-proper-noun": [-1738, 1226], "cxn:plant-noun": [-2147, 1257], "cxn:polarity-focus-construction": [-1272, -429], "cxn:polarity-question-construction": [-1427, -272], "cxn:polarity-response-construction": [-1279, -996], "cxn:positive-question-polarity-response-construction": [-1531, -1167], "cxn:possessed-argument-construction": [338, 770], "cxn:possession-construction": [-688, -270], "cxn:possessive-attributive-phrase": [-997, 749], "cxn:possessive-modification-construction": [-849, 669], "cxn:possessive-pronoun": [-1264, 975], "cxn:possessor-argument-phrase": [225, 688], "cxn:pragmatically-nonspecific-article": [-953, 1078], "cxn:pragmatically-nonspecific-pronoun": [-1368, 1196], "cxn:pragmatically-specific-article": [-943, 1055], "cxn:pragmatically-specific-pronoun": [-1374, 1174], "cxn:predicate": [57, -121], "cxn:predicate-adjectival-construction": [-432, 110], "cxn:predicate-identity-construction": [475, -75], "cxn:predicate-nominal-construction": [-294, 45], "cxn:predicational-location-construction": [-900, 83], "cxn:predicational-possession-construction": [-630, -131], "cxn:presentational-construction": [-1016, -138], "cxn:presentational-location-construction": [-1116, 1], "cxn:presentational-possession-construction": [-782, -232], "cxn:pretense-construction": [453, -1642], "cxn:pretense-predicate": [545, -1468], "cxn:prohibitive-construction": [-1002, -937], "cxn:pronominal-argument-complex-predicate": [756, -929], "cxn:pronoun": [-1274, 1191], "cxn:proper-noun": [-1488, 1109], "cxn:property-referring-phrase": [-543, 356], "cxn:proportional-quantifier-term": [-95, 1577], "cxn:propositional-attitude-construction": [323, -1394], "cxn:propositional-attitude-predicate": [439, -1307], "cxn:protasis-clause": [-626, -639], "cxn:prototypical-construction": [-383, 521], "cxn:purpose-construction": [-478, -990], "cxn:pursuit-verb": [434, 765], "cxn:quantifier-attributive-phrase": [-465, 1205], "cxn:quantifier-modification-construction": [-424, 1103], "cxn:quantifier-term": [-209, 1345], "cxn:question-pronoun": [-1304, 1719], "cxn:r-phrase": [953, 787], "cxn:reciprocal-construction": [96, 583], "cxn:reference-tracking-construction": [186, -154], "cxn:referent-expression": [-622, 497], "cxn:referring-phrase": [-478, 491], "cxn:reflexive-construction": [85, 522], "cxn:relative-clause": [-519, 232], "cxn:relative-clause-construction": [-443, -96], "cxn:relative-clause-head": [-569, 257], "cxn:relative-matrix-clause": [-581, -182], "cxn:relativized-referring-phrase": [-607, 169], "cxn:removal-verb": [327, 839], "cxn:response-construction": [-1156, -770], "cxn:result-verb": [236, 424], "cxn:resultative-complex-predicate": [1051, -1163], "cxn:s-phrase": [918, 631], "cxn:second-person-pronoun": [-1455, 1439], "cxn:semantically-nonspecific-article": [-924, 1220], "cxn:semantically-nonspecific-pronoun": [-1338, 1560], "cxn:sensation-verb": [1217, 276], "cxn:set-member-attributive-phrase": [-532, 1181], "cxn:set-member-modification-construction": [-458, 1116], "cxn:set-member-term": [-280, 1259], "cxn:shape-term": [-622, 1309], "cxn:simple-contrast-coordination": [-803, -1780], "cxn:simple-predicate": [161, 232], "cxn:social-noun": [-2163, 1141], "cxn:species-term": [-148, 1608], "cxn:specific-known-pronoun": [-1374, 1445], "cxn:specific-unknown-pronoun": [-1393, 1439], "cxn:speech-act-construction": [-870, -468], "cxn:spontaneous-verb": [275, 516], "cxn:spurious-complex-predicate": [1143, -1184], "cxn:stative-complex-predicate": [860, -934], "cxn:stative-predicate-part": [957, -944], "cxn:stimulus-phrase": [855, 676], "cxn:subject-identity-construction": [488, -273], "cxn:subject-phrase": [828, 620], "cxn:subordinate-clause": [-468, -409], "cxn:substitutive-construction": [-509, -978], "cxn:subtractive-construction": [-450, -1025], "cxn:superlative-form": [-601, 998], "cxn:support-verb": [570, -676], "cxn:support-verb-construction": [667, -647], "cxn:t-phrase": [930, 803], "cxn:temporal-construction": [-485, -954], "cxn:temporary-predicate": [392, -35], "cxn:thetic-construction": [-937, -152], "cxn:third-person-pronoun": [-1465, 1415], "cxn:topic-comment-construction": [-475, 114], "cxn:topic-phrase": [-707, 303], "cxn:transfer-verb": [387, 873], "cxn:transitive-a-phrase": [965, 716], "cxn:transitive-construction": [751, 502], "cxn:typifying-construction": [-548, 1073], "cxn:uncontrolled-predicate": [378, -20], "cxn:unexpected-co-occurrence-coordination": [-772, -1794], "cxn:universal-pronoun": [-1358, 1464], "cxn:utterance-construction": [202, -1272], "cxn:utterance-predicate": [354, -1229], "cxn:vague-numeral-term": [-159, 1578], "cxn:value-term": [-540, 1317], "cxn:verb": [247, 561], "cxn:verbal-clause": [-117, 650], "cxn:wishing-construction": [556, -1693], "cxn:wishing-predicate": [610, -1487], "inf:aboutness": [-740, 122], "inf:accessibility": [-1065, 1098], "inf:active-referent": [-878, 934], "inf:actor": [-1234, 767], "inf:admodification": [-438, 395], "inf:alternative-proposition": [-984, -204], "inf:alternative-question": [-1418, -196], "inf:anchor": [-678, 1225], "inf:announcement": [-1270, 0], "inf:appositive-modification": [-166, 349], "inf:background-description": [-1272, -36], "inf:choosing-contrast": [-1455, -461], "inf:comparative-referent": [-1239, 1551], "inf:complementative": [-184, 363], "inf:complex-figure": [-453, -591], "inf:conditional-referent": [-1176, 1599], "inf:contrast": [-1303, -394], "inf:coreference": [-82, 584], "inf:counterpresuppositional-contrast": [-1287, -411], "inf:declarative": [-841, -213], "inf:different-subject": [395, 901], "inf:direct-negation-referent": [-1153, 1610], "inf:discourse-coherence": [-465, 82], "inf:discourse-connection": [-514, -248], "inf:discourse-deixis": [-569, 515], "inf:discourse-structure": [-531, 83], "inf:entity-central": [-1116, -118], "inf:equational": [-1230, -245], "inf:event-central": [-1168, -63], "inf:exclamative": [-968, -569], "inf:expanding-contrast": [-1413, -472], "inf:explanation": [-1286, -16], "inf:figure-ground": [-536, -531], "inf:focus": [-883, -163], "inf:free-choice-referent": [-1145, 1586], "inf:generic-referent": [-1158, 1039], "inf:high-accessibility": [-1300, 1283], "inf:high-topicality": [906, -398], "inf:highest-topicality": [1245, -553], "inf:identifiability": [-1269, 1063], "inf:identificational": [-992, -268], "inf:identity-known": [-1521, 1208], "inf:identity-unknown": [-1546, 1173], "inf:imperative-hortative": [-930, -663], "inf:inactive-referent": [-862, 912], "inf:indirect-negation-referent": [-1213, 1593], "inf:inferrable-referent": [-834, 953], "inf:information-gap": [-1233, -424], "inf:information-packaging": [-359, 107], "inf:information-question": [-1415, -224], "inf:information-question-response": [-1160, -815], "inf:information-status": [-921, 710], "inf:interrogative": [-1158, -357], "inf:interrogative-unit": [-992, 857], "inf:interruption": [-1269, -64], "inf:irrealis-referent": [-1223, 1570], "inf:link": [-900, 493], "inf:listing-contrast": [-1516, -499], "inf:logophoric-subject-identity": [402, 1371], "inf:low-accessibility": [-1234, 1331], "inf:low-topicality": [734, -349], "inf:major-propositional-act": [-509, 404], "inf:medium-accessibility": [-1263, 1302], "inf:mid-topicality": [742, -306], "inf:modification": [-354, 647], "inf:negative-question-polarity-response": [-1627, -1030], "inf:non-high-topicality": [766, -348], "inf:non-low-topicality": [786, -322], "inf:nonspecific-referent": [-1057, 1354], "inf:nonverbal-contrast": [-1526, -467], "inf:object-identity": [427, 1361], "inf:parallel-contrast": [-1465, -433], "inf:polarity-question": [-1439, -214], "inf:polarity-response": [-1328, -883], "inf:poset": [-832, 301], "inf:positive-question-polarity-response": [-1600, -1047], "inf:pragmatic-assertion": [-265, -455], "inf:pragmatic-presupposition": [-798, -282], "inf:pragmatically-specific-referent": [-1002, 899], "inf:predicate-identity": [197, 1445], "inf:predication": [-321, 417], "inf:presentational": [-1060, -103], "inf:presupposed-open-proposition": [-920, -164], "inf:prohibitive": [-1026, -904], "inf:prop": [-1249, 792], "inf:question-referent": [-1186, 1568], "inf:reference": [-710, 737], "inf:referent-type-identity": [223, 1471], "inf:rejecting-contrast": [-1425, -484], "inf:replacing-contrast": [-1441, -510], "inf:response": [-1173, -615], "inf:restricting-contrast": [-1421, -529], "inf:restrictive-modification": [-200, 365], "inf:same-subject": [416, 893], "inf:selecting": [-228, 1083], "inf:semantically-specific-referent": [-1058, 1118], "inf:semi-active-referent": [-864, 964], "inf:setting": [-1214, 783], "inf:situating": [-496, 989], "inf:specific-known-referent": [-1236, 1375], "inf:specific-unknown-referent": [-1197, 1390], "inf:speech-acts": [-846, -321], "inf:subcategorizing": [-306, 685], "inf:theater-metaphor": [-1003, 580], "inf:thetic": [-944, -140], "inf:token-identity": [257, 1034], "inf:topic-comment": [-630, 197], "inf:topicality": [427, -166], "inf:trigger": [-922, 495], "inf:type-identifiable": [-1370, 1337], "inf:type-identity": [106, 1105], "inf:verbal-contrast": [-1524, -435], "sem:a-role": [1572, -78], "sem:achievement": [776, -1501], "sem:action-concept": [374, 498], "sem:addition": [-335, -1637], "sem:additive": [-444, -1431], "sem:addressee": [808, -377], "sem:affectee": [860, -133], "sem:affecting": [4475, -4519], "sem:age": [42, 1638], "sem:agent": [1302, -16], "sem:agentive-change-of-state-event": [489, 539], "sem:agentive-experience-event": [1546, 177], "sem:agentive-ingestion-event": [1543, 237], "sem:amount": [1337, 1367], "sem:animacy": [-375, 1930], "sem:animate": [-369, 1742], "sem:antecedent-role": [1050, 126], "sem:anterior": [-457, -1237], "sem:apodosis": [-802, -1395], "sem:application-event": [93, 755], "sem:apprehensional": [-369, -1488], "sem:arrangement": [1944, 1621], "sem:arrival": [-17, -179], "sem:aspect": [296, -124], "sem:atelic": [1281, 525], "sem:attending": [4530, -4630], "sem:avalent": [1630, -195], "sem:base-event": [1161, 472], "sem:beneficiary": [1092, -96], "sem:bivalent": [1233, -19], "sem:bodily-action": [348, 410], "sem:bodily-motion-event": [-111, 590], "sem:body-care-event": [-118, 689], "sem:body-part-relation": [-700, 467], "sem:body-position-event": [381, 324], "sem:cardinal-numeral": [996, 1419], "sem:categorical": [1973, -6284], "sem:causal": [-191, -1489], "sem:causal-chain": [889, 183], "sem:causal-chain-profile": [3636, -5210], "sem:causal-control": [5167, -3528], "sem:causal-cyclicality": [-5777, 2455], "sem:causal-directionality": [4457, -4587], "sem:causal-directness": [365, -6344], "sem:causal-link": [-1072, -1579], "sem:causal-structure": [904, 332], "sem:causative-event": [1216, 373], "sem:cause": [1203, 38], "sem:caused-motion": [23, 732], "sem:causee": [1012, -41], "sem:causer": [1271, 92], "sem:central-participant": [768, 166], "sem:chaining": [-5875, 2493], "sem:change-in-position-event": [-105, 558], "sem:change-of-state-event": [564, 406], "sem:change-type": [1521, 559], "sem:co-actor": [667, -123], "sem:cognition-event": [1355, 248], "sem:collective": [-5811, 2538], "sem:color": [43, 1667], "sem:combining-event": [118, 757], "sem:comitative": [968, -97], "sem:commentative-event": [813, -1366], "sem:communication-event": [83, 971], "sem:comparative-conditional-relation": [-256, -1572], "sem:comparative-degree": [-418, 1506], "sem:comparative-relation": [-215, -1657], "sem:comparee": [282, -1497], "sem:completive": [947, -1975], "sem:concessive-conditional-relation": [-134, -1449], "sem:concessive-relation": [-340, -1558], "sem:concomitant-role": [1209, 117], "sem:conditional-relation": [-642, -1401], "sem:consecutive": [-423, -1244], "sem:contact-by-impact-event": [58, 892], "sem:contact-event": [-56, 939], "sem:container": [1899, 1691], "sem:content-causal-relation": [-953, -1448], "sem:contextual": [-1850, 1436], "sem:continuative": [992, -1940], "sem:controlled": [5195, -3462], "sem:creation-event": [-28, 963], "sem:damage-event": [82, 878], "sem:degree": [-366, 1192], "sem:deontic-modality": [-713, -830], "sem:departure": [-35, -201], "sem:dependent-time-reference": [764, -1557], "sem:desiderative-event": [797, -957], "sem:dimension": [-10, 1656], "sem:direct-causation": [422, -6389], "sem:directed-change": [1294, 481], "sem:distal": [-1792, 1480], "sem:distributive-quantifier": [1346, 1342], "sem:downtoning": [-442, 1523], "sem:durative": [1295, 451], "sem:durativity": [1533, 485], "sem:dynamic": [528, 610], "sem:emotion-event": [1345, 201], "sem:endpoint": [838, 197], "sem:entity": [51, -33], "sem:epistemic-causal-relation": [-933, -1472], "sem:epistemic-modality": [-663, -832], "sem:epistemic-stance": [-922, -1407], "sem:equative-relation": [-192, -1647], "sem:evaluative-event": [811, -1117], "sem:event": [521, 334], "sem:event-oriented": [1228, -1326], "sem:event-relation": [-279, -1298], "sem:eventive-participant-event": [785, -603], "sem:eventive-perception-event": [1093, -759], "sem:evidentiality": [-592, -923], "sem:exclusive-disjunction": [-368, -1663], "sem:exhaustive-list": [-277, -1641], "sem:existence-event": [-482, 363], "sem:experience": [4424, -4652], "sem:experiencer": [843, 4], "sem:experiential-event": [1195, 218], "sem:expertum": [1082, -35], "sem:external-cause": [1125, -39], "sem:extroverted": [-5713, 2522], "sem:fearing-event": [857, -1349], "sem:figure": [459, -252], "sem:figure-ground-spatial-relation": [-474, 346], "sem:first-person": [-2209, 1645], "sem:force": [1201, -9], "sem:future-oriented": [-941, -1001], "sem:gender-class": [295, 1355], "sem:generic-conditional-relation": [-809, -1442], "sem:gradable-predicative-scale": [-78, -1753], "sem:gradient": [1931, -6160], "sem:ground": [554, -248], "sem:group": [1862, 1702], "sem:hearer": [277, 1247], "sem:hoping-event": [822, -1316], "sem:human": [-398, 1750], "sem:human-propensity": [67, 1639], "sem:hypothetical": [-883, -1411], "sem:identity": [-2024, 1606], "sem:inanimate": [-352, 1757], "sem:inceptive": [1011, -2019], "sem:inclusive-disjunction": [-316, -1623], "sem:independent-time-reference": [793, -1549], "sem:indirect-causation": [403, -6294], "sem:ingestion-event": [1367, 219], "sem:initiator": [836, 224], "sem:instrument": [1105, 150], "sem:intensifying": [-377, 1513], "sem:interaction-event": [233, 645], "sem:introverted": [-5860, 2416], "sem:killing-injuring-event": [92, 901], "sem:kinship-relation": [-712, 437], "sem:knowledge-event": [858, -1296], "sem:less-affected-p": [1477, 292], "sem:less-individuated-p": [1478, 264], "sem:let-alone-relation": [-374, -1632], "sem:maleficiary": [1074, -82], "sem:manipulative-event": [836, -974], "sem:manner": [30, -7034], "sem:manner-of-motion-event": [169, -152], "sem:manner-profile": [3584, -5253], "sem:material": [-48, 1653], "sem:meaning": [-58, 61], "sem:means": [-391, -1480], "sem:measure": [1921, 1657], "sem:measuring": [-470, 1515], "sem:mensural-concept": [1686, 1506], "sem:mental-space": [-64, -889], "sem:message": [735, -193], "sem:mirative": [-534, -866], "sem:modality": [-412, -790], "sem:monovalent": [1257, 15], "sem:motion-event": [33, 21], "sem:necessary-participant-sharing": [813, -1492], "sem:negative-circumstantial": [-302, -1485], "sem:negative-epistemic-stance": [-914, -1379], "sem:negative-polarity": [-745, -821], "sem:neutral-epistemic-stance": [-886, -1430], "sem:non-exhaustive-list": [-402, -1607], "sem:nonrelational": [148, 1086], "sem:number": [639, 1019], "sem:numeral": [677, 1407], "sem:object-concept": [103, 946], "sem:objective": [-713, -948], "sem:occupant": [851, -344], "sem:ordinal-numeral": [1008, 1562], "sem:orientation": [1384, -1511], "sem:other": [191, 1275], "sem:ownership": [-688, 436], "sem:p-role": [1318, 104], "sem:part-whole-relation": [-674, 421], "sem:participant-oriented": [1210, -1346], "sem:participant-role": [620, 58], "sem:passing": [-60, -184], "sem:path-event": [148, -165], "sem:patient": [962, 8], "sem:perception-event": [1558, 215], "sem:peripheral-participant": [814, 135], "sem:persistent": [211, 1008], "sem:person": [260, 1272], "sem:person-deixis": [-1993, 1484], "sem:phasal-aspect": [874, -1737], "sem:physical-property": [16, 1662], "sem:piece": [1912, 1617], "sem:place": [238, 1244], "sem:polarity": [-424, -766], "sem:positive-epistemic-stance": [-947, -1362], "sem:positive-polarity": [-726, -806], "sem:possession": [-439, 342], "sem:possessor": [19, 69], "sem:possessum": [-116, 113], "sem:posterior": [-435, -1224], "sem:pretense-event": [882, -1303], "sem:property-concept": [2, 1317], "sem:proportional-quantifier": [1371, 1323], "sem:proposition": [59, -639], "sem:propositional-attitude-event": [842, -1060], "sem:propositional-content": [129, -109], "sem:protasis": [-784, -1451], "sem:proximal": [-1819, 1383], "sem:punctual": [1301, 431], "sem:purpose": [-374, -1455], "sem:pursuit-event": [263, 674], "sem:qualitative-event": [49, 653], "sem:quantitative-relation": [1101, 1146], "sem:quantity": [100, -211], "sem:recipient": [927, -95], "sem:reciprocal": [-5728, 2450], "sem:reference-point": [-284, 1365], "sem:reflexive": [-5773, 2365], "sem:relational": [172, 1082], "sem:relationality": [232, 1315], "sem:removal-event": [62, 747], "sem:result-profile": [3702, -5234], "sem:s-role": [965, -17], "sem:scalar-model": [-24, -1526], "sem:scale": [1951, -6220], "sem:second-person": [-2241, 1576], "sem:semantic-role": [808, -84], "sem:sensation-event": [1341, 173], "sem:set-member": [1198, 1452], "sem:shape": [89, 1639], "sem:simple-contrast": [-457, -1407], "sem:simultaneous": [-332, -1505], "sem:social-event": [93, 638], "sem:social-role": [1062, -266], "sem:social-role-event": [146, 939], "sem:sociative-causation": [321, -6418], "sem:spatial-deixis": [-1806, 1436], "sem:spatial-event": [61, 474], "sem:speaker": [216, 1292], "sem:species": [1881, 1663], "sem:speech-act-causal-relation": [-971, -1425], "sem:spontaneous": [5118, -3580], "sem:standard": [72, -1814], "sem:state": [3, 867], "sem:stative": [531, 587], "sem:stativity": [516, 768], "sem:stimulus": [889, 31], "sem:subjective": [-689, -968], "sem:subsequent-role": [893, 71], "sem:substitution": [-413, -1625], "sem:substitutive": [-283, -1493], "sem:subtraction": [-307, -1656], "sem:subtractive": [-332, -1474], "sem:superlative-degree": [-404, 1536], "sem:tamp": [76, -611], "sem:telic": [1266, 542], "sem:telicity": [1499, 613], "sem:tense": [472, -410], "sem:terminative": [1007, -1973], "sem:theme": [821, -22], "sem:thing": [185, 1253], "sem:third-person": [-2228, 1612], "sem:time": [181, -189], "sem:time-reference": [841, -1715], "sem:time-stability": [281, 632], "sem:token": [-1849, 1511], "sem:topic": [753, -216], "sem:transfer-of-possession-event": [287, 928], "sem:transitoriness": [319, 990], "sem:transitory": [184, 1008], "sem:trivalent": [1257, 41], "sem:type": [-1868, 1486], "sem:uncontrolled": [5251, -3570], "sem:undergoer": [555, -39], "sem:undirected-change": [1284, 498], "sem:unexpected-co-occurrence": [-479, -1432], "sem:utterance-event": [812, -962], "sem:vague-numeral": [1311, 1385], "sem:valency": [1323, -55], "sem:value": [98, 1613], "sem:weather-event": [-490, 319], "sem:wishing-event": [820, -1344], "str:a-not-a": [153, -741], "str:absolute-deranking-system": [1341, 708], "str:absolutive-category": [1767, -43], "str:accusative-alignment": [1699, -97], "str:accusative-category": [1783, -54], "str:action-nominal": [255, -873], "str:active-alignment": [934, 42], "str:active-category": [921, 99], "str:actual-information-packaging-strategy": [1080, 472], "str:adjective-impersonal-strategy": [259, -489], "str:adjective-personal-strategy": [324, -532], "str:adjoined-strategy": [637, -1180], "str:adnominal-possessive-strategy": [-183, -414], "str:adposition": [654, 1031], "str:adpositional-personal-strategy": [296, -516], "str:adpositional-strategy": [246, -547], "str:adverbial-clause-strategy": [-1173, 329], "str:adverbial-strategy": [261, -524], "str:adverbializer": [780, -709], "str:affixal-negation": [198, -784], "str:affixation": [-114, 308], "str:agree-disagree-alignment": [-419, -665], "str:alignment-system": [937, -76], "str:allative-comparative": [451, -1118], "str:alternative-concessive-conditional-strategy": [57, -894], "str:anchoring-nominal-strategy": [-1235, 226], "str:animacy-based-split-ergativity": [1293, 299], "str:anterior-deranking": [-20, -430], "str:anterior-zero": [576, 397], "str:antipassive-alignment": [1406, 27], "str:applicative-alignment": [1465, -29], "str:associative-equative": [499, -1186], "str:associative-strategy": [149, -804], "str:asyndetic": [589, -82], "str:balancing": [191, -413], "str:bare-verb-stem": [-326, -756], "str:base-object-inertia": [1816, -6], "str:basic-word-order": [210, -12], "str:biclausal-reciprocal": [-562, 394], "str:bisyndetic": [974, -367], "str:case-affix": [674, 954], "str:causative-alignment": [1344, -36], "str:causative-applicative-co-expression": [719, 218], "str:causative-coordinate-strategy": [173, -763], "str:causative-predicational-strategy": [87, -791], "str:circumposition": [707, 1149], "str:classifier": [449, 857], "str:clause-alignment": [497, -361], "str:cleft-strategy": [-738, 54], "str:co-expression": [425, 103], "str:cognate-head-dependent-strategy": [399, -754], "str:complement-disalignment": [1369, -249], "str:complementizer": [1196, -604], "str:complex-predicate-asc-strategy": [809, 301], "str:compounding": [-59, 357], "str:conditional-deranking": [1317, 663], "str:conditional-discourse-reference-system": [1336, 612], "str:conjoined-comparative": [416, -1126], "str:conjoined-exceed-comparative": [624, -948], "str:conjunction": [870, -375], "str:contiguity-of-serial-verbs": [1018, -1083], "str:control-based-strategy": [1465, 110], "str:controller": [503, 667], "str:converb": [51, -871], "str:converb-strategy": [217, -518], "str:coordinate-clause-strategy": [-1276, 258], "str:coordinate-impersonal-strategy": [236, -480], "str:coordinate-personal-strategy": [299, -549], "str:coordinator": [996, -457], "str:copula": [270, 107], "str:copular-participle-strategy": [320, -481], "str:correlative-strategy": [656, -1155], "str:declarative-marker": [907, 195], "str:definite-article-strategy": [-1219, 197], "str:degree-affix": [-323, 744], "str:degree-equative": [591, -1027], "str:degree-marker": [117, -306], "str:degree-modifier": [-305, 744], "str:demonstrative-strategy": [-1196, 266], "str:deranking": [108, -594], "str:derived-case": [401, -956], "str:detached-complement-strategy": [1690, -356], "str:detached-topic-phrase": [-242, -499], "str:differential-object-marking": [1305, 268], "str:direct-object-category": [1080, 1163], "str:direct-question-strategy": [-1262, 214], "str:direct-report": [996, -992], "str:discourse-reference-system": [1341, 635], "str:ditransitive-alignment": [1084, 576], "str:domain": [555, 655], "str:double-coding-strategy": [1403, 88], "str:double-expression": [326, -634], "str:double-negation-strategy": [-302, -647], "str:double-oblique-strategy": [1381, 55], "str:doubling": [-131, -120], "str:dual-role-strategy": [-387, 306], "str:echo-strategy": [-382, -671], "str:ellipsis": [-161, -313], "str:encoding-strategy": [145, -488], "str:equal-equative": [608, -1037], "str:ergative-alignment": [1701, -119], "str:ergative-category": [1775, -113], "str:exceed-comparative": [579, -952], "str:existential-negative-strategy": [-1224, 382], "str:experiencer-oriented-strategy": [1376, 104], "str:experiential-alignment": [1328, -48], "str:external-possessor-strategy": [-829, 579], "str:externally-headed": [-103, -665], "str:extraposed-strategy": [-157, -438], "str:figure-incorporating": [308, -656], "str:first-person-plural-strategy": [-1236, 344], "str:fixed-case": [459, -1017], "str:flagging": [560, 700], "str:focus-marker": [74, 41], "str:fusion": [364, -324], "str:gap-strategy": [-160, -887], "str:general-extender": [459, -511], "str:have-possessive-strategy": [-213, -391], "str:headless": [285, 580], "str:human-noun-strategy": [-1256, 319], "str:hybrid-information-packaging-strategy": [1098, 491], "str:identificational-strategy": [-1213, 309], "str:ideophones": [29, -544], "str:inactive-category": [929, 73], "str:inclusory-strategy": [128, -777], "str:incorporation-of-serial-verbs": [1029, -1063], "str:independent-referring-phrase-strategy": [-1117, 148], "str:independent-strategy": [350, -978], "str:index": [487, 690], "str:indexation": [395, 427], "str:indexation-feature": [562, 684], "str:indexed": [488, -151], "str:indirect-object-category": [1099, 1186], "str:indirect-report": [945, -987], "str:indirective-alignment": [1090, 965], "str:information-packaging-alignment": [1124, 277], "str:insubordination": [-553, -114], "str:internal-possessor-strategy": [-806, 614], "str:internal-recipient-strategy": [-815, 821], "str:internally-headed-strategy": [658, -1180], "str:interrogative-complementizer": [1543, -671], "str:interrogative-pronoun-strategy": [-1183, 294], "str:juxtaposition": [-28, 378], "str:linker": [539, 42], "str:locational-possessive-strategy": [-759, -9], "str:locational-strategy": [97, -165], "str:locative-comparative": [490, -1105], "str:locus-of-inflection-of-serial-verbs": [1008, -1103], "str:logophoric-system": [674, -277], "str:long-distance-reflexive": [450, -631], "str:mensural-classifier": [-82, 90], "str:merged-argument-structure-strategy": [352, -720], "str:middle-voice": [-569, 364], "str:monoclausal-transitive-reciprocal-strategy": [-547, 392], "str:monosyndetic": [993, -353], "str:negative-auxiliary-strategy": [-1207, 348], "str:negative-fusion": [549, -532], "str:negative-particle": [96, -755], "str:neutral-alignment": [1674, -146], "str:neutral-ditransitive-alignment": [1116, 888], "str:nominalizer": [36, 468], "str:nominative-category": [1767, -75], "str:non-externally-headed": [494, -950], "str:non-indexed": [337, -48], "str:non-nominative-flag-index": [1564, -124], "str:nonperson-indexation": [522, 814], "str:nonspecific-article-strategy": [-1277, 312], "str:nonspecific-pronoun-strategy": [-1188, 396], "str:nonverbal-copula-strategy": [245, 188], "str:noun-incorporation": [1428, 105], "str:noun-modifying-clause-strategy": [-712, -124], "str:numeral-strategy": [-1242, 287], "str:object-equative": [586, -1347], "str:oblique-p-strategy": [1674, 20], "str:omitted-a-strategy": [1710, 234], "str:omitted-p-strategy": [1514, 261], "str:ordered-strategy": [375, -944], "str:overt-article": [878, 191], "str:overt-coding": [542, 94], "str:overt-pronoun": [867, 262], "str:overtly-coded-single-role-strategy": [63, 278], "str:overtly-coded-verb": [837, 283], "str:overtly-headed-strategy": [374, 511], "str:partially-merged-argument-structure-strategy": [369, -733], "str:participial-strategy": [273, -566], "str:participle": [316, -764], "str:particle-comparative": [438, -1122], "str:particle-equative": [461, -1208], "str:passive-inverse-alignment": [1367, 145], "str:perception-verb-strategy": [-1136, 137], "str:person-indexation": [652, 656], "str:phenomime": [-15, -560], "str:phonomime": [-47, -540], "str:polarity-response-alignment": [64, -466], "str:possessive-locative-strategy": [-431, -280], "str:posterior-deranking": [0, -435], "str:posterior-zero": [517, 402], "str:postnominal-strategy": [-91, -501], "str:postposition": [650, 1163], "str:predicational-locative-strategy": [-1122, 109], "str:predicational-strategy": [223, -558], "str:predicativization-possessive-strategy": [-191, -389], "str:prenominal-strategy": [-69, -508], "str:preposition": [680, 1155], "str:primary-object-category": [1131, 1152], "str:pronoun-retention-strategy": [-186, -879], "str:prosody": [194, -358], "str:pseudo-partitive": [-670, 527], "str:psychomime": [-22, -589], "str:question-marker": [831, 256], "str:quotative-marker": [1417, -808], "str:reciprocal-strategy": [-1230, 257], "str:recruitment-strategy": [-875, 244], "str:reference-tracking-system": [1077, 455], "str:reflexive-strategy": [-1182, 366], "str:relational-strategy": [604, 537], "str:relative-based-equative": [441, -1201], "str:relative-equal-equative": [567, -1010], "str:relative-pronoun-strategy": [-140, -904], "str:relative-strategy": [598, -684], "str:relativizer": [844, -610], "str:repeater": [656, 1103], "str:satellite": [348, -256], "str:satellite-framing-strategy": [252, -299], "str:scalar-concessive-conditional-strategy": [40, -910], "str:second-position": [1003, -951], "str:secondary-object-category": [1140, 1128], "str:secundative-alignment": [1114, 948], "str:semantic-information-packaging-strategy": [1100, 457], "str:separative-comparative": [464, -1100], "str:serial-verb-strategy": [778, -902], "str:simple-strategy": [68, 323], "str:single-role-strategy": [-387, 331], "str:sortal-classifier": [75, 853], "str:special-form": [267, -256], "str:special-p-strategy": [578, -157], "str:specialized-dual-role-strategy": [60, 257], "str:split-argument-structure-strategy": [346, -766], "str:split-structure": [736, -118], "str:stamp-strategy": [1026, -932], "str:stimulus-oriented-strategy": [1381, 80], "str:strategy": [-143, -15], "str:subject-predicate-alignment": [1213, -86], "str:summarizer": [469, -528], "str:switch-reference-system": [1443, 853], "str:syndetic": [847, -213], "str:system": [505, 62], "str:tag": [-280, -608], "str:target": [525, 647], "str:tense-iconicity": [-144, -766], "str:thetic-marker": [888, 227], "str:topic-locational-hybrid-possessive-strategy": [-200, -413], "str:topic-marker": [800, 247], "str:topic-possessive-strategy": [-189, -357], "str:transitive-alignment": [1466, -130], "str:transitivity-based-strategy": [1485, 110], "str:tripartite-alignment": [1666, -107], "str:unique-equative": [625, -1328], "str:universal-concessive-conditional-strategy": [71, -916], "str:universal-pronoun-strategy": [-1196, 233], "str:utterance-clause-alignment": [1034, -631], "str:verb-coding-strategy": [456, 47], "str:verb-framing-strategy": [227, -310], "str:verbal-copula": [156, 102], "str:verbal-strategy": [259, 299], "str:with-possessive-strategy": [-180, -365], "str:word-order": [31, -185], "str:yes-no-alignment": [-426, -682], "str:yes-no-disagree-alignment": [-431, -655], "str:zero-anaphora": [-165, 628], "str:zero-article": [577, 329], "str:zero-coded-verb": [669, 369], "str:zero-coding": [345, 225], "str:zero-copula": [272, 263]}}}};
@@ -0,0 +1 @@
+var SEARCH_INDEX = {"version": "1.0", "fields": ["name", "alias", "definition"], "weights": {"name": 3, "alias": 2, "definition": 1}, "ids": ["1", "1.1", "1.2", "1.2.1", "1.2.2", "1.2.3", "1.3", "1.4", "1.5", "1.6", "10", "10.1", "10.1.1", "10.1.2", "10.2", "10.3", "10.4", "10.4.1", "10.4.2", "10.4.3", "11", "11.1", "11.2", "11.2.1", "11.2.2", "11.2.3", "11.3", "11.3.1", "11.3.2", "11.3.3", "11.4", "11.4.1", "11.4.2", "12", "12.1", "12.2", "12.3", "12.3.1", "12.3.2", "12.3.3", "12.3.4", "12.4", "12.4.1", "12.4.2", "12.5", "12.5.2", "13", "13.1", "13.1.1", "13.1.2", "13.2", "13.2.1", "13.2.2", "13.3", "13.3.2", "13.4", "13.5", "13.6", "14", "14.1", "14.2", "14.3", "14.4", "14.5", "15", "15.1", "15.1.1", "15.1.2", "15.1.3", "15.2", "15.2.1", "15.2.2", "15.2.3", "15.3", "15.3.1", "15.3.2", "16", "16.1", "16.2", "16.3", "16.4", "16.5", "17", "17.2", "17.2.1", "17.2.2", "17.2.3", "17.2.4", "17.3", "17.3.1", "17.3.2", "17.3.3", "17.4", "17.4.1", "17.4.2", "18", "18.2", "18.2.1", "18.2.2", "18.3", "18.3.1", "18.3.2", "18.4", "18.4.1", "18.4.2", "19", "19.1", "19.2", "19.2.1", "19.2.2", "19.2.3", "19.2.4", "19.3", "19.4", "2", "2.1", "2.2", "2.2.1", "2.2.2", "2.2.3", "2.2.4", "2.2.5", "2.3", "2.4", "2.5", "3", "3.1", "3.1.1", "3.1.2", "3.1.3", "3.2", "3.3", "3.3.1", "3.3.2", "3.3.3", "3.4", "3.4.1", "3.4.2", "3.5", "3.6", "4", "4.1", "4.1.1", "4.1.2", "4.1.3", "4.1.4", "4.2", "4.3", "4.4", "4.4.1", "4.4.2", "4.4.3", "4.4.4", "4.5", "5", "5.2", "5.2.1", "5.2.2", "5.2.3", "5.2.4", "5.3", "5.4", "6", "6.1", "6.1.1", "6.1.2", "6.2", "6.2.1", "6.2.2", "6.3", "6.3.1", "6.3.2", "6.3.3", "6.3.4", "6.6", "6.6.1", "7", "7.2", "7.3", "7.3.1", "7.3.2", "7.3.3", "7.4", "7.5", "7.5.1", "7.5.2", "7.5.3", "8", "8.1", "8.3", "8.4", "9", "9.1", "9.2", "9.3", "9.4", "book", "cxn:action-modification-construction", "cxn:additive-construction", "cxn:additive-coordination", "cxn:adjectival-phrase", "cxn:adjective", "cxn:adjective-modification-construction", "cxn:admodifier", "cxn:adverbial-clause-construction", "cxn:adverbial-dependent-clause", "cxn:adverbial-matrix-clause", "cxn:adversative-coordination", "cxn:affecting-verb", "cxn:age-term", "cxn:agentive-change-of-state-verb", "cxn:alienable-possession-attributive-phrase", "cxn:alienable-possession-modification-construction", "cxn:alternative-question-construction", "cxn:amount-term", "cxn:anaphoric-article", "cxn:anaphoric-head-construction", "cxn:anaphoric-head-relative-clause-construction", "cxn:anaphoric-pronoun", "cxn:anchoring-construction", "cxn:animal-noun", "cxn:animal-plant-product-noun", "cxn:antipassive-construction", "cxn:antipassive-oblique-phrase", "cxn:antonym", "cxn:apodosis-clause", "cxn:application-verb", "cxn:applicative-construction", "cxn:applicative-object-phrase", "cxn:apposition", "cxn:apprehensional-construction", "cxn:argument-complex-predicate", "cxn:argument-phrase", "cxn:argument-predicate-part", "cxn:article", "cxn:associative-construction", "cxn:attending-verb", "cxn:attributive-phrase", "cxn:auxiliary", "cxn:auxiliary-construction", "cxn:basic-voice", "cxn:binominal-lexeme", "cxn:bodily-motion-verb", "cxn:bodily-predicate", "cxn:body-care-verb", "cxn:body-part-noun", "cxn:body-position-predicate", "cxn:cardinal-numeral-term", "cxn:causal-construction", "cxn:causative-construction", "cxn:causee-phrase", "cxn:causer-phrase", "cxn:chaining-construction", "cxn:change-in-position-verb", "cxn:change-of-state-verb", "cxn:clause", "cxn:cognition-verb", "cxn:collective-construction", "cxn:color-term", "cxn:combining-verb", "cxn:commentative-construction", "cxn:commentative-predicate", "cxn:common-noun", "cxn:comparative-conditional-construction", "cxn:comparative-construction", "cxn:comparative-form", "cxn:comparative-pronoun", "cxn:complement", "cxn:complement-clause-construction", "cxn:complement-matrix-clause", "cxn:complement-taking-predicate", "cxn:complementary", "cxn:complex-predicate", "cxn:complex-predicate-part", "cxn:complex-sentence", "cxn:concessive-conditional-construction", "cxn:concessive-construction", "cxn:conditional-construction", "cxn:conditional-pronoun", "cxn:conjunctive-coordination", "cxn:consecutive-coordination", "cxn:construction", "cxn:contact-by-impact-verb", "cxn:container-term", "cxn:controlled-predicate", "cxn:coordinand", "cxn:coordinate-clause-construction", "cxn:coordinate-construction", "cxn:core-argument-phrase", "cxn:damage-verb", "cxn:declarative-construction", "cxn:declarative-negation-construction", "cxn:definite-article", "cxn:definite-pronoun", "cxn:demonstrative-attributive", "cxn:demonstrative-pronoun", "cxn:dependent", "cxn:dependent-clause", "cxn:depictive-complex-predicate", "cxn:desiderative-construction", "cxn:desiderative-predicate", "cxn:determiner", "cxn:dimension-term", "cxn:direct-negation-pronoun", "cxn:discourse-markers", "cxn:disjunctive-coordination", "cxn:distributive-quantifier-term", "cxn:ditransitive-a-phrase", "cxn:ditransitive-construction", "cxn:downtoner", "cxn:dynamic-predicate-part", "cxn:element", "cxn:emotion-verb", "cxn:entity-central-construction", "cxn:equational-construction", "cxn:equative-construction", "cxn:evaluative-construction", "cxn:evaluative-predicate", "cxn:event-central-construction", "cxn:eventive-complex-predicate", "cxn:eventive-predicate-part", "cxn:exclamative-construction", "cxn:exclusive-disjunctive-coordination", "cxn:exclusive-pronoun", "cxn:exhaustive-list-coordination", "cxn:existential-negation-construction", "cxn:experience-verb", "cxn:experiencer-phrase", "cxn:experiential-construction", "cxn:experiential-verb", "cxn:extroverted-verb", "cxn:fearing-construction", "cxn:fearing-predicate", "cxn:figure-phrase", "cxn:first-person-pronoun", "cxn:form-term", "cxn:free-choice-pronoun", "cxn:free-modification-construction", "cxn:free-relative-clause-construction", "cxn:gender-term", "cxn:generic-article", "cxn:generic-conditional-construction", "cxn:generic-pronoun", "cxn:ground-phrase", "cxn:group-term", "cxn:hanging-topic-construction", "cxn:hanging-topic-phrase", "cxn:head", "cxn:hoping-construction", "cxn:hoping-predicate", "cxn:human-noun", "cxn:human-propensity-term", "cxn:human-proper-noun", "cxn:identificational-construction", "cxn:imperative-hortative-construction", "cxn:inalienable-possession-attributive-phrase", "cxn:inalienable-possession-modification-construction", "cxn:inclusive-disjunctive-coordination", "cxn:inclusive-pronoun", "cxn:inclusory-construction", "cxn:indefinite-article", "cxn:indefinite-pronoun", "cxn:indirect-negation-pronoun", "cxn:information-question-construction", "cxn:information-question-response-construction", "cxn:ingestion-verb", "cxn:intensifier", "cxn:interaction-verb", "cxn:interrogative-complement", "cxn:interrogative-construction", "cxn:interrogative-pronoun", "cxn:intransitive-construction", "cxn:introverted-verb", "cxn:irrealis-pronoun", "cxn:killing-injuring-verb", "cxn:kinship-noun", "cxn:knowledge-construction", "cxn:knowledge-predicate", "cxn:let-alone-construction", "cxn:locational-construction", "cxn:locative-modification-construction", "cxn:locative-phrase", "cxn:logophoric-construction", "cxn:main-clause", "cxn:manipulative-construction", "cxn:manipulative-predicate", "cxn:manner-complex-predicate", "cxn:manner-of-motion-verb", "cxn:manner-verb", "cxn:material-term", "cxn:matrix-clause", "cxn:means-construction", "cxn:measure-term", "cxn:measurement", "cxn:mensural-attributive-phrase", "cxn:mensural-modification-construction", "cxn:mensural-term", "cxn:modification-construction", "cxn:modifier", "cxn:motion-construction", "cxn:motion-verb", "cxn:natural-object-noun", "cxn:negation-construction", "cxn:negative-circumstantial-construction", "cxn:negative-question-polarity-response-construction", "cxn:nominal-attributive-phrase", "cxn:nominal-modification-construction", "cxn:nominal-phrase", "cxn:non-exhaustive-list-coordination", "cxn:nonanaphoric-definite-article", "cxn:nonbasic-voice", "cxn:nonclausal-coordination", "cxn:nonpredicational-construction", "cxn:nonprototypical-construction", "cxn:nonprototypical-predication-construction", "cxn:nonsubject-argument-phrase", "cxn:noun", "cxn:noun-complement", "cxn:noun-complement-clause-construction", "cxn:noun-complement-head", "cxn:noun-complement-matrix-clause", "cxn:noun-complement-referring-phrase", "cxn:numeral-attributive-phrase", "cxn:numeral-modification-construction", "cxn:object-identity-construction", "cxn:object-phrase", "cxn:oblique-phrase", "cxn:ordinal-numeral-term", "cxn:p-phrase", "cxn:partitive-construction", "cxn:partitive-phrase", "cxn:passive-inverse-a-phrase", "cxn:passive-inverse-p-phrase", "cxn:passive-inverse-voice", "cxn:path-verb", "cxn:perception-clause", "cxn:perception-complement-clause-construction", "cxn:perception-complement-taking-predicate", "cxn:perception-verb", "cxn:personal-pronoun", "cxn:physical-property-term", "cxn:piece-term", "cxn:place-noun", "cxn:place-proper-noun", "cxn:plant-noun", "cxn:polarity-focus-construction", "cxn:polarity-question-construction", "cxn:polarity-response-construction", "cxn:positive-question-polarity-response-construction", "cxn:possessed-argument-construction", "cxn:possession-construction", "cxn:possessive-attributive-phrase", "cxn:possessive-modification-construction", "cxn:possessive-pronoun", "cxn:possessor-argument-phrase", "cxn:pragmatically-nonspecific-article", "cxn:pragmatically-nonspecific-pronoun", "cxn:pragmatically-specific-article", "cxn:pragmatically-specific-pronoun", "cxn:predicate", "cxn:predicate-adjectival-construction", "cxn:predicate-identity-construction", "cxn:predicate-nominal-construction", "cxn:predicational-location-construction", "cxn:predicational-possession-construction", "cxn:presentational-construction", "cxn:presentational-location-construction", "cxn:presentational-possession-construction", "cxn:pretense-construction", "cxn:pretense-predicate", "cxn:prohibitive-construction", "cxn:pronominal-argument-complex-predicate", "cxn:pronoun", "cxn:proper-noun", "cxn:property-referring-phrase", "cxn:proportional-quantifier-term", "cxn:propositional-attitude-construction", "cxn:propositional-attitude-predicate", "cxn:protasis-clause", "cxn:prototypical-construction", "cxn:purpose-construction", "cxn:pursuit-verb", "cxn:quantifier-attributive-phrase", "cxn:quantifier-modification-construction", "cxn:quantifier-term", "cxn:question-pronoun", "cxn:r-phrase", "cxn:reciprocal-construction", "cxn:reference-tracking-construction", "cxn:referent-expression", "cxn:referring-phrase", "cxn:reflexive-construction", "cxn:relative-clause", "cxn:relative-clause-construction", "cxn:relative-clause-head", "cxn:relative-matrix-clause", "cxn:relativized-referring-phrase", "cxn:removal-verb", "cxn:response-construction", "cxn:result-verb", "cxn:resultative-complex-predicate", "cxn:s-phrase", "cxn:second-person-pronoun", "cxn:semantically-nonspecific-article", "cxn:semantically-nonspecific-pronoun", "cxn:sensation-verb", "cxn:set-member-attributive-phrase", "cxn:set-member-modification-construction", "cxn:set-member-term", "cxn:shape-term", "cxn:simple-contrast-coordination", "cxn:simple-predicate", "cxn:social-noun", "cxn:species-term", "cxn:specific-known-pronoun", "cxn:specific-unknown-pronoun", "cxn:speech-act-construction", "cxn:spontaneous-verb", "cxn:spurious-complex-predicate", "cxn:stative-complex-predicate", "cxn:stative-predicate-part", "cxn:stimulus-phrase", "cxn:subject-identity-construction", "cxn:subject-phrase", "cxn:subordinate-clause", "cxn:substitutive-construction", "cxn:subtractive-construction", "cxn:superlative-form", "cxn:support-verb", "cxn:support-verb-construction", "cxn:t-phrase", "cxn:temporal-construction", "cxn:temporary-predicate", "cxn:thetic-construction", "cxn:third-person-pronoun", "cxn:topic-comment-construction", "cxn:topic-phrase", "cxn:transfer-verb", "cxn:transitive-a-phrase", "cxn:transitive-construction", "cxn:typifying-construction", "cxn:uncontrolled-predicate", "cxn:unexpected-co-occurrence-coordination", "cxn:universal-pronoun", "cxn:utterance-construction", "cxn:utterance-predicate", "cxn:vague-numeral-term", "cxn:value-term", "cxn:verb", "cxn:verbal-clause", "cxn:wishing-construction", "cxn:wishing-predicate", "def:accessibility-hierarchy", "def:accessibility-scale", "def:adjunct", "def:agreement-hierarchy", "def:animacy-hierarchy", "def:behavioral-potential", "def:binding-hierarchy", "def:comparative-concept", "def:conceptual-space", "def:construction-grammar", "def:crosslinguistically-valid", "def:cumulation", "def:explicitness", "def:extended-animacy-hierarchy", "def:false-cumulation", "def:file-metaphor", "def:form", "def:function", "def:functionalism", "def:grammaticalization", "def:identity-statements", "def:interlinear-morpheme-translation", "def:lexicalization", "def:metalanguage", "def:modification-predication-continuum", "def:modification-reference-continuum", "def:morphology", "def:morphosyntax", "def:object-language", "def:ontological-categories", "def:ontology", "def:particularizing", "def:preferred-argument-structure", "def:prenominal-integration", "def:role", "def:semantic-classes", "def:semantic-map", "def:semantic-map-model", "def:speech-act-situation", "def:structural-coding", "def:syntax", "def:token-frequency", "def:transitivity-hierarchy", "def:translation", "def:typology", "def:verbalization", "def:word-class", "inf:aboutness", "inf:accessibility", "inf:active-referent", "inf:actor", "inf:admodification", "inf:alternative-proposition", "inf:alternative-question", "inf:anchor", "inf:announcement", "inf:appositive-modification", "inf:background-description", "inf:choosing-contrast", "inf:comparative-referent", "inf:complementative", "inf:complex-figure", "inf:conditional-referent", "inf:contrast", "inf:coreference", "inf:counterpresuppositional-contrast", "inf:declarative", "inf:different-subject", "inf:direct-negation-referent", "inf:discourse-coherence", "inf:discourse-connection", "inf:discourse-deixis", "inf:discourse-structure", "inf:entity-central", "inf:equational", "inf:event-central", "inf:exclamative", "inf:expanding-contrast", "inf:explanation", "inf:figure-ground", "inf:focus", "inf:free-choice-referent", "inf:generic-referent", "inf:high-accessibility", "inf:high-topicality", "inf:highest-topicality", "inf:identifiability", "inf:identificational", "inf:identity-known", "inf:identity-unknown", "inf:imperative-hortative", "inf:inactive-referent", "inf:indirect-negation-referent", "inf:inferrable-referent", "inf:information-gap", "inf:information-packaging", "inf:information-question", "inf:information-question-response", "inf:information-status", "inf:interrogative", "inf:interrogative-unit", "inf:interruption", "inf:irrealis-referent", "inf:link", "inf:listing-contrast", "inf:logophoric-subject-identity", "inf:low-accessibility", "inf:low-topicality", "inf:major-propositional-act", "inf:medium-accessibility", "inf:mid-topicality", "inf:modification", "inf:negative-question-polarity-response", "inf:non-high-topicality", "inf:non-low-topicality", "inf:nonspecific-referent", "inf:nonverbal-contrast", "inf:object-identity", "inf:parallel-contrast", "inf:polarity-question", "inf:polarity-response", "inf:poset", "inf:positive-question-polarity-response", "inf:pragmatic-assertion", "inf:pragmatic-presupposition", "inf:pragmatically-specific-referent", "inf:predicate-identity", "inf:predication", "inf:presentational", "inf:presupposed-open-proposition", "inf:prohibitive", "inf:prop", "inf:question-referent", "inf:reference", "inf:referent-type-identity", "inf:rejecting-contrast", "inf:replacing-contrast", "inf:response", "inf:restricting-contrast", "inf:restrictive-modification", "inf:same-subject", "inf:selecting", "inf:semantically-specific-referent", "inf:semi-active-referent", "inf:setting", "inf:situating", "inf:specific-known-referent", "inf:specific-unknown-referent", "inf:speech-acts", "inf:subcategorizing", "inf:theater-metaphor", "inf:thetic", "inf:token-identity", "inf:topic-comment", "inf:topicality", "inf:trigger", "inf:type-identifiable", "inf:type-identity", "inf:verbal-contrast", "sem:a-role", "sem:achievement", "sem:action-concept", "sem:addition", "sem:additive", "sem:addressee", "sem:affectee", "sem:affecting", "sem:age", "sem:agent", "sem:agentive-change-of-state-event", "sem:agentive-experience-event", "sem:agentive-ingestion-event", "sem:amount", "sem:animacy", "sem:animate", "sem:antecedent-role", "sem:anterior", "sem:apodosis", "sem:application-event", "sem:apprehensional", "sem:arrangement", "sem:arrival", "sem:aspect", "sem:atelic", "sem:attending", "sem:avalent", "sem:base-event", "sem:beneficiary", "sem:bivalent", "sem:bodily-action", "sem:bodily-motion-event", "sem:body-care-event", "sem:body-part-relation", "sem:body-position-event", "sem:cardinal-numeral", "sem:categorical", "sem:causal", "sem:causal-chain", "sem:causal-chain-profile", "sem:causal-control", "sem:causal-cyclicality", "sem:causal-directionality", "sem:causal-directness", "sem:causal-link", "sem:causal-structure", "sem:causative-event", "sem:cause", "sem:caused-motion", "sem:causee", "sem:causer", "sem:central-participant", "sem:chaining", "sem:change-in-position-event", "sem:change-of-state-event", "sem:change-type", "sem:co-actor", "sem:cognition-event", "sem:collective", "sem:color", "sem:combining-event", "sem:comitative", "sem:commentative-event", "sem:communication-event", "sem:comparative-conditional-relation", "sem:comparative-degree", "sem:comparative-relation", "sem:comparee", "sem:completive", "sem:concessive-conditional-relation", "sem:concessive-relation", "sem:concomitant-role", "sem:conditional-relation", "sem:consecutive", "sem:contact-by-impact-event", "sem:contact-event", "sem:container", "sem:content-causal-relation", "sem:contextual", "sem:continuative", "sem:controlled", "sem:creation-event", "sem:damage-event", "sem:degree", "sem:deontic-modality", "sem:departure", "sem:dependent-time-reference", "sem:desiderative-event", "sem:dimension", "sem:direct-causation", "sem:directed-change", "sem:distal", "sem:distributive-quantifier", "sem:downtoning", "sem:durative", "sem:durativity", "sem:dynamic", "sem:emotion-event", "sem:endpoint", "sem:entity", "sem:epistemic-causal-relation", "sem:epistemic-modality", "sem:epistemic-stance", "sem:equative-relation", "sem:evaluative-event", "sem:event", "sem:event-oriented", "sem:event-relation", "sem:eventive-participant-event", "sem:eventive-perception-event", "sem:evidentiality", "sem:exclusive-disjunction", "sem:exhaustive-list", "sem:existence-event", "sem:experience", "sem:experiencer", "sem:experiential-event", "sem:expertum", "sem:external-cause", "sem:extroverted", "sem:fearing-event", "sem:figure", "sem:figure-ground-spatial-relation", "sem:first-person", "sem:force", "sem:future-oriented", "sem:gender-class", "sem:generic-conditional-relation", "sem:gradable-predicative-scale", "sem:gradient", "sem:ground", "sem:group", "sem:hearer", "sem:hoping-event", "sem:human", "sem:human-propensity", "sem:hypothetical", "sem:identity", "sem:inanimate", "sem:inceptive", "sem:inclusive-disjunction", "sem:independent-time-reference", "sem:indirect-causation", "sem:ingestion-event", "sem:initiator", "sem:instrument", "sem:intensifying", "sem:interaction-event", "sem:introverted", "sem:killing-injuring-event", "sem:kinship-relation", "sem:knowledge-event", "sem:less-affected-p", "sem:less-individuated-p", "sem:let-alone-relation", "sem:maleficiary", "sem:manipulative-event", "sem:manner", "sem:manner-of-motion-event", "sem:manner-profile", "sem:material", "sem:meaning", "sem:means", "sem:measure", "sem:measuring", "sem:mensural-concept", "sem:mental-space", "sem:message", "sem:mirative", "sem:modality", "sem:monovalent", "sem:motion-event", "sem:necessary-participant-sharing", "sem:negative-circumstantial", "sem:negative-epistemic-stance", "sem:negative-polarity", "sem:neutral-epistemic-stance", "sem:non-exhaustive-list", "sem:nonrelational", "sem:number", "sem:numeral", "sem:object-concept", "sem:objective", "sem:occupant", "sem:ordinal-numeral", "sem:orientation", "sem:other", "sem:ownership", "sem:p-role", "sem:part-whole-relation", "sem:participant-oriented", "sem:participant-role", "sem:passing", "sem:path-event", "sem:patient", "sem:perception-event", "sem:peripheral-participant", "sem:persistent", "sem:person", "sem:person-deixis", "sem:phasal-aspect", "sem:physical-property", "sem:piece", "sem:place", "sem:polarity", "sem:positive-epistemic-stance", "sem:positive-polarity", "sem:possession", "sem:possessor", "sem:possessum", "sem:posterior", "sem:pretense-event", "sem:property-concept", "sem:proportional-quantifier", "sem:proposition", "sem:propositional-attitude-event", "sem:propositional-content", "sem:protasis", "sem:proximal", "sem:punctual", "sem:purpose", "sem:pursuit-event", "sem:qualitative-event", "sem:quantitative-relation", "sem:quantity", "sem:recipient", "sem:reciprocal", "sem:reference-point", "sem:reflexive", "sem:relational", "sem:relationality", "sem:removal-event", "sem:result-profile", "sem:s-role", "sem:scalar-model", "sem:scale", "sem:second-person", "sem:semantic-role", "sem:sensation-event", "sem:set-member", "sem:shape", "sem:simple-contrast", "sem:simultaneous", "sem:social-event", "sem:social-role", "sem:social-role-event", "sem:sociative-causation", "sem:spatial-deixis", "sem:spatial-event", "sem:speaker", "sem:species", "sem:speech-act-causal-relation", "sem:spontaneous", "sem:standard", "sem:state", "sem:stative", "sem:stativity", "sem:stimulus", "sem:subjective", "sem:subsequent-role", "sem:substitution", "sem:substitutive", "sem:subtraction", "sem:subtractive", "sem:superlative-degree", "sem:tamp", "sem:telic", "sem:telicity", "sem:tense", "sem:terminative", "sem:theme", "sem:thing", "sem:third-person", "sem:time", "sem:time-reference", "sem:time-stability", "sem:token", "sem:topic", "sem:transfer-of-possession-event", "sem:transitoriness", "sem:transitory", "sem:trivalent", "sem:type", "sem:uncontrolled", "sem:undergoer", "sem:undirected-change", "sem:unexpected-co-occurrence", "sem:utterance-event", "sem:vague-numeral", "sem:valency", "sem:value", "sem:weather-event", "sem:wishing-event", "str:a-not-a", "str:absolute-deranking-system", "str:absolutive-category", "str:accusative-alignment", "str:accusative-category", "str:action-nominal", "str:active-alignment", "str:active-category", "str:actual-information-packaging-strategy", "str:adjective-impersonal-strategy", "str:adjective-personal-strategy", "str:adjoined-strategy", "str:adnominal-possessive-strategy", "str:adposition", "str:adpositional-personal-strategy", "str:adpositional-strategy", "str:adverbial-clause-strategy", "str:adverbial-strategy", "str:adverbializer", "str:affixal-negation", "str:affixation", "str:agree-disagree-alignment", "str:alignment-system", "str:allative-comparative", "str:alternative-concessive-conditional-strategy", "str:anchoring-nominal-strategy", "str:animacy-based-split-ergativity", "str:anterior-deranking", "str:anterior-zero", "str:antipassive-alignment", "str:applicative-alignment", "str:associative-equative", "str:associative-strategy", "str:asyndetic", "str:balancing", "str:bare-verb-stem", "str:base-object-inertia", "str:basic-word-order", "str:biclausal-reciprocal", "str:bisyndetic", "str:case-affix", "str:causative-alignment", "str:causative-applicative-co-expression", "str:causative-coordinate-strategy", "str:causative-predicational-strategy", "str:circumposition", "str:classifier", "str:clause-alignment", "str:cleft-strategy", "str:co-expression", "str:cognate-head-dependent-strategy", "str:complement-disalignment", "str:complementizer", "str:complex-predicate-asc-strategy", "str:compounding", "str:conditional-deranking", "str:conditional-discourse-reference-system", "str:conjoined-comparative", "str:conjoined-exceed-comparative", "str:conjunction", "str:contiguity-of-serial-verbs", "str:control-based-strategy", "str:controller", "str:converb", "str:converb-strategy", "str:coordinate-clause-strategy", "str:coordinate-impersonal-strategy", "str:coordinate-personal-strategy", "str:coordinator", "str:copula", "str:copular-participle-strategy", "str:correlative-strategy", "str:declarative-marker", "str:definite-article-strategy", "str:degree-affix", "str:degree-equative", "str:degree-marker", "str:degree-modifier", "str:demonstrative-strategy", "str:deranking", "str:derived-case", "str:detached-complement-strategy", "str:detached-topic-phrase", "str:differential-object-marking", "str:direct-object-category", "str:direct-question-strategy", "str:direct-report", "str:discourse-reference-system", "str:ditransitive-alignment", "str:domain", "str:double-coding-strategy", "str:double-expression", "str:double-negation-strategy", "str:double-oblique-strategy", "str:doubling", "str:dual-role-strategy", "str:echo-strategy", "str:ellipsis", "str:encoding-strategy", "str:equal-equative", "str:ergative-alignment", "str:ergative-category", "str:exceed-comparative", "str:existential-negative-strategy", "str:experiencer-oriented-strategy", "str:experiential-alignment", "str:external-possessor-strategy", "str:externally-headed", "str:extraposed-strategy", "str:figure-incorporating", "str:first-person-plural-strategy", "str:fixed-case", "str:flagging", "str:focus-marker", "str:fusion", "str:gap-strategy", "str:general-extender", "str:have-possessive-strategy", "str:headless", "str:human-noun-strategy", "str:hybrid-information-packaging-strategy", "str:identificational-strategy", "str:ideophones", "str:inactive-category", "str:inclusory-strategy", "str:incorporation-of-serial-verbs", "str:independent-referring-phrase-strategy", "str:independent-strategy", "str:index", "str:indexation", "str:indexation-feature", "str:indexed", "str:indirect-object-category", "str:indirect-report", "str:indirective-alignment", "str:information-packaging-alignment", "str:insubordination", "str:internal-possessor-strategy", "str:internal-recipient-strategy", "str:internally-headed-strategy", "str:interrogative-complementizer", "str:interrogative-pronoun-strategy", "str:juxtaposition", "str:linker", "str:locational-possessive-strategy", "str:locational-strategy", "str:locative-comparative", "str:locus-of-inflection-of-serial-verbs", "str:logophoric-system", "str:long-distance-reflexive", "str:mensural-classifier", "str:merged-argument-structure-strategy", "str:middle-voice", "str:monoclausal-transitive-reciprocal-strategy", "str:monosyndetic", "str:negative-auxiliary-strategy", "str:negative-fusion", "str:negative-particle", "str:neutral-alignment", "str:neutral-ditransitive-alignment", "str:nominalizer", "str:nominative-category", "str:non-externally-headed", "str:non-indexed", "str:non-nominative-flag-index", "str:nonperson-indexation", "str:nonspecific-article-strategy", "str:nonspecific-pronoun-strategy", "str:nonverbal-copula-strategy", "str:noun-incorporation", "str:noun-modifying-clause-strategy", "str:numeral-strategy", "str:object-equative", "str:oblique-p-strategy", "str:omitted-a-strategy", "str:omitted-p-strategy", "str:ordered-strategy", "str:overt-article", "str:overt-coding", "str:overt-pronoun", "str:overtly-coded-single-role-strategy", "str:overtly-coded-verb", "str:overtly-headed-strategy", "str:partially-merged-argument-structure-strategy", "str:participial-strategy", "str:participle", "str:particle-comparative", "str:particle-equative", "str:passive-inverse-alignment", "str:perception-verb-strategy", "str:person-indexation", "str:phenomime", "str:phonomime", "str:polarity-response-alignment", "str:possessive-locative-strategy", "str:posterior-deranking", "str:posterior-zero", "str:postnominal-strategy", "str:postposition", "str:predicational-locative-strategy", "str:predicational-strategy", "str:predicativization-possessive-strategy", "str:prenominal-strategy", "str:preposition", "str:primary-object-category", "str:pronoun-retention-strategy", "str:prosody", "str:pseudo-partitive", "str:psychomime", "str:question-marker", "str:quotative-marker", "str:reciprocal-strategy", "str:recruitment-strategy", "str:reference-tracking-system", "str:reflexive-strategy", "str:relational-strategy", "str:relative-based-equative", "str:relative-equal-equative", "str:relative-pronoun-strategy", "str:relative-strategy", "str:relativizer", "str:repeater", "str:satellite", "str:satellite-framing-strategy", "str:scalar-concessive-conditional-strategy", "str:second-position", "str:secondary-object-category", "str:secundative-alignment", "str:semantic-information-packaging-strategy", "str:separative-comparative", "str:serial-verb-strategy", "str:simple-strategy", "str:single-role-strategy", "str:sortal-classifier", "str:special-form", "str:special-p-strategy", "str:specialized-dual-role-strategy", "str:split-argument-structure-strategy", "str:split-structure", "str:stamp-strategy", "str:stimulus-oriented-strategy", "str:strategy", "str:subject-predicate-alignment", "str:summarizer", "str:switch-reference-system", "str:syndetic", "str:system", "str:tag", "str:target", "str:tense-iconicity", "str:thetic-marker", "str:topic-locational-hybrid-possessive-strategy", "str:topic-marker", "str:topic-possessive-strategy", "str:transitive-alignment", "str:transitivity-based-strategy", "str:tripartite-alignment", "str:unique-equative", "str:universal-concessive-conditional-strategy", "str:universal-pronoun-strategy", "str:utterance-clause-alignment", "str:verb-coding-strategy", "str:verb-framing-strategy", "str:verbal-copula", "str:verbal-strategy", "str:with-possessive-strategy", "str:word-order", "str:yes-no-alignment", "str:yes-no-disagree-alignment", "str:zero-anaphora", "str:zero-article", "str:zero-coded-verb", "str:zero-coding", "str:zero-copula"], "tokens": {"1": [[0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 11, 12, 13, 17, 21, 23, 27, 31, 34, 37, 42, 47, 48, 49, 51, 59, 65, 66, 67, 68, 70, 74, 77, 84, 89, 93, 97, 100, 103, 106, 108, 115, 117, 126, 127, 128, 129, 132, 136, 141, 142, 143, 144, 145, 149, 156, 163, 164, 165, 167, 170, 175, 179, 184, 188, 192], [], [201, 203, 204, 205, 207, 209, 210, 212, 213, 214, 215, 218, 219, 224, 225, 227, 232, 237, 240, 241, 247, 249, 254, 255, 258, 262, 263, 264, 265, 267, 268, 270, 271, 272, 274, 277, 279, 281, 283, 285, 286, 288, 290, 292, 293, 294, 295, 296, 297, 298, 302, 304, 305, 306, 308, 309, 311, 313, 314, 318, 319, 321, 322, 323, 324, 329, 334, 335, 339, 341, 344, 347, 351, 353, 354, 356, 357, 358, 360, 361, 363, 366, 368, 369, 370, 371, 379, 380, 381, 383, 386, 387, 389, 392, 393, 396, 400, 402, 406, 408, 409, 410, 412, 414, 416, 425, 426, 427, 434, 439, 440, 441, 445, 446, 451, 452, 455, 456, 457, 458, 460, 462, 463, 465, 466, 470, 472, 473, 475, 478, 484, 488, 490, 492, 493, 494, 500, 502, 508, 509, 513, 516, 519, 523, 524, 527, 533, 534, 535, 537, 539, 540, 546, 547, 548, 553, 556, 558, 559, 561, 562, 563, 565, 566, 567, 568, 569, 570, 571, 572, 573, 574, 575, 578, 579, 580, 581, 582, 584, 586, 587, 590, 592, 595, 596, 597, 598, 599, 600, 601, 602, 604, 605, 606, 607, 609, 610, 613, 615, 616, 617, 618, 619, 625, 626, 627, 628, 629, 630, 631, 632, 634, 639, 642, 643, 645, 646, 647, 648, 651, 653, 656, 660, 663, 668, 670, 671, 675, 676, 677, 679, 680, 681, 682, 683, 685, 687, 688, 690, 692, 693, 694, 695, 696, 697, 700, 701, 702, 703, 705, 706, 710, 711, 713, 715, 720, 721, 726, 727, 728, 729, 731, 734, 735, 738, 739, 740, 744, 748, 749, 756, 758, 762, 765, 772, 775, 778, 782, 783, 784, 788, 789, 795, 801, 802, 805, 807, 809, 810, 811, 812, 813, 816, 817, 824, 826, 827, 832, 833, 835, 838, 839, 841, 845, 847, 849, 855, 856, 861, 866, 869, 872, 873, 877, 879, 880, 881, 882, 884, 885, 886, 887, 889, 891, 892, 898, 899, 900, 901, 902, 904, 905, 907, 908, 910, 915, 916, 917, 919, 920, 921, 923, 925, 927, 928, 929, 930, 931, 936, 938, 940, 944, 948, 952, 953, 958, 962, 964, 965, 966, 968, 970, 972, 974, 976, 977, 979, 981, 987, 989, 991, 992, 993, 996, 997, 1000, 1002, 1006, 1007, 1008, 1026, 1039, 1053, 1056, 1073, 1078, 1081, 1102, 1104, 1105, 1155, 1162, 1165, 1187, 1189, 1194, 1216, 1224, 1226, 1227, 1241, 1245, 1250, 1253, 1260, 1266, 1267, 1273]], "10": [[10, 11, 12, 13, 14, 15, 16, 17, 18, 19], [], [313, 314, 318, 353, 379, 412, 414, 450, 460, 462, 463, 464, 465, 466, 467, 533, 535, 567, 572, 625, 626, 627, 639, 680, 703, 705, 833, 918, 919, 920, 986, 1016, 1073, 1121, 1130, 1148, 1149, 1172, 1193, 1198, 1203, 1205, 1255, 1257, 1267, 1268, 1269, 1277]], "11": [[20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32], [], [313, 318, 346, 353, 445, 533, 535, 599, 604, 607, 609, 610, 615, 617, 625, 627, 629, 630, 632, 639, 646, 653, 655, 656, 668, 670, 673, 676, 681, 687, 688, 690, 703, 705, 707, 710, 824, 925, 927, 1002, 1052, 1086, 1101, 1117, 1210, 1242]], "12": [[33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45], [], [213, 290, 291, 321, 325, 354, 363, 364, 368, 369, 370, 402, 446, 447, 470, 516, 605, 618, 628, 642, 648, 649, 651, 671, 672, 682, 700, 795, 812, 821, 836, 879, 880, 886, 893, 915, 917, 969, 1025, 1039, 1083, 1096, 1100, 1251, 1271, 1272]], "13": [[46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57], [], [231, 238, 239, 272, 319, 471, 519, 528, 529, 574, 675, 976, 979, 1054, 1064, 1129, 1151, 1229, 1234, 1243]], "135": [[], [], [300, 798]], "14": [[58, 59, 60, 61, 62, 63], [], [298, 386, 387, 400, 434, 500, 519, 576, 608, 612, 691, 733, 796, 817, 832, 841, 869, 882, 901, 903, 904, 1013, 1014, 1018, 1019, 1021, 1038, 1068, 1070, 1071, 1074, 1083, 1095, 1113, 1126, 1135, 1167, 1188, 1195, 1196, 1204, 1212, 1226]], "147": [[], [], [606]], "15": [[64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74, 75], [], [204, 205, 207, 274, 279, 285, 286, 297, 304, 305, 322, 324, 357, 383, 408, 524, 613, 631, 675, 715, 728, 731, 748, 784, 873, 884, 921, 931, 952, 953, 972, 974, 997, 1009, 1022, 1031, 1037, 1038, 1043, 1063, 1072, 1083, 1120, 1140, 1158, 1199, 1247, 1249, 1253]], "16": [[76, 77, 78, 79, 80, 81], [], [424, 461, 488, 522, 616, 619, 692, 1005, 1059, 1060, 1091, 1248]], "17": [[82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94], [], [225, 263, 264, 275, 276, 277, 315, 341, 378, 478, 729, 748, 775, 778, 780, 781, 783, 788, 811, 813, 838, 839, 847, 877, 885, 887, 916, 928, 945, 962, 964, 1027, 1028, 1035, 1061, 1062, 1079, 1080, 1084, 1103, 1106, 1115, 1131, 1150, 1180, 1190, 1191, 1220, 1221, 1223, 1228, 1233, 1262]], "18": [[95, 96, 97, 98, 99, 100, 101, 102, 103, 104], [], [261, 267, 268, 270, 300, 317, 332, 349, 368, 377, 382, 385, 437, 469, 477, 545, 551, 558, 712, 773, 797, 798, 815, 831, 844, 852, 862, 867, 877, 883, 911, 922, 925, 926, 998, 1003, 1056, 1090, 1137, 1152, 1153, 1155, 1187, 1214, 1241]], "19": [[105, 106, 107, 108, 109, 110, 111, 112, 113], [], [216, 217, 338, 417, 418, 492, 493, 494, 552, 564, 1015, 1052, 1075, 1111, 1112, 1119, 1143, 1174, 1189, 1201, 1206, 1209, 1222, 1224, 1265]], "1964": [[], [], [599]], "1972": [[], [], [1265]], "1977": [[], [], [597]], "1980": [[], [], [558]], "1990b": [[], [], [813]], "1994": [[], [], [675, 676]], "1995": [[], [], [1067]], "1997": [[], [], [610, 693]], "1sg": [[], [], [1268]], "1st": [[], [834], [359]], "2": [[2, 3, 4, 5, 13, 14, 18, 22, 23, 24, 25, 28, 32, 35, 38, 43, 45, 49, 50, 51, 52, 54, 60, 67, 69, 70, 71, 72, 75, 78, 83, 84, 85, 86, 87, 90, 94, 96, 97, 98, 101, 104, 107, 108, 109, 110, 111, 114, 115, 116, 117, 118, 119, 120, 121, 122, 123, 124, 128, 130, 133, 137, 143, 146, 150, 155, 156, 157, 158, 159, 165, 166, 167, 168, 171, 177, 180, 185, 193], [], [200, 201, 203, 207, 209, 210, 219, 224, 226, 232, 234, 237, 241, 242, 244, 249, 252, 253, 254, 255, 257, 258, 259, 261, 264, 265, 267, 268, 270, 271, 272, 276, 279, 281, 282, 285, 286, 289, 291, 294, 295, 296, 297, 300, 301, 302, 305, 308, 309, 311, 313, 314, 315, 317, 318, 319, 322, 324, 325, 329, 330, 332, 339, 346, 347, 349, 351, 353, 356, 357, 366, 370, 371, 372, 374, 377, 378, 382, 383, 385, 387, 388, 389, 393, 395, 397, 398, 400, 402, 406, 407, 408, 412, 413, 416, 417, 418, 425, 426, 429, 434, 437, 440, 450, 459, 460, 462, 464, 465, 467, 469, 474, 477, 479, 487, 489, 490, 491, 493, 497, 499, 509, 517, 519, 523, 524, 527, 533, 535, 539, 540, 545, 547, 548, 549, 551, 556, 557, 558, 565, 567, 571, 572, 574, 577, 582, 583, 587, 591, 593, 598, 599, 603, 606, 625, 626, 627, 638, 639, 650, 655, 663, 673, 675, 679, 680, 685, 701, 703, 705, 707, 712, 713, 715, 720, 721, 726, 727, 730, 734, 735, 739, 740, 742, 743, 748, 749, 756, 757, 758, 760, 761, 764, 765, 771, 772, 773, 778, 781, 782, 785, 793, 794, 797, 798, 801, 805, 807, 809, 810, 815, 816, 826, 827, 831, 835, 837, 839, 844, 845, 849, 852, 855, 856, 860, 862, 866, 867, 869, 877, 879, 881, 882, 883, 889, 892, 902, 904, 905, 908, 911, 918, 919, 920, 922, 923, 925, 926, 930, 936, 938, 940, 942, 952, 964, 965, 966, 968, 970, 976, 977, 979, 981, 986, 991, 992, 996, 997, 998, 1000, 1003, 1009, 1012, 1013, 1014, 1015, 1016, 1018, 1019, 1021, 1022, 1024, 1027, 1031, 1035, 1037, 1038, 1041, 1042, 1043, 1052, 1058, 1060, 1061, 1062, 1063, 1064, 1065, 1068, 1070, 1071, 1072, 1073, 1074, 1075, 1078, 1079, 1080, 1081, 1083, 1084, 1086, 1088, 1090, 1091, 1096, 1099, 1101, 1103, 1106, 1111, 1112, 1115, 1116, 1117, 1119, 1120, 1121, 1124, 1129, 1131, 1133, 1135, 1136, 1137, 1138, 1140, 1143, 1146, 1148, 1149, 1150, 1151, 1152, 1153, 1154, 1156, 1157, 1158, 1163, 1164, 1167, 1169, 1172, 1174, 1180, 1182, 1184, 1188, 1189, 1190, 1191, 1199, 1201, 1204, 1205, 1206, 1208, 1209, 1210, 1211, 1214, 1220, 1221, 1222, 1223, 1224, 1226, 1230, 1231, 1232, 1233, 1234, 1235, 1236, 1237, 1240, 1242, 1247, 1249, 1251, 1255, 1257, 1259, 1267, 1268, 1269, 1270, 1276, 1277]], "2002": [[], [], [606]], "2003": [[], [], [558]], "2003b": [[], [], [1265]], "2007": [[], [], [300, 798]], "2007a": [[], [], [597]], "2016": [[], [], [533, 607, 703]], "2021": [[], [], [1091]], "2nd": [[], [947], []], "2sg": [[], [], [1141, 1142]], "3": [[5, 6, 15, 19, 25, 26, 27, 28, 29, 36, 37, 38, 39, 40, 53, 54, 61, 68, 72, 73, 74, 75, 79, 86, 88, 89, 90, 91, 99, 100, 101, 110, 112, 119, 122, 125, 126, 127, 128, 129, 130, 131, 132, 133, 134, 135, 136, 137, 138, 139, 144, 147, 151, 158, 160, 169, 170, 171, 172, 173, 178, 179, 180, 181, 186, 189, 194], [], [200, 201, 204, 205, 213, 214, 215, 218, 225, 226, 227, 228, 234, 243, 246, 247, 255, 259, 262, 266, 274, 275, 276, 277, 278, 281, 282, 283, 284, 289, 292, 293, 294, 295, 301, 303, 306, 313, 318, 323, 334, 335, 336, 340, 341, 342, 344, 346, 356, 358, 360, 361, 362, 363, 364, 367, 368, 369, 370, 371, 373, 374, 387, 388, 392, 396, 400, 407, 409, 416, 425, 426, 427, 433, 434, 439, 441, 446, 447, 455, 456, 457, 458, 460, 462, 466, 472, 473, 475, 478, 479, 481, 484, 485, 490, 497, 499, 502, 503, 504, 508, 513, 514, 515, 517, 523, 532, 533, 534, 539, 541, 543, 546, 548, 549, 552, 553, 556, 558, 560, 564, 565, 571, 576, 581, 583, 585, 588, 589, 590, 594, 600, 601, 602, 605, 607, 608, 609, 611, 612, 613, 614, 620, 623, 625, 627, 630, 631, 633, 634, 638, 643, 644, 645, 647, 648, 649, 650, 651, 653, 654, 655, 660, 663, 667, 671, 672, 673, 677, 679, 683, 684, 685, 691, 693, 694, 695, 696, 698, 699, 702, 703, 707, 708, 711, 726, 728, 729, 730, 731, 741, 745, 748, 771, 780, 781, 783, 784, 785, 788, 789, 793, 802, 811, 812, 813, 821, 824, 832, 838, 841, 845, 847, 849, 858, 860, 869, 873, 877, 882, 884, 885, 887, 891, 892, 893, 899, 904, 910, 916, 921, 928, 929, 931, 932, 942, 944, 945, 953, 958, 962, 969, 972, 974, 987, 993, 1002, 1005, 1006, 1007, 1008, 1009, 1010, 1011, 1015, 1017, 1022, 1025, 1026, 1028, 1030, 1031, 1038, 1044, 1046, 1049, 1050, 1056, 1059, 1062, 1064, 1075, 1083, 1087, 1090, 1098, 1100, 1104, 1105, 1110, 1116, 1127, 1129, 1130, 1131, 1133, 1140, 1141, 1142, 1143, 1151, 1162, 1164, 1165, 1180, 1193, 1198, 1199, 1202, 1203, 1207, 1210, 1214, 1219, 1223, 1225, 1226, 1227, 1228, 1239, 1242, 1251, 1253, 1260, 1262, 1265, 1266, 1270, 1271, 1272, 1273]], "3du": [[], [], [1099]], "3pl": [[], [], [1205, 1208, 1231]], "3rd": [[], [983], [1132, 1133, 1165]], "3sg": [[], [], [228, 1016, 1071, 1149, 1248]], "4": [[7, 16, 17, 18, 19, 30, 31, 32, 40, 41, 42, 43, 55, 62, 80, 87, 92, 93, 94, 102, 103, 104, 111, 113, 120, 123, 135, 136, 137, 140, 141, 142, 143, 144, 145, 146, 147, 148, 149, 150, 151, 152, 153, 159, 161, 173, 182, 190, 195], [], [201, 203, 208, 209, 212, 214, 216, 217, 222, 224, 229, 235, 236, 237, 238, 239, 247, 255, 256, 258, 263, 265, 271, 281, 283, 292, 293, 302, 306, 309, 312, 315, 326, 328, 329, 335, 338, 339, 344, 351, 353, 354, 356, 359, 360, 361, 365, 366, 368, 370, 378, 379, 380, 381, 382, 389, 392, 393, 396, 397, 398, 400, 402, 406, 413, 417, 418, 427, 433, 438, 440, 441, 445, 450, 451, 452, 455, 456, 457, 458, 459, 462, 463, 464, 465, 466, 467, 470, 475, 479, 484, 489, 505, 508, 509, 513, 517, 527, 546, 547, 555, 557, 558, 559, 562, 563, 574, 577, 597, 602, 604, 610, 615, 617, 629, 632, 639, 642, 646, 650, 656, 668, 670, 676, 677, 680, 681, 682, 683, 687, 688, 690, 693, 694, 696, 697, 701, 702, 704, 709, 710, 733, 744, 761, 768, 775, 778, 795, 796, 808, 812, 821, 826, 827, 828, 833, 836, 837, 854, 861, 863, 864, 882, 890, 891, 893, 898, 900, 903, 906, 918, 919, 920, 923, 938, 949, 968, 969, 979, 1012, 1016, 1017, 1024, 1026, 1035, 1039, 1044, 1049, 1050, 1052, 1053, 1058, 1066, 1073, 1078, 1079, 1081, 1083, 1093, 1094, 1097, 1101, 1102, 1103, 1108, 1112, 1116, 1117, 1118, 1121, 1122, 1124, 1126, 1130, 1132, 1133, 1134, 1146, 1147, 1148, 1152, 1153, 1155, 1164, 1169, 1173, 1174, 1179, 1182, 1185, 1186, 1187, 1191, 1193, 1194, 1195, 1196, 1198, 1202, 1203, 1205, 1207, 1212, 1216, 1219, 1220, 1221, 1225, 1229, 1232, 1235, 1238, 1241, 1243, 1244, 1245, 1248, 1250, 1252, 1255, 1257, 1267, 1269, 1270, 1275, 1276]], "5": [[8, 44, 45, 56, 63, 81, 121, 124, 138, 153, 154, 155, 156, 157, 158, 159, 160, 161, 183, 184, 185, 186], [], [216, 219, 229, 241, 266, 267, 278, 303, 308, 321, 336, 356, 360, 361, 362, 373, 395, 397, 406, 413, 424, 429, 460, 461, 462, 474, 485, 493, 503, 504, 514, 515, 522, 528, 529, 537, 540, 543, 557, 560, 577, 585, 588, 589, 591, 593, 606, 611, 614, 620, 628, 633, 644, 654, 667, 684, 698, 699, 704, 708, 709, 832, 841, 879, 989, 1067, 1088, 1095, 1110, 1113, 1118, 1122, 1136, 1138, 1141, 1142, 1147, 1154, 1163, 1186, 1208, 1211, 1230, 1231, 1237, 1238, 1270]], "52": [[], [], [675, 676]], "6": [[9, 57, 139, 162, 163, 164, 165, 166, 167, 168, 169, 170, 171, 172, 173, 174, 175], [], [210, 231, 232, 240, 243, 246, 254, 255, 284, 288, 308, 329, 340, 342, 371, 425, 426, 433, 471, 517, 523, 532, 539, 541, 548, 563, 566, 573, 575, 580, 595, 634, 706, 711, 713, 720, 721, 727, 734, 735, 739, 740, 741, 745, 749, 756, 758, 762, 765, 772, 782, 801, 805, 807, 809, 816, 826, 827, 835, 855, 856, 866, 881, 899, 902, 905, 907, 930, 936, 944, 948, 966, 968, 970, 977, 979, 981, 992, 996, 1000, 1006, 1007, 1008, 1010, 1011, 1026, 1041, 1054, 1104, 1105, 1116, 1127, 1133, 1162, 1165, 1260, 1270]], "7": [[176, 177, 178, 179, 180, 181, 182, 183, 184, 185, 186], [], [208, 226, 236, 242, 244, 252, 253, 256, 257, 259, 282, 289, 308, 312, 326, 328, 329, 330, 365, 367, 372, 374, 387, 388, 400, 434, 438, 481, 487, 491, 497, 499, 505, 517, 537, 539, 594, 713, 730, 742, 743, 761, 764, 768, 771, 785, 793, 808, 826, 827, 828, 832, 841, 854, 858, 860, 869, 882, 904, 906, 932, 942, 949, 968, 989, 1042, 1088, 1094, 1097, 1099, 1108, 1110, 1136, 1138, 1141, 1142, 1156, 1157, 1163, 1184, 1208, 1226, 1227, 1230, 1231, 1236, 1240, 1244, 1266]], "8": [[187, 188, 189, 190], [], [222, 240, 410, 433, 584, 863, 864, 1030, 1087, 1173, 1179, 1239]], "9": [[191, 192, 193, 194, 195], [], [227, 228, 249, 533, 607, 703, 738, 757, 760, 761, 1046, 1065, 1185, 1259, 1275]], "97": [[], [], [599]], "a": [[307, 431, 538, 711, 1004, 1178], [307, 431, 538, 711], [200, 201, 203, 204, 207, 208, 209, 210, 212, 213, 214, 215, 216, 217, 218, 219, 222, 224, 225, 227, 229, 231, 232, 234, 235, 236, 237, 240, 241, 242, 243, 244, 246, 247, 249, 252, 253, 254, 255, 256, 257, 258, 259, 261, 262, 263, 264, 265, 266, 267, 268, 270, 271, 272, 274, 275, 276, 277, 278, 279, 281, 282, 283, 284, 285, 286, 287, 288, 289, 290, 291, 292, 293, 294, 295, 296, 297, 298, 300, 301, 302, 303, 304, 305, 306, 308, 309, 311, 312, 313, 315, 317, 318, 319, 321, 322, 323, 324, 325, 326, 329, 330, 332, 334, 335, 336, 338, 339, 340, 341, 342, 344, 346, 347, 349, 351, 353, 354, 356, 357, 358, 359, 360, 361, 362, 365, 366, 367, 368, 369, 370, 372, 373, 374, 377, 378, 379, 380, 381, 382, 383, 385, 386, 387, 388, 389, 390, 392, 393, 395, 396, 397, 398, 400, 402, 406, 407, 408, 410, 412, 413, 416, 417, 418, 424, 425, 427, 429, 433, 434, 437, 438, 439, 440, 441, 445, 446, 447, 450, 451, 452, 455, 456, 457, 458, 459, 460, 461, 462, 463, 464, 465, 466, 467, 469, 470, 471, 472, 473, 474, 475, 477, 478, 479, 481, 484, 485, 487, 488, 489, 490, 491, 492, 493, 494, 497, 499, 500, 502, 503, 504, 505, 508, 509, 513, 514, 515, 517, 519, 522, 524, 527, 528, 529, 532, 533, 534, 535, 536, 537, 539, 540, 543, 546, 547, 548, 549, 551, 552, 553, 554, 555, 556, 557, 558, 559, 560, 561, 562, 563, 564, 565, 566, 567, 568, 569, 570, 571, 572, 573, 574, 575, 576, 577, 581, 582, 583, 584, 586, 587, 588, 589, 591, 592, 593, 594, 597, 598, 599, 600, 601, 603, 604, 605, 606, 607, 608, 609, 610, 611, 612, 613, 614, 615, 616, 617, 618, 620, 625, 626, 627, 628, 629, 630, 631, 632, 633, 634, 638, 639, 642, 643, 644, 645, 646, 647, 648, 650, 651, 653, 654, 655, 656, 663, 667, 668, 670, 672, 673, 675, 676, 677, 679, 680, 682, 683, 684, 685, 687, 688, 690, 691, 693, 694, 695, 697, 698, 699, 700, 701, 702, 703, 704, 705, 706, 707, 708, 709, 710, 711, 712, 713, 715, 720, 721, 726, 727, 728, 731, 733, 735, 738, 739, 740, 741, 742, 743, 744, 745, 748, 749, 756, 757, 758, 760, 761, 762, 764, 765, 768, 771, 772, 773, 775, 778, 780, 781, 782, 783, 784, 785, 788, 789, 793, 794, 795, 796, 797, 798, 801, 802, 805, 807, 808, 809, 810, 811, 812, 813, 815, 816, 817, 821, 824, 827, 828, 831, 832, 833, 835, 836, 837, 838, 839, 841, 844, 845, 847, 849, 852, 854, 855, 856, 858, 860, 861, 862, 863, 864, 866, 867, 869, 872, 873, 877, 879, 880, 881, 882, 883, 884, 885, 887, 889, 890, 891, 892, 893, 898, 899, 900, 901, 902, 903, 904, 905, 906, 908, 910, 911, 915, 916, 918, 919, 920, 921, 922, 923, 925, 926, 927, 928, 929, 930, 931, 936, 938, 940, 942, 944, 945, 948, 949, 952, 953, 958, 962, 964, 965, 966, 970, 972, 974, 976, 977, 979, 981, 986, 987, 989, 991, 992, 993, 996, 997, 1000, 1002, 1003, 1004, 1005, 1007, 1008, 1009, 1010, 1011, 1012, 1013, 1014, 1015, 1016, 1017, 1018, 1019, 1021, 1022, 1024, 1026, 1027, 1028, 1030, 1031, 1035, 1038, 1039, 1041, 1042, 1043, 1044, 1046, 1050, 1052, 1053, 1054, 1056, 1058, 1059, 1060, 1061, 1062, 1063, 1064, 1065, 1066, 1067, 1068, 1070, 1071, 1072, 1073, 1074, 1075, 1078, 1079, 1080, 1081, 1083, 1084, 1086, 1087, 1090, 1091, 1093, 1094, 1095, 1096, 1097, 1098, 1099, 1100, 1101, 1102, 1103, 1104, 1105, 1106, 1108, 1110, 1111, 1112, 1113, 1115, 1116, 1117, 1118, 1119, 1120, 1121, 1122, 1124, 1126, 1129, 1130, 1131, 1133, 1134, 1135, 1137, 1138, 1140, 1141, 1142, 1143, 1146, 1147, 1148, 1149, 1150, 1152, 1153, 1154, 1155, 1156, 1157, 1158, 1162, 1163, 1164, 1165, 1167, 1172, 1173, 1179, 1180, 1182, 1184, 1185, 1186, 1187, 1188, 1189, 1190, 1191, 1193, 1194, 1195, 1196, 1198, 1199, 1201, 1203, 1204, 1205, 1206, 1208, 1209, 1210, 1211, 1212, 1214, 1216, 1219, 1220, 1221, 1222, 1223, 1224, 1225, 1226, 1227, 1228, 1229, 1230, 1231, 1232, 1233, 1234, 1235, 1236, 1237, 1238, 1239, 1240, 1241, 1242, 1243, 1244, 1245, 1247, 1248, 1250, 1251, 1252, 1253, 1255, 1257, 1259, 1260, 1262, 1265, 1266, 1267, 1268, 1269, 1270, 1271, 1272, 1273, 1275, 1276, 1277]], "aayi": [[], [], [1074]], "abbreviated": [[], [], [239, 1041]], "abbreviation": [[], [], [976]], "abbreviations": [[], [], [573]], "abe": [[], [], [1184, 1236]], "ability": [[], [], [557]], "abkhaz": [[], [], [1184, 1236]], "ablative": [[], [], [1233]], "about": [[599], [599], [256, 370, 567, 569, 599, 647, 663, 676, 679, 685, 705, 708, 721, 731, 761, 768, 773, 795, 812, 815, 831, 844, 856, 867, 873, 880, 893, 931, 969, 1003, 1097, 1130, 1227, 1243]], "aboutness": [[599], [599], [599]], "above": [[], [], [579, 816]], "absence": [[], [], [575, 974, 1102, 1230, 1273]], "absent": [[], [], [974]], "absolute": [[1005], [], [1248]], "absolutely": [[], [], [1180]], "absolutive": [[1006], [], [1006, 1104]], "abstract": [[], [], [898]], "acc": [[], [], [1065, 1259]], "accent": [[], [], [533, 607, 703]], "accented": [[], [], [445]], "accessed": [[], [], [600]], "accesses": [[], [], [685]], "accessibility": [[552, 553, 600, 635, 658, 661], [], [552, 553, 564, 584, 600, 601]], "accessible": [[], [695], [600, 606]], "accommodates": [[], [], [553]], "accompanied": [[], [], [1075, 1090]], "accompanies": [[], [], [772, 873, 1214]], "accompany": [[], [], [884]], "accompanying": [[], [], [359, 583, 873, 884, 1050]], "according": [[], [], [283, 335, 344]], "accountant": [[], [], [936, 981]], "accusative": [[1007, 1008], [1007], [1008, 1030, 1065, 1165, 1259]], "ache": [[], [], [505]], "aches": [[], [], [505, 949]], "achi": [[], [], [217]], "achievement": [[712], [], [712]], "acholi": [[], [], [1062]], "acquires": [[], [], [571]], "across": [[], [], [560, 562, 589, 596, 599, 706, 948, 1151]], "act": [[516, 590, 660, 962], [516, 660], [237, 240, 275, 276, 277, 290, 291, 321, 354, 369, 439, 470, 472, 490, 567, 590, 616, 618, 628, 642, 651, 682, 689, 748, 756, 780, 781, 783, 788, 789, 811, 836, 910, 958, 962, 979, 1146, 1210]], "acted": [[], [], [809]], "acting": [[], [], [743, 855, 1191]], "action": [[197, 713, 741, 1009], [713, 1121], [243, 267, 413, 414, 459, 493, 529, 548, 549, 642, 696, 713, 741, 762, 795, 816, 889, 907, 940, 1009, 1012, 1053, 1083, 1124, 1164, 1224, 1268]], "actions": [[], [], [602, 683, 696, 741, 1012, 1124]], "activated": [[], [], [643, 695]], "activation": [[], [600], []], "active": [[601, 695, 1010, 1011], [240, 601, 695, 1010], [215, 218, 240, 292, 293, 371, 553, 584, 600, 602, 650, 1011, 1127, 1273]], "activity": [[], [], [284, 541]], "actor": [[602, 767], [1011], [602]], "actors": [[], [], [602, 696, 702]], "acts": [[700], [], [516, 660, 663, 679, 685, 700, 749, 858, 867, 1024, 1058, 1116, 1118, 1133, 1146, 1147, 1219, 1235, 1238]], "actual": [[1012], [1012], [1012, 1124, 1232]], "actuales": [[], [], [1091]], "actuality": [[], [], [813, 885, 887, 916]], "actually": [[], [], [812]], "add": [[], [], [647]], "added": [[], [], [249, 675, 757, 1251]], "adding": [[], [], [569, 608, 629]], "addition": [[714], [], [377, 862, 1018, 1071, 1074, 1080, 1188]], "additional": [[], [], [281, 304, 359, 663, 1073, 1146]], "additionally": [[], [], [974]], "additive": [[198, 199, 715], [], [279, 629, 715, 974]], "addressee": [[716], [], [323, 358, 370, 382, 502, 534, 545, 642, 648, 651, 671, 700, 958, 1141, 1152, 1271]], "adds": [[], [], [608, 629, 663, 679]], "adjacent": [[], [], [1015, 1112]], "adjectival": [[200, 460], [460], [200, 237, 460, 1276]], "adjective": [[201, 202, 1013, 1014], [200, 202], [200, 201, 398, 562, 586, 598, 600, 1013, 1014, 1146, 1232, 1270]], "adjoined": [[1015], [1015], [493, 1015, 1075]], "adjunct": [[554], [], [554]], "admodification": [[603], [], [203]], "admodifier": [[203], [], [203, 603, 794, 1078, 1081]], "adnominal": [[1016], [1016], [1016, 1141]], "adposition": [[1017], [], [1049, 1202, 1207]], "adpositional": [[1018, 1019], [], []], "adpositions": [[], [], [1009, 1017, 1116, 1219]], "adv": [[], [], [1005]], "adverb": [[], [386, 1081], []], "adverbial": [[204, 205, 206, 1020, 1021], [204], [204, 205, 297, 558, 631, 731, 748, 873, 884, 931, 953, 972, 974, 1005, 1015, 1021, 1022, 1063, 1067]], "adverbializer": [[1022], [], [1022, 1063]], "adversative": [[207], [], [207, 952, 997]], "advice": [[], [], [275, 780, 1262]], "affairs": [[], [816], []], "affect": [[], [208], []], "affected": [[863], [], [739, 762, 863, 866, 907, 1099, 1236, 1240]], "affectee": [[717], [], []], "affecting": [[208, 718], [], [208, 633]], "affix": [[1044, 1078], [], [573, 1017, 1024, 1044, 1078, 1080, 1083, 1252]], "affixal": [[1023], [], []], "affixation": [[1024], [], [1235]], "affixed": [[], [], [1022, 1056, 1072]], "affixes": [[], [], [1116, 1219]], "aforementioned": [[], [], [215]], "afraid": [[], [], [828]], "after": [[], [], [336, 500, 586, 607, 631, 633, 921, 1049, 1202, 1229]], "ag": [[], [], [1247]], "again": [[], [], [677, 694]], "against": [[], [], [604]], "age": [[209, 719], [], [209, 467, 873, 923]], "agent": [[720], [], [308, 336, 539, 633, 711, 721, 772, 835, 856, 858, 867, 883, 948, 1155]], "agentive": [[210, 721, 722, 723], [722, 723, 1011], [210, 721, 1026]], "agents": [[], [], [858]], "agree": [[1025], [1025], []], "agreeing": [[], [], [1025]], "agreement": [[555], [1133, 1134], [555]], "agrees": [[], [], [1025]], "ah": [[], [], [952, 1204]], "ai": [[], [], [1155, 1248]], "aja": [[], [], [1169]], "ak": [[], [], [1110, 1129]], "akk": [[], [], [1079]], "al": [[], [379], [1095, 1251]], "alamblak": [[], [], [1129]], "alarms": [[], [], [675]], "album": [[], [], [655, 673, 707]], "ali": [[], [], [1143, 1259]], "alienable": [[211, 212], [212], [212, 356, 452]], "alignment": [[1007, 1010, 1025, 1026, 1033, 1034, 1045, 1051, 1092, 1104, 1109, 1138, 1139, 1162, 1163, 1192, 1197, 1231, 1246, 1258, 1260, 1264, 1271, 1272], [1007, 1010, 1025, 1026, 1051, 1104, 1109, 1138, 1139, 1162, 1163, 1231, 1246, 1264, 1271, 1272], [371, 1006, 1008, 1011, 1025, 1088, 1105, 1127, 1136, 1165, 1208, 1230, 1260, 1271, 1272]], "aligns": [[], [], [1271, 1272]], "alive": [[], [], [271]], "all": [[], [703], [252, 297, 304, 324, 408, 473, 533, 543, 552, 564, 598, 656, 703, 708, 715, 974, 1038, 1064, 1070, 1086, 1119, 1151, 1162, 1163, 1260, 1262]], "allative": [[1027], [], [1027, 1180]], "allowed": [[], [], [1060]], "allowing": [[], [], [437]], "allows": [[], [], [219, 606]], "almost": [[], [], [683, 826, 1066, 1189]], "alone": [[378, 865], [], [295, 378, 945]], "along": [[], [], [904]], "alpa": [[], [], [1015]], "already": [[], [], [292, 293, 469, 600, 623, 676, 681, 922]], "also": [[], [], [207, 235, 240, 252, 255, 261, 264, 279, 285, 286, 329, 332, 334, 349, 370, 390, 418, 464, 473, 502, 524, 529, 551, 554, 571, 600, 602, 613, 629, 638, 643, 656, 694, 706, 707, 731, 748, 773, 782, 816, 831, 844, 854, 883, 891, 893, 918, 919, 920, 938, 981, 989, 1000, 1003, 1030, 1035, 1050, 1058, 1075, 1083, 1090, 1095, 1133, 1141, 1157, 1169, 1194, 1203, 1222, 1227, 1236, 1248, 1267]], "alta": [[], [], [1220]], "altered": [[], [], [574]], "alternative": [[213, 604, 605, 1028], [605], [213, 303, 353, 369, 469, 604, 605, 620, 639, 651, 703, 922, 1004, 1028, 1064, 1129, 1151]], "alternatives": [[], [], [213, 305, 322, 605, 610, 1028, 1262]], "although": [[], [], [276, 378, 437, 756, 781, 890, 969, 1087, 1090]], "altos": [[], [], [1221]], "always": [[], [], [212, 215, 218, 297, 342, 356, 390, 619, 683, 692, 712, 826, 890, 911, 1066, 1115, 1187]], "am": [[], [], [236, 240, 676, 866, 918, 919, 1005, 1025, 1027, 1127, 1205, 1214, 1268, 1269]], "amba": [[], [], [1234]], "ambient": [[], [], [653]], "amele": [[], [], [1149, 1269]], "among": [[], [], [560, 589, 756, 1143]], "amount": [[214, 724], [], [214, 281, 283, 335, 344, 392, 441, 484, 1237]], "amounts": [[], [], [275, 780, 1262]], "amukaintu": [[], [], [1157]], "an": [[], [], [200, 201, 203, 204, 205, 207, 208, 210, 212, 213, 214, 215, 216, 217, 219, 222, 226, 227, 228, 231, 232, 235, 236, 237, 238, 239, 240, 249, 255, 256, 262, 263, 264, 267, 268, 274, 275, 276, 277, 279, 283, 288, 290, 291, 292, 293, 296, 297, 305, 308, 311, 312, 313, 314, 315, 317, 318, 319, 321, 322, 324, 325, 326, 328, 329, 330, 335, 338, 340, 341, 344, 347, 353, 354, 356, 357, 359, 360, 361, 362, 363, 364, 365, 367, 370, 371, 372, 373, 378, 381, 382, 389, 390, 392, 397, 398, 406, 407, 408, 409, 410, 413, 414, 416, 418, 424, 426, 427, 429, 433, 437, 438, 441, 445, 446, 451, 452, 455, 456, 457, 458, 459, 460, 461, 462, 463, 464, 469, 470, 471, 472, 473, 479, 488, 489, 491, 493, 494, 498, 503, 505, 509, 522, 523, 529, 534, 535, 539, 540, 541, 545, 548, 549, 552, 553, 554, 557, 558, 559, 560, 566, 569, 570, 574, 575, 580, 581, 583, 586, 591, 595, 596, 599, 604, 605, 606, 607, 608, 611, 612, 614, 616, 617, 618, 620, 625, 628, 629, 630, 631, 632, 633, 634, 639, 642, 644, 646, 647, 648, 649, 650, 653, 654, 671, 681, 682, 684, 689, 696, 700, 705, 708, 713, 720, 721, 726, 727, 728, 729, 730, 731, 734, 735, 740, 742, 748, 756, 757, 758, 761, 762, 765, 768, 771, 773, 775, 780, 781, 783, 785, 788, 789, 793, 795, 798, 801, 805, 808, 811, 812, 815, 821, 826, 827, 831, 835, 836, 837, 838, 839, 844, 849, 854, 856, 858, 860, 861, 864, 867, 869, 873, 881, 884, 889, 890, 892, 893, 898, 900, 902, 904, 906, 907, 911, 922, 923, 925, 926, 930, 931, 936, 940, 942, 949, 952, 953, 962, 968, 969, 970, 972, 974, 976, 977, 979, 992, 996, 997, 998, 1000, 1002, 1003, 1004, 1006, 1007, 1009, 1013, 1014, 1016, 1017, 1018, 1019, 1022, 1024, 1025, 1026, 1027, 1031, 1035, 1038, 1039, 1041, 1044, 1046, 1049, 1050, 1052, 1054, 1056, 1058, 1061, 1062, 1063, 1067, 1072, 1073, 1075, 1078, 1079, 1081, 1083, 1090, 1097, 1098, 1103, 1105, 1106, 1108, 1110, 1111, 1112, 1115, 1116, 1117, 1119, 1121, 1124, 1126, 1130, 1132, 1133, 1135, 1137, 1140, 1141, 1142, 1143, 1147, 1148, 1149, 1150, 1151, 1152, 1155, 1156, 1157, 1164, 1167, 1169, 1172, 1182, 1184, 1185, 1186, 1187, 1190, 1191, 1193, 1194, 1195, 1196, 1199, 1202, 1205, 1207, 1209, 1212, 1216, 1220, 1221, 1222, 1223, 1224, 1226, 1232, 1233, 1234, 1236, 1237, 1238, 1244, 1247, 1248, 1249, 1252, 1255, 1257, 1265, 1268, 1269, 1271, 1272, 1275]], "an2": [[], [], [903]], "ana": [[], [], [1157]], "analysis": [[], [], [281, 561, 578, 579, 580, 592, 616]], "analyzable": [[], [], [574]], "analyze": [[], [], [1041]], "analyzed": [[], [], [464, 528, 578, 579, 580, 595, 1024]], "anaphora": [[1273], [1273], [488, 554, 692, 1060, 1091, 1273]], "anaphoric": [[215, 216, 217, 218], [215, 1122, 1186], [215, 216, 217, 218, 1122, 1152, 1186, 1209]], "anchor": [[606], [], [219, 429, 606, 938]], "anchored": [[], [], [466, 467]], "anchoring": [[219, 1029], [219, 540, 697], [219, 241, 395, 429, 540, 577, 606]], "ancient": [[], [], [296, 311, 347, 1097, 1156]], "and": [[], [], [200, 201, 204, 208, 209, 210, 212, 213, 215, 216, 222, 224, 226, 229, 231, 232, 234, 235, 236, 239, 240, 241, 243, 244, 246, 249, 252, 253, 254, 255, 256, 257, 258, 261, 263, 264, 267, 268, 272, 275, 276, 277, 279, 281, 282, 284, 285, 286, 287, 288, 289, 290, 292, 293, 296, 297, 298, 301, 302, 304, 305, 308, 311, 312, 314, 315, 319, 324, 326, 328, 329, 330, 332, 334, 338, 339, 340, 341, 349, 351, 353, 354, 356, 357, 358, 359, 360, 361, 365, 368, 369, 371, 372, 374, 377, 379, 380, 381, 383, 386, 389, 395, 396, 397, 400, 402, 407, 408, 410, 412, 413, 414, 418, 424, 429, 438, 440, 450, 451, 452, 461, 462, 465, 467, 474, 479, 481, 484, 487, 488, 493, 494, 497, 498, 500, 505, 508, 517, 519, 522, 523, 524, 532, 535, 536, 537, 539, 540, 541, 547, 548, 549, 551, 552, 553, 554, 555, 557, 558, 559, 562, 563, 565, 569, 571, 572, 573, 574, 576, 577, 578, 579, 580, 581, 583, 584, 586, 590, 591, 592, 596, 597, 599, 600, 601, 602, 604, 605, 606, 607, 610, 613, 615, 616, 626, 629, 630, 632, 634, 638, 639, 642, 643, 645, 650, 651, 655, 656, 660, 663, 667, 668, 670, 673, 680, 681, 683, 685, 688, 689, 690, 691, 693, 694, 696, 700, 702, 703, 704, 705, 706, 708, 709, 710, 711, 713, 715, 726, 727, 729, 730, 731, 734, 735, 738, 740, 743, 744, 748, 749, 756, 761, 762, 764, 773, 775, 780, 781, 782, 783, 784, 788, 789, 795, 801, 810, 811, 813, 815, 816, 831, 832, 833, 837, 838, 839, 844, 847, 858, 861, 862, 864, 867, 873, 877, 880, 882, 884, 890, 891, 892, 893, 898, 900, 902, 906, 907, 908, 910, 918, 923, 925, 926, 927, 928, 931, 932, 944, 945, 948, 953, 958, 962, 965, 969, 970, 972, 974, 976, 977, 981, 986, 989, 991, 996, 997, 998, 1000, 1002, 1003, 1004, 1005, 1006, 1007, 1008, 1009, 1010, 1011, 1012, 1014, 1015, 1017, 1018, 1021, 1026, 1027, 1028, 1030, 1031, 1035, 1037, 1038, 1041, 1043, 1046, 1049, 1050, 1052, 1053, 1054, 1058, 1059, 1060, 1061, 1062, 1063, 1064, 1065, 1070, 1071, 1072, 1073, 1074, 1075, 1079, 1080, 1083, 1084, 1086, 1088, 1091, 1093, 1094, 1095, 1096, 1097, 1098, 1099, 1103, 1104, 1105, 1106, 1115, 1116, 1118, 1119, 1120, 1121, 1124, 1126, 1127, 1129, 1130, 1131, 1133, 1134, 1138, 1142, 1143, 1148, 1149, 1150, 1151, 1152, 1153, 1155, 1157, 1158, 1162, 1163, 1164, 1165, 1169, 1173, 1174, 1180, 1184, 1186, 1187, 1188, 1190, 1191, 1193, 1194, 1199, 1203, 1204, 1205, 1206, 1208, 1209, 1210, 1219, 1220, 1221, 1222, 1223, 1227, 1228, 1231, 1232, 1233, 1234, 1235, 1236, 1237, 1240, 1241, 1242, 1243, 1245, 1247, 1248, 1249, 1250, 1253, 1255, 1257, 1259, 1260, 1262, 1265, 1267, 1268, 1269, 1272, 1277]], "andik": [[], [], [1046]], "anger": [[], [], [263, 775]], "angrier": [[], [], [263, 775]], "angry": [[], [], [608]], "animacy": [[556, 565, 725, 1030], [], [565, 706, 837, 1087]], "animal": [[220, 221], [], [854]], "animals": [[], [], [602, 892]], "animate": [[726], [726], [556, 565, 602, 706, 726]], "animates": [[], [], [726]], "announcement": [[607], [], [607]], "another": [[], [], [252, 265, 390, 462, 491, 508, 569, 575, 606, 619, 692, 705, 730, 772, 780, 809, 838, 855, 877, 880, 882, 889, 932, 936, 940, 942, 948, 991, 998, 1064, 1103, 1106, 1193, 1216]], "answer": [[], [672, 689], [363, 364, 378, 446, 447, 498, 648, 649, 672, 689, 1025, 1100, 1271, 1272]], "answers": [[], [], [1025, 1100]], "anta": [[], [], [382, 1152]], "antecedent": [[727], [478], [277, 478, 727, 782, 783]], "antelope": [[], [], [761]], "anterior": [[728, 1031, 1032], [], [728, 1031]], "antipassive": [[222, 223, 1033], [], [222, 410, 863, 864, 1173, 1179]], "antonym": [[224], [], []], "antonyms": [[], [], [224]], "any": [[], [], [222, 275, 281, 296, 340, 357, 447, 562, 632, 672, 708, 780, 847, 966, 996, 1002, 1025, 1039, 1068, 1070, 1146, 1185, 1234, 1245, 1262, 1271, 1272, 1275, 1277]], "anybody": [[], [], [362, 644]], "anyone": [[], [], [266, 611]], "anything": [[], [], [278, 338, 614, 684]], "anywhere": [[], [], [336, 633]], "ap": [[], [], [356]], "apa": [[], [], [1015]], "apart": [[], [], [440, 847]], "apodosis": [[225, 729], [], [225, 275, 277, 478, 729, 780, 781, 783, 928, 1028, 1228, 1262]], "appearance": [[], [], [1195]], "appears": [[], [], [558, 1153, 1223]], "apple": [[], [], [305]], "apples": [[], [], [604, 617, 629, 687, 688, 690, 824]], "applicants": [[], [], [357]], "application": [[226, 730], [730], [226, 730, 981]], "applicative": [[227, 228, 1034, 1046], [], [228, 410, 1046, 1185, 1265, 1275]], "applied": [[], [], [388, 536, 1080]], "applies": [[], [], [264, 306, 460, 543, 1061, 1062, 1131, 1190, 1191, 1220, 1223]], "apply": [[], [], [923, 965]], "applying": [[], [], [306, 357, 730]], "apposition": [[229], [], []], "appositive": [[608], [], [576, 608]], "apprehensional": [[230, 731], [], [731]], "approach": [[], [], [570, 596]], "appropriate": [[], [], [681]], "aq": [[], [], [1050, 1113, 1237]], "araa": [[], [], [215]], "arabic": [[], [], [1025, 1238]], "arabin": [[], [], [1214]], "aram": [[], [], [477, 926]], "arbitrary": [[], [], [441]], "are": [[], [], [209, 213, 218, 224, 226, 229, 232, 234, 240, 247, 252, 255, 257, 258, 267, 271, 272, 281, 285, 286, 287, 288, 296, 297, 302, 304, 311, 314, 324, 330, 334, 339, 346, 351, 357, 359, 363, 368, 369, 372, 379, 383, 386, 389, 395, 396, 397, 408, 412, 424, 440, 446, 450, 461, 465, 474, 481, 493, 498, 517, 519, 522, 528, 529, 537, 547, 552, 554, 556, 559, 560, 562, 576, 583, 585, 587, 588, 589, 592, 597, 598, 600, 602, 605, 613, 615, 626, 631, 645, 646, 648, 650, 651, 656, 660, 668, 670, 673, 675, 680, 683, 689, 691, 694, 696, 700, 704, 706, 709, 710, 713, 715, 729, 730, 734, 748, 756, 762, 780, 784, 813, 816, 824, 839, 847, 855, 877, 889, 890, 891, 892, 893, 907, 908, 910, 918, 923, 926, 928, 931, 932, 948, 965, 969, 987, 989, 997, 1000, 1002, 1004, 1007, 1008, 1010, 1011, 1017, 1025, 1026, 1037, 1038, 1043, 1046, 1054, 1058, 1062, 1064, 1067, 1083, 1091, 1094, 1096, 1097, 1100, 1101, 1102, 1103, 1104, 1106, 1116, 1118, 1120, 1126, 1131, 1133, 1134, 1138, 1141, 1142, 1146, 1151, 1158, 1162, 1163, 1164, 1169, 1180, 1187, 1199, 1221, 1231, 1240, 1242, 1249, 1250, 1260, 1265]], "area": [[], [], [262, 1222]], "arguably": [[], [], [1133]], "argued": [[], [], [1126]], "argument": [[231, 232, 233, 288, 415, 449, 454, 471, 584, 1155, 1187, 1241], [255, 307, 399, 425, 426, 428, 431, 435, 486, 501, 523, 530, 538, 558], [222, 227, 231, 232, 240, 249, 255, 272, 288, 328, 371, 410, 425, 426, 471, 494, 523, 545, 554, 558, 632, 756, 1006, 1007, 1009, 1013, 1014, 1016, 1018, 1019, 1024, 1026, 1027, 1035, 1049, 1054, 1058, 1068, 1070, 1071, 1094, 1097, 1099, 1104, 1108, 1110, 1111, 1116, 1118, 1133, 1135, 1143, 1146, 1147, 1150, 1155, 1162, 1163, 1167, 1187, 1188, 1191, 1204, 1219, 1220, 1233, 1235, 1236, 1238, 1240, 1241, 1244, 1255]], "arguments": [[], [], [426, 1026]], "arm": [[], [], [606, 744]], "army": [[], [], [873]], "arna": [[], [], [1199]], "arrangement": [[732], [], []], "arrival": [[733], [], [733, 882]], "arrived": [[], [], [235]], "arrows": [[], [], [749]], "article": [[215, 234, 292, 340, 360, 409, 455, 457, 503, 1077, 1170, 1181, 1274], [215, 409, 455, 457, 503], [215, 292, 340, 360, 409, 455, 457, 503, 557, 583, 592, 1232]], "articles": [[], [], [234, 301]], "artifact": [[], [], [898]], "as": [[], [], [205, 216, 219, 227, 228, 231, 249, 252, 262, 266, 267, 281, 283, 286, 287, 295, 298, 304, 315, 319, 328, 334, 340, 342, 347, 353, 380, 383, 386, 395, 406, 418, 429, 433, 437, 439, 447, 464, 469, 473, 475, 488, 491, 493, 502, 524, 528, 533, 536, 540, 545, 552, 554, 555, 558, 559, 565, 566, 569, 575, 576, 577, 579, 583, 593, 604, 606, 608, 609, 611, 613, 616, 619, 630, 631, 632, 639, 643, 647, 650, 655, 656, 670, 672, 673, 675, 692, 693, 700, 703, 704, 707, 708, 709, 713, 715, 727, 728, 729, 731, 748, 760, 761, 782, 784, 789, 795, 802, 805, 807, 812, 813, 816, 828, 833, 837, 839, 841, 847, 858, 861, 872, 873, 884, 886, 890, 891, 892, 893, 898, 905, 908, 917, 918, 919, 920, 921, 922, 927, 928, 929, 930, 931, 938, 940, 944, 964, 966, 970, 972, 974, 976, 981, 987, 1000, 1002, 1008, 1009, 1010, 1012, 1017, 1018, 1024, 1026, 1027, 1034, 1035, 1038, 1041, 1042, 1043, 1044, 1046, 1049, 1054, 1068, 1070, 1071, 1075, 1079, 1080, 1088, 1090, 1091, 1093, 1095, 1099, 1103, 1110, 1111, 1113, 1117, 1119, 1120, 1122, 1124, 1126, 1132, 1138, 1143, 1150, 1154, 1157, 1158, 1163, 1180, 1186, 1187, 1188, 1191, 1193, 1198, 1203, 1204, 1205, 1211, 1212, 1220, 1221, 1224, 1226, 1232, 1233, 1236, 1240, 1242, 1247, 1252, 1255, 1257]], "asae": [[], [], [1202]], "asc": [[1057], [255, 399, 435], []], "ask": [[], [], [370, 1097]], "asked": [[], [], [962, 1014]], "asking": [[], [], [370]], "asleep": [[], [], [598]], "aspect": [[734, 911], [], [239, 712, 911, 925, 976, 1009]], "aspects": [[], [], [886]], "aspectual": [[], [734], [734, 986]], "assert": [[], [], [1061, 1190]], "asserted": [[], [675, 676], [314, 353, 383, 524, 604, 617, 626, 639, 647, 675, 676, 778, 839, 964]], "asserting": [[], [], [460, 462, 646, 679, 687, 962, 1090]], "assertion": [[675], [], [617, 629, 675, 687, 688, 690, 925]], "asserts": [[], [], [378, 618, 1027, 1103, 1106, 1150, 1233, 1262]], "assigning": [[], [], [264, 315]], "assignment": [[], [], [445]], "associated": [[], [], [235, 275, 279, 292, 293, 360, 361, 519, 780, 976, 1155, 1187, 1241]], "associative": [[235, 1035, 1036], [], [235, 1035]], "assume": [[], [253, 764], [694, 815]], "assumed": [[], [], [626]], "assumes": [[], [], [676]], "assumption": [[], [], [357]], "asymmetric": [[], [631], []], "asyndetic": [[1037], [], [1037, 1067]], "at": [[], [], [236, 298, 378, 386, 437, 475, 488, 529, 533, 564, 601, 643, 668, 676, 695, 696, 703, 706, 775, 837, 858, 893, 918, 945, 969, 972, 991, 1004, 1015, 1031, 1095, 1119, 1148, 1150, 1187, 1198, 1255, 1267]], "ate": [[], [], [240, 279, 297, 298, 365, 370, 390, 492, 493, 494, 524, 706, 715, 817, 854, 901, 1038, 1064, 1111, 1119, 1179, 1201, 1206, 1224, 1248]], "atelic": [[735], [], [734, 735]], "atsugewi": [[], [], [1113]], "attack": [[], [], [731]], "attendant": [[], [], [925]], "attending": [[236, 736], [], [236]], "attention": [[], [], [235, 359, 706]], "attitude": [[476, 477, 926], [926], [368, 382, 477, 558, 795, 812, 862, 879, 893, 922, 926, 1152]], "attributed": [[], [], [1002]], "attributes": [[], [], [1027, 1035, 1062, 1079, 1103, 1106, 1150, 1233]], "attributing": [[], [], [612]], "attributive": [[211, 237, 294, 355, 394, 405, 422, 451, 482, 506], [200, 381, 451, 452], [200, 201, 237, 294, 381, 397, 398, 451, 552, 583]], "attributives": [[], [], [301]], "australian": [[], [], [1015]], "autre": [[], [], [1193]], "aux": [[], [], [1229]], "auxiliaries": [[], [], [1151]], "auxiliary": [[238, 239, 1159], [], [238, 239, 291, 359, 976, 1064, 1129, 1151, 1190, 1229, 1243, 1268]], "aval": [[], [], [1074]], "avalent": [[737], [], []], "avan": [[], [], [1005]], "avaru": [[], [], [1005]], "average": [[], [], [584]], "avoid": [[], [], [632, 938]], "avoided": [[], [], [931]], "avoiding": [[], [], [858]], "away": [[], [], [341, 802, 838, 1199]], "b": [[], [], [212, 356, 828, 1042, 1064, 1110]], "ba": [[], [], [356, 1157]], "back": [[], [], [656, 1203]], "background": [[609], [], [604, 609]], "bad": [[], [], [547, 1068]], "badly": [[], [], [1068]], "bag": [[], [], [219, 606]], "baked": [[], [], [227, 491, 492, 493, 494, 738, 1111, 1119, 1201, 1224]], "baking": [[], [], [227, 738]], "bala": [[], [], [1025]], "balanced": [[1038], [1038], [1038, 1059, 1070, 1071, 1083, 1091, 1155]], "balancing": [[1038], [1038], [558]], "baldy": [[], [], [300, 798]], "ball": [[], [], [996, 1146]], "balloon": [[], [], [200, 407, 549, 805, 930]], "ban": [[], [], [1214, 1229]], "banaao": [[], [], [1202]], "banjo": [[], [], [953]], "bano": [[], [], [1031]], "barbecued": [[], [], [972]], "barber": [[], [], [413]], "bare": [[1039], [], [1039]], "barely": [[], [], [378]], "barking": [[], [], [341, 838, 1110]], "bas": [[], [], [212, 356]], "base": [[738, 1040], [1238], [227, 249, 738, 757, 760, 1008, 1259]], "based": [[1030, 1065, 1220, 1259], [], [339, 427, 559, 567, 638, 837, 1000, 1084, 1151, 1220, 1221]], "basic": [[240, 1041], [240], [222, 240, 281, 319, 529, 561, 660, 701, 734, 738, 864, 910, 1019, 1034, 1041, 1151, 1239]], "basically": [[], [], [705, 927]], "basis": [[], [], [559]], "basketball": [[], [], [938]], "baskets": [[], [], [1120]], "bass": [[], [], [383]], "bastante": [[], [], [231]], "bat": [[], [], [340]], "bay": [[], [], [262]], "be": [[], [], [227, 239, 249, 255, 281, 285, 305, 314, 322, 324, 346, 353, 357, 364, 370, 382, 383, 390, 408, 437, 452, 464, 470, 473, 488, 491, 524, 532, 540, 554, 559, 562, 566, 574, 586, 594, 598, 600, 606, 626, 632, 633, 638, 639, 642, 645, 647, 649, 667, 675, 682, 692, 700, 715, 729, 762, 794, 862, 877, 882, 886, 906, 907, 908, 918, 925, 928, 938, 945, 969, 991, 1002, 1005, 1010, 1035, 1050, 1052, 1068, 1073, 1075, 1090, 1095, 1111, 1126, 1143, 1152, 1156, 1182, 1185, 1188, 1194, 1210, 1223, 1236, 1242, 1245, 1249]], "be_fast": [[], [], [1071]], "bear": [[], [], [826, 968]], "beautiful": [[], [], [321, 628, 1019, 1021]], "beautifully": [[], [], [1013, 1019, 1074]], "beauty": [[], [], [1074]], "because": [[], [], [204, 205, 215, 218, 232, 472, 533, 564, 566, 667, 703, 731, 748, 760, 835, 931, 1022, 1084, 1087, 1119, 1186, 1201, 1206]], "become": [[], [], [571]], "becomes": [[], [], [653]], "becoming": [[], [], [254, 765]], "bed": [[], [], [293, 361, 378, 692]], "been": [[], [], [215, 218, 235, 249, 574, 578, 601, 643, 645, 695, 1112, 1158]], "beer": [[], [], [213, 605]], "before": [[], [], [297, 390, 524, 728, 1049, 1207]], "beggar": [[], [], [1014]], "beginning": [[], [], [911]], "behavior": [[], [598], [351, 598]], "behavioral": [[557], [], [557]], "being": [[], [], [262, 265, 266, 286, 298, 313, 353, 357, 466, 473, 532, 580, 595, 611, 613, 625, 627, 631, 639, 663, 679, 684, 706, 809, 832, 893, 908, 945, 965, 966, 969, 991, 1012, 1068, 1112, 1124, 1164, 1188, 1224, 1232]], "beings": [[], [], [726]], "belief": [[], [], [377, 697, 862, 877]], "beliefs": [[], [], [362, 469, 644, 877, 922, 925]], "believes": [[], [], [261, 377, 551, 773, 862, 925, 1003, 1241]], "believing": [[], [], [821, 926]], "belong": [[], [464], []], "belonging": [[], [], [656, 713, 892, 923]], "belongs": [[], [], [262, 462, 464, 708]], "below": [[], [], [565, 579]], "ben": [[], [], [1099]], "beneficiary": [[739], [], [228]], "besides": [[], [], [715]], "best": [[], [], [944]], "better": [[], [], [464]], "between": [[], [], [204, 207, 279, 380, 467, 554, 599, 615, 715, 728, 731, 744, 748, 775, 780, 781, 782, 783, 784, 788, 811, 833, 861, 873, 884, 898, 900, 918, 921, 931, 952, 953, 962, 972, 974, 997, 1028, 1063, 1065, 1116, 1126, 1133, 1147, 1180, 1219, 1228, 1234, 1250]], "beyond": [[], [], [631, 794]], "bhamgiy": [[], [], [1074]], "biased": [[], [], [1251]], "bic": [[], [], [1130]], "biclausal": [[1042], [], [1155]], "bicycle": [[], [], [305, 380, 381, 406, 465, 680, 833, 1122, 1130, 1147, 1193]], "big": [[], [], [839, 1027, 1061, 1062, 1106, 1130, 1199, 1233]], "bigger": [[], [], [778, 964, 1027, 1061, 1062, 1115, 1150, 1233]], "bil": [[], [], [1149]], "bilboi": [[], [], [1060]], "bill": [[], [], [263, 473, 619, 692, 775, 911]], "billy": [[], [], [285, 286]], "binary": [[], [], [1041]], "binding": [[558], [], [558, 1090, 1214]], "binoculars": [[], [], [426]], "binominal": [[241], [241], [577, 1058]], "biological": [[], [], [861]], "bird": [[], [], [574]], "birds": [[], [], [255, 274]], "bisyndetic": [[1043], [], [1249]], "bivalent": [[740], [], [539, 584, 711, 740, 899, 1000, 1259]], "bizi": [[], [], [346]], "black": [[], [], [258, 574]], "blackbird": [[], [], [574]], "blending": [[], [], [259, 771]], "block": [[], [], [691]], "bloodhound": [[], [], [1245, 1267]], "blowing": [[], [], [1002]], "blue": [[], [], [490, 607]], "bluebird": [[], [], [1041]], "bobby": [[], [], [1158]], "bodily": [[242, 243, 741, 742], [949], [242, 243, 329, 741, 742, 764, 826, 827, 882, 949, 968, 1212]], "body": [[244, 245, 246, 743, 744, 745], [253, 743, 744, 764], [244, 246, 253, 356, 741, 743, 744, 745, 764, 882, 900, 918, 1141, 1149, 1247]], "bone": [[], [], [863]], "book": [[196], [], [201, 304, 370, 397, 417, 418, 597, 600, 606, 616, 938, 958, 1044, 1112, 1174, 1270]], "books": [[], [], [247, 646, 1066, 1093, 1134, 1252]], "bookstore": [[], [], [1112]], "bored": [[], [], [204, 205]], "boss": [[], [], [1228, 1277]], "both": [[], [], [252, 292, 293, 301, 319, 322, 356, 357, 358, 360, 361, 424, 461, 494, 522, 572, 579, 690, 729, 816, 837, 847, 882, 892, 893, 928, 931, 1004, 1005, 1006, 1026, 1088, 1091, 1094, 1095, 1096, 1097, 1104, 1116, 1149, 1151, 1165, 1174, 1208, 1242, 1255]], "bottle": [[], [], [283]], "bottom": [[], [], [360, 361, 552]], "bought": [[], [], [228, 417, 418, 604, 617, 629, 687, 688, 690, 1174]], "bouncing": [[], [], [996]], "boundness": [[], [1129], []], "bowl": [[], [], [292, 360, 645, 1154, 1203]], "bowls": [[], [], [1154]], "boy": [[], [], [266, 406, 611, 1065, 1117, 1130]], "boys": [[], [], [247, 371, 433, 892]], "brackets": [[], [], [274, 493, 565]], "branch": [[], [], [215]], "bread": [[], [], [1155]], "breakfast": [[], [], [378, 466]], "breaking": [[], [], [539, 711, 720, 727, 749, 782, 856, 899, 905]], "brick": [[], [], [889]], "bright": [[], [], [1067]], "bring": [[], [], [856, 867, 880, 883]], "bringing": [[], [], [731, 883, 931]], "brings": [[], [], [721, 761]], "british": [[], [], [555]], "broad": [[], [], [272, 581]], "broader": [[], [], [540, 1265]], "broadly": [[], [], [795, 812]], "broke": [[], [], [499, 539, 630, 711, 720, 727, 749, 782, 856, 866, 899, 905, 1162]], "broken": [[], [], [499, 905, 908]], "brother": [[], [], [229, 359, 606]], "brought": [[], [], [619, 656]], "bruce": [[], [], [385, 867]], "bu": [[], [], [1004]], "budget": [[], [], [858]], "bumped": [[], [], [1239]], "burglar": [[], [], [675]], "bus": [[], [], [305, 535, 705, 715]], "busca": [[], [], [1087]], "buscar": [[], [], [566]], "business": [[], [], [447, 672]], "but": [[], [455, 456, 694], [207, 218, 231, 235, 276, 279, 297, 306, 323, 346, 353, 356, 378, 383, 390, 464, 467, 502, 519, 524, 546, 555, 574, 606, 610, 615, 616, 619, 632, 639, 642, 643, 687, 692, 695, 696, 698, 709, 712, 713, 781, 789, 835, 854, 858, 879, 889, 911, 918, 952, 965, 974, 991, 997, 1007, 1010, 1016, 1022, 1056, 1062, 1070, 1072, 1104, 1112, 1138, 1141, 1143, 1152, 1157, 1169, 1173, 1184, 1187, 1190, 1214, 1221, 1226, 1231, 1240, 1270, 1272]], "button": [[], [], [225, 277, 478, 729, 783, 788, 885, 887, 916, 928]], "buy": [[], [], [687]], "buying": [[], [], [545, 998, 1090, 1137]], "by": [[282, 785], [785], [203, 204, 207, 228, 239, 241, 255, 267, 274, 278, 279, 281, 282, 292, 293, 298, 305, 306, 319, 335, 353, 360, 361, 377, 386, 388, 410, 412, 418, 433, 460, 461, 462, 464, 466, 467, 488, 493, 494, 500, 536, 540, 543, 546, 552, 553, 554, 564, 566, 567, 569, 571, 573, 574, 586, 588, 589, 590, 591, 594, 597, 598, 600, 602, 603, 612, 614, 616, 629, 638, 639, 642, 645, 663, 673, 675, 676, 677, 683, 684, 688, 690, 693, 694, 697, 701, 706, 708, 712, 729, 739, 756, 758, 762, 773, 784, 785, 794, 797, 798, 809, 813, 817, 831, 844, 847, 852, 854, 856, 858, 861, 862, 863, 866, 867, 872, 873, 883, 886, 889, 901, 907, 911, 920, 922, 926, 927, 928, 940, 945, 972, 974, 976, 1003, 1012, 1016, 1017, 1026, 1037, 1049, 1050, 1062, 1063, 1066, 1075, 1078, 1081, 1083, 1090, 1096, 1098, 1099, 1101, 1102, 1111, 1117, 1126, 1133, 1146, 1155, 1169, 1173, 1182, 1190, 1194, 1198, 1209, 1222, 1226, 1227, 1230, 1232, 1236, 1237, 1239, 1240, 1245, 1249, 1250, 1253, 1265, 1266, 1267, 1276]], "bye": [[], [], [574]], "c": [[], [], [1075, 1236]], "ca": [[], [], [1150, 1268, 1269]], "caak5": [[], [], [903]], "caine": [[], [], [1052]], "cake": [[], [], [395, 429, 491, 797, 852]], "cakes": [[], [], [408]], "caldera": [[], [], [437]], "calendar": [[], [], [451, 452]], "calendars": [[], [], [452]], "calibratable": [[], [], [393]], "call": [[], [], [668, 816]], "called": [[], [], [240, 286, 645, 668, 948, 1059, 1083, 1133]], "calls": [[], [], [558]], "came": [[], [], [667, 1059, 1117, 1248]], "campus": [[], [], [811]], "can": [[], [], [262, 263, 281, 305, 322, 324, 357, 408, 473, 488, 552, 559, 562, 598, 600, 606, 609, 633, 634, 645, 647, 675, 684, 729, 775, 928, 938, 945, 1042, 1073, 1210, 1245]], "candy": [[], [], [216, 704, 709, 1186]], "cannot": [[], [], [322, 540, 638, 667]], "canoe": [[], [], [1016]], "cantaban": [[], [], [1132, 1133]], "cantonese": [[], [], [1042, 1154]], "canyonlands": [[], [], [267]], "capable": [[], [], [1009]], "capital": [[], [], [536]], "capture": [[], [], [599]], "car": [[], [], [249, 308, 591, 630, 728, 784, 866, 919, 920, 921, 925, 1088, 1136, 1138, 1148, 1189, 1203, 1253]], "cardinal": [[247, 746], [], [247, 891]], "cardinality": [[], [], [247, 281, 484, 546, 569, 890, 891]], "care": [[244, 743], [743], [244, 743, 1097]], "caribou": [[], [], [1043]], "carol": [[], [], [492, 493, 494, 772, 836, 1111, 1119, 1163, 1201, 1224]], "carried": [[], [], [642, 884, 1129, 1248]], "carrots": [[], [], [298, 817, 901]], "carry": [[], [], [1129, 1248]], "carrying": [[], [], [712]], "case": [[1044, 1084, 1115], [948, 1116], [216, 357, 533, 575, 703, 706, 1009, 1014, 1017, 1019, 1027, 1030, 1035, 1044, 1061, 1065, 1079, 1084, 1103, 1106, 1115, 1116, 1150, 1169, 1190, 1191, 1219, 1220, 1221, 1233, 1259]], "cases": [[], [], [926, 1043]], "cat": [[], [], [262, 461, 522, 663, 726, 778, 839, 964, 1155]], "catch": [[], [], [1064]], "categorical": [[747], [], [271]], "categories": [[581], [], [360, 361, 555, 562, 565, 581, 582, 600, 650, 702, 813, 976, 979, 1041, 1133, 1134, 1169, 1194, 1267, 1268]], "categorization": [[], [], [813]], "categorizing": [[], [], [701]], "category": [[1006, 1008, 1011, 1088, 1105, 1127, 1136, 1165, 1208, 1230], [559, 598, 993, 1011, 1127], [262, 300, 301, 413, 462, 473, 513, 571, 572, 583, 587, 588, 602, 634, 663, 726, 798, 802, 810, 816, 821, 837, 845, 847, 849, 880, 890, 910, 915, 929, 979, 993, 1006, 1008, 1011, 1067, 1088, 1105, 1127, 1136, 1165, 1169, 1194, 1208, 1230]], "cats": [[], [], [238, 756, 809, 855, 1026]], "cattle": [[], [], [344]], "caught": [[], [], [997]], "caught_cold": [[], [], [997]], "causal": [[248, 748, 749, 750, 751, 752, 753, 754, 755, 756, 788, 811, 962], [], [225, 275, 276, 277, 341, 478, 491, 613, 727, 729, 748, 749, 756, 757, 760, 780, 781, 782, 783, 788, 809, 811, 838, 855, 928, 962, 970, 1028, 1228]], "causally": [[], [], [225, 277, 478, 783]], "causation": [[800, 853, 957], [], []], "causative": [[249, 757, 1045, 1046, 1047, 1048], [], [249, 385, 410, 757, 760, 867, 1046, 1065, 1259]], "cause": [[758, 829], [], [249, 263, 758, 761, 775]], "caused": [[759], [], []], "causee": [[250, 760], [], [760, 883, 1065, 1155, 1259]], "causer": [[251, 761], [], [757, 760, 761, 1155]], "causes": [[], [], [748, 758, 775, 838]], "causing": [[], [], [341, 748, 838, 854]], "cave": [[], [], [832, 841]], "celestial": [[], [], [314, 626]], "center": [[], [], [601, 695]], "central": [[313, 318, 625, 627, 762], [], [288, 313, 318, 554, 571, 625, 680, 711, 738, 740, 761, 762, 881, 899, 907, 944, 992, 1000, 1141]], "certain": [[], [], [368, 554, 633, 734, 762, 861, 907, 976, 1102, 1152, 1169, 1210, 1245, 1268]], "certainty": [[], [], [812, 880]], "cf": [[], [], [212, 356, 1268]], "ch": [[], [], [346]], "cha": [[], [], [1064]], "chafe": [[], [], [597]], "chain": [[749, 750], [], [252, 491, 727, 749, 756, 757, 760, 782, 809, 855, 970]], "chaining": [[252, 763], [286], [252, 286]], "change": [[210, 253, 254, 721, 764, 765, 766, 801, 996], [253, 764, 765], [210, 253, 254, 528, 529, 713, 721, 756, 764, 765, 801, 807, 854, 858, 905, 908, 966, 996]], "changes": [[], [], [571]], "changing": [[], [], [764]], "chaplin": [[], [], [987]], "chapter": [[0, 10, 20, 33, 46, 58, 64, 76, 82, 95, 105, 114, 125, 140, 154, 162, 176, 187, 191], [], [692]], "chapters": [[], [], [397, 713]], "characteristic": [[], [], [557, 908, 1124, 1126]], "characteristics": [[], [], [976, 1245]], "characterization": [[], [], [650, 795, 812]], "characterized": [[], [], [972, 974]], "characterizes": [[], [], [873, 884]], "charlie": [[], [], [987]], "chase": [[], [], [481, 932, 1229]], "chasing": [[], [], [481, 932, 1229]], "chat": [[], [], [1155]], "chechen": [[], [], [1191]], "check": [[], [], [1163]], "cheesecake": [[], [], [492, 493, 494, 1111, 1119, 1201, 1224]], "chest": [[], [], [1193]], "chewed": [[], [], [863]], "chi": [[], [], [1064]], "chicas": [[], [], [467, 1132, 1133]], "chicken": [[], [], [972, 1075, 1265]], "chidhi": [[], [], [1025]], "child": [[], [], [744, 1248]], "children": [[], [], [290, 475, 618, 1208, 1231]], "chinese": [[], [], [346, 1035]], "chips": [[], [], [365, 854]], "cho": [[], [], [1064, 1268]], "chocolates": [[], [], [408]], "choice": [[336, 633], [], [336, 338, 633]], "choose": [[], [], [336, 633]], "chooses": [[], [], [610]], "choosing": [[610], [], [693]], "chosen": [[], [], [610, 633]], "chrau": [[], [], [1050, 1237]], "chwi": [[], [], [1100]], "cindy": [[], [], [613, 631]], "circle": [[], [], [252]], "circuit": [[], [], [1052]], "circumposition": [[1049], [], [1017]], "circumstantial": [[403, 884], [873], [884]], "citl": [[], [], [1268]], "city": [[], [], [262]], "class": [[598, 837, 1000], [837, 1000], [243, 246, 266, 284, 532, 540, 541, 555, 559, 587, 598, 611, 713, 738, 741, 745, 889, 892, 923, 948, 1000, 1014, 1133, 1134, 1164, 1169, 1194]], "classes": [[587], [], [281, 582, 598, 1000, 1050]], "classical": [[], [], [1247]], "classifer": [[], [], [1237]], "classification": [[], [], [553, 582]], "classified": [[], [], [396]], "classifier": [[1050, 1154, 1237], [], [1050, 1154, 1225, 1237]], "classifiers": [[], [], [395, 1133, 1154]], "classifies": [[], [], [1237]], "clausal": [[], [], [255, 274]], "clause": [[204, 205, 206, 217, 225, 255, 268, 269, 286, 297, 338, 383, 390, 418, 420, 435, 436, 478, 492, 493, 494, 495, 524, 549, 1020, 1051, 1069, 1174, 1264], [204, 267, 286, 379, 412, 450, 492, 1051, 1174, 1264], [204, 205, 207, 216, 217, 225, 255, 268, 270, 272, 285, 286, 288, 297, 336, 338, 347, 368, 379, 382, 383, 385, 390, 412, 417, 418, 424, 459, 460, 461, 462, 464, 478, 492, 493, 494, 522, 524, 548, 549, 552, 558, 564, 619, 620, 631, 632, 633, 644, 656, 675, 692, 712, 729, 731, 748, 756, 797, 812, 813, 852, 873, 883, 884, 885, 887, 911, 916, 927, 928, 931, 953, 972, 974, 1015, 1022, 1027, 1031, 1035, 1038, 1052, 1053, 1056, 1060, 1061, 1062, 1063, 1064, 1067, 1070, 1075, 1079, 1086, 1090, 1098, 1111, 1112, 1116, 1119, 1131, 1140, 1143, 1148, 1150, 1152, 1153, 1155, 1174, 1187, 1189, 1190, 1191, 1199, 1201, 1206, 1209, 1210, 1214, 1220, 1222, 1224, 1226, 1229, 1233, 1241, 1242, 1249, 1251, 1265]], "clauses": [[], [], [204, 255, 274, 285, 297, 305, 379, 383, 412, 424, 450, 461, 493, 522, 552, 558, 660, 1031, 1037, 1042, 1061, 1062, 1063, 1111, 1190, 1199, 1249, 1253]], "clawed": [[], [], [1026]], "cleaning": [[], [], [676]], "clear": [[], [], [371, 554, 944]], "clearly": [[], [], [645]], "cleft": [[1052], [], [1052]], "clerk": [[], [], [1087]], "clf": [[], [], [1016, 1141, 1142, 1198, 1225]], "climb": [[], [], [300, 798]], "climbed": [[], [], [1199]], "climbing": [[], [], [1173]], "clitic": [[], [], [573, 591, 1063, 1249]], "close": [[], [], [836, 1054]], "closed": [[], [], [252, 605, 811]], "closely": [[], [], [347, 1250]], "closing": [[], [], [836]], "co": [[542, 767, 997, 1046, 1053], [1053], [207, 560, 588, 589, 997, 1006, 1010, 1011, 1026, 1088, 1108, 1127, 1142, 1165, 1208, 1244, 1250, 1260]], "code": [[], [1182, 1276], []], "coded": [[1182, 1184, 1185, 1275, 1276], [1182, 1185, 1275, 1276], [222, 227, 917, 1034, 1065, 1083, 1104, 1236, 1259]], "codes": [[], [], [1083, 1182, 1276]], "coding": [[591, 1094, 1182, 1265, 1276], [1182, 1265, 1276], [493, 591, 1041, 1184, 1185, 1234, 1265, 1275, 1277]], "coffee": [[], [], [610, 1124]], "coffre": [[], [], [1193]], "cognate": [[1054], [1054], []], "cognition": [[256, 768], [768], [256, 329, 768]], "coherence": [[621], [], []], "coil": [[], [], [304]], "coincide": [[], [], [953]], "cold": [[], [], [991, 997, 1216, 1220]], "collapsed": [[], [], [758]], "collapsing": [[], [], [758]], "collared": [[], [], [295]], "collective": [[257, 769], [], [257]], "college": [[], [], [357]], "colloquial": [[], [], [1042]], "color": [[258, 770], [], [258, 889]], "column": [[], [], [650]], "combination": [[], [], [231, 255, 281, 340, 357, 540, 566, 569, 1037, 1049, 1083, 1155, 1245, 1249]], "combinations": [[], [], [413, 479]], "combine": [[], [], [241, 301, 1021]], "combined": [[], [], [235, 255, 281, 286, 287, 292, 294, 322, 360, 579, 715, 1050, 1058, 1155, 1243, 1252]], "combines": [[], [], [294, 569, 986, 1124, 1221, 1234, 1237]], "combining": [[259, 771], [771], [234, 259, 291, 771]], "come": [[], [], [267, 574, 634, 713, 795, 812, 847, 965, 1010]], "comes": [[], [], [574, 847, 991, 1227]], "coming": [[], [], [363, 364, 446, 648, 649, 1011, 1193]], "comitative": [[772], [], [772, 1269]], "command": [[], [], [654]], "commands": [[], [], [795]], "comment": [[535, 705], [679], [412, 535, 599, 679, 703, 705, 927, 1002, 1041, 1242]], "commentative": [[260, 261, 773], [773], [261, 332, 349, 382, 773, 815, 831, 844, 1152]], "commitment": [[], [], [813, 885, 887, 916]], "committee": [[], [], [555]], "common": [[262], [], [234, 262, 290, 292, 294, 301, 340, 360, 413, 471, 473, 479, 553, 565, 583, 613, 701, 708, 891, 898, 1030, 1111, 1126, 1201, 1206]], "commonly": [[], [], [368, 414, 1126]], "communication": [[774], [], [647]], "communicative": [[], [], [378, 570]], "companion": [[], [1269], []], "company": [[], [], [898, 1241]], "comparable": [[], [], [265]], "comparative": [[263, 264, 265, 266, 559, 611, 775, 776, 777, 1027, 1061, 1062, 1106, 1150, 1190, 1233], [775, 777, 1062], [225, 263, 264, 266, 315, 478, 554, 559, 611, 748, 775, 778, 839, 964, 1027, 1061, 1062, 1080, 1084, 1106, 1115, 1131, 1150, 1180, 1190, 1223, 1233]], "comparatives": [[], [], [1180]], "compare": [[], [], [559]], "compared": [[], [], [265, 266, 611]], "comparee": [[778], [], [264, 315, 778, 839, 964, 1027, 1035, 1061, 1062, 1079, 1080, 1084, 1103, 1106, 1131, 1150, 1180, 1190, 1191, 1220, 1221, 1223, 1233]], "comparison": [[], [], [611, 663, 1131, 1180, 1223]], "complement": [[267, 268, 269, 270, 368, 417, 418, 419, 420, 421, 436, 437, 1055, 1085], [267, 558, 612], [267, 268, 270, 297, 368, 382, 385, 417, 418, 437, 477, 558, 712, 773, 797, 798, 815, 831, 844, 852, 867, 883, 911, 922, 926, 1003, 1012, 1056, 1063, 1090, 1124, 1137, 1143, 1152, 1153, 1155, 1174, 1187, 1214, 1241]], "complementaries": [[], [], [271]], "complementary": [[271], [], []], "complementative": [[612], [], [576]], "complementizer": [[1056, 1144], [], [1056, 1063, 1214]], "complements": [[], [], [267, 368, 558]], "completed": [[], [], [539]], "completely": [[], [], [762, 1241]], "completion": [[], [], [911]], "completive": [[779], [], []], "complex": [[231, 272, 273, 274, 298, 319, 386, 471, 500, 518, 519, 613, 1057], [298, 500], [204, 231, 239, 255, 272, 274, 286, 287, 297, 298, 319, 383, 386, 390, 424, 461, 471, 488, 500, 519, 522, 528, 529, 574, 613, 616, 619, 692, 715, 731, 748, 784, 817, 873, 884, 901, 931, 953, 972, 974, 1013, 1014, 1018, 1019, 1021, 1037, 1038, 1054, 1063, 1068, 1070, 1071, 1074, 1083, 1126, 1131, 1135, 1151, 1167, 1180, 1187, 1188, 1204, 1223, 1234, 1249]], "component": [[], [], [272, 285, 298, 386, 500, 617, 629, 648, 687, 688, 690, 789, 1013, 1014, 1018, 1019, 1021, 1068, 1070, 1071, 1074, 1126, 1188, 1204, 1226]], "components": [[], [], [272, 575, 668, 670, 710]], "compound": [[], [], [1058]], "compounded": [[], [], [1173]], "compounding": [[1058], [], [1058, 1235]], "comrie": [[], [], [1265]], "conceived": [[], [], [613]], "conceiver": [[], [], [795, 812, 880]], "concept": [[559, 713, 876, 892, 923], [713, 816, 965], [200, 201, 209, 241, 258, 267, 302, 351, 381, 389, 398, 406, 407, 416, 451, 460, 462, 493, 509, 547, 549, 554, 559, 591, 606, 608, 612, 647, 655, 691, 705, 707, 713, 807, 889, 908, 923, 925, 938, 940, 965, 966, 991, 993, 1012, 1019, 1116, 1126, 1164, 1182, 1232, 1267, 1276]], "concepts": [[], [], [241, 339, 414, 474, 559, 577, 582, 587, 655, 693, 701, 706, 713, 794, 810, 816, 892, 923, 1116, 1219]], "conceptual": [[560], [], [560, 588, 589]], "conceptualized": [[], [], [761, 828]], "concern": [[], [], [599]], "concert": [[], [], [772]], "concessive": [[275, 276, 780, 781, 1028, 1228, 1262], [275, 780, 781], [225, 275, 276, 478, 748, 780, 781, 788, 811, 962, 1028, 1228, 1262]], "concomitant": [[782], [], []], "condensing": [[], [], [304]], "condition": [[], [], [962, 1228]], "conditional": [[263, 275, 277, 278, 341, 614, 775, 780, 783, 838, 1028, 1059, 1060, 1228, 1262], [275, 775, 780, 783, 838, 1059], [225, 263, 275, 277, 278, 341, 478, 614, 729, 748, 775, 780, 783, 788, 811, 838, 928, 962, 1028, 1060, 1228, 1262]], "conditionally": [[], [1059], [1223]], "conditions": [[], [], [275, 780, 1028, 1228, 1262]], "conform": [[], [], [410]], "conforming": [[], [], [858]], "conforms": [[], [], [240]], "conj": [[], [], [952, 997]], "conjoined": [[1061, 1062], [1062], [1061, 1062, 1084, 1131, 1223]], "conjoins": [[], [], [1061]], "conjunct": [[], [285], []], "conjunction": [[1063], [324, 408], [1035, 1063, 1190, 1191]], "conjunctions": [[], [], [304]], "conjunctive": [[279], [], [279, 715]], "connected": [[], [], [257, 1060, 1091]], "connection": [[622], [], []], "consciousness": [[], [], [601, 695]], "consecutive": [[280, 784], [], [279, 784, 1180, 1253]], "consequent": [[], [729], [225, 277, 783]], "consider": [[], [], [473, 612]], "considered": [[], [], [288, 290, 706, 715, 738, 762, 907, 945, 952, 1087]], "consistent": [[], [], [1245]], "consisting": [[], [], [268, 272, 274, 592, 598, 757]], "consists": [[], [], [255, 264, 272, 281, 397, 586, 628, 1061, 1190, 1191, 1220, 1251]], "constitute": [[], [], [319, 616]], "constitutes": [[], [], [272]], "constrains": [[], [], [555]], "construal": [[], [], [204, 368, 607, 609, 613, 617, 630, 631, 646, 653, 731, 748, 784, 824, 873, 884, 886, 893, 908, 931, 952, 953, 972, 974]], "construct": [[], [], [1238]], "construction": [[197, 198, 202, 204, 212, 213, 216, 217, 219, 222, 227, 230, 235, 239, 248, 249, 252, 257, 260, 263, 264, 268, 275, 276, 277, 281, 286, 287, 290, 291, 299, 308, 313, 314, 315, 316, 318, 321, 325, 328, 331, 337, 338, 341, 345, 348, 353, 354, 356, 359, 363, 364, 369, 371, 376, 378, 379, 380, 382, 384, 391, 395, 397, 399, 402, 403, 404, 406, 412, 413, 414, 418, 423, 424, 429, 436, 445, 446, 447, 448, 449, 450, 452, 460, 461, 462, 463, 464, 465, 466, 467, 468, 470, 476, 479, 480, 483, 487, 488, 491, 493, 498, 507, 516, 522, 525, 526, 529, 531, 533, 535, 539, 540, 544, 550, 561], [202, 204, 212, 219, 240, 241, 255, 275, 286, 291, 308, 325, 354, 364, 379, 395, 397, 399, 402, 406, 423, 433, 435, 445, 452, 460, 462, 479, 483, 507, 516, 529, 539, 540], [203, 204, 205, 207, 212, 213, 216, 217, 219, 222, 225, 227, 228, 235, 237, 238, 239, 240, 241, 249, 252, 255, 257, 263, 264, 267, 268, 270, 272, 274, 275, 276, 277, 278, 279, 281, 285, 286, 287, 290, 291, 296, 297, 304, 305, 308, 311, 313, 314, 315, 318, 321, 324, 325, 328, 338, 341, 353, 354, 356, 359, 363, 364, 369, 371, 378, 380, 382, 383, 390, 395, 397, 402, 406, 408, 410, 413, 417, 418, 424, 425, 426, 429, 433, 445, 446, 447, 452, 460, 461, 462, 463, 464, 465, 466, 467, 470, 474, 478, 479, 487, 488, 490, 491, 492, 493, 494, 498, 522, 523, 528, 529, 533, 535, 539, 540, 552, 557, 561, 562, 564, 565, 568, 569, 571, 586, 591, 594, 598, 604, 605, 611, 614, 616, 619, 625, 628, 632, 639, 642, 648, 692, 705, 712, 731, 738, 744, 748, 756, 775, 778, 780, 781, 783, 788, 797, 811, 821, 833, 836, 838, 839, 852, 861, 863, 864, 872, 873, 879, 883, 884, 893, 900, 903, 911, 919, 920, 931, 953, 962, 964, 969, 972, 974, 976, 989, 1004, 1005, 1012, 1013, 1014, 1015, 1016, 1018, 1019, 1021, 1022, 1025, 1026, 1028, 1030, 1034, 1037, 1038, 1039, 1041, 1042, 1046, 1052, 1053, 1056, 1058, 1059, 1060, 1061, 1062, 1063, 1064, 1065, 1066, 1067, 1068, 1070, 1071, 1072, 1074, 1075, 1083, 1087, 1093, 1099, 1100, 1102, 1108, 1110, 1111, 1116, 1117, 1119, 1120, 1121, 1122, 1124, 1130, 1131, 1134, 1135, 1141, 1142, 1143, 1148, 1149, 1151, 1152, 1153, 1154, 1155, 1156, 1157, 1158, 1163, 1167, 1173, 1174, 1179, 1180, 1182, 1184, 1185, 1186, 1187, 1188, 1193, 1198, 1203, 1204, 1205, 1209, 1210, 1211, 1216, 1220, 1222, 1223, 1224, 1228, 1232, 1236, 1238, 1239, 1240, 1241, 1242, 1243, 1244, 1245, 1247, 1252, 1255, 1257, 1259, 1262, 1265, 1267, 1268, 1269, 1270, 1271, 1272, 1273, 1275, 1276, 1277]], "constructions": [[], [], [240, 281, 285, 286, 368, 371, 382, 385, 395, 402, 410, 452, 462, 465, 516, 552, 555, 558, 559, 571, 577, 590, 593, 598, 602, 613, 619, 631, 676, 683, 692, 700, 748, 927, 1004, 1005, 1012, 1026, 1027, 1035, 1037, 1041, 1052, 1053, 1064, 1079, 1080, 1084, 1090, 1091, 1094, 1096, 1097, 1101, 1103, 1106, 1111, 1112, 1115, 1124, 1129, 1131, 1140, 1149, 1150, 1151, 1152, 1155, 1180, 1185, 1187, 1191, 1201, 1203, 1206, 1210, 1211, 1214, 1220, 1221, 1223, 1232, 1233, 1241, 1242, 1243, 1248, 1249, 1250, 1251, 1265, 1267, 1275]], "construe": [[], [], [893, 1236, 1240]], "construed": [[], [], [205, 286, 287, 604, 613, 656, 670, 715, 731, 748, 795, 805, 807, 812, 847, 873, 884, 908, 930, 931, 966, 972, 974, 1002]], "construes": [[], [], [286, 287, 613, 1099]], "construing": [[], [], [1099, 1236, 1240]], "contact": [[282, 785, 786], [785], [282, 785]], "contain": [[], [], [363]], "contained": [[], [], [628]], "container": [[283, 787], [], [283, 396]], "containing": [[], [645], [471]], "contains": [[], [], [216, 368, 390, 645, 1075, 1143, 1234, 1265]], "content": [[788, 927], [872], [275, 276, 277, 281, 413, 479, 604, 605, 610, 618, 628, 642, 647, 648, 651, 671, 675, 700, 748, 780, 781, 783, 788, 811, 872, 879, 927, 962, 1012, 1090, 1137, 1245]], "contentful": [[], [], [347]], "context": [[], [], [207, 279, 292, 293, 305, 360, 361, 378, 383, 514, 515, 590, 604, 607, 608, 609, 610, 615, 616, 617, 630, 646, 653, 675, 681, 691, 694, 698, 699, 789, 877, 925, 1060, 1153]], "contexts": [[], [], [633]], "contextual": [[789], [], [234, 294, 295, 334, 439, 472, 502, 534, 590, 789, 802, 929, 958]], "contextually": [[], [], [301, 475, 543, 565]], "contiguity": [[1064], [], [918, 1064, 1234]], "contiguous": [[], [], [1064]], "continuative": [[790], [], []], "continuing": [[], [], [911]], "continuity": [[], [600], []], "continuous": [[], [], [552]], "continuum": [[576, 577], [], [292, 293, 360, 361, 576, 577, 813, 1086]], "contrast": [[510, 610, 615, 617, 629, 656, 668, 670, 687, 688, 690, 710, 952], [], [207, 524, 604, 610, 615, 617, 623, 629, 656, 668, 670, 687, 688, 690, 710, 726, 762, 882, 893, 952, 997, 1012, 1017, 1065, 1083, 1101, 1137]], "contrasting": [[], [], [656, 1050]], "contrasts": [[], [], [212, 356, 615, 704, 788, 811, 817, 901, 962, 1012, 1232, 1237]], "contribution": [[], [], [528, 529]], "control": [[751, 1065], [], [898, 919, 1065]], "controlled": [[284, 791], [], [284, 920]], "controller": [[1066], [], [1066, 1093]], "conventional": [[], [], [281]], "conventionally": [[], [], [334, 502, 872]], "converb": [[1067, 1068], [], [1067]], "conversational": [[], [], [653]], "convertible": [[], [], [1216]], "conveyed": [[], [], [569, 872]], "conveys": [[], [], [628]], "convinced": [[], [], [385, 867]], "cook": [[], [], [378, 1187]], "cookie": [[], [], [370]], "cookies": [[], [], [408, 632, 681, 706, 1101]], "cooperative": [[], [], [447, 672]], "coordinand": [[285], [], [285, 1043, 1158]], "coordinands": [[], [], [285, 1037, 1043, 1158, 1249]], "coordinate": [[286, 287, 1047, 1069, 1070, 1071], [286], [207, 279, 285, 286, 287, 305, 424, 461, 522, 613, 731, 748, 873, 884, 931, 953, 972, 974, 1037, 1038, 1061, 1062, 1063, 1072, 1091, 1131, 1249]], "coordinated": [[], [], [324, 408, 1068, 1070, 1071, 1188]], "coordinating": [[], [], [1035]], "coordination": [[199, 207, 279, 280, 305, 322, 324, 357, 408, 411, 510, 542], [287, 324, 408], [207, 279, 285, 305, 322, 324, 357, 408, 715, 952, 997, 1043, 1060, 1072, 1120, 1158, 1247, 1249]], "coordinator": [[1072], [], [997, 1043, 1063, 1072, 1158, 1249]], "coordinators": [[], [], [1043, 1158]], "copula": [[1073, 1172, 1267, 1277], [1172], [1052, 1074, 1172, 1190, 1191, 1220, 1245, 1267, 1277]], "copular": [[1074], [], [1205]], "copulas": [[], [], [528, 1073]], "core": [[288], [], [227, 232, 249, 288, 1094]], "coreference": [[616], [], [488, 616, 1152]], "coreferential": [[], [616], [382, 424, 522, 619, 692, 1152, 1153, 1255]], "corner": [[], [], [465, 680]], "corporation": [[], [], [1012]], "corpus": [[], [], [593]], "correctly": [[], [], [974]], "correlated": [[], [], [1206]], "correlative": [[1075], [1075], [493, 1075, 1220]], "corresponding": [[], [], [263, 775, 783, 1259]], "corresponds": [[], [], [927]], "cos": [[], [254, 765], []], "cosubordination": [[], [286], [286]], "cough": [[], [], [243, 1065]], "coughing": [[], [], [243, 741]], "could": [[], [], [364, 452, 649, 918, 1262]], "countable": [[], [], [546]], "counter": [[], [], [645]], "counterpart": [[], [], [1211]], "counterpresuppositional": [[617], [], [610, 615, 629, 687, 688, 690]], "course": [[], [], [708, 801, 807, 902, 966, 996]], "cover": [[], [], [462, 572, 713]], "coverb": [[], [528, 529], []], "covering": [[], [], [847]], "covers": [[], [], [646, 837]], "coyote": [[], [], [599, 863, 927, 1229]], "crackers": [[], [], [228]], "crane": [[], [], [236]], "crawl": [[], [], [386]], "crawled": [[], [], [386]], "crawling": [[], [], [386]], "crazy": [[], [], [294]], "cream": [[], [], [513]], "creation": [[792], [], []], "cristofaro": [[], [], [558]], "criteria": [[], [], [281, 675]], "criterion": [[], [], [675]], "croft": [[], [], [473, 597]], "crossbow": [[], [], [1050, 1237]], "crossed": [[], [], [977]], "crosslinguistic": [[], [559], []], "crosslinguistically": [[562], [], [559, 562, 1102, 1222, 1245]], "crow": [[], [], [212, 356]], "cry": [[], [], [1268]], "crying": [[], [], [1268]], "ctp": [[], [270], [1187, 1241]], "cu": [[], [], [1229]], "culturally": [[], [], [898]], "culture": [[], [], [945]], "cumulates": [[], [], [563]], "cumulation": [[563, 566], [], []], "cupe": [[], [], [1257]], "current": [[], [], [265, 601, 619, 692, 695, 927]], "currently": [[], [], [880]], "cut": [[], [], [795, 812]], "cute": [[], [], [571]], "cuts": [[], [], [1126]], "cutting": [[], [], [1126]], "cyclicality": [[752], [], []], "d": [[], [], [1079, 1126, 1191, 1259]], "dahr": [[], [], [1204]], "damage": [[289, 793], [], [289, 793]], "dance": [[], [], [354, 642, 1039]], "dare": [[], [], [1094]], "dareka": [[], [], [418]], "dat": [[], [], [1259]], "dative": [[], [], [1097, 1259]], "daudi": [[], [], [1158]], "daughter": [[], [], [308, 1088, 1136, 1138]], "daughters": [[], [], [710]], "day": [[], [], [607]], "de": [[], [], [467, 1053, 1221]], "dead": [[], [], [271]], "declarative": [[290, 291, 618, 1076], [291], [290, 291, 402, 618, 700, 1067, 1096]], "deer": [[], [], [863]], "def": [[], [], [1229]], "default": [[], [], [290]], "defend": [[], [], [931]], "define": [[], [], [281]], "defined": [[], [], [267, 301, 335, 412, 460, 462, 493, 559, 562, 565, 590, 598, 673, 729, 789, 802, 809, 816, 855, 861, 923, 928, 929, 958, 1026, 1102, 1245, 1250]], "defines": [[], [], [598, 839]], "defining": [[], [], [371, 944, 989]], "definite": [[292, 293, 409, 1077], [215, 409, 1273], [292, 293, 592]], "definition": [[], [], [1153, 1265]], "degree": [[776, 794, 975, 1078, 1079, 1080, 1081], [1081], [263, 553, 603, 628, 706, 775, 812, 880, 886, 1078, 1079, 1080, 1081, 1106, 1220]], "degrees": [[], [], [378, 1228]], "deictic": [[], [789], [294, 295]], "deictically": [[], [], [958]], "deixis": [[623, 910, 958], [802, 929, 958], [697, 802, 929]], "dekh": [[], [], [1075]], "deleted": [[], [], [1101]], "delimiting": [[], [], [344]], "dem": [[], [], [1059]], "demonstrative": [[294, 295, 1082], [], [294, 295, 301, 583, 1172]], "denominator": [[], [], [613]], "denote": [[], [], [319, 574, 606, 845, 1050]], "denoted": [[], [], [203, 204, 281, 298, 319, 386, 418, 461, 494, 500, 552, 554, 564, 603, 729, 817, 883, 901, 928, 976, 1050, 1063, 1066, 1146, 1182, 1253, 1265, 1276]], "denotes": [[], [], [200, 201, 231, 239, 300, 347, 381, 385, 395, 407, 416, 437, 451, 477, 492, 494, 519, 529, 540, 545, 548, 549, 583, 726, 733, 796, 798, 845, 849, 867, 890, 903, 925, 926, 998, 1066, 1265]], "denoting": [[], [], [217, 370, 545, 554, 1079, 1142, 1143, 1153]], "dentist": [[], [], [1259]], "deontic": [[795], [], [795, 836, 880]], "departure": [[796], [], [796, 882]], "dependent": [[205, 296, 297, 797, 1054], [267, 492], [204, 205, 255, 297, 383, 390, 397, 418, 437, 492, 524, 748, 797, 867, 889, 1116, 1187, 1191]], "dependents": [[], [], [272, 296]], "depending": [[], [], [552, 562, 1065, 1259]], "depictive": [[298], [298], [298, 519, 576]], "deranked": [[1083], [1059, 1083], [286, 552, 558, 1005, 1009, 1022, 1031, 1056, 1059, 1067, 1068, 1072, 1074, 1083, 1140, 1155, 1180, 1187, 1188, 1189, 1199, 1221, 1223, 1248]], "deranking": [[1005, 1031, 1059, 1083, 1199], [558, 1059, 1083], [558, 1031, 1059, 1199, 1248]], "derived": [[1084], [1184], [1061, 1084, 1172, 1190, 1191, 1220, 1221]], "derives": [[], [], [596]], "describe": [[], [], [341, 484, 567, 571, 573, 575, 702, 728, 784, 838, 921, 976]], "described": [[], [], [281, 388, 414, 474, 499, 558, 597, 600, 623, 643, 645, 780, 812, 832, 966, 1000, 1002]], "describes": [[], [], [275, 298, 341, 386, 500, 574, 586, 780, 817, 838, 854, 869, 901, 904, 908, 915, 991, 1126, 1195, 1196, 1212, 1221, 1266]], "describing": [[], [], [227, 249, 281, 389, 663, 679, 685, 730, 771, 785, 793, 860, 893, 942, 969, 1002, 1041]], "description": [[609], [], [543, 608, 609, 638, 645]], "desert": [[], [], [489]], "desiderative": [[299, 300, 798], [798], [300, 558, 798]], "designated": [[], [], [508]], "designed": [[], [], [452]], "desirability": [[], [], [880]], "desire": [[], [], [654, 708, 798, 877]], "desk": [[], [], [900, 1067]], "desu": [[], [], [1094]], "detached": [[1085, 1086], [1086], [346, 1086]], "detail": [[], [], [558, 734]], "determined": [[], [], [543, 797, 852]], "determiner": [[301], [], []], "determiners": [[], [], [301, 581]], "determining": [[], [], [564]], "developed": [[], [], [597]], "develops": [[], [], [574]], "dgaimo": [[], [], [324]], "di": [[], [], [1141, 1142, 1206, 1259]], "diachronic": [[], [], [574]], "dialect": [[], [], [235]], "did": [[], [], [291, 378, 445, 687, 916, 927, 974, 1101]], "didn": [[], [], [291, 551, 687, 884, 885, 886, 972, 1003]], "die": [[], [], [517, 541, 1127]], "died": [[], [], [944, 1018, 1162]], "dies": [[], [], [860]], "differ": [[], [], [668, 710]], "difference": [[], [], [670]], "differences": [[], [], [1250]], "different": [[619], [619], [255, 264, 378, 396, 559, 567, 581, 610, 616, 626, 706, 709, 815, 902, 1005, 1007, 1012, 1043, 1059, 1060, 1067, 1083, 1091, 1097, 1104, 1131, 1138, 1152, 1180, 1185, 1231, 1242, 1248, 1250, 1260, 1265, 1267, 1272, 1275, 1277]], "differential": [[1087], [], [1087]], "differently": [[], [], [353, 639, 1065, 1242, 1259]], "differs": [[], [], [353, 639, 1086, 1211]], "difficult": [[], [], [1002]], "diid": [[], [], [1027]], "dik": [[], [], [610, 693]], "diligent": [[], [], [207]], "dimension": [[302, 799], [], [302, 603]], "dimensional": [[], [], [226, 730, 923]], "dineje": [[], [], [1043]], "dinner": [[], [], [1187]], "direct": [[303, 620, 800, 1088, 1089, 1090], [240], [240, 303, 491, 620, 1090, 1111, 1137, 1157, 1214]], "directed": [[801], [], [706, 768, 801, 808, 906, 932, 996]], "direction": [[], [], [801, 996, 1157, 1193]], "directionality": [[753], [], []], "directly": [[], [], [473, 1131, 1157, 1223]], "directness": [[754], [], []], "director": [[], [], [1087, 1259]], "dis": [[], [1051, 1109, 1139, 1246, 1264], []], "disagree": [[1025, 1272], [1025, 1272], []], "disagreeing": [[], [], [1025, 1272]], "disagrees": [[], [], [1025, 1272]], "disalignment": [[1055], [1051, 1109, 1139, 1246, 1264], []], "disappear": [[], [], [854]], "discourse": [[304, 621, 622, 623, 624, 1060, 1091], [621, 647], [215, 218, 240, 304, 433, 466, 467, 474, 488, 508, 600, 601, 602, 604, 607, 609, 610, 615, 616, 617, 623, 630, 643, 646, 647, 650, 653, 663, 673, 675, 677, 679, 680, 681, 683, 685, 694, 695, 696, 702, 706, 707, 1060, 1091, 1130]], "discussed": [[], [], [304, 474, 616, 734, 891, 979]], "disfavored": [[], [], [413]], "disfavors": [[], [], [931]], "dishes": [[], [], [210, 254, 721, 765, 892]], "disjunction": [[822, 851], [], [305, 408]], "disjunctive": [[305, 322, 357], [], [305, 322, 324, 357]], "dispersed": [[], [], [1143]], "disposition": [[], [351], []], "disqualify": [[], [], [357]], "distal": [[802], [802], []], "distance": [[1153], [], [1153]], "distinct": [[], [], [212, 314, 356, 452, 536, 577, 626, 700, 794, 879, 997, 1021, 1030, 1080, 1087, 1099, 1187, 1238, 1239, 1240, 1241]], "distinction": [[], [], [554]], "distinctions": [[], [], [553, 734, 837]], "distinctive": [[], [], [1126]], "distinctly": [[], [], [1138]], "distinguishable": [[], [], [645]], "distinguished": [[], [], [729, 928, 1017, 1041, 1245]], "distinguishing": [[], [], [581]], "distributed": [[], [1257], []], "distribution": [[], [598], [552, 564, 598]], "distributive": [[306, 803], [], [306, 484]], "dit": [[], [], [1062]], "ditransitive": [[307, 308, 1092, 1163], [307, 308, 1163, 1231], [308, 371, 989, 1026, 1142]], "diverse": [[], [], [907, 1190]], "diversity": [[], [], [596]], "divide": [[], [], [1002]], "divided": [[], [], [232, 305, 353, 369, 498, 519, 639, 651, 689, 748, 813, 882, 1000, 1073]], "divides": [[], [], [396, 702]], "division": [[], [], [554]], "dizziness": [[], [], [1212]], "dizzy": [[], [], [1212]], "dm": [[], [], [1075]], "dni": [[], [1273], []], "do": [[], [], [213, 275, 304, 447, 605, 655, 672, 673, 707, 780, 858, 907, 1009, 1025, 1052, 1096, 1100, 1191, 1262, 1267, 1271, 1272]], "doa": [[], [], [418]], "doctor": [[], [], [1268]], "does": [[], [], [263, 275, 332, 349, 357, 408, 410, 469, 502, 515, 534, 540, 564, 608, 667, 699, 703, 735, 775, 780, 831, 844, 884, 887, 889, 902, 922, 966, 996, 1007, 1013, 1066, 1068, 1070, 1083, 1112, 1153, 1167, 1235, 1237, 1262, 1271, 1272]], "doesn": [[], [], [271, 341, 838, 1052]], "dog": [[], [], [208, 306, 326, 341, 424, 459, 461, 522, 778, 838, 839, 964, 1062, 1110, 1205]], "dogs": [[], [], [312, 609, 808, 892, 1108, 1244]], "doma": [[], [], [1095]], "domain": [[1093], [], [1093]], "don": [[], [], [362, 447, 470, 644, 672, 682, 1025, 1100]], "donald": [[], [], [332, 377, 831, 862]], "done": [[], [], [500, 703, 902]], "dongobesh": [[], [], [1158]], "donkey": [[], [], [1255]], "donno": [[], [], [382, 1152]], "door": [[], [], [225, 277, 418, 478, 500, 729, 783, 788, 811, 836, 885, 887, 916, 928, 1058]], "doorknob": [[], [], [1058]], "doqora": [[], [], [359]], "double": [[1094, 1095, 1096, 1097], [1095, 1163, 1257], [1163]], "doubling": [[1098], [], []], "douglas": [[], [], [1221]], "down": [[], [], [372, 386, 630, 866, 927, 996, 1129]], "downtoner": [[309], [], []], "downtoning": [[804], [], []], "downwards": [[], [], [552]], "drank": [[], [], [279, 715, 1038]], "drawer": [[], [], [900]], "drink": [[], [], [528, 740, 854, 1228]], "drinker": [[], [], [740]], "drinking": [[], [], [740, 1015, 1124, 1228]], "dripping": [[], [], [1196]], "drives": [[], [], [294]], "driving": [[], [], [728, 784, 921]], "drop": [[], [], [884]], "drove": [[], [], [784, 921, 1253]], "drums": [[], [], [285, 286]], "dry": [[], [], [210, 254, 765]], "drying": [[], [], [210, 721]], "ds": [[], [619], [1248]], "du": [[], [], [1050, 1237]], "dual": [[1099, 1240], [], [359, 890]], "due": [[], [], [1249]], "dug": [[], [], [879, 1116]], "dumped": [[], [], [1072, 1249]], "durative": [[805], [], [734, 805]], "durativity": [[806], [], []], "dying": [[], [], [517, 541, 944]], "dyirbal": [[], [], [1030]], "dynamic": [[310, 807], [], [713, 734, 749, 986, 1135, 1167]], "dynamics": [[], [756], []], "dzarang": [[], [], [1061]], "e": [[], [], [215, 377, 383, 408, 412, 452, 524, 606, 613, 632, 695, 738, 795, 813, 835, 862, 952, 969, 1005, 1034, 1068, 1113, 1127, 1259, 1277]], "each": [[], [], [229, 252, 330, 359, 372, 487, 565, 586, 590, 775, 1042, 1043, 1099, 1157, 1184, 1187, 1234, 1236, 1240]], "earlier": [[], [], [574]], "early": [[], [], [204, 205]], "easily": [[], [], [559, 600]], "east": [[], [], [336, 633]], "eastern": [[], [], [1255]], "eat": [[], [], [365, 378, 945, 972, 1064, 1155]], "eaten": [[], [], [238, 298, 410, 1179]], "eater": [[], [], [370, 762, 902, 907]], "eating": [[], [], [762, 817, 901, 902, 907, 945, 1155, 1189]], "echo": [[1100], [], []], "ed": [[], [], [578]], "edad": [[], [], [467]], "ee": [[], [], [1054]], "eertuu": [[], [], [1079]], "ego": [[], [], [1251]], "egypt": [[], [], [1209]], "eia": [[], [], [1172]], "eiga": [[], [], [1094]], "either": [[], [], [271, 356, 379, 450, 887, 906, 915, 996, 1019, 1028, 1043, 1075, 1083, 1094, 1099, 1100, 1112, 1239]], "ejt": [[], [], [1019]], "ekiso": [[], [], [1265]], "el": [[], [], [1087, 1091]], "elaborated": [[], [], [597]], "elaborates": [[], [], [630]], "elative": [[], [], [1019]], "elder": [[], [], [668]], "elected": [[], [], [533, 607, 703]], "election": [[], [], [261, 332, 349, 377, 551, 607, 773, 831, 844, 862, 1003]], "electorales": [[], [], [1091]], "element": [[311], [902], [231, 238, 239, 296, 519, 528, 529, 817, 901, 1024, 1130, 1226, 1229, 1243, 1252]], "elements": [[], [], [272, 311, 319, 529, 557, 574, 586, 590, 1058, 1118, 1146, 1147, 1234, 1238, 1270]], "elena": [[], [], [365, 854]], "elephant": [[], [], [346, 1115, 1233]], "elephants": [[], [], [346]], "elk": [[], [], [437]], "ellipsis": [[1101], [], []], "elliptical": [[], [], [1101]], "else": [[], [], [372, 629]], "elsewhere": [[], [], [488]], "emai": [[], [], [1126]], "embedded": [[], [], [644]], "emerald": [[], [], [1222]], "emerge": [[], [], [571]], "emily": [[], [], [425, 426, 523, 1007, 1165]], "emission": [[], [], [1195, 1196]], "emotion": [[312, 808], [], [312, 329, 808, 1212]], "emotional": [[], [], [628]], "emotions": [[], [], [808]], "empathy": [[], [], [556]], "empleado": [[], [], [1087]], "employed": [[], [], [1133]], "employing": [[], [], [1174]], "employs": [[], [], [1074, 1149, 1172]], "emu": [[], [], [1015]], "en": [[], [], [389, 1091]], "encircling": [[], [], [588, 589]], "encode": [[], [], [564]], "encoded": [[], [], [249, 555, 619, 692, 1169, 1194, 1239, 1259]], "encodes": [[], [], [227, 359, 564, 1063, 1116, 1219, 1276]], "encoding": [[1102], [], [1024, 1058, 1065, 1116, 1118, 1133, 1146, 1147, 1219, 1235, 1238]], "end": [[], [], [292, 293, 360, 361, 594, 713, 735, 945]], "ending": [[], [], [1140]], "endpoint": [[809], [], [252, 809]], "ends": [[], [], [977]], "energetically": [[], [], [1126]], "engineer": [[], [], [414]], "engineers": [[], [], [255]], "english": [[], [], [209, 218, 234, 239, 241, 255, 258, 267, 290, 291, 298, 302, 319, 321, 339, 351, 354, 363, 364, 371, 386, 389, 397, 406, 433, 440, 445, 446, 447, 460, 462, 470, 471, 500, 509, 528, 529, 547, 555, 563, 566, 574, 575, 586, 598, 612, 618, 628, 642, 648, 649, 672, 682, 817, 821, 836, 901, 1007, 1008, 1012, 1021, 1026, 1039, 1041, 1043, 1052, 1080, 1101, 1108, 1121, 1124, 1130, 1140, 1147, 1158, 1162, 1163, 1165, 1182, 1193, 1203, 1210, 1216, 1232, 1236, 1240, 1243, 1244, 1245, 1267, 1270, 1271, 1276]], "enkoko": [[], [], [1265]], "enough": [[], [], [227, 249, 653]], "enriches": [[], [], [663]], "enter": [[], [], [434, 904, 1266]], "entered": [[], [], [434, 904, 1266]], "enters": [[], [], [721, 765]], "entertained": [[], [], [684]], "entire": [[], [], [780, 1112]], "entirely": [[], [], [944]], "entities": [[], [810], [214, 279, 285, 287, 324, 357, 408, 546, 556, 565, 673, 715, 849, 877]], "entity": [[313, 625, 810], [], [313, 357, 556, 625, 680, 683, 726, 789, 824, 849, 889, 893, 936, 940, 969, 981, 987]], "enumerated": [[], [], [357]], "enumeration": [[], [], [892, 923]], "environment": [[], [], [653]], "ephraim": [[], [], [668]], "epistemic": [[811, 812, 813, 885, 887, 916], [812], [275, 276, 277, 368, 377, 748, 773, 780, 781, 783, 788, 811, 812, 813, 815, 821, 831, 844, 847, 862, 880, 893, 962, 969, 1003]], "equal": [[1103, 1221], [], [315, 613, 706, 1084, 1103, 1221]], "equality": [[], [], [1221]], "equated": [[], [], [207, 279, 305, 639]], "equational": [[314, 626], [], [314, 462, 464, 572, 1052, 1101]], "equative": [[315, 814, 1035, 1079, 1103, 1176, 1191, 1220, 1221, 1261], [], [315, 778, 839, 964, 1035, 1079, 1080, 1084, 1103, 1115, 1131, 1180, 1191, 1220, 1221, 1223]], "equivalent": [[], [], [863]], "er": [[], [], [1019, 1078, 1080]], "ergative": [[1104, 1105], [1104], [1006, 1030, 1104, 1105, 1191]], "ergativity": [[1030], [], []], "ero": [[], [], [1097]], "es": [[], [], [1019, 1255]], "especially": [[], [], [602, 684, 696, 702, 1250]], "essentially": [[], [], [1004, 1060, 1148, 1155]], "est": [[], [], [231, 1080]], "estimation": [[], [], [600]], "et": [[], [], [1065, 1238]], "etc": [[], [], [573, 598, 654, 708, 1141]], "ete": [[], [], [1115, 1233]], "etymological": [[], [], [1190]], "etymologically": [[], [], [577]], "european": [[], [], [1222]], "evaluation": [[], [], [261, 332, 349, 551, 773, 831, 844, 1003]], "evaluative": [[316, 317, 815], [815], [317, 558, 773, 815, 831, 844, 1003]], "even": [[], [], [330, 554, 574, 645, 864, 1054, 1141, 1228]], "evening": [[], [], [314, 626]], "event": [[318, 627, 721, 722, 723, 730, 738, 742, 743, 745, 757, 764, 765, 768, 771, 773, 774, 785, 786, 792, 793, 798, 808, 815, 816, 817, 818, 819, 820, 824, 827, 831, 844, 854, 858, 860, 862, 867, 869, 882, 904, 906, 922, 926, 932, 933, 942, 949, 954, 956, 959, 989, 998, 1002, 1003], [722, 723, 730, 743, 745, 764, 765, 768, 771, 773, 785, 798, 815, 816, 824, 844, 860, 862, 867, 869, 882, 904, 906, 922, 926, 942, 949, 977, 998], [208, 210, 217, 226, 227, 231, 236, 239, 242, 243, 244, 246, 249, 252, 253, 254, 255, 256, 257, 259, 261, 275, 282, 284, 288, 289, 298, 300, 308, 312, 317, 318, 319, 326, 328, 329, 330, 332, 346, 349, 365, 367, 371, 372, 374, 377, 382, 385, 386, 387, 388, 400, 418, 434, 437, 438, 439, 461, 469, 472, 477, 481, 487, 488, 491, 492, 494, 497, 499, 500, 505, 517, 529, 537, 539, 545, 551, 552, 564, 584, 590, 627, 631, 653, 711, 712, 720, 721, 727, 728, 729, 730, 731, 733, 734, 735, 738, 739, 740, 741, 742, 743, 745, 748, 756, 757, 758, 760, 761, 762, 764, 765, 768, 771, 773, 775, 780, 781, 785, 788, 793, 796, 797, 798, 801, 802, 805, 807, 808, 810, 815, 816, 817, 826, 827, 828, 831, 835, 836, 838, 844, 852, 854, 856, 858, 860, 862, 863, 866, 867, 869, 873, 881, 882, 883, 884, 893, 899, 901, 902, 903, 904, 905, 906, 907, 911, 921, 922, 925, 926, 927, 928, 929, 930, 931, 942, 944, 948, 949, 958, 966, 968, 969, 970, 972, 974, 976, 977, 979, 981, 986, 989, 992, 996, 997, 998, 1000, 1002, 1003, 1013, 1014, 1018, 1021, 1065, 1068, 1070, 1071, 1090, 1099, 1110, 1137, 1141, 1152, 1155, 1157, 1184, 1188, 1193, 1204, 1226, 1227, 1234, 1236, 1240, 1242, 1259, 1265, 1266]], "eventive": [[319, 320, 819, 820], [], [239, 529, 1151, 1234]], "events": [[], [], [204, 207, 226, 243, 244, 246, 253, 257, 275, 284, 285, 286, 300, 329, 330, 341, 371, 372, 400, 461, 481, 491, 517, 532, 537, 541, 545, 558, 594, 613, 623, 631, 713, 728, 730, 731, 743, 748, 756, 764, 775, 780, 781, 783, 784, 788, 798, 815, 838, 858, 867, 873, 882, 884, 921, 926, 931, 932, 944, 948, 952, 953, 972, 974, 981, 989, 997, 1000, 1063, 1095, 1113, 1156, 1227, 1236, 1240, 1253, 1266]], "eventuality": [[], [816], []], "eventually": [[], [], [571, 1187]], "ever": [[], [], [338]], "every": [[], [], [306]], "everyone": [[], [], [543]], "everything": [[], [], [408, 1120]], "evidence": [[], [], [281, 821]], "evidential": [[], [], [821]], "evidentiality": [[821], [], []], "evoked": [[], [], [353, 604, 639, 655, 676, 707]], "evokes": [[], [], [646]], "exactly": [[], [], [275, 780, 1262]], "example": [[], [], [200, 201, 203, 204, 205, 207, 208, 210, 212, 213, 214, 215, 216, 217, 218, 219, 222, 224, 225, 227, 228, 229, 231, 232, 234, 235, 236, 237, 238, 239, 240, 241, 242, 243, 246, 249, 252, 253, 254, 255, 256, 257, 259, 261, 262, 263, 264, 265, 266, 267, 268, 270, 271, 272, 274, 275, 276, 277, 278, 279, 281, 282, 283, 284, 285, 286, 287, 288, 289, 290, 291, 292, 293, 294, 295, 296, 297, 298, 300, 303, 304, 305, 306, 308, 309, 311, 312, 313, 314, 315, 318, 319, 321, 322, 323, 324, 325, 326, 328, 332, 334, 335, 336, 338, 339, 340, 341, 342, 344, 346, 347, 349, 353, 354, 356, 357, 358, 359, 360, 361, 362, 363, 364, 365, 366, 370, 371, 373, 374, 377, 378, 380, 381, 382, 383, 385, 386, 387, 388, 389, 390, 392, 393, 395, 397, 398, 407, 408, 410, 413, 414, 416, 417, 418, 424, 425, 426, 427, 429, 433, 434, 437, 438, 439, 441, 445, 446, 447, 451, 452, 459, 460, 461, 462, 463, 464, 465, 466, 467, 469, 470, 471, 472, 473, 475, 477, 478, 479, 487, 488, 489, 490, 492, 493, 494, 497, 499, 500, 502, 505, 508, 509, 513, 514, 515, 522, 523, 524, 527, 528, 529, 532, 533, 534, 535, 536, 539, 540, 541, 543, 545, 546, 548, 549, 551, 555, 557, 559, 562, 563, 564, 566, 569, 571, 574, 575, 578, 579, 580, 586, 587, 591, 592, 595, 598, 599, 603, 604, 605, 606, 607, 608, 609, 610, 611, 612, 613, 614, 616, 617, 618, 619, 620, 625, 626, 627, 628, 629, 630, 631, 632, 633, 634, 639, 642, 644, 645, 646, 647, 648, 649, 653, 654, 655, 656, 663, 667, 668, 672, 673, 675, 676, 679, 680, 681, 682, 684, 685, 687, 688, 690, 691, 692, 698, 699, 703, 704, 705, 706, 707, 708, 709, 710, 712, 713, 720, 721, 726, 727, 728, 729, 733, 735, 738, 739, 740, 741, 742, 744, 745, 748, 749, 756, 757, 758, 760, 761, 762, 764, 765, 768, 771, 772, 773, 775, 778, 780, 781, 782, 783, 784, 785, 788, 793, 794, 795, 796, 797, 798, 801, 805, 807, 808, 809, 811, 812, 817, 821, 824, 826, 828, 831, 832, 833, 835, 838, 839, 841, 844, 845, 849, 852, 854, 855, 856, 860, 861, 862, 863, 864, 866, 867, 869, 872, 873, 877, 879, 881, 883, 884, 885, 886, 887, 889, 891, 892, 893, 898, 899, 900, 901, 902, 903, 904, 905, 906, 907, 908, 911, 916, 917, 918, 919, 920, 921, 922, 925, 926, 927, 928, 930, 931, 936, 938, 940, 942, 944, 945, 948, 949, 952, 953, 958, 962, 964, 965, 966, 968, 969, 970, 972, 974, 977, 981, 991, 992, 993, 996, 997, 998, 1003, 1004, 1005, 1006, 1007, 1008, 1009, 1010, 1011, 1012, 1013, 1014, 1015, 1016, 1018, 1019, 1021, 1022, 1024, 1025, 1026, 1027, 1028, 1030, 1031, 1035, 1037, 1038, 1039, 1041, 1042, 1043, 1044, 1046, 1049, 1050, 1052, 1053, 1054, 1056, 1058, 1059, 1060, 1061, 1062, 1064, 1065, 1066, 1067, 1068, 1070, 1071, 1072, 1074, 1075, 1078, 1079, 1080, 1081, 1083, 1084, 1086, 1087, 1088, 1090, 1091, 1093, 1094, 1095, 1096, 1097, 1100, 1101, 1103, 1104, 1105, 1106, 1108, 1110, 1111, 1112, 1113, 1115, 1117, 1118, 1119, 1120, 1121, 1122, 1124, 1126, 1127, 1129, 1130, 1132, 1133, 1134, 1136, 1137, 1138, 1140, 1141, 1142, 1143, 1146, 1147, 1148, 1149, 1150, 1152, 1153, 1154, 1155, 1156, 1157, 1158, 1162, 1163, 1164, 1165, 1169, 1172, 1173, 1174, 1179, 1182, 1185, 1186, 1187, 1188, 1189, 1190, 1191, 1193, 1194, 1195, 1196, 1198, 1199, 1201, 1202, 1203, 1204, 1206, 1207, 1208, 1209, 1210, 1212, 1214, 1216, 1220, 1221, 1222, 1223, 1224, 1225, 1226, 1227, 1228, 1229, 1230, 1231, 1232, 1233, 1234, 1237, 1238, 1239, 1241, 1242, 1243, 1244, 1245, 1247, 1248, 1249, 1250, 1251, 1252, 1253, 1255, 1257, 1259, 1262, 1265, 1266, 1267, 1268, 1269, 1270, 1271, 1272, 1275, 1276, 1277]], "examples": [[], [], [209, 218, 226, 244, 247, 258, 297, 302, 330, 351, 368, 372, 400, 406, 412, 418, 440, 474, 481, 491, 517, 537, 547, 559, 581, 638, 650, 711, 730, 731, 743, 789, 836, 847, 858, 882, 892, 923, 932, 965, 987, 989, 1002, 1099, 1116, 1131, 1180, 1184, 1205, 1219, 1236, 1240]], "exceed": [[1062, 1106], [1062], [778, 1062, 1084, 1106, 1223]], "exceeds": [[], [], [264, 964, 1062, 1106, 1223]], "excellent": [[], [], [1232]], "except": [[], [], [252, 304, 656, 974, 1203]], "exchange": [[], [], [604, 610, 617, 629, 655, 673, 687, 688, 690, 707]], "exclamative": [[321, 628], [], [321, 628, 700]], "exclude": [[], [], [1265]], "excludes": [[], [], [1067]], "excluding": [[], [], [323, 447, 672, 690, 738]], "exclusive": [[322, 323, 822], [], [305, 322, 323, 324, 359]], "exclusively": [[], [], [1008, 1105, 1136, 1230, 1265]], "execution": [[], [], [712]], "exemplar": [[], [], [308, 371, 539, 944]], "exemplified": [[], [], [281, 1012, 1232]], "exhaustive": [[324, 408, 823, 888], [324, 408], [322, 324, 357, 408, 581, 1120, 1247]], "exhaustiveness": [[], [], [1120]], "exhibit": [[], [], [329, 351, 670]], "exist": [[], [], [877, 1016, 1255, 1257]], "existence": [[824], [], [318, 371, 627, 684, 824, 877, 889]], "existential": [[325, 1107], [325, 824], [325, 402, 824]], "exists": [[], [], [684, 1016]], "exit": [[], [], [1064]], "exited": [[], [], [903]], "expanded": [[], [], [801]], "expanding": [[629], [], []], "expect": [[], [], [945]], "expected": [[], [], [276, 675, 781, 1028, 1228]], "expecting": [[], [], [363, 446, 648]], "expensive": [[], [], [527]], "expensiveness": [[], [], [527]], "experience": [[326, 722, 825], [597, 722], [326, 583, 827, 968]], "experiencer": [[327, 826, 1108], [1108, 1244], [328, 382, 768, 808, 826, 922, 926, 968, 1094, 1097, 1108, 1152]], "experiences": [[], [], [597, 826]], "experiential": [[328, 329, 827, 1109], [1109], [328, 329, 768, 808, 826, 828, 906, 949, 968, 1094, 1097, 1108, 1212, 1244]], "expertum": [[828], [], [828]], "explains": [[], [], [630]], "explanation": [[630], [], [630]], "explanations": [[], [], [570]], "explicit": [[], [564], [552, 564, 700, 893]], "explicitly": [[], [], [564, 893, 969]], "explicitness": [[564], [], [564]], "express": [[], [1053], [207, 241, 243, 244, 246, 253, 275, 276, 277, 279, 281, 284, 285, 308, 371, 400, 408, 412, 465, 470, 516, 532, 539, 541, 543, 575, 591, 619, 680, 692, 743, 764, 780, 781, 783, 882, 1006, 1012, 1053, 1091, 1096, 1099, 1124, 1131, 1133, 1140, 1148, 1180, 1195, 1196, 1198, 1210, 1211, 1212, 1223, 1232, 1240, 1245]], "expressed": [[], [], [227, 228, 231, 235, 239, 249, 322, 324, 328, 359, 379, 437, 450, 533, 560, 571, 588, 589, 594, 595, 597, 599, 604, 642, 655, 675, 700, 703, 712, 727, 738, 748, 756, 758, 773, 781, 782, 784, 794, 798, 813, 815, 831, 837, 844, 862, 863, 867, 885, 886, 887, 890, 893, 911, 915, 916, 917, 922, 926, 938, 969, 970, 976, 997, 1003, 1004, 1007, 1010, 1013, 1014, 1016, 1018, 1019, 1021, 1026, 1027, 1031, 1035, 1046, 1049, 1075, 1078, 1079, 1081, 1088, 1090, 1094, 1095, 1096, 1097, 1099, 1101, 1104, 1108, 1110, 1111, 1119, 1121, 1126, 1133, 1137, 1138, 1141, 1142, 1143, 1148, 1150, 1157, 1162, 1163, 1173, 1182, 1187, 1193, 1198, 1199, 1209, 1222, 1226, 1227, 1230, 1231, 1233, 1236, 1240, 1242, 1244, 1255, 1257, 1260, 1266, 1269]], "expresses": [[], [], [208, 210, 234, 235, 236, 241, 242, 247, 256, 261, 263, 275, 276, 277, 278, 290, 291, 300, 303, 312, 313, 314, 318, 321, 325, 326, 329, 332, 336, 341, 346, 349, 353, 354, 362, 364, 365, 367, 368, 369, 373, 378, 380, 402, 413, 433, 437, 438, 447, 452, 465, 470, 474, 479, 485, 504, 505, 514, 515, 533, 535, 537, 551, 586, 591, 628, 712, 742, 773, 788, 789, 795, 798, 811, 812, 824, 831, 833, 844, 879, 886, 911, 917, 925, 926, 962, 979, 1003, 1006, 1008, 1011, 1022, 1026, 1027, 1028, 1056, 1062, 1072, 1080, 1088, 1105, 1127, 1131, 1133, 1134, 1136, 1150, 1163, 1165, 1180, 1191, 1208, 1220, 1223, 1228, 1230, 1233, 1242, 1251, 1262, 1268]], "expressing": [[], [], [209, 213, 222, 225, 226, 238, 242, 244, 252, 253, 254, 257, 258, 259, 261, 266, 278, 282, 289, 302, 303, 317, 330, 332, 336, 339, 349, 351, 362, 363, 372, 373, 374, 377, 385, 387, 388, 389, 400, 425, 426, 434, 440, 446, 463, 466, 467, 469, 477, 478, 481, 487, 491, 497, 498, 499, 509, 514, 515, 517, 523, 545, 547, 551, 554, 573, 603, 611, 614, 620, 633, 644, 654, 684, 698, 699, 744, 812, 861, 869, 879, 900, 904, 962, 1007, 1024, 1028, 1041, 1086, 1104, 1146, 1173, 1191, 1210, 1220, 1221, 1226, 1227, 1228, 1234, 1243, 1262, 1266]], "expression": [[489, 1046, 1053, 1095], [568, 1053], [294, 295, 381, 397, 406, 451, 452, 488, 489, 557, 558, 563, 577, 589, 592, 979, 1026, 1075, 1086, 1095, 1098, 1113, 1117, 1119, 1141, 1143, 1156, 1187, 1209, 1216, 1222, 1234, 1239, 1242, 1250, 1260, 1265]], "expressions": [[], [], [590, 1002]], "extended": [[565], [], [565, 571, 706, 989, 1158, 1214]], "extender": [[1120], [], []], "extenders": [[], [], [1120]], "extension": [[], [], [631]], "extent": [[], [], [302]], "external": [[829, 1110], [], [249, 721, 757, 761, 1112, 1119, 1209, 1222]], "externally": [[1111, 1166], [], [493, 1111, 1112, 1119, 1174, 1201, 1206, 1209, 1222, 1265]], "extraposed": [[1112], [1112], [1111, 1112]], "extreme": [[], [], [527, 1228]], "extremely": [[], [], [1054, 1260]], "extroverted": [[330, 830], [], [330]], "f": [[], [], [1185, 1195]], "faahn": [[], [], [1154]], "fact": [[], [], [276, 417, 418, 553, 584, 626, 630, 705, 781, 811, 1002, 1174]], "factive": [[], [847, 916], []], "factor": [[], [], [472, 789, 958]], "failure": [[], [], [712]], "fairly": [[], [], [1143]], "fait": [[], [], [1155]], "fall": [[], [], [336, 633, 821]], "false": [[566], [], [445, 886, 925]], "falsity": [[], [], [915]], "family": [[], [], [235]], "far": [[], [], [1049, 1111]], "farewell": [[], [], [574]], "fashion": [[], [], [1102, 1245]], "fast": [[], [], [266, 611, 1070, 1071, 1204]], "father": [[], [], [616]], "favor": [[], [], [607, 609, 630, 653, 824]], "favored": [[], [], [413, 479]], "favors": [[], [], [617, 646]], "fe": [[], [], [893, 969]], "fear": [[], [], [312, 828, 1108]], "fearing": [[331, 332, 831], [], [332, 815]], "fears": [[], [], [312, 332, 808, 831]], "feature": [[1134], [1134], [837]], "features": [[], [], [986]], "feet": [[], [], [393, 715]], "felicitous": [[], [], [638]], "felines": [[], [], [262]], "fell": [[], [], [232, 828]], "fellow": [[], [], [1238]], "felt": [[], [], [828]], "female": [[], [], [339]], "feminine": [[], [], [1169]], "fennel": [[], [], [279, 715, 1038]], "few": [[], [], [475]], "fewer": [[], [], [1158]], "fifty": [[], [], [398]], "figure": [[333, 613, 631, 832, 833, 1113], [833], [204, 205, 286, 287, 380, 381, 613, 631, 715, 728, 731, 748, 784, 832, 833, 841, 869, 873, 884, 904, 921, 931, 953, 972, 974, 981, 1113, 1180, 1203]], "figures": [[], [], [565]], "file": [[567], [], [567, 600, 601, 643, 663, 679, 685, 695]], "fill": [[], [], [605, 757]], "filler": [[], [], [632]], "filling": [[], [], [757]], "fillmore": [[], [], [813]], "fills": [[], [], [760]], "final": [[], [], [733]], "find": [[], [], [879, 886]], "finding": [[], [], [886, 917]], "fine": [[], [], [553, 650]], "finer": [[], [], [813]], "finish": [[], [], [445]], "finished": [[], [], [445, 619, 676, 692]], "finishing": [[], [], [619, 692]], "finite": [[], [], [267]], "fire": [[], [], [1228]], "firing": [[], [], [1228]], "first": [[334, 834, 1114], [], [239, 252, 323, 334, 354, 358, 359, 502, 565, 642, 655, 673, 707, 775, 780, 821, 858, 910, 972, 974, 1030, 1062, 1106, 1151, 1229]], "fish": [[], [], [952]], "fished": [[], [], [952]], "fixed": [[1115], [], [574, 1027, 1035, 1064, 1079, 1103, 1106, 1115, 1150, 1203, 1233]], "flag": [[1116, 1168], [1116], [222, 1006, 1008, 1017, 1018, 1019, 1027, 1030, 1035, 1044, 1084, 1087, 1094, 1095, 1097, 1104, 1105, 1115, 1116, 1136, 1138, 1150, 1162, 1163, 1226, 1233]], "flagging": [[1116], [1116], [1084]], "flags": [[], [], [1097, 1116]], "flavor": [[], [], [513]], "flavors": [[], [], [513]], "fleas": [[], [], [306]], "fled": [[], [], [675]], "flexional": [[], [], [1205]], "fliers": [[], [], [1070]], "fluency": [[], [], [357]], "fluent": [[], [], [357]], "fluffy": [[], [], [1195]], "fluus": [[], [], [1025]], "fly": [[], [], [400, 882, 1070, 1156]], "flying": [[], [], [340]], "focus": [[445, 632, 1117], [445, 601], [353, 445, 629, 632, 639, 690, 1052, 1117, 1172]], "focused": [[], [], [235, 353, 359, 639]], "follow": [[], [], [481, 797, 903, 932, 1112, 1199, 1265]], "followed": [[], [], [252, 433, 903, 1012, 1190]], "followee": [[], [], [252]], "follower": [[], [], [252]], "following": [[], [], [252, 304, 481, 555, 728, 921, 932, 1049, 1248]], "follows": [[], [], [500, 555, 1112, 1201, 1202, 1270]], "food": [[], [], [212, 762, 854, 902, 907, 1179]], "foodmaking": [[], [], [970]], "foodstuff": [[], [], [898]], "fool": [[], [], [470, 682]], "for": [[], [], [214, 215, 218, 222, 228, 229, 262, 265, 267, 283, 309, 334, 340, 342, 353, 354, 371, 373, 382, 393, 395, 409, 424, 427, 439, 455, 456, 457, 458, 462, 466, 469, 473, 481, 491, 493, 502, 503, 522, 524, 527, 534, 536, 552, 554, 557, 558, 564, 565, 566, 571, 573, 574, 575, 589, 600, 602, 606, 609, 613, 630, 631, 632, 638, 639, 642, 643, 647, 654, 656, 663, 675, 676, 679, 685, 688, 693, 695, 706, 710, 715, 720, 728, 735, 738, 739, 743, 758, 772, 794, 816, 821, 833, 835, 841, 856, 866, 879, 890, 905, 908, 921, 922, 932, 936, 938, 944, 945, 952, 964, 970, 976, 981, 997, 1004, 1005, 1008, 1009, 1010, 1012, 1014, 1015, 1016, 1021, 1024, 1025, 1028, 1030, 1039, 1041, 1050, 1052, 1053, 1054, 1058, 1062, 1065, 1075, 1086, 1087, 1090, 1094, 1095, 1097, 1100, 1101, 1102, 1108, 1111, 1112, 1113, 1116, 1118, 1119, 1121, 1122, 1126, 1130, 1131, 1133, 1137, 1141, 1142, 1143, 1146, 1147, 1148, 1149, 1154, 1155, 1156, 1162, 1164, 1165, 1172, 1173, 1174, 1180, 1182, 1184, 1186, 1190, 1191, 1193, 1198, 1201, 1203, 1205, 1206, 1209, 1210, 1211, 1216, 1219, 1220, 1221, 1222, 1223, 1226, 1227, 1228, 1232, 1234, 1235, 1237, 1238, 1239, 1242, 1244, 1247, 1250, 1251, 1255, 1257, 1259, 1262, 1265, 1266, 1267, 1268, 1269, 1271, 1272, 1273, 1277]], "force": [[835], [749, 756], [749, 858]], "foreground": [[], [], [609]], "form": [[265, 335, 527, 568, 1238], [], [214, 222, 234, 247, 262, 281, 294, 306, 325, 335, 359, 370, 382, 396, 439, 472, 473, 475, 508, 509, 529, 536, 546, 557, 571, 574, 588, 589, 668, 710, 756, 821, 879, 1004, 1007, 1009, 1010, 1014, 1018, 1019, 1021, 1038, 1053, 1058, 1059, 1067, 1068, 1070, 1071, 1074, 1075, 1083, 1090, 1099, 1101, 1104, 1120, 1124, 1126, 1129, 1131, 1132, 1138, 1140, 1147, 1152, 1156, 1162, 1163, 1164, 1172, 1173, 1182, 1184, 1188, 1191, 1216, 1223, 1224, 1225, 1230, 1231, 1236, 1238, 1239, 1240, 1242, 1245, 1247, 1248, 1272, 1276]], "formed": [[], [], [577]], "former": [[], [], [334, 564, 1187]], "forms": [[], [], [301, 484, 529, 583, 655, 936, 981, 1005, 1008, 1067, 1083, 1240, 1260, 1265]], "formulated": [[], [], [552]], "found": [[], [], [278, 283, 303, 362, 368, 373, 554, 596, 613, 614, 620, 631, 644, 654, 910, 917, 1012, 1015, 1060, 1064, 1067, 1083, 1084, 1091, 1096, 1108, 1112, 1115, 1124, 1129, 1151, 1152, 1155, 1187, 1232, 1239, 1241, 1242, 1243, 1244, 1265]], "four": [[], [], [287, 616]], "frame": [[], [902], []], "framing": [[1227, 1266], [1095], [1227, 1266]], "frances": [[], [], [529]], "francisco": [[], [], [262]], "fred": [[], [], [227, 249, 738, 757, 883]], "freddy": [[], [], [826, 968]], "free": [[336, 337, 338, 633], [595], [336, 338, 575, 633, 1063, 1080, 1220, 1249]], "freely": [[], [], [633]], "french": [[], [], [241, 1096, 1155, 1193, 1242, 1272]], "frequency": [[593], [], [593, 1041]], "frequently": [[], [], [890, 1273]], "frieda": [[], [], [267, 414]], "frighten": [[], [], [1244]], "from": [[], [], [266, 353, 357, 440, 469, 500, 508, 536, 556, 567, 571, 576, 577, 595, 596, 610, 611, 639, 645, 700, 733, 758, 796, 802, 836, 847, 882, 893, 903, 922, 927, 936, 942, 945, 948, 969, 986, 997, 1015, 1041, 1060, 1067, 1083, 1084, 1086, 1115, 1143, 1164, 1172, 1187, 1193, 1211, 1233, 1239, 1241, 1267, 1272]], "front": [[], [], [1067]], "full": [[], [], [275, 617, 780, 918, 1101]], "fully": [[], [], [1086]], "fun": [[], [], [267]], "function": [[569], [605, 647, 671], [203, 213, 255, 262, 264, 267, 281, 315, 344, 347, 363, 383, 412, 446, 460, 462, 463, 465, 467, 470, 473, 493, 498, 524, 559, 569, 570, 571, 586, 591, 603, 606, 608, 609, 612, 650, 680, 691, 701, 863, 864, 879, 1004, 1012, 1124, 1126, 1140, 1173, 1182, 1185, 1232, 1275, 1276]], "functionalism": [[570], [], []], "functionalist": [[], [], [570]], "functionally": [[], [], [1053]], "functioning": [[], [], [340, 342, 380, 891, 981, 1122, 1240, 1251]], "functions": [[], [], [219, 255, 283, 304, 311, 338, 412, 429, 516, 560, 567, 573, 576, 588, 589, 609, 660, 833, 1122, 1143, 1173, 1186, 1247]], "furniture": [[], [], [756, 809, 855]], "furry": [[], [], [663]], "further": [[], [], [474, 574, 608, 873, 884, 1245]], "fused": [[], [], [1118]], "fuses": [[], [], [1118]], "fusion": [[1118, 1160], [], []], "future": [[836], [], [304, 798, 812, 836, 931, 1243]], "g": [[], [936], [235, 552, 613, 813, 969, 1027, 1035, 1113, 1214, 1229]], "ga": [[], [], [418, 536, 1094, 1153, 1174]], "gahar": [[], [], [1061]], "gakusei": [[], [], [1174]], "gallon": [[], [], [392]], "gallons": [[], [], [392]], "gap": [[646, 1119], [1119], [564, 646, 1111, 1119]], "garage": [[], [], [380, 381, 833]], "garden": [[], [], [1185, 1275]], "gave": [[], [], [308, 452, 704, 711, 1005, 1088, 1136, 1138, 1206, 1222]], "gen": [[], [], [1079]], "gender": [[339, 837], [837], [339, 555, 837, 1014, 1133, 1134, 1169, 1194]], "general": [[1120], [], [341, 562, 596, 634, 838, 948, 993, 1120, 1203]], "generalization": [[], [], [528, 529, 900, 948]], "generally": [[], [], [288, 383, 643, 668, 706, 743, 756, 918, 976, 993, 1013, 1014, 1019, 1021, 1060, 1068, 1070, 1071, 1074, 1188]], "generates": [[], [], [707]], "generic": [[340, 341, 342, 634, 838], [838], [263, 340, 341, 342, 634, 775, 838, 864]], "generically": [[], [], [838]], "genitive": [[], [451, 1016], [1012, 1044, 1053, 1097, 1147]], "geophysicist": [[], [], [229]], "george": [[], [], [287]], "german": [[], [], [357, 1086]], "germans": [[], [], [336, 633]], "gerund": [[], [1083], [267, 1124, 1140]], "gerunds": [[], [], [1083]], "get": [[], [], [274, 319, 378, 795, 812, 1129, 1248]], "getroffen": [[], [], [1086]], "getting": [[], [], [378]], "gi": [[], [], [324, 382, 1152]], "gift": [[], [], [1014]], "girl": [[], [], [1013, 1021, 1129, 1143, 1193]], "girls": [[], [], [467, 1019, 1132, 1133, 1208, 1230, 1231]], "giv": [[], [], [558]], "give": [[], [], [275, 537, 710, 780, 989, 1005, 1241, 1262]], "given": [[], [], [314, 565, 626, 706]], "gives": [[], [], [1158]], "giving": [[], [], [275, 308, 537, 711, 713, 780, 989, 992]], "glad": [[], [], [261, 773]], "glasses": [[], [], [886, 917]], "gloss": [[], [573], []], "glossed": [[], [], [1255, 1257]], "go": [[], [], [215, 268, 270, 319, 368, 400, 882, 965, 972, 1064, 1199]], "goal": [[], [1148], []], "gobierno": [[], [], [1091]], "god": [[], [], [574]], "goes": [[], [], [991, 996]], "going": [[], [], [368, 821, 972, 1095, 1214]], "good": [[], [], [217, 477, 536, 547, 559, 646, 926, 1143, 1149]], "goodbye": [[], [], [574]], "goods": [[], [], [656]], "gosha": [[], [], [235]], "got": [[], [], [263, 378, 715, 775, 873, 1064, 1259]], "gotta": [[], [], [304]], "govern": [[], [], [558]], "governs": [[], [], [552]], "grab": [[], [], [731, 931]], "grabbed": [[], [], [731]], "gradable": [[839], [839], [264, 315, 775, 778, 839, 964, 1027, 1035, 1061, 1062, 1079, 1080, 1103, 1106, 1131, 1150, 1180, 1190, 1191, 1220, 1221, 1223, 1233]], "gradience": [[], [], [271]], "gradient": [[840], [], [224]], "gradual": [[], [], [801]], "graduate": [[], [], [357]], "grained": [[], [], [553, 650, 813]], "grammar": [[561], [], []], "grammars": [[], [], [474]], "grammatical": [[], [], [555, 557, 561, 563, 565, 571, 573, 580, 596, 979, 1268]], "grammaticalization": [[571], [], [558]], "grammaticalize": [[], [571], []], "grammaticalized": [[], [], [467, 1021, 1118, 1147, 1156, 1193, 1203, 1238]], "granted": [[], [], [675, 676]], "graph": [[], [], [589]], "grasping": [[], [], [749]], "grasshopper": [[], [], [1189]], "grateful": [[], [], [676]], "graze": [[], [], [437]], "greek": [[], [], [1097, 1156]], "green": [[], [], [216, 258, 709, 1186]], "greenlandic": [[], [], [222, 864]], "greg": [[], [], [216, 385, 704, 709, 867, 1122, 1186]], "grizzlies": [[], [], [410]], "grooming": [[], [743], [743]], "ground": [[343, 631, 833, 841], [833], [204, 205, 380, 381, 631, 715, 728, 731, 748, 832, 833, 841, 873, 884, 904, 921, 931, 953, 972, 974, 1113, 1180]], "group": [[344, 842], [], [235, 281, 323, 334, 344, 358, 396, 490, 502, 534, 555, 569]], "grouping": [[], [], [279]], "gsum": [[], [], [1247]], "gtettem": [[], [], [1065]], "gu": [[], [], [1104, 1105]], "guest": [[], [], [252]], "guests": [[], [], [252, 434, 469, 904, 922, 1266]], "guitar": [[], [], [285, 286, 383]], "gulf": [[], [], [1025]], "gune": [[], [], [1150]], "guts": [[], [], [1113]], "gwelaf": [[], [], [1100]], "gwok": [[], [], [1062]], "gyerek": [[], [], [1065]], "h": [[], [], [903, 1042, 1064, 1065, 1097]], "ha": [[], [], [1209]], "hab": [[], [], [467]], "habe": [[], [], [1086]], "habitual": [[], [], [341, 838]], "habitually": [[], [], [838]], "haciendo": [[], [], [231]], "had": [[], [], [263, 382, 469, 528, 551, 760, 775, 847, 885, 922, 1003, 1065, 1152, 1205, 1255]], "hag": [[], [], [1214]], "hair": [[], [], [795, 812]], "halkomelem": [[], [], [1239]], "hall": [[], [], [434, 904, 1266]], "hammer": [[], [], [727, 749, 782]], "hanasita": [[], [], [1153]], "hand": [[], [], [780, 918]], "hang2": [[], [], [1225]], "hanging": [[345, 346], [], [346]], "happen": [[], [], [902]], "happened": [[], [], [630]], "happiness": [[], [], [474]], "happy": [[], [], [474, 598, 965, 1081]], "harar": [[], [], [1079]], "harry": [[], [], [591, 619, 761, 877]], "has": [[], [], [215, 218, 231, 235, 249, 264, 271, 275, 276, 306, 315, 332, 338, 349, 351, 362, 395, 429, 433, 437, 467, 508, 528, 529, 557, 574, 578, 592, 600, 601, 606, 643, 644, 645, 695, 728, 780, 781, 816, 831, 844, 867, 872, 879, 885, 902, 916, 919, 921, 925, 1016, 1065, 1083, 1121, 1122, 1155, 1158, 1187, 1188, 1203, 1216, 1241, 1252, 1272]], "hasan": [[], [], [1206, 1259]], "hasarim": [[], [], [1209]], "haspelmath": [[], [], [1067]], "hasta": [[], [], [1091]], "hataraite": [[], [], [1031]], "hated": [[], [], [1153]], "hati": [[], [], [1115, 1233]], "have": [[1121], [467], [231, 235, 238, 252, 305, 322, 346, 357, 447, 452, 552, 556, 558, 574, 590, 643, 672, 710, 847, 879, 885, 887, 918, 919, 920, 1025, 1080, 1086, 1112, 1121, 1148, 1205, 1257, 1269, 1271, 1272]], "having": [[], [], [464, 619, 692, 836, 1205]], "hawk": [[], [], [426]], "haydom": [[], [], [1158]], "haz": [[], [], [1238]], "he": [[], [], [215, 218, 222, 263, 275, 312, 368, 604, 617, 629, 656, 668, 687, 688, 690, 706, 708, 728, 731, 733, 775, 780, 784, 796, 808, 864, 873, 886, 903, 921, 945, 952, 953, 974, 1004, 1005, 1008, 1009, 1013, 1018, 1028, 1054, 1056, 1059, 1064, 1067, 1071, 1090, 1126, 1129, 1130, 1149, 1172, 1173, 1188, 1204, 1222, 1253, 1262]], "head": [[216, 217, 347, 419, 494, 1054], [1122, 1186], [200, 201, 216, 217, 237, 296, 338, 347, 381, 395, 398, 407, 416, 418, 429, 451, 452, 459, 489, 492, 493, 494, 505, 540, 548, 549, 552, 579, 592, 920, 949, 1015, 1049, 1075, 1093, 1111, 1112, 1119, 1122, 1142, 1143, 1186, 1201, 1202, 1206, 1207, 1209, 1220, 1222, 1265]], "headed": [[1111, 1143, 1166, 1186], [1143], [493, 1075, 1111, 1112, 1119, 1143, 1174, 1186, 1201, 1206, 1209, 1222, 1265, 1267]], "headless": [[1122], [], [338]], "hear": [[], [], [278, 438, 614, 684, 821, 906]], "heard": [[], [], [438, 906, 1251]], "hearer": [[843], [], [292, 293, 360, 361, 370, 590, 600, 601, 606, 626, 638, 643, 663, 667, 675, 676, 680, 681, 695, 698, 699, 708, 789]], "hearing": [[], [], [675]], "hearsay": [[], [], [821]], "heavy": [[], [], [908]], "hebrew": [[], [], [1209]], "hedging": [[], [], [571, 603, 675]], "height": [[], [], [224, 264, 315, 923, 938, 1103, 1106]], "help": [[], [], [1010, 1011, 1042, 1127]], "helped": [[], [], [1011, 1127]], "hence": [[], [], [272, 324, 386, 429, 500, 580, 638, 667, 681, 703, 1006, 1099, 1105, 1124, 1133, 1165, 1208, 1236, 1240]], "her": [[], [], [228, 268, 270, 452, 795, 832, 1008, 1124, 1241, 1255]], "herd": [[], [], [344]], "here": [[], [], [353, 474, 558, 610, 632, 639, 816, 891, 931, 1193, 1203]], "hers": [[], [], [744]], "herself": [[], [], [491, 1184, 1236]], "heute": [[], [], [1086]], "hian": [[], [], [1126]], "hierarchy": [[552, 555, 556, 558, 565, 594], [558, 565], [552, 555, 556, 558, 564, 565, 584, 594, 706, 1090, 1214]], "high": [[635, 636, 665], [], []], "higher": [[], [], [265, 366, 433, 584, 1030, 1041, 1087]], "highest": [[637], [], [527, 556, 601]], "highlights": [[], [], [705]], "highly": [[], [], [554, 606, 1118, 1147, 1238]], "hiin3": [[], [], [903]], "hiking": [[], [], [267, 489]], "hill": [[], [], [1083, 1199]], "him": [[], [], [275, 385, 488, 780, 797, 867, 1005, 1008, 1028, 1059, 1068, 1084, 1086, 1130, 1187, 1251, 1262]], "himi": [[], [], [382, 616, 1152, 1153]], "himk": [[], [], [1152]], "hindi": [[], [], [1075]], "his": [[], [], [235, 266, 308, 611, 656, 668, 744, 795, 812, 873, 886, 917, 1024, 1060, 1067, 1088, 1129, 1136, 1138, 1157, 1204, 1222]], "hisi": [[], [], [616]], "hit": [[], [], [282, 424, 522, 1189, 1234, 1248]], "hitting": [[], [], [282, 785]], "hka": [[], [], [1070]], "ho": [[], [], [1070]], "hocikon": [[], [], [1013]], "hold": [[], [], [469, 922]], "holding": [[], [], [452]], "holds": [[], [], [298, 386, 467, 833, 861, 880]], "hole": [[], [], [1116]], "hom": [[], [], [1024]], "home": [[], [], [972, 1004, 1198, 1214]], "hon": [[], [], [1174]], "hoped": [[], [], [373, 654]], "hopes": [[], [], [349, 844, 1052]], "hoping": [[348, 349, 844], [844], [349, 815]], "horizontal": [[], [], [996]], "horse": [[], [], [1052, 1061, 1115, 1233]], "hortative": [[354, 642], [354, 642], [354, 642, 682, 700, 1039]], "house": [[], [], [264, 315, 321, 545, 628, 676, 733, 758, 796, 903, 998, 1090, 1095, 1137]], "how": [[], [], [378, 564, 592, 597, 600, 638, 650, 734, 869, 1034, 1065, 1220, 1227]], "however": [[], [], [275, 575, 734, 780, 1068, 1070, 1188, 1262]], "hua": [[], [], [324]], "huge": [[], [], [557, 647]], "huhu": [[], [], [1229]], "huichol": [[], [], [1208, 1230, 1231]], "human": [[350, 351, 352, 845, 846, 1123], [], [351, 556, 565, 602, 726, 826, 827, 835, 845]], "humans": [[], [], [556, 559, 587]], "hungarian": [[], [], [1065, 1185]], "hurle": [[], [], [1242]], "hurts": [[], [], [1210]], "huu": [[], [], [1106]], "hwy": [[], [], [1100]], "hybrid": [[1124, 1255], [1124], [1012, 1124, 1232, 1255]], "hygiene": [[], [], [743]], "hypothetical": [[847], [], [266, 278, 611, 614, 684, 708, 813, 847]], "hypotheticality": [[], [813], [813]], "i": [[], [], [204, 205, 216, 228, 235, 236, 240, 249, 268, 270, 274, 276, 281, 298, 303, 305, 324, 326, 334, 341, 359, 362, 368, 377, 378, 383, 408, 412, 439, 445, 447, 452, 471, 472, 491, 492, 493, 494, 524, 545, 606, 612, 616, 620, 632, 644, 646, 655, 672, 673, 676, 695, 704, 707, 709, 715, 731, 735, 738, 748, 772, 781, 795, 813, 817, 821, 828, 835, 838, 847, 862, 866, 879, 883, 893, 901, 918, 919, 920, 931, 936, 952, 977, 981, 998, 1004, 1005, 1008, 1015, 1019, 1022, 1025, 1027, 1034, 1042, 1043, 1054, 1059, 1060, 1065, 1083, 1084, 1086, 1090, 1091, 1095, 1096, 1097, 1100, 1108, 1111, 1112, 1115, 1116, 1119, 1127, 1137, 1141, 1142, 1148, 1149, 1155, 1186, 1187, 1188, 1191, 1199, 1201, 1205, 1206, 1208, 1214, 1224, 1230, 1231, 1233, 1240, 1243, 1257, 1259, 1268, 1269, 1277]], "iandien": [[], [], [1220]], "ib": [[], [], [1046]], "ice": [[], [], [513]], "ich": [[], [], [1086]], "ichee": [[], [], [217]], "icky": [[], [], [1113]], "iconicity": [[1253], [], []], "id": [[], [], [1229, 1255]], "ideally": [[], [], [566, 1188]], "identical": [[], [], [315, 656, 668, 1015, 1046, 1054, 1103, 1225]], "identifiability": [[638], [], []], "identifiable": [[708], [], [292, 293, 360, 361, 395, 540, 574, 638, 667]], "identificational": [[353, 639, 1125], [], [353, 412, 445, 604, 617, 626, 632, 639, 646, 681, 927, 1052, 1101, 1117]], "identified": [[], [], [540, 576, 632]], "identify": [[], [], [219, 606, 650]], "identifying": [[], [], [363, 383, 606, 648]], "identity": [[424, 461, 522, 572, 640, 641, 657, 669, 678, 686, 704, 709, 848], [692], [219, 292, 293, 360, 361, 370, 424, 461, 514, 515, 522, 606, 625, 633, 638, 645, 667, 680, 698, 699, 704, 708, 987, 1186, 1190, 1191, 1220]], "ideophone": [[], [1126], [1126, 1195, 1196, 1212]], "ideophones": [[1126], [], [519, 1126]], "idiosyncratic": [[], [], [529, 574]], "if": [[], [], [225, 277, 278, 340, 341, 478, 502, 514, 515, 524, 574, 606, 614, 638, 645, 698, 699, 729, 783, 788, 811, 838, 847, 885, 887, 928, 1005, 1022, 1041, 1056, 1072, 1141, 1228, 1259]], "ignored": [[], [], [616]], "igual": [[], [], [1221]], "ih": [[], [], [1042]], "ihn": [[], [], [1086]], "ii": [[], [], [281, 1046, 1083]], "iii": [[], [], [1083]], "ij": [[], [], [235]], "ija": [[], [], [1269]], "ik": [[], [], [1046]], "iket": [[], [], [1257]], "illness": [[], [], [1216]], "illustrated": [[], [], [569, 586, 598, 1060, 1182, 1209, 1245, 1267, 1276]], "illustrates": [[], [], [1015]], "imai": [[], [], [1248]], "imbabura": [[], [], [1143]], "imi": [[], [], [1117]], "immediately": [[], [], [1112]], "impact": [[282, 785], [785], [282, 785]], "imperative": [[354, 642], [354, 642], [354, 642, 682, 700, 1039, 1140]], "imperfective": [[], [], [1132]], "impersonal": [[1013, 1070], [], []], "implication": [[], [], [729, 783, 928]], "implicational": [[], [], [552, 558]], "implicature": [[], [], [469, 922]], "implicit": [[], [], [794, 969]], "implied": [[], [], [255]], "implies": [[], [], [1028, 1228]], "important": [[], [], [318, 625, 627, 696]], "imprecise": [[], [], [214]], "imt": [[], [573], []], "imzala": [[], [], [1259]], "in": [[253, 764], [253, 601, 764], [200, 201, 203, 205, 207, 212, 214, 215, 216, 217, 218, 222, 225, 227, 228, 229, 231, 232, 235, 237, 238, 239, 240, 241, 243, 246, 247, 249, 252, 253, 255, 257, 261, 262, 263, 264, 265, 266, 267, 270, 271, 272, 274, 276, 278, 279, 281, 283, 284, 285, 286, 287, 288, 291, 292, 293, 294, 295, 296, 297, 298, 300, 303, 304, 305, 306, 309, 311, 313, 314, 315, 318, 319, 322, 324, 332, 334, 335, 336, 338, 340, 342, 344, 346, 349, 353, 356, 357, 359, 360, 361, 362, 366, 368, 370, 371, 373, 377, 378, 379, 380, 381, 382, 383, 385, 386, 387, 388, 390, 392, 393, 395, 396, 398, 406, 408, 416, 417, 418, 424, 425, 426, 427, 429, 433, 434, 437, 439, 441, 445, 447, 450, 451, 452, 459, 461, 462, 464, 465, 466, 467, 469, 471, 472, 474, 475, 477, 478, 487, 488, 489, 491, 492, 494, 499, 500, 502, 508, 513, 514, 515, 519, 522, 523, 524, 527, 528, 529, 533, 535, 536, 540, 543, 545, 546, 548, 551, 552, 554, 555, 557, 558, 559, 560, 561, 562, 563, 564, 565, 566, 567, 569, 570, 571, 574, 575, 576, 578, 580, 581, 583, 584, 586, 588, 589, 590, 591, 593, 595, 596, 597, 598, 599, 600, 601, 602, 603, 604, 605, 606, 608, 609, 610, 611, 612, 613, 614, 615, 616, 617, 619, 620, 623, 625, 626, 627, 628, 629, 631, 632, 633, 634, 639, 642, 643, 644, 645, 646, 647, 648, 650, 653, 654, 655, 656, 663, 667, 668, 670, 671, 672, 673, 675, 676, 677, 679, 680, 681, 683, 684, 685, 687, 688, 690, 691, 692, 694, 695, 696, 697, 698, 699, 700, 702, 703, 704, 705, 706, 707, 708, 709, 710, 711, 712, 715, 720, 721, 727, 728, 729, 731, 733, 734, 735, 738, 739, 748, 749, 756, 758, 760, 761, 762, 764, 765, 772, 773, 775, 778, 780, 781, 782, 784, 788, 789, 794, 795, 796, 797, 798, 801, 802, 809, 811, 812, 813, 815, 817, 821, 824, 826, 828, 831, 832, 833, 835, 836, 838, 839, 841, 844, 847, 852, 854, 855, 856, 858, 862, 863, 864, 866, 867, 869, 873, 877, 879, 880, 883, 884, 885, 886, 887, 889, 891, 893, 898, 899, 901, 902, 903, 904, 905, 907, 910, 911, 915, 916, 917, 918, 919, 920, 921, 922, 925, 926, 927, 928, 929, 930, 931, 932, 936, 938, 944, 945, 952, 953, 958, 962, 964, 968, 969, 970, 972, 974, 976, 977, 979, 981, 989, 991, 996, 997, 998, 1000, 1003, 1004, 1006, 1007, 1008, 1009, 1010, 1011, 1012, 1013, 1014, 1015, 1016, 1017, 1018, 1019, 1021, 1022, 1024, 1025, 1026, 1027, 1028, 1030, 1031, 1034, 1035, 1037, 1038, 1039, 1041, 1043, 1044, 1046, 1049, 1050, 1052, 1053, 1054, 1056, 1058, 1060, 1063, 1064, 1065, 1066, 1067, 1068, 1070, 1071, 1072, 1073, 1074, 1075, 1078, 1079, 1080, 1081, 1083, 1084, 1086, 1087, 1088, 1090, 1091, 1093, 1094, 1095, 1096, 1097, 1098, 1099, 1100, 1101, 1102, 1103, 1104, 1105, 1106, 1108, 1110, 1111, 1112, 1113, 1115, 1116, 1117, 1118, 1119, 1120, 1121, 1122, 1124, 1126, 1127, 1129, 1130, 1132, 1133, 1134, 1135, 1136, 1137, 1138, 1140, 1141, 1142, 1143, 1146, 1147, 1148, 1150, 1151, 1152, 1153, 1154, 1155, 1158, 1162, 1163, 1164, 1165, 1167, 1169, 1173, 1179, 1180, 1182, 1184, 1185, 1186, 1187, 1188, 1189, 1191, 1193, 1194, 1198, 1199, 1201, 1202, 1203, 1204, 1205, 1206, 1207, 1208, 1209, 1210, 1211, 1214, 1216, 1219, 1221, 1222, 1224, 1225, 1226, 1227, 1228, 1229, 1230, 1231, 1232, 1233, 1235, 1236, 1237, 1238, 1239, 1240, 1241, 1242, 1243, 1244, 1245, 1247, 1248, 1249, 1251, 1252, 1253, 1255, 1257, 1259, 1260, 1262, 1265, 1267, 1268, 1269, 1270, 1271, 1272, 1273, 1275, 1276]], "ina": [[], [], [1118, 1148]], "inactive": [[643, 1127], [643], [292, 293, 409, 553, 600, 645, 650, 1127]], "inalienable": [[355, 356], [356], [212, 356, 452]], "inanimate": [[849], [], [556, 565, 706, 837, 849, 900]], "inceptive": [[850], [], []], "include": [[], [], [301, 324, 329, 402, 408, 410, 414, 467, 481, 484, 502, 508, 519, 534, 545, 581, 795, 812, 858, 867, 932, 1084, 1133, 1193, 1203, 1219, 1235]], "included": [[], [], [324, 502, 918, 1041]], "includes": [[], [], [212, 292, 293, 300, 323, 356, 358, 360, 361, 418, 590, 707, 720, 782, 798, 877, 892, 923, 1141]], "including": [[], [], [255, 267, 304, 323, 334, 358, 488, 493, 502, 558, 565, 573, 739, 758, 772, 810, 816, 835, 856, 860, 866, 880, 892, 905, 918, 936, 981, 1093, 1151, 1227]], "inclusive": [[357, 358, 851], [], [305, 357, 358, 408]], "inclusory": [[359, 1128], [], [359]], "incorporated": [[], [], [1205]], "incorporates": [[], [], [1113]], "incorporating": [[1113], [], []], "incorporation": [[1129, 1173], [], [1129, 1234]], "increase": [[], [], [801]], "incremental": [[], [], [996]], "indeed": [[], [], [261, 377, 773, 862, 1272]], "indefinite": [[360, 361], [455, 456, 457, 458, 503, 504, 667, 677, 694], [338, 360, 361, 455, 456, 864, 1220]], "independent": [[852, 1130, 1131], [], [852, 858, 1017, 1081, 1130, 1131]], "independently": [[], [], [562]], "index": [[1132, 1168], [], [212, 235, 356, 359, 555, 1007, 1010, 1011, 1013, 1066, 1068, 1070, 1093, 1098, 1110, 1127, 1132, 1133, 1134, 1165, 1167, 1169, 1194, 1208, 1231, 1252]], "indexation": [[1133, 1134, 1169, 1194], [], [837, 890, 910, 1009, 1066, 1067, 1091, 1093, 1133, 1134, 1230, 1252, 1268]], "indexed": [[1135, 1167], [], [1007, 1239]], "indexes": [[], [], [616, 1014, 1018, 1071, 1110, 1132, 1133, 1134, 1135, 1169, 1188, 1194]], "indexical": [[], [1133], [1050, 1132, 1133, 1169, 1194]], "indexing": [[], [], [1018, 1068]], "indicate": [[], [], [214, 1146]], "indicated": [[], [], [274, 488, 493, 543, 619, 692]], "indicates": [[], [], [265, 309, 366, 488, 527, 694, 712, 794, 821, 886, 890, 917, 938, 1031, 1050, 1120, 1188, 1199, 1247, 1265, 1272]], "indicating": [[], [], [378, 475, 555, 1184, 1187]], "indicative": [[], [], [1059]], "indicator": [[], [], [864]], "indik": [[], [], [1025]], "indirect": [[362, 644, 853, 1136, 1137], [], [362, 491, 552, 644]], "indirective": [[1138], [1138], [1088, 1136]], "individual": [[], [987], [216, 229, 235, 262, 292, 306, 360, 429, 472, 473, 565, 583, 606, 626, 638, 650, 704, 708, 709, 860]], "individually": [[], [], [306, 565]], "individuals": [[], [], [247, 262, 475, 626, 987, 993]], "individuated": [[864], [], [864]], "individuation": [[], [], [864]], "inertia": [[1040], [], []], "inf": [[], [], [1106]], "inference": [[], [], [811]], "inferential": [[], [], [811]], "inferrable": [[645], [643, 645], [292, 293, 409, 508, 600, 645, 707]], "inferrables": [[], [], [645]], "inferred": [[], [], [645]], "infinitive": [[], [1083], []], "infinitives": [[], [], [1083]], "inflated": [[], [], [805]], "inflect": [[], [], [1267]], "inflected": [[], [], [1205, 1267]], "inflecting": [[], [], [557, 1009]], "inflection": [[1151], [], [976, 1039, 1151, 1234, 1277]], "inflectional": [[], [], [890, 979]], "inflections": [[], [], [557, 890, 1009, 1038, 1083, 1151]], "inflects": [[], [], [1267]], "information": [[363, 364, 646, 647, 648, 649, 650, 1012, 1124, 1139, 1232], [364, 647, 649, 652, 872, 1012, 1139], [204, 205, 234, 255, 281, 286, 287, 292, 293, 313, 314, 318, 353, 360, 361, 363, 364, 368, 369, 370, 413, 464, 465, 466, 467, 479, 498, 533, 535, 553, 559, 567, 569, 572, 576, 600, 603, 605, 608, 609, 612, 613, 615, 625, 626, 627, 631, 632, 639, 646, 647, 648, 649, 650, 651, 660, 663, 667, 675, 679, 680, 681, 688, 689, 691, 697, 702, 703, 705, 728, 784, 872, 886, 893, 921, 969, 1002, 1012, 1041, 1087, 1117, 1124, 1232, 1242, 1245]], "informative": [[], [], [378, 945, 1228]], "ing": [[], [1216], [1083, 1140]], "ingestion": [[365, 723, 854], [723], [329, 365, 854]], "inherent": [[], [], [908]], "inherently": [[], [], [889, 940]], "initial": [[], [], [592, 796]], "initiate": [[], [], [762, 907]], "initiates": [[], [], [720, 762, 835, 948]], "initiator": [[855], [], [252, 760, 855]], "injuring": [[374, 860], [374, 860], [374, 860]], "inside": [[], [], [1143]], "insigeh": [[], [], [1141, 1142]], "inst": [[], [], [1065]], "instance": [[], [987], [204, 207, 208, 212, 213, 217, 222, 231, 236, 240, 249, 255, 263, 264, 268, 274, 275, 276, 277, 279, 290, 291, 297, 305, 308, 313, 315, 321, 322, 324, 326, 328, 341, 356, 357, 363, 365, 378, 382, 390, 397, 406, 408, 410, 413, 414, 424, 433, 445, 446, 452, 461, 463, 464, 470, 479, 493, 522, 529, 535, 539, 540, 605, 618, 625, 628, 630, 648, 682, 693, 705, 775, 780, 781, 783, 795, 812, 838, 854, 861, 952, 997, 1004, 1016, 1027, 1031, 1035, 1038, 1039, 1058, 1061, 1062, 1075, 1079, 1103, 1106, 1108, 1112, 1115, 1121, 1124, 1141, 1142, 1148, 1150, 1190, 1191, 1199, 1205, 1220, 1221, 1233, 1244, 1249, 1255, 1257, 1269]], "instances": [[], [], [330, 372, 475, 484, 693, 847, 993]], "instant": [[], [], [930]], "instantiation": [[], [1273], []], "instead": [[], [], [341, 703, 838, 972, 1041, 1062, 1083, 1110, 1112]], "institution": [[], [], [858]], "institutional": [[], [], [858]], "instrument": [[856], [], [1046, 1265]], "instrumental": [[], [], [1018, 1065, 1265]], "insubordination": [[1140], [], []], "integrated": [[], [], [585]], "integration": [[585], [], []], "intelligence": [[], [], [265, 460, 612]], "intelligent": [[], [], [265, 460, 586, 598, 612]], "intended": [[], [], [357, 575, 599, 650, 731, 836, 931]], "intending": [[], [], [300, 798]], "intends": [[], [], [693]], "intensifier": [[366], [], []], "intensifies": [[], [], [203, 603]], "intensifying": [[857], [], []], "intention": [[], [], [836, 880]], "intentions": [[], [], [795]], "interaction": [[367, 858], [], [367, 570, 653, 858]], "interactions": [[], [], [756]], "interest": [[], [], [599]], "interested": [[], [], [706]], "interlinear": [[573], [], [566, 580, 595]], "interlocutors": [[], [], [219, 469, 650, 697, 706, 922]], "intermediate": [[], [], [491, 576, 903]], "internal": [[1141, 1142], [], [578, 579, 592, 742, 826, 827, 882, 949, 968, 1016, 1141, 1142]], "internally": [[1143], [1143], [493, 1075, 1143]], "interpretation": [[], [], [898]], "interrogation": [[], [], [684]], "interrogative": [[368, 369, 370, 651, 652, 1144, 1145], [652], [363, 368, 369, 370, 605, 648, 671, 689, 700, 1220, 1251]], "interrogatives": [[], [], [369, 498, 651, 684, 689]], "interrupt": [[], [], [653]], "interruption": [[653], [], [653, 1242]], "intial": [[], [], [1086]], "into": [[], [], [232, 252, 287, 288, 305, 353, 369, 387, 396, 466, 467, 498, 519, 558, 566, 578, 582, 585, 639, 651, 677, 680, 689, 694, 702, 703, 730, 748, 813, 832, 841, 869, 873, 882, 884, 1000, 1002, 1073, 1226, 1227, 1239, 1251]], "intr": [[], [], [1205]], "intransitive": [[371], [1184], [371, 1026, 1041, 1108, 1156, 1184, 1236, 1244]], "introduced": [[], [], [278, 466, 467, 602, 614, 677, 683, 694, 1222, 1265]], "introduces": [[], [], [275, 680, 780, 1190, 1191]], "introducing": [[], [], [1130, 1193, 1198]], "introverted": [[372, 859], [], [372]], "inun": [[], [], [222, 864]], "invariant": [[], [], [1147]], "inverse": [[431, 432, 433, 1192], [431, 433], [410, 433, 1030, 1087, 1239]], "investigation": [[], [], [1009]], "invitation": [[], [], [634]], "invokes": [[], [], [1028, 1228]], "invoking": [[], [], [945]], "involve": [[], [], [713, 882, 948, 966, 1235]], "involved": [[], [], [583]], "involves": [[], [], [583, 670, 783, 807, 827, 1187]], "involving": [[], [], [741, 742, 743, 764, 768, 807, 808, 858, 882, 906, 949, 966, 981, 989, 1234]], "inyem": [[], [], [382, 1152]], "ip": [[], [647, 1012, 1124, 1232], [1012, 1124, 1232]], "ipeyarttaaru": [[], [], [1005]], "ir": [[], [], [1099]], "ira": [[], [], [462, 469, 922]], "iraqw": [[], [], [1158]], "irrealis": [[373, 654], [654], [338, 373, 654]], "is": [[], [], [200, 201, 203, 204, 205, 207, 208, 210, 212, 213, 214, 215, 216, 217, 218, 219, 222, 225, 227, 228, 231, 232, 235, 236, 237, 238, 239, 240, 243, 246, 249, 252, 254, 255, 256, 259, 261, 262, 263, 264, 265, 266, 267, 268, 270, 271, 272, 274, 275, 276, 277, 278, 279, 281, 282, 283, 284, 285, 288, 289, 290, 291, 292, 293, 294, 295, 296, 297, 298, 303, 304, 305, 306, 308, 309, 311, 312, 313, 314, 315, 318, 319, 321, 322, 323, 324, 325, 326, 328, 334, 335, 336, 338, 340, 341, 342, 344, 346, 347, 353, 354, 356, 357, 358, 359, 360, 361, 362, 363, 364, 365, 368, 370, 371, 373, 374, 377, 378, 379, 380, 381, 382, 383, 386, 387, 388, 389, 390, 392, 395, 397, 398, 406, 407, 408, 409, 410, 412, 413, 414, 416, 417, 418, 424, 425, 426, 427, 429, 433, 434, 437, 438, 439, 441, 445, 446, 447, 450, 451, 452, 455, 456, 457, 458, 459, 460, 461, 462, 463, 464, 466, 467, 469, 470, 471, 472, 473, 474, 475, 478, 479, 484, 489, 490, 491, 492, 493, 494, 497, 499, 500, 502, 503, 505, 508, 509, 513, 514, 515, 522, 523, 524, 528, 529, 532, 533, 534, 535, 536, 539, 540, 541, 546, 548, 549, 552, 554, 555, 556, 558, 559, 561, 562, 564, 565, 566, 567, 569, 574, 575, 576, 579, 580, 581, 583, 584, 586, 588, 589, 591, 597, 598, 599, 600, 601, 602, 604, 605, 606, 607, 608, 609, 610, 611, 612, 613, 614, 615, 616, 618, 619, 620, 625, 626, 627, 628, 629, 630, 631, 632, 633, 634, 638, 639, 642, 643, 644, 645, 646, 647, 648, 649, 650, 651, 653, 654, 655, 656, 663, 667, 670, 671, 672, 673, 675, 676, 677, 679, 681, 682, 684, 685, 690, 692, 694, 695, 698, 699, 703, 704, 705, 706, 707, 708, 709, 711, 712, 713, 715, 721, 726, 727, 729, 731, 734, 735, 738, 739, 740, 741, 744, 745, 748, 749, 756, 757, 758, 760, 761, 762, 765, 768, 771, 772, 773, 775, 778, 780, 781, 782, 783, 785, 788, 789, 793, 794, 795, 797, 798, 801, 805, 808, 809, 811, 812, 813, 815, 816, 817, 821, 824, 826, 828, 831, 832, 833, 835, 836, 837, 838, 839, 844, 852, 854, 856, 858, 860, 861, 862, 863, 864, 866, 869, 872, 873, 877, 879, 881, 883, 884, 886, 889, 890, 891, 893, 899, 900, 901, 902, 904, 905, 906, 908, 911, 915, 917, 918, 920, 922, 925, 927, 928, 930, 931, 932, 936, 938, 940, 942, 944, 945, 948, 949, 952, 953, 958, 962, 964, 965, 968, 969, 970, 972, 974, 976, 977, 979, 981, 986, 989, 991, 992, 993, 996, 997, 998, 1002, 1003, 1004, 1005, 1006, 1007, 1009, 1010, 1012, 1013, 1014, 1015, 1016, 1018, 1019, 1021, 1022, 1024, 1027, 1028, 1030, 1031, 1034, 1035, 1037, 1038, 1039, 1041, 1042, 1044, 1046, 1049, 1050, 1052, 1054, 1056, 1058, 1060, 1061, 1062, 1063, 1064, 1065, 1066, 1067, 1068, 1070, 1071, 1072, 1073, 1074, 1075, 1078, 1079, 1080, 1081, 1083, 1084, 1086, 1087, 1088, 1090, 1093, 1095, 1096, 1097, 1099, 1101, 1103, 1104, 1105, 1106, 1108, 1110, 1111, 1112, 1113, 1115, 1116, 1117, 1119, 1121, 1122, 1126, 1130, 1131, 1132, 1133, 1137, 1138, 1141, 1142, 1143, 1146, 1147, 1148, 1149, 1150, 1152, 1153, 1154, 1155, 1156, 1157, 1158, 1164, 1165, 1172, 1173, 1174, 1179, 1182, 1184, 1185, 1186, 1187, 1188, 1189, 1190, 1191, 1193, 1194, 1195, 1196, 1198, 1199, 1201, 1203, 1204, 1205, 1206, 1207, 1208, 1209, 1211, 1212, 1214, 1216, 1219, 1220, 1221, 1222, 1223, 1224, 1225, 1226, 1227, 1228, 1229, 1230, 1231, 1232, 1233, 1234, 1236, 1237, 1238, 1239, 1240, 1241, 1242, 1243, 1244, 1245, 1247, 1248, 1249, 1251, 1252, 1255, 1257, 1259, 1260, 1262, 1265, 1266, 1267, 1268, 1269, 1271, 1272, 1273, 1275, 1276, 1277]], "isaan": [[], [], [1079]], "isn": [[], [], [962]], "it": [[], [], [201, 205, 215, 217, 218, 222, 231, 232, 252, 264, 271, 276, 283, 293, 304, 314, 341, 353, 362, 390, 413, 416, 445, 447, 460, 462, 464, 471, 472, 473, 479, 508, 524, 528, 529, 533, 548, 555, 558, 571, 579, 588, 608, 619, 626, 628, 629, 632, 639, 644, 646, 647, 663, 672, 676, 681, 688, 690, 691, 694, 695, 697, 703, 704, 706, 749, 778, 781, 782, 797, 816, 835, 838, 839, 863, 886, 893, 918, 925, 927, 944, 964, 1002, 1005, 1012, 1015, 1018, 1022, 1049, 1056, 1059, 1060, 1061, 1062, 1063, 1064, 1066, 1068, 1070, 1072, 1083, 1090, 1099, 1101, 1126, 1153, 1195, 1196, 1201, 1206, 1212, 1214, 1220, 1224, 1225, 1228, 1232, 1236, 1237, 1240, 1243, 1252, 1268]], "its": [[], [], [200, 237, 241, 255, 281, 340, 381, 407, 451, 466, 536, 540, 549, 569, 574, 604, 606, 618, 638, 648, 700, 708, 738, 815, 880, 889, 908, 925, 958, 987, 1002, 1068, 1070, 1071, 1083, 1090, 1126, 1169, 1187, 1188, 1190, 1237, 1241]], "itself": [[], [], [390, 634, 998, 1141]], "ity": [[], [812], []], "ivan": [[], [], [1044]], "iz": [[], [], [1095]], "j": [[], [], [467, 1150, 1155, 1185]], "ja": [[], [], [1095]], "jack": [[], [], [539, 574, 632, 681, 711, 720, 727, 749, 782, 856, 899, 905, 944, 1162]], "jackrabbit": [[], [], [1229]], "jaguar": [[], [], [412]], "jam": [[], [], [388]], "jane": [[], [], [1216]], "janet": [[], [], [267]], "japan": [[], [], [536]], "japanese": [[], [], [418, 536, 1031, 1094, 1153, 1174, 1196, 1212]], "jared": [[], [], [616]], "jaredi": [[], [], [616]], "je": [[], [], [1096]], "jeh": [[], [], [1064]], "jerry": [[], [], [285, 286, 383, 795, 812, 1041, 1147, 1158]], "ji": [[], [], [1004, 1027]], "jill": [[], [], [332, 349, 551, 711, 831, 844, 1003]], "jim": [[], [], [613, 631, 893, 1101]], "jis": [[], [], [1075]], "joe": [[], [], [261, 349, 551, 711, 773, 844, 1003]], "john": [[], [], [287, 368, 604, 612, 617, 629, 687, 688, 690, 797, 852, 925, 1044, 1157, 1185, 1265, 1275]], "joni": [[], [], [1157]], "joseph": [[], [], [668]], "judgment": [[], [], [773, 815, 831, 844, 1003]], "jui": [[], [], [1013]], "jump": [[], [], [761]], "jumped": [[], [], [548]], "juncos": [[], [], [279, 715, 1038]], "jussive": [[], [], [354, 642]], "just": [[], [], [235, 262, 364, 378, 629, 632, 646, 649, 690, 889, 1018, 1019]], "justification": [[], [], [821]], "juxtaposed": [[], [], [229, 1015, 1075, 1146]], "juxtaposes": [[], [], [1277]], "juxtaposition": [[1146], [], [1037, 1235]], "juxtposed": [[], [], [997]], "k": [[], [], [217, 281, 358, 598, 903, 1054, 1065, 1070, 1075, 1113, 1184, 1185, 1236]], "k5": [[], [], [903]], "ka": [[], [], [1094, 1143, 1199]], "kadite": [[], [], [1005]], "kaip": [[], [], [1220]], "kal": [[], [], [1185]], "kali": [[], [], [1188]], "kamb": [[], [], [1194]], "kan": [[], [], [1143]], "kato": [[], [], [1062]], "katta": [[], [], [1174]], "kayeta": [[], [], [228]], "ke": [[], [], [1027]], "keenan": [[], [], [1265]], "kel": [[], [], [1065]], "kerry": [[], [], [464, 467, 1121]], "kerte": [[], [], [1185]], "kesik": [[], [], [1061]], "keys": [[], [], [711]], "kgaimo": [[], [], [324]], "khu": [[], [], [1127]], "ki": [[], [], [1062]], "kick": [[], [], [1068]], "kids": [[], [], [378]], "kiga": [[], [], [1103]], "kijinlikkoan": [[], [], [1141, 1142]], "kijou": [[], [], [1204]], "kill": [[], [], [1234]], "killed": [[], [], [222, 864, 1075, 1234, 1248, 1259, 1265]], "killing": [[374, 860], [374, 860], [374, 860, 1265]], "kin": [[], [], [861]], "kind": [[], [], [571, 938]], "kinda": [[], [], [571]], "kinds": [[], [], [892, 1185, 1275]], "kinship": [[375, 861], [861], [356, 861, 918, 1141]], "kinsman": [[], [], [656]], "kinyarwanda": [[], [], [1046]], "kiri": [[], [], [1234]], "kit": [[], [], [291, 323, 886, 917]], "kitchen": [[], [], [313, 625, 645, 824]], "kiye": [[], [], [1011, 1127]], "knife": [[], [], [1037, 1075, 1265, 1269]], "kniga": [[], [], [1044]], "knives": [[], [], [1199]], "knob": [[], [], [1058]], "knocking": [[], [], [418]], "know": [[], [], [332, 349, 447, 515, 667, 672, 675, 699, 831, 844]], "knowing": [[], [], [606]], "knowledge": [[376, 377, 862], [862], [377, 382, 558, 590, 600, 681, 697, 789, 926, 1152]], "known": [[514, 640, 698], [], [292, 293, 360, 361, 514, 606, 638, 667, 680, 681, 698, 699, 708]], "knows": [[], [], [377, 514, 676, 698, 862]], "ko": [[], [], [1059, 1075]], "koasati": [[], [], [1070]], "kobon": [[], [], [1214]], "kofi": [[], [], [1234]], "koptjevskaja": [[], [], [606]], "kosraean": [[], [], [323, 358]], "koto": [[], [], [1153]], "ku": [[], [], [1005, 1106, 1198]], "kurakura": [[], [], [1212]], "kuskokwim": [[], [], [1043]], "kut": [[], [], [1015]], "kwermuhl": [[], [], [1158]], "kwintuta": [[], [], [1143]], "kwitsaman": [[], [], [1143]], "kwitsami": [[], [], [1143]], "kyeyattisa": [[], [], [1265]], "l": [[], [], [217, 323, 903, 997, 1042, 1154, 1184, 1205, 1236, 1239, 1255, 1259]], "la": [[], [], [1096, 1157, 1172, 1209, 1242]], "label": [[], [], [586]], "lack": [[], [], [488, 1009]], "lacks": [[], [], [566, 1067, 1083, 1268]], "ladder": [[], [], [488]], "laid": [[], [], [952]], "lakhota": [[], [], [1010, 1011, 1118, 1127]], "lambrecht": [[], [], [675, 676]], "landlord": [[], [], [1163]], "language": [[580], [], [212, 281, 356, 562, 566, 570, 573, 575, 580, 588, 589, 593, 595, 596, 597, 1154, 1245, 1267]], "languages": [[], [], [452, 552, 559, 560, 562, 589, 596, 917, 1015, 1080, 1143, 1265]], "lao": [[], [], [903, 1225]], "lap": [[], [863], []], "laptop": [[], [], [464, 467, 1121]], "large": [[], [], [200, 407, 1203]], "largely": [[], [], [1015, 1222]], "larger": [[], [], [593, 1153]], "las": [[], [], [1132, 1133]], "last": [[], [], [252, 508, 974, 1112, 1151]], "later": [[], [], [597]], "latin": [[], [], [1014]], "latter": [[], [], [334, 558, 564, 606, 707]], "lavukaleve": [[], [], [1037]], "lawn": [[], [], [599]], "lay": [[], [], [372]], "laying": [[], [], [372]], "lazy": [[], [], [207]], "ld": [[], [], [1110]], "le": [[], [], [1155]], "lead": [[], [], [276, 781, 1228]], "leaf": [[], [], [1202]], "lean": [[], [], [253, 764]], "learned": [[], [], [646]], "least": [[], [], [475, 643, 668, 837, 858, 945, 986, 1095, 1187, 1228, 1267]], "leave": [[], [], [836, 1043]], "leaves": [[], [], [257]], "leaving": [[], [], [257, 608]], "left": [[], [], [204, 205, 257, 469, 543, 608, 748, 922, 1022, 1133, 1179, 1199]], "lei": [[], [], [1097]], "length": [[], [], [263, 309, 393, 474, 775, 794]], "lent": [[], [], [918]], "less": [[863, 864], [], [222, 378, 413, 426, 447, 552, 571, 594, 672, 706, 863, 864, 907, 945, 1041, 1153, 1158, 1206, 1228]], "lesser": [[], [], [475]], "lest": [[], [], [731]], "let": [[378, 865], [], [354, 378, 642, 945]], "letter": [[], [], [288, 1046, 1141, 1142, 1259]], "levee": [[], [], [255]], "level": [[], [], [579, 738]], "lexeme": [[241], [241], [577, 1058]], "lexical": [[], [], [563, 1019]], "lexicalization": [[574], [574], []], "lexicalize": [[574], [574], []], "lexicalized": [[], [], [231, 574]], "lhasa": [[], [], [879]], "li": [[], [], [1024, 1277]], "libro": [[], [], [1270]], "libros": [[], [], [1066, 1093, 1134, 1252]], "lie": [[], [], [1113]], "lied": [[], [], [873]], "lifetime": [[], [], [908]], "light": [[], [528, 529], [1067, 1195]], "lightning": [[], [], [835]], "like": [[], [], [291, 338, 498, 576, 610, 655, 673, 689, 706, 707, 711, 886, 899, 974, 1009, 1013, 1014, 1018, 1019, 1031, 1034, 1164, 1191, 1199, 1214, 1220, 1221, 1242, 1255, 1267]], "liked": [[], [], [291]], "likelihood": [[], [], [594]], "likely": [[], [], [555, 700, 1228]], "likes": [[], [], [1094]], "line": [[], [], [588]], "linguistic": [[], [596], [262, 439, 472, 473, 590, 616]], "linguistics": [[], [], [1112]], "linguists": [[], [], [567, 575, 1041]], "link": [[655, 755], [], [285, 655, 707, 1052]], "linked": [[], [], [655]], "linker": [[1147], [], [1147]], "linking": [[], [], [304, 1234]], "links": [[], [], [304, 1052]], "lion": [[], [], [433, 877]], "lip": [[], [864], []], "list": [[324, 408, 823, 888], [324], [322, 324, 357, 408, 581, 605, 610, 1120, 1247]], "listed": [[], [], [650, 816]], "listing": [[656], [], [670]], "lit": [[], [], [231, 828, 1004, 1016, 1068, 1070, 1071, 1103, 1188, 1204, 1205, 1234, 1251, 1269]], "literally": [[], [], [1042, 1157]], "lithuanian": [[], [], [1220]], "little": [[], [], [474, 1130, 1193, 1228, 1255]], "little_donkey": [[], [], [1255]], "live": [[], [], [536]], "living": [[], [], [239, 884]], "lizard": [[], [], [295]], "lki": [[], [], [1070]], "ll": [[], [], [305, 1243]], "ln": [[], [], [1199]], "loading": [[], [], [226, 730]], "loc": [[], [], [1198]], "local": [[], [], [1153]], "located": [[], [], [696, 839, 907, 1151]], "locating": [[], [], [833, 841]], "location": [[463, 466], [379, 833, 1148], [379, 414, 463, 465, 466, 590, 789, 802, 832, 882, 927, 929, 932, 958, 979, 1149, 1198, 1203]], "locational": [[379, 1148, 1149, 1255], [379, 1148, 1149], [1148, 1255]], "locative": [[380, 381, 1150, 1198, 1203], [246, 379, 381, 463, 466, 745], [379, 380, 381, 463, 833, 1148, 1149, 1150, 1180, 1198, 1203, 1255]], "locus": [[1151], [], [1234]], "logical": [[], [], [729, 783, 928]], "logophoric": [[382, 657, 1152], [], [382, 558, 1152, 1153]], "loh": [[], [], [1064]], "long": [[1153], [], [309, 346, 366, 378, 393, 474, 502, 643, 794, 1050, 1153, 1237]], "longer": [[], [], [263, 366, 529, 775]], "look": [[], [], [236, 566]], "look_for": [[], [], [566]], "looking": [[], [], [236, 1087, 1112]], "los": [[], [], [1066, 1091, 1093, 1134, 1252]], "lose": [[], [], [471]], "losing": [[], [], [471]], "lot": [[], [], [231, 365, 656, 854]], "love": [[], [], [330, 1084, 1157, 1184, 1236]], "loved": [[], [], [886]], "loves": [[], [], [1157]], "loving": [[], [], [330]], "low": [[658, 659, 666], [], []], "lower": [[], [], [309, 555, 864, 1030, 1090, 1214]], "ltette": [[], [], [1185]], "luganda": [[], [], [1265]], "lunch": [[], [], [297, 378, 390, 524, 739, 970]], "lune": [[], [], [1096]], "lus": [[], [], [1247]], "ly": [[], [], [1021]], "lying": [[], [], [873, 1113]], "m": [[], [], [467, 471, 545, 676, 828, 998, 1075, 1090, 1097, 1137, 1205, 1239, 1259]], "ma": [[], [], [1011, 1059, 1127, 1148, 1188, 1277]], "maa": [[], [], [1025]], "maale": [[], [], [1054]], "maasai": [[], [], [1110]], "macaw": [[], [], [438, 906]], "machine": [[], [], [294]], "made": [[], [], [204, 249, 255, 274, 389, 397, 452, 579, 739, 757, 761, 773, 815, 831, 844, 852, 970, 1003, 1065, 1155, 1187]], "mae": [[], [], [1203]], "magazine": [[], [], [540]], "magazines": [[], [], [540]], "mailboxes": [[], [], [490]], "main": [[383], [], [298, 383, 386, 390, 500, 524, 602, 612, 1031, 1067, 1070, 1140, 1151, 1199]], "maintain": [[], [246, 745], []], "maintaining": [[], [], [745]], "major": [[660], [660], [615, 1024, 1058, 1116, 1118, 1133, 1146, 1147, 1219, 1235, 1238]], "majority": [[], [], [917]], "make": [[], [], [275, 680, 780, 797, 852, 889, 1028, 1251]], "makes": [[], [], [528, 529, 940, 945, 1052, 1224]], "making": [[], [], [231, 795, 797, 852, 889, 1046, 1062, 1155]], "maktaba": [[], [], [1049]], "malay": [[], [], [325]], "malayalam": [[], [], [1074]], "male": [[], [], [339]], "maleficiary": [[866], [], [866]], "mam": [[], [], [1194]], "mammal": [[], [], [340]], "man": [[], [], [217, 488, 1016, 1031, 1046, 1075, 1208, 1230, 1231, 1239]], "man2": [[], [], [903]], "managed": [[], [], [712]], "managing": [[], [], [858]], "mananga": [[], [], [1115, 1233]], "manant": [[], [], [228]], "manasseh": [[], [], [668]], "manchu": [[], [], [1013]], "mandarin": [[], [], [346, 1004, 1035, 1053]], "mandatos": [[], [], [1091]], "manger": [[], [], [1155]], "manifested": [[], [], [1008]], "manipulated": [[], [], [856]], "manipulates": [[], [], [856]], "manipulative": [[384, 385, 867], [867], [385, 558, 867, 883]], "manner": [[386, 387, 388, 868, 869, 870], [386, 869], [386, 387, 388, 519, 576, 581, 869, 882, 1013, 1014, 1019, 1021, 1035, 1068, 1070, 1071, 1074, 1079, 1126, 1188, 1204, 1227]], "many": [[], [], [452, 467, 513, 565, 590, 923, 948, 1043]], "map": [[588, 589], [], [560, 588, 589]], "mar": [[], [], [1221]], "marginal": [[], [], [1087]], "marked": [[], [], [536]], "marker": [[1076, 1080, 1117, 1213, 1214, 1254, 1256], [1116], [304, 536, 1019, 1022, 1035, 1056, 1059, 1072, 1080, 1090, 1172, 1214, 1220, 1251]], "markers": [[304], [], [304, 1080]], "marking": [[1087], [1095], [1044, 1075, 1087]], "marks": [[], [], [1117]], "marriage": [[], [], [861]], "mary": [[], [], [257, 487, 925, 1236, 1240]], "masculine": [[], [], [1018, 1066, 1093, 1134, 1252]], "masdars": [[], [1083], [1083]], "masha": [[], [], [514, 515, 679, 685, 698, 699]], "matches": [[], [], [1271]], "material": [[389, 871], [], [389, 783, 793, 1113]], "mathematical": [[], [], [589]], "matrix": [[206, 269, 390, 420, 495], [], [204, 268, 270, 297, 383, 390, 493, 494, 524, 619, 692, 731, 797, 852, 1015, 1075, 1111, 1112, 1143, 1153, 1187, 1191, 1220, 1221]], "matter": [[], [], [469, 599, 908, 922, 1028, 1210]], "maturity": [[], [], [209]], "may": [[], [], [207, 255, 275, 276, 277, 279, 285, 346, 353, 370, 383, 390, 488, 491, 524, 553, 554, 555, 574, 616, 632, 638, 639, 645, 708, 715, 780, 781, 783, 794, 815, 836, 882, 886, 906, 908, 919, 920, 925, 991, 1005, 1035, 1050, 1075, 1090, 1111, 1143, 1153, 1156, 1194, 1236, 1242, 1249]], "mazi": [[], [], [1019]], "me": [[], [], [208, 227, 249, 278, 294, 341, 373, 452, 545, 614, 654, 731, 738, 757, 828, 838, 866, 883, 918, 1008, 1011, 1014, 1042, 1124, 1127, 1148, 1149, 1205, 1208, 1231, 1244]], "meagan": [[], [], [300, 798, 832, 841]], "meaning": [[872], [], [231, 238, 281, 471, 528, 529, 569, 571, 574, 575, 595, 610, 647, 872, 883, 945, 1027, 1035, 1049, 1126, 1131, 1150, 1223, 1233]], "meanings": [[], [], [563, 569, 590, 710, 816]], "means": [[391, 873], [], [241, 650, 873, 884, 938]], "meant": [[], [], [615]], "measure": [[392, 874], [], [392, 396, 1237]], "measured": [[], [], [392, 593]], "measurement": [[393], [], []], "measures": [[], [], [393, 396]], "measuring": [[875], [], []], "meat": [[], [], [441]], "media": [[], [], [437]], "medial": [[], [286], [286]], "medium": [[661], [], []], "meeb": [[], [], [1194]], "meeting": [[], [], [1236]], "meir": [[], [], [952]], "mektub": [[], [], [1259]], "melt": [[], [], [517]], "melting": [[], [], [517]], "member": [[506, 507, 508, 950], [507], [427, 508, 571, 707]], "members": [[], [], [306, 508, 543, 656, 668, 673, 710, 889]], "memory": [[], [], [643, 695]], "men": [[], [], [608]], "mendicus": [[], [], [1014]], "mene": [[], [], [1248]], "menja": [[], [], [1148]], "mensural": [[394, 395, 396, 876, 1154], [395], [283, 335, 344, 392, 395, 396, 441, 513, 1154, 1211, 1237]], "ment": [[], [], [1164]], "mental": [[877], [], [373, 537, 654, 697, 708, 826, 827, 877, 922, 968, 989]], "mentioned": [[], [], [645, 655, 673, 707]], "mera": [[], [], [1062]], "mere": [[], [], [359]], "merged": [[1155, 1187], [], [1155, 1187]], "meri": [[], [], [1062]], "message": [[878], [], []], "met": [[], [], [514, 515, 698, 699, 1086, 1236]], "metal": [[], [], [389]], "metalanguage": [[575], [], [575, 595]], "metaphor": [[567, 702], [], [567, 663, 679, 685, 702]], "metaphorically": [[], [], [1180]], "method": [[], [], [573]], "mgeni": [[], [], [1198]], "mi": [[], [], [467, 1129]], "microrole": [[], [902], []], "mid": [[662], [], []], "middle": [[1156], [], [1156]], "midzish": [[], [], [1043]], "might": [[], [], [239, 464, 812, 969]], "mill": [[], [], [241]], "mimetics": [[], [1126], []], "mind": [[], [], [471, 1247]], "mine": [[], [], [1016]], "minimal": [[], [], [528, 529]], "ministers": [[], [], [1209]], "mirative": [[879], [], [879]], "mirrors": [[], [], [1253]], "miseno": [[], [], [1031]], "mismatches": [[], [], [555]], "missed": [[], [], [974]], "missing": [[], [], [370, 646, 715]], "mitsraim": [[], [], [1209]], "mixen": [[], [], [1257]], "mixture": [[], [], [1124]], "miyexwe": [[], [], [1257]], "mni": [[], [], [1070]], "mo": [[], [], [1005]], "modal": [[], [812], [558, 812, 836, 893, 969]], "modalities": [[], [], [906]], "modality": [[795, 812, 880], [], [239, 368, 795, 812, 821, 880, 925, 976]], "model": [[589, 945], [], [275, 378, 560, 561, 588, 589, 597, 780, 945, 1028, 1228, 1262]], "modern": [[], [], [437, 1209]], "modification": [[197, 202, 212, 337, 356, 380, 395, 397, 406, 423, 452, 483, 507, 576, 577, 608, 663, 691], [202, 212, 219, 395, 397, 423, 452, 483, 507, 540, 608, 1238], [212, 237, 281, 356, 380, 397, 406, 452, 540, 569, 576, 577, 591, 608, 660, 663, 691, 693, 697, 701, 833, 919, 920, 1008, 1016, 1053, 1093, 1110, 1116, 1141, 1142, 1211, 1276]], "modified": [[], [], [380, 418, 494, 1075, 1146]], "modifier": [[398, 1081], [406, 451], [203, 209, 216, 217, 219, 237, 258, 281, 302, 339, 351, 370, 380, 389, 395, 398, 406, 429, 440, 452, 509, 540, 547, 555, 576, 577, 579, 592, 603, 608, 891, 919, 1013, 1014, 1024, 1049, 1050, 1058, 1079, 1081, 1093, 1116, 1118, 1133, 1134, 1141, 1142, 1146, 1147, 1219, 1224, 1235, 1237, 1238, 1252]], "modifiers": [[], [], [340, 585, 708, 891, 1126]], "modifies": [[], [], [201, 216, 237, 418, 608, 691, 1079, 1225]], "modify": [[], [], [492, 647]], "modifying": [[1174], [1174], [281, 381, 417, 451, 493, 577, 606, 608, 612, 691, 1174]], "moi": [[], [], [1097]], "mokilese": [[], [], [1016, 1141, 1142, 1204]], "molod": [[], [], [1169]], "molodym": [[], [], [1018]], "money": [[], [], [447, 672, 879, 1005, 1025, 1271, 1272]], "mono": [[], [539], []], "monoclausal": [[1157], [], [1065, 1259]], "monosyndetic": [[1158], [], [1249]], "monotransitive": [[], [539], []], "monovalent": [[881], [], [371, 742, 743, 764, 881, 882, 944, 1000, 1156, 1259]], "month": [[], [], [1241]], "monument": [[], [], [1083]], "mood": [[], [], [1009]], "moon": [[], [], [1096]], "moose": [[], [], [1043]], "mor": [[], [], [1019]], "mordvin": [[], [], [1019]], "more": [[], [], [229, 240, 265, 272, 274, 279, 288, 308, 359, 378, 467, 539, 552, 553, 554, 555, 564, 566, 569, 585, 592, 594, 627, 628, 650, 668, 675, 706, 715, 762, 883, 898, 906, 945, 948, 1013, 1014, 1019, 1021, 1034, 1053, 1068, 1070, 1071, 1074, 1084, 1147, 1153, 1156, 1158, 1188, 1193, 1201, 1203, 1234, 1250]], "morning": [[], [], [314, 378, 626]], "morpheme": [[573], [], [291, 470, 563, 566, 573, 580, 591, 595, 1022, 1050, 1056, 1063, 1072, 1073, 1075, 1080, 1116, 1117, 1118, 1122, 1132, 1133, 1146, 1147, 1186, 1219, 1234, 1235, 1237, 1248, 1249, 1267]], "morphemes": [[], [], [573, 591, 593, 1049, 1096]], "morphological": [[], [1129], []], "morphologically": [[], [], [1008, 1054, 1173, 1238, 1243]], "morphology": [[578], [], []], "morphosyntactic": [[579], [579], [281, 559, 568, 571, 573, 574, 588, 1008, 1011, 1021, 1086, 1088, 1102, 1105, 1136, 1165, 1174, 1208, 1216, 1230, 1245, 1250]], "morphosyntactically": [[], [], [452, 554, 976, 1154]], "morphosyntax": [[579], [579], [561]], "most": [[], [], [218, 272, 290, 308, 318, 347, 378, 413, 414, 425, 479, 523, 527, 539, 576, 625, 627, 700, 762, 889, 891, 945, 986, 1111, 1126, 1228]], "mostly": [[], [], [574, 1173]], "mother": [[], [], [397, 861, 1118]], "motion": [[242, 387, 399, 400, 742, 759, 869, 882], [399, 434, 869, 882, 904], [242, 387, 400, 434, 713, 733, 742, 796, 832, 841, 869, 882, 903, 904, 932, 981, 996, 1095, 1113, 1226, 1227, 1266]], "motivates": [[], [], [554]], "motivation": [[], [], [706]], "moulin": [[], [], [241]], "mountain": [[], [], [433, 877, 1031, 1173]], "mouse": [[], [], [465, 680]], "move": [[], [], [1164]], "movement": [[], [], [882, 981, 1164, 1195]], "movie": [[], [], [291, 886, 1005, 1052, 1094]], "movies": [[], [], [1094]], "moving": [[], [], [749]], "mrefu": [[], [], [1106]], "mt": [[], [], [300, 798]], "mti": [[], [], [1106]], "mu": [[], [], [359, 1046]], "much": [[], [], [275, 342, 780, 1065, 1201, 1206, 1262]], "muchas": [[], [], [467]], "mugasho": [[], [], [1103]], "multiple": [[], [], [272, 563, 602, 696, 993, 1158]], "muna": [[], [], [1071]], "mundari": [[], [], [1115, 1233]], "murg": [[], [], [1075]], "must": [[], [], [357, 437, 555, 566, 795, 797, 1028]], "mutually": [[], [], [1157]], "muu": [[], [], [1025]], "mw": [[], [], [1141, 1142]], "my": [[], [], [212, 229, 276, 305, 356, 370, 397, 445, 465, 467, 505, 630, 632, 667, 680, 681, 715, 735, 778, 781, 821, 839, 861, 866, 949, 964, 1037, 1062, 1110, 1118, 1122, 1210, 1257]], "myself": [[], [], [491, 918, 931, 1240]], "n": [[], [446], [234, 291, 558, 1016, 1027, 1035, 1064, 1068, 1070, 1097, 1150, 1154, 1205, 1206, 1214, 1255]], "n1": [[], [], [903]], "n4": [[], [], [903]], "na": [[], [], [228, 1025, 1030, 1059, 1100, 1184, 1198, 1236]], "naan": [[], [], [1005]], "naaval": [[], [], [1005]], "nacional": [[], [], [1091]], "nahuatl": [[], [], [1268]], "nakanai": [[], [], [1172]], "naki": [[], [], [1234]], "nam": [[], [], [1117]], "nambas": [[], [], [1199]], "name": [[], [473], [473, 668, 703]], "named": [[], [], [473, 685]], "namely": [[], [], [227, 232, 235, 314, 472, 569, 619, 626, 692, 712, 911, 1091, 1124, 1163, 1188]], "names": [[], [], [314, 473, 626, 761, 1158]], "nancy": [[], [], [261, 773]], "nararo": [[], [], [215]], "narrative": [[], [], [609, 702, 1130, 1193]], "narratives": [[], [], [696]], "narrow": [[], [], [462, 608, 958]], "narrows": [[], [], [691]], "nasi": [[], [], [1209]], "natural": [[401], [], [735, 977]], "ne": [[], [], [228, 1027, 1054, 1071, 1075, 1096, 1208, 1230, 1231, 1242, 1257]], "near": [[], [], [514, 515, 698, 699, 929]], "nearly": [[], [], [398]], "necessarily": [[], [883], [356, 418, 459, 489, 494, 612, 795, 883, 1075, 1119, 1141, 1143, 1187, 1209, 1222, 1253]], "necessary": [[883], [], []], "neck": [[], [], [1210]], "nee": [[], [], [1158, 1208, 1230, 1231]], "need": [[], [], [383, 646]], "negate": [[], [], [291]], "negated": [[], [], [362, 644, 675]], "negation": [[291, 303, 325, 362, 402, 620, 644, 1023, 1096], [291, 325, 402], [291, 303, 362, 402, 620, 644, 1096, 1268]], "negative": [[403, 404, 664, 884, 885, 886, 1107, 1159, 1160, 1161], [886], [291, 303, 325, 354, 378, 402, 620, 642, 671, 682, 700, 708, 731, 813, 815, 831, 847, 884, 885, 886, 915, 974, 1003, 1004, 1025, 1096, 1271, 1272]], "negatively": [[], [], [731, 866]], "neglect": [[], [], [758, 1012]], "neglected": [[], [], [1012]], "neither": [[], [], [534, 699, 969]], "ness": [[], [564], [1164]], "nest": [[], [], [1225]], "nests": [[], [], [1225]], "net": [[], [], [1257]], "network": [[], [], [560, 589]], "neuter": [[], [], [1068]], "neutral": [[887, 1162, 1163], [1162, 1163], [275, 780, 812, 813, 815, 831, 844, 847]], "new": [[], [703], [201, 313, 318, 533, 571, 625, 627, 703, 1130]], "newspaper": [[], [], [274, 319]], "next": [[], [], [508, 1126, 1241]], "ng": [[], [], [346, 1035, 1042]], "nga": [[], [], [879]], "ngabakala": [[], [], [1037]], "ngankulukula": [[], [], [1205]], "ngata": [[], [], [359]], "ngauia": [[], [], [1037]], "ngoah": [[], [], [1141, 1142]], "nguna": [[], [], [215]], "ni": [[], [], [215, 1106, 1153, 1198, 1268]], "nice": [[], [], [351, 679, 685]], "nicht": [[], [], [1086]], "nih": [[], [], [1141, 1142]], "nihon": [[], [], [536]], "nii": [[], [], [1202]], "nik": [[], [], [222, 864]], "nikki": [[], [], [1052]], "nikundeiru": [[], [], [1153]], "nkore": [[], [], [1103]], "no": [[1271, 1272], [446, 1271, 1272], [271, 324, 325, 371, 446, 447, 491, 529, 554, 604, 617, 672, 687, 688, 690, 887, 997, 1025, 1028, 1065, 1071, 1122, 1140, 1152, 1271, 1272, 1276, 1277]], "nodes": [[], [], [589]], "noingana": [[], [], [1103]], "nomatsiguenga": [[], [], [228]], "nominal": [[405, 406, 407, 462, 1009, 1029], [219, 406, 540], [219, 406, 407, 416, 452, 462, 529, 540, 577, 1009, 1079, 1182, 1232, 1238, 1245, 1267]], "nominalization": [[], [1083], [1012]], "nominalizations": [[], [], [1083]], "nominalized": [[], [], [1019]], "nominalizer": [[1164], [], []], "nominals": [[], [], [1009, 1083]], "nominative": [[1165, 1168], [], [1008, 1165, 1169]], "non": [[408, 665, 666, 888, 1166, 1167, 1168], [408, 540, 676, 847], [227, 241, 357, 395, 408, 577, 783, 813, 884, 1120, 1272]], "nonanaphoric": [[409], [409], []], "nonbasic": [[410], [], [410, 433, 1041]], "nonclausal": [[411], [], []], "noncontaining": [[], [643], [645]], "noncountable": [[], [], [214]], "nondeclarative": [[], [], [1140]], "none": [[], [], [447, 534, 672]], "nonfuture": [[], [], [359]], "nonhuman": [[], [726], [556, 565, 683, 726, 837]], "nonnull": [[], [1183], []], "nono": [[], [], [1248]], "nonperson": [[1169], [], [1066, 1133]], "nonpredicational": [[412], [412], [255, 412, 1210]], "nonprototypical": [[413, 414], [], [413, 414, 464, 1012, 1073, 1074, 1124, 1149, 1164, 1172, 1232, 1267, 1268]], "nonreal": [[], [], [694, 708]], "nonrelational": [[889], [], [889]], "nonrestrictive": [[], [608], []], "nonsingular": [[], [], [359]], "nonspecific": [[455, 456, 503, 504, 667, 1170, 1171], [455, 456, 503, 504, 667, 694], [360, 361, 455, 456, 503, 504, 667, 694, 864]], "nonsubject": [[415], [], [1240]], "nonverbal": [[668, 1172], [414, 1172], [668, 670, 1073]], "noodles": [[], [], [645]], "noonan": [[], [], [300, 798]], "nor": [[], [], [534, 699]], "norie": [[], [], [461]], "norio": [[], [], [424]], "normal": [[], [], [309, 366, 794, 938]], "normally": [[], [], [677, 694, 741, 813, 972, 974, 1110, 1141, 1242]], "nos": [[], [], [1185]], "nose": [[], [], [346, 356]], "noses": [[], [], [346]], "not": [[1004], [], [218, 235, 271, 272, 291, 296, 297, 304, 318, 323, 332, 346, 349, 356, 357, 360, 361, 378, 383, 390, 408, 410, 413, 418, 459, 469, 474, 484, 489, 502, 515, 524, 534, 540, 546, 554, 555, 563, 564, 581, 606, 608, 619, 627, 632, 634, 643, 645, 646, 667, 692, 694, 695, 696, 698, 699, 703, 709, 712, 734, 735, 811, 831, 835, 844, 852, 879, 880, 884, 887, 889, 890, 891, 893, 901, 907, 911, 922, 944, 945, 966, 972, 991, 996, 1004, 1007, 1013, 1015, 1016, 1022, 1028, 1037, 1056, 1060, 1064, 1068, 1070, 1072, 1075, 1083, 1086, 1087, 1090, 1096, 1112, 1119, 1129, 1141, 1143, 1152, 1153, 1167, 1169, 1187, 1226, 1235, 1237, 1239, 1249, 1271, 1272]], "notated": [[], [], [566, 616]], "notation": [[], [], [573]], "note": [[], [], [262, 473]], "nothing": [[], [], [303, 620]], "noticed": [[], [], [303, 620, 1067]], "notion": [[], [], [567, 599]], "noun": [[220, 221, 245, 262, 350, 352, 375, 401, 416, 417, 418, 419, 420, 421, 442, 443, 444, 473, 512, 1123, 1173, 1174], [401, 1083, 1174], [234, 262, 281, 292, 294, 340, 360, 407, 416, 417, 418, 429, 471, 473, 493, 555, 557, 562, 565, 583, 585, 708, 1030, 1054, 1075, 1093, 1117, 1129, 1142, 1146, 1173, 1174, 1225, 1270]], "nouns": [[], [], [301, 701, 1009, 1083]], "novel": [[], [], [571, 1005]], "november": [[], [], [533, 607, 703]], "now": [[], [], [574, 836]], "nt": [[], [], [1129]], "nuer": [[], [], [1027]], "null": [[], [1122, 1273], []], "num": [[], [], [281]], "number": [[890], [], [247, 281, 555, 557, 563, 591, 890, 962, 1000, 1014, 1133, 1134, 1169, 1194, 1267]], "numeral": [[247, 422, 423, 427, 546, 746, 891, 895, 999, 1175], [423], [281, 427, 546, 569, 579, 891, 1247]], "numerals": [[], [], [247, 484, 508, 693, 891]], "nyeu": [[], [], [1059]], "nyumba": [[], [], [1198]], "o": [[], [899], [418, 1016, 1035, 1041, 1059, 1068, 1126, 1153, 1174, 1229, 1257]], "oaw": [[], [], [1141, 1142]], "obaasanga": [[], [], [1031]], "object": [[228, 401, 424, 425, 580, 669, 892, 1040, 1087, 1088, 1136, 1176, 1208, 1230], [425, 462, 679, 1054, 1163, 1244], [219, 227, 228, 229, 231, 232, 241, 255, 265, 271, 288, 328, 380, 381, 389, 393, 395, 406, 407, 413, 414, 416, 424, 425, 429, 438, 441, 451, 462, 479, 489, 540, 552, 566, 569, 571, 573, 575, 580, 586, 591, 606, 608, 625, 647, 691, 706, 727, 730, 782, 793, 810, 832, 833, 889, 892, 898, 900, 906, 908, 918, 920, 923, 942, 965, 970, 1012, 1034, 1041, 1046, 1053, 1084, 1087, 1094, 1110, 1111, 1116, 1121, 1124, 1141, 1155, 1157, 1163, 1172, 1182, 1187, 1195, 1206, 1208, 1232, 1237, 1240, 1241, 1267, 1268]], "objective": [[893], [], [368, 795, 812, 836, 893]], "objects": [[], [], [281, 314, 408, 527, 569, 623, 626, 706, 726, 771, 833, 837, 845, 849, 892, 918, 1050, 1141, 1237, 1241]], "oblique": [[223, 426, 1097, 1177], [426], [222, 232, 255, 426, 552, 554, 594, 733, 796, 1012, 1018, 1019, 1027, 1034, 1035, 1041, 1097, 1148, 1150, 1155, 1226, 1227, 1233, 1241]], "oburaingwa": [[], [], [1103]], "occasions": [[], [], [616]], "occupant": [[894], [], []], "occur": [[], [], [275, 368, 555, 598, 748, 780, 1093, 1153]], "occurrence": [[542, 997], [], [207, 263, 593, 598, 775, 997]], "occurring": [[], [], [437, 488, 586, 611, 905]], "occurs": [[], [], [275, 590, 780, 781, 858, 1017, 1043, 1044, 1049, 1115, 1202, 1207, 1209]], "odd": [[], [], [1164]], "oddness": [[], [], [1164]], "odham": [[], [], [1229]], "of": [[210, 254, 387, 721, 765, 869, 989, 1064, 1129, 1151], [434, 597, 598, 749, 765, 816, 869, 904, 1129], [201, 203, 204, 205, 207, 208, 209, 210, 212, 213, 215, 216, 217, 218, 219, 222, 224, 227, 231, 232, 235, 236, 237, 239, 240, 241, 247, 249, 254, 255, 256, 261, 262, 263, 264, 267, 268, 272, 274, 275, 276, 277, 278, 279, 281, 283, 285, 286, 287, 290, 291, 292, 293, 296, 297, 298, 300, 301, 302, 304, 305, 306, 308, 311, 312, 313, 315, 318, 319, 321, 322, 324, 325, 326, 328, 330, 332, 334, 335, 336, 338, 341, 344, 347, 349, 351, 354, 356, 357, 360, 361, 362, 363, 365, 368, 370, 371, 372, 373, 378, 379, 382, 383, 386, 387, 388, 389, 390, 392, 393, 395, 396, 397, 398, 406, 408, 410, 412, 413, 414, 416, 418, 424, 427, 429, 433, 434, 437, 438, 439, 441, 445, 446, 447, 450, 452, 459, 460, 461, 462, 463, 464, 465, 466, 467, 469, 470, 473, 474, 475, 479, 484, 488, 489, 490, 493, 494, 499, 500, 502, 505, 508, 509, 513, 514, 515, 519, 522, 527, 528, 529, 532, 534, 535, 539, 540, 541, 543, 546, 547, 548, 551, 552, 553, 554, 555, 556, 557, 558, 559, 560, 561, 562, 563, 564, 565, 566, 567, 568, 569, 570, 571, 573, 574, 575, 576, 577, 578, 579, 580, 581, 582, 583, 586, 587, 588, 589, 590, 591, 592, 593, 594, 595, 596, 597, 598, 599, 600, 601, 603, 604, 605, 606, 607, 608, 610, 611, 612, 613, 614, 615, 616, 617, 618, 619, 620, 625, 626, 627, 628, 629, 630, 631, 632, 633, 634, 638, 639, 642, 644, 645, 646, 647, 648, 650, 651, 653, 654, 656, 663, 667, 668, 670, 671, 672, 673, 675, 676, 679, 680, 681, 682, 684, 687, 688, 690, 691, 692, 693, 695, 697, 698, 699, 700, 701, 702, 704, 705, 706, 707, 709, 710, 712, 713, 715, 721, 726, 727, 729, 731, 733, 734, 738, 739, 740, 741, 744, 745, 748, 756, 757, 758, 760, 765, 768, 771, 773, 775, 778, 780, 781, 782, 783, 784, 788, 789, 794, 795, 796, 797, 798, 801, 802, 805, 807, 808, 809, 812, 813, 815, 817, 824, 831, 832, 836, 837, 838, 839, 841, 844, 845, 847, 849, 852, 854, 855, 856, 858, 860, 861, 863, 864, 866, 867, 869, 872, 873, 877, 879, 880, 881, 882, 883, 884, 885, 886, 887, 889, 890, 891, 892, 893, 898, 900, 901, 902, 903, 904, 905, 906, 908, 911, 915, 916, 917, 922, 923, 925, 926, 927, 928, 929, 930, 931, 936, 938, 940, 942, 945, 949, 952, 953, 958, 962, 964, 965, 966, 969, 970, 972, 974, 976, 977, 979, 981, 986, 991, 992, 993, 996, 997, 998, 1000, 1002, 1003, 1004, 1009, 1010, 1011, 1012, 1013, 1014, 1016, 1019, 1021, 1022, 1025, 1026, 1027, 1028, 1030, 1031, 1035, 1037, 1038, 1039, 1041, 1042, 1049, 1050, 1052, 1053, 1056, 1058, 1060, 1061, 1062, 1064, 1065, 1067, 1068, 1070, 1071, 1072, 1074, 1075, 1079, 1080, 1083, 1084, 1086, 1087, 1090, 1095, 1098, 1099, 1100, 1102, 1103, 1106, 1108, 1110, 1111, 1112, 1113, 1115, 1117, 1119, 1120, 1121, 1124, 1126, 1127, 1131, 1132, 1133, 1134, 1135, 1137, 1140, 1141, 1142, 1143, 1146, 1148, 1149, 1150, 1152, 1153, 1154, 1155, 1156, 1157, 1162, 1163, 1167, 1169, 1173, 1174, 1179, 1180, 1182, 1184, 1185, 1186, 1187, 1188, 1190, 1191, 1193, 1194, 1195, 1196, 1198, 1199, 1202, 1203, 1204, 1205, 1207, 1209, 1216, 1219, 1220, 1221, 1222, 1223, 1226, 1227, 1228, 1230, 1232, 1233, 1234, 1235, 1236, 1237, 1238, 1239, 1240, 1242, 1243, 1244, 1245, 1247, 1249, 1250, 1251, 1252, 1253, 1255, 1257, 1259, 1260, 1262, 1265, 1266, 1267, 1268, 1269, 1270, 1271, 1272, 1273, 1275, 1276, 1277]], "off": [[], [], [272, 908, 1173]], "offer": [[], [], [373, 654]], "offered": [[], [], [213, 605]], "offering": [[], [], [687, 688]], "offers": [[], [], [605]], "office": [[], [], [667, 811]], "often": [[], [], [207, 218, 262, 279, 285, 297, 368, 390, 529, 571, 583, 602, 616, 712, 726, 749, 890, 911, 997, 1133, 1211]], "ogress": [[], [], [1255]], "ojiisanga": [[], [], [1031]], "old": [[], [], [209, 416, 459, 479, 835, 1031]], "older": [[], [], [1122, 1190]], "ollie": [[], [], [353, 639]], "omitted": [[1178, 1179], [], []], "on": [[], [], [224, 235, 255, 264, 265, 271, 285, 286, 300, 302, 309, 315, 339, 359, 366, 378, 388, 390, 393, 397, 408, 418, 427, 452, 463, 524, 527, 533, 552, 555, 556, 559, 562, 565, 567, 574, 584, 607, 638, 645, 703, 743, 749, 756, 775, 778, 780, 794, 797, 798, 811, 828, 837, 839, 855, 858, 863, 866, 885, 887, 889, 893, 907, 916, 923, 926, 938, 945, 962, 964, 974, 1000, 1007, 1018, 1024, 1031, 1041, 1046, 1052, 1059, 1060, 1065, 1091, 1103, 1106, 1113, 1116, 1129, 1132, 1134, 1150, 1151, 1157, 1169, 1180, 1185, 1187, 1193, 1194, 1199, 1203, 1207, 1221, 1223, 1230, 1259, 1275]], "once": [[], [], [314, 571, 626, 683, 1187]], "one": [[], [], [216, 231, 239, 247, 252, 262, 271, 272, 274, 285, 314, 334, 338, 342, 357, 452, 471, 473, 488, 502, 519, 529, 543, 559, 566, 574, 591, 597, 610, 615, 617, 626, 631, 705, 709, 730, 731, 741, 748, 749, 775, 780, 801, 858, 873, 881, 882, 883, 884, 901, 906, 931, 932, 944, 948, 972, 974, 998, 1024, 1026, 1035, 1049, 1050, 1053, 1062, 1071, 1103, 1106, 1152, 1157, 1158, 1186, 1188, 1205, 1221, 1237, 1238, 1255]], "oneself": [[], [], [242, 244, 330, 372, 742, 743, 795]], "only": [[], [], [271, 278, 288, 303, 353, 359, 362, 373, 395, 462, 540, 562, 614, 620, 638, 639, 644, 654, 667, 683, 684, 690, 726, 760, 879, 952, 1008, 1101, 1119, 1130, 1133, 1137, 1143, 1151, 1157, 1187, 1190, 1228]], "onto": [[], [], [730]], "ontological": [[581], [], [581]], "ontology": [[582], [], []], "open": [[681], [], [225, 277, 353, 478, 604, 628, 632, 639, 646, 681, 729, 783, 788, 887, 928, 1052, 1101]], "opened": [[], [], [601, 885, 916]], "opening": [[], [], [788]], "opens": [[], [], [685]], "operation": [[], [], [529]], "operationally": [[], [], [593]], "operator": [[], [], [629, 690]], "opi": [[], [], [1188]], "opposing": [[], [], [224, 271]], "opposite": [[], [], [710, 731, 781, 1028, 1193, 1228]], "optional": [[], [], [554, 1190]], "or": [[], [], [209, 213, 225, 229, 239, 240, 263, 271, 275, 276, 277, 279, 281, 286, 305, 308, 311, 322, 330, 338, 341, 347, 356, 357, 359, 360, 361, 364, 368, 371, 372, 379, 382, 389, 396, 397, 409, 412, 413, 445, 446, 447, 450, 452, 469, 475, 478, 479, 488, 491, 502, 508, 509, 513, 529, 534, 547, 555, 556, 557, 569, 574, 582, 583, 590, 594, 599, 602, 603, 604, 605, 606, 610, 613, 623, 630, 631, 638, 647, 649, 651, 654, 668, 671, 672, 673, 675, 676, 685, 691, 693, 697, 700, 707, 708, 711, 712, 713, 715, 729, 730, 731, 743, 744, 745, 775, 778, 780, 781, 783, 788, 795, 811, 812, 826, 827, 832, 837, 838, 839, 854, 858, 861, 864, 877, 880, 882, 883, 884, 887, 889, 898, 899, 902, 906, 908, 911, 915, 918, 922, 925, 927, 928, 932, 940, 944, 949, 952, 953, 962, 964, 965, 968, 969, 976, 987, 996, 1009, 1019, 1025, 1028, 1034, 1037, 1038, 1043, 1049, 1050, 1053, 1058, 1062, 1063, 1064, 1075, 1079, 1080, 1083, 1094, 1099, 1100, 1101, 1102, 1108, 1110, 1111, 1112, 1120, 1126, 1129, 1133, 1141, 1148, 1151, 1152, 1153, 1155, 1156, 1158, 1164, 1172, 1180, 1184, 1187, 1195, 1204, 1211, 1212, 1220, 1228, 1229, 1234, 1236, 1237, 1239, 1240, 1242, 1244, 1245, 1249, 1250, 1251]], "orange": [[], [], [305]], "order": [[1041, 1270], [], [562, 574, 680, 1041, 1112, 1140, 1201, 1203, 1206, 1253, 1265, 1270]], "ordered": [[1180], [], [427, 673, 1180]], "ordering": [[], [], [427, 508, 553, 673, 858]], "orders": [[], [], [1041]], "ordinal": [[427, 895], [], [427, 508, 891]], "ordinary": [[], [], [263, 775, 1152]], "organizing": [[], [], [696]], "orientation": [[896], [], []], "oriented": [[817, 836, 901, 1108, 1244], [], [298, 386, 500, 817, 901, 1108, 1244]], "origin": [[], [], [1148]], "original": [[], [], [1090, 1156]], "originally": [[], [], [571, 1149, 1268]], "originated": [[], [], [574]], "originates": [[], [], [1090, 1214]], "origins": [[], [], [1190]], "oromo": [[], [], [1079]], "orphan": [[], [], [1194]], "os": [[], [], [1066, 1093, 1134, 1252]], "osshee": [[], [], [212]], "ost": [[], [], [1113]], "otam": [[], [], [1209]], "other": [[897], [], [227, 229, 231, 239, 252, 255, 285, 324, 330, 357, 359, 372, 412, 414, 447, 487, 491, 508, 519, 529, 554, 557, 558, 559, 571, 583, 590, 631, 642, 648, 650, 655, 672, 675, 693, 706, 710, 731, 748, 756, 780, 795, 812, 816, 861, 873, 884, 886, 890, 891, 918, 931, 977, 981, 1010, 1021, 1024, 1042, 1053, 1062, 1083, 1090, 1099, 1129, 1135, 1149, 1157, 1167, 1184, 1194, 1204, 1214, 1221, 1226, 1236, 1240]], "others": [[], [], [324, 795, 813]], "otherwise": [[], [], [1165]], "oto": [[], [], [418]], "oui": [[], [], [1272]], "oumar": [[], [], [382, 1152]], "oumari": [[], [], [382, 1152]], "our": [[], [], [575, 710]], "ourselves": [[], [], [710]], "out": [[], [], [242, 274, 276, 389, 396, 607, 642, 650, 693, 697, 712, 742, 757, 781, 879, 958, 972, 1064, 1067, 1095, 1237]], "outcome": [[], [], [731, 739, 866, 931, 1028, 1065, 1228, 1262]], "outdoor": [[], [], [304]], "outside": [[], [], [893]], "over": [[], [], [647, 734, 805, 807, 908, 919, 966, 991, 1065, 1199, 1262]], "overlap": [[], [953], [385, 953]], "overt": [[1181, 1182, 1183], [1182, 1186], [338, 488, 619, 1022, 1030, 1046, 1056, 1072, 1087, 1122, 1157, 1182, 1184, 1185, 1186, 1234, 1249, 1275, 1276, 1277]], "overtly": [[1182, 1184, 1185, 1186], [1182, 1185], [222, 555, 564, 938, 1022, 1056, 1072, 1083, 1182, 1186, 1236]], "overwhelmingly": [[], [], [1009]], "own": [[], [], [743, 987, 1187, 1190, 1241]], "owner": [[], [], [1110]], "ownership": [[898], [898], [212, 464, 918, 1141]], "owns": [[], [], [452, 898]], "p": [[428, 432, 863, 864, 899, 1177, 1179, 1239], [428, 899], [222, 227, 433, 539, 552, 584, 863, 864, 899, 1006, 1007, 1008, 1010, 1030, 1041, 1064, 1068, 1087, 1088, 1104, 1110, 1127, 1138, 1141, 1162, 1163, 1173, 1179, 1208, 1214, 1231, 1239, 1260]], "pa": [[], [], [1005, 1248]], "package": [[], [], [700]], "packaged": [[], [], [569, 647, 891, 927, 1068, 1070, 1071, 1188, 1204]], "packaging": [[647, 1012, 1124, 1139, 1232], [1012, 1139], [204, 205, 255, 281, 286, 287, 313, 314, 318, 353, 413, 464, 465, 466, 467, 479, 533, 535, 559, 567, 569, 572, 576, 603, 608, 612, 613, 626, 631, 632, 639, 650, 660, 679, 680, 681, 691, 703, 705, 728, 784, 921, 1002, 1012, 1041, 1124, 1232, 1245]], "paddle": [[], [], [1037]], "pai": [[], [], [1248]], "pain": [[], [], [1155]], "painted": [[], [], [500]], "painting": [[], [], [500]], "pair": [[], [], [1041]], "pairing": [[], [], [281, 574]], "pal": [[], [], [1070]], "palk": [[], [], [1070]], "palo": [[], [], [1188]], "pantu": [[], [], [1015]], "paper": [[], [], [425, 523]], "par": [[], [], [1155]], "parallel": [[670], [], [240, 410, 615, 656, 668, 670, 710]], "parallelism": [[], [], [670]], "park": [[], [], [735]], "part": [[233, 245, 273, 310, 320, 520, 744, 900], [598, 744, 900], [286, 287, 311, 356, 441, 519, 552, 588, 590, 597, 604, 632, 651, 673, 681, 690, 744, 882, 885, 887, 900, 916, 918, 972, 974, 1005, 1095, 1100, 1106, 1120, 1141, 1153, 1205, 1247]], "partial": [[], [], [673, 813]], "partially": [[1187], [], [574, 673, 1187]], "participant": [[762, 819, 883, 901, 902, 907], [883, 902], [222, 227, 228, 232, 240, 255, 298, 346, 359, 382, 410, 418, 433, 491, 494, 500, 564, 584, 612, 619, 692, 711, 720, 727, 735, 739, 740, 749, 757, 758, 760, 761, 762, 765, 772, 782, 801, 809, 817, 828, 835, 855, 856, 858, 863, 864, 866, 881, 882, 899, 902, 905, 932, 936, 944, 948, 968, 970, 977, 981, 992, 996, 998, 1000, 1018, 1034, 1075, 1087, 1097, 1099, 1110, 1119, 1141, 1142, 1143, 1152, 1153, 1173, 1179, 1187, 1209, 1222, 1236, 1239, 1240, 1242, 1244, 1265]], "participants": [[], [], [252, 288, 359, 426, 554, 558, 738, 756, 762, 883, 901, 907, 925, 1002, 1030, 1099, 1141, 1155, 1236, 1239, 1240]], "participial": [[1188], [], []], "participle": [[1074, 1189], [], [1005, 1189]], "participles": [[], [], [493, 1083]], "particle": [[1161, 1190, 1191], [], [1053, 1084, 1131, 1190, 1191]], "particular": [[], [], [262, 281, 285, 429, 473, 540, 552, 574, 586, 588, 589, 590, 593, 598, 634, 638, 639, 679, 697, 745, 762, 847, 872, 877, 902, 907, 925, 987, 996, 1011, 1127, 1148, 1153, 1245, 1268]], "particularizing": [[583], [], [583, 597]], "particularly": [[], [], [900, 1039, 1096]], "partitive": [[429, 430, 1211], [], [395, 429, 1211]], "partly": [[], [], [858]], "parts": [[], [598], [272, 613, 656, 710, 918]], "party": [[], [], [267, 368, 608, 634, 728, 748, 784, 921, 1022, 1253]], "pas": [[], [], [1096]], "pashto": [[], [], [1049]], "passage": [[], [], [215, 304, 488]], "passing": [[903], [], [882, 903]], "passive": [[431, 432, 433, 1192], [431, 433], [410, 433, 1030, 1087, 1239]], "past": [[], [], [291, 578, 836, 893, 1059]], "patatesi": [[], [], [1206]], "patch": [[], [], [574]], "path": [[434, 904], [434, 904], [434, 733, 796, 832, 841, 882, 903, 904, 1095, 1180, 1226, 1227, 1266]], "paths": [[], [], [1227]], "patient": [[905], [], [539, 721, 765, 899, 1155]], "patientive": [[], [1127], []], "patio": [[], [], [760]], "patted": [[], [], [424, 522]], "pattern": [[], [], [341, 560, 838]], "patterns": [[], [], [596]], "patterson": [[], [], [529]], "paul": [[], [], [287]], "peaches": [[], [], [604, 617, 629, 688, 690]], "pear": [[], [], [1130, 1193]], "pedro": [[], [], [1221]], "pen": [[], [], [918, 1046]], "pend": [[], [], [1184, 1236]], "people": [[], [], [222, 252, 452, 543, 634, 706, 864]], "perceiving": [[], [], [437, 438]], "perception": [[435, 436, 437, 438, 820, 906, 1193], [435, 906], [329, 437, 438, 558, 906, 1193]], "perform": [[], [], [255]], "performance": [[], [], [500, 962]], "performed": [[], [], [693, 701, 889, 940]], "performing": [[], [], [795, 962]], "performs": [[], [], [203, 237, 255, 281, 490, 902]], "period": [[], [], [805]], "peripheral": [[907], [], [426, 554, 695, 738, 762, 907, 1034]], "permissive": [[], [], [867]], "pero": [[], [], [231]], "persistent": [[908], [], []], "persisting": [[], [], [986]], "persists": [[], [], [908]], "person": [[334, 502, 534, 834, 909, 910, 947, 983, 1114, 1194], [834, 947, 983], [210, 265, 323, 334, 351, 354, 358, 359, 363, 439, 451, 472, 502, 514, 515, 534, 563, 565, 581, 642, 648, 654, 685, 698, 699, 721, 743, 744, 764, 826, 854, 861, 877, 898, 910, 919, 938, 948, 987, 991, 1030, 1039, 1067, 1068, 1091, 1132, 1133, 1134, 1152, 1165, 1169, 1194, 1267, 1268]], "personal": [[439, 1014, 1018, 1071], [], [334, 502, 534, 555, 910, 1133, 1172]], "personified": [[], [], [602]], "persons": [[], [], [334, 473, 502, 534, 556, 642, 845, 861, 892]], "perspective": [[], [], [893, 969]], "persuaded": [[], [], [797]], "persuading": [[], [], [797]], "pertaining": [[], [], [1164]], "pete": [[], [], [1156]], "peter": [[], [], [219, 499, 606, 1086]], "petivit": [[], [], [1014]], "petja": [[], [], [207]], "phasal": [[911], [], [558, 911]], "phase": [[], [], [733, 796, 903, 911]], "phases": [[], [], [882, 911]], "phenomena": [[], [], [565]], "phenomenon": [[], [], [585, 826]], "phenomime": [[1195], [], [1195]], "phil": [[], [], [383, 760, 1158]], "phone": [[], [], [318, 627, 653]], "phonetic": [[], [], [571]], "phonetically": [[], [], [571]], "phonological": [[], [], [1126, 1210]], "phonologically": [[], [], [1054, 1126]], "phonomime": [[1196], [], [1196]], "photo": [[], [], [452]], "photograph": [[], [], [1024]], "photos": [[], [], [452]], "phrase": [[200, 211, 223, 228, 232, 237, 250, 251, 288, 307, 327, 333, 343, 346, 355, 381, 394, 405, 407, 415, 421, 422, 425, 426, 428, 430, 431, 432, 451, 454, 474, 482, 486, 490, 496, 501, 506, 521, 523, 530, 536, 538, 1086, 1130], [200, 307, 381, 425, 426, 428, 431, 451, 486, 501, 523, 530, 538, 1086], [200, 201, 222, 227, 231, 232, 235, 237, 249, 288, 292, 294, 295, 296, 346, 347, 359, 380, 381, 397, 398, 407, 416, 425, 426, 451, 474, 489, 490, 494, 523, 536, 540, 554, 555, 571, 574, 585, 608, 619, 638, 645, 650, 691, 708, 733, 796, 1007, 1012, 1013, 1014, 1016, 1018, 1019, 1027, 1035, 1041, 1050, 1054, 1066, 1084, 1086, 1087, 1094, 1097, 1098, 1108, 1121, 1130, 1148, 1150, 1153, 1187, 1190, 1191, 1193, 1198, 1202, 1203, 1207, 1220, 1227, 1229, 1233, 1236, 1240, 1243, 1244, 1251, 1255, 1257, 1269, 1273]], "phrases": [[], [], [229, 232, 255, 272, 285, 287, 288, 305, 397, 553, 554, 597, 660, 1006, 1007, 1041, 1099, 1104, 1126, 1162, 1163, 1240, 1277]], "physical": [[440, 912], [], [440, 509, 537, 697, 744, 765, 892, 898, 918, 989]], "physiological": [[], [], [854, 949, 1212]], "pianist": [[], [], [477, 926]], "piano": [[], [], [353, 639, 911, 1007, 1165]], "pick": [[], [], [650]], "picked": [[], [], [290, 618, 704, 1072, 1249]], "picking": [[], [], [958]], "picks": [[], [], [693, 697]], "pie": [[], [], [227, 738]], "piece": [[441, 913], [], [395, 396, 429, 441, 605, 639, 646, 648, 671]], "pieces": [[], [], [893, 969, 1072, 1249]], "pig": [[], [], [1064]], "pigs": [[], [], [1248]], "pile": [[], [], [335]], "piles": [[], [], [335]], "pine": [[], [], [877, 1169]], "piping": [[], [], [304]], "pitha": [[], [], [1199]], "pitjantjatjara": [[], [], [1205]], "place": [[442, 443, 914], [], [336, 536, 581, 633, 696, 762, 805, 882, 930, 1158]], "placed": [[], [], [255]], "placing": [[], [], [730]], "planet": [[], [], [314, 626]], "plant": [[221, 444], [], [574]], "planted": [[], [], [1185, 1275]], "plants": [[], [], [297, 390, 524]], "plate": [[], [], [907, 1116]], "play": [[], [], [581, 696, 911, 1007, 1165]], "played": [[], [], [285, 286, 383, 953]], "player": [[], [], [938]], "players": [[], [], [602]], "playing": [[], [], [255, 286, 353, 472, 639, 911, 1099, 1236, 1240]], "playpen": [[], [], [996]], "plays": [[], [], [494, 552, 564, 683, 711, 899, 944]], "please": [[], [], [319, 610]], "plural": [[1114], [], [235, 354, 555, 557, 579, 642, 864, 890, 1068, 1093, 1099, 1132, 1133, 1134, 1252]], "plus": [[], [], [235, 255, 397]], "pneumonia": [[], [], [1216]], "pocket": [[], [], [1060]], "poetry": [[], [], [1005]], "point": [[938], [], [601, 606, 631, 695, 706, 728, 833, 841, 860, 921, 938, 964, 991]], "polar": [[], [], [684, 1028]], "polarity": [[404, 445, 446, 447, 448, 664, 671, 672, 674, 886, 915, 917, 1197], [671, 672, 886, 917], [239, 291, 325, 363, 369, 402, 445, 446, 447, 498, 648, 651, 671, 672, 689, 886, 915, 917, 925, 976, 1004, 1025, 1096, 1100, 1251, 1271, 1272]], "ponapean": [[], [], [952]], "poonaan": [[], [], [1005]], "poori": [[], [], [1049]], "pop": [[], [681], []], "popped": [[], [], [549, 930]], "portmanteau": [[], [], [1110]], "poset": [[673], [], [655, 656, 673, 707]], "posets": [[], [], [668, 710]], "posh": [[], [], [997]], "position": [[246, 253, 745, 764, 1229], [246, 253, 745, 764], [246, 253, 315, 427, 491, 565, 745, 764, 778, 839, 964, 1017, 1064, 1086, 1149, 1229]], "positioned": [[], [], [1229]], "positions": [[], [], [264, 670]], "positive": [[448, 674, 916, 917], [873, 917], [276, 377, 445, 671, 773, 781, 783, 813, 815, 844, 847, 862, 884, 915, 916, 917, 1003, 1004, 1272]], "positively": [[], [], [739]], "poss": [[], [], [1141, 1142]], "possessed": [[449], [920], []], "possessee": [[], [920], []], "possession": [[211, 212, 355, 356, 450, 464, 467, 918, 989], [212, 356, 450, 452, 464, 467, 918], [212, 356, 414, 450, 451, 452, 464, 465, 467, 744, 861, 900, 918, 919, 920, 1016, 1121, 1148, 1198, 1205, 1216, 1255, 1257, 1269]], "possessive": [[451, 452, 453, 1016, 1121, 1148, 1198, 1205, 1255, 1257, 1269], [451, 452, 918, 1016, 1148, 1257], [212, 356, 397, 406, 451, 452, 919, 920, 1012, 1016, 1110, 1121, 1124, 1141, 1142, 1148, 1198, 1205, 1211, 1255, 1257, 1269]], "possessor": [[454, 919, 1110, 1141], [919], [452, 464, 467, 552, 918, 919, 920, 1016, 1024, 1121, 1141, 1142, 1148, 1194, 1255, 1257, 1269]], "possessum": [[920], [920], [452, 464, 467, 918, 919, 920, 1121, 1148, 1198, 1205, 1255, 1257, 1269]], "possibilities": [[], [], [1083, 1151]], "possibility": [[], [], [684]], "possible": [[], [], [252, 338, 608, 691, 708, 731, 893, 1028, 1262]], "possibly": [[], [], [371, 556, 638, 642, 1131, 1180, 1223]], "posterior": [[921, 1199, 1200], [], [921, 1199]], "postnominal": [[1201], [1201], [585, 1111, 1112, 1201, 1206]], "postposition": [[1202], [], [1017]], "posture": [[], [246, 253, 745, 764], [253, 745, 764, 1149]], "postverbal": [[], [], [1163]], "pot": [[], [], [463]], "potapota": [[], [], [1196]], "potato": [[], [], [1206]], "potential": [[557], [], [557]], "potentially": [[], [], [655]], "pots": [[], [], [1120]], "pr": [[], [], [235]], "pragmatic": [[675, 676], [], [675, 925]], "pragmatically": [[455, 456, 457, 458, 677], [455, 456, 457, 458, 675, 676, 677, 694], [360, 361, 383, 455, 456, 457, 458, 524, 675, 677, 694]], "praised": [[], [], [487, 616, 1240]], "praises": [[], [], [487]], "praising": [[], [], [1240]], "prasamgiccu": [[], [], [1074]], "pravda": [[], [], [1251]], "precede": [[], [], [1031]], "preceded": [[], [], [1012, 1232]], "precedes": [[], [], [1203, 1206, 1207, 1270]], "preceding": [[], [], [304, 728, 921, 1026, 1049]], "precise": [[], [], [427, 484, 546, 891, 1153]], "precisely": [[], [], [569, 628, 675]], "predadj": [[], [], [586, 598]], "predicate": [[231, 233, 243, 246, 261, 270, 272, 273, 284, 298, 300, 310, 317, 319, 320, 332, 349, 377, 385, 386, 437, 459, 460, 461, 462, 469, 471, 477, 500, 511, 518, 519, 520, 532, 541, 545, 551, 678, 1057, 1246], [246, 298, 460, 469, 500, 1246], [231, 232, 235, 239, 243, 246, 255, 261, 270, 272, 284, 298, 300, 306, 317, 319, 328, 332, 349, 377, 385, 386, 437, 459, 460, 461, 462, 469, 471, 477, 494, 500, 519, 528, 529, 532, 541, 545, 551, 555, 558, 574, 576, 586, 598, 612, 619, 692, 712, 758, 773, 817, 831, 839, 844, 883, 901, 911, 926, 976, 1003, 1005, 1009, 1013, 1014, 1018, 1019, 1021, 1022, 1024, 1031, 1035, 1038, 1050, 1054, 1056, 1058, 1067, 1068, 1070, 1071, 1072, 1074, 1079, 1083, 1095, 1110, 1111, 1116, 1118, 1126, 1133, 1135, 1143, 1146, 1147, 1149, 1155, 1167, 1182, 1184, 1187, 1188, 1189, 1190, 1191, 1204, 1205, 1219, 1220, 1221, 1232, 1234, 1235, 1238, 1241, 1242, 1245, 1248, 1265, 1267]], "predicated": [[], [], [346, 464, 529, 539, 548, 599, 696, 705, 1188, 1204, 1232]], "predicates": [[], [], [243, 246, 284, 386, 460, 462, 519, 529, 532, 541, 543, 545, 586, 668, 710, 1021, 1026, 1103, 1106, 1151, 1187, 1191, 1199, 1221]], "predicating": [[], [], [460, 462, 679]], "predication": [[414, 576, 679], [414, 460, 462, 463, 679], [255, 379, 412, 413, 414, 464, 543, 576, 599, 647, 660, 663, 679, 705, 1012, 1038, 1067, 1068, 1070, 1071, 1073, 1074, 1083, 1113, 1124, 1149, 1172, 1182, 1188, 1204, 1216, 1232, 1267, 1268, 1277]], "predicational": [[463, 464, 679, 1048, 1203, 1204], [462, 679], [255, 450, 462, 463, 464, 1203]], "predicationally": [[], [], [379, 450]], "predications": [[], [], [1038, 1126]], "predicative": [[839], [612, 839], [264, 315, 775, 778, 839, 964, 1027, 1035, 1061, 1062, 1079, 1080, 1103, 1106, 1131, 1150, 1180, 1190, 1191, 1220, 1221, 1223, 1233]], "predicativization": [[1205], [], [1205]], "prefer": [[], [], [213, 605]], "preferably": [[], [], [606]], "preferred": [[584], [], []], "prefix": [[], [], [1095, 1184, 1185, 1194, 1199, 1236]], "prenominal": [[585, 1206], [1206], [585, 1111, 1112, 1201, 1206]], "preocesos": [[], [], [1091]], "preparing": [[], [], [619]], "preposed": [[], [], [592, 1075]], "preposition": [[1207], [], [1017]], "presence": [[], [], [1102, 1235, 1249]], "present": [[], [], [563, 821, 1007, 1130, 1165]], "presentational": [[465, 466, 467, 680], [466], [379, 450, 462, 465, 466, 467, 572, 680, 1016, 1121, 1130, 1148, 1193, 1198, 1203, 1205, 1242, 1255, 1257, 1269]], "presentationally": [[], [], [379, 450]], "presented": [[], [], [313, 469, 508, 580, 595, 625, 627, 647, 703, 824, 922, 1090]], "presents": [[], [], [610, 922]], "preservative": [[], [790], []], "president": [[], [], [1209]], "presidential": [[], [], [607]], "press": [[], [], [225, 277, 478, 729, 783, 788, 885, 887, 916, 928]], "pressed": [[], [], [885, 916]], "pressing": [[], [], [788, 887]], "presumably": [[], [], [1015]], "presumed": [[], [], [556, 1268]], "presuppose": [[], [676], []], "presupposed": [[681], [], [353, 604, 628, 630, 632, 639, 646, 676, 681, 813, 862, 1052, 1101]], "presupposes": [[], [], [261, 332, 349, 551, 773, 831, 844, 1003]], "presupposition": [[676], [676], []], "pretence": [[], [469, 922], []], "pretended": [[], [], [469, 922]], "pretense": [[468, 469, 922], [], [469, 922, 926]], "previous": [[], [], [617]], "previously": [[], [], [215, 216, 218, 508, 617, 645, 655]], "primarily": [[], [], [234, 837, 976, 979]], "primary": [[1208], [], [313, 616, 625, 1068, 1070, 1071, 1188, 1208]], "prime": [[], [], [962]], "prior": [[], [], [437, 555, 629, 687, 688, 690, 707]], "prize": [[], [], [1194]], "pro": [[], [], [1101]], "probably": [[], [], [1021, 1126, 1148]], "problem": [[], [], [931]], "problems": [[], [], [974]], "process": [[], [], [519, 571, 574, 583]], "processes": [[], [], [319, 583]], "product": [[221], [], []], "productivity": [[], [], [1009]], "professor": [[], [], [811, 1182]], "profile": [[750, 870, 943], [], []], "prohibitive": [[470, 682], [], [354, 402, 470, 642, 682, 700]], "projected": [[], [], [836]], "promoted": [[], [], [613, 631]], "pronominal": [[471], [], [471, 1030]], "pronoun": [[218, 266, 278, 293, 295, 303, 323, 334, 336, 342, 358, 361, 362, 370, 373, 439, 453, 456, 458, 472, 485, 502, 504, 514, 515, 534, 543, 1145, 1171, 1183, 1209, 1222, 1263], [456, 458, 504, 1183, 1209], [218, 266, 278, 293, 295, 303, 323, 334, 336, 342, 358, 361, 362, 363, 370, 373, 382, 439, 456, 458, 471, 472, 485, 488, 502, 504, 514, 515, 534, 543, 555, 564, 565, 611, 614, 620, 633, 644, 654, 684, 698, 699, 1008, 1075, 1086, 1111, 1124, 1152, 1153, 1172, 1209, 1220, 1222, 1243]], "pronouns": [[], [], [218, 334, 543, 581, 910, 1133]], "proof": [[], [], [974]], "prop": [[683], [], []], "propensity": [[351, 846], [], [351]], "proper": [[352, 443, 473], [473], [473, 565]], "properties": [[], [598], [598, 837, 923, 1086]], "property": [[440, 474, 912, 923], [460, 923], [200, 201, 265, 309, 366, 386, 393, 398, 414, 440, 460, 474, 527, 562, 564, 571, 577, 586, 603, 612, 628, 647, 663, 679, 701, 797, 810, 817, 852, 883, 889, 901, 923, 938, 940, 1013, 1014, 1126, 1146, 1149, 1164, 1195, 1196, 1212, 1276]], "proportion": [[], [], [475]], "proportional": [[475, 924], [], [475, 484]], "proposes": [[], [], [610]], "proposition": [[604, 681, 925], [], [225, 277, 353, 368, 377, 378, 445, 469, 478, 604, 617, 628, 632, 639, 646, 648, 671, 675, 676, 681, 710, 729, 773, 783, 813, 815, 821, 831, 844, 862, 877, 885, 887, 916, 922, 925, 926, 928, 1003, 1004, 1052, 1062, 1101]], "propositional": [[476, 477, 660, 926, 927], [660, 926], [368, 382, 477, 558, 567, 604, 605, 618, 628, 642, 648, 651, 660, 663, 671, 679, 685, 700, 862, 879, 922, 926, 927, 1024, 1058, 1116, 1118, 1133, 1146, 1147, 1152, 1219, 1235, 1238]], "propositions": [[], [], [264, 378, 604, 615, 623, 656, 670, 676, 710, 783, 811, 877, 1131, 1223]], "proprietive": [[], [], [1205]], "props": [[], [], [683, 696, 702]], "prorrogar": [[], [], [1091]], "prosodic": [[], [], [1101]], "prosodically": [[], [], [1086]], "prosody": [[1210], [], [1210]], "prostudilsja": [[], [], [997]], "protasis": [[478, 928], [], [225, 275, 277, 278, 478, 614, 729, 748, 780, 783, 928, 1028, 1228, 1262]], "prototype": [[], [], [715, 952]], "prototypical": [[479], [479], [200, 237, 240, 255, 308, 398, 407, 410, 413, 479, 539, 549, 576, 691, 711, 738, 886, 899, 1012, 1086, 1108, 1124, 1149, 1232, 1244, 1267]], "prototypically": [[], [], [207, 279, 642, 918]], "provide": [[], [], [370, 553]], "provided": [[], [], [543, 638, 708]], "provides": [[], [], [663]], "providing": [[], [], [573]], "proximal": [[929], [929], []], "prs": [[], [], [1149]], "ps": [[], [], [1087]], "pseudo": [[1211], [], [395, 1211]], "pseudocleft": [[], [], [1052]], "psychomime": [[1212], [], [1212]], "publications": [[], [], [597]], "pulpit": [[], [], [574]], "punch": [[], [], [884]], "punctual": [[930], [], [734, 930]], "purpose": [[480, 931], [], [558, 731]], "pursuit": [[481, 932], [], [481, 858, 932]], "purukupa": [[], [], [1277]], "purukuparli": [[], [], [1277]], "put": [[], [], [304, 592, 1060]], "putting": [[], [226, 730], []], "puuzeiyast": [[], [], [1208, 1230, 1231]], "q": [[], [], [903, 1100, 1239]], "qasaqa": [[], [], [1150]], "qualifying": [[], [], [603]], "qualitative": [[933], [], []], "quality": [[], [923], [547]], "quantifier": [[306, 475, 482, 483, 484, 803, 924], [483], [306, 475]], "quantifiers": [[], [], [484, 693]], "quantifies": [[], [], [1262]], "quantitative": [[934], [], []], "quantity": [[935], [], [214, 396, 484, 581, 1079]], "quarrel": [[], [], [372]], "quarreling": [[], [], [372]], "que": [[], [], [1221]], "quechua": [[], [], [1143]], "question": [[213, 363, 364, 404, 446, 448, 485, 605, 648, 649, 664, 671, 674, 684, 1089, 1213], [364, 446, 605, 649, 651, 671], [213, 292, 360, 363, 364, 378, 393, 446, 485, 498, 508, 605, 630, 648, 649, 651, 672, 684, 689, 836, 1004, 1025, 1100, 1101, 1229, 1251, 1271, 1272]], "questioned": [[], [], [675]], "questioner": [[], [], [684]], "questionnaire": [[], [], [757]], "questions": [[], [], [363, 369, 651, 1004]], "qui": [[], [], [1242]], "quickly": [[], [], [272]], "quit": [[], [], [613, 631]], "quite": [[], [], [272, 907, 1015]], "quitting": [[], [], [613, 631]], "quotative": [[1214], [], [1090, 1214]], "r": [[486], [486, 936], [308, 828, 1046, 1064, 1075, 1129, 1136, 1138, 1142, 1163, 1195, 1203, 1208, 1231, 1255, 1259]], "ra": [[], [], [1046]], "rafael": [[], [], [385, 867]], "rain": [[], [], [276, 781]], "raining": [[], [], [276, 781, 1002]], "raise": [[], [], [1241]], "ram": [[], [], [1075, 1214]], "ran": [[], [], [599, 832, 841, 903, 944, 1095, 1199]], "randy": [[], [], [308, 1088, 1136, 1138, 1190]], "range": [[], [], [275, 558, 713, 780, 945, 1153, 1173]], "ranked": [[], [], [945]], "ranking": [[], [], [240, 255, 410, 556, 565, 594]], "ranks": [[], [], [555]], "rare": [[], [], [474, 1015, 1062, 1143, 1222, 1260]], "rarely": [[], [], [683]], "rarer": [[], [], [890]], "rather": [[], [], [370, 471, 473, 608, 629, 690, 1060, 1064, 1112, 1243]], "ravens": [[], [], [546]], "raw": [[], [], [298, 901]], "rdngul": [[], [], [879]], "re": [[], [], [646, 821]], "reached": [[], [], [499, 903]], "reaching": [[], [], [977, 1083]], "reaction": [[], [], [628]], "read": [[], [], [425, 523, 1191]], "reading": [[], [], [370]], "ready": [[], [], [676]], "real": [[], [], [303, 620, 638, 698, 699]], "reality": [[], [], [469, 880, 922]], "realization": [[], [], [798]], "really": [[], [], [231, 646, 655, 673, 707]], "reasonable": [[], [], [1009]], "receives": [[], [], [936]], "recently": [[], [], [643]], "reception": [[], [], [434, 904, 1266]], "recipient": [[936, 1142], [], [227, 308, 936, 1141, 1142]], "reciprocal": [[487, 937, 1042, 1157, 1215], [], [487, 1042, 1099, 1156, 1157, 1184, 1236, 1240]], "recognitional": [[], [695], [695]], "recording": [[], [], [437]], "recoverability": [[], [564], []], "recruit": [[], [1216], [1012, 1083, 1232]], "recruited": [[], [], [1015, 1143, 1211]], "recruiting": [[], [1216], [464, 1042, 1149, 1157, 1184, 1268, 1277]], "recruitment": [[1216], [1216], [1004, 1140]], "recruits": [[], [], [1012, 1038, 1062, 1070, 1071, 1074, 1131, 1140, 1148, 1149, 1154, 1156, 1180, 1203, 1216, 1220, 1223, 1232, 1268]], "recurrence": [[], [], [488]], "recurs": [[], [], [616]], "red": [[], [], [216, 258, 500, 574, 704, 709, 1066, 1093, 1130, 1134, 1146, 1186, 1252, 1270]], "reduced": [[], [], [571, 574, 1087, 1173, 1220, 1243]], "reduplicated": [[], [], [1126]], "reduplication": [[], [], [573, 1126]], "refer": [[], [], [229, 262, 288, 473, 502, 540, 569, 583, 638, 693, 726, 813, 1164]], "reference": [[488, 577, 685, 797, 852, 938, 985, 1060, 1091, 1217, 1248], [488, 685], [229, 235, 334, 340, 342, 359, 382, 437, 439, 474, 479, 490, 502, 534, 606, 619, 623, 631, 634, 650, 660, 685, 692, 728, 797, 833, 836, 841, 852, 867, 889, 921, 938, 940, 964, 1005, 1012, 1059, 1060, 1091, 1124, 1152, 1164, 1232, 1248, 1250]], "referent": [[489, 601, 611, 614, 620, 633, 634, 643, 644, 645, 654, 667, 677, 684, 685, 686, 694, 695, 698, 699], [397, 654, 667, 677, 685, 694], [215, 218, 219, 229, 235, 265, 266, 278, 283, 292, 293, 303, 335, 336, 360, 361, 362, 370, 373, 380, 381, 392, 395, 396, 397, 406, 409, 424, 425, 429, 441, 451, 452, 455, 456, 457, 458, 460, 462, 479, 485, 488, 489, 492, 493, 503, 504, 513, 514, 515, 522, 523, 540, 555, 577, 599, 600, 601, 608, 611, 614, 616, 619, 620, 633, 634, 638, 643, 644, 645, 650, 654, 663, 667, 677, 679, 680, 684, 685, 692, 694, 695, 697, 698, 699, 704, 705, 706, 708, 709, 778, 864, 890, 910, 964, 1024, 1050, 1058, 1066, 1098, 1110, 1116, 1118, 1130, 1132, 1133, 1134, 1146, 1147, 1152, 1153, 1164, 1169, 1193, 1198, 1219, 1235, 1238, 1273]], "referentiality": [[], [565], []], "referents": [[], [], [218, 255, 264, 287, 292, 293, 315, 344, 360, 361, 424, 522, 527, 543, 567, 608, 626, 645, 679, 691, 694, 702, 704, 709, 891]], "referred": [[], [], [215, 216, 218, 228, 262, 586, 602, 677, 683, 694, 696, 705, 813, 1012, 1124, 1164, 1169, 1194, 1239]], "referring": [[421, 474, 490, 496, 1130], [], [216, 229, 232, 235, 255, 267, 281, 285, 287, 292, 294, 295, 305, 323, 334, 358, 359, 380, 397, 407, 416, 474, 479, 489, 490, 494, 502, 534, 536, 553, 555, 557, 559, 569, 577, 586, 590, 592, 597, 608, 616, 619, 634, 638, 645, 650, 685, 691, 708, 1012, 1050, 1066, 1084, 1086, 1087, 1098, 1126, 1130, 1132, 1153, 1193, 1198, 1202, 1207, 1273, 1277]], "refers": [[], [], [216, 232, 235, 262, 281, 323, 358, 359, 439, 472, 473, 490, 536, 540, 555, 564, 600, 1050, 1129, 1132, 1133, 1209, 1222, 1237]], "reflexive": [[491, 939, 1153, 1218], [], [491, 1099, 1153, 1156, 1184, 1236, 1240]], "reflexives": [[], [], [1153]], "refrigerant": [[], [], [304]], "regard": [[], [], [938]], "regarding": [[], [], [651]], "rei": [[], [], [1061]], "reject": [[], [], [886]], "rejected": [[], [], [629, 688, 690, 886]], "rejecting": [[687], [], []], "rejects": [[], [], [617, 629, 687, 688, 690]], "related": [[], [], [606, 693, 821, 863, 1053, 1054, 1223, 1250]], "relation": [[744, 775, 777, 780, 781, 783, 788, 811, 814, 818, 833, 838, 861, 865, 900, 934, 962], [621, 744, 775, 777, 780, 781, 783, 833, 838, 861, 898, 900, 918], [204, 212, 263, 275, 276, 277, 279, 341, 379, 380, 381, 450, 451, 452, 466, 467, 540, 590, 599, 673, 715, 728, 729, 731, 744, 748, 775, 780, 781, 783, 784, 788, 811, 833, 838, 861, 873, 884, 898, 900, 918, 919, 920, 921, 928, 931, 952, 953, 962, 972, 974, 997, 1022, 1024, 1028, 1056, 1058, 1062, 1063, 1072, 1083, 1091, 1110, 1116, 1118, 1133, 1141, 1146, 1147, 1152, 1211, 1219, 1228, 1234, 1235, 1238, 1253]], "relational": [[940, 1219], [], [713, 923, 965, 1219]], "relationality": [[941], [], []], "relations": [[], [], [356, 631, 729, 748, 861, 918, 928]], "relationship": [[], [], [529, 656, 1126, 1147]], "relationships": [[], [], [560, 589]], "relative": [[217, 338, 492, 493, 494, 495, 1220, 1221, 1222, 1223], [492], [216, 217, 255, 297, 338, 492, 493, 494, 552, 555, 562, 564, 778, 789, 832, 904, 938, 958, 1015, 1053, 1063, 1064, 1075, 1080, 1084, 1111, 1112, 1119, 1143, 1174, 1189, 1201, 1206, 1209, 1220, 1221, 1222, 1223, 1224, 1242, 1265, 1270]], "relatively": [[], [], [529, 812, 908]], "relativize": [[], [], [552]], "relativized": [[496], [], []], "relativizer": [[1224], [], [1063, 1220, 1224]], "relevant": [[], [], [207, 279, 305, 408, 475, 527, 599, 735, 824, 862, 945, 977, 1151, 1276]], "remainder": [[], [], [1052]], "remained": [[], [], [378]], "remains": [[], [], [1009, 1203]], "remembers": [[], [], [695]], "removal": [[497, 942], [942], [497, 942, 981]], "rendille": [[], [], [1117]], "reng": [[], [], [1064]], "repair": [[], [], [925]], "repairing": [[], [], [646]], "repeater": [[1225], [], [1237]], "repeats": [[], [], [1100]], "replacement": [[], [], [687, 688]], "replaces": [[], [], [688]], "replacing": [[688], [], [629, 690]], "report": [[1090, 1137], [], [1090, 1137, 1214]], "reported": [[], [], [377, 488, 602, 627, 683, 836, 862, 1137]], "reporting": [[], [], [607]], "reports": [[], [], [1214]], "represent": [[], [], [556, 589, 1008, 1153, 1250]], "representation": [[], [], [588]], "representative": [[], [408], []], "represented": [[], [], [589, 749]], "representing": [[], [], [207, 266, 279, 305, 589, 611, 654]], "represents": [[], [], [560, 588, 616, 650, 880, 1041, 1208]], "repulsive": [[], [], [945]], "request": [[], [], [466, 962]], "requested": [[], [], [648, 671]], "requests": [[], [], [642, 651]], "required": [[], [], [370, 612]], "requires": [[], [], [606, 613, 638, 700, 883]], "respect": [[], [], [237, 275, 325, 377, 381, 451, 488, 564, 597, 600, 700, 728, 731, 780, 862, 880, 884, 910, 921, 974, 979, 1186]], "respectively": [[], [], [379, 450, 927, 944, 1005, 1041, 1163, 1187, 1236, 1240]], "respondent": [[], [], [1272]], "response": [[364, 404, 447, 448, 498, 649, 664, 672, 674, 689, 1197], [364, 649], [378, 447, 630, 653, 672, 700, 1025, 1100, 1271, 1272]], "responses": [[], [], [447, 498, 672, 689, 1101]], "respose": [[], [], [610]], "rest": [[], [], [628, 1086]], "restricted": [[], [], [1222]], "restricting": [[690], [], []], "restrictive": [[691], [], [576, 608, 690]], "restrictively": [[], [], [691]], "restricts": [[], [], [690, 691, 1265]], "result": [[499, 943], [], [499, 500, 675, 735, 905, 931, 977, 1227]], "resultative": [[500], [500], [500, 519, 576]], "resulting": [[], [], [721, 765]], "results": [[], [], [500]], "retained": [[], [], [564]], "retention": [[1209], [1209], [564, 1111, 1209]], "reverse": [[], [], [1203]], "reversed": [[], [], [1203]], "revised": [[], [], [558]], "ri": [[], [], [1208, 1231]], "rice": [[], [], [1154]], "rich": [[], [], [1232]], "riddle": [[], [], [712]], "ride": [[], [], [305]], "right": [[], [], [1025, 1028]], "rights": [[], [], [1012]], "rimba": [[], [], [1071]], "ring": [[], [], [1060]], "ringing": [[], [], [318, 627, 653, 675]], "ringo": [[], [], [287]], "ripe": [[], [], [209]], "ripeness": [[], [], [209]], "rise": [[], [], [1158]], "rl": [[], [], [1071]], "rmh": [[], [], [529]], "ro": [[], [], [228]], "roadrunner": [[], [], [1189]], "roast": [[], [], [1064]], "roasted": [[], [], [1064]], "robins": [[], [], [279, 715, 1038]], "rock": [[], [], [849, 856, 903]], "roj": [[], [], [1134]], "rojo": [[], [], [1270]], "rojos": [[], [], [1066, 1093, 1134, 1252]], "role": [[586, 711, 727, 782, 899, 902, 944, 948, 955, 956, 970, 1099, 1184, 1236, 1240], [711, 899, 919, 920, 936, 944, 948, 981], [228, 240, 308, 311, 334, 371, 410, 439, 472, 494, 502, 536, 539, 552, 564, 569, 581, 584, 586, 598, 683, 696, 711, 720, 727, 739, 757, 758, 760, 761, 772, 782, 809, 835, 855, 856, 866, 881, 899, 902, 905, 910, 936, 944, 948, 970, 981, 1007, 1008, 1010, 1011, 1046, 1053, 1088, 1104, 1105, 1110, 1127, 1136, 1138, 1141, 1142, 1163, 1230, 1231, 1236, 1265]], "roles": [[], [], [255, 590, 720, 739, 740, 758, 772, 782, 835, 856, 866, 905, 936, 948, 981, 992, 1000, 1006, 1007, 1008, 1010, 1011, 1088, 1097, 1099, 1104, 1127, 1138, 1162, 1163, 1165, 1208, 1231, 1240, 1260]], "ron": [[], [], [1068, 1083]], "room": [[], [], [239, 252, 387, 466, 543, 869, 884, 1226, 1227]], "root": [[], [], [578, 579]], "rotten": [[], [], [646]], "roughly": [[], [], [576]], "round": [[], [], [509]], "rqa": [[], [], [1205]], "rude": [[], [], [351]], "run": [[], [], [284, 341, 838, 940, 1199]], "runner": [[], [], [927]], "running": [[], [], [266, 284, 609, 611, 713, 927, 944, 1204]], "runny": [[], [], [1113]], "runs": [[], [], [266, 611, 1071, 1204]], "russian": [[], [], [235, 997, 1018, 1044, 1095, 1148, 1169, 1251]], "s": [[501, 944], [501, 598, 944], [219, 227, 231, 261, 263, 266, 281, 313, 318, 332, 335, 346, 349, 354, 362, 363, 370, 371, 373, 377, 382, 392, 397, 406, 412, 447, 451, 452, 464, 465, 467, 471, 488, 513, 540, 545, 551, 552, 558, 560, 563, 569, 579, 589, 591, 600, 601, 606, 611, 625, 627, 628, 631, 642, 643, 644, 646, 648, 653, 654, 672, 679, 680, 695, 696, 738, 741, 743, 744, 768, 773, 775, 797, 808, 811, 813, 831, 836, 844, 852, 862, 877, 879, 898, 925, 927, 932, 938, 944, 1002, 1003, 1004, 1006, 1007, 1008, 1010, 1011, 1012, 1016, 1024, 1041, 1044, 1064, 1068, 1070, 1071, 1090, 1104, 1110, 1122, 1127, 1137, 1141, 1147, 1152, 1162, 1165, 1188, 1194, 1203, 1210, 1238, 1239, 1242, 1260, 1271]], "sa": [[], [], [1099]], "sadly": [[], [], [1014]], "sadom": [[], [], [1115, 1233]], "said": [[], [], [217, 382, 545, 998, 1090, 1137, 1152, 1214]], "salad": [[], [], [322, 619]], "salience": [[], [706], [240, 255, 410, 433, 556, 706, 738, 864, 1030, 1087]], "salient": [[], [706], [222, 227, 240, 249, 308, 371, 418, 425, 426, 523, 539, 554, 607, 619, 653, 670, 692, 706, 757, 1002]], "sally": [[], [], [288, 377, 412, 451, 452, 491, 797, 852, 862, 898]], "salmon": [[], [], [240, 410]], "sam": [[], [], [387, 413, 869, 1226, 1227, 1236, 1245, 1267]], "same": [[692], [692], [216, 229, 235, 298, 314, 347, 354, 386, 437, 461, 488, 555, 620, 626, 642, 704, 709, 839, 1005, 1006, 1007, 1009, 1010, 1026, 1028, 1038, 1046, 1053, 1059, 1060, 1066, 1088, 1091, 1094, 1104, 1132, 1138, 1151, 1153, 1154, 1162, 1163, 1165, 1174, 1188, 1191, 1203, 1208, 1216, 1220, 1223, 1228, 1231, 1248, 1250, 1262]], "san": [[], [], [262, 385, 867]], "sanctioned": [[], [], [898]], "sand": [[], [], [335]], "sandbags": [[], [], [255]], "sandhill": [[], [], [236]], "sandra": [[], [], [290, 364, 618, 649, 760]], "sandy": [[], [], [545, 739, 970, 998, 1090, 1137]], "sang": [[], [], [953, 1013, 1021]], "sanna": [[], [], [1191]], "santa": [[], [], [893, 969]], "sanuma": [[], [], [1188]], "sarah": [[], [], [460]], "sargan": [[], [], [1013]], "sat": [[], [], [465, 680]], "satellite": [[1226, 1227], [], [1095, 1227]], "saturday": [[], [], [300, 798]], "saves": [[], [], [304]], "saw": [[], [], [326, 461, 491, 826, 968, 1041, 1075, 1240]], "say": [[], [], [1131, 1223]], "saying": [[], [], [998]], "sbj": [[], [], [586, 598]], "scalar": [[945, 1228], [], [275, 378, 628, 780, 794, 923, 945, 1028, 1078, 1081, 1228, 1262]], "scale": [[553, 839, 946], [839], [224, 264, 265, 271, 309, 315, 366, 393, 527, 553, 775, 778, 794, 839, 923, 938, 945, 964, 986, 1027, 1035, 1061, 1062, 1079, 1080, 1103, 1106, 1131, 1150, 1180, 1190, 1191, 1220, 1221, 1223, 1233]], "scene": [[], [], [609, 832, 841]], "schematically": [[], [], [281]], "school": [[], [], [997, 1049]], "scope": [[], [], [571, 620, 684]], "scratch": [[], [], [289]], "scratched": [[], [], [756, 809, 855]], "scratching": [[], [], [289, 793]], "screwdriver": [[], [], [883]], "scrub": [[], [], [497]], "scrubbing": [[], [], [497, 942]], "se": [[], [], [1075]], "search": [[], [], [481, 932, 1064]], "searching": [[], [], [481, 932]], "second": [[502, 947, 1229], [], [354, 359, 425, 427, 488, 502, 565, 617, 642, 655, 656, 668, 673, 707, 749, 775, 781, 858, 910, 972, 974, 997, 1030, 1039, 1052, 1060, 1062, 1064, 1070, 1075, 1106, 1190, 1229]], "secondary": [[1230], [298, 500], [663]], "section": [[1, 2, 3, 4, 5, 6, 7, 8, 9, 11, 12, 13, 14, 15, 16, 17, 18, 19, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 59, 60, 61, 62, 63, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74, 75, 77, 78, 79, 80, 81, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 96, 97, 98, 99, 100, 101, 102, 103, 104, 106, 107, 108, 109, 110, 111, 112, 113, 115, 116, 117, 118, 119, 120, 121, 122, 123, 124, 126, 127, 128, 129, 130, 131, 132, 133, 134, 135, 136, 137, 138, 139, 141, 142, 143, 144, 145, 146, 147, 148, 149, 150, 151, 152, 153, 155, 156, 157, 158, 159, 160, 161, 163, 164, 165, 166, 167, 168, 169, 170, 171, 172, 173, 174, 175, 177, 178, 179, 180, 181, 182, 183, 184, 185, 186, 188, 189, 190, 192, 193, 194, 195], [], [200, 204, 205, 207, 208, 209, 210, 212, 213, 214, 215, 217, 218, 219, 222, 224, 225, 226, 228, 229, 231, 234, 235, 236, 238, 239, 241, 242, 243, 244, 246, 247, 252, 253, 256, 257, 258, 259, 261, 262, 263, 264, 265, 266, 268, 270, 271, 275, 276, 277, 278, 279, 281, 282, 283, 284, 285, 286, 288, 289, 290, 291, 292, 293, 296, 297, 298, 300, 301, 302, 303, 304, 305, 306, 309, 311, 312, 314, 315, 317, 319, 322, 323, 324, 325, 326, 328, 330, 332, 334, 335, 336, 338, 339, 340, 341, 342, 344, 346, 347, 349, 351, 357, 358, 359, 360, 361, 362, 363, 364, 365, 366, 367, 372, 373, 374, 377, 378, 379, 380, 381, 382, 383, 385, 386, 388, 389, 392, 393, 395, 396, 397, 398, 407, 408, 409, 410, 412, 413, 414, 417, 418, 424, 427, 429, 437, 438, 439, 440, 441, 445, 446, 447, 450, 451, 452, 455, 456, 457, 458, 459, 461, 463, 464, 467, 469, 470, 471, 472, 473, 474, 475, 477, 478, 479, 481, 484, 485, 487, 488, 489, 491, 492, 494, 497, 499, 500, 502, 503, 504, 505, 508, 509, 513, 514, 515, 516, 522, 524, 527, 528, 529, 532, 534, 537, 540, 541, 543, 545, 546, 547, 549, 551, 552, 553, 555, 556, 558, 559, 560, 561, 562, 564, 565, 566, 568, 569, 570, 572, 573, 575, 576, 577, 578, 579, 580, 581, 582, 583, 584, 585, 586, 587, 588, 589, 590, 591, 592, 593, 594, 595, 596, 597, 598, 599, 601, 602, 603, 604, 605, 606, 607, 608, 609, 610, 611, 612, 613, 614, 615, 616, 617, 618, 619, 620, 623, 626, 629, 630, 631, 632, 633, 638, 643, 644, 645, 646, 648, 649, 650, 653, 654, 655, 656, 660, 667, 668, 670, 671, 672, 673, 676, 677, 681, 682, 683, 684, 687, 688, 690, 691, 692, 694, 695, 696, 697, 698, 699, 700, 702, 704, 706, 707, 708, 709, 710, 711, 712, 713, 715, 720, 721, 726, 727, 728, 729, 730, 731, 733, 734, 735, 738, 739, 740, 741, 742, 743, 744, 745, 748, 757, 758, 760, 762, 764, 768, 771, 772, 773, 775, 780, 781, 782, 783, 784, 785, 788, 789, 793, 794, 796, 797, 798, 801, 802, 805, 808, 810, 811, 813, 815, 817, 821, 824, 828, 831, 835, 836, 837, 838, 839, 844, 845, 847, 849, 852, 854, 858, 860, 861, 862, 863, 864, 866, 867, 872, 873, 880, 881, 883, 884, 885, 886, 887, 889, 890, 891, 893, 898, 899, 900, 901, 903, 905, 906, 907, 908, 910, 911, 915, 916, 917, 918, 921, 922, 926, 927, 928, 929, 930, 931, 932, 936, 938, 940, 942, 945, 948, 949, 952, 953, 958, 962, 964, 965, 969, 970, 972, 974, 976, 977, 981, 986, 987, 989, 991, 992, 993, 996, 997, 998, 1000, 1003, 1005, 1006, 1007, 1008, 1009, 1010, 1011, 1012, 1013, 1014, 1015, 1016, 1017, 1018, 1019, 1021, 1022, 1024, 1025, 1027, 1028, 1030, 1031, 1035, 1037, 1039, 1041, 1042, 1043, 1044, 1046, 1049, 1050, 1052, 1053, 1054, 1056, 1058, 1059, 1060, 1061, 1062, 1063, 1065, 1066, 1068, 1070, 1071, 1072, 1074, 1075, 1078, 1079, 1080, 1081, 1084, 1086, 1087, 1088, 1091, 1093, 1094, 1095, 1096, 1097, 1098, 1099, 1100, 1101, 1102, 1103, 1104, 1105, 1106, 1108, 1110, 1111, 1112, 1113, 1115, 1117, 1118, 1119, 1120, 1121, 1122, 1124, 1126, 1127, 1130, 1131, 1132, 1134, 1135, 1136, 1137, 1138, 1140, 1141, 1142, 1143, 1146, 1147, 1148, 1149, 1150, 1152, 1153, 1154, 1155, 1156, 1157, 1158, 1162, 1163, 1164, 1165, 1167, 1169, 1172, 1173, 1174, 1179, 1180, 1182, 1184, 1185, 1186, 1187, 1188, 1189, 1190, 1191, 1193, 1194, 1195, 1196, 1198, 1199, 1201, 1202, 1203, 1204, 1205, 1206, 1207, 1208, 1209, 1210, 1211, 1212, 1214, 1216, 1219, 1220, 1221, 1222, 1223, 1224, 1225, 1227, 1228, 1229, 1230, 1231, 1232, 1233, 1234, 1235, 1236, 1237, 1238, 1239, 1240, 1241, 1242, 1243, 1244, 1245, 1247, 1248, 1249, 1250, 1251, 1252, 1253, 1255, 1257, 1259, 1260, 1262, 1265, 1266, 1268, 1269, 1271, 1272, 1273, 1275, 1276, 1277]], "sections": [[], [], [201, 203, 216, 227, 232, 237, 240, 249, 254, 255, 267, 272, 274, 294, 295, 304, 308, 313, 318, 321, 329, 353, 354, 356, 360, 361, 368, 369, 370, 371, 387, 400, 402, 406, 416, 425, 426, 433, 434, 460, 462, 465, 466, 490, 493, 517, 519, 523, 533, 535, 539, 548, 557, 563, 567, 571, 574, 600, 625, 627, 628, 634, 639, 642, 647, 651, 663, 675, 679, 680, 685, 693, 701, 703, 705, 734, 748, 749, 756, 761, 765, 778, 795, 807, 809, 812, 816, 826, 827, 832, 833, 841, 855, 856, 869, 877, 879, 882, 892, 902, 904, 919, 920, 923, 925, 944, 966, 968, 979, 1002, 1026, 1038, 1064, 1073, 1083, 1090, 1116, 1129, 1133, 1151, 1226, 1267, 1270]], "secundative": [[1231], [1231], [1208, 1230]], "see": [[], [], [326, 330, 360, 361, 413, 440, 479, 488, 891, 1096, 1100, 1193, 1208, 1231]], "seeds": [[], [], [279, 715, 1038]], "seeing": [[], [], [330, 461, 1240]], "seeks": [[], [], [570]], "seen": [[], [], [362, 382, 644, 1152]], "segment": [[], [], [552]], "select": [[], [], [546]], "selected": [[], [], [266, 611]], "selecting": [[693], [], [577, 583, 610, 693]], "selects": [[], [], [283, 335, 344, 392, 441, 513]], "sem": [[], [790], []], "semantic": [[587, 588, 589, 948, 1232], [872, 1232], [216, 264, 272, 281, 315, 329, 395, 413, 479, 494, 528, 529, 552, 555, 559, 560, 564, 581, 582, 583, 587, 588, 589, 610, 647, 648, 670, 673, 713, 720, 726, 729, 731, 738, 739, 748, 758, 772, 783, 788, 797, 811, 835, 837, 845, 849, 852, 856, 866, 873, 883, 884, 890, 892, 905, 910, 918, 923, 927, 928, 931, 936, 952, 953, 962, 972, 974, 976, 981, 986, 997, 1012, 1022, 1050, 1056, 1113, 1116, 1124, 1164, 1219, 1226, 1232, 1245, 1265]], "semantically": [[503, 504, 694], [455, 456, 503, 504, 667, 694], [240, 554, 603, 694, 948, 1026, 1054]], "semantics": [[], [], [255, 734, 1124]], "semi": [[695], [695], [215, 292, 293, 553, 600, 650]], "send": [[], [], [537, 989]], "sending": [[], [], [537, 989]], "sensation": [[505, 949], [949], [329, 505, 826, 949, 1212]], "sense": [[], [], [462, 559, 562, 574, 945, 958]], "sensory": [[], [], [906]], "sent": [[], [], [936, 981, 1163, 1209]], "sentence": [[274], [], [204, 274, 290, 297, 378, 383, 390, 424, 461, 488, 522, 575, 599, 616, 617, 618, 619, 629, 655, 675, 676, 687, 688, 690, 692, 706, 893, 945, 969, 1037, 1038, 1052, 1063, 1068, 1070, 1071, 1083, 1094, 1096, 1131, 1157, 1180, 1188, 1223, 1241, 1249, 1253]], "sentences": [[], [], [465, 592, 680]], "separate": [[], [], [229, 529, 1068, 1070, 1071, 1117, 1151, 1188]], "separated": [[], [], [441, 1086]], "separately": [[], [], [927]], "separative": [[1233], [], [1180, 1233]], "sequence": [[], [], [341, 613, 838, 1253]], "sequential": [[], [921], [728, 784, 921]], "seraya": [[], [], [325]], "serial": [[1064, 1129, 1151, 1234], [1129, 1234], [903, 1059, 1064, 1129, 1151, 1234]], "serve": [[], [], [919, 920]], "serves": [[], [], [304, 488, 606, 631, 655, 707, 728, 731, 841, 921, 931, 944, 964, 1186]], "sesele": [[], [], [1172]], "set": [[506, 507, 508, 950], [507], [247, 275, 306, 344, 371, 427, 475, 484, 508, 527, 540, 543, 546, 553, 588, 598, 608, 656, 673, 676, 691, 693, 738, 780, 824, 891, 976, 1028, 1050, 1084, 1115, 1228, 1250, 1262]], "sets": [[], [], [668, 1250]], "setting": [[696], [], [609]], "settings": [[], [], [696, 702]], "several": [[], [], [338, 546, 1151]], "sew": [[], [], [646]], "sex": [[], [], [339, 837]], "sg": [[], [], [1011]], "shalax": [[], [], [1209]], "shape": [[509, 951], [], [335, 440, 509, 872, 923]], "shared": [[], [883], [469, 494, 564, 590, 604, 615, 681, 789, 883, 922, 927, 1075, 1119, 1143, 1187, 1209, 1222, 1265]], "shares": [[], [], [898]], "sharing": [[883], [], []], "shattered": [[], [], [835]], "shattering": [[], [], [835]], "shave": [[], [], [244, 372, 743]], "shaved": [[], [], [1236]], "shaving": [[], [], [372, 1236]], "she": [[], [], [218, 239, 297, 388, 390, 452, 472, 524, 545, 548, 549, 563, 586, 598, 638, 708, 712, 811, 847, 879, 884, 938, 953, 1008, 1035, 1052, 1056, 1072, 1074, 1079, 1120, 1137, 1179, 1182, 1184, 1209, 1236, 1239, 1248, 1249]], "shelley": [[], [], [328]], "shelter": [[], [], [898, 1202]], "shepherd": [[], [], [227, 738]], "shifted": [[], [], [571]], "shinda": [[], [], [1106]], "shita": [[], [], [1031]], "shkolu": [[], [], [997]], "shoot": [[], [], [1099]], "shop": [[], [], [925]], "short": [[], [], [224, 691, 695, 938]], "shorter": [[], [], [309, 677, 694, 938]], "shoulders": [[], [], [1129]], "shovel": [[], [], [1116]], "show": [[], [], [537, 989, 1052]], "showed": [[], [], [1208, 1230, 1231]], "showing": [[], [], [537, 989]], "shrimp": [[], [], [945]], "si": [[], [], [222, 864, 1272]], "sick": [[], [], [532, 965, 1010, 1127]], "side": [[], [], [977]], "sigin": [[], [], [1269]], "sign": [[], [], [1259]], "signal": [[], [], [1251]], "signals": [[], [], [619, 692, 1147, 1164, 1224]], "significant": [[], [], [905]], "sika": [[], [], [1061]], "sillier": [[], [], [1078]], "similar": [[], [], [645, 948, 1062, 1154, 1221]], "similarities": [[], [], [329, 1250]], "simple": [[510, 511, 952, 1235], [], [207, 529, 821, 836, 952, 997, 1031, 1037, 1038, 1059, 1071, 1083, 1155, 1199, 1235, 1251]], "simplest": [[], [], [357, 1158]], "simply": [[], [], [608, 618, 629, 687, 690, 864, 1146, 1237, 1277]], "simultaneous": [[953], [], [731, 748, 931, 953, 972, 974, 1131, 1180, 1223]], "simultaneously": [[], [], [1098]], "sinan": [[], [], [1206]], "sinana": [[], [], [1206]], "since": [[], [], [219, 285, 646, 729, 757, 864, 916, 928, 962, 1133, 1248]], "sindicatos": [[], [], [1091]], "sing": [[], [], [563, 1007, 1132, 1165]], "singers": [[], [], [1133]], "singing": [[], [], [255, 274, 1132, 1133]], "single": [[1184, 1236], [], [308, 371, 539, 563, 616, 703, 756, 1058, 1118, 1129, 1155, 1236]], "sings": [[], [], [1019]], "singular": [[], [], [555, 557, 563, 821, 890, 1018, 1066, 1165, 1169]], "sinimaavukku": [[], [], [1005]], "sink": [[], [], [313, 625]], "sip2": [[], [], [1225]], "sir": [[], [], [1242]], "siren": [[], [], [1242]], "sit": [[], [], [253, 764, 1149]], "sitting": [[], [], [239, 1067]], "situating": [[697], [], [583, 697]], "situation": [[590], [816], [322, 325, 433, 472, 590, 604, 607, 619, 692, 795, 812, 824, 836, 880, 886, 910, 915, 917, 979, 1002]], "situational": [[], [958], []], "situations": [[], [], [824, 847, 858, 945]], "siwu": [[], [], [1195]], "six": [[], [], [392]], "size": [[], [], [778, 801, 839, 964, 1062]], "slab": [[], [], [908]], "sleep": [[], [], [952]], "sleeping": [[], [], [881]], "slept": [[], [], [523, 952, 1026]], "slice": [[], [], [441]], "slightly": [[], [], [558]], "slope": [[], [], [386]], "slot": [[], [586], [639]], "slow": [[], [], [203, 237, 603, 1188]], "slowly": [[], [], [386, 817, 1188]], "sly": [[], [], [1251]], "small": [[], [], [302, 1037, 1061]], "smart": [[], [], [351, 908]], "smeared": [[], [], [388]], "smearing": [[], [], [226, 730]], "smith": [[], [], [811]], "smoked": [[], [], [240]], "smoking": [[], [], [1140]], "smooth": [[], [], [440, 940]], "snake": [[], [], [313, 625, 1203]], "so": [[], [], [304, 452, 474, 574, 591, 616, 646, 695, 706, 735, 748, 749, 801, 858, 923, 926, 1028, 1041, 1142, 1152, 1199, 1203, 1220, 1228]], "soa": [[], [816], []], "social": [[512, 954, 955, 956], [], [590, 858, 861]], "socially": [[], [], [861]], "sociative": [[957], [], []], "sofa": [[], [], [1026]], "soft": [[], [], [440]], "sol": [[], [], [231]], "sold": [[], [], [1120]], "soldier": [[], [], [272]], "sole": [[], [], [1204]], "solve": [[], [], [712]], "solving": [[], [], [712]], "somali": [[], [], [1024]], "some": [[], [], [207, 214, 279, 329, 344, 472, 508, 545, 610, 615, 650, 670, 673, 783, 789, 824, 873, 879, 884, 945, 991, 1010, 1011, 1041, 1043, 1065, 1080, 1083, 1126, 1127, 1242, 1267]], "somebody": [[], [], [515, 699, 1064]], "somehow": [[], [], [519]], "someone": [[], [], [330, 372, 418, 481, 514, 681, 698, 858, 889, 918, 932, 940, 945]], "something": [[], [], [289, 330, 361, 481, 604, 629, 630, 646, 653, 793, 858, 889, 908, 932, 940, 991]], "sometime": [[], [], [373, 654]], "sometimes": [[], [], [353, 354, 462, 554, 572, 632, 639, 642, 645, 675, 1002, 1041, 1050, 1054, 1062, 1101, 1110, 1141]], "somewhat": [[], [], [309, 706, 974]], "son": [[], [], [668, 1221]], "song": [[], [], [655, 673, 707]], "sons": [[], [], [668]], "sort": [[], [], [207, 279, 508, 670, 673, 715, 1126, 1237, 1242]], "sortal": [[1237], [], [1154, 1225, 1237]], "sosna": [[], [], [1169]], "sound": [[], [], [418, 1126, 1196]], "soup": [[], [], [322, 328]], "sources": [[], [], [304]], "space": [[560, 877], [], [373, 560, 588, 589, 654, 697, 708, 877, 922]], "spanish": [[], [], [231, 467, 566, 1066, 1087, 1091, 1093, 1132, 1133, 1134, 1221, 1252, 1270]], "spatial": [[833, 958, 959], [833, 958], [302, 380, 381, 466, 590, 631, 832, 833, 841, 904, 958, 1027, 1035, 1150, 1180, 1233]], "speaker": [[960], [], [261, 275, 276, 292, 293, 323, 332, 334, 349, 358, 360, 361, 362, 370, 373, 377, 378, 382, 439, 472, 502, 514, 515, 534, 551, 590, 600, 605, 606, 628, 629, 638, 643, 644, 654, 663, 667, 676, 677, 679, 681, 685, 687, 688, 690, 693, 694, 695, 698, 699, 700, 708, 773, 780, 781, 789, 795, 802, 812, 813, 831, 844, 847, 862, 879, 880, 885, 887, 893, 916, 922, 925, 929, 958, 962, 969, 998, 1003, 1025, 1090, 1152, 1153, 1271, 1272]], "speaking": [[], [], [590]], "spear": [[], [], [1205]], "speared": [[], [], [1015]], "special": [[1238, 1239], [], [216, 325, 382, 470, 602, 683, 926, 1152, 1237, 1238, 1240, 1272]], "specialized": [[1240], [], [571]], "species": [[513, 961], [], [396, 513, 574]], "specific": [[457, 458, 514, 515, 677, 694, 698, 699], [455, 456, 457, 458, 677, 694], [263, 281, 338, 341, 360, 361, 457, 458, 514, 515, 540, 552, 559, 562, 574, 583, 588, 593, 677, 694, 698, 699, 775, 838, 987, 1087]], "specifically": [[], [], [227, 249, 359, 528, 529, 592, 756, 902]], "specification": [[], [], [612, 663]], "specified": [[], [], [484, 612, 778]], "specifies": [[], [], [306, 475, 508, 891, 1028, 1228, 1262]], "specify": [[], [], [1265]], "specifying": [[], [], [608, 910]], "speech": [[516, 590, 700, 962], [516, 598], [275, 276, 277, 290, 291, 321, 354, 369, 439, 470, 472, 516, 590, 618, 628, 642, 651, 682, 689, 700, 748, 780, 781, 783, 788, 789, 802, 811, 836, 893, 910, 929, 958, 962, 969, 979, 1210, 1247]], "speed": [[], [], [203, 237, 603, 1204]], "spill": [[], [], [884]], "spilling": [[], [], [884]], "spirit": [[], [], [1172]], "split": [[1030, 1241, 1242], [], [703, 1151, 1241, 1242]], "spoke": [[], [], [359, 1074]], "spoken": [[], [], [1130]], "spontaneous": [[517, 963], [], [517]], "spurious": [[518], [], []], "square": [[], [], [274, 565, 872]], "squid": [[], [], [945]], "sranan": [[], [], [1234]], "ss": [[], [692], [1248]], "st": [[], [], [1113]], "stab": [[], [], [374]], "stabbing": [[], [], [374, 860]], "stability": [[986], [], [908]], "stable": [[], [908], [908, 923, 986]], "stage": [[], [], [574]], "stamp": [[1243], [], []], "stance": [[813, 885, 887, 916], [], [275, 276, 377, 773, 780, 781, 783, 813, 815, 831, 844, 847, 862, 1003]], "stances": [[], [], [813, 815, 847]], "stand": [[], [], [246]], "standand": [[], [], [1191]], "standard": [[964], [], [264, 266, 315, 611, 778, 839, 964, 1027, 1035, 1060, 1061, 1062, 1079, 1084, 1091, 1103, 1106, 1115, 1131, 1150, 1180, 1190, 1191, 1220, 1221, 1223, 1233]], "standards": [[], [], [858]], "standing": [[], [], [246, 599, 745]], "stands": [[], [], [295]], "stanford": [[], [], [821]], "star": [[], [], [314, 626, 1052]], "started": [[], [], [911, 1088, 1138]], "starts": [[], [], [341, 596, 838]], "state": [[210, 254, 721, 765, 965], [765, 816, 965], [210, 254, 298, 386, 499, 500, 519, 532, 721, 735, 756, 765, 816, 817, 854, 858, 877, 901, 908, 977, 991, 1227]], "statement": [[], [], [630]], "statements": [[572], [], []], "states": [[], [], [908, 965]], "stative": [[519, 520, 966], [246, 745, 1127], [298, 386, 500, 519, 608, 612, 691, 734, 817, 901, 965, 986, 1013, 1014, 1018, 1019, 1021, 1068, 1070, 1071, 1074, 1126, 1135, 1167, 1188, 1204]], "stativity": [[967], [], []], "status": [[650], [], [234, 292, 293, 360, 361, 553, 600, 613, 650, 667, 697, 702, 880, 1022, 1056, 1072, 1087]], "stay": [[], [], [1248]], "stayed": [[], [], [1248]], "staying": [[], [], [276, 781]], "ste": [[], [], [1019]], "stem": [[1039], [], [1039]], "sthai": [[], [], [1156]], "stick": [[], [], [731, 931]], "still": [[], [], [378, 706, 813]], "stimulates": [[], [], [968]], "stimulus": [[521, 968, 1244], [], [328, 768, 808, 906, 968, 1094, 1097, 1193, 1244]], "stipem": [[], [], [1014]], "stole": [[], [], [632, 681, 1222]], "stolen": [[], [], [592]], "stone": [[], [], [908, 1083]], "stopped": [[], [], [535, 705, 1130]], "store": [[], [], [1031]], "stored": [[], [], [567]], "stories": [[], [], [1130, 1193]], "storm": [[], [], [801]], "story": [[], [], [1143, 1238]], "stranger": [[], [], [1198]], "strategies": [[], [1245], [267, 395, 493, 552, 558, 559, 564, 1021, 1060, 1064, 1065, 1084, 1091, 1115, 1129, 1131, 1133, 1151, 1219, 1234, 1235, 1250, 1259, 1265]], "strategy": [[1012, 1013, 1014, 1015, 1016, 1018, 1019, 1020, 1021, 1028, 1029, 1036, 1047, 1048, 1052, 1054, 1057, 1065, 1068, 1069, 1070, 1071, 1074, 1075, 1077, 1082, 1085, 1089, 1094, 1096, 1097, 1099, 1100, 1102, 1107, 1108, 1110, 1112, 1114, 1119, 1121, 1123, 1124, 1125, 1128, 1130, 1131, 1141, 1142, 1143, 1145, 1148, 1149, 1155, 1157, 1159, 1170, 1171, 1172, 1174, 1175, 1177, 1178, 1179, 1180, 1184, 1186, 1187, 1188, 1193, 1198, 1201, 1203, 1204, 1205, 1206, 1209, 1215, 1216, 1218, 1219, 1222, 1223, 1227, 1228, 1232, 1234, 1235, 1236, 1239, 1240, 1241, 1243, 1244, 1245, 1255, 1257, 1259, 1262, 1263, 1265, 1266, 1268, 1269], [1012, 1015, 1016, 1025, 1026, 1053, 1054, 1075, 1108, 1112, 1119, 1121, 1124, 1126, 1133, 1143, 1148, 1149, 1172, 1174, 1182, 1185, 1186, 1201, 1206, 1209, 1216, 1232, 1234, 1244, 1257, 1269, 1271, 1272, 1275, 1276], [229, 235, 338, 346, 359, 464, 467, 564, 1004, 1005, 1006, 1012, 1013, 1014, 1015, 1016, 1018, 1019, 1021, 1024, 1025, 1027, 1028, 1030, 1031, 1035, 1038, 1039, 1041, 1042, 1043, 1050, 1052, 1054, 1058, 1059, 1060, 1061, 1062, 1064, 1066, 1068, 1070, 1071, 1073, 1074, 1075, 1079, 1083, 1084, 1086, 1087, 1090, 1093, 1094, 1095, 1096, 1097, 1099, 1100, 1101, 1102, 1103, 1106, 1108, 1110, 1111, 1112, 1113, 1115, 1116, 1118, 1119, 1121, 1122, 1124, 1126, 1129, 1130, 1131, 1132, 1133, 1134, 1135, 1137, 1141, 1142, 1143, 1146, 1147, 1148, 1149, 1150, 1152, 1153, 1154, 1155, 1156, 1157, 1158, 1167, 1169, 1172, 1173, 1174, 1179, 1180, 1182, 1184, 1185, 1186, 1187, 1188, 1190, 1191, 1193, 1194, 1195, 1196, 1198, 1199, 1201, 1203, 1204, 1205, 1206, 1209, 1210, 1211, 1212, 1214, 1216, 1219, 1220, 1221, 1222, 1223, 1226, 1227, 1228, 1229, 1232, 1233, 1234, 1235, 1236, 1237, 1238, 1239, 1240, 1241, 1242, 1243, 1244, 1245, 1251, 1252, 1253, 1255, 1257, 1260, 1262, 1265, 1266, 1267, 1268, 1269, 1271, 1272, 1275, 1276, 1277]], "strawson": [[], [], [599]], "street": [[], [], [927, 977]], "strength": [[], [], [378]], "stretch": [[], [], [242, 616, 742]], "stride": [[], [], [387, 869, 1226, 1227]], "strode": [[], [], [387, 869, 1226, 1227]], "strong": [[], [], [469, 628, 922, 945]], "strongest": [[], [], [945, 1228]], "strongly": [[], [], [762, 907, 1206]], "structural": [[591], [], [591, 1041]], "structure": [[584, 624, 756, 1155, 1187, 1241, 1242], [255, 399, 435, 647, 734], [240, 255, 281, 328, 410, 426, 491, 523, 559, 568, 570, 571, 573, 574, 578, 579, 592, 597, 660, 670, 727, 734, 749, 756, 970, 1108, 1155, 1174, 1187, 1203, 1221, 1241, 1242, 1244, 1245]], "structures": [[], [], [596, 1102]], "student": [[], [], [417, 418, 638, 667, 708, 1174]], "studied": [[], [], [474]], "study": [[], [], [570, 596]], "stuff": [[], [], [1120]], "subcategorizing": [[701], [], []], "subclass": [[], [], [540]], "subdivision": [[], [], [650]], "subevent": [[], [], [529]], "subevents": [[], [], [319]], "subject": [[522, 523, 619, 657, 692, 1246], [523, 619, 692, 1108, 1246, 1257], [232, 235, 249, 255, 288, 328, 522, 523, 536, 552, 586, 594, 619, 692, 706, 782, 1005, 1014, 1041, 1059, 1060, 1067, 1068, 1071, 1086, 1091, 1094, 1099, 1108, 1121, 1131, 1148, 1155, 1180, 1188, 1204, 1223, 1236, 1240, 1241, 1243, 1244, 1248, 1250, 1255, 1257, 1269]], "subjective": [[969], [], [795, 812, 836, 893, 969]], "subjunctive": [[], [], [1059]], "subordinate": [[524], [204], [297, 383, 390, 524, 1242]], "subordination": [[], [], [1022, 1056]], "subscript": [[], [], [616]], "subsequent": [[970], [], [677, 694, 782, 970]], "subset": [[], [], [608, 782, 1156]], "substance": [[], [389, 401], [389]], "substitute": [[], [], [325]], "substituted": [[], [], [972]], "substitution": [[971], [], [972]], "substitutive": [[525, 972], [], []], "subsume": [[], [], [1116]], "subsumed": [[], [], [756]], "subsumes": [[], [], [993]], "subtraction": [[973], [], []], "subtractive": [[526, 974], [], [974]], "subtype": [[], [], [513, 528, 610, 629, 656, 668, 673, 687, 688, 690, 693, 697, 701, 710, 838, 1203, 1205]], "subtypes": [[], [], [465, 670]], "success": [[], [], [712]], "successful": [[], [], [712]], "succulents": [[], [], [592]], "such": [[], [], [252, 374, 418, 434, 447, 452, 477, 487, 488, 528, 529, 556, 559, 577, 583, 613, 616, 631, 672, 673, 675, 694, 700, 713, 715, 721, 728, 765, 775, 780, 781, 833, 858, 861, 872, 898, 918, 921, 940, 945, 987, 1012, 1080, 1091, 1124, 1152, 1212, 1226, 1227, 1232, 1266]], "sue": [[], [], [257, 487, 1236, 1240]], "sufficient": [[], [], [378]], "suffix": [[], [], [222, 228, 578, 579, 1021, 1030, 1031, 1046, 1080, 1083, 1093, 1117, 1132, 1133, 1134, 1150, 1156, 1157, 1164, 1169, 1184, 1188, 1233, 1236, 1239, 1265]], "suffixed": [[], [], [1044, 1074, 1252]], "suki": [[], [], [1094]], "sumie": [[], [], [424, 461, 522]], "sumiyoi": [[], [], [536]], "summarizer": [[1247], [], [1247]], "summary": [[], [324], []], "sun": [[], [], [231]], "sunday": [[], [], [1041]], "sunny": [[], [], [231]], "superlative": [[527, 975], [], [1080]], "superordinate": [[], [], [301, 572, 810, 816, 847]], "supervising": [[], [], [858]], "support": [[528, 529], [], [528, 529, 1028]], "supporting": [[], [], [683, 701]], "surprise": [[], [], [208, 628, 879]], "surprised": [[], [], [208, 879]], "surprises": [[], [], [1124]], "suspendi": [[], [], [1091]], "svo": [[], [], [1041]], "svox": [[], [], [1041]], "sw": [[], [], [1239]], "swahili": [[], [], [1106, 1184, 1198, 1236]], "sweep": [[], [], [760]], "sweeping": [[], [], [760]], "switch": [[1248], [], [1005, 1250]], "switches": [[], [], [1248]], "symbolic": [[], [], [1126]], "symmetric": [[], [613], []], "syndetic": [[1249], [], [1022, 1043, 1056, 1072, 1091, 1158, 1224, 1249]], "synonym": [[], [], [353, 632, 639, 938]], "synonymous": [[], [], [473, 668, 705]], "syntactic": [[], [598], []], "syntactically": [[], [], [241, 554, 1146]], "syntax": [[592], [], [592]], "syrian": [[], [], [1238]], "system": [[1005, 1026, 1060, 1091, 1152, 1217, 1248, 1250], [1007, 1010, 1059, 1104, 1138, 1162, 1163, 1231], [382, 1005, 1007, 1008, 1010, 1011, 1026, 1046, 1053, 1059, 1060, 1088, 1091, 1104, 1105, 1127, 1136, 1138, 1152, 1153, 1162, 1163, 1165, 1208, 1230, 1231, 1248]], "systematically": [[], [], [1005, 1248]], "systems": [[], [], [1091, 1250]], "syuto": [[], [], [536]], "t": [[530], [530, 981], [267, 271, 291, 308, 341, 358, 362, 447, 470, 488, 551, 552, 634, 644, 672, 682, 687, 838, 884, 885, 886, 945, 962, 972, 1003, 1004, 1019, 1025, 1035, 1052, 1068, 1088, 1097, 1100, 1110, 1129, 1138, 1142, 1163, 1185, 1194, 1208, 1230, 1231, 1239, 1259]], "t4": [[], [], [903]], "taam3": [[], [], [903]], "table": [[], [], [292, 293, 360, 361, 463, 619, 650, 789, 987, 1116, 1203, 1207]], "tables": [[], [], [993]], "tag": [[1251], [], [1251]], "tags": [[], [], [1251]], "taip": [[], [], [1220]], "takasi": [[], [], [1153]], "takasii": [[], [], [1153]], "take": [[], [], [305, 338, 385, 557, 675, 676, 696, 708, 710, 867]], "taken": [[], [], [377, 862, 877, 925]], "takes": [[], [], [272, 570, 762, 1019]], "taking": [[270, 437], [], [270, 437, 477, 557, 558, 712, 805, 883, 911, 926, 930, 1009, 1018, 1155, 1187, 1241]], "talei": [[], [], [1199]], "talitsk": [[], [], [235]], "talking": [[], [], [685]], "tall": [[], [], [224, 302, 315, 598, 691, 908, 938, 966, 1035, 1079, 1103, 1221, 1276]], "taller": [[], [], [264, 938, 1080, 1106, 1150]], "tallest": [[], [], [1080]], "tamil": [[], [], [1005]], "tamm": [[], [], [606]], "tamp": [[976], [], [238, 239, 976, 979, 1243]], "tanana": [[], [], [325]], "tape": [[], [], [215]], "tarafit": [[], [], [1255]], "target": [[1252], [], [1093, 1252]], "taroo": [[], [], [1153]], "taste": [[], [], [1195]], "tasted": [[], [], [328]], "tataku": [[], [], [418]], "taua": [[], [], [1172]], "tauya": [[], [], [1248]], "te": [[], [], [1031, 1059, 1248]], "tea": [[], [], [610]], "telic": [[977], [977], [734, 816, 977]], "telicity": [[978], [], []], "tell": [[], [], [278, 537, 614, 989]], "telling": [[], [], [537, 609, 883, 989]], "temporal": [[531], [], [728, 784, 921, 1015, 1131, 1180, 1223, 1253]], "temporally": [[], [], [500, 953]], "temporary": [[532], [965], [532, 918, 1034]], "ten": [[], [], [962]], "tende": [[], [], [1071]], "tended": [[], [], [1031]], "tendency": [[], [], [1002]], "tends": [[], [], [607, 609, 630, 653]], "tense": [[979, 1253], [], [239, 291, 563, 578, 925, 976, 979, 1007, 1009, 1059, 1165, 1267]], "ter": [[], [], [1049]], "term": [[209, 214, 247, 258, 283, 302, 306, 335, 339, 344, 351, 389, 392, 396, 427, 440, 441, 475, 484, 508, 509, 513, 546, 547], [389], [214, 283, 334, 335, 344, 353, 354, 392, 395, 396, 427, 440, 441, 462, 473, 502, 508, 509, 513, 554, 569, 602, 606, 610, 615, 632, 639, 642, 643, 677, 694, 695, 705, 726, 756, 760, 816, 938, 958, 981, 1058, 1158]], "terminating": [[], [], [911]], "terminative": [[980], [], []], "terms": [[], [], [209, 258, 302, 339, 351, 388, 389, 396, 439, 440, 473, 484, 499, 508, 547, 589, 729, 809, 816, 855, 869, 880, 928, 958, 1041]], "terry": [[], [], [739, 970, 1241]], "tests": [[], [], [281]], "text": [[], [], [215, 575, 595]], "textbook": [[], [], [272, 396, 554, 570, 734, 795, 812, 979, 1153]], "texture": [[], [], [1195]], "th": [[], [], [1075]], "thaang2": [[], [], [903]], "than": [[], [], [222, 227, 240, 264, 265, 272, 274, 285, 308, 309, 366, 370, 412, 414, 433, 471, 473, 529, 539, 553, 554, 564, 566, 584, 585, 608, 629, 648, 690, 706, 778, 863, 938, 945, 964, 1027, 1060, 1061, 1062, 1064, 1084, 1106, 1112, 1115, 1122, 1150, 1158, 1190, 1201, 1206, 1226, 1233, 1243]], "thanks": [[], [], [371]], "that": [[], [], [201, 203, 208, 210, 212, 215, 216, 218, 222, 227, 232, 234, 235, 236, 237, 240, 241, 243, 246, 247, 255, 256, 261, 262, 263, 264, 267, 268, 270, 271, 272, 275, 276, 277, 278, 281, 283, 284, 285, 286, 287, 290, 291, 292, 293, 294, 295, 296, 297, 298, 300, 301, 303, 304, 306, 311, 312, 313, 314, 315, 318, 321, 323, 324, 325, 326, 329, 332, 335, 336, 338, 341, 344, 346, 347, 349, 351, 353, 354, 356, 357, 358, 360, 361, 362, 364, 365, 367, 368, 369, 370, 373, 377, 378, 380, 382, 383, 386, 390, 392, 395, 396, 397, 402, 408, 409, 410, 412, 413, 416, 417, 418, 429, 433, 437, 438, 439, 441, 445, 447, 452, 455, 456, 457, 458, 460, 462, 464, 465, 467, 469, 470, 472, 473, 474, 475, 477, 479, 484, 485, 488, 490, 492, 493, 494, 499, 500, 503, 504, 505, 508, 513, 514, 515, 524, 528, 529, 532, 533, 534, 535, 536, 537, 540, 541, 543, 545, 548, 551, 552, 553, 554, 555, 556, 558, 559, 560, 562, 564, 569, 570, 574, 576, 580, 581, 584, 585, 586, 588, 589, 596, 598, 599, 600, 604, 606, 613, 614, 616, 619, 626, 628, 629, 630, 631, 632, 638, 639, 642, 644, 646, 647, 651, 653, 655, 656, 660, 667, 668, 670, 675, 676, 677, 680, 681, 683, 684, 688, 690, 692, 693, 694, 695, 697, 700, 703, 705, 706, 707, 708, 710, 711, 712, 713, 715, 720, 721, 726, 727, 728, 738, 739, 740, 743, 756, 758, 760, 761, 762, 765, 772, 773, 775, 780, 781, 782, 783, 788, 794, 795, 797, 798, 801, 805, 811, 812, 817, 821, 827, 831, 833, 835, 836, 837, 839, 844, 845, 849, 852, 856, 858, 860, 861, 862, 866, 869, 872, 877, 879, 880, 881, 883, 885, 886, 889, 890, 891, 893, 899, 900, 901, 902, 904, 905, 907, 908, 911, 915, 916, 917, 920, 921, 922, 925, 926, 927, 930, 936, 938, 940, 945, 948, 958, 962, 964, 969, 970, 972, 974, 979, 981, 986, 989, 991, 992, 993, 996, 1002, 1003, 1006, 1008, 1009, 1011, 1012, 1013, 1014, 1016, 1022, 1027, 1028, 1031, 1050, 1052, 1053, 1056, 1060, 1061, 1062, 1063, 1066, 1067, 1072, 1074, 1075, 1080, 1083, 1087, 1088, 1090, 1093, 1096, 1102, 1103, 1105, 1106, 1111, 1112, 1116, 1117, 1119, 1120, 1122, 1126, 1127, 1130, 1131, 1133, 1134, 1136, 1137, 1141, 1142, 1146, 1147, 1150, 1152, 1153, 1154, 1155, 1156, 1164, 1165, 1172, 1174, 1186, 1187, 1188, 1190, 1191, 1199, 1201, 1202, 1203, 1206, 1207, 1208, 1209, 1216, 1219, 1220, 1223, 1224, 1225, 1227, 1230, 1232, 1233, 1234, 1235, 1237, 1238, 1239, 1240, 1241, 1242, 1245, 1247, 1250, 1251, 1262, 1265, 1266, 1267, 1268, 1271, 1272, 1276]], "the": [[], [], [200, 201, 203, 204, 205, 207, 208, 210, 212, 213, 215, 216, 217, 218, 219, 222, 224, 225, 226, 227, 228, 229, 231, 232, 234, 235, 236, 237, 238, 239, 240, 242, 243, 244, 246, 247, 249, 252, 253, 254, 255, 256, 257, 259, 261, 262, 263, 264, 265, 266, 267, 268, 270, 271, 272, 274, 275, 276, 277, 278, 279, 281, 282, 283, 284, 285, 286, 287, 288, 289, 290, 291, 292, 293, 294, 296, 297, 298, 300, 303, 304, 305, 306, 308, 311, 312, 313, 314, 315, 318, 319, 322, 323, 324, 326, 328, 332, 334, 335, 336, 338, 346, 347, 349, 353, 354, 356, 357, 358, 359, 360, 361, 362, 363, 364, 368, 369, 370, 371, 373, 374, 377, 378, 380, 381, 382, 383, 385, 386, 387, 388, 389, 390, 393, 395, 397, 398, 400, 402, 406, 407, 408, 410, 412, 413, 414, 416, 417, 418, 424, 425, 426, 427, 429, 433, 434, 437, 438, 439, 441, 445, 446, 447, 451, 452, 459, 460, 461, 462, 463, 464, 465, 466, 467, 469, 470, 471, 472, 473, 474, 475, 477, 478, 479, 481, 484, 487, 488, 489, 490, 491, 492, 493, 494, 497, 498, 499, 500, 502, 505, 508, 513, 514, 515, 516, 517, 519, 522, 523, 524, 527, 528, 529, 532, 533, 534, 535, 536, 539, 540, 541, 543, 545, 548, 549, 551, 552, 553, 554, 555, 556, 557, 558, 559, 560, 561, 562, 563, 564, 565, 566, 567, 568, 569, 570, 571, 573, 574, 575, 576, 578, 579, 580, 581, 583, 584, 585, 586, 588, 589, 590, 591, 592, 593, 594, 595, 596, 597, 598, 599, 600, 601, 602, 603, 604, 605, 606, 607, 608, 609, 610, 611, 612, 613, 614, 615, 616, 617, 618, 619, 620, 623, 625, 626, 627, 628, 629, 630, 631, 632, 633, 634, 638, 639, 642, 643, 644, 645, 646, 647, 648, 649, 650, 651, 653, 654, 655, 656, 660, 663, 667, 668, 671, 672, 673, 675, 676, 677, 679, 680, 681, 683, 684, 685, 687, 688, 689, 690, 691, 692, 693, 694, 695, 696, 697, 698, 699, 700, 701, 702, 703, 704, 705, 706, 707, 708, 709, 710, 711, 712, 715, 720, 721, 726, 727, 728, 729, 731, 733, 734, 735, 738, 739, 740, 741, 744, 745, 748, 749, 756, 757, 758, 760, 761, 762, 765, 768, 771, 772, 773, 775, 778, 780, 781, 782, 783, 784, 788, 789, 794, 795, 796, 797, 798, 801, 802, 805, 807, 809, 811, 812, 813, 815, 816, 817, 821, 824, 826, 828, 831, 832, 833, 835, 836, 838, 839, 841, 844, 847, 852, 854, 855, 856, 858, 860, 862, 863, 864, 866, 867, 869, 872, 873, 877, 879, 880, 882, 883, 884, 885, 886, 887, 889, 890, 891, 893, 898, 899, 900, 901, 902, 903, 904, 905, 906, 907, 908, 910, 911, 915, 916, 917, 918, 919, 920, 921, 922, 923, 925, 926, 927, 928, 929, 930, 931, 936, 938, 944, 945, 948, 952, 953, 958, 962, 964, 965, 966, 968, 969, 970, 972, 974, 976, 977, 979, 981, 986, 989, 993, 996, 997, 998, 1000, 1002, 1003, 1004, 1005, 1006, 1007, 1008, 1009, 1010, 1011, 1012, 1013, 1014, 1015, 1016, 1018, 1019, 1021, 1022, 1024, 1025, 1026, 1027, 1028, 1030, 1031, 1034, 1035, 1037, 1038, 1039, 1041, 1042, 1043, 1046, 1049, 1050, 1052, 1053, 1054, 1056, 1058, 1059, 1060, 1061, 1062, 1063, 1064, 1065, 1066, 1067, 1068, 1070, 1071, 1072, 1074, 1075, 1079, 1080, 1083, 1084, 1086, 1087, 1088, 1090, 1091, 1093, 1094, 1095, 1096, 1097, 1099, 1100, 1101, 1102, 1103, 1104, 1105, 1106, 1108, 1110, 1111, 1112, 1113, 1115, 1116, 1117, 1118, 1119, 1120, 1121, 1122, 1124, 1126, 1127, 1129, 1130, 1131, 1132, 1133, 1134, 1135, 1136, 1137, 1138, 1140, 1141, 1142, 1143, 1146, 1147, 1148, 1149, 1150, 1151, 1152, 1153, 1154, 1155, 1156, 1157, 1158, 1162, 1163, 1164, 1165, 1167, 1169, 1172, 1173, 1174, 1179, 1180, 1182, 1184, 1185, 1186, 1187, 1188, 1189, 1190, 1191, 1193, 1194, 1195, 1196, 1198, 1199, 1201, 1202, 1203, 1204, 1205, 1206, 1207, 1208, 1209, 1210, 1211, 1212, 1214, 1216, 1219, 1220, 1221, 1222, 1223, 1224, 1225, 1226, 1227, 1228, 1229, 1230, 1231, 1232, 1233, 1234, 1235, 1236, 1237, 1238, 1239, 1240, 1241, 1242, 1243, 1244, 1245, 1247, 1248, 1249, 1250, 1251, 1252, 1253, 1255, 1257, 1259, 1260, 1262, 1265, 1266, 1267, 1268, 1269, 1270, 1271, 1272, 1273, 1275, 1276, 1277]], "theater": [[702], [], [702]], "their": [[], [], [334, 371, 378, 439, 502, 546, 553, 582, 590, 594, 598, 670, 738, 764, 783, 815, 910, 1199]], "them": [[], [], [285, 306, 645, 902, 923, 1008, 1072, 1079, 1099, 1100, 1209, 1230, 1249]], "thematic": [[], [948], []], "theme": [[981], [], [308, 981]], "themselves": [[], [], [1099]], "then": [[], [], [502, 514, 515, 571, 638, 698, 699, 811, 1005, 1130, 1193]], "theoretical": [[], [], [567, 575]], "there": [[], [], [235, 255, 271, 313, 325, 359, 371, 412, 465, 467, 469, 488, 491, 493, 554, 574, 615, 625, 647, 668, 670, 680, 691, 735, 756, 760, 773, 781, 788, 801, 811, 824, 831, 844, 877, 890, 891, 902, 918, 922, 927, 952, 962, 1003, 1027, 1030, 1035, 1043, 1065, 1079, 1086, 1087, 1096, 1103, 1106, 1116, 1122, 1126, 1129, 1133, 1147, 1150, 1151, 1152, 1155, 1158, 1185, 1186, 1193, 1198, 1203, 1219, 1233, 1242, 1275, 1276]], "thereby": [[], [], [1099]], "therefore": [[], [], [264, 554, 555, 726]], "thereof": [[], [], [488]], "these": [[], [], [272, 379, 450, 473, 893, 969, 1083]], "thetic": [[533, 703, 1254], [], [313, 412, 533, 607, 609, 625, 627, 630, 653, 680, 703, 824, 927, 1002, 1210, 1242]], "they": [[], [], [218, 235, 298, 474, 519, 528, 534, 543, 555, 646, 656, 696, 713, 805, 923, 965, 1008, 1064, 1068, 1070, 1079, 1099, 1126, 1129, 1184, 1199, 1205, 1221, 1236, 1248]], "thin": [[], [], [302]], "thing": [[982], [], [581]], "things": [[], [], [706, 902, 945]], "think": [[], [], [256, 362, 644, 893, 1243]], "thinking": [[], [], [926]], "thinks": [[], [], [267, 852, 877]], "third": [[534, 983], [], [354, 359, 524, 534, 563, 565, 642, 650, 749, 910, 1030, 1068, 1116, 1133, 1147, 1152, 1194, 1219, 1234, 1235, 1237]], "this": [[], [], [225, 255, 272, 277, 292, 293, 294, 295, 304, 341, 353, 360, 361, 378, 396, 413, 447, 467, 478, 529, 533, 554, 555, 570, 576, 581, 583, 597, 600, 601, 606, 610, 613, 616, 617, 631, 639, 655, 672, 673, 703, 707, 708, 729, 731, 734, 783, 788, 789, 795, 797, 812, 821, 838, 852, 879, 883, 884, 885, 886, 887, 917, 918, 928, 931, 938, 948, 974, 979, 1006, 1060, 1061, 1106, 1141, 1150, 1153, 1193, 1203, 1238]], "those": [[], [], [275, 319, 559, 762, 780, 907, 1028, 1133, 1262]], "though": [[], [], [675, 890, 1141, 1250]], "thought": [[], [], [256, 314, 477, 626, 768, 852, 893, 926, 1056]], "three": [[], [], [247, 255, 264, 281, 393, 553, 569, 579, 670, 702, 813, 891, 992, 1000, 1083, 1086, 1162, 1163, 1247, 1260]], "threw": [[], [], [288]], "thrown": [[], [], [288]], "thus": [[], [], [1265]], "ti": [[], [], [1268]], "tibetan": [[], [], [879, 1247]], "tica": [[], [], [1061]], "tightly": [[], [], [585]], "tim": [[], [], [256, 438, 768, 906]], "time": [[797, 852, 984, 985, 986], [], [263, 298, 373, 378, 386, 437, 533, 581, 590, 631, 654, 676, 703, 734, 775, 797, 805, 807, 836, 852, 867, 893, 908, 930, 966, 969, 979, 986, 991]], "times": [[], [], [602, 616, 696]], "tina": [[], [], [1277]], "tired": [[], [], [748, 1022, 1056]], "tita": [[], [], [1129]], "tiwi": [[], [], [1277]], "tjara": [[], [], [1205]], "tlawi": [[], [], [1158]], "to": [[], [], [214, 215, 216, 218, 219, 227, 228, 229, 231, 232, 235, 237, 240, 241, 249, 252, 262, 263, 264, 265, 266, 267, 274, 275, 276, 281, 283, 288, 291, 292, 293, 294, 300, 303, 304, 306, 308, 314, 315, 323, 324, 325, 328, 329, 334, 335, 336, 341, 344, 351, 358, 359, 360, 361, 364, 368, 370, 371, 377, 378, 381, 382, 385, 388, 408, 410, 439, 447, 451, 460, 462, 464, 466, 467, 470, 472, 473, 474, 479, 488, 490, 492, 502, 516, 524, 528, 529, 534, 536, 539, 540, 543, 546, 555, 556, 557, 558, 559, 564, 567, 569, 570, 571, 572, 573, 574, 575, 576, 577, 583, 586, 590, 591, 594, 596, 597, 599, 600, 602, 605, 606, 607, 608, 609, 611, 612, 616, 619, 620, 623, 626, 628, 629, 630, 633, 634, 638, 645, 646, 647, 649, 650, 653, 655, 663, 667, 672, 675, 676, 677, 679, 680, 683, 685, 689, 690, 692, 693, 694, 695, 696, 698, 699, 700, 702, 704, 705, 706, 707, 708, 710, 712, 713, 726, 727, 728, 733, 738, 757, 762, 772, 775, 778, 780, 781, 782, 784, 789, 793, 795, 796, 797, 798, 812, 813, 821, 832, 836, 838, 854, 856, 858, 860, 862, 863, 867, 877, 879, 880, 882, 883, 885, 886, 887, 889, 892, 893, 902, 904, 907, 908, 910, 911, 916, 918, 921, 923, 925, 927, 931, 936, 938, 940, 945, 948, 958, 965, 970, 972, 979, 981, 986, 989, 997, 1002, 1005, 1006, 1012, 1015, 1017, 1021, 1022, 1025, 1027, 1035, 1042, 1044, 1050, 1052, 1053, 1056, 1059, 1061, 1062, 1064, 1072, 1075, 1079, 1080, 1083, 1084, 1086, 1087, 1088, 1097, 1099, 1100, 1101, 1103, 1106, 1110, 1112, 1124, 1126, 1129, 1130, 1131, 1132, 1133, 1136, 1138, 1140, 1141, 1142, 1143, 1146, 1148, 1150, 1151, 1152, 1154, 1157, 1158, 1164, 1169, 1180, 1186, 1190, 1191, 1194, 1195, 1196, 1198, 1206, 1208, 1209, 1210, 1211, 1212, 1214, 1220, 1221, 1222, 1223, 1225, 1228, 1230, 1231, 1232, 1233, 1237, 1239, 1240, 1245, 1248, 1249, 1251, 1252, 1253, 1259, 1262, 1265, 1271, 1272]], "toast": [[], [], [388]], "today": [[], [], [529, 1086, 1220]], "tog": [[], [], [879]], "together": [[], [], [257, 279, 304, 592, 707]], "tohono": [[], [], [1229]], "token": [[593, 704, 987], [], [634, 638, 1041]], "tokens": [[], [], [475]], "told": [[], [], [268, 270, 545, 883, 1059, 1143, 1153]], "tom": [[], [], [1190]], "tong": [[], [], [1050, 1237]], "tonga": [[], [], [1157]], "too": [[], [], [342, 847, 1130]], "took": [[], [], [215, 216, 709, 925, 1101, 1186]], "top": [[], [], [292, 293, 488, 536, 552, 908, 1083]], "topic": [[345, 346, 535, 536, 705, 988, 1086, 1255, 1256, 1257], [600, 1086], [346, 412, 535, 536, 599, 679, 703, 705, 927, 1002, 1041, 1086, 1172, 1242, 1255, 1257]], "topical": [[706], [706], []], "topicality": [[636, 637, 659, 662, 665, 666, 706], [706], [738]], "topics": [[], [], [346, 1086]], "toqabaqita": [[], [], [359]], "totality": [[], [], [715]], "toward": [[], [], [275, 276, 336, 377, 556, 628, 633, 768, 773, 780, 781, 795, 798, 808, 812, 815, 831, 844, 862, 879, 906, 926, 932, 1003]], "track": [[], [], [488]], "tracking": [[488, 1217], [488, 695], [619, 692, 1005, 1059, 1060, 1091, 1248, 1250]], "traditions": [[], [], [567]], "transfer": [[537, 989], [], [537, 713, 981, 989, 1141]], "transferred": [[], [], [981]], "transferring": [[], [], [738]], "transitive": [[538, 539, 1157, 1258], [538, 539, 1162], [371, 425, 539, 594, 863, 1026, 1041, 1099, 1108, 1157, 1244]], "transitivity": [[594, 1259], [], []], "transitoriness": [[990], [], []], "transitory": [[991], [965], [713, 965, 986]], "translated": [[], [], [566, 1005]], "translation": [[573, 595], [595], [241, 566, 573, 575, 580, 595]], "translational": [[], [], [882]], "transmission": [[], [749], []], "transmitted": [[], [], [858]], "travel": [[], [], [336, 633]], "travels": [[], [], [869]], "treasure": [[], [], [1193]], "treated": [[], [], [464]], "treats": [[], [], [306]], "tree": [[], [], [215, 232, 247, 264, 281, 315, 427, 557, 569, 579, 647, 733, 796, 835, 877, 908, 938, 1106, 1150]], "trees": [[], [], [398, 557, 569, 691, 1185, 1275, 1276]], "trigger": [[707], [], [655, 707]], "tripartite": [[1260], [], [1260]], "tristis": [[], [], [1014]], "trivalent": [[992], [], [308, 711, 989, 992, 1000]], "truck": [[], [], [237, 898]], "true": [[], [], [445, 469, 795, 812, 877, 880, 893, 917, 922, 925, 991, 1153, 1251]], "truly": [[], [], [1172]], "trump": [[], [], [533, 607, 703]], "truth": [[], [445], [633, 812, 815, 915, 925, 926]], "tsam": [[], [], [879]], "ttu": [[], [], [1255]], "tula": [[], [], [1037]], "tundra": [[], [], [1205]], "tuqut": [[], [], [222, 864]], "turkana": [[], [], [1068]], "turkish": [[], [], [1206, 1259]], "turn": [[], [], [655, 673, 707]], "twice": [[], [], [1098]], "two": [[], [], [204, 207, 229, 241, 247, 257, 264, 274, 279, 286, 287, 314, 315, 335, 357, 378, 379, 395, 424, 450, 452, 461, 473, 522, 610, 613, 615, 626, 631, 656, 668, 670, 704, 709, 710, 715, 728, 731, 740, 748, 771, 775, 781, 783, 784, 811, 833, 858, 873, 884, 891, 918, 921, 931, 952, 953, 972, 974, 986, 997, 1028, 1042, 1043, 1049, 1053, 1058, 1061, 1063, 1096, 1097, 1099, 1103, 1106, 1116, 1118, 1131, 1146, 1147, 1151, 1154, 1158, 1190, 1219, 1221, 1223, 1225, 1234, 1238, 1240, 1250, 1270]], "ty": [[], [], [1251]], "type": [[686, 708, 709, 766, 993], [], [207, 216, 247, 279, 281, 305, 322, 324, 325, 351, 357, 395, 408, 413, 433, 461, 475, 479, 484, 540, 543, 571, 573, 606, 617, 625, 626, 627, 634, 638, 645, 667, 670, 673, 680, 691, 693, 704, 708, 709, 712, 783, 795, 812, 911, 993, 1002, 1113, 1184, 1186, 1223, 1237, 1245]], "types": [[], [], [368, 379, 414, 450, 553, 581, 615, 756, 891, 892, 923, 986, 1012, 1124, 1232, 1242, 1277]], "typical": [[], [], [890, 1134]], "typically": [[], [], [207, 239, 279, 305, 383, 524, 555, 602, 619, 675, 692, 696, 891, 948, 976, 979, 1002, 1024, 1064, 1141, 1149, 1164, 1169, 1172, 1187, 1194, 1210, 1220, 1251]], "typifying": [[540], [540, 701], [241, 540, 1058]], "typological": [[], [], [555, 585]], "typology": [[596], [596], [474]], "u": [[], [], [1005, 1011, 1015, 1030, 1064, 1148, 1191, 1259]], "ubykh": [[], [], [1150]], "ucule": [[], [], [1013]], "udii": [[], [], [1005]], "uhng": [[], [], [1154]], "ula": [[], [], [1255]], "ule": [[], [], [1106]], "ulu": [[], [], [1015]], "um": [[], [], [1193]], "umer": [[], [], [1018]], "umugabo": [[], [], [1046]], "un": [[], [], [880, 1087, 1193]], "unanalyzable": [[], [], [574]], "uncertain": [[], [], [651]], "uncertainty": [[], [], [969]], "unchanging": [[], [], [1115]], "uncontrolled": [[541, 994], [], [541, 741]], "uncountable": [[], [], [392]], "under": [[], [], [275, 293, 357, 361, 756, 780, 918, 1009, 1028, 1202, 1228, 1262]], "undergo": [[], [], [996]], "undergoer": [[995], [], []], "undergoes": [[], [], [571, 756, 765, 801, 905, 996]], "undergone": [[], [], [528, 529]], "undergraduate": [[], [], [708]], "underlying": [[], [], [560]], "understood": [[], [], [324, 408]], "underwent": [[], [], [529]], "undirected": [[996], [], []], "unexpected": [[542, 997], [], [207, 275, 533, 607, 703, 780, 997, 1028, 1228]], "unexpectedly": [[], [], [781]], "unexpressed": [[], [], [1133, 1179]], "unfolds": [[], [], [734]], "unidirectional": [[], [], [801]], "uninflected": [[], [], [1205]], "uninflecting": [[], [], [1172]], "unique": [[1261], [], [1021, 1222]], "unit": [[652], [652], [281, 304, 396, 561, 574]], "unitary": [[], [], [231, 241, 574, 577]], "units": [[], [], [593]], "universal": [[543, 1262, 1263], [], [338, 543, 555, 560, 584, 1262]], "universals": [[], [], [552]], "university": [[], [], [514, 515, 698, 699]], "unknown": [[515, 641, 699], [], [368, 370, 515, 605, 638, 648, 651, 671, 681, 699, 708]], "unlike": [[], [], [363, 371, 529, 1075, 1221, 1251]], "unrealized": [[], [], [731, 931]], "unspecified": [[], [], [611, 614, 620, 633, 644, 684]], "unstressed": [[], [], [218]], "unsure": [[], [], [695]], "unwilling": [[], [], [945]], "up": [[], [], [204, 255, 274, 275, 290, 378, 397, 618, 704, 735, 780, 977, 996, 1028, 1052, 1072, 1187, 1249]], "upon": [[], [], [240, 809]], "upper": [[], [], [1043]], "upriver": [[], [], [1239]], "upwards": [[], [], [552]], "uq": [[], [], [1255]], "uqa": [[], [], [1149]], "urarina": [[], [], [1202]], "urinate": [[], [], [1054]], "urinating": [[], [], [1054]], "urine": [[], [], [1054]], "us": [[], [], [1008, 1075]], "usage": [[], [], [632]], "use": [[], [], [262, 346, 462, 473, 558, 569, 575, 593, 606, 634, 638, 677, 694, 729, 813, 886, 928, 938, 958, 1005, 1006, 1008, 1041, 1042, 1060, 1091, 1104, 1111, 1153, 1157, 1162, 1165, 1184, 1248, 1265]], "used": [[], [], [214, 215, 218, 222, 262, 267, 281, 292, 293, 308, 328, 334, 340, 342, 353, 354, 360, 361, 370, 371, 382, 406, 409, 439, 455, 456, 457, 458, 462, 473, 492, 493, 502, 503, 514, 515, 516, 534, 539, 546, 552, 554, 558, 559, 567, 572, 573, 575, 583, 591, 595, 600, 602, 606, 610, 632, 638, 639, 642, 647, 675, 695, 698, 699, 702, 726, 728, 760, 784, 816, 886, 907, 921, 938, 981, 989, 997, 1008, 1012, 1013, 1014, 1018, 1019, 1021, 1030, 1039, 1043, 1058, 1068, 1070, 1071, 1073, 1074, 1090, 1094, 1097, 1112, 1120, 1126, 1130, 1152, 1153, 1154, 1158, 1164, 1173, 1174, 1188, 1191, 1195, 1196, 1204, 1208, 1210, 1212, 1214, 1216, 1220, 1224, 1231, 1232, 1238, 1245, 1247, 1267, 1273]], "uses": [[], [], [382, 470, 571, 693, 1021, 1028, 1035, 1052, 1053, 1059, 1060, 1083, 1084, 1087, 1097, 1099, 1119, 1124, 1133, 1152, 1153, 1172, 1174, 1190, 1198, 1209, 1216, 1227, 1228, 1241, 1245, 1262, 1265, 1266, 1267, 1272]], "using": [[], [], [212, 325, 338, 356, 821, 997, 1021, 1027, 1066, 1068, 1070, 1071, 1093, 1126, 1134, 1150, 1156, 1188, 1195, 1196, 1212, 1252]], "usually": [[], [], [222, 262, 441, 508, 536, 552, 574, 584, 588, 593, 603, 607, 615, 651, 683, 693, 701, 758, 765, 772, 835, 923, 979, 989, 1087, 1097, 1131, 1133, 1223, 1242, 1243, 1252, 1255, 1257]], "utensils": [[], [], [907]], "utterance": [[544, 545, 998, 1264], [998, 1264], [382, 545, 558, 599, 633, 679, 700, 879, 886, 915, 917, 998, 1090, 1137, 1152, 1153, 1214]], "utterances": [[], [], [579, 592]], "uttered": [[], [], [533, 562, 607, 675, 676, 703]], "uttu": [[], [], [1005]], "utz": [[], [], [217]], "uukaraawiciiz": [[], [], [1208, 1231]], "uukari": [[], [], [1208, 1230, 1231]], "uuki": [[], [], [1208, 1230, 1231]], "v": [[], [], [997, 1041]], "vague": [[546, 999], [], [484, 546, 891]], "vakar": [[], [], [1220]], "valency": [[1000], [1000], [738, 740, 881, 992, 1000, 1259]], "valid": [[562], [], [559, 562, 1102]], "value": [[547, 1001], [445], [265, 271, 309, 366, 393, 527, 547, 555, 603, 633, 794, 898, 925, 938]], "values": [[], [], [224, 271, 890, 910]], "vanja": [[], [], [207, 997]], "variant": [[], [], [1031, 1039, 1199]], "varied": [[], [], [272]], "varies": [[], [], [1153]], "variety": [[], [], [267, 304, 493, 513]], "various": [[], [], [360, 361, 837, 892, 1228]], "vary": [[], [], [706]], "vast": [[], [], [917]], "veggie": [[], [], [365, 854]], "venes": [[], [], [467]], "vent": [[], [], [241]], "venus": [[], [], [314, 626]], "ver": [[], [], [1206]], "verb": [[208, 210, 226, 236, 242, 244, 253, 254, 256, 259, 282, 289, 312, 326, 329, 330, 365, 367, 372, 374, 387, 388, 400, 434, 438, 481, 497, 499, 505, 517, 528, 529, 537, 548, 1039, 1185, 1193, 1234, 1265, 1266, 1275], [226, 253, 254, 286, 374, 434, 528, 529, 1185, 1234, 1265, 1275], [208, 210, 222, 226, 231, 236, 242, 244, 253, 254, 256, 259, 282, 286, 289, 312, 326, 329, 330, 365, 367, 372, 374, 387, 388, 400, 434, 438, 481, 493, 497, 499, 505, 517, 528, 529, 537, 548, 549, 578, 869, 903, 904, 906, 1007, 1026, 1039, 1041, 1046, 1054, 1059, 1064, 1091, 1095, 1099, 1101, 1113, 1129, 1140, 1149, 1151, 1157, 1173, 1184, 1185, 1206, 1226, 1227, 1230, 1234, 1236, 1243, 1255, 1257, 1265, 1266, 1267, 1275]], "verbal": [[549, 710, 1267, 1268], [1083], [255, 548, 549, 670, 1073, 1083, 1151, 1245]], "verbalization": [[597], [597], [583]], "verbs": [[1064, 1129, 1151], [1129], [330, 372, 481, 517, 537, 668, 710, 932, 989, 1007, 1064, 1129, 1151, 1165, 1267]], "version": [[], [], [558, 731, 884, 974, 1021]], "versions": [[], [], [467, 1193, 1203]], "vertical": [[], [], [996]], "very": [[], [], [200, 201, 203, 237, 366, 474, 477, 581, 603, 645, 794, 926, 1070, 1081]], "via": [[], [], [262, 381, 437, 451, 472, 540, 564, 603, 645, 958, 1234]], "view": [[], [], [272, 691]], "viewed": [[], [], [426]], "villashka": [[], [], [1143]], "violin": [[], [], [416, 479]], "violinist": [[], [], [1232]], "virtually": [[], [], [668]], "virtue": [[], [], [306]], "visit": [[], [], [373, 654]], "visual": [[], [], [1195]], "vmi": [[], [], [1199]], "voice": [[240, 410, 433, 1156], [240, 255, 433, 1185, 1275], [222, 240, 410, 433, 738, 1030, 1034, 1087, 1156, 1185, 1239, 1265, 1275]], "voici": [[], [], [1193]], "voil": [[], [], [1193, 1242]], "vois": [[], [], [1096]], "volitional": [[], [], [721, 835]], "volitionally": [[], [], [720, 948]], "volvi": [[], [], [1091]], "vruh": [[], [], [1199]], "vs": [[], [], [330, 372, 558]], "vuq": [[], [], [222, 864]], "vy": [[], [], [1095]], "w": [[], [], [1113, 1154, 1195, 1229, 1255]], "wa": [[], [], [536, 1046, 1153, 1184, 1208, 1230, 1231, 1236]], "waa": [[], [], [382, 1152]], "wailing": [[], [], [1242]], "wait": [[], [], [263, 481, 775, 932]], "waiting": [[], [], [481, 932]], "wakh": [[], [], [1059]], "wakwe": [[], [], [1157]], "walk": [[], [], [578, 1011]], "walked": [[], [], [272, 371, 735]], "walking": [[], [], [735, 807]], "wall": [[], [], [336, 633]], "wan": [[], [], [1064]], "wanogoe": [[], [], [215]], "want": [[], [], [1052]], "wants": [[], [], [275, 300, 700, 780, 798, 1262]], "war": [[], [], [256, 768, 1016]], "warlpiri": [[], [], [1015]], "was": [[], [], [204, 205, 276, 285, 286, 288, 325, 353, 466, 477, 533, 571, 607, 613, 629, 631, 632, 639, 681, 688, 690, 703, 748, 781, 893, 907, 926, 996, 1015, 1022, 1056, 1101, 1130, 1137, 1149, 1203, 1211, 1239, 1255, 1268]], "wash": [[], [], [244, 249, 743]], "washed": [[], [], [728, 784, 1184, 1236, 1253]], "washing": [[], [], [249, 728, 784, 921]], "wastebasket": [[], [], [288, 1072, 1249]], "watch": [[], [], [296, 311, 347]], "watched": [[], [], [437]], "watching": [[], [], [437]], "water": [[], [], [279, 715, 1015, 1038]], "watered": [[], [], [297, 390, 524]], "way": [[], [], [553, 647, 700, 873, 884, 889, 1009, 1026, 1070, 1088, 1091, 1138, 1163]], "ways": [[], [], [396]], "we": [[], [], [334, 386, 437, 462, 473, 500, 556, 606, 632, 677, 694, 710, 816, 938, 958, 972, 1008, 1028, 1042, 1265]], "weak": [[], [], [945]], "weaker": [[], [], [918]], "weakest": [[], [], [945]], "weakly": [[], [], [609]], "weather": [[1002], [], [1002]], "week": [[], [], [1112]], "well": [[], [], [488, 493, 565, 693, 760, 795, 812, 892, 1018, 1054, 1090]], "welsh": [[], [], [1100, 1203]], "welwch": [[], [], [1100]], "wendy": [[], [], [893, 969]], "went": [[], [], [274, 276, 692, 733, 772, 781, 796, 997, 1005, 1059, 1064]], "were": [[], [], [255, 274, 298, 314, 336, 408, 410, 433, 467, 609, 626, 633, 1132, 1133]], "west": [[], [], [222, 864]], "wet": [[], [], [715]], "what": [[], [], [217, 272, 275, 321, 338, 353, 462, 599, 617, 628, 629, 630, 639, 679, 685, 687, 688, 690, 780, 816, 902, 927, 944, 1028, 1052, 1097, 1149, 1210, 1262, 1268]], "when": [[], [], [215, 218, 274, 281, 308, 341, 382, 491, 519, 539, 543, 604, 675, 760, 838, 1065, 1091, 1133, 1152, 1164, 1272, 1273]], "whenever": [[], [], [341, 838]], "where": [[], [], [213, 271, 292, 293, 313, 322, 357, 360, 361, 418, 484, 514, 515, 574, 605, 619, 625, 691, 692, 696, 698, 699, 731, 748, 762, 867, 873, 884, 886, 893, 931, 945, 953, 972, 974, 1005, 1015, 1028, 1043, 1059, 1060, 1061, 1062, 1091, 1116, 1151, 1152, 1153, 1158, 1203, 1220, 1228, 1248, 1262, 1271]], "whereas": [[], [], [383, 564, 882, 1059]], "whether": [[], [], [332, 349, 368, 445, 695, 812, 831, 844, 893, 927, 962, 1028, 1037, 1064, 1129, 1249]], "which": [[], [], [217, 227, 228, 229, 231, 235, 239, 249, 252, 255, 266, 281, 286, 287, 298, 319, 322, 324, 336, 338, 357, 359, 368, 370, 379, 386, 388, 389, 406, 418, 424, 433, 437, 441, 450, 459, 461, 464, 467, 471, 489, 500, 508, 519, 522, 529, 535, 554, 558, 561, 562, 567, 571, 574, 579, 583, 586, 590, 600, 601, 605, 607, 608, 609, 610, 611, 612, 615, 616, 617, 618, 620, 625, 626, 627, 628, 629, 630, 632, 633, 639, 642, 643, 644, 645, 646, 648, 651, 653, 654, 655, 656, 668, 671, 673, 675, 676, 681, 687, 688, 690, 691, 696, 705, 710, 721, 735, 749, 756, 761, 765, 773, 795, 801, 815, 821, 824, 831, 838, 839, 844, 854, 858, 862, 863, 864, 877, 892, 907, 922, 923, 931, 932, 952, 965, 968, 976, 977, 996, 997, 998, 1003, 1004, 1007, 1010, 1012, 1013, 1014, 1015, 1016, 1017, 1018, 1019, 1021, 1024, 1025, 1027, 1028, 1030, 1031, 1035, 1038, 1039, 1044, 1046, 1049, 1050, 1054, 1058, 1061, 1062, 1065, 1068, 1070, 1071, 1073, 1074, 1075, 1079, 1083, 1084, 1086, 1087, 1090, 1094, 1095, 1096, 1097, 1100, 1101, 1103, 1104, 1106, 1108, 1110, 1111, 1112, 1113, 1115, 1116, 1118, 1119, 1121, 1122, 1124, 1126, 1130, 1131, 1132, 1133, 1135, 1137, 1138, 1141, 1142, 1143, 1146, 1147, 1148, 1150, 1153, 1155, 1158, 1162, 1163, 1167, 1169, 1173, 1179, 1180, 1182, 1185, 1186, 1187, 1188, 1190, 1191, 1193, 1194, 1198, 1199, 1201, 1202, 1203, 1204, 1205, 1206, 1207, 1209, 1211, 1219, 1220, 1221, 1222, 1223, 1228, 1229, 1231, 1232, 1233, 1238, 1239, 1241, 1243, 1244, 1245, 1251, 1252, 1253, 1255, 1257, 1259, 1260, 1262, 1265, 1267, 1269, 1271, 1272, 1275, 1276]], "while": [[], [], [383, 676, 710, 953, 1007, 1062]], "who": [[], [], [353, 363, 364, 368, 370, 606, 632, 639, 648, 649, 681, 826, 919, 927, 948, 1094, 1101, 1194, 1214]], "whole": [[900], [900], [286, 287, 306, 319, 347, 475, 528, 529, 540, 574, 590, 613, 673, 703, 900, 918, 1093, 1143]], "whom": [[], [], [265, 334, 502, 534, 927, 1143]], "whose": [[], [], [200, 219, 239, 370, 381, 407, 445, 451, 491, 549, 601, 633, 645, 667, 684, 695, 698, 699, 708, 738, 778, 832, 908, 964]], "wide": [[], [], [493, 558, 713]], "widely": [[], [], [573, 1143]], "wife": [[], [], [1157, 1222]], "will": [[], [], [225, 277, 305, 462, 473, 478, 677, 694, 710, 729, 731, 783, 788, 795, 812, 847, 852, 887, 928, 931, 938, 958, 1228, 1241, 1243]], "willing": [[], [], [945]], "win": [[], [], [551, 1003]], "wind": [[], [], [241, 1002]], "windmill": [[], [], [241]], "window": [[], [], [408, 499, 539, 711, 720, 727, 749, 782, 856, 899, 905, 1067, 1162]], "wine": [[], [], [213, 214, 283, 392, 605]], "winged": [[], [], [574]], "wings": [[], [], [574]], "winner": [[], [], [412]], "winning": [[], [], [261, 332, 349, 551, 773, 831, 844, 1003]], "wish": [[], [], [654]], "wishes": [[], [], [551, 795, 1003]], "wishing": [[550, 551, 1003], [], [551, 815, 1003]], "with": [[1269], [], [204, 207, 212, 222, 228, 234, 235, 237, 255, 275, 279, 281, 291, 292, 293, 294, 301, 305, 325, 328, 340, 356, 360, 361, 371, 372, 377, 381, 382, 385, 408, 426, 451, 452, 488, 493, 514, 515, 519, 533, 554, 564, 565, 574, 579, 580, 595, 597, 600, 607, 608, 610, 615, 619, 639, 646, 655, 681, 688, 692, 698, 699, 700, 703, 704, 705, 707, 726, 727, 728, 731, 738, 740, 749, 772, 780, 782, 788, 811, 817, 856, 862, 879, 880, 881, 882, 883, 901, 902, 910, 921, 925, 927, 962, 976, 979, 987, 992, 997, 1007, 1009, 1010, 1012, 1016, 1018, 1019, 1021, 1022, 1025, 1027, 1035, 1042, 1043, 1046, 1050, 1056, 1059, 1064, 1067, 1068, 1070, 1071, 1072, 1074, 1075, 1079, 1090, 1091, 1094, 1097, 1101, 1104, 1108, 1115, 1116, 1124, 1129, 1133, 1137, 1138, 1141, 1142, 1149, 1150, 1151, 1152, 1153, 1155, 1157, 1158, 1162, 1163, 1173, 1184, 1185, 1186, 1187, 1188, 1190, 1198, 1205, 1206, 1214, 1220, 1231, 1232, 1233, 1234, 1236, 1237, 1240, 1241, 1242, 1243, 1244, 1248, 1252, 1255, 1257, 1260, 1265, 1269, 1272, 1275]], "without": [[], [], [633, 634, 687, 884, 889, 1002, 1039, 1146, 1163, 1190, 1234, 1275, 1277]], "wo": [[], [], [1150, 1152]], "woal": [[], [], [1016]], "woaroa": [[], [], [1016]], "wolof": [[], [], [1059]], "woman": [[], [], [845, 1031, 1239]], "women": [[], [], [540, 891, 1208, 1231]], "won": [[], [], [261, 267, 332, 349, 377, 551, 773, 831, 844, 862, 945, 1003]], "wonder": [[], [], [368]], "wondered": [[], [], [368]], "wonderful": [[], [], [489]], "wood": [[], [], [389, 1126]], "word": [[598, 1041, 1270], [], [201, 281, 304, 311, 347, 416, 548, 562, 566, 571, 578, 579, 598, 794, 872, 891, 938, 1017, 1019, 1041, 1058, 1079, 1081, 1112, 1126, 1129, 1164, 1201, 1203, 1206, 1251, 1267]], "words": [[], [], [559, 578, 592, 593, 598]], "work": [[], [], [304]], "worked": [[], [], [1031, 1188]], "worker": [[], [], [1012]], "works": [[], [], [342]], "world": [[], [], [278, 303, 362, 560, 589, 596, 614, 620, 638, 644, 654, 684, 698, 699, 708, 788, 1143]], "would": [[], [], [268, 270, 275, 276, 368, 378, 610, 780, 781, 847, 885, 945, 1265]], "write": [[], [], [1005, 1046]], "writer": [[], [], [462]], "writing": [[], [], [1046]], "wrong": [[], [], [1028]], "wrote": [[], [], [1005, 1141, 1142, 1163]], "x": [[], [], [353, 604, 632, 639, 681, 1041]], "xal": [[], [], [235]], "xi": [[], [], [346]], "xubij": [[], [], [217]], "y": [[], [446], [467, 828, 1035, 1042, 1091, 1117, 1129, 1221, 1239]], "ya": [[], [], [1011, 1127]], "yad": [[], [], [1214]], "yamade": [[], [], [1031]], "yand": [[], [], [1157]], "yankiri": [[], [], [1015]], "yard": [[], [], [609, 1203]], "ye": [[], [], [574]], "yeah": [[], [], [655, 673, 707]], "years": [[], [], [1112]], "yedim": [[], [], [1206]], "yes": [[1271, 1272], [446, 1271, 1272], [446, 447, 672, 1025, 1272]], "yesterday": [[], [], [1220]], "yet": [[], [], [231, 488, 1228]], "yi": [[], [], [1150]], "yid": [[], [], [1247]], "yma": [[], [], [1203]], "yosiko": [[], [], [1153]], "you": [[], [], [213, 225, 275, 277, 278, 304, 322, 324, 338, 357, 446, 447, 478, 488, 502, 605, 610, 614, 634, 655, 672, 673, 676, 684, 707, 710, 729, 731, 780, 783, 788, 821, 836, 885, 887, 916, 928, 945, 962, 1011, 1025, 1027, 1035, 1042, 1043, 1084, 1097, 1100, 1103, 1127, 1141, 1142, 1143, 1191, 1193, 1214, 1228, 1251, 1262, 1271, 1272]], "young": [[], [], [608, 1018, 1169]], "younger": [[], [], [467]], "your": [[], [], [275, 359, 447, 672, 710, 778, 780, 788, 821, 839, 887, 964, 1062, 1141, 1142, 1228]], "yours": [[], [], [1062]], "yt": [[], [], [1184, 1236]], "yukaghir": [[], [], [1205]], "yuwaalaraay": [[], [], [1006, 1104, 1105]], "z": [[], [], [1004, 1054, 1255]], "zalame": [[], [], [1238]], "zeiya": [[], [], [1208, 1231]], "zero": [[1032, 1200, 1273, 1274, 1275, 1276, 1277], [1275, 1276], [488, 554, 692, 917, 1006, 1060, 1091, 1104, 1162, 1165, 1190, 1191, 1205, 1220, 1273, 1275]], "zibun": [[], [], [1153]], "zizitu": [[], [], [1174]]}};
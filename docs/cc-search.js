@@ -0,0 +1,182 @@
+///////////////////////////////////////////////////////////////////////////////
+// The CCs and their relations
+//
+// This file is used both by the glossary that is built in the browser (cc-database.js),
+// and by the pre-rendered glossary (cc-glossary.js). Each CC in DATA.concepts has its element in cc.elem.
+
+function index_concepts() {
+    DATA.concepts = {};
+    for (const cc of DATA.nodes) {
+        cc.related = [];
+        DATA.concepts[cc.id] = cc;
+    }
+    DATA.relations = {};
+    for (const e of DATA.edges) {
+        DATA.concepts[e.start].related.push(e.end);
+        DATA.concepts[e.end].related.push(e.start);
+        if (!(e.rel in DATA.relations)) DATA.relations[e.rel] = {start: {}, end: {}};
+        (DATA.relations[e.rel].start[e.start] ??= []).push(e.end);
+        (DATA.relations[e.rel].end[e.end] ??= []).push(e.start);
+    }
+}
+
+function stripHTML(html) {
+    const tmp = document.createElement("div");
+    tmp.innerHTML = html;
+    return tmp.textContent || "";
+}
+
+
+///////////////////////////////////////////////////////////////////////////////
+// Searching/filtering CCs
+
+function init_searchfilter() {
+    for (const id in DATA.concepts) {
+        const cc = DATA.concepts[id];
+        cc.search = {
+            name: (cc.alias || []).concat(cc.name).join("\n"),
+            definition: stripHTML(cc.definition),
+            relation: cc.related.map((c) => DATA.concepts[c].name).join("\n"),
+        };
+        cc.shown = true;
+    }
+    document.addEventListener('click', (event) => {
+        if (event.target.closest?.("a")) setTimeout(filter_ccs, 100);
+    });
+    for (const elem of document.querySelectorAll('#search input')) {
+        elem.addEventListener('input', filter_ccs);
+    }
+    document.getElementById("search").addEventListener("toggle", filter_ccs);
+    window.addEventListener("hashchange", filter_ccs);
+    filter_ccs();
+}
+
+
+// The elements that are currently highlighted, so that we don't have to unmark the whole page
+let MARKED = [];
+
+function filter_ccs() {
+    for (const elem of MARKED) new Mark(elem).unmark();
+    MARKED = [];
+
+    const current_id = window.location.hash.replace("#", "");
+    const current_elem = current_id && document.getElementById(current_id);
+    if (current_elem) {
+        const current_name = current_elem.querySelector(".cc-header-name");
+        new Mark(current_name).markRanges([{
+            start: 0, length: current_name.innerText.trim().length,
+        }]);
+        MARKED.push(current_name);
+    }
+
+    // Define search variables, based on current search term
+    // We only care about alphanumeric characters
+    let search_term = document.getElementById("search-box").value.trim().replace(/\W+/g, " ");
+    const is_search = (
+        document.getElementById("search").hasAttribute("open") &&
+        search_term.length >= 3
+    );
+    if (!is_search) {
+        for (const id in DATA.concepts) show_cc(DATA.concepts[id], true);
+        document.getElementById("search-info").innerText = `Type at least 3 characters`;
+        return;
+    }
+
+    const match_type = document.querySelector('#search input[name="matchtype"]:checked')?.value;
+    const candidates = search_candidates(search_term.toLowerCase().split(" "), match_type);
+    if (match_type === "startswith") {
+        search_term = "^" + search_term.replaceAll(" ", "\\S*?\\s*");
+    } else if (match_type === "wordstarts") {
+        search_term = "\\b" + search_term.replaceAll(" ", ".*?\\b");
+    } else {
+        search_term = search_term.replaceAll(" ", ".*?");
+    }
+    const regex = new RegExp(search_term, "im");
+    const mark_regex = new RegExp(search_term.replace("^", "\\b"), "igm");
+
+    const filter_types = [...document.querySelectorAll('#search input[name="filtertype"]:checked')].map((e) => e.value);
+    if (DATA.shards && filter_types.includes("definition") && !all_shards_loaded()) {
+        // Search the definitions that are already loaded, and search again when all are loaded
+        load_all_shards().then(filter_ccs);
+    }
+    const cc_types = new Set([...document.querySelectorAll('#search input[name="cctype"]:checked')].map((e) => e.value));
+
+    let count = 0;
+    for (const id in DATA.concepts) {
+        const cc = DATA.concepts[id];
+        const show = (
+            cc_types.has(cc.type) &&
+            filter_types.some((type) => (!candidates || candidates[type].has(id)) && regex.test(cc.search[type]))
+        );
+        show_cc(cc, id === current_id || show);
+        if (id === current_id || show) {
+            count++;
+            for (const type of filter_types) {
+                const contents = cc.elem.querySelectorAll("." + type);
+                new Mark(contents).markRegExp(mark_regex, {acrossElements: true});
+                MARKED.push(...contents);
+            }
+        }
+    }
+
+    document.getElementById("search-info").innerText = `Showing ${count} CCs (out of ${DATA.nodes.length})`;
+    document.getElementById("search-box").focus();
+    if (current_elem) current_elem.scrollIntoView();
+}
+
+
+function show_cc(cc, show) {
+    if (cc.shown !== show) {
+        cc.elem.style.display = show ? "" : "none";
+        cc.shown = show;
+    }
+}
+
+
+// Look up the search words in the search index (cc-search-index.js), and return the ids
+// of the CCs that can match for each filter type, or null if the search index isn't loaded (yet).
+// The candidates always include all real matches, which are then tested with the regex.
+function search_candidates(words, match_type) {
+    if (typeof SEARCH_INDEX === "undefined") return null;
+    // Javascript sorts integer-like keys first, so we have to sort the words ourselves
+    SEARCH_INDEX.words ??= Object.keys(SEARCH_INDEX.tokens).sort();
+    let names_aliases = null, definitions = null, relations = null;
+    words.forEach((word, i) => {
+        // Only "starts with" and "words start with" require words to start a token,
+        // and "starts with" only requires it of the first word
+        const prefix = match_type === "wordstarts" || (match_type === "startswith" && i === 0);
+        const found = [new Set(), new Set(), new Set()];
+        for (const token of search_tokens(word, prefix)) {
+            SEARCH_INDEX.tokens[token].forEach((ccs, field) => {
+                for (const n of ccs) found[field].add(SEARCH_INDEX.ids[n]);
+            });
+        }
+        names_aliases = intersect(names_aliases, new Set([...found[0], ...found[1]]));
+        definitions = intersect(definitions, found[2]);
+        // The relation filter searches the names of related CCs, and a match can span several of them
+        const related = new Set();
+        for (const id of found[0]) {
+            for (const rel of DATA.concepts[id]?.related || []) related.add(rel);
+        }
+        relations = intersect(relations, related);
+    });
+    return {name: names_aliases, definition: definitions, relation: relations};
+}
+
+function search_tokens(word, prefix) {
+    const words = SEARCH_INDEX.words;
+    if (!prefix) return words.filter((token) => token.includes(word));
+    // Binary search for the first token that starts with the word
+    let lo = 0, hi = words.length;
+    while (lo < hi) {
+        const mid = (lo + hi) >> 1;
+        if (words[mid] < word) lo = mid + 1; else hi = mid;
+    }
+    const tokens = [];
+    while (lo < words.length && words[lo].startsWith(word)) tokens.push(words[lo++]);
+    return tokens;
+}
+
+function intersect(set, other) {
+    return set === null ? other : new Set([...set].filter((x) => other.has(x)));
+}
@@ -0,0 +1,37 @@
+///////////////////////////////////////////////////////////////////////////////
+// Loading the definitions and examples of the CCs on demand
+//
+// In a sharded export, DATA.shards is a list of file names, and each node has the number of the shard
+// that contains its definition and examples. When a shard file is loaded, it replaces its name in
+// DATA.shards with its contents, which are then merged into the nodes.
+// After that, a "shardloaded" event is sent, with the ids of the loaded nodes as detail.
+
+const SHARD_PROMISES = {};
+let SHARD_NODES = null;
+
+function load_shard(n) {
+    if (!DATA.shards || n === undefined) return Promise.resolve();
+    return SHARD_PROMISES[n] ??= new Promise((resolve, reject) => {
+        const script = document.createElement("script");
+        script.src = DATA.shards[n];
+        script.onload = () => {
+            SHARD_NODES ??= Object.fromEntries(DATA.nodes.map((node) => [node.id, node]));
+            const shard = DATA.shards[n];
+            for (const id in shard) {
+                Object.assign(SHARD_NODES[id], shard[id]);
+            }
+            document.dispatchEvent(new CustomEvent("shardloaded", {detail: Object.keys(shard)}));
+            resolve();
+        };
+        script.onerror = () => reject(new Error(`Could not load shard ${script.src}`));
+        document.head.appendChild(script);
+    });
+}
+
+function load_all_shards() {
+    return Promise.all((DATA.shards || []).map((_, n) => load_shard(n)));
+}
+
+function all_shards_loaded() {
+    return (DATA.shards || []).every((shard) => typeof shard !== "string");
+}
@@ -0,0 +1,145 @@
+"""
+The relation graph of the database as NumPy arrays, with compressed sparse row (CSR) adjacency for each relation.
+"""
+
+import io
+import zipfile
+from pathlib import Path
+from typing import BinaryIO
+
+import numpy as np
+
+from validation import CCType, Relation, Glosses
+
+
+# The CC types in the order of their codes in the type array
+TYPES = list(CCType)
+
+
+class GraphArrays:
+    """
+    The nodes are numbered by sorted id. For each relation, the forward adjacency goes from a CC to
+    its targets (as in the database), and the reverse adjacency from a CC to the CCs that point to it.
+    The neighbours of node n are indices[indptr[n]:indptr[n+1]], in increasing order.
+    The type array has the position of each CC's type in TYPES, and the section array has the node
+    of the first section of each CC (-1 if it has none).
+    """
+    version: str
+    ids: np.ndarray
+    types: np.ndarray
+    sections: np.ndarray
+    forward: dict[Relation, tuple[np.ndarray, np.ndarray]]
+    reverse: dict[Relation, tuple[np.ndarray, np.ndarray]]
+
+    def __init__(self, arrays: dict[str, np.ndarray]):
+        self.version = str(arrays['version'])
+        self.ids = arrays['ids']
+        self.types = arrays['types']
+        self.sections = arrays['sections']
+        self.forward = {rel: (arrays[f'{rel.value}.indptr'], arrays[f'{rel.value}.indices']) for rel in Relation}
+        self.reverse = {rel: (arrays[f'{rel.value}.reverse.indptr'], arrays[f'{rel.value}.reverse.indices'])
+                        for rel in Relation}
+
+    @classmethod
+    def from_glosses(cls, glosses: Glosses, version: str = "") -> 'GraphArrays':
+        return cls(graph_arrays(glosses, version))
+
+    @classmethod
+    def load(cls, file: str | Path, mmap: bool = True) -> 'GraphArrays':
+        """Load the arrays from an .npz file, by default memory-mapped so that nothing is read until it's used."""
+        return cls(load_npz(file) if mmap else dict(np.load(file)))
+
+    def arrays(self) -> dict[str, np.ndarray]:
+        arrays = {'version': np.array(self.version), 'ids': self.ids, 'types': self.types, 'sections': self.sections}
+        for rel in Relation:
+            arrays[f'{rel.value}.indptr'], arrays[f'{rel.value}.indices'] = self.forward[rel]
+            arrays[f'{rel.value}.reverse.indptr'], arrays[f'{rel.value}.reverse.indices'] = self.reverse[rel]
+        return arrays
+
+    def save(self, file: str | Path | BinaryIO) -> None:
+        """Save as an uncompressed .npz file, which can be memory-mapped by load."""
+        np.savez(file, **self.arrays())  # type: ignore
+
+    def node(self, id: str) -> int:
+        n = int(np.searchsorted(self.ids, id))
+        if n == len(self.ids) or self.ids[n] != id:
+            raise ValueError(f"Unknown CC id: {id}")
+        return n
+
+    def neighbours(self, n: int, relation: Relation, reverse: bool = False) -> np.ndarray:
+        indptr, indices = (self.reverse if reverse else self.forward)[relation]
+        return indices[indptr[n]:indptr[n+1]]
+
+    def edges(self, relation: Relation) -> tuple[np.ndarray, np.ndarray]:
+        """All edges of the relation, as arrays of sources and targets."""
+        indptr, indices = self.forward[relation]
+        return np.repeat(np.arange(len(self.ids), dtype=indices.dtype), np.diff(indptr)), indices
+
+
+def graph_arrays(glosses: Glosses, version: str = "") -> dict[str, np.ndarray]:
+    """All arrays of the graph, with the same names as in the exported .npz file."""
+    ids = sorted(glosses)
+    index = {id: n for n, id in enumerate(ids)}
+    typecodes = {cctype: code for code, cctype in enumerate(TYPES)}
+    arrays: dict[str, np.ndarray] = {
+        'version': np.array(version),
+        'ids': np.array(ids, dtype=str),
+        'types': np.array([typecodes[glosses[id].Type] for id in ids], dtype=np.int8),
+        'sections': np.array([
+            index.get(next(iter(glosses[id].Relations.get(Relation.Sections, ())), ""), -1) for id in ids
+        ], dtype=np.int32),
+    }
+    for rel in Relation:
+        edges = np.array([
+            (n, index[relid])
+            for n, id in enumerate(ids)
+            for relid in glosses[id].Relations.get(rel, ())
+            if relid in index
+        ], dtype=np.int32).reshape(-1, 2)
+        arrays[f'{rel.value}.indptr'], arrays[f'{rel.value}.indices'] = csr(edges[:, 0], edges[:, 1], len(ids))
+        arrays[f'{rel.value}.reverse.indptr'], arrays[f'{rel.value}.reverse.indices'] = csr(edges[:, 1], edges[:, 0], len(ids))
+    return arrays
+
+
+def csr(sources: np.ndarray, targets: np.ndarray, size: int) -> tuple[np.ndarray, np.ndarray]:
+    """The CSR adjacency of the edges, with the neighbours of each node sorted and without duplicates."""
+    edges = np.unique(np.stack([sources, targets], axis=1), axis=0) if len(sources) else np.empty((0, 2), np.int32)
+    indptr = np.zeros(size + 1, dtype=np.int32)
+    np.cumsum(np.bincount(edges[:, 0], minlength=size), out=indptr[1:])
+    return indptr, edges[:, 1].astype(np.int32)
+
+
+def npz_bytes(arrays: dict[str, np.ndarray]) -> bytes:
+    buffer = io.BytesIO()
+    np.savez(buffer, **arrays)  # type: ignore
+    return buffer.getvalue()
+
+
+def load_npz(file: str | Path) -> dict[str, np.ndarray]:
+    """
+    Memory-map all arrays in an uncompressed .npz file. Each array is stored as an .npy file in the zip archive,
+    so it can be mapped directly at the offset of its data.
+    """
+    arrays: dict[str, np.ndarray] = {}
+    with open(file, 'rb') as F, zipfile.ZipFile(F) as archive:
+        for info in archive.infolist():
+            if info.compress_type != zipfile.ZIP_STORED:
+                raise ValueError(f"Cannot memory-map the compressed array {info.filename} in {file}")
+            F.seek(info.header_offset)
+            header = F.read(30)
+            namelength, extralength = int.from_bytes(header[26:28], 'little'), int.from_bytes(header[28:30], 'little')
+            F.seek(info.header_offset + 30 + namelength + extralength)
+            if np.lib.format.read_magic(F) == (1, 0):
+                shape, fortran, dtype = np.lib.format.read_array_header_1_0(F)
+            else:
+                shape, fortran, dtype = np.lib.format.read_array_header_2_0(F)
+            name = info.filename.removesuffix('.npy')
+            if dtype.hasobject:
+                raise ValueError(f"Cannot memory-map the object array {name} in {file}")
+            if len(shape) == 0 or 0 in shape:
+                # Scalars and empty arrays cannot be memory-mapped
+                with archive.open(info) as member:
+                    arrays[name] = np.load(member)
+            else:
+                arrays[name] = np.memmap(file, dtype, 'r', F.tell(), shape, 'F' if fortran else 'C')
+    return arrays
@@ -0,0 +1,112 @@
+"""
+Deterministic force-directed layouts of the graphs in docs/cc-graphs.json, computed with NumPy.
+"""
+
+import json
+import hashlib
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from validation import CCType, Relation, Glosses
+
+
+# The graphs of the visualization: their names, node types and relations
+GRAPHS_FILE = Path(__file__).parent / 'docs' / 'cc-graphs.json'
+
+# Ideal edge length, the same as springLength in the vis-network settings
+EDGE_LENGTH = 100.0
+
+# Number of iterations of the force simulation
+ITERATIONS = 200
+
+# How strongly the nodes repel each other, relative to the edge length
+REPULSION = 0.2
+
+# How strongly all nodes are pulled towards the centre, so that unconnected nodes don't drift away
+GRAVITY = 0.05
+
+
+def read_graphs(graphsfile: Path = GRAPHS_FILE) -> dict[str, dict[str, Any]]:
+    with open(graphsfile) as F:
+        return json.load(F)
+
+
+def graph_edges(glosses: Glosses, ids: list[str], relations: list[Relation]) -> np.ndarray:
+    """All edges between the given CCs, as an array of index pairs."""
+    index = {id: n for n, id in enumerate(ids)}
+    edges = [
+        (index[id], index[relid])
+        for id in ids
+        for rel in relations
+        for relid in glosses[id].Relations.get(rel, ())
+        if relid in index and relid != id
+    ]
+    return np.array(sorted(set(edges)), dtype=np.intp).reshape(-1, 2)
+
+
+def initial_positions(ids: list[str]) -> np.ndarray:
+    """
+    Start positions that only depend on each id, so that adding or removing a CC doesn't move all the others.
+    """
+    radius = EDGE_LENGTH * np.sqrt(len(ids))
+    positions = np.empty((len(ids), 2))
+    for n, id in enumerate(ids):
+        digest = hashlib.sha256(id.encode()).digest()
+        positions[n] = np.frombuffer(digest[:8], dtype=np.uint32) / 2**32 * 2 - 1
+    return positions * radius
+
+
+def force_layout(ids: list[str], edges: np.ndarray, iterations: int = ITERATIONS) -> np.ndarray:
+    """
+    Fruchterman-Reingold layout with central gravity, where the maximum displacement of each node
+    decreases linearly over the iterations. There is no randomness, so the result is deterministic.
+    """
+    positions = initial_positions(ids).astype(np.float32)
+    if len(ids) < 2:
+        return positions
+    k = np.float32(EDGE_LENGTH)
+    repulsion = np.float32(REPULSION * EDGE_LENGTH**2)
+    start, end = edges[:, 0], edges[:, 1]
+    temperature = EDGE_LENGTH * np.sqrt(len(ids)) / 2
+    cooling = temperature / iterations
+    for _ in range(iterations):
+        x, y = positions[:, 0], positions[:, 1]
+        dx = x[:, None] - x[None, :]
+        dy = y[:, None] - y[None, :]
+        # Repulsion between all pairs of nodes: repulsion / distance, in the direction of (dx, dy)
+        force = dx * dx
+        force += dy * dy
+        np.maximum(force, 1e-4, out=force)
+        np.divide(repulsion, force, out=force)
+        displacement = np.stack([(dx * force).sum(axis=1), (dy * force).sum(axis=1)], axis=1)
+        # Attraction along the edges: distance^2 / k, in the direction of the edge
+        edelta = positions[start] - positions[end]
+        pull = edelta * (np.hypot(edelta[:, 0], edelta[:, 1]) / k)[:, None]
+        np.subtract.at(displacement, start, pull)
+        np.add.at(displacement, end, pull)
+        displacement -= GRAVITY * positions
+        length = np.maximum(np.hypot(displacement[:, 0], displacement[:, 1]), 0.01)
+        positions += displacement * (np.minimum(length, temperature) / length)[:, None]
+        temperature -= cooling
+    return positions - positions.mean(axis=0)
+
+
+# Layouts that have already been computed in this process (used when watching the database)
+LAYOUT_CACHE: dict[tuple[tuple[str, ...], bytes], dict[str, list[int]]] = {}
+
+def graph_layouts(glosses: Glosses, graphs: dict[str, dict[str, Any]]) -> dict[str, dict[str, list[int]]]:
+    """The layout of each graph, with all its node types and relations, as integer coordinates for each id."""
+    layouts: dict[str, dict[str, list[int]]] = {}
+    for name, graph in graphs.items():
+        types = {CCType(cctype) for cctype, show in graph['nodes'].items() if show}
+        relations = [Relation(rel) for rel, show in graph['edges'].items() if show]
+        ids = sorted(id for id, item in glosses.items() if item.Type in types)
+        edges = graph_edges(glosses, ids, relations)
+        key = (tuple(ids), edges.tobytes())
+        if key not in LAYOUT_CACHE:
+            positions = force_layout(ids, edges)
+            LAYOUT_CACHE[key] = {id: [round(x), round(y)] for id, (x, y) in zip(ids, positions.tolist())}
+        layouts[name] = LAYOUT_CACHE[key]
+    return layouts
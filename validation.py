@@ -1,11 +1,19 @@
 
 import sys
 import re
+import time
 import yaml
+import inspect
+import itertools
+import functools
+import tracemalloc
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
 from pathlib import Path
-from typing import Any
-from pydantic import BaseModel, ConfigDict, ValidationError
+from typing import Any, NamedTuple
+from collections.abc import Iterable, Iterator
+from pydantic import BaseModel, ConfigDict, TypeAdapter, ValidationError
 
 
 ###############################################################################
@@ -54,6 +62,18 @@ class GlossItem(BaseModel):
 
 Glosses = dict[str, GlossItem]
 
+# Precompiled validator for loading all items in one call
+GLOSSITEM_LIST = TypeAdapter(list[GlossItem])
+
+# Incoming edges: target id -> relation -> ids of the CCs that point to the target
+ReverseRelations = dict[str, dict[Relation, list[str]]]
+
+# A warning or error from a validator: ("warning" or "error", category, message)
+Diagnostic = tuple[str, str, str]
+
+# The warnings and errors that were reported for a CC, as (category, message)
+Diagnostics = tuple[list[tuple[str, str]], list[tuple[str, str]]]
+
 
 # What general definitions do different types correspond to?
 GENERIC_TYPES = {
@@ -113,21 +133,35 @@ IGNORE_CODEWORDS_CCS = {
 def parse_yaml_database(glossfile: str | Path, keep_deleted: bool = False) -> Glosses:
     reset_errors_and_warnings()
     glosses: Glosses = {}
-    with open(glossfile) as F:
-        for item in yaml.load(F, Loader=yaml.CLoader):
-            if not keep_deleted and item.get('Status') == "deleted":
-                continue
-            try:
-                gitem = convert_glossitem(item)
-                gitem.Alias = expand_aliases(gitem)
-                glosses[gitem.Id] = gitem
-            except ValidationError as e:
-                error(f"while parsing {item.get('Id')!r}", str(e))
+    with open(glossfile) as F, timed("yaml.load"):
+        items = yaml.load(F, Loader=yaml.CLoader)
+    for gitem in parse_items(items, keep_deleted):
+        glosses[gitem.Id] = gitem
     add_sections(glosses)
     report_errors_and_warnings("parsing the YAML database")
     return glosses
 
 
+def parse_items(items: Iterable[dict[str, Any]], keep_deleted: bool = False) -> list[GlossItem]:
+    """
+    Validate all items in one bulk call. If that fails, the items are validated one by one instead,
+    so that the errors are reported for each item in the same way as before.
+    """
+    items = [item for item in items if keep_deleted or item.get('Status') != "deleted"]
+    try:
+        gitems = GLOSSITEM_LIST.validate_python([split_relations(item) for item in items])
+    except ValidationError:
+        gitems = []
+        for item in items:
+            try:
+                gitems.append(convert_glossitem(item))
+            except ValidationError as e:
+                error(f"while parsing {item.get('Id')!r}", str(e))
+    for gitem in gitems:
+        gitem.Alias = expand_aliases(gitem)
+    return gitems
+
+
 BOOK_ID = "book"
 
 def add_sections(glosses: Glosses):
@@ -149,100 +183,266 @@ def add_sections(glosses: Glosses):
 
 
 def convert_glossitem(item: dict[str, Any]) -> GlossItem:
-    newitem = {key: value for key, value in item.items() if key not in Relation.__members__}
-    newitem['Relations'] = {key: value for key, value in item.items() if key in Relation.__members__}
-    return GlossItem(**newitem)
+    return GlossItem.model_validate(split_relations(item))
+
+
+def split_relations(item: dict[str, Any]) -> dict[str, Any]:
+    """
+    Move the relations into their own dict, in a single pass over the item.
+    The ids and relation targets are interned, so that each id is only stored once.
+    """
+    newitem: dict[str, Any] = {}
+    relations: dict[str, Any] = {}
+    for key, value in item.items():
+        if key in Relation.__members__:
+            if isinstance(value, list):
+                value = [sys.intern(relid) if type(relid) is str else relid for relid in value]
+            relations[key] = value
+        elif key == 'Id' and type(value) is str:
+            newitem[key] = sys.intern(value)
+        else:
+            newitem[key] = value
+    newitem['Relations'] = relations
+    return newitem
 
 
-def validate_database(glosses: Glosses) -> None:
+def reverse_relations(glosses: Glosses) -> ReverseRelations:
+    """Build the reverse adjacency of all relations, so that incoming edges can be looked up directly."""
+    incoming: ReverseRelations = {}
+    for id, item in glosses.items():
+        for rel, relids in item.Relations.items():
+            for relid in relids:
+                incoming.setdefault(relid, {}).setdefault(rel, []).append(id)
+    return incoming
+
+
+def validate_database(glosses: Glosses, previous: Glosses | None = None,
+                      diagnostics: dict[str, Diagnostics] | None = None, jobs: int = 1) -> dict[str, Diagnostics]:
+    """
+    Validate the database, and return the warnings and errors for each CC.
+    If the previous glosses and their diagnostics are given, only the CCs affected by the changes are validated.
+    With several jobs, the CCs are validated in parallel processes.
+    """
     reset_errors_and_warnings()
-    run_validators(glosses)
+    if previous is None or diagnostics is None:
+        diagnostics = run_validators(glosses, jobs=jobs)
+    else:
+        affected = affected_ids(previous, glosses, changed_ids(previous, glosses))
+        diagnostics = {id: diags for id, diags in diagnostics.items() if id in glosses and id not in affected}
+        for warnings, errors in diagnostics.values():
+            ERROR_SETTINGS["warnings"].extend(warnings)
+            ERROR_SETTINGS["errors"].extend(errors)
+        diagnostics.update(run_validators(glosses, affected, jobs=jobs))
     report_errors_and_warnings("validating the database")
+    return diagnostics
 
 
 ###########################################################################
 ## Expanding aliases
 
-def expand_aliases(item: GlossItem) -> list[str]:
+# The maximum number of variants of each comma-separated part of an alias:
+# every optional "(...)" doubles the number of variants, so aliases with many of them are cut off
+MAX_ALIAS_VARIANTS = 64
+
+# Regular expression for the optional parts of an alias
+OPTIONAL_PART = re.compile(r"\(([^()]+)\)")
+
+
+def expand_aliases(item: GlossItem, limit: int = MAX_ALIAS_VARIANTS) -> list[str]:
     """
-    Expand all aliases in a gloss item - don't include the name itself
+    Expand all aliases in a gloss item - don't include the name itself.
+    Only the first `limit` variants of each alias part are used, validate_alias_variants warns about the rest.
     """
     aliases: set[str] = set()
     for alias in [item.Name] + item.Alias:
-        aliases.update(expand_alias(alias))
+        aliases.update(alias_variants(alias, limit))
     aliases.discard(item.Name)
     return sorted(aliases)
 
 
-def expand_alias(alias: str) -> list[str]:
+def expand_alias(alias: str, limit: int = MAX_ALIAS_VARIANTS) -> list[str]:
     """
     Expand an alias of the form "a (b) c (d)" into all possible alternatives:
     - "a c", "a b c", "a c d", "a b c d", plus itself "a (b) c (d)"
     Outer commas are also expanded, "a, b (c)" becomes:
     - "a", "b", "b c", as well as "b (c)" and "a, b (c)"
     """
-    def expand_parentheses(s: str) -> list[str]:
-        m = re.search(r"\(([^()]+)\)", s)
-        if not m:
-            return [s]
-        prefix = s[:m.start()]
-        alternatives: list[str] = ["", m.group(1)]
-        suffixes = expand_parentheses(s[m.end():])
-        return [prefix + alt + suf for alt in alternatives for suf in suffixes]
-
-    result = set([alias])
+    return sorted(alias_variants(alias, limit))
+
+
+@functools.lru_cache(maxsize=1 << 16)
+def alias_variants(alias: str, limit: int) -> frozenset[str]:
+    """
+    The expanded variants of an alias, with at most `limit` variants of each part.
+    The results are cached, so that aliases that are repeated in several entries are only expanded once.
+    """
+    result = {alias}
     for part in re.split(r", *", alias):
         result.add(part)
-        for s in expand_parentheses(part):
-            s = " ".join(s.split())
-            result.add(s)
-    return sorted(result)
+        optional = OPTIONAL_PART.findall(part)
+        for s in itertools.islice(optional_variants(part, optional), limit):
+            result.add(" ".join(s.split()))
+    return frozenset(result)
+
+
+def optional_variants(part: str, optional: list[str]) -> Iterator[str]:
+    """Generate the variants of an alias part lazily, with and without each of its optional parts."""
+    fixed = OPTIONAL_PART.split(part)[::2]
+    for choice in itertools.product(*(("", opt) for opt in optional)):
+        yield "".join(f + c for f, c in zip(fixed, choice)) + fixed[-1]
 
 
 ###############################################################################
 ## Specific validators
 
-def run_validators(glosses: Glosses):
-    for id, item in glosses.items():
+def run_validators(glosses: Glosses, ids: Iterable[str] | None = None, jobs: int = 1) -> dict[str, Diagnostics]:
+    """
+    Validate the given ids (default: all CCs), and return the warnings and errors reported for each of them.
+    With several jobs, the CCs are validated in parallel processes, with the same result as when run serially.
+    The timings of the worker processes are added to the timings of this process.
+    Cycles in the strategy taxonomy are not about one CC, so they are only added to the global errors.
+    """
+    for cycle in taxonomy_cycles(glosses):
+        error("taxonomy cycle", ' -> '.join(map(repr, cycle)))
+    index = index_glosses(glosses)
+    selected = None if ids is None else set(ids)
+    idlist = [id for id in glosses if selected is None or id in selected]
+    diagnostics: dict[str, Diagnostics] = {}
+    if jobs > 1 and len(idlist) > jobs:
+        chunksize = -(-len(idlist) // (4 * jobs))
+        chunks = [idlist[i:i+chunksize] for i in range(0, len(idlist), chunksize)]
+        initargs = (index, TIMING_SETTINGS["enabled"], TIMING_SETTINGS["memory"])
+        with ProcessPoolExecutor(jobs, initializer=init_validation_worker, initargs=initargs) as executor:
+            for chunk_diagnostics, timings in executor.map(validate_chunk, chunks):
+                diagnostics.update(chunk_diagnostics)
+                add_timings(timings)
+    else:
+        diagnostics = validate_items(index, idlist)
+    for warnings, errors in diagnostics.values():
+        ERROR_SETTINGS["warnings"].extend(warnings)
+        ERROR_SETTINGS["errors"].extend(errors)
+    return diagnostics
+
+
+class ValidationIndex(NamedTuple):
+    """Everything that the per-item validators need, computed once and then only read."""
+    glosses: Glosses
+    names: 'NameIndex'
+    incoming: ReverseRelations
+
+
+def index_glosses(glosses: Glosses) -> ValidationIndex:
+    return ValidationIndex(
+        glosses,
+        index_names_and_aliases(glosses),
+        reverse_relations(glosses),
+    )
+
+
+def validate_items(index: ValidationIndex, ids: Iterable[str]) -> dict[str, Diagnostics]:
+    """
+    Run the per-item validators on the ids, and return the warnings and errors for each of them.
+    The validators only return what they find, so this doesn't change any global state and can be run in parallel.
+    """
+    glosses = index.glosses
+    diagnostics: dict[str, Diagnostics] = {}
+    for id in ids:
+        item = glosses[id]
+        found: list[Diagnostic] = []
         if id != item.Id:
-            error("mismatched id", f"{id} != {item.Id!r}")
+            found.append(("error", "mismatched id", f"{id} != {item.Id!r}"))
 
-        current_errors = len(ERROR_SETTINGS['errors'])
-        validate_names_and_aliases(item, glosses)
-        validate_link_ids(item, glosses)
-        validate_consistent_name_and_id(item)
-        validate_codewords(item)
+        schema = [
+            *validate_names_and_aliases(item, glosses, index.names),
+            *validate_alias_variants(item),
+            *validate_link_ids(item, glosses),
+            *validate_consistent_name_and_id(item),
+            *validate_codewords(item),
+        ]
+        found += schema
 
         # Run property validators iff there are no schema errors
-        if len(ERROR_SETTINGS['errors']) == current_errors and item.Type != CCType.def_:
-            validate_isolated(item, glosses)
-            validate_relations_by_cctype(item, glosses)
-            validate_strategy_supertypes(item, glosses)
+        if all(kind != "error" for kind, _, _ in schema) and item.Type != CCType.def_:
+            found += validate_isolated(item, index.incoming)
+            found += validate_relations_by_cctype(item, glosses)
+            found += validate_strategy_supertypes(item)
+
+        diagnostics[id] = (
+            [(cat, msg) for kind, cat, msg in found if kind == "warning"],
+            [(cat, msg) for kind, cat, msg in found if kind == "error"],
+        )
+    return diagnostics
+
+
+# The validation index in a parallel worker process
+WORKER_INDEX: list[ValidationIndex] = []
+
+def init_validation_worker(index: ValidationIndex, timings: bool, memory: bool):
+    WORKER_INDEX[:] = [index]
+    # A forked worker inherits the timed functions and the timings so far, a spawned worker has neither
+    if TIMING_SETTINGS["enabled"]:
+        TIMINGS.clear()
+    elif timings:
+        enable_timings([], memory)
+
+def validate_chunk(ids: list[str]) -> tuple[dict[str, Diagnostics], dict[str, dict[str, float]]]:
+    """Validate the ids in a worker process, and return their diagnostics and the timings of the worker."""
+    diagnostics = validate_items(WORKER_INDEX[0], ids)
+    timings = dict(TIMINGS)
+    TIMINGS.clear()
+    return diagnostics, timings
+
+
+class NameIndex(NamedTuple):
+    names: dict[str, list[str]]    # name -> ids having that name
+    aliases: dict[str, list[str]]  # alias -> ids having that alias
+
+
+def index_names_and_aliases(glosses: Glosses) -> NameIndex:
+    """Build an index from names and aliases to the ids that use them, in one pass over the glosses."""
+    names: dict[str, list[str]] = {}
+    aliases: dict[str, list[str]] = {}
+    for id, item in glosses.items():
+        names.setdefault(item.Name, []).append(id)
+        for alias in item.Alias:
+            ids = aliases.setdefault(alias, [])
+            if not ids or ids[-1] != id:
+                ids.append(id)
+    return NameIndex(names, aliases)
 
 
-def validate_names_and_aliases(item: GlossItem, glosses: Glosses):
+def validate_names_and_aliases(item: GlossItem, glosses: Glosses, index: NameIndex) -> Iterator[Diagnostic]:
     # the name must be unique among names (with the same type)
     id = item.Id
-    for id2, item2 in glosses.items():
+    for id2 in index.names.get(item.Name, ()):
         if id < id2:
-            if item.Type == item2.Type and item.Name == item2.Name:
-                error("duplicate name", f"{item.Name!r} is the name of {id!r} and {id2!r}, both of type {item.Type}")
-            elif item.Name == item2.Name:
-                warning("duplicate name", f"{item.Name!r} is the name of {id!r} and {id2!r}")
+            item2 = glosses[id2]
+            if item.Type == item2.Type:
+                yield "error", "duplicate name", f"{item.Name!r} is the name of {id!r} and {id2!r}, both of type {item.Type}"
+            else:
+                yield "warning", "duplicate name", f"{item.Name!r} is the name of {id!r} and {id2!r}"
     # a name should not be an alias
-    for id2, item2 in glosses.items():
+    for id2 in index.aliases.get(item.Name, ()):
         if id != id2:
-            if item.Name in item2.Alias:
-                warning("name is alias", f"{item.Name!r} is the name of {id!r} but also an alias for {id2!r}")
+            yield "warning", "name is alias", f"{item.Name!r} is the name of {id!r} but also an alias for {id2!r}"
     # an alias should not be an alias for another CC
     for alias in item.Alias:
-        for id2, item2 in glosses.items():
-            if id < id2 and "(" not in alias:
-                if alias in item2.Alias:
-                    warning("duplicate alias", f"{alias!r} is alias for {id!r} and {id2!r}")
+        if "(" not in alias:
+            for id2 in index.aliases.get(alias, ()):
+                if id < id2:
+                    yield "warning", "duplicate alias", f"{alias!r} is alias for {id!r} and {id2!r}"
+
 
+def validate_alias_variants(item: GlossItem, limit: int = MAX_ALIAS_VARIANTS) -> Iterator[Diagnostic]:
+    # the expanded aliases still contain the original aliases, so the parts that were cut off can be found again
+    parts = {part for alias in [item.Name] + item.Alias if "(" in alias for part in re.split(r", *", alias)}
+    for part in sorted(parts):
+        variants = 2 ** len(OPTIONAL_PART.findall(part))
+        if variants > limit:
+            yield "warning", "too many alias variants", f"{item.Id!r}: {part!r} has {variants} variants, only the first {limit} are used"
 
-def validate_codewords(item: GlossItem):
+
+def validate_codewords(item: GlossItem) -> Iterator[Diagnostic]:
     if item.Id in IGNORE_CODEWORDS_CCS:
         return
 
@@ -252,21 +452,21 @@ def validate_codewords(item: GlossItem):
                 # if cword in item.Name.split():
                 #     warning(f"codeword of wrong type: {item.Id!r} contains codeword {cword!r} for type {type.value!r}")
                 if cword == item.Name.split()[-1]:
-                    warning("codeword of wrong type", f"{item.Id!r} / {item.Name!r} ends with codeword {cword!r} for type {type.value!r}")
+                    yield "warning", "codeword of wrong type", f"{item.Id!r} / {item.Name!r} ends with codeword {cword!r} for type {type.value!r}"
 
 
-def validate_consistent_name_and_id(item: GlossItem):
+def validate_consistent_name_and_id(item: GlossItem) -> Iterator[Diagnostic]:
     id = item.Id
     name = item.Name.lower()
     if item.Type is CCType.section:
         if id != BOOK_ID and not re.match(r"^[0-9.]+$", id):
-            error("section unknown chars", f"{id!r} contains non-permitted chars")
+            yield "error", "section unknown chars", f"{id!r} contains non-permitted chars"
         return
     id_type, _, id_name = id.partition(":")
     if not re.match(r"^[a-z-]+$", id_name):
-        error("id unknown chars", f"{id!r} contains non-permitted chars")
+        yield "error", "id unknown chars", f"{id!r} contains non-permitted chars"
     if id_type != item.Type.value:
-        warning("id type error", f"{id!r} has the wrong type - it should be {item.Type.value}")
+        yield "warning", "id type error", f"{id!r} has the wrong type - it should be {item.Type.value}"
     id_parts = id_name.split("-")
     name_commaparts = re.split(", *", name) + [name]
     mismatches = 0
@@ -277,54 +477,146 @@ def validate_consistent_name_and_id(item: GlossItem):
         if id_parts != name_parts:
             mismatches += 1
     if mismatches == len(name_commaparts):
-        warning("name-id mismatch", f"{id!r} != {name!r}")
+        yield "warning", "name-id mismatch", f"{id!r} != {name!r}"
 
 
-def validate_link_ids(item: GlossItem, glosses: Glosses):
+def validate_link_ids(item: GlossItem, glosses: Glosses) -> Iterator[Diagnostic]:
     # check that ids exits
     for rel, relids in item.Relations.items():
         for relid in relids:
             if rel != "Sections" and relid and relid not in glosses:
-                error("missing id", f"id {relid!r} doesn't exist, refered to from {item.Id!r} relation {rel.value!r}")
+                yield "error", "missing id", f"id {relid!r} doesn't exist, refered to from {item.Id!r} relation {rel.value!r}"
 
 
-def validate_isolated(item: GlossItem, glosses: Glosses):
+def validate_isolated(item: GlossItem, incoming: ReverseRelations) -> Iterator[Diagnostic]:
     relations = item.Relations
     out_degree = sum(len(relids) for relids in relations.values())
-    in_degree = sum(
-        otherid == item.Id
-        for gloss in glosses.values()
-        for relids in gloss.Relations.values()
-        for otherid in relids
-    )
+    in_degree = sum(len(relids) for relids in incoming.get(item.Id, {}).values())
     if out_degree == 0 and in_degree == 0:
-        warning("isolated CC", f"{item.Id!r} has no structural relations with other concepts")
+        yield "warning", "isolated CC", f"{item.Id!r} has no structural relations with other concepts"
 
 
-def validate_relations_by_cctype(item: GlossItem, glosses: Glosses):
+def validate_relations_by_cctype(item: GlossItem, glosses: Glosses) -> Iterator[Diagnostic]:
     for rel in item.Relations:
         cctypes = RELATION_CCTYPES.get(rel)
         if cctypes:
             if item.Type not in cctypes:
-                error("wrong relation", f"{item.Id!r} is of type {item.Type!r} but has a {rel!r} relation")
+                yield "error", "wrong relation", f"{item.Id!r} is of type {item.Type!r} but has a {rel!r} relation"
                 continue
             for relid in item.Relations[rel]:
                 other = glosses[relid]
                 if other.Type != cctypes[item.Type]:
-                    error("invalid type", f"{item.Id!r} has {rel!r} relation with CC of invalid type {other.Id!r}")
+                    yield "error", "invalid type", f"{item.Id!r} has {rel!r} relation with CC of invalid type {other.Id!r}"
+
 
+def strategy_supertypes(item: GlossItem) -> list[str]:
+    return item.Relations.get(Relation.SubtypeOf, []) + item.Relations.get(Relation.ConstituentOf, [])
+
+
+def taxonomy_cycles(glosses: Glosses) -> list[list[str]]:
+    """
+    Find the cycles in the supertypes of the strategies, each as the path from a CC back to itself.
+    Each CC is visited only once, with an iterative depth-first search so that deep taxonomies don't hit the recursion limit.
+    """
+    cycles: list[list[str]] = []
+    done: set[str] = set()
+    for start, item in glosses.items():
+        if item.Type != CCType.str or start in done or start in STRATEGY_TYPES:
+            continue
+        path: list[str] = [start]
+        onpath: set[str] = {start}
+        todo = [iter(strategy_supertypes(item))]
+        while todo:
+            super = next(todo[-1], None)
+            if super is None:
+                id = path.pop()
+                onpath.discard(id)
+                done.add(id)
+                todo.pop()
+            elif super in onpath:
+                cycles.append(path[path.index(super):] + [super])
+            elif super in done or super in STRATEGY_TYPES or super not in glosses or glosses[super].Type != CCType.str:
+                continue
+            else:
+                path.append(super)
+                onpath.add(super)
+                todo.append(iter(strategy_supertypes(glosses[super])))
+    return cycles
 
-def validate_strategy_supertypes(item: GlossItem, glosses: Glosses):
+
+def validate_strategy_supertypes(item: GlossItem) -> Iterator[Diagnostic]:
     if item.Type != CCType.str or item.Id in STRATEGY_TYPES:
         return
-    for super in item.Relations.get(Relation.SubtypeOf, []) + item.Relations.get(Relation.ConstituentOf, []):
+    # The first supertype that is a strategy type or a definition decides, the other strategies are validated on their own
+    for super in strategy_supertypes(item):
         if super in STRATEGY_TYPES:
             return
         elif super.startswith('def:'):
-            error("not in taxonomy", f"{item.Id!r} is not in the taxonomy of {', '.join(STRATEGY_TYPES)}")
+            yield "error", "not in taxonomy", f"{item.Id!r} is not in the taxonomy of {', '.join(STRATEGY_TYPES)}"
             return
+
+
+###############################################################################
+## Incremental parsing and validation
+
+# The parsed items of each top-level entry in the YAML database, keyed by the source text of the entry
+ParsedEntries = dict[str, list[GlossItem]]
+
+
+def parse_yaml_entries(glossfile: str | Path, keep_deleted: bool = False,
+                       cache: ParsedEntries | None = None) -> tuple[Glosses, ParsedEntries]:
+    """
+    Parse the YAML database in the same way as parse_yaml_database, but only the entries that are not in the cache.
+    The database is split into entries at each line that starts with "- ".
+    """
+    reset_errors_and_warnings()
+    cache = cache or {}
+    entries: ParsedEntries = {}
+    glosses: Glosses = {}
+    with open(glossfile) as F:
+        text = F.read()
+    for source in re.split(r'(?m)^(?=- )', text):
+        if source in cache:
+            items = cache[source]
         else:
-            validate_strategy_supertypes(glosses[super], glosses)
+            items = parse_items(yaml.load(source, Loader=yaml.CLoader) or (), keep_deleted)
+        entries[source] = items
+        for gitem in items:
+            glosses[gitem.Id] = gitem
+    add_sections(glosses)
+    report_errors_and_warnings("parsing the YAML database")
+    return glosses, entries
+
+
+def changed_ids(previous: Glosses, glosses: Glosses) -> set[str]:
+    """The ids of the CCs that were added, removed or modified."""
+    return {
+        id for id in previous.keys() | glosses.keys()
+        if previous.get(id) is not glosses.get(id) and previous.get(id) != glosses.get(id)
+    }
+
+
+def affected_ids(previous: Glosses, glosses: Glosses, changed: Iterable[str]) -> set[str]:
+    """
+    Find the CCs whose validation can be affected by the changed ids: the changed CCs themselves,
+    CCs sharing names or aliases with them (before or after the change), and their relation neighbours.
+    Cycles in the strategy taxonomy are found again by run_validators every time.
+    """
+    names = index_names_and_aliases(glosses)
+    incoming = reverse_relations(glosses)
+    affected: set[str] = set()
+    for id in changed:
+        affected.add(id)
+        for item in (previous.get(id), glosses.get(id)):
+            if item:
+                for name in [item.Name] + item.Alias:
+                    affected.update(names.names.get(name, ()))
+                    affected.update(names.aliases.get(name, ()))
+                for relids in item.Relations.values():
+                    affected.update(relids)
+        for relids in incoming.get(id, {}).values():
+            affected.update(relids)
+    return affected & glosses.keys()
 
 
 ###############################################################################
@@ -360,3 +652,108 @@ def warning(cat: str, warn: str):
 def error(cat:str, err: str):
     ERROR_SETTINGS["errors"].append((cat, err))
 
+
+###############################################################################
+## Timing and profiling
+
+# Functions in this module that are timed when timings are enabled
+TIMED_FUNCTIONS = [
+    'parse_yaml_database', 'parse_yaml_entries', 'parse_items', 'convert_glossitem', 'expand_aliases', 'add_sections',
+    'validate_database', 'run_validators', 'validate_items', 'index_names_and_aliases', 'reverse_relations', 'taxonomy_cycles',
+    'validate_names_and_aliases', 'validate_alias_variants', 'validate_link_ids', 'validate_consistent_name_and_id',
+    'validate_codewords', 'validate_isolated', 'validate_relations_by_cctype', 'validate_strategy_supertypes',
+]
+
+TIMING_SETTINGS: dict[str, bool] = {
+    "enabled": False,
+    "memory": False,
+}
+
+# Wall time, number of calls and peak memory for each timed phase or function
+TIMINGS: dict[str, dict[str, float]] = {}
+
+# The timed phases that are currently running: [name, start time, peak memory]
+TIMING_STACK: list[list[Any]] = []
+
+
+def enable_timings(namespaces: Iterable[tuple[object, list[str]]], memory: bool = False):
+    """
+    Start timing the given functions or methods, by replacing them with timed wrappers.
+    Nothing is wrapped unless this is called, so timing costs nothing when it's disabled.
+    Tracing peak memory makes everything slower, so it is optional.
+    """
+    TIMING_SETTINGS["enabled"] = True
+    TIMING_SETTINGS["memory"] = memory
+    TIMINGS.clear()
+    if memory:
+        tracemalloc.start()
+    for namespace, names in [(sys.modules[__name__], TIMED_FUNCTIONS), *namespaces]:
+        for name in names:
+            function = inspect.getattr_static(namespace, name)
+            if isinstance(function, staticmethod):
+                setattr(namespace, name, staticmethod(timed_function(function.__func__)))
+            elif isinstance(function, classmethod):
+                setattr(namespace, name, classmethod(timed_function(function.__func__)))
+            else:
+                setattr(namespace, name, timed_function(function))
+
+
+def timed_function(function: Any) -> Any:
+    if inspect.isgeneratorfunction(function):
+        # A generator does its work while it's iterated, so it's timed until it's exhausted
+        @functools.wraps(function)
+        def generator_wrapper(*args: Any, **kwargs: Any) -> Any:
+            with timed(function.__qualname__):
+                return iter(list(function(*args, **kwargs)))
+        return generator_wrapper
+
+    @functools.wraps(function)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        with timed(function.__qualname__):
+            return function(*args, **kwargs)
+    return wrapper
+
+
+@contextmanager
+def timed(name: str) -> Iterator[None]:
+    """Time a phase, if timings are enabled. Nested phases are included in the outer phases."""
+    if not TIMING_SETTINGS["enabled"]:
+        yield
+        return
+    memory = TIMING_SETTINGS["memory"]
+    if memory:
+        # The peak is reset for the inner phase, so remember it for the outer phase
+        if TIMING_STACK:
+            TIMING_STACK[-1][2] = max(TIMING_STACK[-1][2], tracemalloc.get_traced_memory()[1])
+        tracemalloc.reset_peak()
+    frame = [name, time.perf_counter(), 0]
+    TIMING_STACK.append(frame)
+    try:
+        yield
+    finally:
+        TIMING_STACK.pop()
+        timing = TIMINGS.setdefault(name, {"seconds": 0.0, "calls": 0, "peak_memory": 0})
+        timing["seconds"] += time.perf_counter() - frame[1]
+        timing["calls"] += 1
+        if memory:
+            peak = max(frame[2], tracemalloc.get_traced_memory()[1])
+            timing["peak_memory"] = max(timing["peak_memory"], peak)
+            if TIMING_STACK:
+                TIMING_STACK[-1][2] = max(TIMING_STACK[-1][2], peak)
+
+
+def add_timings(timings: dict[str, dict[str, float]]):
+    """Add timings from another process, such as a parallel validation worker."""
+    for name, timing in timings.items():
+        total = TIMINGS.setdefault(name, {"seconds": 0.0, "calls": 0, "peak_memory": 0})
+        total["seconds"] += timing["seconds"]
+        total["calls"] += timing["calls"]
+        total["peak_memory"] = max(total["peak_memory"], timing["peak_memory"])
+
+
+def report_timings():
+    print(f"{'Phase or function':45s} {'calls':>8s} {'seconds':>9s} {'peak MB':>9s}", file=sys.stderr)
+    for name, timing in sorted(TIMINGS.items(), key=lambda t: -t[1]["seconds"]):
+        memory = f"{timing['peak_memory'] / 2**20:9.1f}" if TIMING_SETTINGS["memory"] else f"{'-':>9s}"
+        print(f"{name:45s} {timing['calls']:8d} {timing['seconds']:9.4f} {memory}", file=sys.stderr)
+    print(file=sys.stderr)